@@ -0,0 +1,109 @@
+"""Benchmark build.py generating the library from an XIDL file.
+
+Usage::
+
+    python benchmarks/bench_build.py [--xidl VirtualBox.xidl] [--interfaces N]
+
+Without --xidl a synthetic XIDL is generated with N interfaces whose
+descriptions are full of links and markup, like the real VirtualBox.xidl.
+The library is generated into a temporary directory twice: once to
+measure the wall time and once to measure the peak memory traced.
+"""
+
+from __future__ import print_function
+import argparse
+import importlib.util
+import os
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DESC = """\
+      <desc>
+        The <b>%(name)s</b> object, see <link to="IMachine::lockMachine"/> and
+        <link to="IMachine_state">the state</link> or <link to="#method%(i)s"/>.
+        <ul><li><i>first</i> item</li><li><tt>second</tt> item &amp; more</li></ul>
+        <note>Calls to <link to="ISession"/> are &lt;always&gt; serialized.</note>
+      </desc>
+"""
+
+METHOD = """\
+    <method name="method%(i)s">
+%(desc)s
+      <param name="value" type="wstring" dir="in"><desc>The value.</desc></param>
+      <param name="machine" type="IMachine" dir="return"/>
+    </method>
+"""
+
+
+def synthetic_xidl(interfaces, methods=20, paragraphs=20):
+    out = ['<?xml version="1.0" ?>', "<idl>", "<desc>Synthetic API.</desc>"]
+    out.append('<library name="VirtualBox" uuid="0" version="1.3">')
+    out.append('<application name="VirtualBox" uuid="1">')
+    out.append('<enum name="VBoxEventType" uuid="2">')
+    out.append('<const name="Invalid" value="0"><desc>Invalid.</desc></const>')
+    out.append("</enum>")
+    for n in range(interfaces):
+        name = "IThing%s" % n
+        desc = "\n".join(DESC % dict(name=name, i=i) for i in range(paragraphs))
+        out.append(
+            '<interface name="%s" extends="$unknown" uuid="%s" wsmap="managed">'
+            % (name, n)
+        )
+        out.append(desc.replace("</desc>\n      <desc>", ""))
+        for i in range(methods):
+            out.append(METHOD % dict(i=i, desc=DESC % dict(name=name, i=i)))
+        out.append("</interface>")
+    out.extend(["</application>", "</library>", "</idl>"])
+    return "\n".join(out).encode("utf-8")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--xidl", help="path to a VirtualBox.xidl file")
+    parser.add_argument("--interfaces", type=int, default=200)
+    parser.add_argument("--build", default=os.path.join(ROOT, "build.py"))
+    parser.add_argument("--lean", action="store_true")
+    args = parser.parse_args()
+
+    work = tempfile.mkdtemp()
+    try:
+        os.makedirs(os.path.join(work, "virtualbox"))
+        open(os.path.join(work, "Config.kmk"), "w").close()
+        xidl_path = os.path.join(work, "VirtualBox.xidl")
+        if args.xidl:
+            shutil.copy(args.xidl, xidl_path)
+        else:
+            with open(xidl_path, "wb") as f:
+                f.write(synthetic_xidl(args.interfaces))
+        spec = importlib.util.spec_from_file_location("build", args.build)
+        build = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(build)
+
+        cwd = os.getcwd()
+        os.chdir(work)
+        sys.argv = ["build.py"] + (["--lean"] if args.lean else [])
+        try:
+            start = time.time()
+            build.main()
+            elapsed = time.time() - start
+            # Memory is measured on a second run, tracing slows the build down.
+            tracemalloc.start()
+            build.main()
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+        finally:
+            os.chdir(cwd)
+        print("xidl size   : %.1f MiB" % (os.path.getsize(xidl_path) / 1024.0 / 1024))
+        print("wall time   : %.2f s" % elapsed)
+        print("peak memory : %.1f MiB" % (peak / 1024.0 / 1024))
+    finally:
+        shutil.rmtree(work)
+
+
+if __name__ == "__main__":
+    main()
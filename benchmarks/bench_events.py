@@ -0,0 +1,136 @@
+"""Benchmark event callback registration and unregistration latency.
+
+Usage::
+
+    python benchmarks/bench_events.py [--callbacks N] [--sources N] [--types N]
+
+The benchmark runs against an in-process fake ``IEventSource`` whose
+``get_event`` blocks for the requested timeout unless the listener is
+unregistered, which is how VirtualBox behaves.  Callbacks are spread
+round robin over ``--sources`` event sources and ``--types`` event types.
+With one source every callback shares a listener; with as many sources as
+callbacks each registration starts, and each unregistration stops, a
+monitor thread.  The script reports total and per-call latency for
+registering and then unregistering every callback.
+"""
+
+from __future__ import print_function
+import argparse
+import os
+import sys
+import threading
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from virtualbox import events  # noqa: E402
+from virtualbox import library  # noqa: E402
+
+EVENT_TYPES = [
+    library.VBoxEventType.on_machine_state_changed,
+    library.VBoxEventType.on_machine_data_changed,
+    library.VBoxEventType.on_machine_registered,
+    library.VBoxEventType.on_session_state_changed,
+    library.VBoxEventType.on_extra_data_changed,
+    library.VBoxEventType.on_guest_property_changed,
+    library.VBoxEventType.on_snapshot_taken,
+    library.VBoxEventType.on_snapshot_deleted,
+]
+
+
+class FakeEventSource(object):
+    def __init__(self):
+        self._i = object()
+        self.cond = threading.Condition()
+        self.listeners = set()
+        self.created = 0
+
+    def create_listener(self):
+        self.created += 1
+        return (id(self), self.created)
+
+    def register_listener(self, listener, interesting, active):
+        with self.cond:
+            self.listeners.add(listener)
+
+    def unregister_listener(self, listener):
+        with self.cond:
+            self.listeners.discard(listener)
+            self.cond.notify_all()
+
+    def get_event(self, listener, timeout):
+        with self.cond:
+            if listener not in self.listeners:
+                raise library.VBoxError("listener not registered")
+            self.cond.wait(timeout / 1000.0)
+            if listener not in self.listeners:
+                raise library.VBoxError("listener unregistered")
+        return None
+
+    def event_processed(self, listener, event):
+        pass
+
+
+def report(label, timings):
+    total = sum(timings)
+    timings = sorted(timings)
+    print(
+        "%-10s total %8.1f ms  mean %7.3f ms  p99 %7.3f ms  max %7.3f ms"
+        % (
+            label,
+            total * 1000,
+            total / len(timings) * 1000,
+            timings[int(len(timings) * 0.99) - 1] * 1000,
+            timings[-1] * 1000,
+        )
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--callbacks", type=int, default=1000)
+    parser.add_argument("--sources", type=int, default=1)
+    parser.add_argument("--types", type=int, default=4)
+    args = parser.parse_args()
+
+    sources = [FakeEventSource() for _ in range(args.sources)]
+    types = EVENT_TYPES[: max(1, min(args.types, len(EVENT_TYPES)))]
+
+    def callback(event):
+        pass
+
+    # Resolve the event interfaces outside of the timed region.
+    for event_type in types:
+        events.type_to_interface(event_type)
+
+    ids = []
+    register = []
+    for i in range(args.callbacks):
+        source = sources[i % len(sources)]
+        event_type = types[i % len(types)]
+        t0 = time.time()
+        ids.append(events.register_callback(callback, source, event_type))
+        register.append(time.time() - t0)
+
+    unregister = []
+    for callback_id in ids:
+        t0 = time.time()
+        events.unregister_callback(callback_id)
+        unregister.append(time.time() - t0)
+
+    print(
+        "callbacks %s, event sources %s, event types %s, listeners created %s"
+        % (
+            args.callbacks,
+            len(sources),
+            len(types),
+            sum(s.created for s in sources),
+        )
+    )
+    report("register", register)
+    report("unregister", unregister)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Benchmark the cost of ``import virtualbox`` in a fresh interpreter.
+
+Usage::
+
+    python benchmarks/bench_import.py [--runs N]
+
+Each run starts a new Python process so that the module cache is cold.
+Byte code caches are warmed first, so the timings measure loading the
+library rather than compiling it.  The script reports the time taken to
+import the package, to reach ``IVirtualBox``, ``IMachine`` and
+``ISession``, how many generated modules were loaded along the way and
+the peak resident memory of the process.
+"""
+
+from __future__ import print_function
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PROBE = """
+import json, sys, time
+t0 = time.time()
+import virtualbox
+t1 = time.time()
+from virtualbox import library
+library.IVirtualBox, library.IMachine, library.ISession
+t2 = time.time()
+loaded = [m for m in sys.modules if m.startswith("virtualbox._library.")]
+try:
+    import resource
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+except ImportError:
+    rss = 0
+print(json.dumps({"import": t1 - t0, "common": t2 - t0, "modules": len(loaded), "rss": rss}))
+"""
+
+
+def run_probe():
+    env = dict(os.environ)
+    env["PYTHONPATH"] = ROOT + os.pathsep + env.get("PYTHONPATH", "")
+    out = subprocess.check_output([sys.executable, "-c", PROBE], env=env, cwd=ROOT)
+    return json.loads(out.decode("utf-8").strip().splitlines()[-1])
+
+
+def median(values):
+    values = sorted(values)
+    return values[len(values) // 2]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    subprocess.check_call([sys.executable, "-m", "compileall", "-q", ROOT])
+    results = [run_probe() for _ in range(args.runs)]
+    print("runs                          : %s" % args.runs)
+    print(
+        "import virtualbox (median)    : %.1f ms"
+        % (median(r["import"] for r in results) * 1000)
+    )
+    print(
+        "+ IVirtualBox/IMachine/ISession: %.1f ms"
+        % (median(r["common"] for r in results) * 1000)
+    )
+    print("generated modules loaded      : %s" % results[-1]["modules"])
+    print("peak RSS (median)             : %s KiB" % median(r["rss"] for r in results))
+
+
+if __name__ == "__main__":
+    main()
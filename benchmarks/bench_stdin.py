@@ -0,0 +1,129 @@
+"""Benchmark streaming stdin to a guest process.
+
+Usage::
+
+    python benchmarks/bench_stdin.py [--mb N] [--chunk BYTES] [--legacy-mb N]
+
+The benchmark feeds ``--mb`` megabytes of input through
+``ExecuteStream`` to an in-process fake ``IGuestProcess`` that accepts at
+most ``--chunk`` bytes per ``write_array`` call, as the guest's stdin pipe
+does.  The input is passed three ways: as one bytes object, as a file
+object and as an iterator of pieces.  For comparison the old conversion to
+one decimal string per byte is timed over ``--legacy-mb`` megabytes.  Peak
+memory allocated while streaming is reported on Python 3.
+"""
+
+from __future__ import print_function
+import argparse
+import io
+import os
+import sys
+import time
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from bench_events import FakeEventSource  # noqa: E402
+from virtualbox import library  # noqa: E402
+from virtualbox.library_ext.guest_session import ExecuteStream  # noqa: E402
+
+MB = 1024 * 1024
+
+
+class FakeProcess(object):
+    """Process that reads all of its stdin and then exits"""
+
+    def __init__(self, chunk):
+        self.chunk = chunk
+        self.received = 0
+        self.eof = False
+        self.event_source = FakeEventSource()
+
+    @property
+    def status(self):
+        if self.eof:
+            return library.ProcessStatus.terminated_normally
+        return library.ProcessStatus.started
+
+    def write_array(self, handle, flags, data, timeout_ms):
+        if flags == [library.ProcessInputFlag.end_of_file]:
+            self.eof = True
+            return 0
+        wrote = min(len(data), self.chunk)
+        self.received += wrote
+        return wrote
+
+    def read(self, handle, to_read, timeout_ms):
+        return b""
+
+
+def pieces(size, piece_size=MB):
+    piece = b"x" * piece_size
+    for _ in range(size // piece_size):
+        yield piece
+
+
+def stream(label, stdin, size, chunk):
+    process = FakeProcess(chunk)
+    if tracemalloc is not None:
+        tracemalloc.start()
+    t0 = time.time()
+    list(ExecuteStream(process, [], chunk, stdin))
+    elapsed = time.time() - t0
+    peak = None
+    if tracemalloc is not None:
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    assert process.received == size and process.eof
+    print(
+        "%-10s %8.1f MB in %7.3f s  %8.1f MB/s  peak %s"
+        % (
+            label,
+            size / float(MB),
+            elapsed,
+            size / float(MB) / max(elapsed, 1e-9),
+            "n/a" if peak is None else "%.1f MB" % (peak / float(MB)),
+        )
+    )
+
+
+def legacy(size, chunk):
+    stdin = b"x" * size
+    if sys.version_info[0] >= 3:
+        stdin = stdin.decode("ascii")
+    t0 = time.time()
+    index = 0
+    while index < len(stdin):
+        array = [str(ord(a)) for a in stdin[index:]]
+        index += min(len(array), chunk)
+    elapsed = time.time() - t0
+    print(
+        "%-10s %8.1f MB in %7.3f s  %8.1f MB/s"
+        % ("per-byte", size / float(MB), elapsed, size / float(MB) / elapsed)
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--mb", type=int, default=100)
+    parser.add_argument("--chunk", type=int, default=65000)
+    parser.add_argument("--legacy-mb", type=float, default=1)
+    args = parser.parse_args()
+
+    size = args.mb * MB
+    data = b"x" * size
+    stream("bytes", data, size, args.chunk)
+    stream("file", io.BytesIO(data), size, args.chunk)
+    del data
+    stream("iterator", pieces(size), size, args.chunk)
+    if args.legacy_mb > 0:
+        legacy(int(args.legacy_mb * MB), args.chunk)
+
+
+if __name__ == "__main__":
+    main()
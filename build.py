@@ -1,8 +1,22 @@
-"""This build tool generates the VirtualBox library.py Main COM API."""
+"""This build tool generates the VirtualBox library.py Main COM API.
 
-from xml.dom import minidom
+The generated API is split into one module per interface and enumeration
+under the virtualbox/_library package.  virtualbox/library.py is generated
+as an index over that package which imports each module on first attribute
+access.
+
+Run with --lean to leave docstrings out of the generated modules.  They are
+written to virtualbox/_library/docs instead and loaded on demand, see
+:class:`virtualbox.library_base.LazyDoc`.
+"""
+
+from xml.etree import ElementTree
+import argparse
+import ast
+import json
 import os
 import re
+import shutil
 import hashlib
 
 try:
@@ -28,30 +42,109 @@ def to_string(value):
 LIB_IMPORTS = """\
 # Complete implementation of VirtualBox's COM API with a Pythonic interface.
 #
-# Note: Commenting, and API structure generation was carved from 
+# Note: Commenting, and API structure generation was carved from
 #       VirtualBox project's VirtualBox.xidl Main API definition.
 #
+# Note: Interfaces and enumerations live in the virtualbox._library package
+#       and are imported on first attribute access of this module.
+#
 from __future__ import absolute_import
-from .library_base import Enum 
-from .library_base import Interface 
+import importlib
+import sys
+
+from .library_base import Enum
+from .library_base import Interface
 from .library_base import VBoxError
 
-# Py2 and Py3 compatibility  
+# Py2 and Py3 compatibility
 try:
-    import __builtin__ as builtin 
+    import __builtin__ as builtin
 except:
     import builtins as builtin
 try:
     basestring = basestring
 except:
-    basestring = (str, bytes) 
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int, )
+
+"""
+
+LIB_ERRORS_IMPORT = """\
+# Errors are imported eagerly so that they are registered in
+# library_base.vbox_error before the first COM call is made.
+from ._library.errors import (
+%(names)s
+)
+
+"""
+
+LIB_EVENTS = """\
+# Map of VBoxEventType value -> event interface name
+_event_interfaces = {
+%(events)s
+}
+
+"""
+
+LIB_LAZY = """\
+# Map of API name -> module under virtualbox._library
+_index = {
+%(index)s
+}
+
+
+def _load(name):
+    module = importlib.import_module("virtualbox._library." + _index[name])
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __getattr__(name):
+    if name in _index:
+        return _load(name)
+    raise AttributeError("module %%r has no attribute %%r" %% (__name__, name))
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_index))
+
+
+# Module level __getattr__ (PEP 562) requires Python 3.7+.
+if sys.version_info < (3, 7):
+    for _name in list(_index):
+        _load(_name)
+"""
+
+LIB_REF = """
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]"""
+
+MODULE_IMPORTS = """\
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+%(imports)s
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
 try:
     baseinteger = (int, long)
 except:
     baseinteger = (int, )
 
+
 """
 
+LIB_PACKAGE_INIT = '''\
+"""Generated VirtualBox Main API modules, see :mod:`virtualbox.library`."""
+'''
+
 LIB_META = """\
 vbox_version = '%(vbox_version)s'
 lib_version  = %(version)s
@@ -171,26 +264,70 @@ replace_rules = [
 ]
 
 
+remove_rule = re.compile("</?(?:%s)>" % "|".join(remove))
+result_rule = re.compile("(<result).*(</result>)", flags=re.DOTALL)
+
+
+def tag_name(node):
+    """Return the tag of an element, None for comments"""
+    if isinstance(node.tag, str):
+        return node.tag
+    return None
+
+
+def escape_xml(text):
+    return (
+        text.replace("&", "&amp;")
+        .replace("<", "&lt;")
+        .replace('"', "&quot;")
+        .replace(">", "&gt;")
+    )
+
+
+def to_xml(node, out):
+    """Serialise node into the out list the way minidom's toxml() does"""
+    tag = tag_name(node)
+    if tag is None:
+        out.append("<!--%s-->" % node.text)
+    else:
+        out.append("<" + tag)
+        for key, value in node.attrib.items():
+            out.append(' %s="%s"' % (key, escape_xml(value)))
+        if node.text or len(node):
+            out.append(">")
+            if node.text:
+                out.append(escape_xml(node.text))
+            for child in node:
+                to_xml(child, out)
+            out.append("</%s>" % tag)
+        else:
+            out.append("/>")
+    if node.tail:
+        out.append(escape_xml(node.tail))
+
+
 def get_doc(node, whitespace=12):
-    docnode = node.getElementsByTagName("desc")
-    if docnode:
-        html = docnode[0].toxml()
+    for docnode in node.iter("desc"):
+        if docnode is not node:
+            break
+    else:
+        docnode = None
+    if docnode is not None:
+        tail, docnode.tail = docnode.tail, None
+        html = []
+        to_xml(docnode, html)
+        docnode.tail = tail
+        html = "".join(html)
 
         # Strip out stuff we don't want.
-        for r in remove:
-            html = html.replace("<%s>" % r, "").replace("</%s>" % r, "")
-        html, _ = re.subn("(<result).*(</result>)", "", html, flags=re.DOTALL)
+        html = remove_rule.sub("", html)
+        html = result_rule.sub("", html)
         doc = [l.strip() for l in html.splitlines()]
         doc = ("\n" + " " * whitespace).join(doc).rstrip().strip()
-        doc = "".join(doc)
 
         # Run replace rules
         for rule, sub_func in replace_rules:
-            m = rule.search(doc)
-            while m:
-                sub_text = sub_func(m)
-                doc = doc.replace(doc[m.start() : m.end()], sub_text)
-                m = rule.search(doc)
+            doc = rule.sub(sub_func, doc)
 
         # Replace words.
         for pattern, word in replace_words:
@@ -224,6 +361,11 @@ OLE_ERRORS = [
 ]
 
 
+def module_name(name):
+    """Return the virtualbox._library module name for an API name"""
+    return name.lower()
+
+
 def error_name_to_pname(name):
     if name.count("_") > 1:
         pname = "".join([e.title() for e in name.lower().split("_")[2:]])
@@ -240,10 +382,10 @@ def build_error_result(name, value, doc):
 
 
 def process_result_node(node):
-    name = node.getAttribute("name")
-    value = node.getAttribute("value")
-    descnode = node.getElementsByTagName("desc")[0]
-    doc = descnode.childNodes[0].wholeText.strip()
+    name = node.get("name", "")
+    value = node.get("value", "")
+    descnode = next(node.iter("desc"))
+    doc = (descnode.text or "").strip()
     return build_error_result(name, value, doc)
 
 
@@ -265,28 +407,32 @@ ENUM_ROW = """\
         ('%(label)s', %(value)s, 
          '''%(doc)s'''),"""
 
-VBOXEVENT_ENUM_VALUES = set()
+# VBoxEventType label -> value
+VBOXEVENT_ENUM_VALUES = {}
+
+# VBoxEventType value -> event interface name
+EVENT_INTERFACES = {}
 
 
 def process_enum_node(node):
-    name = node.getAttribute("name")
-    uuid = "'%s'" % node.getAttribute("uuid")
+    name = node.get("name", "")
+    uuid = "'%s'" % node.get("uuid", "")
     code = []
     enum_doc = [get_doc(node, 4), "\n"]
     enums = ["["]
-    for child in node.childNodes:
-        tagname = getattr(child, "tagName", None)
+    for child in node:
+        tagname = tag_name(child)
         if tagname != "const":
             continue
         doc = get_doc(child)
-        label = str(child.getAttribute("name"))
-        if name == "VBoxEventType":
-            VBOXEVENT_ENUM_VALUES.add(pythonic_name(label))
-        value = child.getAttribute("value")
+        label = str(child.get("name", ""))
+        value = child.get("value", "")
         if "0x" in value:
             value = int(value[2:], 16)
         else:
             value = int(value)
+        if name == "VBoxEventType":
+            VBOXEVENT_ENUM_VALUES[pythonic_name(label)] = value
         enums.append(ENUM_ROW % dict(label=label, value=value, doc=doc))
 
         enum_doc.append(
@@ -301,7 +447,8 @@ def process_enum_node(node):
     # lookup = pprint.pformat(enums, width=4, indent=8)
     code.append(ENUM_DEFINE % dict(name=name, doc=enum_doc, uuid=uuid, enums=enums))
     code.append("\n")
-    return "\n".join(code)
+    imports = MODULE_IMPORTS % dict(imports="from ..library_base import Enum")
+    return imports + "\n".join(code)
 
 
 ###########################################################
@@ -318,18 +465,23 @@ class %(name)s(%(extends)s):
 
 
 def process_interface_node(node):
-    name = node.getAttribute("name")
-    uuid = node.getAttribute("uuid")
-    extends = node.getAttribute("extends")
+    name = node.get("name", "")
+    uuid = node.get("uuid", "")
+    extends = node.get("extends", "")
+    imports = ["import sys as _sys"]
     if extends == "$unknown":
         extends = "Interface"
     elif extends == "$errorinfo":
         extends = "Interface"
-    wsmap = node.getAttribute("wsmap")
+    if extends == "Interface":
+        imports.append("from ..library_base import Interface")
+    else:
+        imports.append("from .%s import %s" % (module_name(extends), extends))
+    wsmap = node.get("wsmap", "")
     doc = get_doc(node, 4)
     if doc:
         doc = "\n    %s\n    " % doc
-    event_id = node.getAttribute("id")
+    event_id = node.get("id", "")
     if event_id:
         event_id = pythonic_name(event_id)
         # Work-around for a typo in Virtualbox.xidl:
@@ -338,7 +490,9 @@ def process_interface_node(node):
 
         # Some event IDs aren't actually a part of the VBoxEventType enum
         if event_id in VBOXEVENT_ENUM_VALUES:
+            EVENT_INTERFACES[VBOXEVENT_ENUM_VALUES[event_id]] = name
             event_id = "id = VBoxEventType.%(event_id)s" % dict(event_id=event_id)
+            imports.append("from .vboxeventtype import VBoxEventType")
         else:
             event_id = ""
     class_def = CLASS_DEF % dict(
@@ -348,8 +502,8 @@ def process_interface_node(node):
     code = []
     code.append(class_def)
 
-    for n in node.childNodes:
-        name = getattr(n, "tagName", None)
+    for n in node:
+        name = tag_name(n)
         if name in [None, "desc", "note"]:
             continue
         if name == "attribute":
@@ -359,7 +513,8 @@ def process_interface_node(node):
         else:
             raise Exception("Unknown interface a member '%s' \n%s" % (name, class_def))
     code.append("")
-    return "\n".join(code)
+    imports.append(LIB_REF)
+    return MODULE_IMPORTS % dict(imports="\n".join(imports)) + "\n".join(code)
 
 
 ATTR_GET = '''\
@@ -376,7 +531,7 @@ ATTR_SET = """
         return self._set_attr("%(name)s", value)"""
 
 ATTR_SET_ASSERT_INST = """\
-        if not isinstance(value, %(ntype)s):
+        if not isinstance(value, %(ltype)s):
             raise TypeError("value is not an instance of %(ntype)s")"""
 
 known_types = {
@@ -394,6 +549,8 @@ known_types = {
 
 python_types = ["str", "bool", "int"]
 
+local_types = python_types + ["basestring", "baseinteger", "list"]
+
 
 def type_to_name(t):
     if t in known_types:
@@ -401,6 +558,16 @@ def type_to_name(t):
     return t
 
 
+def lib_type(name):
+    """Return the expression used to reference type name from within a
+    generated module.  API types are looked up through virtualbox.library
+    at call time so that they are loaded lazily and so that extension
+    classes from virtualbox.library_ext are picked up."""
+    if name in local_types:
+        return name
+    return "_lib.%s" % name
+
+
 def type_to_name_doc(t):
     if t in known_types:
         return known_types[t]
@@ -408,11 +575,11 @@ def type_to_name_doc(t):
 
 
 def process_interface_attribute(node):
-    name = node.getAttribute("name")
-    atype = node.getAttribute("type")
-    array = node.getAttribute("safearray") == "yes"
+    name = node.get("name", "")
+    atype = node.get("type", "")
+    array = node.get("safearray", "") == "yes"
     ntype = type_to_name(atype)
-    readonly = node.getAttribute("readonly") == "yes"
+    readonly = node.get("readonly", "") == "yes"
     if readonly:
         doc_action = "Get"
     else:
@@ -429,12 +596,12 @@ def process_interface_attribute(node):
     pname = pythonic_name(name)
     if array:
         if ntype not in python_types:
-            retval = "[%s(a) for a in ret]" % ntype
+            retval = "[%s(a) for a in ret]" % lib_type(ntype)
         else:
             retval = "ret"
     else:
         if ntype not in python_types:
-            retval = "%s(ret)" % (ntype)
+            retval = "%s(ret)" % lib_type(ntype)
         else:
             retval = "ret"
     code.append(
@@ -455,11 +622,10 @@ def process_interface_attribute(node):
             doc = "\n        %s\n        " % (rdoc)
 
         if ntype == "str":
-            assert_type = ATTR_SET_ASSERT_INST % (dict(ntype="basestring"))
+            ntype = "basestring"
         elif ntype == "int":
-            assert_type = ATTR_SET_ASSERT_INST % (dict(ntype="baseinteger"))
-        else:
-            assert_type = ATTR_SET_ASSERT_INST % (dict(ntype=ntype))
+            ntype = "baseinteger"
+        assert_type = ATTR_SET_ASSERT_INST % dict(ntype=ntype, ltype=lib_type(ntype))
         code.append(ATTR_SET % dict(name=name, pname=pname, assert_type=assert_type))
     code.append("")
     return code
@@ -479,17 +645,17 @@ METHOD_DOC_RAISES = """\
         """
 
 METHOD_ASSERT_IN_INST = """\
-        if not isinstance(%(invar)s, %(invartype)s):
+        if not isinstance(%(invar)s, %(linvartype)s):
             raise TypeError("%(invar)s can only be an instance of type %(invartype)s")"""
 
 METHOD_ASSERT_ARRAY_IN = """\
         for a in %(invar)s[:10]:
-            if not isinstance(a, %(invartype)s):
+            if not isinstance(a, %(linvartype)s):
                 raise TypeError("array can only contain objects of type %(invartype)s")"""
 
 METHOD_ASSERT_ARRAY_IN_INST = """\
         for a in %(invar)s[:10]:
-            if not isinstance(a, %(invartype)s):
+            if not isinstance(a, %(linvartype)s):
                 raise TypeError(
                         "array can only contain objects of type %(invartype)s")"""
 
@@ -505,37 +671,36 @@ METHOD_RETURN = """\
 
 def process_interface_method(node):
     def process_result(c):
-        name = c.getAttribute("name")
+        name = c.get("name", "")
         cname = ":class:`%s`" % error_name_to_pname(name)
-        d = c.childNodes[0]
-        cdoc = getattr(d, "wholeText", "").strip()
+        cdoc = (c.text or "").strip()
         if cdoc:
             cdoc = "\n            %s" % cdoc
         return (cname, cdoc)
 
-    method_name = node.getAttribute("name")
+    method_name = node.get("name", "")
     method_doc = get_doc(node, 8)
 
     ret_param = None
     params = []
     raises = []
-    for c in node.childNodes:
-        name = getattr(c, "tagName", None)
+    for c in node:
+        name = tag_name(c)
         if name in [None, "note"]:
             continue
         if name == "desc":
-            for e in c.childNodes:
-                n = getattr(e, "tagName", None)
+            for e in c:
+                n = tag_name(e)
                 if n == "result":
                     raises.append(process_result(e))
         elif name == "result":
             raises.append(process_result(c))
         elif name == "param":
-            cname = c.getAttribute("name")
+            cname = c.get("name", "")
             cdoc = get_doc(c)
-            atype = c.getAttribute("type")
-            cio = c.getAttribute("dir")
-            array = c.getAttribute("safearray")
+            atype = c.get("type", "")
+            cio = c.get("dir", "")
+            array = c.get("safearray", "")
             if cio in ["in", "out"]:
                 params.append((cname, cio, cdoc, atype, array))
             elif cio == "return":
@@ -586,32 +751,22 @@ def process_interface_method(node):
                 invartype = atype
 
             if invartype == "str":
-                func.append(
-                    METHOD_ASSERT_IN_INST % dict(invar=name, invartype="basestring")
-                )
+                invartype = "basestring"
             elif invartype == "int":
-                func.append(
-                    METHOD_ASSERT_IN_INST % dict(invar=name, invartype="baseinteger")
-                )
-            else:
-                func.append(
-                    METHOD_ASSERT_IN_INST % dict(invar=name, invartype=invartype)
-                )
+                invartype = "baseinteger"
+            func.append(
+                METHOD_ASSERT_IN_INST
+                % dict(invar=name, invartype=invartype, linvartype=lib_type(invartype))
+            )
             if array:
                 if atype == "str":
-                    func.append(
-                        METHOD_ASSERT_ARRAY_IN_INST
-                        % dict(invar=name, invartype="basestring")
-                    )
+                    atype = "basestring"
                 elif atype == "int":
-                    func.append(
-                        METHOD_ASSERT_ARRAY_IN_INST
-                        % dict(invar=name, invartype="baseinteger")
-                    )
-                else:
-                    func.append(
-                        METHOD_ASSERT_ARRAY_IN_INST % dict(invar=name, invartype=atype)
-                    )
+                    atype = "baseinteger"
+                func.append(
+                    METHOD_ASSERT_ARRAY_IN_INST
+                    % dict(invar=name, invartype=atype, linvartype=lib_type(atype))
+                )
         elif io == "out":
             outvars.append(name)
             out_p.append((name, atype, array))
@@ -646,9 +801,9 @@ def process_interface_method(node):
             continue
 
         if array:
-            convfunc = "[%s(a) for a in %s]" % (atype, name)
+            convfunc = "[%s(a) for a in %s]" % (lib_type(atype), name)
         else:
-            convfunc = "%s(%s)" % (atype, name)
+            convfunc = "%s(%s)" % (lib_type(atype), name)
         func.append(METHOD_OUT_CONV % dict(name=name, convfunc=convfunc))
 
     if retvars:
@@ -659,9 +814,9 @@ def process_interface_method(node):
 
 
 def preprocess(xidl, target):
-    lines = []
+    """Yield the stripped lines of the xidl file object that apply to target"""
     emit = True
-    for line in xidl.splitlines():
+    for line in xidl:
         line = line.strip()
         if line.startswith(b"<if target="):
             if target in line:
@@ -673,8 +828,95 @@ def preprocess(xidl, target):
             emit = True
             continue
         if emit:
-            lines.append(line)
-    return b"\n".join(lines)
+            yield line
+
+
+class XIDLTarget(ElementTree.TreeBuilder):
+    """XIDLTarget builds the XIDL element tree while it is being parsed.
+
+    Once an element has been fully parsed it is passed to handler(element,
+    parent).  When handler returns True the element is dropped from the
+    tree, which keeps only the part of the document being worked on in
+    memory.
+    """
+
+    def __init__(self, handler):
+        ElementTree.TreeBuilder.__init__(self, insert_comments=True)
+        self.handler = handler
+        self.stack = []
+
+    def start(self, tag, attrs):
+        element = ElementTree.TreeBuilder.start(self, tag, attrs)
+        self.stack.append(element)
+        return element
+
+    def end(self, tag):
+        element = ElementTree.TreeBuilder.end(self, tag)
+        self.stack.pop()
+        parent = self.stack[-1] if self.stack else None
+        if self.handler(element, parent) and parent is not None:
+            parent.remove(element)
+        return element
+
+
+###########################################################
+#
+# Lean build - move docstrings out of the generated code
+#
+###########################################################
+LEAN_DOC = """\
+    __doc__ = LazyDoc("%(name)s")
+"""
+
+
+def make_lean(name, source):
+    """Strip docstrings out of the generated module source for class name.
+
+    Return the lean module source and a dict of the docstrings that were
+    removed.  The dict holds the class docstring under "__doc__", the
+    docstring of each member under the member's name and, for enumerations,
+    the docstring of each value under "_enums".
+    """
+    tree = ast.parse(source)
+    lines = source.splitlines(True)
+    docs = {}
+    cut = []
+    for node in tree.body:
+        if not isinstance(node, ast.ClassDef) or node.name != name:
+            continue
+        doc = ast.get_docstring(node, clean=False)
+        if doc is not None:
+            docs["__doc__"] = doc
+            cut.append(node.body[0])
+        for member in node.body:
+            if isinstance(member, ast.FunctionDef):
+                doc = ast.get_docstring(member, clean=False)
+                if doc is not None and len(member.body) > 1:
+                    docs[member.name] = doc
+                    cut.append(member.body[0])
+            elif isinstance(member, ast.Assign) and member.targets[0].id == "_enums":
+                rows = ast.literal_eval(member.value)
+                docs["_enums"] = dict((str(value), doc) for _, value, doc in rows)
+                enums = ["    _enums = ["]
+                enums.extend(
+                    "        (%r, %r)," % (label, value) for label, value, _ in rows
+                )
+                enums.append("    ]\n")
+                cut.append(member)
+                lines[member.lineno - 1] = "\n".join(enums)
+        class_line = node.lineno - 1
+    # Drop the lines of each docstring, last first to keep line numbers valid.
+    for node in sorted(cut, key=lambda n: n.lineno, reverse=True):
+        keep = lines[node.lineno - 1] if not isinstance(node, ast.Expr) else ""
+        lines[node.lineno - 1 : node.end_lineno] = [keep] if keep else []
+    lines.insert(class_line + 1, LEAN_DOC % dict(name=name))
+    source = "".join(lines)
+    source = source.replace(
+        "from __future__ import absolute_import",
+        "from __future__ import absolute_import\nfrom ..library_base import LazyDoc",
+        1,
+    )
+    return source, docs
 
 
 ###########################################################
@@ -684,6 +926,13 @@ def preprocess(xidl, target):
 ###########################################################
 
 
+def write_source(path, source):
+    if not isinstance(source, bytes):
+        source = source.encode("utf-8")
+    with open(path, "wb") as f:
+        f.write(source)
+
+
 def get_vbox_version(config_kmk):
     "Return the vbox config major, minor, build"
     with open(config_kmk, "rb") as f:
@@ -695,65 +944,83 @@ def get_vbox_version(config_kmk):
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Generate virtualbox/library.py")
+    parser.add_argument(
+        "--lean",
+        action="store_true",
+        help="write docstrings to virtualbox/_library/docs instead of the code",
+    )
+    options = parser.parse_args()
+
     virtualbox_xidl = "VirtualBox.xidl"
     config_kmk = "Config.kmk"
 
     print("Create new virtualbox/library.py")
-    xidl = open(virtualbox_xidl, "rb").read()
-    xidl = preprocess(xidl, target=b"xpidl")
-
-    xml = minidom.parseString(xidl)
-
-    # Get the idl description
-    idl = xml.getElementsByTagName("idl")
-    assert len(idl) == 1
-    idl = idl[0]
-    lib_doc = '''__doc__ = """\\\n  %s\n"""\n\n''' % get_doc(idl, 0)
+    lib_doc = []
+    library = {}
+    applications = []
+    results = []
+    error_names = []
+    modules = {}
+
+    def handle(node, parent):
+        name = tag_name(node)
+        if name == "desc" and not lib_doc:
+            # The first desc in the document describes the idl.
+            lib_doc.append('''__doc__ = """\\\n  %s\n"""\n\n''' % get_doc(parent, 0))
+            return False
+        elif name == "library":
+            library.update(node.attrib)
+            return False
+        elif name == "application":
+            applications.append(node)
+            return False
+        elif parent is None or parent.tag not in ("library", "application"):
+            return False
+
+        # 5.2 introduced <library><application> ... </application></library>
+        if parent.tag == "library" or parent.get("name") == "VirtualBox":
+            if name == "result":
+                results.append(process_result_node(node))
+                error_names.append(error_name_to_pname(node.get("name", "")))
+            elif name == "enum":
+                modules[node.get("name", "")] = process_enum_node(node)
+            elif name == "interface":
+                modules[node.get("name", "")] = process_interface_node(node)
+        return True
+
+    md5 = hashlib.md5()
+    xml_parser = ElementTree.XMLParser(target=XIDLTarget(handle))
+    with open(virtualbox_xidl, "rb") as xidl:
+        for i, line in enumerate(preprocess(xidl, target=b"xpidl")):
+            if i:
+                md5.update(b"\n")
+                xml_parser.feed(b"\n")
+            md5.update(line)
+            xml_parser.feed(line)
+    xml_parser.close()
+    lib_doc = lib_doc[0]
 
-    # Process the library
-
-    library = xml.getElementsByTagName("library")
-    assert len(library) == 1
-    library = library[0]
-
-    # 5.2 introduced <library><application> ... </application></library>
-    applications = xml.getElementsByTagName("application")
     if applications:
         for application in applications:
-            name = application.attributes.get("name", None)
-            if name is not None:
-                if "VirtualBox" == name.value:
-                    break
+            if application.get("name") == "VirtualBox":
+                break
         else:
             raise ValueError("Failed to find VirtualBox application")
-        app_uuid = application.getAttribute("uuid")
-        virtualbox_application = application
+        app_uuid = application.get("uuid", "")
     else:
-        app_uuid = library.getAttribute("appUuid")
-        virtualbox_application = library
-
-    # Iterate each element under the virtualbox application node
-    source = dict(result=[], enum=[], interface=[])
-    for node in virtualbox_application.childNodes:
-        name = getattr(node, "tagName", None)
-        if name is None:
-            continue
-        if name == "result":
-            source["result"].append(process_result_node(node))
-        elif name == "enum":
-            source["enum"].append(process_enum_node(node))
-        elif name == "interface":
-            source["interface"].append(process_interface_node(node))
+        app_uuid = library.get("appUuid", "")
 
     # Add OLE errors to 'result'
     for args in OLE_ERRORS:
-        source["result"].append(build_error_result(*args))
+        results.append(build_error_result(*args))
+        error_names.append(error_name_to_pname(args[0]))
 
     # get lib meta
     vbox_version = get_vbox_version(config_kmk)
-    uuid = library.getAttribute("uuid")
-    version = library.getAttribute("version")
-    xidl_hash = hashlib.md5(xidl).hexdigest()
+    uuid = library.get("uuid", "")
+    version = library.get("version", "")
+    xidl_hash = md5.hexdigest()
     lib_meta = LIB_META % dict(
         vbox_version=to_string(vbox_version),
         uuid=to_string(uuid),
@@ -762,26 +1029,50 @@ def main():
         xidl_hash=to_string(xidl_hash),
     )
 
+    errors = MODULE_IMPORTS % dict(imports="from ..library_base import VBoxError")
+    errors += "\n".join(results)
+    lib_errors = LIB_ERRORS_IMPORT % dict(
+        names="\n".join("    %s," % n for n in error_names)
+    )
+    lib_events = LIB_EVENTS % dict(
+        events="\n".join(
+            '    %s: "%s",' % (value, name)
+            for value, name in sorted(EVENT_INTERFACES.items())
+        )
+    )
+    lib_lazy = LIB_LAZY % dict(
+        index="\n".join('    "%s": "%s",' % (n, module_name(n)) for n in modules)
+    )
+
     code = []
     code.append(LIB_IMPORTS)
     code.append(lib_doc)
     code.append(lib_meta)
     code.append(LIB_DEFINES)
-    code.extend(source["result"])
-    code.extend(source["enum"])
-    code.extend(source["interface"])
-    code = b"\n".join(
-        [c.encode("utf-8") if not isinstance(c, bytes) else c for c in code]
-    )
+    code.append(lib_errors)
+    code.append(lib_events)
+    code.append(lib_lazy)
+    code = "\n".join(code)
     print("   vbox version : %s" % to_string(vbox_version))
     print("   xidl hash    : %s" % xidl_hash)
     print("   version      : %s" % version)
-    print("   line count   : %s" % code.count(b"\n"))
-    library_path = os.path.join(".", "virtualbox", "library.py")
-    if os.path.exists(library_path):
-        os.unlink(library_path)
-    with open(library_path, "wb") as f:
-        f.write(code)
+    print("   modules      : %s" % len(modules))
+
+    package_path = os.path.join(".", "virtualbox", "_library")
+    if os.path.exists(package_path):
+        shutil.rmtree(package_path)
+    os.makedirs(package_path)
+    write_source(os.path.join(package_path, "__init__.py"), LIB_PACKAGE_INIT)
+    write_source(os.path.join(package_path, "errors.py"), errors)
+    if options.lean:
+        os.makedirs(os.path.join(package_path, "docs"))
+    for name, source in modules.items():
+        if options.lean:
+            source, docs = make_lean(name, source)
+            doc_path = os.path.join(package_path, "docs", "%s.json" % name)
+            write_source(doc_path, json.dumps(docs, indent=1, sort_keys=True))
+        write_source(os.path.join(package_path, "%s.py" % module_name(name)), source)
+    write_source(os.path.join(".", "virtualbox", "library.py"), code)
 
 
 if __name__ == "__main__":
@@ -1,18 +1,31 @@
 #!/usr/bin/env python
 from setuptools import setup
+from setuptools.command.build_py import build_py
 import os
-
+import sys
 
 base_dir = os.path.dirname(os.path.abspath(__file__))
 about = {}
 with open(os.path.join(base_dir, "virtualbox", "__about__.py")) as f:
     exec(f.read(), about)
 
+# Modules written in Python 3 only syntax, left out of Python 2 builds
+PY3_ONLY = [("virtualbox", "aio")]
+
+
+class BuildPy(build_py):
+    def find_package_modules(self, package, package_dir):
+        modules = build_py.find_package_modules(self, package, package_dir)
+        if sys.version_info[0] < 3:
+            modules = [m for m in modules if (m[0], m[1]) not in PY3_ONLY]
+        return modules
+
 
 setup(
     name=about["__title__"],
     version=about["__version__"],
-    packages=["virtualbox", "virtualbox.library_ext"],
+    packages=["virtualbox", "virtualbox.library_ext", "virtualbox._library"],
+    package_data={"virtualbox._library": ["docs/*.json"]},
     author=about["__author__"],
     author_email=about["__author_email__"],
     maintainer=about["__maintainer__"],
@@ -22,7 +35,8 @@ setup(
     long_description=open("README.rst").read(),
     license=about["__license__"],
     zip_safe=False,
-    install_requires=[],
+    # virtualbox.executor needs concurrent.futures, backported as futures
+    install_requires=['futures; python_version < "3"'],
     platforms=["cygwin", "win", "linux"],
     classifiers=[
         "Development Status :: 5 - Production/Stable",
@@ -50,4 +64,5 @@ setup(
         "Topic :: Software Development :: Testing",
     ],
     test_suite="tests",
+    cmdclass={"build_py": BuildPy},
 )
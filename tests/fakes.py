@@ -0,0 +1,132 @@
+"""Stand-ins for the machine, session, console and guest objects shared by
+the tests.  Tests subclass them for the behaviour they exercise."""
+
+import threading
+
+from virtualbox.library import AdditionsRunLevelType
+from virtualbox.library import GuestSessionStatus
+from virtualbox.library import LockType
+from virtualbox.library import SessionState
+from virtualbox.library import VBoxError
+
+from tests.test_event_dispatch import FakeEventSource
+
+
+class FakeProgress(object):
+    id_p = "progress"
+    completed = True
+    result_code = 0
+
+    def wait_for_completion(self, timeout):
+        pass
+
+
+class FakeGuestSession(object):
+    def __init__(self, machine=None, user=None):
+        self.machine = machine
+        self.user = user
+        self.event_source = FakeEventSource()
+        self.status = GuestSessionStatus.started
+        self.closed = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def close(self):
+        self.closed = True
+        self.status = GuestSessionStatus.terminated
+
+
+class FakeGuest(object):
+    def __init__(self, machine=None):
+        self.machine = machine
+        self.event_source = FakeEventSource()
+        self.additions_run_level = AdditionsRunLevelType.system
+
+    def create_session(self, user, password, domain="", session_name="", timeout_ms=0):
+        return self.machine.create_guest_session(user, password)
+
+
+class FakeConsole(object):
+    def __init__(self, machine=None, activity=()):
+        self.machine = machine
+        self.guest = FakeGuest(machine)
+        self.activity = list(activity)
+        self.samples = 0
+
+    def get_device_activity(self, device_types):
+        self.samples += 1
+        return [self.activity.pop(0)]
+
+    def pause(self):
+        pass
+
+    def power_down(self):
+        self.machine.power_off()
+        return FakeProgress()
+
+
+class FakeSession(object):
+    def __init__(self, console=None):
+        self.machine = None
+        self.console = console
+
+    @property
+    def state(self):
+        if self.machine is not None and self in self.machine.sessions:
+            return SessionState.locked
+        return SessionState.unlocked
+
+    def unlock_machine(self):
+        if self.state != SessionState.locked:
+            raise VBoxError("session is not locked")
+        self.machine.unlock(self)
+
+
+class FakeMachine(object):
+    """Machine that sessions can lock, with a guest behind its console"""
+
+    def __init__(self, id_p, name=None):
+        self.id_p = id_p
+        self.name = name or id_p
+        # Sessions holding a lock on the machine
+        self.sessions = []
+        self.unlocked = 0
+        self.mutex = threading.Lock()
+
+    @property
+    def locked(self):
+        return len(self.sessions)
+
+    @property
+    def session_state(self):
+        if self.sessions:
+            return SessionState.locked
+        return SessionState.unlocked
+
+    def lock_machine(self, session, lock_type):
+        with self.mutex:
+            if (
+                lock_type == LockType.write
+                and self.session_state == SessionState.locked
+            ):
+                raise VBoxError("machine is already locked")
+            self.sessions.append(session)
+        session.machine = self
+        session.console = FakeConsole(self)
+
+    def create_session(self, lock_type=LockType.shared):
+        session = FakeSession()
+        self.lock_machine(session, lock_type)
+        return session
+
+    def unlock(self, session):
+        with self.mutex:
+            self.sessions.remove(session)
+            self.unlocked += 1
+
+    def create_guest_session(self, user, password):
+        return FakeGuestSession(self, user)
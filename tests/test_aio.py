@@ -0,0 +1,287 @@
+import asyncio
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from virtualbox import aio
+from virtualbox import events
+from virtualbox import library
+from virtualbox import pool
+from virtualbox import readiness
+
+from tests import fakes
+from tests import test_pool
+from tests.test_event_dispatch import FakeEventSource
+
+EXTRA = library.VBoxEventType.on_extra_data_changed
+STATE = library.VBoxEventType.on_machine_state_changed
+
+
+class TestEventStream(unittest.TestCase):
+    def setUp(self):
+        self.source = FakeEventSource()
+        self.loop = asyncio.new_event_loop()
+
+    def tearDown(self):
+        self.loop.close()
+
+    def run_async(self, coro):
+        return self.loop.run_until_complete(asyncio.wait_for(coro, 5))
+
+    def test_stream_delivers_typed_events(self):
+        async def consume():
+            stream = aio.EventStream(self.source, [EXTRA, STATE])
+            async with stream:
+                # Wait for the listener for EXTRA alone to be retired.
+                while len(self.source.listeners) > 1:
+                    await asyncio.sleep(0.01)
+                self.source.fire(EXTRA)
+                self.source.fire(STATE)
+                received = [await stream.get(), await stream.get()]
+            return received, self.source.processed
+
+        received, processed = self.run_async(consume())
+        self.assertEqual(
+            [type(e) for e in received],
+            [library.IExtraDataChangedEvent, library.IMachineStateChangedEvent],
+        )
+        self.assertEqual(processed, 2)
+        self.assertEqual(self.source.listeners, {})
+
+    def test_iteration_stops_after_close(self):
+        async def consume():
+            stream = aio.EventStream(self.source, EXTRA)
+            self.source.fire(EXTRA)
+            received = []
+            async for event in stream:
+                received.append(event)
+                stream.close()
+            return received
+
+        self.assertEqual(len(self.run_async(consume())), 1)
+
+    def test_drop_oldest(self):
+        stream = aio.EventStream(
+            self.source, EXTRA, maxsize=2, overflow=aio.DROP_OLDEST, loop=self.loop
+        )
+        queued = [object(), object(), object()]
+        for event in queued:
+            stream._put(event)
+        stream.close()
+        self.assertEqual([e for _, e in stream._buffer], queued[1:])
+        self.assertEqual(stream.dropped, 1)
+
+    def test_coalesce(self):
+        keys = []
+
+        def coalesce_key(event):
+            keys.append(event)
+            return event[0]
+
+        stream = aio.EventStream(
+            self.source,
+            EXTRA,
+            maxsize=2,
+            overflow=aio.COALESCE,
+            coalesce_key=coalesce_key,
+            loop=self.loop,
+        )
+        for event in [("a", 1), ("b", 1), ("a", 2)]:
+            stream._put(event)
+        stream.close()
+        self.assertEqual([e for _, e in stream._buffer], [("b", 1), ("a", 2)])
+        self.assertEqual(stream.dropped, 1)
+        # The key of each event is computed once, as it is queued.
+        self.assertEqual(keys, [("a", 1), ("b", 1), ("a", 2)])
+
+    def test_block_uses_own_listener(self):
+        shared = aio.EventStream(self.source, EXTRA, loop=self.loop)
+        blocking = aio.EventStream(
+            self.source, EXTRA, maxsize=1, overflow=aio.BLOCK, loop=self.loop
+        )
+        try:
+            self.assertEqual(self.source.created, 2)
+            self.assertNotIn(blocking._dispatcher, events._dispatchers.values())
+        finally:
+            blocking.close()
+            shared.close()
+        self.assertEqual(self.source.listeners, {})
+
+    def test_invalid_overflow(self):
+        with self.assertRaises(ValueError):
+            aio.EventStream(self.source, EXTRA, overflow="spill", loop=self.loop)
+
+
+class FakeErrorInfo(object):
+    text = "operation failed in the fake"
+
+
+class FakeCompletedEvent(object):
+    type = library.VBoxEventType.on_progress_task_completed
+
+    def __init__(self, progress_id):
+        self.progressId = progress_id
+
+
+class FakeProgressEventSource(FakeEventSource):
+    def __init__(self):
+        FakeEventSource.__init__(self)
+        self.aggregated = []
+
+    def create_aggregator(self, subordinates):
+        self.aggregated.append(len(subordinates))
+        return self
+
+    def complete(self, progress):
+        progress.completed = True
+        self.post(FakeCompletedEvent(progress.id_p))
+
+
+class FakeProgress(object):
+    def __init__(self, event_source, progress_id="progress", result_code=0):
+        self.event_source = event_source
+        self.id_p = progress_id
+        self.completed = False
+        self.result_code = result_code
+        self.error_info = FakeErrorInfo() if result_code else None
+
+
+class TestWaitForProgress(unittest.TestCase):
+    def setUp(self):
+        self.source = FakeProgressEventSource()
+        self.loop = asyncio.new_event_loop()
+
+    def tearDown(self):
+        self.loop.close()
+
+    def run_async(self, coro):
+        return self.loop.run_until_complete(asyncio.wait_for(coro, 5))
+
+    def wait_until(self, predicate):
+        deadline = time.time() + 5
+        while not predicate():
+            self.assertLess(time.time(), deadline, "timed out")
+            time.sleep(0.01)
+
+    def test_completion_event(self):
+        progress = FakeProgress(self.source)
+        self.loop.call_later(0.01, self.source.complete, progress)
+        self.run_async(aio.wait_for_progress(progress))
+        self.wait_until(lambda: not self.source.listeners)
+
+    def test_already_completed(self):
+        progress = FakeProgress(self.source)
+        progress.completed = True
+        self.run_async(aio.wait_for_progress(progress))
+        self.assertEqual(self.source.created, 0)
+
+    def test_failed_operation(self):
+        progress = FakeProgress(self.source, result_code=1)
+        progress.completed = True
+        with self.assertRaises(library.VBoxError) as cm:
+            self.run_async(aio.wait_for_progress(progress))
+        self.assertIn("failed in the fake", str(cm.exception))
+
+    def test_waiters_share_one_listener(self):
+        monitor = aio._progress_monitor
+        progresses = [FakeProgress(self.source, "p%s" % i) for i in range(5)]
+
+        async def wait_all():
+            waits = [aio.wait_for_progress(progress) for progress in progresses]
+            waits = asyncio.gather(*waits)
+            while len(monitor._waiters) < 5 or monitor._listener is None:
+                await asyncio.sleep(0.01)
+            self.assertEqual(len(self.source.listeners), 1)
+            self.assertEqual(self.source.aggregated[-1], 5)
+            for progress in progresses:
+                self.source.complete(progress)
+            await waits
+
+        self.run_async(wait_all())
+        self.wait_until(lambda: not self.source.listeners)
+
+
+class TestAsyncMachinePool(unittest.TestCase):
+    def setUp(self):
+        self.root = test_pool.FakeMachine("root", name="win7")
+        self.vbox = test_pool.FakeVirtualBox([self.root])
+        self.saved = pool.VirtualBox, pool.Session, aio.VirtualBox, aio.Session
+        pool.VirtualBox = aio.VirtualBox = lambda: self.vbox
+        pool.Session = aio.Session = fakes.FakeSession
+        self.probe = test_pool.TrackingProbe()
+        self.loop = asyncio.new_event_loop()
+
+    def tearDown(self):
+        self.loop.close()
+        pool.VirtualBox, pool.Session, aio.VirtualBox, aio.Session = self.saved
+
+    def run_pool(self, test, **kwargs):
+        kwargs.setdefault("readiness", readiness.Readiness([self.probe]))
+
+        async def run():
+            async_pool = await aio.AsyncMachinePool.open("win7", **kwargs)
+            try:
+                await test(async_pool)
+            finally:
+                await async_pool.close()
+
+        self.loop.run_until_complete(asyncio.wait_for(run(), 10))
+
+    def test_acquire_and_release(self):
+        async def test(async_pool):
+            session = await async_pool.acquire("Mick", "password")
+            clone = session.machine
+            self.assertTrue(clone.running)
+            await async_pool.release(session)
+            self.assertFalse(clone.running)
+            self.assertEqual(async_pool.pool.stats()["ready"], 1)
+
+            async with async_pool.machine("Mick", "password") as session:
+                self.assertIs(session.machine, clone)
+                self.assertEqual(async_pool.pool.stats()["busy"], 1)
+            self.assertEqual(async_pool.pool.stats()["ready"], 1)
+
+        self.run_pool(test, max_size=1)
+
+    def test_acquire_waits_for_release_at_max_size(self):
+        async def test(async_pool):
+            first = await async_pool.acquire("Mick", "password")
+            waiter = asyncio.ensure_future(async_pool.acquire("Mick", "password"))
+            await asyncio.sleep(0.05)
+            self.assertFalse(waiter.done())
+            t0 = time.time()
+            await async_pool.release(first)
+            second = await waiter
+            # Woken by the release rather than the once a second recheck.
+            self.assertLess(time.time() - t0, 0.5)
+            self.assertIs(second.machine, first.machine)
+            await async_pool.release(second)
+
+        self.run_pool(test, max_size=1)
+
+    def test_builds_bounded_by_workers(self):
+        self.probe.delay = 0.05
+
+        async def test(async_pool):
+            sessions = await asyncio.gather(
+                *[async_pool.acquire("Mick", "password") for _ in range(4)]
+            )
+            self.assertEqual(self.probe.peak, 2)
+            for session in sessions:
+                await async_pool.release(session)
+
+        self.run_pool(test, workers=2)
+
+    def test_close_leaves_callers_executor_running(self):
+        executor = ThreadPoolExecutor(2)
+        self.addCleanup(executor.shutdown)
+        owned = []
+
+        async def test(async_pool):
+            owned.append(async_pool.executor)
+
+        self.run_pool(test, executor=executor)
+        self.assertEqual(executor.submit(lambda: 42).result(), 42)
+        self.run_pool(test)
+        self.assertIsNot(owned[1], executor)
+        self.assertRaises(RuntimeError, owned[1].submit, lambda: 42)
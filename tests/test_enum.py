@@ -8,3 +8,22 @@ class TestEnumeration(unittest.TestCase):
         self.assertEqual(int(library.MachineState.paused), 6)
         self.assertEqual(str(library.MachineState.paused), "Paused")
         self.assertEqual(repr(library.MachineState.paused), "MachineState(6)")
+
+    def test_instances_are_interned(self):
+        state = library.MachineState(6)
+        self.assertIs(state, library.MachineState.paused)
+        self.assertIs(library.MachineState(5), library.MachineState.running)
+        self.assertIs(library.MachineState(5), library.MachineState.first_online)
+
+    def test_eq_and_hash_use_value(self):
+        self.assertEqual(library.MachineState.paused, 6)
+        self.assertNotEqual(library.MachineState.paused, 5)
+        lookup = {library.MachineState.paused: "paused"}
+        self.assertEqual(lookup[6], "paused")
+
+    def test_unknown_value(self):
+        self.assertRaises(ValueError, library.MachineState, 9999)
+
+    def test_no_instance_dict(self):
+        self.assertFalse(hasattr(library.MachineState.paused, "__dict__"))
+        self.assertTrue(library.MachineState.paused.__doc__)
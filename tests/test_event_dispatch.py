@@ -0,0 +1,231 @@
+import threading
+import time
+import unittest
+
+from virtualbox import events
+from virtualbox import library
+
+ANY = int(library.VBoxEventType.any_p)
+LAST_WILDCARD = int(library.VBoxEventType.last_wildcard)
+
+
+class FakeEvent(object):
+    def __init__(self, event_type):
+        self.type = event_type
+
+
+class FakeEventSource(object):
+    """Minimal stand-in for IEventSource that records listener traffic
+
+    Like VirtualBox, each registered listener gets its own queue of the
+    events it is interested in, and wildcard types match every event whose
+    interface derives from theirs.
+    """
+
+    def __init__(self):
+        self._i = object()
+        self.cond = threading.Condition()
+        self.queues = {}
+        self.listeners = {}
+        self.aggregators = []
+        self.registrations = 0
+        self.created = 0
+        self.processed = 0
+
+    def create_listener(self):
+        self.created += 1
+        return "listener-%s" % self.created
+
+    def create_aggregator(self, subordinates):
+        aggregator = FakeEventSource()
+        for source in subordinates:
+            with source.cond:
+                source.aggregators.append(aggregator)
+        return aggregator
+
+    def register_listener(self, listener, interesting, active):
+        with self.cond:
+            self.registrations += 1
+            self.listeners[listener] = [int(t) for t in interesting]
+            self.queues[listener] = []
+            self.cond.notify_all()
+
+    def unregister_listener(self, listener):
+        with self.cond:
+            self.listeners.pop(listener, None)
+            self.queues.pop(listener, None)
+            self.cond.notify_all()
+
+    @staticmethod
+    def _interested(interesting, event_type):
+        if ANY in interesting or event_type in interesting:
+            return True
+        interface = events.type_to_interface(library.VBoxEventType(event_type))
+        for wildcard in interesting:
+            if wildcard <= LAST_WILDCARD and wildcard in library._event_interfaces:
+                wildcard = events.type_to_interface(library.VBoxEventType(wildcard))
+                if issubclass(interface, wildcard):
+                    return True
+        return False
+
+    def post(self, event):
+        """Queue event for every listener interested in its type"""
+        with self.cond:
+            for listener, interesting in self.listeners.items():
+                if self._interested(interesting, int(event.type)):
+                    self.queues[listener].append(event)
+            self.cond.notify_all()
+            aggregators = list(self.aggregators)
+        for aggregator in aggregators:
+            aggregator.post(event)
+
+    def fire(self, event_type):
+        self.post(FakeEvent(event_type))
+
+    def get_event(self, listener, timeout):
+        with self.cond:
+            if listener not in self.listeners:
+                raise library.VBoxError("listener not registered")
+            if not self.queues[listener] and timeout:
+                self.cond.wait(timeout / 1000.0)
+            if listener not in self.listeners:
+                raise library.VBoxError("listener unregistered while waiting")
+            queue = self.queues[listener]
+            return queue.pop(0) if queue else None
+
+    def event_processed(self, listener, event):
+        with self.cond:
+            self.processed += 1
+
+
+class TestEventDispatch(unittest.TestCase):
+    def setUp(self):
+        self.source = FakeEventSource()
+        self.ids = []
+
+    def tearDown(self):
+        for callback_id in self.ids:
+            events.unregister_callback(callback_id)
+
+    def wait_for_one_listener(self):
+        # Replaced listeners are retired by the monitor thread.
+        deadline = time.time() + 5
+        while len(self.source.listeners) > 1 and time.time() < deadline:
+            time.sleep(0.01)
+
+    def register(self, callback, event_type):
+        callback_id = events.register_callback(callback, self.source, event_type)
+        self.ids.append(callback_id)
+        return callback_id
+
+    def test_one_listener_for_many_callbacks(self):
+        seen = []
+        done = threading.Event()
+
+        def on_extra(event):
+            seen.append(("extra", type(event)))
+
+        def on_state(event):
+            seen.append(("state", type(event)))
+            done.set()
+
+        self.register(on_extra, library.VBoxEventType.on_extra_data_changed)
+        self.register(on_state, library.VBoxEventType.on_machine_state_changed)
+        extra = int(library.VBoxEventType.on_extra_data_changed)
+        state = int(library.VBoxEventType.on_machine_state_changed)
+        self.wait_for_one_listener()
+        self.assertEqual(list(self.source.listeners.values()), [sorted([extra, state])])
+
+        self.source.fire(library.VBoxEventType.on_extra_data_changed)
+        self.source.fire(library.VBoxEventType.on_machine_state_changed)
+        self.assertTrue(done.wait(5))
+        self.assertEqual(
+            seen,
+            [
+                ("extra", library.IExtraDataChangedEvent),
+                ("state", library.IMachineStateChangedEvent),
+            ],
+        )
+
+    def test_listener_grows_with_event_types(self):
+        extra = library.VBoxEventType.on_extra_data_changed
+        first = self.register(lambda e: None, extra)
+        self.register(lambda e: None, extra)
+        self.assertEqual(self.source.registrations, 1)
+        self.register(lambda e: None, library.VBoxEventType.on_snapshot_taken)
+        events.unregister_callback(first)
+        self.register(lambda e: None, library.VBoxEventType.on_machine_registered)
+        self.assertEqual(self.source.registrations, 3)
+        expected = sorted(
+            int(t)
+            for t in (
+                extra,
+                library.VBoxEventType.on_snapshot_taken,
+                library.VBoxEventType.on_machine_registered,
+            )
+        )
+        self.wait_for_one_listener()
+        self.assertEqual(list(self.source.listeners.values()), [expected])
+
+    def test_unsubscribed_events_are_not_fetched(self):
+        done = threading.Event()
+        self.register(lambda e: done.set(), library.VBoxEventType.on_machine_registered)
+        self.source.fire(library.VBoxEventType.on_extra_data_changed)
+        self.source.fire(library.VBoxEventType.on_machine_registered)
+        self.assertTrue(done.wait(5))
+        self.assertEqual(self.source.processed, 1)
+
+    def test_no_events_lost_or_repeated_while_growing(self):
+        seen = []
+        extra = library.VBoxEventType.on_extra_data_changed
+        self.register(seen.append, extra)
+        later = [
+            library.VBoxEventType.on_snapshot_taken,
+            library.VBoxEventType.on_machine_registered,
+            library.VBoxEventType.on_machine_state_changed,
+        ]
+        for event_type in later:
+            for _ in range(20):
+                self.source.fire(extra)
+            self.register(lambda e: None, event_type)
+        for _ in range(20):
+            self.source.fire(extra)
+        deadline = time.time() + 5
+        while len(seen) < 80 and time.time() < deadline:
+            time.sleep(0.01)
+        time.sleep(0.1)
+        self.assertEqual(len(seen), 80)
+        self.assertEqual(len(set(id(e._i) for e in seen)), 80)
+
+    def test_wildcard_event_type(self):
+        delivered = []
+        done = threading.Event()
+
+        def on_machine_event(event):
+            delivered.append(type(event))
+            done.set()
+
+        self.register(on_machine_event, library.VBoxEventType.machine_event)
+        self.source.fire(library.VBoxEventType.on_medium_registered)
+        self.source.fire(library.VBoxEventType.on_machine_state_changed)
+        self.assertTrue(done.wait(5))
+        self.assertEqual(delivered, [library.IMachineStateChangedEvent])
+
+    def test_last_unregister_removes_listener(self):
+        callback_id = self.register(
+            lambda e: None, library.VBoxEventType.on_extra_data_changed
+        )
+        events.unregister_callback(callback_id)
+        self.assertEqual(self.source.listeners, {})
+        self.assertNotIn(callback_id, events._callbacks)
+
+    def test_unregister_interrupts_get_event(self):
+        callback_id = events.register_callback(
+            lambda e: None, self.source, library.VBoxEventType.on_extra_data_changed
+        )
+        dispatcher = events._callbacks[callback_id]
+        self.assertTrue(dispatcher.ready.is_set())
+        t0 = time.time()
+        events.unregister_callback(callback_id)
+        self.assertLess(time.time() - t0, 0.5)
+        self.assertFalse(dispatcher.thread.is_alive())
@@ -0,0 +1,119 @@
+import unittest
+
+from virtualbox import library
+from virtualbox.executor import GuestExecutor
+from virtualbox.library_ext.guest_session import IGuestSession
+
+from tests.test_event_dispatch import FakeEventSource
+from tests.test_guest_session import FLAGS, FakeProcess, LateProcess
+
+
+class FakeSessionEventSource(FakeEventSource):
+    def __init__(self):
+        FakeEventSource.__init__(self)
+        self.aggregated = []
+
+    def create_aggregator(self, subordinates):
+        aggregator = FakeEventSource.create_aggregator(self, subordinates)
+        self.aggregated.append(aggregator)
+        return aggregator
+
+
+class FakeGuestSession(object):
+    def __init__(self):
+        self.event_source = FakeSessionEventSource()
+        self.started = []
+        self.running = 0
+        self.most_running = 0
+
+    def _create_process(self, command, arguments, *args):
+        if command == "missing":
+            raise library.VBoxError("no such file")
+        session = self
+
+        class Process(FakeProcess):
+            exit_code = len(arguments or [])
+
+            @property
+            def status(self):
+                status = FakeProcess.status.fget(self)
+                if status == library.ProcessStatus.terminated_normally and self.running:
+                    self.running = False
+                    session.running -= 1
+                return status
+
+            def wait_for(self, wait_for, timeout_ms=0):
+                return library.ProcessWaitResult.start
+
+        process = Process([command.encode("ascii")], [b"err"], running_reads=3)
+        process.running = True
+        self.running += 1
+        self.most_running = max(self.most_running, self.running)
+        self.started.append(command)
+        return process, FLAGS
+
+
+class TestGuestExecutor(unittest.TestCase):
+    def test_results(self):
+        session = FakeGuestSession()
+        with GuestExecutor(session) as executor:
+            futures = [executor.submit("cmd%s" % i, ["a"] * i) for i in range(5)]
+        for i, future in enumerate(futures):
+            result = future.result(5)
+            self.assertEqual(result.exit_code, i)
+            self.assertEqual(result.stdout, ("cmd%s" % i).encode("ascii"))
+            self.assertEqual(result.stderr, b"err")
+        # One listener at a time, on an aggregator of the running processes
+        aggregated = session.event_source.aggregated
+        self.assertTrue(aggregated)
+        for aggregator in aggregated:
+            self.assertEqual(aggregator.registrations, 1)
+            self.assertEqual(aggregator.listeners, {})
+        for future in futures:
+            event_source = future.result().process.event_source
+            self.assertEqual(event_source.registrations, 0)
+
+    def test_events_routed_to_their_process(self):
+        session = FakeGuestSession()
+        quiet = LateProcess(0.3)
+        chatty = FakeProcess([b"x"] * 200, [], running_reads=3)
+        processes = {"quiet": quiet, "chatty": chatty}
+        for process in processes.values():
+            process.wait_for = lambda wait_for, timeout_ms=0: None
+            process.exit_code = 0
+        session._create_process = lambda command, *args: (processes[command], FLAGS)
+        with GuestExecutor(session) as executor:
+            quiet_future = executor.submit("quiet")
+            chatty_future = executor.submit("chatty")
+            self.assertEqual(chatty_future.result(5).stdout, b"x" * 200)
+            # The quiet process isn't read while the chatty one is busy.
+            self.assertLess(len(quiet.reads), 20)
+        self.assertEqual(quiet_future.result(5).stdout, b"late")
+
+    def test_max_processes(self):
+        session = FakeGuestSession()
+        with GuestExecutor(session, max_processes=2) as executor:
+            futures = [executor.submit("cmd") for i in range(6)]
+        self.assertEqual([f.result(5).stdout for f in futures], [b"cmd"] * 6)
+        self.assertEqual(session.most_running, 2)
+
+    def test_failed_start(self):
+        session = FakeGuestSession()
+        with GuestExecutor(session) as executor:
+            failed = executor.submit("missing")
+            ok = executor.submit("cmd")
+        self.assertRaises(library.VBoxError, failed.result, 5)
+        self.assertEqual(ok.result(5).stdout, b"cmd")
+
+    def test_submit_after_shutdown(self):
+        executor = GuestExecutor(FakeGuestSession())
+        executor.shutdown()
+        self.assertRaises(RuntimeError, executor.submit, "cmd")
+
+    def test_run_many(self):
+        session = FakeGuestSession()
+        commands = [["one", "a", "b"], "two", {"command": "three"}]
+        futures = IGuestSession.run_many(session, commands)
+        results = [f.result(5) for f in futures]
+        self.assertEqual([r.stdout for r in results], [b"one", b"two", b"three"])
+        self.assertEqual(results[0].exit_code, 2)
@@ -0,0 +1,114 @@
+import threading
+import time
+import unittest
+
+from virtualbox import fleet
+from virtualbox import library
+
+from tests import fakes
+
+
+class FakeProcess(object):
+    def __init__(self, session, exit_code, status):
+        self.session = session
+        self._exit_code = exit_code
+        self._status = status
+
+    def _check(self):
+        if self.session.closed:
+            raise library.VBoxError("the guest session has been closed")
+
+    @property
+    def exit_code(self):
+        self._check()
+        return self._exit_code
+
+    @property
+    def status(self):
+        self._check()
+        return self._status
+
+
+class FakeGuestSession(fakes.FakeGuestSession):
+    def execute(self, command, arguments, stdin, timeout_ms=0):
+        machine = self.machine
+        machine.timeouts.append(timeout_ms)
+        with machine.lock:
+            machine.running[0] += 1
+            machine.most[0] = max(machine.most[0], machine.running[0])
+        time.sleep(machine.delay)
+        with machine.lock:
+            machine.running[0] -= 1
+        if machine.name == "broken":
+            raise library.VBoxError("guest additions not running")
+        status = library.ProcessStatus.terminated_normally
+        if machine.name == "slow":
+            status = library.ProcessStatus.timed_out_killed
+        return FakeProcess(self, 0, status), machine.name.encode("ascii"), b""
+
+
+class FakeMachine(fakes.FakeMachine):
+    lock = threading.Lock()
+
+    def __init__(self, name, delay=0.1, running=None, most=None):
+        fakes.FakeMachine.__init__(self, name)
+        self.delay = delay
+        self.running = running if running is not None else [0]
+        self.most = most if most is not None else [0]
+        self.timeouts = []
+
+    def create_guest_session(self, user, password):
+        return FakeGuestSession(self, user)
+
+
+class TestFanOut(unittest.TestCase):
+    def machines(self, names, delay=0.1):
+        running, most = [0], [0]
+        return [FakeMachine(name, delay, running, most) for name in names]
+
+    def test_runs_in_parallel(self):
+        machines = self.machines(["vm%s" % i for i in range(20)], delay=0.2)
+        t0 = time.time()
+        results = list(fleet.fan_out(machines, "uptime", max_workers=20))
+        self.assertLess(time.time() - t0, 2)
+        self.assertEqual(
+            sorted(r.stdout for r in results),
+            sorted(m.name.encode("ascii") for m in machines),
+        )
+        self.assertTrue(all(r.error is None and r.exit_code == 0 for r in results))
+        self.assertTrue(all(m.unlocked == 1 for m in machines))
+
+    def test_max_workers(self):
+        machines = self.machines(["vm%s" % i for i in range(8)], delay=0.05)
+        list(fleet.fan_out(machines, "uptime", max_workers=3))
+        self.assertEqual(machines[0].most[0], 3)
+
+    def test_errors_and_timeouts_are_reported(self):
+        machines = self.machines(["ok", "broken", "slow"])
+        results = dict(
+            (r.machine.name, r) for r in fleet.fan_out(machines, "uptime", timeout=30)
+        )
+        self.assertIsNone(results["ok"].error)
+        self.assertIsInstance(results["broken"].error, library.VBoxError)
+        self.assertIsInstance(results["slow"].error, fleet.FleetTimeout)
+        timeout_ms = machines[0].timeouts[0]
+        self.assertTrue(0 < timeout_ms <= 30000)
+        self.assertTrue(all(m.unlocked == 1 for m in machines))
+
+    def test_expired_deadline(self):
+        result = fleet.run_on_machine(FakeMachine("vm"), "uptime", timeout=-1)
+        self.assertIsInstance(result.error, fleet.FleetTimeout)
+
+    def test_hung_machine_times_out_on_the_host(self):
+        machines = self.machines(["vm0", "vm1", "vm2"])
+        # A call that ignores its VirtualBox timeout.
+        machines[0].delay = 5
+        t0 = time.time()
+        results = list(fleet.fan_out(machines, "uptime", max_workers=2, timeout=0.5))
+        self.assertLess(time.time() - t0, 2)
+        self.assertEqual(len(results), 3)
+        by_name = dict((r.machine.name, r) for r in results)
+        self.assertIsInstance(by_name["vm0"].error, fleet.FleetTimeout)
+        self.assertIsNone(by_name["vm0"].exit_code)
+        self.assertIsNone(by_name["vm1"].error)
+        self.assertIsNone(by_name["vm2"].error)
@@ -0,0 +1,84 @@
+import threading
+import time
+import unittest
+
+from virtualbox import library
+from virtualbox.library_ext.guest import IGuest
+
+from tests import fakes
+
+
+class FakeErrorInfo(object):
+    text = "The specified user was not able to logon on guest"
+
+
+class FakeStateEvent(object):
+    type = library.VBoxEventType.on_guest_session_state_changed
+
+    def __init__(self, status):
+        self.status = status
+        self.error = FakeErrorInfo()
+
+
+class FakeGuestSession(fakes.FakeGuestSession):
+    def __init__(self):
+        fakes.FakeGuestSession.__init__(self)
+        self.status = library.GuestSessionStatus.starting
+
+    def change_later(self, status, delay=0.05):
+        def change():
+            time.sleep(delay)
+            self.status = status
+            self.event_source.post(FakeStateEvent(status))
+
+        threading.Thread(target=change).start()
+
+
+class TestCreateSessionWait(unittest.TestCase):
+    def wait(self, session, timeout=5):
+        IGuest._wait_for_session_start(session, time.time() + timeout, timeout * 1000)
+
+    def test_returns_when_started(self):
+        session = FakeGuestSession()
+        session.change_later(library.GuestSessionStatus.started)
+        t0 = time.time()
+        self.wait(session)
+        self.assertLess(time.time() - t0, 1)
+        self.assertFalse(session.closed)
+        self.assertEqual(session.event_source.listeners, {})
+
+    def test_failed_session(self):
+        session = FakeGuestSession()
+        session.change_later(library.GuestSessionStatus.error)
+        with self.assertRaises(SystemError) as cm:
+            self.wait(session)
+        self.assertIn("not able to logon", str(cm.exception))
+        self.assertTrue(session.closed)
+
+    def test_timeout(self):
+        session = FakeGuestSession()
+        t0 = time.time()
+        with self.assertRaises(SystemError) as cm:
+            self.wait(session, timeout=0.2)
+        self.assertLess(time.time() - t0, 1)
+        self.assertIn("within 200", str(cm.exception))
+        self.assertTrue(session.closed)
+
+    def test_run_level(self):
+        guest = fakes.FakeGuest()
+
+        def raise_run_level():
+            time.sleep(0.05)
+            guest.additions_run_level = library.AdditionsRunLevelType.userland
+            guest.event_source.fire(
+                library.VBoxEventType.on_guest_additions_status_changed
+            )
+
+        threading.Thread(target=raise_run_level).start()
+        userland = library.AdditionsRunLevelType.userland
+        t0 = time.time()
+        IGuest._wait_for_run_level(guest, userland, time.time() + 5, 5000)
+        self.assertLess(time.time() - t0, 1)
+        guest.additions_run_level = library.AdditionsRunLevelType.system
+        with self.assertRaises(SystemError):
+            IGuest._wait_for_run_level(guest, userland, time.time() + 0.1, 100)
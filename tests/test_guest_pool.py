@@ -0,0 +1,116 @@
+import time
+import unittest
+
+from virtualbox import library
+from virtualbox.guest_pool import GuestSessionPool
+
+from tests import fakes
+
+
+class FakeMachine(fakes.FakeMachine):
+    def __init__(self, id_p):
+        fakes.FakeMachine.__init__(self, id_p)
+        self.logins = 0
+        self.created = 0
+
+    def create_session(self, lock_type=library.LockType.shared):
+        self.created += 1
+        return fakes.FakeMachine.create_session(self, lock_type)
+
+    def create_guest_session(self, user, password):
+        if password != "password":
+            raise library.VBoxError("login failed")
+        self.logins += 1
+        return fakes.FakeGuestSession(self, user)
+
+    def restart(self):
+        """Drop the shared lock and end the guest sessions, like a reboot"""
+        with self.mutex:
+            del self.sessions[:]
+
+
+class TestGuestSessionPool(unittest.TestCase):
+    def setUp(self):
+        self.pool = GuestSessionPool(max_idle=2)
+        self.machine = FakeMachine("vm1")
+
+    def tearDown(self):
+        self.pool.close()
+
+    def test_reuses_sessions_per_key(self):
+        with self.pool.session(self.machine, "mick", "password") as first:
+            pass
+        with self.pool.session(self.machine, "mick", "password") as second:
+            self.assertIs(first, second)
+        with self.pool.session(self.machine, "root", "password") as third:
+            self.assertIsNot(first, third)
+        self.assertEqual(self.machine.logins, 2)
+        self.assertEqual(self.machine.locked, 1)
+        self.assertEqual(len(self.pool), 2)
+
+    def test_broken_session_is_replaced(self):
+        with self.pool.session(self.machine, "mick", "password") as first:
+            pass
+        first.status = library.GuestSessionStatus.error
+        with self.pool.session(self.machine, "mick", "password") as second:
+            self.assertIsNot(first, second)
+        self.assertTrue(first.closed)
+        self.assertEqual(len(self.pool), 1)
+
+    def test_idle_eviction(self):
+        self.pool.idle_timeout = 0.05
+        with self.pool.session(self.machine, "mick", "password") as first:
+            pass
+        time.sleep(0.1)
+        self.pool.evict_idle()
+        self.assertTrue(first.closed)
+        self.assertEqual(len(self.pool), 0)
+        self.assertEqual(self.machine.locked, 0)
+
+    def test_idle_sessions_are_reaped(self):
+        self.pool.idle_timeout = 0.05
+        with self.pool.session(self.machine, "mick", "password") as first:
+            pass
+        deadline = time.time() + 5
+        while not first.closed and time.time() < deadline:
+            time.sleep(0.01)
+        self.assertTrue(first.closed)
+        self.assertEqual(len(self.pool), 0)
+        self.assertEqual(self.machine.locked, 0)
+
+    def test_stale_machine_session_is_replaced(self):
+        with self.pool.session(self.machine, "mick", "password") as first:
+            pass
+        self.machine.restart()
+        first.status = library.GuestSessionStatus.terminated
+        with self.pool.session(self.machine, "mick", "password") as second:
+            self.assertIsNot(first, second)
+        self.assertEqual(self.machine.created, 2)
+        self.assertEqual(self.machine.locked, 1)
+        self.pool.close()
+        self.assertEqual(self.machine.locked, 0)
+
+    def test_max_idle(self):
+        sessions = [
+            self.pool.acquire(self.machine, "mick", "password") for _ in range(3)
+        ]
+        for session in sessions:
+            self.pool.release(session)
+        self.assertEqual([s.closed for s in sessions], [False, False, True])
+
+    def test_failed_login_releases_machine(self):
+        with self.assertRaises(library.VBoxError):
+            self.pool.acquire(self.machine, "mick", "wrong")
+        self.assertEqual(self.machine.locked, 0)
+
+    def test_close(self):
+        in_use = self.pool.acquire(self.machine, "mick", "password")
+        with self.pool.session(self.machine, "root", "password") as idle:
+            pass
+        self.pool.close()
+        self.assertTrue(idle.closed)
+        self.assertFalse(in_use.closed)
+        self.pool.release(in_use)
+        self.assertTrue(in_use.closed)
+        self.assertEqual(self.machine.locked, 0)
+        self.assertRaises(RuntimeError, self.pool.acquire, self.machine, "mick", "x")
@@ -0,0 +1,133 @@
+import io
+import itertools
+import threading
+import time
+import unittest
+
+from virtualbox import library
+from virtualbox.library_ext.guest_session import ExecuteStream
+
+from tests.test_event_dispatch import FakeEvent, FakeEventSource
+
+FLAGS = [
+    library.ProcessCreateFlag.wait_for_std_err,
+    library.ProcessCreateFlag.wait_for_std_out,
+]
+
+
+class FakeProcess(object):
+    """Process that exits once all of its output has been queued"""
+
+    pids = itertools.count(1000)
+
+    def __init__(self, stdout, stderr, running_reads=2):
+        self.pid = next(self.pids)
+        self.output = {1: list(stdout), 2: list(stderr)}
+        self.running_reads = running_reads
+        self.reads = []
+        self.event_source = FakeEventSource()
+        self.stdin = []
+        self.eof = False
+        self.accept = 7
+
+    def write_array(self, handle, flags, data, timeout_ms):
+        if flags == [library.ProcessInputFlag.end_of_file]:
+            self.eof = True
+            self.running_reads = 0
+            return 0
+        self.stdin.append(data[: self.accept])
+        return len(self.stdin[-1])
+
+    @property
+    def status(self):
+        if self.running_reads > 0:
+            self.running_reads -= 1
+            return library.ProcessStatus.started
+        return library.ProcessStatus.terminated_normally
+
+    def read(self, handle, to_read, timeout_ms):
+        self.reads.append(to_read)
+        if self.output[handle]:
+            return self.output[handle].pop(0)[:to_read]
+        return b""
+
+
+class LateProcess(FakeProcess):
+    """Process whose output arrives after a pause, announced by an event"""
+
+    def __init__(self, delay):
+        FakeProcess.__init__(self, [], [], running_reads=1000)
+        self.exited = False
+
+        def produce():
+            time.sleep(delay)
+            self.output[1].append(b"late")
+            self.exited = True
+            event = FakeEvent(library.VBoxEventType.on_guest_process_output)
+            event.pid = self.pid
+            self.event_source.post(event)
+
+        threading.Thread(target=produce).start()
+
+    @property
+    def status(self):
+        if self.exited:
+            return library.ProcessStatus.terminated_normally
+        return library.ProcessStatus.started
+
+
+class FakeSocket(object):
+    def __init__(self):
+        self.sent = []
+
+    def sendall(self, data):
+        self.sent.append(data)
+
+
+class TestExecuteStream(unittest.TestCase):
+    def test_yields_chunks_in_order(self):
+        process = FakeProcess([b"a", b"b", b"c"], [b"x"])
+        stream = ExecuteStream(process, FLAGS, 4096)
+        self.assertEqual(
+            list(stream),
+            [("stdout", b"a"), ("stderr", b"x"), ("stdout", b"b"), ("stdout", b"c")],
+        )
+        self.assertEqual(set(process.reads), set([4096]))
+
+    def test_only_requested_streams(self):
+        process = FakeProcess([b"a"], [b"x"])
+        flags = [library.ProcessCreateFlag.wait_for_std_out]
+        self.assertEqual(list(ExecuteStream(process, flags, 10)), [("stdout", b"a")])
+
+    def test_pipe_to_file_and_socket(self):
+        process = FakeProcess([b"out1", b"out2"], [b"err"])
+        out, err = io.BytesIO(), FakeSocket()
+        result = ExecuteStream(process, FLAGS, 10).pipe(stdout=out, stderr=err)
+        self.assertIs(result, process)
+        self.assertEqual(out.getvalue(), b"out1out2")
+        self.assertEqual(err.sent, [b"err"])
+
+    def test_event_wakes_quiet_stream(self):
+        process = LateProcess(0.3)
+        stream = ExecuteStream(process, FLAGS, 10)
+        stream.poll_interval = 30
+        t0 = time.time()
+        self.assertEqual(list(stream), [("stdout", b"late")])
+        self.assertLess(time.time() - t0, 5)
+        self.assertEqual(process.event_source.listeners, {})
+
+    def test_stdin_sources(self):
+        data = b"0123456789" * 5
+        sources = [
+            data,
+            data.decode("ascii"),
+            io.BytesIO(data),
+            iter([data[:12], data[12:]]),
+        ]
+        for stdin in sources:
+            process = FakeProcess([b"a"], [], running_reads=1000)
+            stream = ExecuteStream(process, FLAGS, 10, stdin)
+            self.assertEqual(list(stream), [("stdout", b"a")])
+            self.assertEqual(b"".join(process.stdin), data)
+            self.assertTrue(max(len(chunk) for chunk in process.stdin) <= 7)
+            self.assertTrue(process.eof)
@@ -0,0 +1,54 @@
+import unittest
+
+from virtualbox import library_base
+
+
+class FakeCOMObject(object):
+    def __init__(self):
+        self.calls = []
+        self.name = "fake"
+
+    def getState(self):
+        self.calls.append("getState")
+        return 5
+
+    def powerDown(self, *args):
+        self.calls.append("powerDown")
+        return args
+
+
+class FakeInterface(library_base.Interface):
+    pass
+
+
+class TestInterfaceAttrCache(unittest.TestCase):
+    def setUp(self):
+        library_base.Interface._attr_cache.clear()
+
+    def test_get_attr_value(self):
+        i = FakeInterface(FakeCOMObject())
+        self.assertEqual(i._get_attr("name"), "fake")
+        key = (FakeCOMObject, FakeInterface, "name", "get")
+        self.assertEqual(library_base.Interface._attr_cache[key], ("name", False))
+
+    def test_get_attr_prefixed_method(self):
+        com = FakeCOMObject()
+        i = FakeInterface(com)
+        self.assertEqual(i._get_attr("state"), 5)
+        self.assertEqual(i._get_attr("state"), 5)
+        key = (FakeCOMObject, FakeInterface, "state", "get")
+        self.assertEqual(library_base.Interface._attr_cache[key], ("getState", True))
+        self.assertEqual(com.calls, ["getState", "getState"])
+
+    def test_call_shared_between_instances(self):
+        FakeInterface(FakeCOMObject())._call("powerDown", in_p=[1])
+        key = (FakeCOMObject, FakeInterface, "powerDown", None)
+        self.assertIn(key, library_base.Interface._attr_cache)
+        self.assertEqual(FakeInterface(FakeCOMObject())._call("powerDown"), ())
+
+    def test_stale_entry_is_reprobed(self):
+        key = (FakeCOMObject, FakeInterface, "state", "get")
+        library_base.Interface._attr_cache[key] = ("getMissing", True)
+        i = FakeInterface(FakeCOMObject())
+        self.assertEqual(i._get_attr("state"), 5)
+        self.assertEqual(library_base.Interface._attr_cache[key], ("getState", True))
@@ -0,0 +1,119 @@
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+
+from virtualbox import library
+from virtualbox import library_base
+
+
+class FakeCOMObject(object):
+    state = 6
+
+
+class TestLazyLibrary(unittest.TestCase):
+    def test_import(self):
+        # Before Python 3.7 every module is loaded while virtualbox.library
+        # is still importing.
+        code = (
+            "import virtualbox;"
+            "from virtualbox import library;"
+            "print(library.IMachine.__name__)"
+        )
+        out = subprocess.check_output([sys.executable, "-c", code])
+        self.assertEqual(out.strip(), b"IMachine")
+
+    @unittest.skipIf(sys.version_info < (3, 7), "needs module __getattr__")
+    def test_import_loads_subset(self):
+        code = (
+            "import sys, virtualbox;"
+            "print(len([m for m in sys.modules "
+            "if m.startswith('virtualbox._library.')]))"
+        )
+        out = subprocess.check_output([sys.executable, "-c", code])
+        self.assertLess(int(out), len(library._index) // 2)
+
+    @unittest.skipIf(sys.version_info < (3, 7), "needs module __getattr__")
+    def test_event_interface_lookup_is_lazy(self):
+        code = (
+            "import sys, virtualbox;"
+            "from virtualbox import events, library;"
+            "before = set(sys.modules);"
+            "events.type_to_interface("
+            "library.VBoxEventType.on_machine_state_changed);"
+            "print(len([m for m in set(sys.modules) - before "
+            "if m.startswith('virtualbox._library.')]))"
+        )
+        out = subprocess.check_output([sys.executable, "-c", code])
+        self.assertLess(int(out), 10)
+
+    def test_event_interfaces_table(self):
+        for value, name in library._event_interfaces.items():
+            self.assertEqual(int(getattr(library, name).id), value)
+
+    def test_dir_lists_all_names(self):
+        names = dir(library)
+        for name in ("IMachine", "MachineState", "VBoxEventType", "OleErrorFail"):
+            self.assertIn(name, names)
+
+    def test_unknown_name(self):
+        self.assertRaises(AttributeError, getattr, library, "INoSuchInterface")
+
+    def test_generated_types_resolve_through_library(self):
+        from virtualbox._library.imachine import IMachine
+
+        machine = IMachine(FakeCOMObject())
+        self.assertIs(machine.state, library.MachineState.paused)
+
+
+class TestLazyDoc(unittest.TestCase):
+    def setUp(self):
+        self.docs_path = library_base.DOCS_PATH
+        library_base.DOCS_PATH = tempfile.mkdtemp()
+        docs = {
+            "__doc__": "The lean interface.",
+            "state": "Get the state.",
+            "power_down": "Power down the machine.",
+            "_enums": {"1": "Powered off."},
+        }
+        with open(os.path.join(library_base.DOCS_PATH, "ILean.json"), "w") as f:
+            json.dump(docs, f)
+
+    def tearDown(self):
+        shutil.rmtree(library_base.DOCS_PATH)
+        library_base.DOCS_PATH = self.docs_path
+
+    def test_interface_docs_loaded_on_demand(self):
+        class ILean(library_base.Interface):
+            __doc__ = library_base.LazyDoc("ILean")
+
+            @property
+            def state(self):
+                return 1
+
+            def power_down(self):
+                return None
+
+        self.assertIsNone(ILean.power_down.__doc__)
+        self.assertEqual(ILean.__doc__, "The lean interface.")
+        self.assertEqual(ILean.power_down.__doc__, "Power down the machine.")
+        self.assertEqual(ILean.state.__doc__, "Get the state.")
+
+    def test_enum_docs_loaded_on_demand(self):
+        class LeanState(library_base.Enum):
+            __doc__ = library_base.LazyDoc("ILean")
+            _enums = [("Null", 0), ("PoweredOff", 1)]
+
+        self.assertEqual(LeanState.__doc__, "The lean interface.")
+        self.assertEqual(LeanState.powered_off.__doc__, "Powered off.")
+        self.assertIsNone(LeanState.null.__doc__)
+        self.assertEqual(str(LeanState(1)), "PoweredOff")
+
+    def test_missing_docs(self):
+        class IMissing(library_base.Interface):
+            __doc__ = library_base.LazyDoc("IMissing")
+
+        self.assertIsNone(IMissing.__doc__)
@@ -0,0 +1,512 @@
+import collections
+import json
+import threading
+import time
+import unittest
+
+from virtualbox import pool
+from virtualbox import readiness
+from virtualbox.library import MachineState
+from virtualbox.library import SessionState
+from virtualbox.library import VBoxError
+
+from tests import fakes
+
+
+class FakeEvent(object):
+    def __init__(self, **kwargs):
+        self.__dict__.update(kwargs)
+
+
+class FakeMachine(fakes.FakeMachine):
+    """Machine that can be locked, launched, cloned and removed"""
+
+    def __init__(self, id_p, session_state=SessionState.unlocked, name=None):
+        fakes.FakeMachine.__init__(self, id_p, name)
+        self.vbox = None
+        self.extra_data = {}
+        self.running = session_state == SessionState.locked
+        self.current_snapshot = None
+
+    @property
+    def session_state(self):
+        if self.sessions or self.running:
+            return SessionState.locked
+        return SessionState.unlocked
+
+    @property
+    def state(self):
+        return MachineState.running if self.running else MachineState.powered_off
+
+    def _fire_session_state(self):
+        self.vbox.fire(
+            "session_state", FakeEvent(machine_id=self.id_p, state=self.session_state)
+        )
+
+    def lock_machine(self, session, lock_type):
+        fakes.FakeMachine.lock_machine(self, session, lock_type)
+        self._fire_session_state()
+
+    def unlock(self, session):
+        fakes.FakeMachine.unlock(self, session)
+        self._fire_session_state()
+
+    def launch_vm_process(self, session=None, type_p="gui", environment=""):
+        if self.vbox.fail_launch:
+            self.vbox.fail_launch -= 1
+            raise VBoxError("failed to launch %s" % self.name)
+        with self.mutex:
+            if self.sessions or self.running:
+                raise VBoxError("machine is already locked")
+            self.running = True
+        self.vbox.record("launch", self)
+        self._fire_session_state()
+        return fakes.FakeProgress()
+
+    def power_off(self):
+        self.running = False
+        self._fire_session_state()
+
+    def take_snapshot(self, name, description, pause):
+        self.current_snapshot = name
+        return fakes.FakeProgress(), name
+
+    def restore_snapshot(self):
+        return fakes.FakeProgress()
+
+    def clone(self, name=None, uuid=None):
+        self.vbox.record("clone", self)
+        time.sleep(self.vbox.clone_delay)
+        clone = FakeMachine(uuid, name=name)
+        self.vbox.add(clone)
+        return clone
+
+    def remove(self):
+        self.vbox.record("remove", self)
+        if self.vbox.fail_remove:
+            raise VBoxError("failed to remove %s" % self.name)
+        self.vbox.remove(self)
+
+    def get_extra_data(self, key):
+        return self.extra_data.get(key, "")
+
+    def set_extra_data(self, key, value):
+        self.extra_data[key] = value
+        self.vbox.fire(
+            "extra_data", FakeEvent(machine_id=self.id_p, key=key, value=value)
+        )
+
+
+class FakeVirtualBox(object):
+    def __init__(self, machines):
+        self._machines = collections.OrderedDict()
+        self.callbacks = collections.defaultdict(list)
+        self.log = []
+        self.clone_delay = 0
+        self.fail_remove = False
+        self.fail_launch = 0
+        self.scans = 0
+        self.lock = threading.Lock()
+        for machine in machines:
+            self.add(machine)
+
+    @property
+    def machines(self):
+        self.scans += 1
+        return list(self._machines.values())
+
+    def add(self, machine):
+        with self.lock:
+            for other in self._machines.values():
+                if other.name == machine.name:
+                    raise VBoxError("settings file of %s already exists" % machine.name)
+            machine.vbox = self
+            self._machines[machine.id_p] = machine
+
+    def remove(self, machine):
+        del self._machines[machine.id_p]
+        self.fire("registered", FakeEvent(machine_id=machine.id_p, registered=False))
+
+    def find_machine(self, name_or_id):
+        for machine in self._machines.values():
+            if name_or_id in (machine.id_p, machine.name):
+                return machine
+        raise VBoxError("machine %s not found" % name_or_id)
+
+    def record(self, action, machine):
+        """Log action on machine and whether the root machine was locked"""
+        root = next(iter(self._machines.values()))
+        self.log.append((action, machine.id_p, bool(root.sessions), machine.running))
+
+    def fire(self, name, event):
+        for callback in list(self.callbacks[name]):
+            callback(event)
+
+    def _register(self, name, callback):
+        self.callbacks[name].append(callback)
+        return -sum(len(c) for c in self.callbacks.values())
+
+    def register_on_extra_data_changed(self, callback):
+        return self._register("extra_data", callback)
+
+    def register_on_machine_registered(self, callback):
+        return self._register("registered", callback)
+
+    def register_on_session_state_changed(self, callback):
+        return self._register("session_state", callback)
+
+
+class TestCloneRegistry(unittest.TestCase):
+    def setUp(self):
+        self.root = FakeMachine("root")
+        self.vbox = FakeVirtualBox(
+            [self.root, FakeMachine("a"), FakeMachine("b", SessionState.locked)]
+        )
+        self.registry = pool._CloneRegistry(self.vbox, self.root)
+        self.registry.write(self.root, {"a": "ready", "b": "ready", "c": "building"})
+
+    def tearDown(self):
+        self.registry.close()
+
+    def test_write_persists_and_tracks_free(self):
+        stored = json.loads(self.root.extra_data[self.registry.key])
+        self.assertEqual(stored, {"a": "ready", "b": "ready", "c": "building"})
+        self.assertEqual(len(self.registry), 3)
+        self.assertEqual(list(self.registry.free), ["a"])
+
+    def test_pop_free(self):
+        self.assertEqual(self.registry.pop_free(), "a")
+        self.assertIsNone(self.registry.pop_free())
+
+    def test_session_state_events_do_not_free_clones(self):
+        self.vbox.fire(
+            "session_state", FakeEvent(machine_id="b", state=SessionState.unlocked)
+        )
+        self.assertEqual(list(self.registry.free), ["a"])
+
+    def test_free_only_once_released(self):
+        clone = self.vbox.find_machine("b")
+        self.registry.set_state(clone, "free")
+        self.assertEqual(list(self.registry.free), ["a", "b"])
+        self.registry.set_state(clone, "busy")
+        self.assertEqual(list(self.registry.free), ["a"])
+        self.assertEqual(clone.extra_data[self.registry.state_key], "busy")
+
+    def test_released_by_another_process(self):
+        on_extra_data = self.vbox.callbacks["extra_data"][-1]
+        on_extra_data(
+            FakeEvent(machine_id="b", key=self.registry.state_key, value="free")
+        )
+        on_extra_data(
+            FakeEvent(machine_id="c", key=self.registry.state_key, value="free")
+        )
+        self.assertEqual(list(self.registry.free), ["a", "b"])
+
+    def test_unregistered_clone_is_dropped(self):
+        on_registered = self.vbox.callbacks["registered"][-1]
+        on_registered(FakeEvent(machine_id="a", registered=False))
+        self.assertEqual(len(self.registry), 2)
+        self.assertIsNone(self.registry.pop_free())
+
+    def test_index_changed_by_another_process(self):
+        on_extra_data = self.vbox.callbacks["extra_data"][-1]
+        on_extra_data(
+            FakeEvent(
+                machine_id="root",
+                key=self.registry.key,
+                value=json.dumps({"b": "ready"}),
+            )
+        )
+        self.assertEqual(self.registry.clones, {"b": "ready"})
+        self.assertEqual(list(self.registry.free), [])
+
+
+class TestRootLock(unittest.TestCase):
+    def setUp(self):
+        self.session = pool.Session
+        pool.Session = fakes.FakeSession
+        self.root = FakeMachine("root")
+        self.vbox = FakeVirtualBox([self.root])
+        self.vbox.find_machine = lambda name: self.root
+        self.lock = pool._RootLock(self.vbox, "root")
+
+    def tearDown(self):
+        self.lock.close()
+        pool.Session = self.session
+
+    def test_timeout_ms(self):
+        session = self.lock.acquire()
+        t0 = time.time()
+        self.assertRaises(ValueError, self.lock.acquire, 50)
+        self.assertLess(time.time() - t0, 1)
+        session.unlock_machine()
+        self.lock.acquire(50).unlock_machine()
+
+    def test_waiters_served_in_order_on_unlock(self):
+        session = self.lock.acquire()
+        order = []
+
+        def waiter(name):
+            s = self.lock.acquire(5000)
+            order.append(name)
+            s.unlock_machine()
+
+        threads = []
+        for name in range(5):
+            t = threading.Thread(target=waiter, args=(name,))
+            t.start()
+            threads.append(t)
+            while len(self.lock.queue) != name + 1:
+                time.sleep(0.001)
+        t0 = time.time()
+        session.unlock_machine()
+        for t in threads:
+            t.join()
+        self.assertEqual(order, list(range(5)))
+        self.assertLess(time.time() - t0, 1)
+
+
+class TrackingProbe(readiness.Probe):
+    """Probe that takes delay seconds and records how many run at once"""
+
+    name = "tracking"
+
+    def __init__(self):
+        self.delay = 0
+        self.error = None
+        self.lock = threading.Lock()
+        self.active = 0
+        self.peak = 0
+
+    def wait(self, session, deadline):
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            time.sleep(self.delay)
+            if self.error is not None:
+                raise self.error
+        finally:
+            with self.lock:
+                self.active -= 1
+
+
+class TestMachinePool(unittest.TestCase):
+    def setUp(self):
+        self.root = FakeMachine("root", name="win7")
+        self.vbox = FakeVirtualBox([self.root])
+        self.saved = pool.VirtualBox, pool.Session
+        pool.VirtualBox = lambda: self.vbox
+        pool.Session = fakes.FakeSession
+        self.probe = TrackingProbe()
+        self.pools = []
+
+    def tearDown(self):
+        for machine_pool in self.pools:
+            machine_pool.close()
+        pool.VirtualBox, pool.Session = self.saved
+
+    def make_pool(self, **kwargs):
+        kwargs.setdefault("readiness", readiness.Readiness([self.probe]))
+        machine_pool = pool.MachinePool("win7", **kwargs)
+        self.pools.append(machine_pool)
+        return machine_pool
+
+    def wait_until(self, predicate, timeout=5):
+        deadline = time.time() + timeout
+        while not predicate():
+            self.assertLess(time.time(), deadline, "timed out")
+            time.sleep(0.01)
+
+    def actions(self, action):
+        return [entry for entry in self.vbox.log if entry[0] == action]
+
+    def test_construction(self):
+        old = FakeMachine("old", name="win7 Pool")
+        old.current_snapshot = "initialised"
+        self.vbox.add(old)
+        machine_pool = self.make_pool()
+        self.assertEqual(self.root.current_snapshot, "initialised")
+        self.assertEqual(machine_pool._registry.clones, {"old": "ready"})
+        self.assertEqual(list(machine_pool._registry.free), ["old"])
+        self.assertEqual(self.root.sessions, [])
+
+    def test_existing_clones_scanned_once(self):
+        self.make_pool().close()
+        self.make_pool().close()
+        self.assertEqual(self.vbox.scans, 1)
+        self.assertEqual(self.root.extra_data[pool._CloneRegistry.key], "{}")
+
+    def test_invalid_arguments(self):
+        self.assertRaises(ValueError, pool.MachinePool, "win7", min_ready=1)
+        self.assertRaises(
+            ValueError,
+            pool.MachinePool,
+            "win7",
+            min_ready=2,
+            max_size=1,
+            username="Mick",
+            password="password",
+        )
+
+    def test_acquire_builds_and_reuses_released_clone(self):
+        machine_pool = self.make_pool(max_size=1)
+        session = machine_pool.acquire("Mick", "password")
+        clone = session.machine
+        self.assertTrue(clone.running)
+        self.assertEqual(machine_pool.stats()["busy"], 1)
+        # Only release makes the clone free again.
+        unlocked = FakeEvent(machine_id=clone.id_p, state=SessionState.unlocked)
+        self.vbox.fire("session_state", unlocked)
+        self.assertEqual(machine_pool.stats()["ready"], 0)
+        machine_pool.release(session)
+        self.assertFalse(clone.running)
+        self.assertEqual(machine_pool.stats()["ready"], 1)
+
+        session = machine_pool.acquire("Mick", "password")
+        self.assertIs(session.machine, clone)
+        self.assertEqual(len(self.actions("clone")), 1)
+        machine_pool.release(session)
+
+    def test_acquire_waits_for_release_at_max_size(self):
+        machine_pool = self.make_pool(max_size=1)
+        first = machine_pool.acquire("Mick", "password")
+        acquired = []
+        thread = threading.Thread(
+            target=lambda: acquired.append(machine_pool.acquire("Mick", "password"))
+        )
+        thread.start()
+        time.sleep(0.05)
+        self.assertEqual(acquired, [])
+        machine_pool.release(first)
+        thread.join(5)
+        self.assertEqual([s.machine for s in acquired], [first.machine])
+        self.assertEqual(len(self.actions("clone")), 1)
+        machine_pool.release(acquired[0])
+
+    def test_acquire_woken_by_release_in_another_process(self):
+        machine_pool = self.make_pool(max_size=1)
+        first = machine_pool.acquire("Mick", "password")
+        clone = first.machine
+        acquired = []
+        thread = threading.Thread(
+            target=lambda: acquired.append(machine_pool.acquire("Mick", "password"))
+        )
+        thread.start()
+        time.sleep(0.05)
+        # Release the clone the way another process's pool would.
+        clone.power_off()
+        first.unlock_machine()
+        t0 = time.time()
+        clone.set_extra_data(pool._CloneRegistry.state_key, "free")
+        thread.join(5)
+        self.assertLess(time.time() - t0, 0.5)
+        self.assertEqual([s.machine for s in acquired], [clone])
+        machine_pool.release(acquired[0])
+
+    def test_acquire_timeout(self):
+        machine_pool = self.make_pool(max_size=1)
+        first = machine_pool.acquire("Mick", "password")
+        t0 = time.time()
+        self.assertRaises(ValueError, machine_pool.acquire, timeout_ms=100)
+        self.assertLess(time.time() - t0, 1)
+        self.assertEqual(machine_pool.stats()["waiting"], 0)
+        machine_pool.release(first)
+
+    def test_provisioner_keeps_min_ready_within_max_size(self):
+        machine_pool = self.make_pool(
+            min_ready=2, max_size=3, username="Mick", password="password"
+        )
+        self.wait_until(lambda: machine_pool.stats()["ready"] == 2)
+        first = machine_pool.acquire()
+        self.wait_until(lambda: machine_pool.stats()["ready"] == 2)
+        self.assertEqual(machine_pool.stats()["size"], 3)
+        second = machine_pool.acquire()
+        time.sleep(0.05)
+        stats = machine_pool.stats()
+        self.assertEqual((stats["size"], stats["ready"], stats["busy"]), (3, 1, 2))
+        machine_pool.release(first)
+        machine_pool.release(second)
+
+    def test_provisioner_builds_in_parallel_up_to_workers(self):
+        self.probe.delay = 0.05
+        machine_pool = self.make_pool(
+            min_ready=6, workers=3, username="Mick", password="password"
+        )
+        self.wait_until(lambda: machine_pool.stats()["ready"] == 6)
+        self.assertEqual(self.probe.peak, 3)
+
+    def test_inline_builds_bounded_by_workers(self):
+        self.probe.delay = 0.05
+        machine_pool = self.make_pool(workers=2)
+        sessions = []
+
+        def acquire():
+            sessions.append(machine_pool.acquire("Mick", "password"))
+
+        threads = [threading.Thread(target=acquire) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+        self.assertEqual(len(sessions), 4)
+        self.assertEqual(self.probe.peak, 2)
+        for session in sessions:
+            machine_pool.release(session)
+
+    def test_clone_and_launch_outside_root_lock(self):
+        self.vbox.clone_delay = 0.01
+        machine_pool = self.make_pool()
+        machine_pool.release(machine_pool.acquire("Mick", "password"))
+        machine_pool.release(machine_pool.acquire("Mick", "password"))
+        self.assertEqual(len(self.actions("clone")), 1)
+        self.assertEqual(len(self.actions("launch")), 3)
+        for action, _, root_locked, _ in self.vbox.log:
+            self.assertFalse(root_locked, action)
+
+    def test_failed_build_powers_off_and_removes_clone(self):
+        self.probe.error = readiness.ReadinessTimeout("not ready")
+        machine_pool = self.make_pool()
+        self.assertRaises(
+            readiness.ReadinessTimeout, machine_pool.acquire, "Mick", "password"
+        )
+        ((_, _, _, running),) = self.actions("remove")
+        self.assertFalse(running)
+        self.assertEqual(machine_pool._registry.read(self.root), {})
+        self.assertEqual(self.vbox.machines, [self.root])
+
+    def test_clone_that_can_not_be_removed_stays_indexed(self):
+        self.probe.error = readiness.ReadinessTimeout("not ready")
+        self.vbox.fail_remove = True
+        machine_pool = self.make_pool()
+        self.assertRaises(
+            readiness.ReadinessTimeout, machine_pool.acquire, "Mick", "password"
+        )
+        ((_, clone_id, _, _),) = self.actions("remove")
+        self.assertEqual(machine_pool._registry.read(self.root), {clone_id: "broken"})
+        stats = machine_pool.stats()
+        self.assertEqual((stats["broken"], stats["building"]), (1, 0))
+
+    def test_clone_that_fails_to_launch_is_replaced(self):
+        machine_pool = self.make_pool()
+        session = machine_pool.acquire("Mick", "password")
+        broken = session.machine
+        machine_pool.release(session)
+        self.vbox.fail_launch = 1
+        session = machine_pool.acquire("Mick", "password")
+        self.assertIsNot(session.machine, broken)
+        self.assertEqual([a[1] for a in self.actions("remove")], [broken.id_p])
+        self.assertEqual(
+            machine_pool._registry.read(self.root), {session.machine.id_p: "ready"}
+        )
+        machine_pool.release(session)
+
+    def test_parallel_builds_get_their_own_names(self):
+        self.probe.delay = 0.02
+        machine_pool = self.make_pool(
+            min_ready=4, workers=4, username="Mick", password="password"
+        )
+        self.wait_until(lambda: machine_pool.stats()["ready"] == 4)
+        names = [m.name for m in self.vbox.machines if m is not self.root]
+        self.assertEqual(len(set(names)), 4)
+        self.assertTrue(all(name.startswith("win7 Pool ") for name in names))
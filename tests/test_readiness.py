@@ -0,0 +1,97 @@
+import threading
+import time
+import unittest
+
+from virtualbox import readiness
+from virtualbox.library import AdditionsRunLevelType
+from virtualbox.library import DeviceActivity
+from virtualbox.library import VBoxEventType
+
+from tests import fakes
+from tests.test_event_dispatch import FakeEventSource
+
+
+class FakeStatusEvent(object):
+    type = VBoxEventType.on_guest_additions_status_changed
+
+    def __init__(self, run_level):
+        self.runLevel = run_level
+
+
+class SleepProbe(readiness.Probe):
+    def __init__(self, name, seconds):
+        self.name = name
+        self.seconds = seconds
+
+    def wait(self, session, deadline):
+        time.sleep(self.seconds)
+        if deadline is not None and time.time() > deadline:
+            raise readiness.ReadinessTimeout(self.name)
+
+
+class TestWaitForEvent(unittest.TestCase):
+    def setUp(self):
+        self.source = FakeEventSource()
+        self.event_type = VBoxEventType.on_guest_property_changed
+
+    def test_already_ready(self):
+        ready = readiness.wait_for_event(
+            self.source, self.event_type, lambda e: False, lambda: True, None
+        )
+        self.assertTrue(ready)
+        self.assertEqual(self.source.listeners, {})
+
+    def test_event_observed(self):
+        timer = threading.Timer(0.05, self.source.fire, [self.event_type])
+        timer.start()
+        t0 = time.time()
+        ready = readiness.wait_for_event(
+            self.source, self.event_type, lambda e: True, lambda: False, t0 + 5
+        )
+        self.assertTrue(ready)
+        self.assertLess(time.time() - t0, 1)
+
+    def test_timeout(self):
+        ready = readiness.wait_for_event(
+            self.source,
+            self.event_type,
+            lambda e: True,
+            lambda: False,
+            time.time() + 0.05,
+        )
+        self.assertFalse(ready)
+
+
+class TestReadiness(unittest.TestCase):
+    def test_timings_per_phase(self):
+        r = readiness.Readiness([SleepProbe("a", 0.01), SleepProbe("b", 0.02)])
+        timings = r.wait(fakes.FakeSession())
+        self.assertEqual(list(timings), ["a", "b"])
+        self.assertGreaterEqual(timings["b"], 0.02)
+
+    def test_timeout_records_failed_phase(self):
+        r = readiness.Readiness([SleepProbe("slow", 0.05)], timeout=0.01)
+        self.assertRaises(readiness.ReadinessTimeout, r.wait, fakes.FakeSession())
+        self.assertEqual(list(r.timings), ["slow"])
+
+    def test_run_level_waits_on_guest_events(self):
+        console = fakes.FakeConsole()
+        guest = console.guest
+
+        def raise_run_level():
+            guest.additions_run_level = AdditionsRunLevelType.userland
+            guest.event_source.post(FakeStatusEvent(AdditionsRunLevelType.userland))
+
+        timer = threading.Timer(0.05, raise_run_level)
+        timer.start()
+        t0 = time.time()
+        readiness.RunLevel().wait(fakes.FakeSession(console), t0 + 5)
+        self.assertLess(time.time() - t0, 1)
+        self.assertEqual(guest.event_source.processed, 1)
+
+    def test_disk_idle_returns_once_settled(self):
+        busy, idle = DeviceActivity.reading, DeviceActivity.idle
+        console = fakes.FakeConsole(activity=[busy, idle, idle, busy, idle, idle, idle])
+        probe = readiness.DiskIdle(samples=3, interval=0)
+        probe.wait(fakes.FakeSession(console), None)
+        self.assertEqual(console.samples, 5)
@@ -0,0 +1,58 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from virtualbox import telemetry
+
+
+class TestTelemetry(unittest.TestCase):
+    def test_histogram_buckets_are_cumulative(self):
+        histogram = telemetry.Histogram(buckets=(1, 5))
+        for value in (0.5, 2, 10):
+            histogram.observe(value)
+        snapshot = histogram.snapshot()
+        self.assertEqual(snapshot["count"], 3)
+        self.assertEqual(snapshot["sum"], 12.5)
+        self.assertEqual(snapshot["buckets"], [(1, 1), (5, 2), (float("inf"), 3)])
+
+    def test_timer_records_on_error(self):
+        t = telemetry.Telemetry()
+        with self.assertRaises(ValueError):
+            with t.timer("launch"):
+                raise ValueError()
+        self.assertEqual(t.snapshot()["launch"]["count"], 1)
+
+    def test_prometheus_text(self):
+        t = telemetry.Telemetry(buckets=(1,))
+        t.observe("restore", 0.25)
+        text = telemetry.prometheus_text(
+            "pyvbox_pool",
+            [("pool", 'win "7"')],
+            t.snapshot(),
+            [("clones", "Clones by state.", [([("state", "ready")], 2)])],
+        )
+        lines = text.splitlines()
+        self.assertIn("# TYPE pyvbox_pool_phase_seconds histogram", lines)
+        self.assertIn(
+            'pyvbox_pool_phase_seconds_bucket{pool="win \\"7\\"",phase="restore",'
+            'le="+Inf"} 1',
+            lines,
+        )
+        self.assertIn(
+            'pyvbox_pool_phase_seconds_sum{pool="win \\"7\\"",phase="restore"} 0.25',
+            lines,
+        )
+        self.assertIn('pyvbox_pool_clones{pool="win \\"7\\"",state="ready"} 2', lines)
+
+    def test_write_prometheus(self):
+        path = tempfile.mkdtemp()
+        try:
+            target = os.path.join(path, "pool.prom")
+            telemetry.write_prometheus(target, "a 1\n")
+            telemetry.write_prometheus(target, "a 2\n")
+            with open(target) as f:
+                self.assertEqual(f.read(), "a 2\n")
+            self.assertEqual(os.listdir(path), ["pool.prom"])
+        finally:
+            shutil.rmtree(path)
@@ -0,0 +1,284 @@
+import os
+import random
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+
+from virtualbox import library
+from virtualbox import transfer
+
+from tests import fakes
+
+
+class FakeGuestFile(object):
+    """In-memory guest file that serves at most max_io bytes per call"""
+
+    def __init__(self, fs, path, max_io=1000):
+        self.fs = fs
+        self.path = path
+        self.max_io = max_io
+        self.closed = False
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.most_in_flight = 0
+
+    def _enter(self):
+        with self.lock:
+            self.in_flight += 1
+            self.most_in_flight = max(self.most_in_flight, self.in_flight)
+        # Finish out of order.
+        time.sleep(random.random() * 0.005)
+
+    def _exit(self):
+        with self.lock:
+            self.in_flight -= 1
+
+    def query_size(self):
+        return len(self.fs[self.path])
+
+    def read_at(self, offset, to_read, timeout_ms):
+        self._enter()
+        try:
+            if self.fs.get("fail_at") == offset:
+                raise library.VBoxError("connection lost")
+            self.fs.setdefault("reads", []).append(offset)
+            end = offset + min(to_read, self.max_io)
+            return bytes(self.fs[self.path][offset:end])
+        finally:
+            self._exit()
+
+    def write_at(self, offset, data, timeout_ms):
+        self._enter()
+        try:
+            if self.fs.get("fail_at") == offset:
+                raise library.VBoxError("disk full")
+            self.fs.setdefault("writes", []).append(offset)
+            data = data[: self.max_io]
+            end = offset + len(data)
+            with self.lock:
+                buf = self.fs[self.path]
+                if len(buf) < end:
+                    buf.extend(b"\0" * (end - len(buf)))
+                buf[offset:end] = data
+            return len(data)
+        finally:
+            self._exit()
+
+    def set_size(self, size):
+        del self.fs[self.path][size:]
+
+    def close(self):
+        self.closed = True
+
+
+class FakeFsObjInfo(object):
+    def __init__(self, data):
+        self.object_size = len(data)
+        self.modification_time = 1234
+
+
+class FakeGuestSession(fakes.FakeGuestSession):
+    def __init__(self):
+        fakes.FakeGuestSession.__init__(self)
+        self.fs = {}
+        self.files = []
+
+    def fs_obj_query_info(self, path, follow_symlinks):
+        if path not in self.fs:
+            raise library.VBoxError("file not found")
+        return FakeFsObjInfo(self.fs[path])
+
+    def file_open(self, path, access_mode, open_action, creation_mode):
+        if open_action == library.FileOpenAction.create_or_replace:
+            self.fs[path] = bytearray()
+        elif open_action == library.FileOpenAction.open_or_create:
+            self.fs.setdefault(path, bytearray())
+        elif path not in self.fs:
+            raise library.VBoxError("file not found")
+        guest_file = FakeGuestFile(self.fs, path)
+        self.files.append(guest_file)
+        return guest_file
+
+
+class TestTransfer(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.session = FakeGuestSession()
+        self.data = os.urandom(100 * 1024 + 17)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def test_download(self):
+        self.session.fs["/guest/file"] = bytearray(self.data)
+        host_path = os.path.join(self.tmp, "file")
+        calls = []
+        stats = transfer.download(
+            self.session,
+            "/guest/file",
+            host_path,
+            chunk_size=4096,
+            window=4,
+            progress=lambda done, total: calls.append((done, total)),
+        )
+        with open(host_path, "rb") as f:
+            self.assertEqual(f.read(), self.data)
+        self.assertEqual(stats.bytes, len(self.data))
+        self.assertEqual(calls[-1], (len(self.data), len(self.data)))
+        guest_file = self.session.files[0]
+        self.assertTrue(guest_file.closed)
+        self.assertTrue(1 < guest_file.most_in_flight <= 4)
+
+    def test_upload(self):
+        host_path = os.path.join(self.tmp, "file")
+        with open(host_path, "wb") as f:
+            f.write(self.data)
+        stats = transfer.upload(
+            self.session, host_path, "/guest/file", chunk_size=4096, window=3
+        )
+        self.assertEqual(bytes(self.session.fs["/guest/file"]), self.data)
+        self.assertEqual(stats.bytes, len(self.data))
+        self.assertTrue(stats.throughput > 0)
+        self.assertTrue(self.session.files[0].most_in_flight <= 3)
+
+    def test_upload_error(self):
+        host_path = os.path.join(self.tmp, "file")
+        with open(host_path, "wb") as f:
+            f.write(self.data)
+        self.session.fs["fail_at"] = 8192
+        with self.assertRaises(library.VBoxError):
+            transfer.upload(self.session, host_path, "/guest/file", chunk_size=4096)
+        guest_file = self.session.files[0]
+        self.assertTrue(guest_file.closed)
+        self.assertEqual(guest_file.in_flight, 0)
+
+    def test_download_error_keeps_host_file(self):
+        self.session.fs["/guest/file"] = bytearray(self.data)
+        self.session.fs["fail_at"] = 8192
+        host_path = os.path.join(self.tmp, "file")
+        with open(host_path, "wb") as f:
+            f.write(b"old")
+        with self.assertRaises(library.VBoxError):
+            transfer.download(self.session, "/guest/file", host_path, chunk_size=4096)
+        with open(host_path, "rb") as f:
+            self.assertEqual(f.read(), b"old")
+        self.assertEqual(os.listdir(self.tmp), ["file"])
+
+    def test_empty_file(self):
+        self.session.fs["/guest/empty"] = bytearray()
+        host_path = os.path.join(self.tmp, "empty")
+        stats = transfer.download(self.session, "/guest/empty", host_path)
+        self.assertEqual(os.path.getsize(host_path), 0)
+        self.assertEqual(stats.bytes, 0)
+
+
+class TestResume(unittest.TestCase):
+    chunk = 4096
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.session = FakeGuestSession()
+        self.data = os.urandom(10 * self.chunk + 17)
+        self.host_path = os.path.join(self.tmp, "file")
+        self.sidecar = self.host_path + transfer.Checkpoint.suffix
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def chunks(self, offsets):
+        return set(offset - offset % self.chunk for offset in offsets)
+
+    def download(self):
+        return transfer.download(
+            self.session,
+            "/guest/file",
+            self.host_path,
+            chunk_size=self.chunk,
+            window=2,
+            resume=True,
+        )
+
+    def upload(self):
+        return transfer.upload(
+            self.session,
+            self.host_path,
+            "/guest/file",
+            chunk_size=self.chunk,
+            window=2,
+            resume=True,
+        )
+
+    def test_download_resumes(self):
+        fs = self.session.fs
+        fs["/guest/file"] = bytearray(self.data)
+        fs["fail_at"] = 6 * self.chunk
+        self.assertRaises(library.VBoxError, self.download)
+        self.assertTrue(os.path.exists(self.sidecar))
+        fetched = self.chunks(fs.pop("reads"))
+
+        # Damage one of the chunks already on the host.
+        with open(self.host_path, "r+b") as f:
+            f.seek(self.chunk)
+            f.write(b"x")
+        del fs["fail_at"]
+        stats = self.download()
+        refetched = self.chunks(fs["reads"])
+        with open(self.host_path, "rb") as f:
+            self.assertEqual(f.read(), self.data)
+        self.assertFalse(os.path.exists(self.sidecar))
+        self.assertIn(self.chunk, refetched)
+        self.assertEqual(fetched & refetched, set([self.chunk]))
+        self.assertEqual(stats.bytes, len(self.data) - (len(fetched) - 1) * self.chunk)
+
+    def test_download_restarts_when_source_changes(self):
+        fs = self.session.fs
+        fs["/guest/file"] = bytearray(self.data)
+        fs["fail_at"] = 6 * self.chunk
+        self.assertRaises(library.VBoxError, self.download)
+        del fs["fail_at"]
+        self.data = self.data[:-1]
+        fs["/guest/file"] = bytearray(self.data)
+        stats = self.download()
+        self.assertEqual(stats.bytes, len(self.data))
+        with open(self.host_path, "rb") as f:
+            self.assertEqual(f.read(), self.data)
+
+    def test_upload_resumes(self):
+        fs = self.session.fs
+        with open(self.host_path, "wb") as f:
+            f.write(self.data)
+        fs["fail_at"] = 6 * self.chunk
+        self.assertRaises(library.VBoxError, self.upload)
+        written = self.chunks(fs.pop("writes")) - set([fs.pop("fail_at")])
+        stats = self.upload()
+        self.assertEqual(bytes(fs["/guest/file"]), self.data)
+        self.assertFalse(self.chunks(fs["writes"]) & written)
+        self.assertEqual(stats.bytes, len(self.data) - len(written) * self.chunk)
+        self.assertFalse(os.path.exists(self.sidecar))
+
+    def test_upload_restarts_when_guest_file_is_gone(self):
+        fs = self.session.fs
+        with open(self.host_path, "wb") as f:
+            f.write(self.data)
+        fs["fail_at"] = 6 * self.chunk
+        self.assertRaises(library.VBoxError, self.upload)
+        del fs["fail_at"]
+        del fs["/guest/file"]
+        stats = self.upload()
+        self.assertEqual(bytes(fs["/guest/file"]), self.data)
+        self.assertEqual(stats.bytes, len(self.data))
+
+    def test_torn_checkpoint(self):
+        header = {"a": 1}
+        checkpoint = transfer.Checkpoint(self.sidecar, header)
+        checkpoint.open()
+        checkpoint.record(0, "aa")
+        checkpoint.record(4096, "bb")
+        checkpoint.close()
+        with open(self.sidecar, "a") as f:
+            f.write("8192 c")
+        loaded = transfer.Checkpoint.load(self.sidecar, header)
+        self.assertEqual(loaded.chunks, {0: "aa", 4096: "bb"})
+        self.assertEqual(transfer.Checkpoint.load(self.sidecar, {"a": 2}).chunks, {})
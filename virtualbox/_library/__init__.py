@@ -0,0 +1 @@
+"""Generated VirtualBox Main API modules, see :mod:`virtualbox.library`."""
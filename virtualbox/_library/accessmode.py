@@ -0,0 +1,34 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class AccessMode(Enum):
+    """Access mode for opening files.
+
+
+    .. describe:: read_only(1)
+
+
+
+    .. describe:: read_write(2)
+
+
+
+    """
+
+    __uuid__ = "1da0007c-ddf7-4be8-bcac-d84a1558785f"
+    _enums = [
+        ("ReadOnly", 1, """"""),
+        ("ReadWrite", 2, """"""),
+    ]
@@ -0,0 +1,59 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class AdditionsFacilityClass(Enum):
+    """Guest Additions facility classes.
+
+
+    .. describe:: none(0)
+
+            No/invalid class.
+
+    .. describe:: driver(10)
+
+            Driver.
+
+    .. describe:: service(30)
+
+            System service.
+
+    .. describe:: program(50)
+
+            Program.
+
+    .. describe:: feature(100)
+
+            Feature.
+
+    .. describe:: third_party(999)
+
+            Third party.
+
+    .. describe:: all_p(2147483646)
+
+            All facility classes selected.
+
+    """
+
+    __uuid__ = "446451b2-c88d-4e5d-84c9-91bc7f533f5f"
+    _enums = [
+        ("None", 0, """No/invalid class."""),
+        ("Driver", 10, """Driver."""),
+        ("Service", 30, """System service."""),
+        ("Program", 50, """Program."""),
+        ("Feature", 100, """Feature."""),
+        ("ThirdParty", 999, """Third party."""),
+        ("All", 2147483646, """All facility classes selected."""),
+    ]
@@ -0,0 +1,69 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class AdditionsFacilityStatus(Enum):
+    """Guest Additions facility states.
+
+
+    .. describe:: inactive(0)
+
+            Facility is not active.
+
+    .. describe:: paused(1)
+
+            Facility has been paused.
+
+    .. describe:: pre_init(20)
+
+            Facility is preparing to initialize.
+
+    .. describe:: init(30)
+
+            Facility is initializing.
+
+    .. describe:: active(50)
+
+            Facility is up and running.
+
+    .. describe:: terminating(100)
+
+            Facility is shutting down.
+
+    .. describe:: terminated(101)
+
+            Facility successfully shut down.
+
+    .. describe:: failed(800)
+
+            Facility failed to start.
+
+    .. describe:: unknown(999)
+
+            Facility status is unknown.
+
+    """
+
+    __uuid__ = "ce06f9e1-394e-4fe9-9368-5a88c567dbde"
+    _enums = [
+        ("Inactive", 0, """Facility is not active."""),
+        ("Paused", 1, """Facility has been paused."""),
+        ("PreInit", 20, """Facility is preparing to initialize."""),
+        ("Init", 30, """Facility is initializing."""),
+        ("Active", 50, """Facility is up and running."""),
+        ("Terminating", 100, """Facility is shutting down."""),
+        ("Terminated", 101, """Facility successfully shut down."""),
+        ("Failed", 800, """Facility failed to start."""),
+        ("Unknown", 999, """Facility status is unknown."""),
+    ]
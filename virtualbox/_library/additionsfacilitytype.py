@@ -0,0 +1,81 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class AdditionsFacilityType(Enum):
+    """Guest Additions facility IDs.
+
+
+    .. describe:: none(0)
+
+            No/invalid facility.
+
+    .. describe:: v_box_guest_driver(20)
+
+            VirtualBox base driver (VBoxGuest).
+
+    .. describe:: auto_logon(90)
+
+            Auto-logon modules (VBoxGINA, VBoxCredProv, pam_vbox).
+
+    .. describe:: v_box_service(100)
+
+            VirtualBox system service (VBoxService).
+
+    .. describe:: v_box_tray_client(101)
+
+            VirtualBox desktop integration (VBoxTray on Windows, VBoxClient on non-Windows).
+
+    .. describe:: seamless(1000)
+
+            Seamless guest desktop integration.
+
+    .. describe:: graphics(1100)
+
+            Guest graphics mode. If not enabled, seamless rendering will not work, resize hints
+            are not immediately acted on and guest display resizes are probably not initiated by
+            the Guest Additions.
+
+    .. describe:: monitor_attach(1101)
+
+            Guest supports monitor hotplug.
+
+    .. describe:: all_p(2147483646)
+
+            All facilities selected.
+
+    """
+
+    __uuid__ = "c4b10d74-dd48-4ff4-9a40-785a2a389ade"
+    _enums = [
+        ("None", 0, """No/invalid facility."""),
+        ("VBoxGuestDriver", 20, """VirtualBox base driver (VBoxGuest)."""),
+        ("AutoLogon", 90, """Auto-logon modules (VBoxGINA, VBoxCredProv, pam_vbox)."""),
+        ("VBoxService", 100, """VirtualBox system service (VBoxService)."""),
+        (
+            "VBoxTrayClient",
+            101,
+            """VirtualBox desktop integration (VBoxTray on Windows, VBoxClient on non-Windows).""",
+        ),
+        ("Seamless", 1000, """Seamless guest desktop integration."""),
+        (
+            "Graphics",
+            1100,
+            """Guest graphics mode. If not enabled, seamless rendering will not work, resize hints
+            are not immediately acted on and guest display resizes are probably not initiated by
+            the Guest Additions.""",
+        ),
+        ("MonitorAttach", 1101, """Guest supports monitor hotplug."""),
+        ("All", 2147483646, """All facilities selected."""),
+    ]
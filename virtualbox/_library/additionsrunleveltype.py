@@ -0,0 +1,48 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class AdditionsRunLevelType(Enum):
+    """Guest Additions run level type.
+
+
+    .. describe:: none(0)
+
+            Guest Additions are not loaded.
+
+    .. describe:: system(1)
+
+            Guest drivers are loaded.
+
+    .. describe:: userland(2)
+
+            Common components (such as application services) are loaded.
+
+    .. describe:: desktop(3)
+
+            Per-user desktop components are loaded.
+
+    """
+
+    __uuid__ = "a25417ee-a9dd-4f5b-b0dc-377860087754"
+    _enums = [
+        ("None", 0, """Guest Additions are not loaded."""),
+        ("System", 1, """Guest drivers are loaded."""),
+        (
+            "Userland",
+            2,
+            """Common components (such as application services) are loaded.""",
+        ),
+        ("Desktop", 3, """Per-user desktop components are loaded."""),
+    ]
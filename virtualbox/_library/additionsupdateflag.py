@@ -0,0 +1,44 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class AdditionsUpdateFlag(Enum):
+    """Guest Additions update flags.
+
+
+    .. describe:: none(0)
+
+            No flag set.
+
+    .. describe:: wait_for_update_start_only(1)
+
+            Starts the regular updating process and waits until the
+            actual Guest Additions update inside the guest was started.
+            This can be necessary due to needed interaction with the guest
+            OS during the installation phase.
+
+    """
+
+    __uuid__ = "726a818d-18d6-4389-94e8-3e9e6826171a"
+    _enums = [
+        ("None", 0, """No flag set."""),
+        (
+            "WaitForUpdateStartOnly",
+            1,
+            """Starts the regular updating process and waits until the
+            actual Guest Additions update inside the guest was started.
+            This can be necessary due to needed interaction with the guest
+            OS during the installation phase.""",
+        ),
+    ]
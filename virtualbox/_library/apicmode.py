@@ -0,0 +1,40 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class APICMode(Enum):
+    """BIOS APIC initialization mode. If the hardware does not support the
+    mode then the code falls back to a lower mode.
+
+
+    .. describe:: disabled(0)
+
+
+
+    .. describe:: apic(1)
+
+
+
+    .. describe:: x2_apic(2)
+
+
+
+    """
+
+    __uuid__ = "c6884ba5-3cc4-4a92-a7f6-4410f9fd894e"
+    _enums = [
+        ("Disabled", 0, """"""),
+        ("APIC", 1, """"""),
+        ("X2APIC", 2, """"""),
+    ]
@@ -0,0 +1,50 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class AudioCodecType(Enum):
+    """The exact variant of audio codec hardware presented
+    to the guest; see :py:func:`IAudioAdapter.audio_codec` .
+
+
+    .. describe:: null(0)
+
+            @c null value. Never used by the API.
+
+    .. describe:: sb16(1)
+
+            SB16; this is the only option for the SB16 device.
+
+    .. describe:: stac9700(2)
+
+            A STAC9700 AC'97 codec.
+
+    .. describe:: ad1980(3)
+
+            An AD1980 AC'97 codec. Recommended for Linux guests.
+
+    .. describe:: stac9221(4)
+
+            A STAC9221 HDA codec.
+
+    """
+
+    __uuid__ = "7b406301-f520-420c-9805-8ce11c086370"
+    _enums = [
+        ("Null", 0, """@c null value. Never used by the API."""),
+        ("SB16", 1, """SB16; this is the only option for the SB16 device."""),
+        ("STAC9700", 2, """A STAC9700 AC'97 codec."""),
+        ("AD1980", 3, """An AD1980 AC'97 codec. Recommended for Linux guests."""),
+        ("STAC9221", 4, """A STAC9221 HDA codec."""),
+    ]
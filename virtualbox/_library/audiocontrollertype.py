@@ -0,0 +1,39 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class AudioControllerType(Enum):
+    """Virtual audio controller type.
+
+
+    .. describe:: ac97(0)
+
+
+
+    .. describe:: sb16(1)
+
+
+
+    .. describe:: hda(2)
+
+
+
+    """
+
+    __uuid__ = "7afd395c-42c3-444e-8788-3ce80292f36c"
+    _enums = [
+        ("AC97", 0, """"""),
+        ("SB16", 1, """"""),
+        ("HDA", 2, """"""),
+    ]
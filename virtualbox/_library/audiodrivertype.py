@@ -0,0 +1,77 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class AudioDriverType(Enum):
+    """Host audio driver type.
+
+
+    .. describe:: null(0)
+
+            Null value, also means "dummy audio driver".
+
+    .. describe:: win_mm(1)
+
+            Windows multimedia (Windows hosts only, not supported at the moment).
+
+    .. describe:: oss(2)
+
+            Open Sound System (Linux / Unix hosts only).
+
+    .. describe:: alsa(3)
+
+            Advanced Linux Sound Architecture (Linux hosts only).
+
+    .. describe:: direct_sound(4)
+
+            DirectSound (Windows hosts only).
+
+    .. describe:: core_audio(5)
+
+            CoreAudio (Mac hosts only).
+
+    .. describe:: mmpm(6)
+
+            Reserved for historical reasons.
+
+    .. describe:: pulse(7)
+
+            PulseAudio (Linux hosts only).
+
+    .. describe:: sol_audio(8)
+
+            Solaris audio (Solaris hosts only, not supported at the moment).
+
+    """
+
+    __uuid__ = "4bcc3d73-c2fe-40db-b72f-0c2ca9d68496"
+    _enums = [
+        ("Null", 0, """Null value, also means "dummy audio driver"."""),
+        (
+            "WinMM",
+            1,
+            """Windows multimedia (Windows hosts only, not supported at the moment).""",
+        ),
+        ("OSS", 2, """Open Sound System (Linux / Unix hosts only)."""),
+        ("ALSA", 3, """Advanced Linux Sound Architecture (Linux hosts only)."""),
+        ("DirectSound", 4, """DirectSound (Windows hosts only)."""),
+        ("CoreAudio", 5, """CoreAudio (Mac hosts only)."""),
+        ("MMPM", 6, """Reserved for historical reasons."""),
+        ("Pulse", 7, """PulseAudio (Linux hosts only)."""),
+        (
+            "SolAudio",
+            8,
+            """Solaris audio (Solaris hosts only, not supported at the moment).""",
+        ),
+    ]
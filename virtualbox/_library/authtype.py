@@ -0,0 +1,39 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class AuthType(Enum):
+    """VirtualBox authentication type.
+
+
+    .. describe:: null(0)
+
+            Null value, also means "no authentication".
+
+    .. describe:: external(1)
+
+
+
+    .. describe:: guest(2)
+
+
+
+    """
+
+    __uuid__ = "7eef6ef6-98c2-4dc2-ab35-10d2b292028d"
+    _enums = [
+        ("Null", 0, """Null value, also means "no authentication"."""),
+        ("External", 1, """"""),
+        ("Guest", 2, """"""),
+    ]
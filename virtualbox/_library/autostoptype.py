@@ -0,0 +1,48 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class AutostopType(Enum):
+    """Autostop types, used with :py:func:`IMachine.autostop_type` .
+
+
+    .. describe:: disabled(1)
+
+            Stopping the VM during system shutdown is disabled.
+
+    .. describe:: save_state(2)
+
+            The state of the VM will be saved when the system shuts down.
+
+    .. describe:: power_off(3)
+
+            The VM is powered off when the system shuts down.
+
+    .. describe:: acpi_shutdown(4)
+
+            An ACPI shutdown event is generated.
+
+    """
+
+    __uuid__ = "6bb96740-cf34-470d-aab2-2cd48ea2e10e"
+    _enums = [
+        ("Disabled", 1, """Stopping the VM during system shutdown is disabled."""),
+        (
+            "SaveState",
+            2,
+            """The state of the VM will be saved when the system shuts down.""",
+        ),
+        ("PowerOff", 3, """The VM is powered off when the system shuts down."""),
+        ("AcpiShutdown", 4, """An ACPI shutdown event is generated."""),
+    ]
@@ -0,0 +1,39 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class BandwidthGroupType(Enum):
+    """Type of a bandwidth control group.
+
+
+    .. describe:: null(0)
+
+            Null type, must be first.
+
+    .. describe:: disk(1)
+
+            The bandwidth group controls disk I/O.
+
+    .. describe:: network(2)
+
+            The bandwidth group controls network I/O.
+
+    """
+
+    __uuid__ = "1d92b67d-dc69-4be9-ad4c-93a01e1e0c8e"
+    _enums = [
+        ("Null", 0, """Null type, must be first."""),
+        ("Disk", 1, """The bandwidth group controls disk I/O."""),
+        ("Network", 2, """The bandwidth group controls network I/O."""),
+    ]
@@ -0,0 +1,39 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class BIOSBootMenuMode(Enum):
+    """BIOS boot menu mode.
+
+
+    .. describe:: disabled(0)
+
+
+
+    .. describe:: menu_only(1)
+
+
+
+    .. describe:: message_and_menu(2)
+
+
+
+    """
+
+    __uuid__ = "ae4fb9f7-29d2-45b4-b2c7-d579603135d5"
+    _enums = [
+        ("Disabled", 0, """"""),
+        ("MenuOnly", 1, """"""),
+        ("MessageAndMenu", 2, """"""),
+    ]
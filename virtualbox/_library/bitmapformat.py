@@ -0,0 +1,86 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class BitmapFormat(Enum):
+    """Format of a bitmap. Generic values for formats used by
+    the source bitmap, the screen shot or image update APIs.
+
+
+    .. describe:: opaque(0)
+
+            Unknown buffer format (the user may not assume any particular format of
+            the buffer).
+
+    .. describe:: bgr(542263106)
+
+            Generic BGR format without alpha channel.
+            Pixel layout depends on the number of bits per pixel:
+
+
+            **32** - bits 31:24 undefined, bits 23:16 R, bits 15:8 G, bits 7:0 B.
+
+
+
+            **16** - bits 15:11 R, bits 10:5 G, bits 4:0 B.
+
+    .. describe:: bgr0(810698562)
+
+            4 bytes per pixel: B, G, R, 0.
+
+    .. describe:: bgra(1095911234)
+
+            4 bytes per pixel: B, G, R, A.
+
+    .. describe:: rgba(1094862674)
+
+            4 bytes per pixel: R, G, B, A.
+
+    .. describe:: png(541544016)
+
+            PNG image.
+
+    .. describe:: jpeg(1195724874)
+
+            JPEG image.
+
+    """
+
+    __uuid__ = "afb2bf39-8b1e-4f9f-8948-d1b887f83eb0"
+    _enums = [
+        (
+            "Opaque",
+            0,
+            """Unknown buffer format (the user may not assume any particular format of
+            the buffer).""",
+        ),
+        (
+            "BGR",
+            542263106,
+            """Generic BGR format without alpha channel.
+            Pixel layout depends on the number of bits per pixel:
+            
+            
+            **32** - bits 31:24 undefined, bits 23:16 R, bits 15:8 G, bits 7:0 B.
+            
+            
+            
+            **16** - bits 15:11 R, bits 10:5 G, bits 4:0 B.""",
+        ),
+        ("BGR0", 810698562, """4 bytes per pixel: B, G, R, 0."""),
+        ("BGRA", 1095911234, """4 bytes per pixel: B, G, R, A."""),
+        ("RGBA", 1094862674, """4 bytes per pixel: R, G, B, A."""),
+        ("PNG", 541544016, """PNG image."""),
+        ("JPEG", 1195724874, """JPEG image."""),
+    ]
@@ -0,0 +1,44 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class CertificateVersion(Enum):
+    """X.509 certificate version numbers.
+
+
+    .. describe:: v1(1)
+
+
+
+    .. describe:: v2(2)
+
+
+
+    .. describe:: v3(3)
+
+
+
+    .. describe:: unknown(99)
+
+
+
+    """
+
+    __uuid__ = "9e232a99-51d0-4dbd-96a0-ffac4bc3e2a8"
+    _enums = [
+        ("V1", 1, """"""),
+        ("V2", 2, """"""),
+        ("V3", 3, """"""),
+        ("Unknown", 99, """"""),
+    ]
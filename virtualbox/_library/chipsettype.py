@@ -0,0 +1,39 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class ChipsetType(Enum):
+    """Type of emulated chipset (mostly southbridge).
+
+
+    .. describe:: null(0)
+
+            @c null value. Never used by the API.
+
+    .. describe:: piix3(1)
+
+            A PIIX3 (PCI IDE ISA Xcelerator) chipset.
+
+    .. describe:: ich9(2)
+
+            A ICH9 (I/O Controller Hub) chipset.
+
+    """
+
+    __uuid__ = "8b4096a8-a7c3-4d3b-bbb1-05a0a51ec394"
+    _enums = [
+        ("Null", 0, """@c null value. Never used by the API."""),
+        ("PIIX3", 1, """A PIIX3 (PCI IDE ISA Xcelerator) chipset."""),
+        ("ICH9", 2, """A ICH9 (I/O Controller Hub) chipset."""),
+    ]
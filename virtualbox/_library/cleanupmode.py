@@ -0,0 +1,60 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class CleanupMode(Enum):
+    """Cleanup mode, used with :py:func:`IMachine.unregister` .
+
+
+    .. describe:: unregister_only(1)
+
+            Unregister only the machine, but neither delete snapshots nor detach media.
+
+    .. describe:: detach_all_return_none(2)
+
+            Delete all snapshots and detach all media but return none; this will keep all media registered.
+
+    .. describe:: detach_all_return_hard_disks_only(3)
+
+            Delete all snapshots, detach all media and return hard disks for closing, but not removable media.
+
+    .. describe:: full(4)
+
+            Delete all snapshots, detach all media and return all media for closing.
+
+    """
+
+    __uuid__ = "67897c50-7cca-47a9-83f6-ce8fd8eb5441"
+    _enums = [
+        (
+            "UnregisterOnly",
+            1,
+            """Unregister only the machine, but neither delete snapshots nor detach media.""",
+        ),
+        (
+            "DetachAllReturnNone",
+            2,
+            """Delete all snapshots and detach all media but return none; this will keep all media registered.""",
+        ),
+        (
+            "DetachAllReturnHardDisksOnly",
+            3,
+            """Delete all snapshots, detach all media and return hard disks for closing, but not removable media.""",
+        ),
+        (
+            "Full",
+            4,
+            """Delete all snapshots, detach all media and return all media for closing.""",
+        ),
+    ]
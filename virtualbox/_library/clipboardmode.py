@@ -0,0 +1,44 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class ClipboardMode(Enum):
+    """Host-Guest clipboard interchange mode.
+
+
+    .. describe:: disabled(0)
+
+
+
+    .. describe:: host_to_guest(1)
+
+
+
+    .. describe:: guest_to_host(2)
+
+
+
+    .. describe:: bidirectional(3)
+
+
+
+    """
+
+    __uuid__ = "33364716-4008-4701-8f14-be0fa3d62950"
+    _enums = [
+        ("Disabled", 0, """"""),
+        ("HostToGuest", 1, """"""),
+        ("GuestToHost", 2, """"""),
+        ("Bidirectional", 3, """"""),
+    ]
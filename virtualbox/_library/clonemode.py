@@ -0,0 +1,47 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class CloneMode(Enum):
+    """Clone mode, used with :py:func:`IMachine.clone_to` .
+
+
+    .. describe:: machine_state(1)
+
+            Clone the state of the selected machine.
+
+    .. describe:: machine_and_child_states(2)
+
+            Clone the state of the selected machine and its child snapshots if present.
+
+    .. describe:: all_states(3)
+
+            Clone all states (including all snapshots) of the machine, regardless of the machine object used.
+
+    """
+
+    __uuid__ = "A7A159FE-5096-4B8D-8C3C-D033CB0B35A8"
+    _enums = [
+        ("MachineState", 1, """Clone the state of the selected machine."""),
+        (
+            "MachineAndChildStates",
+            2,
+            """Clone the state of the selected machine and its child snapshots if present.""",
+        ),
+        (
+            "AllStates",
+            3,
+            """Clone all states (including all snapshots) of the machine, regardless of the machine object used.""",
+        ),
+    ]
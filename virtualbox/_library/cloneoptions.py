@@ -0,0 +1,61 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class CloneOptions(Enum):
+    """Clone options, used with :py:func:`IMachine.clone_to` .
+
+
+    .. describe:: link(1)
+
+            Create a clone VM where all virtual disks are linked to the original VM.
+
+    .. describe:: keep_all_ma_cs(2)
+
+            Don't generate new MAC addresses of the attached network adapters.
+
+    .. describe:: keep_natma_cs(3)
+
+            Don't generate new MAC addresses of the attached network adapters when they are using NAT.
+
+    .. describe:: keep_disk_names(4)
+
+            Don't change the disk names.
+
+    .. describe:: keep_hw_uui_ds(5)
+
+            Don't change UUID of the machine hardware.
+
+    """
+
+    __uuid__ = "22243f8e-96ab-497c-8cf0-f40a566c630b"
+    _enums = [
+        (
+            "Link",
+            1,
+            """Create a clone VM where all virtual disks are linked to the original VM.""",
+        ),
+        (
+            "KeepAllMACs",
+            2,
+            """Don't generate new MAC addresses of the attached network adapters.""",
+        ),
+        (
+            "KeepNATMACs",
+            3,
+            """Don't generate new MAC addresses of the attached network adapters when they are using NAT.""",
+        ),
+        ("KeepDiskNames", 4, """Don't change the disk names."""),
+        ("KeepHwUUIDs", 5, """Don't change UUID of the machine hardware."""),
+    ]
@@ -0,0 +1,59 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class CloudImageState(Enum):
+    """Cloud image state
+
+
+    .. describe:: invalid(0)
+
+            Invalid state
+
+    .. describe:: provisioning(1)
+
+            The image is in the process of provisioning
+
+    .. describe:: importing(2)
+
+            The image is in the process of importing
+
+    .. describe:: available(3)
+
+            The image is avalable
+
+    .. describe:: exporting(4)
+
+            The image is in the process of exporting
+
+    .. describe:: disabled(5)
+
+            The image is disabled
+
+    .. describe:: deleted(6)
+
+            The image was deleted
+
+    """
+
+    __uuid__ = "6e5d6762-eea2-4f2c-b104-2952d0aa8a0a"
+    _enums = [
+        ("Invalid", 0, """Invalid state"""),
+        ("Provisioning", 1, """The image is in the process of provisioning"""),
+        ("Importing", 2, """The image is in the process of importing"""),
+        ("Available", 3, """The image is avalable"""),
+        ("Exporting", 4, """The image is in the process of exporting"""),
+        ("Disabled", 5, """The image is disabled"""),
+        ("Deleted", 6, """The image was deleted"""),
+    ]
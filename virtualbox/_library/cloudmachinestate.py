@@ -0,0 +1,69 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class CloudMachineState(Enum):
+    """Cloud instance execution state
+
+
+    .. describe:: invalid(0)
+
+            Invalid state
+
+    .. describe:: provisioning(1)
+
+            The machine is in the process of provisioning
+
+    .. describe:: running(2)
+
+            The machine runs
+
+    .. describe:: starting(3)
+
+            The machine is in the process of starting
+
+    .. describe:: stopping(4)
+
+            The machine is in the process of stopping
+
+    .. describe:: stopped(5)
+
+            The machine was stopped
+
+    .. describe:: creating_image(6)
+
+            The machine is in the process of creating image
+
+    .. describe:: terminating(7)
+
+            The machine is in the process of terminating
+
+    .. describe:: terminated(8)
+
+            The machine was terminated
+
+    """
+
+    __uuid__ = "67b6d054-0154-4f5d-b71b-6ac406e1ff78"
+    _enums = [
+        ("Invalid", 0, """Invalid state"""),
+        ("Provisioning", 1, """The machine is in the process of provisioning"""),
+        ("Running", 2, """The machine runs"""),
+        ("Starting", 3, """The machine is in the process of starting"""),
+        ("Stopping", 4, """The machine is in the process of stopping"""),
+        ("Stopped", 5, """The machine was stopped"""),
+        ("CreatingImage", 6, """The machine is in the process of creating image"""),
+        ("Terminating", 7, """The machine is in the process of terminating"""),
+        ("Terminated", 8, """The machine was terminated"""),
+    ]
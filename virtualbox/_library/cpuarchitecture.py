@@ -0,0 +1,39 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class CPUArchitecture(Enum):
+    """Basic CPU architecture types.
+
+
+    .. describe:: any_p(0)
+
+            Matches any CPU architecture.
+
+    .. describe:: x86(1)
+
+            32-bit (and 16-bit) x86.
+
+    .. describe:: amd64(2)
+
+            64-bit x86.  (Also known as x86-64 or x64.)
+
+    """
+
+    __uuid__ = "4a2c9915-12f1-43b2-bb84-e4bd4d5ca227"
+    _enums = [
+        ("Any", 0, """Matches any CPU architecture."""),
+        ("x86", 1, """32-bit (and 16-bit) x86."""),
+        ("AMD64", 2, """64-bit x86.  (Also known as x86-64 or x64.)"""),
+    ]
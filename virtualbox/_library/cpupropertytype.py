@@ -0,0 +1,220 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class CPUPropertyType(Enum):
+    """Virtual CPU property type. This enumeration represents possible values of the
+    IMachine get- and setCPUProperty methods.
+
+
+    .. describe:: null(0)
+
+            Null value (never used by the API).
+
+    .. describe:: pae(1)
+
+            This setting determines whether VirtualBox will expose the Physical Address
+            Extension (PAE) feature of the host CPU to the guest. Note that in case PAE
+            is not available, it will not be reported.
+
+    .. describe:: long_mode(2)
+
+            This setting determines whether VirtualBox will advertise long mode
+            (i.e. 64-bit guest support) and let the guest enter it.
+
+    .. describe:: triple_fault_reset(3)
+
+            This setting determines whether a triple fault within a guest will
+            trigger an internal error condition and stop the VM (default) or reset
+            the virtual CPU/VM and continue execution.
+
+    .. describe:: apic(4)
+
+            This setting determines whether an APIC is part of the virtual CPU.
+            This feature can only be turned off when the X2APIC feature is off.
+
+    .. describe:: x2_apic(5)
+
+            This setting determines whether an x2APIC is part of the virtual CPU.
+            Since this feature implies that the APIC feature is present, it
+            automatically enables the APIC feature when set.
+
+    .. describe:: ibpb_on_vm_exit(6)
+
+            If set, force an indirect branch prediction barrier on VM exits if the
+            host CPU supports it.  This setting will significantly slow down workloads
+            causing many VM exits, so it is only recommended for situation where there
+            is a real need to be paranoid.
+
+    .. describe:: ibpb_on_vm_entry(7)
+
+            If set, force an indirect branch prediction barrier on VM entry if the
+            host CPU supports it.  This setting will significantly slow down workloads
+            causing many VM exits, so it is only recommended for situation where there
+            is a real need to be paranoid.
+
+    .. describe:: hw_virt(8)
+
+            Enabled the hardware virtualization (AMD-V/VT-x) feature on the guest CPU.
+            This requires hardware virtualization on the host CPU.
+
+    .. describe:: spec_ctrl(9)
+
+            If set, the speculation control CPUID bits and MSRs, when available on the
+            host, are exposed to the guest. Depending on the host CPU and operating
+            system, this may significantly slow down workloads causing many VM exits.
+
+    .. describe:: spec_ctrl_by_host(10)
+
+            If set, the speculation controls are managed by the host. This is intended
+            for guests which do not set the speculation controls themselves.
+            Note! This has not yet been implemented beyond leaving everything to the host OS.
+
+    .. describe:: l1_d_flush_on_emt_scheduling(11)
+
+            If set and the host is affected by CVE-2018-3646, flushes the level 1 data
+            cache when the EMT is scheduled to do ring-0 guest execution.  There could
+            be a small performance penalty for certain typs of workloads.
+            For security reasons this setting will be enabled by default.
+
+    .. describe:: l1_d_flush_on_vm_entry(12)
+
+            If set and the host is affected by CVE-2018-3646, flushes the level 1 data
+            on every VM entry.  This setting may significantly slow down workloads
+            causing many VM exits, so it is only recommended for situation where there
+            is a real need to be paranoid.
+
+    .. describe:: mds_clear_on_emt_scheduling(13)
+
+            If set and the host is affected by CVE-2018-12126, CVE-2018-12127, or
+            CVE-2018-12130, clears the relevant MDS buffers when the EMT is scheduled
+            to do ring-0 guest execution.  There could be a small performance penalty
+            for certain typs of workloads. For security reasons this setting will be
+            enabled by default.
+
+    .. describe:: mds_clear_on_vm_entry(14)
+
+            If set and the host is affected by CVE-2018-12126, CVE-2018-12127, or
+            CVE-2018-12130, clears the relevant MDS buffers on every VM entry.  This
+            setting may slow down workloads causing many VM exits, so it is only
+            recommended for situation where there is a real need to be paranoid.
+
+    """
+
+    __uuid__ = "3fcfe589-ca66-468f-e313-656f9d0b2eb6"
+    _enums = [
+        ("Null", 0, """Null value (never used by the API)."""),
+        (
+            "PAE",
+            1,
+            """This setting determines whether VirtualBox will expose the Physical Address
+            Extension (PAE) feature of the host CPU to the guest. Note that in case PAE
+            is not available, it will not be reported.""",
+        ),
+        (
+            "LongMode",
+            2,
+            """This setting determines whether VirtualBox will advertise long mode
+            (i.e. 64-bit guest support) and let the guest enter it.""",
+        ),
+        (
+            "TripleFaultReset",
+            3,
+            """This setting determines whether a triple fault within a guest will
+            trigger an internal error condition and stop the VM (default) or reset
+            the virtual CPU/VM and continue execution.""",
+        ),
+        (
+            "APIC",
+            4,
+            """This setting determines whether an APIC is part of the virtual CPU.
+            This feature can only be turned off when the X2APIC feature is off.""",
+        ),
+        (
+            "X2APIC",
+            5,
+            """This setting determines whether an x2APIC is part of the virtual CPU.
+            Since this feature implies that the APIC feature is present, it
+            automatically enables the APIC feature when set.""",
+        ),
+        (
+            "IBPBOnVMExit",
+            6,
+            """If set, force an indirect branch prediction barrier on VM exits if the
+            host CPU supports it.  This setting will significantly slow down workloads
+            causing many VM exits, so it is only recommended for situation where there
+            is a real need to be paranoid.""",
+        ),
+        (
+            "IBPBOnVMEntry",
+            7,
+            """If set, force an indirect branch prediction barrier on VM entry if the
+            host CPU supports it.  This setting will significantly slow down workloads
+            causing many VM exits, so it is only recommended for situation where there
+            is a real need to be paranoid.""",
+        ),
+        (
+            "HWVirt",
+            8,
+            """Enabled the hardware virtualization (AMD-V/VT-x) feature on the guest CPU.
+            This requires hardware virtualization on the host CPU.""",
+        ),
+        (
+            "SpecCtrl",
+            9,
+            """If set, the speculation control CPUID bits and MSRs, when available on the
+            host, are exposed to the guest. Depending on the host CPU and operating
+            system, this may significantly slow down workloads causing many VM exits.""",
+        ),
+        (
+            "SpecCtrlByHost",
+            10,
+            """If set, the speculation controls are managed by the host. This is intended
+            for guests which do not set the speculation controls themselves.
+            Note! This has not yet been implemented beyond leaving everything to the host OS.""",
+        ),
+        (
+            "L1DFlushOnEMTScheduling",
+            11,
+            """If set and the host is affected by CVE-2018-3646, flushes the level 1 data
+            cache when the EMT is scheduled to do ring-0 guest execution.  There could
+            be a small performance penalty for certain typs of workloads.
+            For security reasons this setting will be enabled by default.""",
+        ),
+        (
+            "L1DFlushOnVMEntry",
+            12,
+            """If set and the host is affected by CVE-2018-3646, flushes the level 1 data
+            on every VM entry.  This setting may significantly slow down workloads
+            causing many VM exits, so it is only recommended for situation where there
+            is a real need to be paranoid.""",
+        ),
+        (
+            "MDSClearOnEMTScheduling",
+            13,
+            """If set and the host is affected by CVE-2018-12126, CVE-2018-12127, or
+            CVE-2018-12130, clears the relevant MDS buffers when the EMT is scheduled
+            to do ring-0 guest execution.  There could be a small performance penalty
+            for certain typs of workloads. For security reasons this setting will be
+            enabled by default.""",
+        ),
+        (
+            "MDSClearOnVMEntry",
+            14,
+            """If set and the host is affected by CVE-2018-12126, CVE-2018-12127, or
+            CVE-2018-12130, clears the relevant MDS buffers on every VM entry.  This
+            setting may slow down workloads causing many VM exits, so it is only
+            recommended for situation where there is a real need to be paranoid.""",
+        ),
+    ]
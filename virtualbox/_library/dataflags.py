@@ -0,0 +1,49 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class DataFlags(Enum):
+    """
+
+
+    .. describe:: none(0)
+
+
+
+    .. describe:: mandatory(1)
+
+
+
+    .. describe:: expert(2)
+
+
+
+    .. describe:: array(4)
+
+
+
+    .. describe:: flag_mask(7)
+
+
+
+    """
+
+    __uuid__ = "86884dcf-1d6b-4f1b-b4bf-f5aa44959d60"
+    _enums = [
+        ("None", 0, """"""),
+        ("Mandatory", 1, """"""),
+        ("Expert", 2, """"""),
+        ("Array", 4, """"""),
+        ("FlagMask", 7, """"""),
+    ]
@@ -0,0 +1,39 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class DataType(Enum):
+    """
+
+
+    .. describe:: int32(0)
+
+
+
+    .. describe:: int8(1)
+
+
+
+    .. describe:: string(2)
+
+
+
+    """
+
+    __uuid__ = "d90ea51e-a3f1-4a01-beb1-c1723c0d3ba7"
+    _enums = [
+        ("Int32", 0, """"""),
+        ("Int8", 1, """"""),
+        ("String", 2, """"""),
+    ]
@@ -0,0 +1,44 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class DeviceActivity(Enum):
+    """Device activity for :py:func:`IConsole.get_device_activity` .
+
+
+    .. describe:: null(0)
+
+
+
+    .. describe:: idle(1)
+
+
+
+    .. describe:: reading(2)
+
+
+
+    .. describe:: writing(3)
+
+
+
+    """
+
+    __uuid__ = "6FC8AEAA-130A-4eb5-8954-3F921422D707"
+    _enums = [
+        ("Null", 0, """"""),
+        ("Idle", 1, """"""),
+        ("Reading", 2, """"""),
+        ("Writing", 3, """"""),
+    ]
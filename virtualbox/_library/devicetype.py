@@ -0,0 +1,70 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class DeviceType(Enum):
+    """Device type.
+
+
+    .. describe:: null(0)
+
+            Null value, may also mean "no device" (not allowed for
+            :py:func:`IConsole.get_device_activity` ).
+
+    .. describe:: floppy(1)
+
+            Floppy device.
+
+    .. describe:: dvd(2)
+
+            CD/DVD-ROM device.
+
+    .. describe:: hard_disk(3)
+
+            Hard disk device.
+
+    .. describe:: network(4)
+
+            Network device.
+
+    .. describe:: usb(5)
+
+            USB device.
+
+    .. describe:: shared_folder(6)
+
+            Shared folder device.
+
+    .. describe:: graphics3_d(7)
+
+            Graphics device 3D activity.
+
+    """
+
+    __uuid__ = "cb977be1-d1fb-41f8-ad7e-951736c6cb3e"
+    _enums = [
+        (
+            "Null",
+            0,
+            """Null value, may also mean "no device" (not allowed for
+            :py:func:`IConsole.get_device_activity` ).""",
+        ),
+        ("Floppy", 1, """Floppy device."""),
+        ("DVD", 2, """CD/DVD-ROM device."""),
+        ("HardDisk", 3, """Hard disk device."""),
+        ("Network", 4, """Network device."""),
+        ("USB", 5, """USB device."""),
+        ("SharedFolder", 6, """Shared folder device."""),
+        ("Graphics3D", 7, """Graphics device 3D activity."""),
+    ]
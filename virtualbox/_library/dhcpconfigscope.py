@@ -0,0 +1,44 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class DHCPConfigScope(Enum):
+    """:py:func:`IDHCPServer.global_config`
+
+
+    .. describe:: global_p(0)
+
+            :py:func:`IDHCPServer.global_config`
+
+    .. describe:: group(1)
+
+            :py:func:`IDHCPServer.group_configs`
+
+    .. describe:: machine_nic(2)
+
+            :py:func:`IDHCPServer.individual_configs`
+
+    .. describe:: mac(3)
+
+            :py:func:`IDHCPServer.individual_configs`
+
+    """
+
+    __uuid__ = "469c42e4-b9ec-43f2-bdcb-9e9d1eb434ae"
+    _enums = [
+        ("Global", 0, """:py:func:`IDHCPServer.global_config` """),
+        ("Group", 1, """:py:func:`IDHCPServer.group_configs` """),
+        ("MachineNIC", 2, """:py:func:`IDHCPServer.individual_configs` """),
+        ("MAC", 3, """:py:func:`IDHCPServer.individual_configs` """),
+    ]
@@ -0,0 +1,54 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class DHCPGroupConditionType(Enum):
+    """MAC address
+
+
+    .. describe:: mac(0)
+
+            MAC address
+
+    .. describe:: mac_wildcard(1)
+
+            MAC address wildcard pattern.
+
+    .. describe:: vendor_class_id(2)
+
+            Vendor class ID
+
+    .. describe:: vendor_class_id_wildcard(3)
+
+            Vendor class ID wildcard pattern.
+
+    .. describe:: user_class_id(4)
+
+            User class ID
+
+    .. describe:: user_class_id_wildcard(5)
+
+            User class ID wildcard pattern.
+
+    """
+
+    __uuid__ = "2cb9280f-ada2-4194-dee8-bfb8ad77119d"
+    _enums = [
+        ("MAC", 0, """MAC address"""),
+        ("MACWildcard", 1, """MAC address wildcard pattern."""),
+        ("vendorClassID", 2, """Vendor class ID"""),
+        ("vendorClassIDWildcard", 3, """Vendor class ID wildcard pattern."""),
+        ("userClassID", 4, """User class ID"""),
+        ("userClassIDWildcard", 5, """User class ID wildcard pattern."""),
+    ]
@@ -0,0 +1,571 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class DHCPOption(Enum):
+    """IPv4 netmask. Set to :py:func:`IDHCPServer.network_mask`  by default.
+
+
+    .. describe:: subnet_mask(1)
+
+            IPv4 netmask. Set to :py:func:`IDHCPServer.network_mask`  by default.
+
+    .. describe:: time_offset(2)
+
+            UTC offset in seconds (32-bit decimal value).
+
+    .. describe:: routers(3)
+
+            Space separated list of IPv4 router addresses.
+
+    .. describe:: time_servers(4)
+
+            Space separated list of IPv4 time server (RFC 868) addresses.
+
+    .. describe:: name_servers(5)
+
+            Space separated list of IPv4 name server (IEN 116) addresses.
+
+    .. describe:: domain_name_servers(6)
+
+            Space separated list of IPv4 DNS addresses.
+
+    .. describe:: log_servers(7)
+
+            Space separated list of IPv4 log server addresses.
+
+    .. describe:: cookie_servers(8)
+
+            Space separated list of IPv4 cookie server (RFC 865) addresses.
+
+    .. describe:: lpr_servers(9)
+
+            Space separated list of IPv4 line printer server (RFC 1179) addresses.
+
+    .. describe:: impress_servers(10)
+
+            Space separated list of IPv4 imagen impress server addresses.
+
+    .. describe:: resourse_location_servers(11)
+
+            Space separated list of IPv4 resource location (RFC 887) addresses.
+
+    .. describe:: host_name(12)
+
+            The client name. See RFC 1035 for character limits.
+
+    .. describe:: boot_file_size(13)
+
+            Number of 512 byte blocks making up the boot file (16-bit decimal value).
+
+    .. describe:: merit_dump_file(14)
+
+            Client core file.
+
+    .. describe:: domain_name(15)
+
+            Domain name for the client.
+
+    .. describe:: swap_server(16)
+
+            IPv4 address of the swap server that the client should use.
+
+    .. describe:: root_path(17)
+
+            The path to the root disk the client should use.
+
+    .. describe:: extension_path(18)
+
+            Path to a file containing additional DHCP options (RFC2123).
+
+    .. describe:: ip_forwarding(19)
+
+            Whether IP forwarding should be enabled by the client (boolean).
+
+    .. describe:: opt_non_local_source_routing(20)
+
+            Whether non-local datagrams should be forwarded by the client (boolean)
+
+    .. describe:: policy_filter(21)
+
+            List of IPv4 addresses and masks paris controlling non-local source routing.
+
+    .. describe:: max_dgram_reassembly_size(22)
+
+            The maximum datagram size the client should reassemble (16-bit decimal value).
+
+    .. describe:: default_ipttl(23)
+
+            The default time-to-leave on outgoing (IP) datagrams (8-bit decimal value).
+
+    .. describe:: path_mtu_aging_timeout(24)
+
+            RFC1191 path MTU discovery timeout value in seconds (32-bit decimal value).
+
+    .. describe:: path_mtu_plateau_table(25)
+
+            RFC1191 path MTU discovery size table, sorted in ascending order (list of 16-bit decimal values).
+
+    .. describe:: interface_mtu(26)
+
+            The MTU size for the interface (16-bit decimal value).
+
+    .. describe:: all_subnets_are_local(27)
+
+            Indicates whether the MTU size is the same for all subnets (boolean).
+
+    .. describe:: broadcast_address(28)
+
+            Broadcast address (RFC1122) for the client to use (IPv4 address).
+
+    .. describe:: perform_mask_discovery(29)
+
+            Whether to perform subnet mask discovery via ICMP (boolean).
+
+    .. describe:: mask_supplier(30)
+
+            Whether to respond to subnet mask requests via ICMP (boolean).
+
+    .. describe:: perform_router_discovery(31)
+
+            Whether to perform router discovery (RFC1256) (boolean).
+
+    .. describe:: router_solicitation_address(32)
+
+            Where to send router solicitation requests (RFC1256) (IPv4 address).
+
+    .. describe:: static_route(33)
+
+            List of network and router address pairs addresses.
+
+    .. describe:: trailer_encapsulation(34)
+
+            Whether to negotiate the use of trailers for ARP (RTF893) (boolean).
+
+    .. describe:: arp_cache_timeout(35)
+
+            The timeout in seconds for ARP cache entries (32-bit decimal value).
+
+    .. describe:: ethernet_encapsulation(36)
+
+            Whether to use IEEE 802.3 (RTF1042) rather than of v2 (RFC894) ethernet encapsulation (boolean).
+
+    .. describe:: tcp_default_ttl(37)
+
+            Default time-to-live for TCP sends (non-zero 8-bit decimal value).
+
+    .. describe:: tcp_keepalive_interval(38)
+
+            The interface in seconds between TCP keepalive messages (32-bit decimal value).
+
+    .. describe:: tcp_keepalive_garbage(39)
+
+            Whether to include a byte of garbage in TCP keepalive messages for backward compatibility (boolean).
+
+    .. describe:: nis_domain(40)
+
+            The NIS (Sun Network Information Services) domain name (string).
+
+    .. describe:: nis_servers(41)
+
+            Space separated list of IPv4 NIS server addresses.
+
+    .. describe:: ntp_servers(42)
+
+            Space separated list of IPv4 NTP (RFC1035) server addresses.
+
+    .. describe:: vendor_specific_info(43)
+
+            Vendor specific information. Only accessible using :py:attr:`DHCPOptionEncoding.hex_p` .
+
+    .. describe:: net_bios_name_servers(44)
+
+            Space separated list of IPv4 NetBIOS name server (NBNS) addresses (RFC1001,RFC1002).
+
+    .. describe:: net_bios_datagram_servers(45)
+
+            Space separated list of IPv4 NetBIOS datagram distribution server (NBDD) addresses (RFC1001,RFC1002).
+
+    .. describe:: net_bios_node_type(46)
+
+            NetBIOS node type (RFC1001,RFC1002): 1=B-node, 2=P-node, 4=M-node, and 8=H-node (8-bit decimal value).
+
+    .. describe:: net_bios_scope(47)
+
+            NetBIOS scope (RFC1001,RFC1002). Only accessible using :py:attr:`DHCPOptionEncoding.hex_p` .
+
+    .. describe:: x_windows_font_servers(48)
+
+            Space separated list of IPv4 X windows font server addresses.
+
+    .. describe:: x_windows_display_manager(49)
+
+            Space separated list of IPv4 X windows display manager addresses.
+
+    .. describe:: net_ware_ip_domain_name(62)
+
+            Netware IP domain name (RFC2242) (string).
+
+    .. describe:: net_ware_ip_information(63)
+
+            Netware IP information (RFC2242). Only accessible using :py:attr:`DHCPOptionEncoding.hex_p` .
+
+    .. describe:: nis_plus_domain(64)
+
+            The NIS+ domain name (string).
+
+    .. describe:: nis_plus_servers(65)
+
+            Space separated list of IPv4 NIS+ server addresses.
+
+    .. describe:: tftp_server_name(66)
+
+            TFTP server name (string).
+
+    .. describe:: bootfile_name(67)
+
+            Bootfile name (string).
+
+    .. describe:: mobile_ip_home_agents(68)
+
+            Space separated list of IPv4 mobile IP agent addresses.
+
+    .. describe:: smtp_servers(69)
+
+            Space separated list of IPv4 simple mail transport protocol (SMPT) server addresses.
+
+    .. describe:: pop3_servers(70)
+
+            Space separated list of IPv4 post office protocol 3 (POP3) server addresses.
+
+    .. describe:: nntp_servers(71)
+
+            Space separated list of IPv4 network news transport protocol (NTTP) server addresses.
+
+    .. describe:: www_servers(72)
+
+            Space separated list of default IPv4 world wide web (WWW) server addresses.
+
+    .. describe:: finger_servers(73)
+
+            Space separated list of default IPv4 finger server addresses.
+
+    .. describe:: irc_servers(74)
+
+            Space separated list of default IPv4 internet relay chat (IRC) server  addresses.
+
+    .. describe:: street_talk_servers(75)
+
+            Space separated list of IPv4 StreetTalk server addresses.
+
+    .. describe:: stda_servers(76)
+
+            Space separated list of IPv4 StreetTalk directory assistance (STDA) server addresses.
+
+    .. describe:: slp_directory_agent(78)
+
+            Addresses of one or more service location protocol (SLP) directory agent, and an indicator of whether their use is mandatory. Only accessible using :py:attr:`DHCPOptionEncoding.hex_p` .
+
+    .. describe:: slp_service_scope(79)
+
+            List of service scopes for the service location protocol (SLP) and whether using the list is mandator. Only accessible using :py:attr:`DHCPOptionEncoding.hex_p` .
+
+    .. describe:: domain_search(119)
+
+            Domain search list, see RFC3397 and section 4.1.4 in RFC1035 for encoding.  Only accessible using :py:attr:`DHCPOptionEncoding.hex_p` .
+
+    """
+
+    __uuid__ = "00f5b10f-0021-4513-00f7-5bf4000982bf"
+    _enums = [
+        (
+            "SubnetMask",
+            1,
+            """IPv4 netmask. Set to :py:func:`IDHCPServer.network_mask`  by default.""",
+        ),
+        ("TimeOffset", 2, """UTC offset in seconds (32-bit decimal value)."""),
+        ("Routers", 3, """Space separated list of IPv4 router addresses."""),
+        (
+            "TimeServers",
+            4,
+            """Space separated list of IPv4 time server (RFC 868) addresses.""",
+        ),
+        (
+            "NameServers",
+            5,
+            """Space separated list of IPv4 name server (IEN 116) addresses.""",
+        ),
+        ("DomainNameServers", 6, """Space separated list of IPv4 DNS addresses."""),
+        ("LogServers", 7, """Space separated list of IPv4 log server addresses."""),
+        (
+            "CookieServers",
+            8,
+            """Space separated list of IPv4 cookie server (RFC 865) addresses.""",
+        ),
+        (
+            "LPRServers",
+            9,
+            """Space separated list of IPv4 line printer server (RFC 1179) addresses.""",
+        ),
+        (
+            "ImpressServers",
+            10,
+            """Space separated list of IPv4 imagen impress server addresses.""",
+        ),
+        (
+            "ResourseLocationServers",
+            11,
+            """Space separated list of IPv4 resource location (RFC 887) addresses.""",
+        ),
+        ("HostName", 12, """The client name. See RFC 1035 for character limits."""),
+        (
+            "BootFileSize",
+            13,
+            """Number of 512 byte blocks making up the boot file (16-bit decimal value).""",
+        ),
+        ("MeritDumpFile", 14, """Client core file."""),
+        ("DomainName", 15, """Domain name for the client."""),
+        (
+            "SwapServer",
+            16,
+            """IPv4 address of the swap server that the client should use.""",
+        ),
+        ("RootPath", 17, """The path to the root disk the client should use."""),
+        (
+            "ExtensionPath",
+            18,
+            """Path to a file containing additional DHCP options (RFC2123).""",
+        ),
+        (
+            "IPForwarding",
+            19,
+            """Whether IP forwarding should be enabled by the client (boolean).""",
+        ),
+        (
+            "OptNonLocalSourceRouting",
+            20,
+            """Whether non-local datagrams should be forwarded by the client (boolean)""",
+        ),
+        (
+            "PolicyFilter",
+            21,
+            """List of IPv4 addresses and masks paris controlling non-local source routing.""",
+        ),
+        (
+            "MaxDgramReassemblySize",
+            22,
+            """The maximum datagram size the client should reassemble (16-bit decimal value).""",
+        ),
+        (
+            "DefaultIPTTL",
+            23,
+            """The default time-to-leave on outgoing (IP) datagrams (8-bit decimal value).""",
+        ),
+        (
+            "PathMTUAgingTimeout",
+            24,
+            """RFC1191 path MTU discovery timeout value in seconds (32-bit decimal value).""",
+        ),
+        (
+            "PathMTUPlateauTable",
+            25,
+            """RFC1191 path MTU discovery size table, sorted in ascending order (list of 16-bit decimal values).""",
+        ),
+        (
+            "InterfaceMTU",
+            26,
+            """The MTU size for the interface (16-bit decimal value).""",
+        ),
+        (
+            "AllSubnetsAreLocal",
+            27,
+            """Indicates whether the MTU size is the same for all subnets (boolean).""",
+        ),
+        (
+            "BroadcastAddress",
+            28,
+            """Broadcast address (RFC1122) for the client to use (IPv4 address).""",
+        ),
+        (
+            "PerformMaskDiscovery",
+            29,
+            """Whether to perform subnet mask discovery via ICMP (boolean).""",
+        ),
+        (
+            "MaskSupplier",
+            30,
+            """Whether to respond to subnet mask requests via ICMP (boolean).""",
+        ),
+        (
+            "PerformRouterDiscovery",
+            31,
+            """Whether to perform router discovery (RFC1256) (boolean).""",
+        ),
+        (
+            "RouterSolicitationAddress",
+            32,
+            """Where to send router solicitation requests (RFC1256) (IPv4 address).""",
+        ),
+        ("StaticRoute", 33, """List of network and router address pairs addresses."""),
+        (
+            "TrailerEncapsulation",
+            34,
+            """Whether to negotiate the use of trailers for ARP (RTF893) (boolean).""",
+        ),
+        (
+            "ARPCacheTimeout",
+            35,
+            """The timeout in seconds for ARP cache entries (32-bit decimal value).""",
+        ),
+        (
+            "EthernetEncapsulation",
+            36,
+            """Whether to use IEEE 802.3 (RTF1042) rather than of v2 (RFC894) ethernet encapsulation (boolean).""",
+        ),
+        (
+            "TCPDefaultTTL",
+            37,
+            """Default time-to-live for TCP sends (non-zero 8-bit decimal value).""",
+        ),
+        (
+            "TCPKeepaliveInterval",
+            38,
+            """The interface in seconds between TCP keepalive messages (32-bit decimal value).""",
+        ),
+        (
+            "TCPKeepaliveGarbage",
+            39,
+            """Whether to include a byte of garbage in TCP keepalive messages for backward compatibility (boolean).""",
+        ),
+        (
+            "NISDomain",
+            40,
+            """The NIS (Sun Network Information Services) domain name (string).""",
+        ),
+        ("NISServers", 41, """Space separated list of IPv4 NIS server addresses."""),
+        (
+            "NTPServers",
+            42,
+            """Space separated list of IPv4 NTP (RFC1035) server addresses.""",
+        ),
+        (
+            "VendorSpecificInfo",
+            43,
+            """Vendor specific information. Only accessible using :py:attr:`DHCPOptionEncoding.hex_p` .""",
+        ),
+        (
+            "NetBIOSNameServers",
+            44,
+            """Space separated list of IPv4 NetBIOS name server (NBNS) addresses (RFC1001,RFC1002).""",
+        ),
+        (
+            "NetBIOSDatagramServers",
+            45,
+            """Space separated list of IPv4 NetBIOS datagram distribution server (NBDD) addresses (RFC1001,RFC1002).""",
+        ),
+        (
+            "NetBIOSNodeType",
+            46,
+            """NetBIOS node type (RFC1001,RFC1002): 1=B-node, 2=P-node, 4=M-node, and 8=H-node (8-bit decimal value).""",
+        ),
+        (
+            "NetBIOSScope",
+            47,
+            """NetBIOS scope (RFC1001,RFC1002). Only accessible using :py:attr:`DHCPOptionEncoding.hex_p` .""",
+        ),
+        (
+            "XWindowsFontServers",
+            48,
+            """Space separated list of IPv4 X windows font server addresses.""",
+        ),
+        (
+            "XWindowsDisplayManager",
+            49,
+            """Space separated list of IPv4 X windows display manager addresses.""",
+        ),
+        ("NetWareIPDomainName", 62, """Netware IP domain name (RFC2242) (string)."""),
+        (
+            "NetWareIPInformation",
+            63,
+            """Netware IP information (RFC2242). Only accessible using :py:attr:`DHCPOptionEncoding.hex_p` .""",
+        ),
+        ("NISPlusDomain", 64, """The NIS+ domain name (string)."""),
+        (
+            "NISPlusServers",
+            65,
+            """Space separated list of IPv4 NIS+ server addresses.""",
+        ),
+        ("TFTPServerName", 66, """TFTP server name (string)."""),
+        ("BootfileName", 67, """Bootfile name (string)."""),
+        (
+            "MobileIPHomeAgents",
+            68,
+            """Space separated list of IPv4 mobile IP agent addresses.""",
+        ),
+        (
+            "SMTPServers",
+            69,
+            """Space separated list of IPv4 simple mail transport protocol (SMPT) server addresses.""",
+        ),
+        (
+            "POP3Servers",
+            70,
+            """Space separated list of IPv4 post office protocol 3 (POP3) server addresses.""",
+        ),
+        (
+            "NNTPServers",
+            71,
+            """Space separated list of IPv4 network news transport protocol (NTTP) server addresses.""",
+        ),
+        (
+            "WWWServers",
+            72,
+            """Space separated list of default IPv4 world wide web (WWW) server addresses.""",
+        ),
+        (
+            "FingerServers",
+            73,
+            """Space separated list of default IPv4 finger server addresses.""",
+        ),
+        (
+            "IRCServers",
+            74,
+            """Space separated list of default IPv4 internet relay chat (IRC) server  addresses.""",
+        ),
+        (
+            "StreetTalkServers",
+            75,
+            """Space separated list of IPv4 StreetTalk server addresses.""",
+        ),
+        (
+            "STDAServers",
+            76,
+            """Space separated list of IPv4 StreetTalk directory assistance (STDA) server addresses.""",
+        ),
+        (
+            "SLPDirectoryAgent",
+            78,
+            """Addresses of one or more service location protocol (SLP) directory agent, and an indicator of whether their use is mandatory. Only accessible using :py:attr:`DHCPOptionEncoding.hex_p` .""",
+        ),
+        (
+            "SLPServiceScope",
+            79,
+            """List of service scopes for the service location protocol (SLP) and whether using the list is mandator. Only accessible using :py:attr:`DHCPOptionEncoding.hex_p` .""",
+        ),
+        (
+            "DomainSearch",
+            119,
+            """Domain search list, see RFC3397 and section 4.1.4 in RFC1035 for encoding.  Only accessible using :py:attr:`DHCPOptionEncoding.hex_p` .""",
+        ),
+    ]
@@ -0,0 +1,44 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class DHCPOptionEncoding(Enum):
+    """Value format is specific to the option and generally user friendly.
+
+
+    .. describe:: normal(0)
+
+            Value format is specific to the option and generally user friendly.
+
+    .. describe:: hex_p(1)
+
+            Value format is a series of hex bytes (09314f3200fe), optionally colons
+            as byte separators (9:31:4f:32::fe).
+
+    """
+
+    __uuid__ = "84b6d460-2838-4682-c0d6-ef5b573ef28a"
+    _enums = [
+        (
+            "Normal",
+            0,
+            """Value format is specific to the option and generally user friendly.""",
+        ),
+        (
+            "Hex",
+            1,
+            """Value format is a series of hex bytes (09314f3200fe), optionally colons
+            as byte separators (9:31:4f:32::fe).""",
+        ),
+    ]
@@ -0,0 +1,39 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class DirectoryCopyFlag(Enum):
+    """Directory copying flags.
+    Not flags are implemented yet.
+
+
+    .. describe:: none(0)
+
+            No flag set.
+
+    .. describe:: copy_into_existing(1)
+
+            Allow copying into an existing destination directory.
+
+    """
+
+    __uuid__ = "b5901856-d064-4fbc-ab06-2909ba106154"
+    _enums = [
+        ("None", 0, """No flag set."""),
+        (
+            "CopyIntoExisting",
+            1,
+            """Allow copying into an existing destination directory.""",
+        ),
+    ]
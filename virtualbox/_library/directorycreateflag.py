@@ -0,0 +1,34 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class DirectoryCreateFlag(Enum):
+    """Directory creation flags.
+
+
+    .. describe:: none(0)
+
+            No flag set.
+
+    .. describe:: parents(1)
+
+            No error if existing, make parent directories as needed.
+
+    """
+
+    __uuid__ = "bd721b0e-ced5-4f79-b368-249897c32a36"
+    _enums = [
+        ("None", 0, """No flag set."""),
+        ("Parents", 1, """No error if existing, make parent directories as needed."""),
+    ]
@@ -0,0 +1,34 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class DirectoryOpenFlag(Enum):
+    """Directory open flags.
+
+
+    .. describe:: none(0)
+
+            No flag set.
+
+    .. describe:: no_symlinks(1)
+
+            Don't allow symbolic links as part of the path.
+
+    """
+
+    __uuid__ = "5138837a-8fd2-4194-a1b0-08f7bc3949d0"
+    _enums = [
+        ("None", 0, """No flag set."""),
+        ("NoSymlinks", 1, """Don't allow symbolic links as part of the path."""),
+    ]
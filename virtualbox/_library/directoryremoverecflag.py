@@ -0,0 +1,51 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class DirectoryRemoveRecFlag(Enum):
+    """Directory recursive removement flags.
+
+    WARNING!! THE FLAGS ARE CURRENTLY IGNORED. THE METHOD APPLIES
+    :py:attr:`DirectoryRemoveRecFlag.content_and_dir`  REGARDLESS
+    OF THE INPUT.
+
+
+    .. describe:: none(0)
+
+            No flag set.
+
+    .. describe:: content_and_dir(1)
+
+            Delete the content of the directory and the directory itself.
+
+    .. describe:: content_only(2)
+
+            Only delete the content of the directory, omit the directory it self.
+
+    """
+
+    __uuid__ = "455aabf0-7692-48f6-9061-f21579b65769"
+    _enums = [
+        ("None", 0, """No flag set."""),
+        (
+            "ContentAndDir",
+            1,
+            """Delete the content of the directory and the directory itself.""",
+        ),
+        (
+            "ContentOnly",
+            2,
+            """Only delete the content of the directory, omit the directory it self.""",
+        ),
+    ]
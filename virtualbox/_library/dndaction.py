@@ -0,0 +1,44 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class DnDAction(Enum):
+    """Possible actions of a drag'n drop operation.
+
+
+    .. describe:: ignore(0)
+
+            Do nothing.
+
+    .. describe:: copy(1)
+
+            Copy the item to the target.
+
+    .. describe:: move(2)
+
+            Move the item to the target.
+
+    .. describe:: link(3)
+
+            Link the item from within the target.
+
+    """
+
+    __uuid__ = "17609e74-778e-4d0e-8827-35f5230f287b"
+    _enums = [
+        ("Ignore", 0, """Do nothing."""),
+        ("Copy", 1, """Copy the item to the target."""),
+        ("Move", 2, """Move the item to the target."""),
+        ("Link", 3, """Link the item from within the target."""),
+    ]
@@ -0,0 +1,167 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import VBoxError
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class VBoxErrorObjectNotFound(VBoxError):
+    """Object corresponding to the supplied arguments does not exist."""
+
+    name = "VBOX_E_OBJECT_NOT_FOUND"
+    value = 0x80BB0001
+
+
+class VBoxErrorInvalidVmState(VBoxError):
+    """Current virtual machine state prevents the operation."""
+
+    name = "VBOX_E_INVALID_VM_STATE"
+    value = 0x80BB0002
+
+
+class VBoxErrorVmError(VBoxError):
+    """Virtual machine error occurred attempting the operation."""
+
+    name = "VBOX_E_VM_ERROR"
+    value = 0x80BB0003
+
+
+class VBoxErrorFileError(VBoxError):
+    """File not accessible or erroneous file contents."""
+
+    name = "VBOX_E_FILE_ERROR"
+    value = 0x80BB0004
+
+
+class VBoxErrorIprtError(VBoxError):
+    """Runtime subsystem error."""
+
+    name = "VBOX_E_IPRT_ERROR"
+    value = 0x80BB0005
+
+
+class VBoxErrorPdmError(VBoxError):
+    """Pluggable Device Manager error."""
+
+    name = "VBOX_E_PDM_ERROR"
+    value = 0x80BB0006
+
+
+class VBoxErrorInvalidObjectState(VBoxError):
+    """Current object state prohibits operation."""
+
+    name = "VBOX_E_INVALID_OBJECT_STATE"
+    value = 0x80BB0007
+
+
+class VBoxErrorHostError(VBoxError):
+    """Host operating system related error."""
+
+    name = "VBOX_E_HOST_ERROR"
+    value = 0x80BB0008
+
+
+class VBoxErrorNotSupported(VBoxError):
+    """Requested operation is not supported."""
+
+    name = "VBOX_E_NOT_SUPPORTED"
+    value = 0x80BB0009
+
+
+class VBoxErrorXmlError(VBoxError):
+    """Invalid XML found."""
+
+    name = "VBOX_E_XML_ERROR"
+    value = 0x80BB000A
+
+
+class VBoxErrorInvalidSessionState(VBoxError):
+    """Current session state prohibits operation."""
+
+    name = "VBOX_E_INVALID_SESSION_STATE"
+    value = 0x80BB000B
+
+
+class VBoxErrorObjectInUse(VBoxError):
+    """Object being in use prohibits operation."""
+
+    name = "VBOX_E_OBJECT_IN_USE"
+    value = 0x80BB000C
+
+
+class VBoxErrorPasswordIncorrect(VBoxError):
+    """A provided password was incorrect."""
+
+    name = "VBOX_E_PASSWORD_INCORRECT"
+    value = 0x80BB000D
+
+
+class VBoxErrorMaximumReached(VBoxError):
+    """A maximum has been reached."""
+
+    name = "VBOX_E_MAXIMUM_REACHED"
+    value = 0x80BB000E
+
+
+class VBoxErrorGstctlGuestError(VBoxError):
+    """Guest Control reported an error from the guest side."""
+
+    name = "VBOX_E_GSTCTL_GUEST_ERROR"
+    value = 0x80BB000F
+
+
+class VBoxErrorTimeout(VBoxError):
+    """The operation ran into an explicitly requested timeout."""
+
+    name = "VBOX_E_TIMEOUT"
+    value = 0x80BB0010
+
+
+class OleErrorFail(VBoxError):
+    """Unspecified error"""
+
+    name = "E_FAIL"
+    value = 0x80004005
+
+
+class OleErrorNointerface(VBoxError):
+    """No such interface supported"""
+
+    name = "E_NOINTERFACE"
+    value = 0x80004002
+
+
+class OleErrorAccessdenied(VBoxError):
+    """General access denied error"""
+
+    name = "E_ACCESSDENIED"
+    value = 0x80070005
+
+
+class OleErrorNotimpl(VBoxError):
+    """Not implemented"""
+
+    name = "E_NOTIMPL"
+    value = 0x80004001
+
+
+class OleErrorUnexpected(VBoxError):
+    """Catastrophic failure"""
+
+    name = "E_UNEXPECTED"
+    value = 0x8000FFFF
+
+
+class OleErrorInvalidarg(VBoxError):
+    """One or more arguments are invalid"""
+
+    name = "E_INVALIDARG"
+    value = 0x80070057
@@ -0,0 +1,76 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class ExportOptions(Enum):
+    """Export options, used with :py:func:`IAppliance.write` .
+
+
+    .. describe:: create_manifest(1)
+
+            Write the optional manifest file (.mf) which is used for integrity
+            checks prior import.
+
+    .. describe:: export_dvd_images(2)
+
+            Export DVD images. Default is not to export them as it is rarely
+            needed for typical VMs.
+
+    .. describe:: strip_all_ma_cs(3)
+
+            Do not export any MAC address information. Default is to keep them
+            to avoid losing information which can cause trouble after import, at the
+            price of risking duplicate MAC addresses, if the import options are used
+            to keep them.
+
+    .. describe:: strip_all_non_natma_cs(4)
+
+            Do not export any MAC address information, except for adapters
+            using NAT. Default is to keep them to avoid losing information which can
+            cause trouble after import, at the price of risking duplicate MAC
+            addresses, if the import options are used to keep them.
+
+    """
+
+    __uuid__ = "8f45eb08-fd34-41ee-af95-a880bdee5554"
+    _enums = [
+        (
+            "CreateManifest",
+            1,
+            """Write the optional manifest file (.mf) which is used for integrity
+            checks prior import.""",
+        ),
+        (
+            "ExportDVDImages",
+            2,
+            """Export DVD images. Default is not to export them as it is rarely
+            needed for typical VMs.""",
+        ),
+        (
+            "StripAllMACs",
+            3,
+            """Do not export any MAC address information. Default is to keep them
+            to avoid losing information which can cause trouble after import, at the
+            price of risking duplicate MAC addresses, if the import options are used
+            to keep them.""",
+        ),
+        (
+            "StripAllNonNATMACs",
+            4,
+            """Do not export any MAC address information, except for adapters
+            using NAT. Default is to keep them to avoid losing information which can
+            cause trouble after import, at the price of risking duplicate MAC
+            addresses, if the import options are used to keep them.""",
+        ),
+    ]
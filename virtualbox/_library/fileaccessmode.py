@@ -0,0 +1,66 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class FileAccessMode(Enum):
+    """File open access mode for use with :py:func:`IGuestSession.file_open`
+    and :py:func:`IGuestSession.file_open_ex` .
+
+
+    .. describe:: read_only(1)
+
+            Open the file only with read access.
+
+    .. describe:: write_only(2)
+
+            Open the file only with write access.
+
+    .. describe:: read_write(3)
+
+            Open the file with both read and write access.
+
+    .. describe:: append_only(4)
+
+            Open the file for appending only, no read or seek access.
+            Not yet implemented.
+
+    .. describe:: append_read(5)
+
+            Open the file for appending and read.  Writes always goes to the
+            end of the file while reads are done at the current or specified file
+            position.
+            Not yet implemented.
+
+    """
+
+    __uuid__ = "231a578f-47fb-ea30-3b3e-8489558227f0"
+    _enums = [
+        ("ReadOnly", 1, """Open the file only with read access."""),
+        ("WriteOnly", 2, """Open the file only with write access."""),
+        ("ReadWrite", 3, """Open the file with both read and write access."""),
+        (
+            "AppendOnly",
+            4,
+            """Open the file for appending only, no read or seek access.
+            Not yet implemented.""",
+        ),
+        (
+            "AppendRead",
+            5,
+            """Open the file for appending and read.  Writes always goes to the
+            end of the file while reads are done at the current or specified file
+            position.
+            Not yet implemented.""",
+        ),
+    ]
@@ -0,0 +1,65 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class FileCopyFlag(Enum):
+    """File copying flags.
+    Not flags are implemented yet.
+
+
+    .. describe:: none(0)
+
+            No flag set.
+
+    .. describe:: no_replace(1)
+
+            Do not replace the destination file if it exists.
+            This flag is not implemented yet.
+
+    .. describe:: follow_links(2)
+
+            Follow symbolic links.
+            This flag is not implemented yet.
+
+    .. describe:: update(4)
+
+            Only copy when the source file is newer than the destination file
+            or when the destination file is missing.
+            This flag is not implemented yet.
+
+    """
+
+    __uuid__ = "791909d7-4c64-2fa4-4303-adb10658d347"
+    _enums = [
+        ("None", 0, """No flag set."""),
+        (
+            "NoReplace",
+            1,
+            """Do not replace the destination file if it exists.
+            This flag is not implemented yet.""",
+        ),
+        (
+            "FollowLinks",
+            2,
+            """Follow symbolic links.
+            This flag is not implemented yet.""",
+        ),
+        (
+            "Update",
+            4,
+            """Only copy when the source file is newer than the destination file
+            or when the destination file is missing.
+            This flag is not implemented yet.""",
+        ),
+    ]
@@ -0,0 +1,99 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class FileOpenAction(Enum):
+    """What action :py:func:`IGuestSession.file_open`  and :py:func:`IGuestSession.file_open_ex`
+    should take whether the file being opened exists or not.
+
+
+    .. describe:: open_existing(1)
+
+            Opens an existing file, fails if no file exists. (Was "oe".)
+
+    .. describe:: open_or_create(2)
+
+            Opens an existing file, creates a new one if no file exists. (Was "oc".)
+
+    .. describe:: create_new(3)
+
+            Creates a new file is no file exists, fails if there is a file there already. (Was "ce".)
+
+    .. describe:: create_or_replace(4)
+
+            Creates a new file, replace any existing file. (Was "ca".)
+
+            Currently undefined whether we will inherit mode and ACLs from the
+            existing file or replace them.
+
+    .. describe:: open_existing_truncated(5)
+
+            Opens and truncate an existing file, fails if no file exists. (Was "ot".)
+
+    .. describe:: append_or_create(99)
+
+            Opens an existing file and places the file pointer at the end of
+            the file, creates the file if it does not exist.  This action implies
+            write access. (Was "oa".)
+
+            <!-- @todo r=bird: See iprt/file.h, RTFILE_O_APPEND - not an action/disposition!
+            Moving the file pointer to the end, is almost fine, but implying 'write' access
+            isn't. That is something that is exclusively reserved for the opening mode. -->
+            Deprecated. Only here for historical reasons. Do not use!
+
+    """
+
+    __uuid__ = "12bc97e2-4fc6-a8b4-4f84-0cbf4ab970d2"
+    _enums = [
+        (
+            "OpenExisting",
+            1,
+            """Opens an existing file, fails if no file exists. (Was "oe".)""",
+        ),
+        (
+            "OpenOrCreate",
+            2,
+            """Opens an existing file, creates a new one if no file exists. (Was "oc".)""",
+        ),
+        (
+            "CreateNew",
+            3,
+            """Creates a new file is no file exists, fails if there is a file there already. (Was "ce".)""",
+        ),
+        (
+            "CreateOrReplace",
+            4,
+            """Creates a new file, replace any existing file. (Was "ca".)
+            
+            Currently undefined whether we will inherit mode and ACLs from the
+            existing file or replace them.""",
+        ),
+        (
+            "OpenExistingTruncated",
+            5,
+            """Opens and truncate an existing file, fails if no file exists. (Was "ot".)""",
+        ),
+        (
+            "AppendOrCreate",
+            99,
+            """Opens an existing file and places the file pointer at the end of
+            the file, creates the file if it does not exist.  This action implies
+            write access. (Was "oa".)
+            
+            <!-- @todo r=bird: See iprt/file.h, RTFILE_O_APPEND - not an action/disposition!
+            Moving the file pointer to the end, is almost fine, but implying 'write' access
+            isn't. That is something that is exclusively reserved for the opening mode. -->
+            Deprecated. Only here for historical reasons. Do not use!""",
+        ),
+    ]
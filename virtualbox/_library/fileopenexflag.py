@@ -0,0 +1,29 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class FileOpenExFlag(Enum):
+    """Open flags for :py:func:`IGuestSession.file_open_ex` .
+
+
+    .. describe:: none(0)
+
+            No flag set.
+
+    """
+
+    __uuid__ = "4671abd4-f70c-42aa-8542-6c169cb87a5c"
+    _enums = [
+        ("None", 0, """No flag set."""),
+    ]
@@ -0,0 +1,45 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class FileSeekOrigin(Enum):
+    """What a file seek (:py:func:`IFile.seek` ) is relative to.
+
+
+    .. describe:: begin(0)
+
+            Seek from the beginning of the file.
+
+    .. describe:: current(1)
+
+            Seek from the current file position.
+
+    .. describe:: end(2)
+
+            Seek relative to the end of the file.  To seek to the position two
+            bytes from the end of the file, specify -2 as the seek offset.
+
+    """
+
+    __uuid__ = "ad32f789-4279-4530-979c-f16892e1c263"
+    _enums = [
+        ("Begin", 0, """Seek from the beginning of the file."""),
+        ("Current", 1, """Seek from the current file position."""),
+        (
+            "End",
+            2,
+            """Seek relative to the end of the file.  To seek to the position two
+            bytes from the end of the file, specify -2 as the seek offset.""",
+        ),
+    ]
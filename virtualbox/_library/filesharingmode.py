@@ -0,0 +1,71 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class FileSharingMode(Enum):
+    """File sharing mode for :py:func:`IGuestSession.file_open_ex` .
+
+
+    .. describe:: read(1)
+
+            Only share read access to the file.
+
+    .. describe:: write(2)
+
+            Only share write access to the file.
+
+    .. describe:: read_write(3)
+
+            Share both read and write access to the file, but deny deletion.
+
+    .. describe:: delete(4)
+
+            Only share delete access, denying read and write.
+
+    .. describe:: read_delete(5)
+
+            Share read and delete access to the file, denying writing.
+
+    .. describe:: write_delete(6)
+
+            Share write and delete access to the file, denying reading.
+
+    .. describe:: all_p(7)
+
+            Share all access, i.e. read, write and delete, to the file.
+
+    """
+
+    __uuid__ = "f87dfe58-425b-c5ba-7d6d-22adeea25de1"
+    _enums = [
+        ("Read", 1, """Only share read access to the file."""),
+        ("Write", 2, """Only share write access to the file."""),
+        (
+            "ReadWrite",
+            3,
+            """Share both read and write access to the file, but deny deletion.""",
+        ),
+        ("Delete", 4, """Only share delete access, denying read and write."""),
+        (
+            "ReadDelete",
+            5,
+            """Share read and delete access to the file, denying writing.""",
+        ),
+        (
+            "WriteDelete",
+            6,
+            """Share write and delete access to the file, denying reading.""",
+        ),
+        ("All", 7, """Share all access, i.e. read, write and delete, to the file."""),
+    ]
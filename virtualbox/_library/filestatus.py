@@ -0,0 +1,59 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class FileStatus(Enum):
+    """File statuses.
+
+
+    .. describe:: undefined(0)
+
+            File is in an undefined state.
+
+    .. describe:: opening(10)
+
+            Guest file is opening.
+
+    .. describe:: open_p(100)
+
+            Guest file has been successfully opened.
+
+    .. describe:: closing(150)
+
+            Guest file closing.
+
+    .. describe:: closed(200)
+
+            Guest file has been closed.
+
+    .. describe:: down(600)
+
+            Service/OS is stopping, guest file was closed.
+
+    .. describe:: error(800)
+
+            Something went wrong.
+
+    """
+
+    __uuid__ = "8c86468b-b97b-4080-8914-e29f5b0abd2c"
+    _enums = [
+        ("Undefined", 0, """File is in an undefined state."""),
+        ("Opening", 10, """Guest file is opening."""),
+        ("Open", 100, """Guest file has been successfully opened."""),
+        ("Closing", 150, """Guest file closing."""),
+        ("Closed", 200, """Guest file has been closed."""),
+        ("Down", 600, """Service/OS is stopping, guest file was closed."""),
+        ("Error", 800, """Something went wrong."""),
+    ]
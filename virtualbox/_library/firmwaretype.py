@@ -0,0 +1,49 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class FirmwareType(Enum):
+    """Firmware type.
+
+
+    .. describe:: bios(1)
+
+            BIOS Firmware.
+
+    .. describe:: efi(2)
+
+            EFI Firmware, bitness detected basing on OS type.
+
+    .. describe:: efi32(3)
+
+            EFI firmware, 32-bit.
+
+    .. describe:: efi64(4)
+
+            EFI firmware, 64-bit.
+
+    .. describe:: efidual(5)
+
+            EFI firmware, combined 32 and 64-bit.
+
+    """
+
+    __uuid__ = "b903f264-c230-483e-ac74-2b37ce60d371"
+    _enums = [
+        ("BIOS", 1, """BIOS Firmware."""),
+        ("EFI", 2, """EFI Firmware, bitness detected basing on OS type."""),
+        ("EFI32", 3, """EFI firmware, 32-bit."""),
+        ("EFI64", 4, """EFI firmware, 64-bit."""),
+        ("EFIDUAL", 5, """EFI firmware, combined 32 and 64-bit."""),
+    ]
@@ -0,0 +1,44 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class FormValueType(Enum):
+    """
+
+
+    .. describe:: boolean(0)
+
+
+
+    .. describe:: string(1)
+
+
+
+    .. describe:: choice(2)
+
+
+
+    .. describe:: ranged_integer(3)
+
+
+
+    """
+
+    __uuid__ = "43d794a0-7c98-11e9-a346-a36d5fa858a5"
+    _enums = [
+        ("Boolean", 0, """"""),
+        ("String", 1, """"""),
+        ("Choice", 2, """"""),
+        ("RangedInteger", 3, """"""),
+    ]
@@ -0,0 +1,79 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class FramebufferCapabilities(Enum):
+    """Framebuffer capability flags.
+
+
+    .. describe:: update_image(1)
+
+            Requires NotifyUpdateImage. NotifyUpdate must not be called.
+
+    .. describe:: vhwa(2)
+
+            Supports VHWA interface. If set, then
+            IFramebuffer::processVHWACommand can be called. <!-- no link, otherwise trouble with javadoc -->
+
+    .. describe:: visible_region(4)
+
+            Supports visible region. If set, then
+            IFramebuffer::setVisibleRegion can be called. <!-- no link, otherwise trouble with javadoc -->
+
+    .. describe:: render_cursor(8)
+
+            This framebuffer implementation can render a pointer cursor itself.  Unless the
+            MoveCursor capability is also set the cursor will always be rendered at the
+            location of (and usually using) the host pointer.
+
+    .. describe:: move_cursor(16)
+
+            Supports rendering a pointer cursor anywhere within the guest screen.  Implies
+            RenderCursor.
+
+    """
+
+    __uuid__ = "cc395839-30fa-4ca5-ae65-e6360e3edd7a"
+    _enums = [
+        (
+            "UpdateImage",
+            1,
+            """Requires NotifyUpdateImage. NotifyUpdate must not be called.""",
+        ),
+        (
+            "VHWA",
+            2,
+            """Supports VHWA interface. If set, then
+            IFramebuffer::processVHWACommand can be called. <!-- no link, otherwise trouble with javadoc -->""",
+        ),
+        (
+            "VisibleRegion",
+            4,
+            """Supports visible region. If set, then
+            IFramebuffer::setVisibleRegion can be called. <!-- no link, otherwise trouble with javadoc -->""",
+        ),
+        (
+            "RenderCursor",
+            8,
+            """This framebuffer implementation can render a pointer cursor itself.  Unless the
+            MoveCursor capability is also set the cursor will always be rendered at the
+            location of (and usually using) the host pointer.""",
+        ),
+        (
+            "MoveCursor",
+            16,
+            """Supports rendering a pointer cursor anywhere within the guest screen.  Implies
+            RenderCursor.""",
+        ),
+    ]
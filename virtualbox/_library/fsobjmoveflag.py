@@ -0,0 +1,64 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class FsObjMoveFlag(Enum):
+    """File moving flags.
+
+
+    .. describe:: none(0)
+
+            No flag set.
+
+    .. describe:: replace(1)
+
+            Replace the destination file, symlink, etc if it exists, however this
+            does not allow replacing any directories.
+
+    .. describe:: follow_links(2)
+
+            Follow symbolic links in the final components or not (only applied to
+            the given source and target paths, not to anything else).
+
+    .. describe:: allow_directory_moves(4)
+
+            Allow moving directories accross file system boundraries. Because it
+            is could be a big undertaking, we require extra assurance that we
+            should do it when requested.
+
+    """
+
+    __uuid__ = "2450a05d-80c6-4c96-9a17-94d73293ff86"
+    _enums = [
+        ("None", 0, """No flag set."""),
+        (
+            "Replace",
+            1,
+            """Replace the destination file, symlink, etc if it exists, however this
+            does not allow replacing any directories.""",
+        ),
+        (
+            "FollowLinks",
+            2,
+            """Follow symbolic links in the final components or not (only applied to
+            the given source and target paths, not to anything else).""",
+        ),
+        (
+            "AllowDirectoryMoves",
+            4,
+            """Allow moving directories accross file system boundraries. Because it
+            is could be a big undertaking, we require extra assurance that we
+            should do it when requested.""",
+        ),
+    ]
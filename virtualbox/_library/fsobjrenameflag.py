@@ -0,0 +1,41 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class FsObjRenameFlag(Enum):
+    """Flags for use when renaming file system objects (files, directories,
+    symlink, etc), see :py:func:`IGuestSession.fs_obj_rename` .
+
+
+    .. describe:: no_replace(0)
+
+            Do not replace any destination object.
+
+    .. describe:: replace(1)
+
+            This will attempt to replace any destination object other except
+            directories. (The default is to fail if the destination exists.)
+
+    """
+
+    __uuid__ = "59bbf3a1-4e23-d7cf-05d5-ccae32080ed2"
+    _enums = [
+        ("NoReplace", 0, """Do not replace any destination object."""),
+        (
+            "Replace",
+            1,
+            """This will attempt to replace any destination object other except
+            directories. (The default is to fail if the destination exists.)""",
+        ),
+    ]
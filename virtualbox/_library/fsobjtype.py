@@ -0,0 +1,81 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class FsObjType(Enum):
+    """File system object (file) types.
+
+
+    .. describe:: unknown(1)
+
+            Used either if the object has type that is not in this enum, or
+            if the type has not yet been determined or set.
+
+    .. describe:: fifo(2)
+
+            FIFO or named pipe, depending on the platform/terminology.
+
+    .. describe:: dev_char(3)
+
+            Character device.
+
+    .. describe:: directory(4)
+
+            Directory.
+
+    .. describe:: dev_block(5)
+
+            Block device.
+
+    .. describe:: file_p(6)
+
+            Regular file.
+
+    .. describe:: symlink(7)
+
+            Symbolic link.
+
+    .. describe:: socket(8)
+
+            Socket.
+
+    .. describe:: white_out(9)
+
+            A white-out file.  Found in union mounts where it is used for
+            hiding files after deletion, I think.
+
+    """
+
+    __uuid__ = "34a0d1aa-491e-e209-e150-84964d6cee5f"
+    _enums = [
+        (
+            "Unknown",
+            1,
+            """Used either if the object has type that is not in this enum, or
+            if the type has not yet been determined or set.""",
+        ),
+        ("Fifo", 2, """FIFO or named pipe, depending on the platform/terminology."""),
+        ("DevChar", 3, """Character device."""),
+        ("Directory", 4, """Directory."""),
+        ("DevBlock", 5, """Block device."""),
+        ("File", 6, """Regular file."""),
+        ("Symlink", 7, """Symbolic link."""),
+        ("Socket", 8, """Socket."""),
+        (
+            "WhiteOut",
+            9,
+            """A white-out file.  Found in union mounts where it is used for
+            hiding files after deletion, I think.""",
+        ),
+    ]
@@ -0,0 +1,44 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class GraphicsControllerType(Enum):
+    """Graphics controller type, used with :py:func:`IGraphicsAdapter.graphics_controller_type` .
+
+
+    .. describe:: null(0)
+
+            Reserved value, invalid.
+
+    .. describe:: v_box_vga(1)
+
+            VirtualBox VGA device.
+
+    .. describe:: vmsvga(2)
+
+            VMware SVGA II device.
+
+    .. describe:: v_box_svga(3)
+
+            VirtualBox VGA device with VMware SVGA II extensions.
+
+    """
+
+    __uuid__ = "3e009bb0-2b57-4283-a39b-4c363d4f0808"
+    _enums = [
+        ("Null", 0, """Reserved value, invalid."""),
+        ("VBoxVGA", 1, """VirtualBox VGA device."""),
+        ("VMSVGA", 2, """VMware SVGA II device."""),
+        ("VBoxSVGA", 3, """VirtualBox VGA device with VMware SVGA II extensions."""),
+    ]
@@ -0,0 +1,39 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class GuestMonitorChangedEventType(Enum):
+    """How the guest monitor has been changed.
+
+
+    .. describe:: enabled(0)
+
+            The guest monitor has been enabled by the guest.
+
+    .. describe:: disabled(1)
+
+            The guest monitor has been disabled by the guest.
+
+    .. describe:: new_origin(2)
+
+            The guest monitor origin has changed in the guest.
+
+    """
+
+    __uuid__ = "ef172985-7e36-4297-95be-e46396968d66"
+    _enums = [
+        ("Enabled", 0, """The guest monitor has been enabled by the guest."""),
+        ("Disabled", 1, """The guest monitor has been disabled by the guest."""),
+        ("NewOrigin", 2, """The guest monitor origin has changed in the guest."""),
+    ]
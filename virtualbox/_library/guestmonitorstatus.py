@@ -0,0 +1,43 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class GuestMonitorStatus(Enum):
+    """The current status of the guest display.
+
+
+    .. describe:: disabled(0)
+
+            The guest monitor is disabled in the guest.
+
+    .. describe:: enabled(1)
+
+            The guest monitor is enabled in the guest.
+
+    .. describe:: blank(2)
+
+            The guest monitor is enabled in the guest but should display nothing.
+
+    """
+
+    __uuid__ = "6b8d3f71-39cb-459e-a916-48917ed43e19"
+    _enums = [
+        ("Disabled", 0, """The guest monitor is disabled in the guest."""),
+        ("Enabled", 1, """The guest monitor is enabled in the guest."""),
+        (
+            "Blank",
+            2,
+            """The guest monitor is enabled in the guest but should display nothing.""",
+        ),
+    ]
@@ -0,0 +1,39 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class GuestMouseEventMode(Enum):
+    """The mode (relative, absolute, multi-touch) of a pointer event.
+
+    @todo A clear pattern seems to be emerging that we should usually have
+    multiple input devices active for different types of reporting, so we
+    should really have different event types for relative (including wheel),
+    absolute (not including wheel) and multi-touch events.
+
+
+    .. describe:: relative(0)
+
+            Relative event.
+
+    .. describe:: absolute(1)
+
+            Absolute event.
+
+    """
+
+    __uuid__ = "4b500146-ebba-4b7c-bc29-69c2d57a5caf"
+    _enums = [
+        ("Relative", 0, """Relative event."""),
+        ("Absolute", 1, """Absolute event."""),
+    ]
@@ -0,0 +1,74 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class GuestSessionStatus(Enum):
+    """Guest session status. This enumeration represents possible values of
+    the :py:func:`IGuestSession.status`  attribute.
+
+
+    .. describe:: undefined(0)
+
+            Guest session is in an undefined state.
+
+    .. describe:: starting(10)
+
+            Guest session is being started.
+
+    .. describe:: started(100)
+
+            Guest session has been started.
+
+    .. describe:: terminating(480)
+
+            Guest session is being terminated.
+
+    .. describe:: terminated(500)
+
+            Guest session terminated normally.
+
+    .. describe:: timed_out_killed(512)
+
+            Guest session timed out and was killed.
+
+    .. describe:: timed_out_abnormally(513)
+
+            Guest session timed out and was not killed successfully.
+
+    .. describe:: down(600)
+
+            Service/OS is stopping, guest session was killed.
+
+    .. describe:: error(800)
+
+            Something went wrong.
+
+    """
+
+    __uuid__ = "ac2669da-4624-44f2-85b5-0b0bfb8d8673"
+    _enums = [
+        ("Undefined", 0, """Guest session is in an undefined state."""),
+        ("Starting", 10, """Guest session is being started."""),
+        ("Started", 100, """Guest session has been started."""),
+        ("Terminating", 480, """Guest session is being terminated."""),
+        ("Terminated", 500, """Guest session terminated normally."""),
+        ("TimedOutKilled", 512, """Guest session timed out and was killed."""),
+        (
+            "TimedOutAbnormally",
+            513,
+            """Guest session timed out and was not killed successfully.""",
+        ),
+        ("Down", 600, """Service/OS is stopping, guest session was killed."""),
+        ("Error", 800, """Something went wrong."""),
+    ]
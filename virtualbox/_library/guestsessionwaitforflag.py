@@ -0,0 +1,44 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class GuestSessionWaitForFlag(Enum):
+    """Guest session waiting flags.
+
+
+    .. describe:: none(0)
+
+            No waiting flags specified. Do not use this.
+
+    .. describe:: start(1)
+
+            Wait for the guest session being started.
+
+    .. describe:: terminate(2)
+
+            Wait for the guest session being terminated.
+
+    .. describe:: status(4)
+
+            Wait for the next guest session status change.
+
+    """
+
+    __uuid__ = "bb7a372a-f635-4e11-a81a-e707f3a52ef5"
+    _enums = [
+        ("None", 0, """No waiting flags specified. Do not use this."""),
+        ("Start", 1, """Wait for the guest session being started."""),
+        ("Terminate", 2, """Wait for the guest session being terminated."""),
+        ("Status", 4, """Wait for the next guest session status change."""),
+    ]
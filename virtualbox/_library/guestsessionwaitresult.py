@@ -0,0 +1,85 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class GuestSessionWaitResult(Enum):
+    """Guest session waiting results. Depending on the session waiting flags (for
+    more information see :py:class:`GuestSessionWaitForFlag` ) the waiting result
+    can vary based on the session's current status.
+
+    To wait for a guest session to terminate after it has been
+    created by :py:func:`IGuest.create_session`  one would specify
+    GuestSessionWaitResult_Terminate.
+
+
+    .. describe:: none(0)
+
+            No result was returned. Not being used.
+
+    .. describe:: start(1)
+
+            The guest session has been started.
+
+    .. describe:: terminate(2)
+
+            The guest session has been terminated.
+
+    .. describe:: status(3)
+
+            The guest session has changed its status. The status then can
+            be retrieved via :py:func:`IGuestSession.status` .
+
+    .. describe:: error(4)
+
+            Error while executing the process.
+
+    .. describe:: timeout(5)
+
+            The waiting operation timed out. This also will happen
+            when no event has been occurred matching the
+            current waiting flags in a :py:func:`IGuestSession.wait_for`  call.
+
+    .. describe:: wait_flag_not_supported(6)
+
+            A waiting flag specified in the :py:func:`IGuestSession.wait_for`  call
+            is not supported by the guest.
+
+    """
+
+    __uuid__ = "c0f6a8a5-fdb6-42bf-a582-56c6f82bcd2d"
+    _enums = [
+        ("None", 0, """No result was returned. Not being used."""),
+        ("Start", 1, """The guest session has been started."""),
+        ("Terminate", 2, """The guest session has been terminated."""),
+        (
+            "Status",
+            3,
+            """The guest session has changed its status. The status then can
+            be retrieved via :py:func:`IGuestSession.status` .""",
+        ),
+        ("Error", 4, """Error while executing the process."""),
+        (
+            "Timeout",
+            5,
+            """The waiting operation timed out. This also will happen
+            when no event has been occurred matching the
+            current waiting flags in a :py:func:`IGuestSession.wait_for`  call.""",
+        ),
+        (
+            "WaitFlagNotSupported",
+            6,
+            """A waiting flag specified in the :py:func:`IGuestSession.wait_for`  call
+            is not supported by the guest.""",
+        ),
+    ]
@@ -0,0 +1,52 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class GuestShutdownFlag(Enum):
+    """Guest shutdown flags.
+
+
+    .. describe:: none(0)
+
+            No flag set.
+
+    .. describe:: power_off(1)
+
+            Performs a reboot after shutdown.
+
+    .. describe:: reboot(2)
+
+            Performs a reboot after shutdown.
+
+    .. describe:: force(4)
+
+            Force the system to shutdown/reboot regardless of objecting
+            application or other stuff. This flag might not be realized on
+            all systems.
+
+    """
+
+    __uuid__ = "28D19C9C-5862-4930-B29A-F117712B4864"
+    _enums = [
+        ("None", 0, """No flag set."""),
+        ("PowerOff", 1, """Performs a reboot after shutdown."""),
+        ("Reboot", 2, """Performs a reboot after shutdown."""),
+        (
+            "Force",
+            4,
+            """Force the system to shutdown/reboot regardless of objecting
+            application or other stuff. This flag might not be realized on
+            all systems.""",
+        ),
+    ]
@@ -0,0 +1,236 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class GuestUserState(Enum):
+    """State a guest user has been changed to.
+
+
+    .. describe:: unknown(0)
+
+            Unknown state. Not being used.
+
+    .. describe:: logged_in(1)
+
+            A guest user has been successfully logged into
+            the guest OS.
+            This property is not implemented yet!
+
+    .. describe:: logged_out(2)
+
+            A guest user has been successfully logged out
+            of the guest OS.
+            This property is not implemented yet!
+
+    .. describe:: locked(3)
+
+            A guest user has locked its account. This might
+            include running a password-protected screensaver
+            in the guest.
+            This property is not implemented yet!
+
+    .. describe:: unlocked(4)
+
+            A guest user has unlocked its account.
+            This property is not implemented yet!
+
+    .. describe:: disabled(5)
+
+            A guest user has been disabled by the guest OS.
+            This property is not implemented yet!
+
+    .. describe:: idle(6)
+
+            A guest user currently is not using the guest OS.
+            Currently only available for Windows guests since
+            Windows 2000 SP2.
+            On Windows guests this function currently only supports
+            reporting contiguous idle times up to 49.7 days per user.
+            The event will be triggered if a guest user is not active for
+            at least 5 seconds. This threshold can be adjusted by either altering
+            VBoxService's command line in the guest to
+            --vminfo-user-idle-threshold
+            , or by setting the per-VM guest property
+            /VirtualBox/GuestAdd/VBoxService/--vminfo-user-idle-threshold
+            with the RDONLYGUEST flag on the host. In both cases VBoxService needs
+            to be restarted in order to get the changes applied.
+
+    .. describe:: in_use(7)
+
+            A guest user continued using the guest OS after
+            being idle.
+
+    .. describe:: created(8)
+
+            A guest user has been successfully created.
+            This property is not implemented yet!
+
+    .. describe:: deleted(9)
+
+            A guest user has been successfully deleted.
+            This property is not implemented yet!
+
+    .. describe:: session_changed(10)
+
+            To guest OS has changed the session of a user.
+            This property is not implemented yet!
+
+    .. describe:: credentials_changed(11)
+
+            To guest OS has changed the authentication
+            credentials of a user. This might include changed passwords
+            and authentication types.
+            This property is not implemented yet!
+
+    .. describe:: role_changed(12)
+
+            To guest OS has changed the role of a user permanently,
+            e.g. granting / denying administrative rights.
+            This property is not implemented yet!
+
+    .. describe:: group_added(13)
+
+            To guest OS has added a user to a specific
+            user group.
+            This property is not implemented yet!
+
+    .. describe:: group_removed(14)
+
+            To guest OS has removed a user from a specific
+            user group.
+            This property is not implemented yet!
+
+    .. describe:: elevated(15)
+
+            To guest OS temporarily has elevated a user
+            to perform a certain task.
+            This property is not implemented yet!
+
+    """
+
+    __uuid__ = "b2a82b02-fd3d-4fc2-ba84-6ba5ac8be198"
+    _enums = [
+        ("Unknown", 0, """Unknown state. Not being used."""),
+        (
+            "LoggedIn",
+            1,
+            """A guest user has been successfully logged into
+            the guest OS.
+            This property is not implemented yet!""",
+        ),
+        (
+            "LoggedOut",
+            2,
+            """A guest user has been successfully logged out
+            of the guest OS.
+            This property is not implemented yet!""",
+        ),
+        (
+            "Locked",
+            3,
+            """A guest user has locked its account. This might
+            include running a password-protected screensaver
+            in the guest.
+            This property is not implemented yet!""",
+        ),
+        (
+            "Unlocked",
+            4,
+            """A guest user has unlocked its account.
+            This property is not implemented yet!""",
+        ),
+        (
+            "Disabled",
+            5,
+            """A guest user has been disabled by the guest OS.
+            This property is not implemented yet!""",
+        ),
+        (
+            "Idle",
+            6,
+            """A guest user currently is not using the guest OS.
+            Currently only available for Windows guests since
+            Windows 2000 SP2.
+            On Windows guests this function currently only supports
+            reporting contiguous idle times up to 49.7 days per user.
+            The event will be triggered if a guest user is not active for
+            at least 5 seconds. This threshold can be adjusted by either altering
+            VBoxService's command line in the guest to
+            --vminfo-user-idle-threshold 
+            , or by setting the per-VM guest property
+            /VirtualBox/GuestAdd/VBoxService/--vminfo-user-idle-threshold 
+            with the RDONLYGUEST flag on the host. In both cases VBoxService needs
+            to be restarted in order to get the changes applied.""",
+        ),
+        (
+            "InUse",
+            7,
+            """A guest user continued using the guest OS after
+            being idle.""",
+        ),
+        (
+            "Created",
+            8,
+            """A guest user has been successfully created.
+            This property is not implemented yet!""",
+        ),
+        (
+            "Deleted",
+            9,
+            """A guest user has been successfully deleted.
+            This property is not implemented yet!""",
+        ),
+        (
+            "SessionChanged",
+            10,
+            """To guest OS has changed the session of a user.
+            This property is not implemented yet!""",
+        ),
+        (
+            "CredentialsChanged",
+            11,
+            """To guest OS has changed the authentication
+            credentials of a user. This might include changed passwords
+            and authentication types.
+            This property is not implemented yet!""",
+        ),
+        (
+            "RoleChanged",
+            12,
+            """To guest OS has changed the role of a user permanently,
+            e.g. granting / denying administrative rights.
+            This property is not implemented yet!""",
+        ),
+        (
+            "GroupAdded",
+            13,
+            """To guest OS has added a user to a specific
+            user group.
+            This property is not implemented yet!""",
+        ),
+        (
+            "GroupRemoved",
+            14,
+            """To guest OS has removed a user from a specific
+            user group.
+            This property is not implemented yet!""",
+        ),
+        (
+            "Elevated",
+            15,
+            """To guest OS temporarily has elevated a user
+            to perform a certain task.
+            This property is not implemented yet!""",
+        ),
+    ]
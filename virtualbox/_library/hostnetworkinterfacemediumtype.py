@@ -0,0 +1,46 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class HostNetworkInterfaceMediumType(Enum):
+    """Type of encapsulation. Ethernet encapsulation includes both wired and
+    wireless Ethernet connections.
+    :py:class:`IHostNetworkInterface`
+
+
+    .. describe:: unknown(0)
+
+            The type of interface cannot be determined.
+
+    .. describe:: ethernet(1)
+
+            Ethernet frame encapsulation.
+
+    .. describe:: ppp(2)
+
+            Point-to-point protocol encapsulation.
+
+    .. describe:: slip(3)
+
+            Serial line IP encapsulation.
+
+    """
+
+    __uuid__ = "1aa54aaf-2497-45a2-bfb1-8eb225e93d5b"
+    _enums = [
+        ("Unknown", 0, """The type of interface cannot be determined."""),
+        ("Ethernet", 1, """Ethernet frame encapsulation."""),
+        ("PPP", 2, """Point-to-point protocol encapsulation."""),
+        ("SLIP", 3, """Serial line IP encapsulation."""),
+    ]
@@ -0,0 +1,40 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class HostNetworkInterfaceStatus(Enum):
+    """Current status of the interface.
+    :py:class:`IHostNetworkInterface`
+
+
+    .. describe:: unknown(0)
+
+            The state of interface cannot be determined.
+
+    .. describe:: up(1)
+
+            The interface is fully operational.
+
+    .. describe:: down(2)
+
+            The interface is not functioning.
+
+    """
+
+    __uuid__ = "CC474A69-2710-434B-8D99-C38E5D5A6F41"
+    _enums = [
+        ("Unknown", 0, """The state of interface cannot be determined."""),
+        ("Up", 1, """The interface is fully operational."""),
+        ("Down", 2, """The interface is not functioning."""),
+    ]
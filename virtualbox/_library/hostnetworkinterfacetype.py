@@ -0,0 +1,34 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class HostNetworkInterfaceType(Enum):
+    """Network interface type.
+
+
+    .. describe:: bridged(1)
+
+
+
+    .. describe:: host_only(2)
+
+
+
+    """
+
+    __uuid__ = "67431b00-9946-48a2-bc02-b25c5919f4f3"
+    _enums = [
+        ("Bridged", 1, """"""),
+        ("HostOnly", 2, """"""),
+    ]
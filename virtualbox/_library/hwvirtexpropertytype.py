@@ -0,0 +1,111 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class HWVirtExPropertyType(Enum):
+    """Hardware virtualization property type. This enumeration represents possible values
+    for the :py:func:`IMachine.get_hw_virt_ex_property`  and
+    :py:func:`IMachine.set_hw_virt_ex_property`  methods.
+
+
+    .. describe:: null(0)
+
+            Null value (never used by the API).
+
+    .. describe:: enabled(1)
+
+            Whether hardware virtualization (VT-x/AMD-V) is enabled at all. If
+            such extensions are not available, they will not be used.
+
+    .. describe:: vpid(2)
+
+            Whether VT-x VPID is enabled. If this extension is not available, it will not be used.
+
+    .. describe:: nested_paging(3)
+
+            Whether Nested Paging is enabled. If this extension is not available, it will not be used.
+
+    .. describe:: unrestricted_execution(4)
+
+            Whether VT-x unrestricted execution is enabled. If this feature is not available, it will not be used.
+
+    .. describe:: large_pages(5)
+
+            Whether large page allocation is enabled; requires nested paging and a 64-bit host.
+
+    .. describe:: force(6)
+
+            Whether the VM should fail to start if hardware virtualization (VT-x/AMD-V) cannot be used. If
+            not set, there will be an automatic fallback to software virtualization.
+
+    .. describe:: use_native_api(7)
+
+            Use the native hypervisor API instead of the VirtualBox one (HM) for VT-X/AMD-V.  This is
+            ignored if :py:attr:`HWVirtExPropertyType.enabled`  isn't set.
+
+    .. describe:: virt_vmsave_vmload(8)
+
+            Whether AMD-V Virtualized VMSAVE/VMLOAD is enabled. If this feature is not available, it will not
+            be used.
+
+    """
+
+    __uuid__ = "00069d9c-00b5-460c-00dd-64250024f7aa"
+    _enums = [
+        ("Null", 0, """Null value (never used by the API)."""),
+        (
+            "Enabled",
+            1,
+            """Whether hardware virtualization (VT-x/AMD-V) is enabled at all. If
+            such extensions are not available, they will not be used.""",
+        ),
+        (
+            "VPID",
+            2,
+            """Whether VT-x VPID is enabled. If this extension is not available, it will not be used.""",
+        ),
+        (
+            "NestedPaging",
+            3,
+            """Whether Nested Paging is enabled. If this extension is not available, it will not be used.""",
+        ),
+        (
+            "UnrestrictedExecution",
+            4,
+            """Whether VT-x unrestricted execution is enabled. If this feature is not available, it will not be used.""",
+        ),
+        (
+            "LargePages",
+            5,
+            """Whether large page allocation is enabled; requires nested paging and a 64-bit host.""",
+        ),
+        (
+            "Force",
+            6,
+            """Whether the VM should fail to start if hardware virtualization (VT-x/AMD-V) cannot be used. If
+            not set, there will be an automatic fallback to software virtualization.""",
+        ),
+        (
+            "UseNativeApi",
+            7,
+            """Use the native hypervisor API instead of the VirtualBox one (HM) for VT-X/AMD-V.  This is
+            ignored if :py:attr:`HWVirtExPropertyType.enabled`  isn't set.""",
+        ),
+        (
+            "VirtVmsaveVmload",
+            8,
+            """Whether AMD-V Virtualized VMSAVE/VMLOAD is enabled. If this feature is not available, it will not
+            be used.""",
+        ),
+    ]
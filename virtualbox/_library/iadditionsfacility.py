@@ -0,0 +1,67 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from ..library_base import Interface
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IAdditionsFacility(Interface):
+    """
+    Structure representing a Guest Additions facility.
+    """
+
+    __uuid__ = "f2f7fae4-4a06-81fc-a916-78b2da1fa0e5"
+    __wsmap__ = "struct"
+
+    @property
+    def class_type(self):
+        """Get AdditionsFacilityClass value for 'classType'
+        The class this facility is part of.
+        """
+        ret = self._get_attr("classType")
+        return _lib.AdditionsFacilityClass(ret)
+
+    @property
+    def last_updated(self):
+        """Get int value for 'lastUpdated'
+        Timestamp of the last status update,
+        in milliseconds since 1970-01-01 UTC.
+        """
+        ret = self._get_attr("lastUpdated")
+        return ret
+
+    @property
+    def name(self):
+        """Get str value for 'name'
+        The facility's friendly name.
+        """
+        ret = self._get_attr("name")
+        return ret
+
+    @property
+    def status(self):
+        """Get AdditionsFacilityStatus value for 'status'
+        The current status.
+        """
+        ret = self._get_attr("status")
+        return _lib.AdditionsFacilityStatus(ret)
+
+    @property
+    def type_p(self):
+        """Get AdditionsFacilityType value for 'type'
+        The facility's type ID.
+        """
+        ret = self._get_attr("type")
+        return _lib.AdditionsFacilityType(ret)
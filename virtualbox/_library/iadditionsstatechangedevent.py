@@ -0,0 +1,36 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from .ievent import IEvent
+from .vboxeventtype import VBoxEventType
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IAdditionsStateChangedEvent(IEvent):
+    """
+    Notification when a Guest Additions property changes.
+    Interested callees should query IGuest attributes to
+    find out what has changed.
+    """
+
+    __uuid__ = "D70F7915-DA7C-44C8-A7AC-9F173490446A"
+    __wsmap__ = "managed"
+    id = VBoxEventType.on_additions_state_changed
+
+    @property
+    def midl_does_not_like_empty_interfaces(self):
+        """Get bool value for 'midlDoesNotLikeEmptyInterfaces'"""
+        ret = self._get_attr("midlDoesNotLikeEmptyInterfaces")
+        return ret
@@ -0,0 +1,378 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from ..library_base import Interface
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IAppliance(Interface):
+    """
+    Represents a platform-independent appliance in OVF format. An instance of this is returned
+    by :py:func:`IVirtualBox.create_appliance` , which can then be used to import and export
+    virtual machines within an appliance with VirtualBox.
+
+    The OVF standard suggests two different physical file formats:
+
+
+    If the appliance is distributed as a set of files, there must be at least one XML descriptor
+    file that conforms to the OVF standard and carries an .ovf file extension. If
+    this descriptor file references other files such as disk images, as OVF appliances typically
+    do, those additional files must be in the same directory as the descriptor file.
+
+    If the appliance is distributed as a single file, it must be in TAR format and have the
+    .ova file extension. This TAR file must then contain at least the OVF descriptor
+    files and optionally other files.
+
+    At this time, VirtualBox does not not yet support the packed (TAR) variant; support will
+    be added with a later version.
+
+
+    **Importing** an OVF appliance into VirtualBox as instances of
+    :py:class:`IMachine`  involves the following sequence of API calls:
+
+
+    Call :py:func:`IVirtualBox.create_appliance` . This will create an empty IAppliance object.
+
+
+    On the new object, call :py:func:`read`  with the full path of the OVF file you
+    would like to import. So long as this file is syntactically valid, this will succeed
+    and fill the appliance object with the parsed data from the OVF file.
+
+
+    Next, call :py:func:`interpret` , which analyzes the OVF data and sets up the
+    contents of the IAppliance attributes accordingly. These can be inspected by a
+    VirtualBox front-end such as the GUI, and the suggestions can be displayed to the
+    user. In particular, the :py:func:`virtual_system_descriptions`  array contains
+    instances of :py:class:`IVirtualSystemDescription`  which represent the virtual
+    systems (machines) in the OVF, which in turn describe the virtual hardware prescribed
+    by the OVF (network and hardware adapters, virtual disk images, memory size and so on).
+    The GUI can then give the user the option to confirm and/or change these suggestions.
+
+
+    If desired, call :py:func:`IVirtualSystemDescription.set_final_values`  for each
+    virtual system (machine) to override the suggestions made by the :py:func:`interpret`  routine.
+
+
+    Finally, call :py:func:`import_machines`  to create virtual machines in
+    VirtualBox as instances of :py:class:`IMachine`  that match the information in the
+    virtual system descriptions. After this call succeeded, the UUIDs of the machines created
+    can be found in the :py:func:`machines`  array attribute.
+
+
+
+    **Exporting** VirtualBox machines into an OVF appliance involves the following steps:
+
+
+    As with importing, first call :py:func:`IVirtualBox.create_appliance`  to create
+    an empty IAppliance object.
+
+
+    For each machine you would like to export, call :py:func:`IMachine.export_to`
+    with the IAppliance object you just created. Each such call creates one instance of
+    :py:class:`IVirtualSystemDescription`  inside the appliance.
+
+
+    If desired, call :py:func:`IVirtualSystemDescription.set_final_values`  for each
+    virtual system (machine) to override the suggestions made by the :py:func:`IMachine.export_to`  routine.
+
+
+    Finally, call :py:func:`write`  with a path specification to have the OVF
+    file written.
+    """
+
+    __uuid__ = "86a98347-7619-41aa-aece-b21ac5c1a7e6"
+    __wsmap__ = "managed"
+
+    @property
+    def path(self):
+        """Get str value for 'path'
+        Path to the main file of the OVF appliance, which is either the .ovf or
+        the .ova file passed to :py:func:`read`  (for import) or
+        :py:func:`write`  (for export).
+        This attribute is empty until one of these methods has been called.
+        """
+        ret = self._get_attr("path")
+        return ret
+
+    @property
+    def disks(self):
+        """Get str value for 'disks'
+        Array of virtual disk definitions. One such description exists for each
+        disk definition in the OVF; each string array item represents one such piece of
+        disk information, with the information fields separated by tab (\\t) characters.
+
+        The caller should be prepared for additional fields being appended to
+        this string in future versions of VirtualBox and therefore check for
+        the number of tabs in the strings returned.
+
+        In the current version, the following eight fields are returned per string
+        in the array:
+
+
+        Disk ID (unique string identifier given to disk)
+
+        Capacity (unsigned integer indicating the maximum capacity of the disk)
+
+        Populated size (optional unsigned integer indicating the current size of the
+        disk; can be approximate; -1 if unspecified)
+
+        Format (string identifying the disk format, typically
+        "http://www.vmware.com/specifications/vmdk.html#sparse")
+
+        Reference (where to find the disk image, typically a file name; if empty,
+        then the disk should be created on import)
+
+        Image size (optional unsigned integer indicating the size of the image,
+        which need not necessarily be the same as the values specified above, since
+        the image may be compressed or sparse; -1 if not specified)
+
+        Chunk size (optional unsigned integer if the image is split into chunks;
+        presently unsupported and always -1)
+
+        Compression (optional string equaling "gzip" if the image is gzip-compressed)
+        """
+        ret = self._get_attr("disks")
+        return ret
+
+    @property
+    def virtual_system_descriptions(self):
+        """Get IVirtualSystemDescription value for 'virtualSystemDescriptions'
+        Array of virtual system descriptions. One such description is created
+        for each virtual system (machine) found in the OVF.
+        This array is empty until either :py:func:`interpret`  (for import) or :py:func:`IMachine.export_to`
+        (for export) has been called.
+        """
+        ret = self._get_attr("virtualSystemDescriptions")
+        return [_lib.IVirtualSystemDescription(a) for a in ret]
+
+    @property
+    def machines(self):
+        """Get str value for 'machines'
+        Contains the UUIDs of the machines created from the information in this appliances. This is only
+        relevant for the import case, and will only contain data after a call to :py:func:`import_machines`
+        succeeded.
+        """
+        ret = self._get_attr("machines")
+        return ret
+
+    @property
+    def certificate(self):
+        """Get ICertificate value for 'certificate'
+        The X.509 signing certificate, if the imported OVF was signed, @c null
+        if not signed.  This is available after calling :py:func:`read` .
+        """
+        ret = self._get_attr("certificate")
+        return _lib.ICertificate(ret)
+
+    def read(self, file_p):
+        """Reads an OVF file into the appliance object.
+
+        This method succeeds if the OVF is syntactically valid and, by itself, without errors. The
+        mere fact that this method returns successfully does not mean that VirtualBox supports all
+        features requested by the appliance; this can only be examined after a call to :py:func:`interpret` .
+
+        in file_p of type str
+            Name of appliance file to open (either with an .ovf or .ova extension, depending
+            on whether the appliance is distributed as a set of files or as a single file, respectively).
+
+        return progress of type :class:`IProgress`
+            Progress object to track the operation completion.
+
+        """
+        if not isinstance(file_p, basestring):
+            raise TypeError("file_p can only be an instance of type basestring")
+        progress = self._call("read", in_p=[file_p])
+        progress = _lib.IProgress(progress)
+        return progress
+
+    def interpret(self):
+        """Interprets the OVF data that was read when the appliance was constructed. After
+        calling this method, one can inspect the
+        :py:func:`virtual_system_descriptions`  array attribute, which will then contain
+        one :py:class:`IVirtualSystemDescription`  for each virtual machine found in
+        the appliance.
+
+        Calling this method is the second step of importing an appliance into VirtualBox;
+        see :py:class:`IAppliance`  for an overview.
+
+        After calling this method, one should call :py:func:`get_warnings`  to find out
+        if problems were encountered during the processing which might later lead to
+        errors.
+
+        """
+        self._call("interpret")
+
+    def import_machines(self, options):
+        """Imports the appliance into VirtualBox by creating instances of :py:class:`IMachine`
+        and other interfaces that match the information contained in the appliance as
+        closely as possible, as represented by the import instructions in the
+        :py:func:`virtual_system_descriptions`  array.
+
+        Calling this method is the final step of importing an appliance into VirtualBox;
+        see :py:class:`IAppliance`  for an overview.
+
+        Since importing the appliance will most probably involve copying and converting
+        disk images, which can take a long time, this method operates asynchronously and
+        returns an IProgress object to allow the caller to monitor the progress.
+
+        After the import succeeded, the UUIDs of the IMachine instances created can be
+        retrieved from the :py:func:`machines`  array attribute.
+
+        in options of type :class:`ImportOptions`
+            Options for the importing operation.
+
+        return progress of type :class:`IProgress`
+            Progress object to track the operation completion.
+
+        """
+        if not isinstance(options, list):
+            raise TypeError("options can only be an instance of type list")
+        for a in options[:10]:
+            if not isinstance(a, _lib.ImportOptions):
+                raise TypeError("array can only contain objects of type ImportOptions")
+        progress = self._call("importMachines", in_p=[options])
+        progress = _lib.IProgress(progress)
+        return progress
+
+    def create_vfs_explorer(self, uri):
+        """Returns a :py:class:`IVFSExplorer`  object for the given URI.
+
+        in uri of type str
+            The URI describing the file system to use.
+
+        return explorer of type :class:`IVFSExplorer`
+
+        """
+        if not isinstance(uri, basestring):
+            raise TypeError("uri can only be an instance of type basestring")
+        explorer = self._call("createVFSExplorer", in_p=[uri])
+        explorer = _lib.IVFSExplorer(explorer)
+        return explorer
+
+    def write(self, format_p, options, path):
+        """Writes the contents of the appliance exports into a new OVF file.
+
+        Calling this method is the final step of exporting an appliance from VirtualBox;
+        see :py:class:`IAppliance`  for an overview.
+
+        Since exporting the appliance will most probably involve copying and converting
+        disk images, which can take a long time, this method operates asynchronously and
+        returns an IProgress object to allow the caller to monitor the progress.
+
+        in format_p of type str
+            Output format, as a string. Currently supported formats are "ovf-0.9", "ovf-1.0",
+            "ovf-2.0" and "opc-1.0"; future versions of VirtualBox may support additional formats.
+            The "opc-1.0" format is for creating tarballs for the Oracle Public Cloud.
+
+        in options of type :class:`ExportOptions`
+            Options for the exporting operation.
+
+        in path of type str
+            Name of appliance file to create.  There are certain restrictions with regard
+            to the file name suffix.  If the format parameter is "opc-1.0" a .tar.gz
+            suffix is required.  Otherwise the suffix must either be .ovf or
+            .ova, depending on whether the appliance is distributed as a set of
+            files or as a single file, respectively.
+
+        return progress of type :class:`IProgress`
+            Progress object to track the operation completion.
+
+        """
+        if not isinstance(format_p, basestring):
+            raise TypeError("format_p can only be an instance of type basestring")
+        if not isinstance(options, list):
+            raise TypeError("options can only be an instance of type list")
+        for a in options[:10]:
+            if not isinstance(a, _lib.ExportOptions):
+                raise TypeError("array can only contain objects of type ExportOptions")
+        if not isinstance(path, basestring):
+            raise TypeError("path can only be an instance of type basestring")
+        progress = self._call("write", in_p=[format_p, options, path])
+        progress = _lib.IProgress(progress)
+        return progress
+
+    def get_warnings(self):
+        """Returns textual warnings which occurred during execution of :py:func:`interpret` .
+
+        return warnings of type str
+
+        """
+        warnings = self._call("getWarnings")
+        return warnings
+
+    def get_password_ids(self):
+        """Returns a list of password identifiers which must be supplied to import or export
+        encrypted virtual machines.
+
+        return identifiers of type str
+            The list of password identifiers required for export on success.
+
+        """
+        identifiers = self._call("getPasswordIds")
+        return identifiers
+
+    def get_medium_ids_for_password_id(self, password_id):
+        """Returns a list of medium identifiers which use the given password identifier.
+
+        in password_id of type str
+            The password identifier to get the medium identifiers for.
+
+        return identifiers of type str
+            The list of medium identifiers returned on success.
+
+        """
+        if not isinstance(password_id, basestring):
+            raise TypeError("password_id can only be an instance of type basestring")
+        identifiers = self._call("getMediumIdsForPasswordId", in_p=[password_id])
+        return identifiers
+
+    def add_passwords(self, identifiers, passwords):
+        """Adds a list of passwords required to import or export encrypted virtual
+        machines.
+
+        in identifiers of type str
+            List of identifiers.
+
+        in passwords of type str
+            List of matching passwords.
+
+        """
+        if not isinstance(identifiers, list):
+            raise TypeError("identifiers can only be an instance of type list")
+        for a in identifiers[:10]:
+            if not isinstance(a, basestring):
+                raise TypeError("array can only contain objects of type basestring")
+        if not isinstance(passwords, list):
+            raise TypeError("passwords can only be an instance of type list")
+        for a in passwords[:10]:
+            if not isinstance(a, basestring):
+                raise TypeError("array can only contain objects of type basestring")
+        self._call("addPasswords", in_p=[identifiers, passwords])
+
+    def create_virtual_system_descriptions(self, requested):
+        """Creates a number of :py:class:`IVirtualSystemDescription`  objects and store them
+        in the :py:func:`virtual_system_descriptions`  array.
+
+        in requested of type int
+            Requested number of new virtual system description objects
+
+        return created of type int
+            Actually created number of virtual system description objects
+
+        """
+        if not isinstance(requested, baseinteger):
+            raise TypeError("requested can only be an instance of type baseinteger")
+        created = self._call("createVirtualSystemDescriptions", in_p=[requested])
+        return created
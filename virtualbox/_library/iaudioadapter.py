@@ -0,0 +1,165 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from ..library_base import Interface
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IAudioAdapter(Interface):
+    """
+    The IAudioAdapter interface represents the virtual audio adapter of
+    the virtual machine. Used in :py:func:`IMachine.audio_adapter` .
+    """
+
+    __uuid__ = "5155bfd3-7ba7-45a8-b26d-c91ae3754e37"
+    __wsmap__ = "managed"
+
+    @property
+    def enabled(self):
+        """Get or set bool value for 'enabled'
+        Flag whether the audio adapter is present in the
+        guest system. If disabled, the virtual guest hardware will
+        not contain any audio adapter. Can only be changed when
+        the VM is not running.
+        """
+        ret = self._get_attr("enabled")
+        return ret
+
+    @enabled.setter
+    def enabled(self, value):
+        if not isinstance(value, bool):
+            raise TypeError("value is not an instance of bool")
+        return self._set_attr("enabled", value)
+
+    @property
+    def enabled_in(self):
+        """Get or set bool value for 'enabledIn'
+        Flag whether the audio adapter is enabled for audio
+        input. Only relevant if the adapter is enabled.
+        """
+        ret = self._get_attr("enabledIn")
+        return ret
+
+    @enabled_in.setter
+    def enabled_in(self, value):
+        if not isinstance(value, bool):
+            raise TypeError("value is not an instance of bool")
+        return self._set_attr("enabledIn", value)
+
+    @property
+    def enabled_out(self):
+        """Get or set bool value for 'enabledOut'
+        Flag whether the audio adapter is enabled for audio
+        output. Only relevant if the adapter is enabled.
+        """
+        ret = self._get_attr("enabledOut")
+        return ret
+
+    @enabled_out.setter
+    def enabled_out(self, value):
+        if not isinstance(value, bool):
+            raise TypeError("value is not an instance of bool")
+        return self._set_attr("enabledOut", value)
+
+    @property
+    def audio_controller(self):
+        """Get or set AudioControllerType value for 'audioController'
+        The emulated audio controller.
+        """
+        ret = self._get_attr("audioController")
+        return _lib.AudioControllerType(ret)
+
+    @audio_controller.setter
+    def audio_controller(self, value):
+        if not isinstance(value, _lib.AudioControllerType):
+            raise TypeError("value is not an instance of AudioControllerType")
+        return self._set_attr("audioController", value)
+
+    @property
+    def audio_codec(self):
+        """Get or set AudioCodecType value for 'audioCodec'
+        The exact variant of audio codec hardware presented
+        to the guest.
+        For HDA and SB16, only one variant is available, but for AC'97,
+        there are several.
+        """
+        ret = self._get_attr("audioCodec")
+        return _lib.AudioCodecType(ret)
+
+    @audio_codec.setter
+    def audio_codec(self, value):
+        if not isinstance(value, _lib.AudioCodecType):
+            raise TypeError("value is not an instance of AudioCodecType")
+        return self._set_attr("audioCodec", value)
+
+    @property
+    def audio_driver(self):
+        """Get or set AudioDriverType value for 'audioDriver'
+        Audio driver the adapter is connected to. This setting
+        can only be changed when the VM is not running.
+        """
+        ret = self._get_attr("audioDriver")
+        return _lib.AudioDriverType(ret)
+
+    @audio_driver.setter
+    def audio_driver(self, value):
+        if not isinstance(value, _lib.AudioDriverType):
+            raise TypeError("value is not an instance of AudioDriverType")
+        return self._set_attr("audioDriver", value)
+
+    @property
+    def properties_list(self):
+        """Get str value for 'propertiesList'
+        Array of names of tunable properties, which can be supported by audio driver.
+        """
+        ret = self._get_attr("propertiesList")
+        return ret
+
+    def set_property(self, key, value):
+        """Sets an audio specific property string.
+
+        If you pass @c null or empty string as a key @a value, the given @a key
+        will be deleted.
+
+        in key of type str
+            Name of the key to set.
+
+        in value of type str
+            Value to assign to the key.
+
+        """
+        if not isinstance(key, basestring):
+            raise TypeError("key can only be an instance of type basestring")
+        if not isinstance(value, basestring):
+            raise TypeError("value can only be an instance of type basestring")
+        self._call("setProperty", in_p=[key, value])
+
+    def get_property(self, key):
+        """Returns an audio specific property string.
+
+        If the requested data @a key does not exist, this function will
+        succeed and return an empty string in the @a value argument.
+
+        in key of type str
+            Name of the key to get.
+
+        return value of type str
+            Value of the requested key.
+
+        """
+        if not isinstance(key, basestring):
+            raise TypeError("key can only be an instance of type basestring")
+        value = self._call("getProperty", in_p=[key])
+        return value
@@ -0,0 +1,38 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from .ievent import IEvent
+from .vboxeventtype import VBoxEventType
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IAudioAdapterChangedEvent(IEvent):
+    """
+    Notification when a property of the audio adapter changes.
+    Interested callees should use IAudioAdapter methods and attributes
+    to find out what has changed.
+    """
+
+    __uuid__ = "D5ABC823-04D0-4DB6-8D66-DC2F033120E1"
+    __wsmap__ = "managed"
+    id = VBoxEventType.on_audio_adapter_changed
+
+    @property
+    def audio_adapter(self):
+        """Get IAudioAdapter value for 'audioAdapter'
+        Audio adapter that is subject to change.
+        """
+        ret = self._get_attr("audioAdapter")
+        return _lib.IAudioAdapter(ret)
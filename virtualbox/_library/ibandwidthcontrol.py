@@ -0,0 +1,97 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from ..library_base import Interface
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IBandwidthControl(Interface):
+    """
+    Controls the bandwidth groups of one machine used to cap I/O done by a VM.
+    This includes network and disk I/O.
+    """
+
+    __uuid__ = "48c7f4c0-c9d6-4742-957c-a6fd52e8c4ae"
+    __wsmap__ = "managed"
+
+    @property
+    def num_groups(self):
+        """Get int value for 'numGroups'
+        The current number of existing bandwidth groups managed.
+        """
+        ret = self._get_attr("numGroups")
+        return ret
+
+    def create_bandwidth_group(self, name, type_p, max_bytes_per_sec):
+        """Creates a new bandwidth group.
+
+        in name of type str
+            Name of the bandwidth group.
+
+        in type_p of type :class:`BandwidthGroupType`
+            The type of the bandwidth group (network or disk).
+
+        in max_bytes_per_sec of type int
+            The maximum number of bytes which can be transfered by all
+            entities attached to this group during one second.
+
+        """
+        if not isinstance(name, basestring):
+            raise TypeError("name can only be an instance of type basestring")
+        if not isinstance(type_p, _lib.BandwidthGroupType):
+            raise TypeError("type_p can only be an instance of type BandwidthGroupType")
+        if not isinstance(max_bytes_per_sec, baseinteger):
+            raise TypeError(
+                "max_bytes_per_sec can only be an instance of type baseinteger"
+            )
+        self._call("createBandwidthGroup", in_p=[name, type_p, max_bytes_per_sec])
+
+    def delete_bandwidth_group(self, name):
+        """Deletes a new bandwidth group.
+
+        in name of type str
+            Name of the bandwidth group to delete.
+
+        """
+        if not isinstance(name, basestring):
+            raise TypeError("name can only be an instance of type basestring")
+        self._call("deleteBandwidthGroup", in_p=[name])
+
+    def get_bandwidth_group(self, name):
+        """Get a bandwidth group by name.
+
+        in name of type str
+            Name of the bandwidth group to get.
+
+        return bandwidth_group of type :class:`IBandwidthGroup`
+            Where to store the bandwidth group on success.
+
+        """
+        if not isinstance(name, basestring):
+            raise TypeError("name can only be an instance of type basestring")
+        bandwidth_group = self._call("getBandwidthGroup", in_p=[name])
+        bandwidth_group = _lib.IBandwidthGroup(bandwidth_group)
+        return bandwidth_group
+
+    def get_all_bandwidth_groups(self):
+        """Get all managed bandwidth groups.
+
+        return bandwidth_groups of type :class:`IBandwidthGroup`
+            The array of managed bandwidth groups.
+
+        """
+        bandwidth_groups = self._call("getAllBandwidthGroups")
+        bandwidth_groups = [_lib.IBandwidthGroup(a) for a in bandwidth_groups]
+        return bandwidth_groups
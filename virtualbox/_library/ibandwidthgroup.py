@@ -0,0 +1,65 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from ..library_base import Interface
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IBandwidthGroup(Interface):
+    """
+    Represents one bandwidth group.
+    """
+
+    __uuid__ = "31587f93-2d12-4d7c-ba6d-ce51d0d5b265"
+    __wsmap__ = "managed"
+
+    @property
+    def name(self):
+        """Get str value for 'name'
+        Name of the group.
+        """
+        ret = self._get_attr("name")
+        return ret
+
+    @property
+    def type_p(self):
+        """Get BandwidthGroupType value for 'type'
+        Type of the group.
+        """
+        ret = self._get_attr("type")
+        return _lib.BandwidthGroupType(ret)
+
+    @property
+    def reference(self):
+        """Get int value for 'reference'
+        How many devices/medium attachments use this group.
+        """
+        ret = self._get_attr("reference")
+        return ret
+
+    @property
+    def max_bytes_per_sec(self):
+        """Get or set int value for 'maxBytesPerSec'
+        The maximum number of bytes which can be transfered by all
+        entities attached to this group during one second.
+        """
+        ret = self._get_attr("maxBytesPerSec")
+        return ret
+
+    @max_bytes_per_sec.setter
+    def max_bytes_per_sec(self, value):
+        if not isinstance(value, baseinteger):
+            raise TypeError("value is not an instance of baseinteger")
+        return self._set_attr("maxBytesPerSec", value)
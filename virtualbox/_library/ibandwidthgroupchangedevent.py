@@ -0,0 +1,36 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from .ievent import IEvent
+from .vboxeventtype import VBoxEventType
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IBandwidthGroupChangedEvent(IEvent):
+    """
+    Notification when one of the bandwidth groups changed
+    """
+
+    __uuid__ = "334df94a-7556-4cbc-8c04-043096b02d82"
+    __wsmap__ = "managed"
+    id = VBoxEventType.on_bandwidth_group_changed
+
+    @property
+    def bandwidth_group(self):
+        """Get IBandwidthGroup value for 'bandwidthGroup'
+        The changed bandwidth group.
+        """
+        ret = self._get_attr("bandwidthGroup")
+        return _lib.IBandwidthGroup(ret)
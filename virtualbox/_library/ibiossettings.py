@@ -0,0 +1,201 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from ..library_base import Interface
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IBIOSSettings(Interface):
+    """
+    The IBIOSSettings interface represents BIOS settings of the virtual
+    machine. This is used only in the :py:func:`IMachine.bios_settings`  attribute.
+    """
+
+    __uuid__ = "73af4152-7e67-4144-bf34-41c38e8b4cc7"
+    __wsmap__ = "managed"
+
+    @property
+    def logo_fade_in(self):
+        """Get or set bool value for 'logoFadeIn'
+        Fade in flag for BIOS logo animation.
+        """
+        ret = self._get_attr("logoFadeIn")
+        return ret
+
+    @logo_fade_in.setter
+    def logo_fade_in(self, value):
+        if not isinstance(value, bool):
+            raise TypeError("value is not an instance of bool")
+        return self._set_attr("logoFadeIn", value)
+
+    @property
+    def logo_fade_out(self):
+        """Get or set bool value for 'logoFadeOut'
+        Fade out flag for BIOS logo animation.
+        """
+        ret = self._get_attr("logoFadeOut")
+        return ret
+
+    @logo_fade_out.setter
+    def logo_fade_out(self, value):
+        if not isinstance(value, bool):
+            raise TypeError("value is not an instance of bool")
+        return self._set_attr("logoFadeOut", value)
+
+    @property
+    def logo_display_time(self):
+        """Get or set int value for 'logoDisplayTime'
+        BIOS logo display time in milliseconds (0 = default).
+        """
+        ret = self._get_attr("logoDisplayTime")
+        return ret
+
+    @logo_display_time.setter
+    def logo_display_time(self, value):
+        if not isinstance(value, baseinteger):
+            raise TypeError("value is not an instance of baseinteger")
+        return self._set_attr("logoDisplayTime", value)
+
+    @property
+    def logo_image_path(self):
+        """Get or set str value for 'logoImagePath'
+        Local file system path for external BIOS splash image. Empty string
+        means the default image is shown on boot.
+        """
+        ret = self._get_attr("logoImagePath")
+        return ret
+
+    @logo_image_path.setter
+    def logo_image_path(self, value):
+        if not isinstance(value, basestring):
+            raise TypeError("value is not an instance of basestring")
+        return self._set_attr("logoImagePath", value)
+
+    @property
+    def boot_menu_mode(self):
+        """Get or set BIOSBootMenuMode value for 'bootMenuMode'
+        Mode of the BIOS boot device menu.
+        """
+        ret = self._get_attr("bootMenuMode")
+        return _lib.BIOSBootMenuMode(ret)
+
+    @boot_menu_mode.setter
+    def boot_menu_mode(self, value):
+        if not isinstance(value, _lib.BIOSBootMenuMode):
+            raise TypeError("value is not an instance of BIOSBootMenuMode")
+        return self._set_attr("bootMenuMode", value)
+
+    @property
+    def acpi_enabled(self):
+        """Get or set bool value for 'ACPIEnabled'
+        ACPI support flag.
+        """
+        ret = self._get_attr("ACPIEnabled")
+        return ret
+
+    @acpi_enabled.setter
+    def acpi_enabled(self, value):
+        if not isinstance(value, bool):
+            raise TypeError("value is not an instance of bool")
+        return self._set_attr("ACPIEnabled", value)
+
+    @property
+    def ioapic_enabled(self):
+        """Get or set bool value for 'IOAPICEnabled'
+        I/O-APIC support flag. If set, VirtualBox will provide an I/O-APIC
+        and support IRQs above 15.
+        """
+        ret = self._get_attr("IOAPICEnabled")
+        return ret
+
+    @ioapic_enabled.setter
+    def ioapic_enabled(self, value):
+        if not isinstance(value, bool):
+            raise TypeError("value is not an instance of bool")
+        return self._set_attr("IOAPICEnabled", value)
+
+    @property
+    def apic_mode(self):
+        """Get or set APICMode value for 'APICMode'
+        APIC mode to set up by the firmware.
+        """
+        ret = self._get_attr("APICMode")
+        return _lib.APICMode(ret)
+
+    @apic_mode.setter
+    def apic_mode(self, value):
+        if not isinstance(value, _lib.APICMode):
+            raise TypeError("value is not an instance of APICMode")
+        return self._set_attr("APICMode", value)
+
+    @property
+    def time_offset(self):
+        """Get or set int value for 'timeOffset'
+        Offset in milliseconds from the host system time. This allows for
+        guests running with a different system date/time than the host.
+        It is equivalent to setting the system date/time in the BIOS except
+        it is not an absolute value but a relative one. Guest Additions
+        time synchronization honors this offset.
+        """
+        ret = self._get_attr("timeOffset")
+        return ret
+
+    @time_offset.setter
+    def time_offset(self, value):
+        if not isinstance(value, baseinteger):
+            raise TypeError("value is not an instance of baseinteger")
+        return self._set_attr("timeOffset", value)
+
+    @property
+    def pxe_debug_enabled(self):
+        """Get or set bool value for 'PXEDebugEnabled'
+        PXE debug logging flag. If set, VirtualBox will write extensive
+        PXE trace information to the release log.
+        """
+        ret = self._get_attr("PXEDebugEnabled")
+        return ret
+
+    @pxe_debug_enabled.setter
+    def pxe_debug_enabled(self, value):
+        if not isinstance(value, bool):
+            raise TypeError("value is not an instance of bool")
+        return self._set_attr("PXEDebugEnabled", value)
+
+    @property
+    def non_volatile_storage_file(self):
+        """Get str value for 'nonVolatileStorageFile'
+        The location of the file storing the non-volatile memory content when
+        the VM is powered off.  The file does not always exist.
+        """
+        ret = self._get_attr("nonVolatileStorageFile")
+        return ret
+
+    @property
+    def smbios_uuid_little_endian(self):
+        """Get or set bool value for 'SMBIOSUuidLittleEndian'
+        Flag to control whether the SMBIOS system UUID is presented in little endian
+        form to the guest as mandated by the SMBIOS spec chapter 7.2.1.
+        Before VirtualBox version 6.1 it was always presented in big endian form
+        and to retain the old behavior this flag was introduced so it can be changed.
+        VMs created with VBox 6.1 will default to true for this flag.
+        """
+        ret = self._get_attr("SMBIOSUuidLittleEndian")
+        return ret
+
+    @smbios_uuid_little_endian.setter
+    def smbios_uuid_little_endian(self, value):
+        if not isinstance(value, bool):
+            raise TypeError("value is not an instance of bool")
+        return self._set_attr("SMBIOSUuidLittleEndian", value)
@@ -0,0 +1,47 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from .iformvalue import IFormValue
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IBooleanFormValue(IFormValue):
+    """"""
+
+    __uuid__ = "4f4adcf6-3e87-11e9-8af2-576e84223953"
+    __wsmap__ = "managed"
+
+    def get_selected(self):
+        """
+
+        return selected of type bool
+
+        """
+        selected = self._call("getSelected")
+        return selected
+
+    def set_selected(self, selected):
+        """
+
+        in selected of type bool
+
+        return progress of type :class:`IProgress`
+
+        """
+        if not isinstance(selected, bool):
+            raise TypeError("selected can only be an instance of type bool")
+        progress = self._call("setSelected", in_p=[selected])
+        progress = _lib.IProgress(progress)
+        return progress
@@ -0,0 +1,42 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from .ivetoevent import IVetoEvent
+from .vboxeventtype import VBoxEventType
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class ICanShowWindowEvent(IVetoEvent):
+    """
+    Notification when a call to
+    :py:func:`IMachine.can_show_console_window`  is made by a
+    front-end to check if a subsequent call to
+    :py:func:`IMachine.show_console_window`  can succeed.
+
+    The callee should give an answer appropriate to the current
+    machine state using event veto. This answer must
+    remain valid at least until the next
+    :py:func:`IConsole.state` machine state change.
+    """
+
+    __uuid__ = "adf292b0-92c9-4a77-9d35-e058b39fe0b9"
+    __wsmap__ = "managed"
+    id = VBoxEventType.on_can_show_window
+
+    @property
+    def midl_does_not_like_empty_interfaces(self):
+        """Get bool value for 'midlDoesNotLikeEmptyInterfaces'"""
+        ret = self._get_attr("midlDoesNotLikeEmptyInterfaces")
+        return ret
@@ -0,0 +1,220 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from ..library_base import Interface
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class ICertificate(Interface):
+    """
+    X.509 certificate details.
+    """
+
+    __uuid__ = "392f1de4-80e1-4a8a-93a1-67c5f92a838a"
+    __wsmap__ = "managed"
+
+    @property
+    def version_number(self):
+        """Get CertificateVersion value for 'versionNumber'
+        Certificate version number.
+        """
+        ret = self._get_attr("versionNumber")
+        return _lib.CertificateVersion(ret)
+
+    @property
+    def serial_number(self):
+        """Get str value for 'serialNumber'
+        Certificate serial number.
+        """
+        ret = self._get_attr("serialNumber")
+        return ret
+
+    @property
+    def signature_algorithm_oid(self):
+        """Get str value for 'signatureAlgorithmOID'
+        The dotted OID of the signature algorithm.
+        """
+        ret = self._get_attr("signatureAlgorithmOID")
+        return ret
+
+    @property
+    def signature_algorithm_name(self):
+        """Get str value for 'signatureAlgorithmName'
+        The signature algorithm name if known (if known).
+        """
+        ret = self._get_attr("signatureAlgorithmName")
+        return ret
+
+    @property
+    def issuer_name(self):
+        """Get str value for 'issuerName'
+        Issuer name.  Each member of the array is on the format
+        COMPONENT=NAME, e.g. "C=DE", "ST=Example", "L=For Instance", "O=Beispiel GmbH",
+        "CN=beispiel.example.org".
+        """
+        ret = self._get_attr("issuerName")
+        return ret
+
+    @property
+    def subject_name(self):
+        """Get str value for 'subjectName'
+        Subject name.  Same format as issuerName.
+        """
+        ret = self._get_attr("subjectName")
+        return ret
+
+    @property
+    def friendly_name(self):
+        """Get str value for 'friendlyName'
+        Friendly subject name or similar.
+        """
+        ret = self._get_attr("friendlyName")
+        return ret
+
+    @property
+    def validity_period_not_before(self):
+        """Get str value for 'validityPeriodNotBefore'
+        Certificate not valid before ISO timestamp.
+        """
+        ret = self._get_attr("validityPeriodNotBefore")
+        return ret
+
+    @property
+    def validity_period_not_after(self):
+        """Get str value for 'validityPeriodNotAfter'
+        Certificate not valid after ISO timestamp.
+        """
+        ret = self._get_attr("validityPeriodNotAfter")
+        return ret
+
+    @property
+    def public_key_algorithm_oid(self):
+        """Get str value for 'publicKeyAlgorithmOID'
+        The dotted OID of the public key algorithm.
+        """
+        ret = self._get_attr("publicKeyAlgorithmOID")
+        return ret
+
+    @property
+    def public_key_algorithm(self):
+        """Get str value for 'publicKeyAlgorithm'
+        The public key algorithm name (if known).
+        """
+        ret = self._get_attr("publicKeyAlgorithm")
+        return ret
+
+    @property
+    def subject_public_key(self):
+        """Get str value for 'subjectPublicKey'
+        The raw public key bytes.
+        """
+        ret = self._get_attr("subjectPublicKey")
+        return ret
+
+    @property
+    def issuer_unique_identifier(self):
+        """Get str value for 'issuerUniqueIdentifier'
+        Unique identifier of the issuer (empty string if not present).
+        """
+        ret = self._get_attr("issuerUniqueIdentifier")
+        return ret
+
+    @property
+    def subject_unique_identifier(self):
+        """Get str value for 'subjectUniqueIdentifier'
+        Unique identifier of this certificate (empty string if not present).
+        """
+        ret = self._get_attr("subjectUniqueIdentifier")
+        return ret
+
+    @property
+    def certificate_authority(self):
+        """Get bool value for 'certificateAuthority'
+        Whether this certificate is a certificate authority.  Will return E_FAIL
+        if this attribute is not present.
+        """
+        ret = self._get_attr("certificateAuthority")
+        return ret
+
+    @property
+    def key_usage(self):
+        """Get int value for 'keyUsage'
+        Key usage mask.  Will return 0 if not present.
+        """
+        ret = self._get_attr("keyUsage")
+        return ret
+
+    @property
+    def extended_key_usage(self):
+        """Get str value for 'extendedKeyUsage'
+        Array of dotted extended key usage OIDs.  Empty array if not present.
+        """
+        ret = self._get_attr("extendedKeyUsage")
+        return ret
+
+    @property
+    def raw_cert_data(self):
+        """Get str value for 'rawCertData'
+        The raw certificate bytes.
+        """
+        ret = self._get_attr("rawCertData")
+        return ret
+
+    @property
+    def self_signed(self):
+        """Get bool value for 'selfSigned'
+        Set if self signed certificate.
+        """
+        ret = self._get_attr("selfSigned")
+        return ret
+
+    @property
+    def trusted(self):
+        """Get bool value for 'trusted'
+        Set if the certificate is trusted (by the parent object).
+        """
+        ret = self._get_attr("trusted")
+        return ret
+
+    @property
+    def expired(self):
+        """Get bool value for 'expired'
+        Set if the certificate has expired (relevant to the parent object)/
+        """
+        ret = self._get_attr("expired")
+        return ret
+
+    def is_currently_expired(self):
+        """Tests if the certificate has expired at the present time according to
+        the X.509 validity of the certificate.
+
+        return result of type bool
+
+        """
+        result = self._call("isCurrentlyExpired")
+        return result
+
+    def query_info(self, what):
+        """Way to extend the interface.
+
+        in what of type int
+
+        return result of type str
+
+        """
+        if not isinstance(what, baseinteger):
+            raise TypeError("what can only be an instance of type baseinteger")
+        result = self._call("queryInfo", in_p=[what])
+        return result
@@ -0,0 +1,53 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from .iformvalue import IFormValue
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IChoiceFormValue(IFormValue):
+    """"""
+
+    __uuid__ = "7191cf38-3e8a-11e9-825c-ab7b2cabce23"
+    __wsmap__ = "managed"
+
+    @property
+    def values(self):
+        """Get str value for 'values'"""
+        ret = self._get_attr("values")
+        return ret
+
+    def get_selected_index(self):
+        """
+
+        return index of type int
+
+        """
+        index = self._call("getSelectedIndex")
+        return index
+
+    def set_selected_index(self, index):
+        """
+
+        in index of type int
+
+        return progress of type :class:`IProgress`
+
+        """
+        if not isinstance(index, baseinteger):
+            raise TypeError("index can only be an instance of type baseinteger")
+        progress = self._call("setSelectedIndex", in_p=[index])
+        progress = _lib.IProgress(progress)
+        return progress
@@ -0,0 +1,36 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from .ievent import IEvent
+from .vboxeventtype import VBoxEventType
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IClipboardFileTransferModeChangedEvent(IEvent):
+    """
+    Notification when the shared clipboard file transfer mode changes.
+    """
+
+    __uuid__ = "00391758-00B1-4E9D-0000-11FA00F9D583"
+    __wsmap__ = "managed"
+    id = VBoxEventType.on_clipboard_file_transfer_mode_changed
+
+    @property
+    def enabled(self):
+        """Get bool value for 'enabled'
+        Whether file transfers are allowed or not.
+        """
+        ret = self._get_attr("enabled")
+        return ret
@@ -0,0 +1,36 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from .ievent import IEvent
+from .vboxeventtype import VBoxEventType
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IClipboardModeChangedEvent(IEvent):
+    """
+    Notification when the shared clipboard mode changes.
+    """
+
+    __uuid__ = "cac21692-7997-4595-a731-3a509db604e5"
+    __wsmap__ = "managed"
+    id = VBoxEventType.on_clipboard_mode_changed
+
+    @property
+    def clipboard_mode(self):
+        """Get ClipboardMode value for 'clipboardMode'
+        The new clipboard mode.
+        """
+        ret = self._get_attr("clipboardMode")
+        return _lib.ClipboardMode(ret)
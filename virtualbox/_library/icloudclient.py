@@ -0,0 +1,654 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from ..library_base import Interface
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class ICloudClient(Interface):
+    """
+    Returns a form for editing the virtual system description for
+    exporting a local VM into a cloud custom image.
+    """
+
+    __uuid__ = "5fa3a8db-1c4f-4cda-b8d4-7982ef60fefb"
+    __wsmap__ = "managed"
+
+    def get_export_description_form(self, description):
+        """Returns a form for editing the virtual system description for
+        exporting a local VM into a cloud custom image.
+
+        in description of type :class:`IVirtualSystemDescription`
+            Virtual system description to be edited.
+
+        out form of type :class:`IVirtualSystemDescriptionForm`
+            An IForm instance for editing the virtual system description.
+
+        return progress of type :class:`IProgress`
+            Progress object to track the operation completion.
+
+        """
+        if not isinstance(description, _lib.IVirtualSystemDescription):
+            raise TypeError(
+                "description can only be an instance of type IVirtualSystemDescription"
+            )
+        progress, form = self._call("getExportDescriptionForm", in_p=[description])
+        progress = _lib.IProgress(progress)
+        form = _lib.IVirtualSystemDescriptionForm(form)
+        return (progress, form)
+
+    def export_vm(self, description, progress):
+        """Export local VM into the cloud, creating a custom image.
+
+        in description of type :class:`IVirtualSystemDescription`
+            Virtual system description object which describes the
+            machine and all required parameters.
+
+        in progress of type :class:`IProgress`
+            Progress object to track the operation completion.
+
+        """
+        if not isinstance(description, _lib.IVirtualSystemDescription):
+            raise TypeError(
+                "description can only be an instance of type IVirtualSystemDescription"
+            )
+        if not isinstance(progress, _lib.IProgress):
+            raise TypeError("progress can only be an instance of type IProgress")
+        self._call("exportVM", in_p=[description, progress])
+
+    def get_launch_description_form(self, description):
+        """Virtual system description to be edited.
+
+        in description of type :class:`IVirtualSystemDescription`
+            Virtual system description to be edited.
+
+        out form of type :class:`IVirtualSystemDescriptionForm`
+            An IForm instance for editing the virtual system description.
+
+        return progress of type :class:`IProgress`
+            Progress object to track the operation completion.
+
+        """
+        if not isinstance(description, _lib.IVirtualSystemDescription):
+            raise TypeError(
+                "description can only be an instance of type IVirtualSystemDescription"
+            )
+        progress, form = self._call("getLaunchDescriptionForm", in_p=[description])
+        progress = _lib.IProgress(progress)
+        form = _lib.IVirtualSystemDescriptionForm(form)
+        return (progress, form)
+
+    def launch_vm(self, description):
+        """Virtual system description object which describes the
+        machine and all required parameters.
+
+        in description of type :class:`IVirtualSystemDescription`
+            Virtual system description object which describes the
+            machine and all required parameters.
+
+        return progress of type :class:`IProgress`
+            Progress object to track the operation completion.
+
+        """
+        if not isinstance(description, _lib.IVirtualSystemDescription):
+            raise TypeError(
+                "description can only be an instance of type IVirtualSystemDescription"
+            )
+        progress = self._call("launchVM", in_p=[description])
+        progress = _lib.IProgress(progress)
+        return progress
+
+    def get_import_description_form(self, description):
+        """Returns a form for editing the virtual system description for
+        import from cloud.
+
+        in description of type :class:`IVirtualSystemDescription`
+            Virtual system description to be edited.
+
+        out form of type :class:`IVirtualSystemDescriptionForm`
+            An IForm instance for editing the virtual system description.
+
+        return progress of type :class:`IProgress`
+            Progress object to track the operation completion.
+
+        """
+        if not isinstance(description, _lib.IVirtualSystemDescription):
+            raise TypeError(
+                "description can only be an instance of type IVirtualSystemDescription"
+            )
+        progress, form = self._call("getImportDescriptionForm", in_p=[description])
+        progress = _lib.IProgress(progress)
+        form = _lib.IVirtualSystemDescriptionForm(form)
+        return (progress, form)
+
+    def import_instance(self, description, progress):
+        """Import an existing cloud instance to the local host.
+        All needed parameters are passed in the description (VSD).
+
+        in description of type :class:`IVirtualSystemDescription`
+            VirtualSystemDescription object which is describing a machine and all required parameters.
+
+        in progress of type :class:`IProgress`
+            Progress object to track the operation completion.
+
+        """
+        if not isinstance(description, _lib.IVirtualSystemDescription):
+            raise TypeError(
+                "description can only be an instance of type IVirtualSystemDescription"
+            )
+        if not isinstance(progress, _lib.IProgress):
+            raise TypeError("progress can only be an instance of type IProgress")
+        self._call("importInstance", in_p=[description, progress])
+
+    def get_cloud_machine(self, id_p):
+        """Create an object that represents a cloud machine with the
+        specified UUID.  Note that the operation is synchronous.  The
+        returned machine is initiatally in inaccessible state and
+        requires a refresh to get its data from the cloud.
+
+        in id_p of type str
+            UUID of a cloud machine.
+
+        return machine of type :class:`ICloudMachine`
+            Object that represents the cloud machine with the specified UUID.
+
+        """
+        if not isinstance(id_p, basestring):
+            raise TypeError("id_p can only be an instance of type basestring")
+        machine = self._call("getCloudMachine", in_p=[id_p])
+        machine = _lib.ICloudMachine(machine)
+        return machine
+
+    def read_cloud_machine_list(self):
+        """Make the list of cloud machines available via
+        :py:func:`cloud_machine_list`  attribute.
+
+        return progress of type :class:`IProgress`
+            Progress object to track the operation completion.
+
+        """
+        progress = self._call("readCloudMachineList")
+        progress = _lib.IProgress(progress)
+        return progress
+
+    @property
+    def cloud_machine_list(self):
+        """Get ICloudMachine value for 'cloudMachineList'
+        See :py:func:`read_cloud_machine_list` .
+        """
+        ret = self._get_attr("cloudMachineList")
+        return [_lib.ICloudMachine(a) for a in ret]
+
+    def read_cloud_machine_stub_list(self):
+        """Make the list of cloud machine stubs available via
+        :py:func:`cloud_machine_stub_list`  attribute.
+        Like with :py:func:`get_cloud_machine` , the returned machines
+        are initiatally inaccessible and require a refresh to get
+        their data from the cloud.
+
+        return progress of type :class:`IProgress`
+            Progress object to track the operation completion.
+
+        """
+        progress = self._call("readCloudMachineStubList")
+        progress = _lib.IProgress(progress)
+        return progress
+
+    @property
+    def cloud_machine_stub_list(self):
+        """Get ICloudMachine value for 'cloudMachineStubList'
+        See :py:func:`read_cloud_machine_stub_list` .
+        """
+        ret = self._get_attr("cloudMachineStubList")
+        return [_lib.ICloudMachine(a) for a in ret]
+
+    def add_cloud_machine(self, instance_id):
+        """Adopt a running instance and register it as cloud machine.
+        This is kinda like adding a local .vbox file as a local VM.
+
+        in instance_id of type str
+            ID of an instance to be added as a cloud machine.
+
+        out machine of type :class:`ICloudMachine`
+            Object that represents the newly registered cloud machine.
+
+        return progress of type :class:`IProgress`
+            Progress object to track the operation completion.
+
+        """
+        if not isinstance(instance_id, basestring):
+            raise TypeError("instance_id can only be an instance of type basestring")
+        progress, machine = self._call("addCloudMachine", in_p=[instance_id])
+        progress = _lib.IProgress(progress)
+        machine = _lib.ICloudMachine(machine)
+        return (progress, machine)
+
+    def create_cloud_machine(self, description):
+        """This is transitional method that combines
+        :py:func:`launch_vm`  and :py:func:`add_cloud_machine` .
+
+        in description of type :class:`IVirtualSystemDescription`
+            Virtual system description object which describes the
+            machine and all required parameters.
+
+        out machine of type :class:`ICloudMachine`
+            Object that represents the newly created cloud machine.
+
+        return progress of type :class:`IProgress`
+            Progress object to track the operation completion.
+
+        """
+        if not isinstance(description, _lib.IVirtualSystemDescription):
+            raise TypeError(
+                "description can only be an instance of type IVirtualSystemDescription"
+            )
+        progress, machine = self._call("createCloudMachine", in_p=[description])
+        progress = _lib.IProgress(progress)
+        machine = _lib.ICloudMachine(machine)
+        return (progress, machine)
+
+    def list_instances(self, machine_state):
+        """Returns the list of the instances in the Cloud.
+
+        in machine_state of type :class:`CloudMachineState`
+            State of each VM.
+
+        out return_names of type :class:`IStringArray`
+            VM names.
+
+        out return_ids of type :class:`IStringArray`
+            VM ids.
+
+        return progress of type :class:`IProgress`
+            Progress object to track the operation completion.
+
+        """
+        if not isinstance(machine_state, list):
+            raise TypeError("machine_state can only be an instance of type list")
+        for a in machine_state[:10]:
+            if not isinstance(a, _lib.CloudMachineState):
+                raise TypeError(
+                    "array can only contain objects of type CloudMachineState"
+                )
+        progress, return_names, return_ids = self._call(
+            "listInstances", in_p=[machine_state]
+        )
+        progress = _lib.IProgress(progress)
+        return_names = _lib.IStringArray(return_names)
+        return_ids = _lib.IStringArray(return_ids)
+        return (progress, return_names, return_ids)
+
+    def list_source_instances(self):
+        """Returns the list of instances in the cloud that can be
+        added/adopted as VirtualBox cloud machines.
+
+        out return_names of type :class:`IStringArray`
+            Instance names.
+
+        out return_ids of type :class:`IStringArray`
+            Instance idss.
+
+        return progress of type :class:`IProgress`
+            Progress object to track the operation completion.
+
+        """
+        progress, return_names, return_ids = self._call("listSourceInstances")
+        progress = _lib.IProgress(progress)
+        return_names = _lib.IStringArray(return_names)
+        return_ids = _lib.IStringArray(return_ids)
+        return (progress, return_names, return_ids)
+
+    def list_images(self, image_state):
+        """Returns the list of the images in the Cloud.
+
+        in image_state of type :class:`CloudImageState`
+            State of each image.
+
+        out return_names of type :class:`IStringArray`
+            Images names.
+
+        out return_ids of type :class:`IStringArray`
+            Images ids.
+
+        return progress of type :class:`IProgress`
+            Progress object to track the operation completion.
+
+        """
+        if not isinstance(image_state, list):
+            raise TypeError("image_state can only be an instance of type list")
+        for a in image_state[:10]:
+            if not isinstance(a, _lib.CloudImageState):
+                raise TypeError(
+                    "array can only contain objects of type CloudImageState"
+                )
+        progress, return_names, return_ids = self._call(
+            "listImages", in_p=[image_state]
+        )
+        progress = _lib.IProgress(progress)
+        return_names = _lib.IStringArray(return_names)
+        return_ids = _lib.IStringArray(return_ids)
+        return (progress, return_names, return_ids)
+
+    def list_boot_volumes(self):
+        """Returns the list of boot volumes in the Cloud.
+
+        out return_names of type :class:`IStringArray`
+            Boot volume names.
+
+        out return_ids of type :class:`IStringArray`
+            Boot volume ids.
+
+        return progress of type :class:`IProgress`
+            Progress object to track the operation completion.
+
+        """
+        progress, return_names, return_ids = self._call("listBootVolumes")
+        progress = _lib.IProgress(progress)
+        return_names = _lib.IStringArray(return_names)
+        return_ids = _lib.IStringArray(return_ids)
+        return (progress, return_names, return_ids)
+
+    def list_source_boot_volumes(self):
+        """Returns the list of boot volumes in the cloud that can be
+        added/adopted as VirtualBox cloud machines.
+
+        out return_names of type :class:`IStringArray`
+            Boot volume names.
+
+        out return_ids of type :class:`IStringArray`
+            Boot volume ids.
+
+        return progress of type :class:`IProgress`
+            Progress object to track the operation completion.
+
+        """
+        progress, return_names, return_ids = self._call("listSourceBootVolumes")
+        progress = _lib.IProgress(progress)
+        return_names = _lib.IStringArray(return_names)
+        return_ids = _lib.IStringArray(return_ids)
+        return (progress, return_names, return_ids)
+
+    def get_instance_info(self, uid, description):
+        """Returns the information about an instance in the Cloud.
+
+        in uid of type str
+            The id of instance in the Cloud.
+
+        in description of type :class:`IVirtualSystemDescription`
+            VirtualSystemDescription object which is describing a machine
+
+        return progress of type :class:`IProgress`
+            Progress object to track the operation completion.
+
+        """
+        if not isinstance(uid, basestring):
+            raise TypeError("uid can only be an instance of type basestring")
+        if not isinstance(description, _lib.IVirtualSystemDescription):
+            raise TypeError(
+                "description can only be an instance of type IVirtualSystemDescription"
+            )
+        progress = self._call("getInstanceInfo", in_p=[uid, description])
+        progress = _lib.IProgress(progress)
+        return progress
+
+    def start_instance(self, uid):
+        """Start an existing instance with passed id.
+
+        in uid of type str
+            The id of instance in the Cloud.
+
+        return progress of type :class:`IProgress`
+            Progress object to track the operation completion.
+
+        """
+        if not isinstance(uid, basestring):
+            raise TypeError("uid can only be an instance of type basestring")
+        progress = self._call("startInstance", in_p=[uid])
+        progress = _lib.IProgress(progress)
+        return progress
+
+    def pause_instance(self, uid):
+        """Pause an existing instance with passed id.
+
+        in uid of type str
+            The id of instance in the Cloud.
+
+        return progress of type :class:`IProgress`
+            Progress object to track the operation completion.
+
+        """
+        if not isinstance(uid, basestring):
+            raise TypeError("uid can only be an instance of type basestring")
+        progress = self._call("pauseInstance", in_p=[uid])
+        progress = _lib.IProgress(progress)
+        return progress
+
+    def terminate_instance(self, uid):
+        """Terminate an existing instance with passed id.
+
+        in uid of type str
+            the id of instance in the Cloud.
+
+        return progress of type :class:`IProgress`
+            Progress object to track the operation completion.
+
+        """
+        if not isinstance(uid, basestring):
+            raise TypeError("uid can only be an instance of type basestring")
+        progress = self._call("terminateInstance", in_p=[uid])
+        progress = _lib.IProgress(progress)
+        return progress
+
+    def create_image(self, parameters):
+        """Create an image in the Cloud.
+
+        in parameters of type str
+            Each parameter in the array must be in the form "name=value".
+
+        return progress of type :class:`IProgress`
+            Progress object to track the operation completion.
+
+        """
+        if not isinstance(parameters, list):
+            raise TypeError("parameters can only be an instance of type list")
+        for a in parameters[:10]:
+            if not isinstance(a, basestring):
+                raise TypeError("array can only contain objects of type basestring")
+        progress = self._call("createImage", in_p=[parameters])
+        progress = _lib.IProgress(progress)
+        return progress
+
+    def export_image(self, image, parameters):
+        """Export an existing VBox image in the Cloud.
+
+        in image of type :class:`IMedium`
+            Reference to the existing VBox image.
+
+        in parameters of type str
+            Each parameter in the array must be in the form "name=value".
+
+        return progress of type :class:`IProgress`
+            Progress object to track the operation completion.
+
+        """
+        if not isinstance(image, _lib.IMedium):
+            raise TypeError("image can only be an instance of type IMedium")
+        if not isinstance(parameters, list):
+            raise TypeError("parameters can only be an instance of type list")
+        for a in parameters[:10]:
+            if not isinstance(a, basestring):
+                raise TypeError("array can only contain objects of type basestring")
+        progress = self._call("exportImage", in_p=[image, parameters])
+        progress = _lib.IProgress(progress)
+        return progress
+
+    def import_image(self, uid, parameters):
+        """Import an existing image in the Cloud to the local host.
+
+        in uid of type str
+            the id of image in the Cloud.
+
+        in parameters of type str
+            Each parameter in the array must be in the form "name=value".
+
+        return progress of type :class:`IProgress`
+            Progress object to track the operation completion.
+
+        """
+        if not isinstance(uid, basestring):
+            raise TypeError("uid can only be an instance of type basestring")
+        if not isinstance(parameters, list):
+            raise TypeError("parameters can only be an instance of type list")
+        for a in parameters[:10]:
+            if not isinstance(a, basestring):
+                raise TypeError("array can only contain objects of type basestring")
+        progress = self._call("importImage", in_p=[uid, parameters])
+        progress = _lib.IProgress(progress)
+        return progress
+
+    def delete_image(self, uid):
+        """Delete an existing image with passed id from the Cloud.
+
+        in uid of type str
+            The id of image in the Cloud.
+
+        return progress of type :class:`IProgress`
+            Progress object to track the operation completion.
+
+        """
+        if not isinstance(uid, basestring):
+            raise TypeError("uid can only be an instance of type basestring")
+        progress = self._call("deleteImage", in_p=[uid])
+        progress = _lib.IProgress(progress)
+        return progress
+
+    def get_image_info(self, uid):
+        """Returns the information about an image in the Cloud.
+
+        in uid of type str
+            The id of image in the Cloud.
+
+        out info_array of type :class:`IStringArray`
+            An array where the image settings or properties is returned.
+            Each parameter in the array must be in the form "name=value".
+
+        return progress of type :class:`IProgress`
+            Progress object to track the operation completion.
+
+        """
+        if not isinstance(uid, basestring):
+            raise TypeError("uid can only be an instance of type basestring")
+        progress, info_array = self._call("getImageInfo", in_p=[uid])
+        progress = _lib.IProgress(progress)
+        info_array = _lib.IStringArray(info_array)
+        return (progress, info_array)
+
+    def start_cloud_network_gateway(self, network, ssh_public_key):
+        """The id of image in the Cloud.
+
+        in network of type :class:`ICloudNetwork`
+            The id of image in the Cloud.
+
+        in ssh_public_key of type str
+            The id of image in the Cloud.
+
+        out gateway_info of type :class:`ICloudNetworkGatewayInfo`
+            Information about the started gateway.
+
+        return progress of type :class:`IProgress`
+            Progress object to track the operation completion.
+
+        """
+        if not isinstance(network, _lib.ICloudNetwork):
+            raise TypeError("network can only be an instance of type ICloudNetwork")
+        if not isinstance(ssh_public_key, basestring):
+            raise TypeError("ssh_public_key can only be an instance of type basestring")
+        progress, gateway_info = self._call(
+            "startCloudNetworkGateway", in_p=[network, ssh_public_key]
+        )
+        progress = _lib.IProgress(progress)
+        gateway_info = _lib.ICloudNetworkGatewayInfo(gateway_info)
+        return (progress, gateway_info)
+
+    def setup_cloud_network_environment(
+        self,
+        tunnel_network_name,
+        tunnel_network_range,
+        gateway_os_name,
+        gateway_os_version,
+        gateway_shape,
+    ):
+        """The name of tunnelling network to be created in the Cloud. If this parameter
+        is empty the default value "VirtualBox Tunneling Network" is assumed.
+
+        in tunnel_network_name of type str
+            The name of tunnelling network to be created in the Cloud. If this parameter
+            is empty the default value "VirtualBox Tunneling Network" is assumed.
+
+        in tunnel_network_range of type str
+            The IP address range of tunnelling network to be created in the Cloud. If this
+            parameter is empty the default value "10.0.0.0/16" is assumed.
+
+        in gateway_os_name of type str
+            The name of the operating system to be used for cloud gateway instances.
+            The default value is "Oracle Linux".
+
+        in gateway_os_version of type str
+            The version of the operating system to be used for cloud gateway instances.
+            The default value is "7.8".
+
+        in gateway_shape of type str
+            The shape of cloud gateway instance. The default value is "VM.Standard2.1".
+
+        out network_environment_info of type :class:`ICloudNetworkEnvironmentInfo`
+            Information about the created network environment.
+
+        return progress of type :class:`IProgress`
+            Progress object to track the operation completion.
+
+        """
+        if not isinstance(tunnel_network_name, basestring):
+            raise TypeError(
+                "tunnel_network_name can only be an instance of type basestring"
+            )
+        if not isinstance(tunnel_network_range, basestring):
+            raise TypeError(
+                "tunnel_network_range can only be an instance of type basestring"
+            )
+        if not isinstance(gateway_os_name, basestring):
+            raise TypeError(
+                "gateway_os_name can only be an instance of type basestring"
+            )
+        if not isinstance(gateway_os_version, basestring):
+            raise TypeError(
+                "gateway_os_version can only be an instance of type basestring"
+            )
+        if not isinstance(gateway_shape, basestring):
+            raise TypeError("gateway_shape can only be an instance of type basestring")
+        progress, network_environment_info = self._call(
+            "setupCloudNetworkEnvironment",
+            in_p=[
+                tunnel_network_name,
+                tunnel_network_range,
+                gateway_os_name,
+                gateway_os_version,
+                gateway_shape,
+            ],
+        )
+        progress = _lib.IProgress(progress)
+        network_environment_info = _lib.ICloudNetworkEnvironmentInfo(
+            network_environment_info
+        )
+        return (progress, network_environment_info)
@@ -0,0 +1,285 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from ..library_base import Interface
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class ICloudMachine(Interface):
+    """
+    Virtual virtual machine (sic) in the cloud.
+
+    Reading object attributes returns cached values, use
+    :py:func:`refresh`  to refresh them.
+    """
+
+    __uuid__ = "8e3b08e6-a605-11ea-9edf-3bfdab40b718"
+    __wsmap__ = "managed"
+
+    @property
+    def id_p(self):
+        """Get str value for 'id'
+        UUID of the cloud machine.
+        """
+        ret = self._get_attr("id")
+        return ret
+
+    @property
+    def accessible(self):
+        """Get bool value for 'accessible'
+        Whether this virtual machine is currently accessible or not.
+        TBD...
+        """
+        ret = self._get_attr("accessible")
+        return ret
+
+    @property
+    def access_error(self):
+        """Get IVirtualBoxErrorInfo value for 'accessError'
+        Error information describing the reason of machine
+        inaccessibility.
+
+        Reading this property is only valid after the last call to
+        :py:func:`accessible`  returned @c false (i.e. the
+        machine is currently inaccessible). Otherwise, a @c null
+        IVirtualBoxErrorInfo object will be returned.
+        """
+        ret = self._get_attr("accessError")
+        return _lib.IVirtualBoxErrorInfo(ret)
+
+    @property
+    def name(self):
+        """Get str value for 'name'
+        Convenience shortcut to retrieve the name of the cloud
+        machine.  The name is part of the machine settings that are
+        hidden behind the settings form (see :py:func:`get_settings_form` ).
+        """
+        ret = self._get_attr("name")
+        return ret
+
+    @property
+    def os_type_id(self):
+        """Get str value for 'OSTypeId'
+        Convenience shortcut to retrieve the OS Type id of the cloud
+        machine.  It is part of the machine settings that are hidden
+        behind the settings form (see :py:func:`get_settings_form` ).
+        """
+        ret = self._get_attr("OSTypeId")
+        return ret
+
+    @property
+    def state(self):
+        """Get CloudMachineState value for 'state'
+        Machine state.
+        """
+        ret = self._get_attr("state")
+        return _lib.CloudMachineState(ret)
+
+    def refresh(self):
+        """Refresh information by reading it from the cloud.
+
+        return progress of type :class:`IProgress`
+            Progress object to track the operation completion.
+
+        """
+        progress = self._call("refresh")
+        progress = _lib.IProgress(progress)
+        return progress
+
+    def get_details_form(self):
+        """Obtain a form with the current settings for this cloud
+        machine.  The form is not editable.
+
+        return form of type :class:`IForm`
+            A form with the cloud machine settings.
+
+        """
+        form = self._call("getDetailsForm")
+        form = _lib.IForm(form)
+        return form
+
+    def get_settings_form(self):
+        """Obtain a form with settings for this cloud machine.
+        The form is editable.
+
+        out form of type :class:`IForm`
+            A form with the cloud machine settings.
+
+        return progress of type :class:`IProgress`
+            Progress object to track the operation completion.
+
+        """
+        progress, form = self._call("getSettingsForm")
+        progress = _lib.IProgress(progress)
+        form = _lib.IForm(form)
+        return (progress, form)
+
+    def power_up(self):
+        """Start cloud virtual machine execution.
+
+        return progress of type :class:`IProgress`
+            Progress object to track the operation completion.
+
+        """
+        progress = self._call("powerUp")
+        progress = _lib.IProgress(progress)
+        return progress
+
+    def reboot(self):
+        """Reboot cloud virtual machine.
+
+        return progress of type :class:`IProgress`
+            Progress object to track the operation completion.
+
+        """
+        progress = self._call("reboot")
+        progress = _lib.IProgress(progress)
+        return progress
+
+    def shutdown(self):
+        """Shutdown cloud virtual machine.
+
+        return progress of type :class:`IProgress`
+            Progress object to track the operation completion.
+
+        """
+        progress = self._call("shutdown")
+        progress = _lib.IProgress(progress)
+        return progress
+
+    def power_down(self):
+        """Initiates the power down procedure to stop the virtual machine
+        execution.
+
+        The completion of the power down procedure is tracked using the returned
+        IProgress object. After the operation is complete, the machine will go
+        to the PoweredOff state.
+
+        return progress of type :class:`IProgress`
+            Progress object to track the operation completion.
+
+        raises :class:`VBoxErrorInvalidVmState`
+            Virtual machine must be Running, to be powered down.
+
+        """
+        progress = self._call("powerDown")
+        progress = _lib.IProgress(progress)
+        return progress
+
+    def terminate(self):
+        """Terminate cloud virtual machine.
+
+        return progress of type :class:`IProgress`
+            Progress object to track the operation completion.
+
+        """
+        progress = self._call("terminate")
+        progress = _lib.IProgress(progress)
+        return progress
+
+    def unregister(self):
+        """Unregister this cloud machine, but leave the cloud artifacts
+        intact.
+
+        return progress of type :class:`IProgress`
+            Progress object to track the operation completion.
+
+        """
+        progress = self._call("unregister")
+        progress = _lib.IProgress(progress)
+        return progress
+
+    def remove(self):
+        """Unregister this cloud machine and delete all its cloud artifacts.
+
+        return progress of type :class:`IProgress`
+            Progress object to track the operation completion.
+
+        """
+        progress = self._call("remove")
+        progress = _lib.IProgress(progress)
+        return progress
+
+    def create_console_connection(self, ssh_public_key):
+        """SSH public key authorized to connect to the console.
+
+        in ssh_public_key of type str
+            SSH public key authorized to connect to the console.
+
+        return progress of type :class:`IProgress`
+            Progress object to track the operation completion.
+
+        """
+        if not isinstance(ssh_public_key, basestring):
+            raise TypeError("ssh_public_key can only be an instance of type basestring")
+        progress = self._call("createConsoleConnection", in_p=[ssh_public_key])
+        progress = _lib.IProgress(progress)
+        return progress
+
+    def delete_console_connection(self):
+        """Progress object to track the operation completion.
+
+        return progress of type :class:`IProgress`
+            Progress object to track the operation completion.
+
+        """
+        progress = self._call("deleteConsoleConnection")
+        progress = _lib.IProgress(progress)
+        return progress
+
+    @property
+    def console_connection_fingerprint(self):
+        """Get str value for 'consoleConnectionFingerprint'
+        The fingerprint of the ssh key that is authorized to access
+        the machine's console connection.
+        """
+        ret = self._get_attr("consoleConnectionFingerprint")
+        return ret
+
+    @property
+    def serial_console_command(self):
+        """Get str value for 'serialConsoleCommand'
+        The shell command to establish ssh connection to the cloud
+        machine serial console.
+        """
+        ret = self._get_attr("serialConsoleCommand")
+        return ret
+
+    @property
+    def serial_console_command_windows(self):
+        """Get str value for 'serialConsoleCommandWindows'
+        The PowerShell command to establish ssh connection to the
+        cloud machine serial console using PuTTY's plink.
+        """
+        ret = self._get_attr("serialConsoleCommandWindows")
+        return ret
+
+    @property
+    def vnc_console_command(self):
+        """Get str value for 'VNCConsoleCommand'
+        The shell command to establish ssh port forwarding for the
+        VNC connection to the cloud machine console.
+        """
+        ret = self._get_attr("VNCConsoleCommand")
+        return ret
+
+    @property
+    def vnc_console_command_windows(self):
+        """Get str value for 'VNCConsoleCommandWindows'
+        The PowerShell command to establish ssh port forwarding for the
+        VNC connection to the cloud machine console using PuTTY's plink.
+        """
+        ret = self._get_attr("VNCConsoleCommandWindows")
+        return ret
@@ -0,0 +1,96 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from ..library_base import Interface
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class ICloudNetwork(Interface):
+    """
+    TBD: User-friendly, descriptive name of cloud subnet. For example, domain
+    names of subnet and vcn, separated by dot.
+    """
+
+    __uuid__ = "d8e3496e-735f-4fde-8a54-427d49409b5f"
+    __wsmap__ = "managed"
+
+    @property
+    def network_name(self):
+        """Get or set str value for 'networkName'
+        TBD: User-friendly, descriptive name of cloud subnet. For example, domain
+        names of subnet and vcn, separated by dot.
+        """
+        ret = self._get_attr("networkName")
+        return ret
+
+    @network_name.setter
+    def network_name(self, value):
+        if not isinstance(value, basestring):
+            raise TypeError("value is not an instance of basestring")
+        return self._set_attr("networkName", value)
+
+    @property
+    def enabled(self):
+        """Get or set bool value for 'enabled'"""
+        ret = self._get_attr("enabled")
+        return ret
+
+    @enabled.setter
+    def enabled(self, value):
+        if not isinstance(value, bool):
+            raise TypeError("value is not an instance of bool")
+        return self._set_attr("enabled", value)
+
+    @property
+    def provider(self):
+        """Get or set str value for 'provider'
+        Cloud provider short name.
+        """
+        ret = self._get_attr("provider")
+        return ret
+
+    @provider.setter
+    def provider(self, value):
+        if not isinstance(value, basestring):
+            raise TypeError("value is not an instance of basestring")
+        return self._set_attr("provider", value)
+
+    @property
+    def profile(self):
+        """Get or set str value for 'profile'
+        Cloud profile name.
+        """
+        ret = self._get_attr("profile")
+        return ret
+
+    @profile.setter
+    def profile(self, value):
+        if not isinstance(value, basestring):
+            raise TypeError("value is not an instance of basestring")
+        return self._set_attr("profile", value)
+
+    @property
+    def network_id(self):
+        """Get or set str value for 'networkId'
+        Cloud network id.
+        """
+        ret = self._get_attr("networkId")
+        return ret
+
+    @network_id.setter
+    def network_id(self, value):
+        if not isinstance(value, basestring):
+            raise TypeError("value is not an instance of basestring")
+        return self._set_attr("networkId", value)
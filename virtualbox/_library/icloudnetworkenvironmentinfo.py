@@ -0,0 +1,30 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from ..library_base import Interface
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class ICloudNetworkEnvironmentInfo(Interface):
+    """"""
+
+    __uuid__ = "181dfb55-394d-44d3-9edb-af2c4472c40a"
+    __wsmap__ = "managed"
+
+    @property
+    def tunnel_network_id(self):
+        """Get str value for 'tunnelNetworkId'"""
+        ret = self._get_attr("tunnelNetworkId")
+        return ret
@@ -0,0 +1,48 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from ..library_base import Interface
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class ICloudNetworkGatewayInfo(Interface):
+    """"""
+
+    __uuid__ = "89a63ace-0c65-11ea-ad23-0ff257c71a7f"
+    __wsmap__ = "managed"
+
+    @property
+    def public_ip(self):
+        """Get str value for 'publicIP'"""
+        ret = self._get_attr("publicIP")
+        return ret
+
+    @property
+    def secondary_public_ip(self):
+        """Get str value for 'secondaryPublicIP'"""
+        ret = self._get_attr("secondaryPublicIP")
+        return ret
+
+    @property
+    def mac_address(self):
+        """Get str value for 'macAddress'"""
+        ret = self._get_attr("macAddress")
+        return ret
+
+    @property
+    def instance_id(self):
+        """Get str value for 'instanceId'"""
+        ret = self._get_attr("instanceId")
+        return ret
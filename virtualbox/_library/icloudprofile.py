@@ -0,0 +1,174 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from ..library_base import Interface
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class ICloudProfile(Interface):
+    """
+    Returns the profile name.
+    """
+
+    __uuid__ = "b1d978b8-f7b7-4b05-900e-2a9253c00f51"
+    __wsmap__ = "managed"
+
+    @property
+    def name(self):
+        """Get or set str value for 'name'
+        Returns the profile name.
+        """
+        ret = self._get_attr("name")
+        return ret
+
+    @name.setter
+    def name(self, value):
+        if not isinstance(value, basestring):
+            raise TypeError("value is not an instance of basestring")
+        return self._set_attr("name", value)
+
+    @property
+    def provider_id(self):
+        """Get str value for 'providerId'
+        Returns provider identifier tied with this profile.
+        """
+        ret = self._get_attr("providerId")
+        return ret
+
+    def get_property(self, name):
+        """Returns the value of the cloud profile property with the given name.
+
+        If the requested data @a name does not exist, this function will
+        succeed and return an empty string in the @a value argument.
+
+        in name of type str
+            Name of the property to get.
+
+        return value of type str
+            Current property value.
+
+        raises :class:`OleErrorInvalidarg`
+            @a name is @c null or empty.
+
+        """
+        if not isinstance(name, basestring):
+            raise TypeError("name can only be an instance of type basestring")
+        value = self._call("getProperty", in_p=[name])
+        return value
+
+    def set_property(self, name, value):
+        """Sets the value of the cloud profile property with the given name.
+
+        Setting the property value to @c null or an empty string is equivalent
+        to deleting the existing value.
+
+        in name of type str
+            Name of the property to set.
+
+        in value of type str
+            Property value to set.
+
+        raises :class:`OleErrorInvalidarg`
+            @a name is @c null or empty.
+
+        """
+        if not isinstance(name, basestring):
+            raise TypeError("name can only be an instance of type basestring")
+        if not isinstance(value, basestring):
+            raise TypeError("value can only be an instance of type basestring")
+        self._call("setProperty", in_p=[name, value])
+
+    def get_properties(self, names):
+        """Returns values for a group of properties in one call.
+
+        The names of the properties to get are specified using the @a names
+        argument which is a list of comma-separated property names or
+        an empty string if all properties are to be returned.
+        Currently the value of this argument is ignored and the method
+        always returns all existing properties.
+
+        The method returns two arrays, the array of property names corresponding
+        to the @a names argument and the current values of these properties.
+        Both arrays have the same number of elements with each element at the
+        given index in the first array corresponds to an element at the same
+        index in the second array.
+
+        in names of type str
+            Names of properties to get.
+
+        out return_names of type str
+            Names of returned properties.
+
+        return return_values of type str
+            Values of returned properties.
+
+        """
+        if not isinstance(names, basestring):
+            raise TypeError("names can only be an instance of type basestring")
+        return_values, return_names = self._call("getProperties", in_p=[names])
+        return (return_values, return_names)
+
+    def set_properties(self, names, values):
+        """Updates profile, changing/adding/removing properties.
+
+        The names of the properties to set are passed in the @a names
+        array along with the new values for them in the @a values array. Both
+        arrays have the same number of elements with each element at the given
+        index in the first array corresponding to an element at the same index
+        in the second array.
+
+        If there is at least one property name in @a names that is not valid,
+        the method will fail before changing the values of any other properties
+        from the @a names array.
+
+        Using this method over :py:func:`set_property`  is preferred if you
+        need to set several properties at once since it is more efficient.
+
+        Setting the property value to @c null or an empty string is equivalent
+        to deleting the existing value.
+
+        in names of type str
+            Names of properties.
+
+        in values of type str
+            Values of set properties.
+
+        """
+        if not isinstance(names, list):
+            raise TypeError("names can only be an instance of type list")
+        for a in names[:10]:
+            if not isinstance(a, basestring):
+                raise TypeError("array can only contain objects of type basestring")
+        if not isinstance(values, list):
+            raise TypeError("values can only be an instance of type list")
+        for a in values[:10]:
+            if not isinstance(a, basestring):
+                raise TypeError("array can only contain objects of type basestring")
+        self._call("setProperties", in_p=[names, values])
+
+    def remove(self):
+        """Deletes a profile."""
+        self._call("remove")
+
+    def create_cloud_client(self):
+        """Creates a cloud client for this cloud profile.
+
+        return cloud_client of type :class:`ICloudClient`
+            The cloud client object reference.
+
+        """
+        cloud_client = self._call("createCloudClient")
+        cloud_client = _lib.ICloudClient(cloud_client)
+        return cloud_client
@@ -0,0 +1,38 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from .ievent import IEvent
+from .vboxeventtype import VBoxEventType
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class ICloudProfileChangedEvent(IEvent):
+    """"""
+
+    __uuid__ = "83795a4c-fce1-11ea-8a17-636028ae0be2"
+    __wsmap__ = "managed"
+    id = VBoxEventType.on_cloud_profile_changed
+
+    @property
+    def provider_id(self):
+        """Get str value for 'providerId'"""
+        ret = self._get_attr("providerId")
+        return ret
+
+    @property
+    def name(self):
+        """Get str value for 'name'"""
+        ret = self._get_attr("name")
+        return ret
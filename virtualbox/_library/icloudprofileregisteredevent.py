@@ -0,0 +1,44 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from .ievent import IEvent
+from .vboxeventtype import VBoxEventType
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class ICloudProfileRegisteredEvent(IEvent):
+    """"""
+
+    __uuid__ = "6a5e65ba-eeb9-11ea-ae38-73242bc0f172"
+    __wsmap__ = "managed"
+    id = VBoxEventType.on_cloud_profile_registered
+
+    @property
+    def provider_id(self):
+        """Get str value for 'providerId'"""
+        ret = self._get_attr("providerId")
+        return ret
+
+    @property
+    def name(self):
+        """Get str value for 'name'"""
+        ret = self._get_attr("name")
+        return ret
+
+    @property
+    def registered(self):
+        """Get bool value for 'registered'"""
+        ret = self._get_attr("registered")
+        return ret
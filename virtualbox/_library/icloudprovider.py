@@ -0,0 +1,158 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from ..library_base import Interface
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class ICloudProvider(Interface):
+    """
+    Returns the long name of the provider. Includes vendor and precise
+    product name spelled out in the preferred way.
+    """
+
+    __uuid__ = "22363cfc-07da-41ec-ac4a-3dd99db35594"
+    __wsmap__ = "managed"
+
+    @property
+    def name(self):
+        """Get str value for 'name'
+        Returns the long name of the provider. Includes vendor and precise
+        product name spelled out in the preferred way.
+        """
+        ret = self._get_attr("name")
+        return ret
+
+    @property
+    def short_name(self):
+        """Get str value for 'shortName'
+        Returns the short name of the provider. Less than 8 ASCII chars,
+        using acronyms. No vendor name, but can contain a hint if it's a 3rd
+        party implementation for this cloud provider, to keep it unique.
+        """
+        ret = self._get_attr("shortName")
+        return ret
+
+    @property
+    def id_p(self):
+        """Get str value for 'id'
+        Returns the UUID of this cloud provider.
+        """
+        ret = self._get_attr("id")
+        return ret
+
+    @property
+    def profiles(self):
+        """Get ICloudProfile value for 'profiles'
+        Returns all profiles for this cloud provider.
+        """
+        ret = self._get_attr("profiles")
+        return [_lib.ICloudProfile(a) for a in ret]
+
+    @property
+    def profile_names(self):
+        """Get str value for 'profileNames'
+        Returns all profile names for this cloud provider.
+        """
+        ret = self._get_attr("profileNames")
+        return ret
+
+    @property
+    def supported_property_names(self):
+        """Get str value for 'supportedPropertyNames'
+        Returns the supported property names.
+        """
+        ret = self._get_attr("supportedPropertyNames")
+        return ret
+
+    def get_property_description(self, name):
+        """Property name.
+
+        in name of type str
+            Property name.
+
+        return description of type str
+            Property description.
+
+        """
+        if not isinstance(name, basestring):
+            raise TypeError("name can only be an instance of type basestring")
+        description = self._call("getPropertyDescription", in_p=[name])
+        return description
+
+    def create_profile(self, profile_name, names, values):
+        """Creates a new profile.
+
+        in profile_name of type str
+            The profile name. Must not exist, otherwise an error is raised.
+
+        in names of type str
+            Names of properties.
+
+        in values of type str
+            Values of set properties.
+
+        """
+        if not isinstance(profile_name, basestring):
+            raise TypeError("profile_name can only be an instance of type basestring")
+        if not isinstance(names, list):
+            raise TypeError("names can only be an instance of type list")
+        for a in names[:10]:
+            if not isinstance(a, basestring):
+                raise TypeError("array can only contain objects of type basestring")
+        if not isinstance(values, list):
+            raise TypeError("values can only be an instance of type list")
+        for a in values[:10]:
+            if not isinstance(a, basestring):
+                raise TypeError("array can only contain objects of type basestring")
+        self._call("createProfile", in_p=[profile_name, names, values])
+
+    def import_profiles(self):
+        """Import the profiles from the original source"""
+        self._call("importProfiles")
+
+    def restore_profiles(self):
+        """Restores the old local profiles if they exist"""
+        self._call("restoreProfiles")
+
+    def save_profiles(self):
+        """Saves the local profiles"""
+        self._call("saveProfiles")
+
+    def get_profile_by_name(self, profile_name):
+        """
+
+        in profile_name of type str
+
+        return profile of type :class:`ICloudProfile`
+
+        """
+        if not isinstance(profile_name, basestring):
+            raise TypeError("profile_name can only be an instance of type basestring")
+        profile = self._call("getProfileByName", in_p=[profile_name])
+        profile = _lib.ICloudProfile(profile)
+        return profile
+
+    def prepare_uninstall(self):
+        """The caller requests the cloud provider to cease operation. Should
+        return an error if this is currently not possible (due to ongoing
+        cloud activity, possibly by a different API client). However, this
+        must not wait for the completion for a larger amount of time (ideally
+        stays below a second of execution time). If this succeeds it should
+        leave the cloud provider in a state which does not allow starting new
+        operations.
+
+        """
+        self._call("prepareUninstall")
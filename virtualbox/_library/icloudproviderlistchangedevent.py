@@ -0,0 +1,37 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from .ievent import IEvent
+from .vboxeventtype import VBoxEventType
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class ICloudProviderListChangedEvent(IEvent):
+    """
+    Each individual provider that is installed or uninstalled is
+    reported as an :py:class:`ICloudProviderRegisteredEvent` .  When
+    the batch is done this event is sent and listerns can get the
+    new list.
+    """
+
+    __uuid__ = "a54d9cca-f23f-11ea-9755-efd0f1f792d9"
+    __wsmap__ = "managed"
+    id = VBoxEventType.on_cloud_provider_list_changed
+
+    @property
+    def registered(self):
+        """Get bool value for 'registered'"""
+        ret = self._get_attr("registered")
+        return ret
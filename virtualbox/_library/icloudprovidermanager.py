@@ -0,0 +1,76 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from ..library_base import Interface
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class ICloudProviderManager(Interface):
+    """
+    Returns all supported cloud providers.
+    """
+
+    __uuid__ = "9128800f-762e-4120-871c-a2014234a607"
+    __wsmap__ = "managed"
+
+    @property
+    def providers(self):
+        """Get ICloudProvider value for 'providers'
+        Returns all supported cloud providers.
+        """
+        ret = self._get_attr("providers")
+        return [_lib.ICloudProvider(a) for a in ret]
+
+    def get_provider_by_id(self, provider_id):
+        """
+
+        in provider_id of type str
+
+        return provider of type :class:`ICloudProvider`
+
+        """
+        if not isinstance(provider_id, basestring):
+            raise TypeError("provider_id can only be an instance of type basestring")
+        provider = self._call("getProviderById", in_p=[provider_id])
+        provider = _lib.ICloudProvider(provider)
+        return provider
+
+    def get_provider_by_short_name(self, provider_name):
+        """
+
+        in provider_name of type str
+
+        return provider of type :class:`ICloudProvider`
+
+        """
+        if not isinstance(provider_name, basestring):
+            raise TypeError("provider_name can only be an instance of type basestring")
+        provider = self._call("getProviderByShortName", in_p=[provider_name])
+        provider = _lib.ICloudProvider(provider)
+        return provider
+
+    def get_provider_by_name(self, provider_name):
+        """
+
+        in provider_name of type str
+
+        return provider of type :class:`ICloudProvider`
+
+        """
+        if not isinstance(provider_name, basestring):
+            raise TypeError("provider_name can only be an instance of type basestring")
+        provider = self._call("getProviderByName", in_p=[provider_name])
+        provider = _lib.ICloudProvider(provider)
+        return provider
@@ -0,0 +1,41 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from .ievent import IEvent
+from .vboxeventtype import VBoxEventType
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class ICloudProviderRegisteredEvent(IEvent):
+    """
+    A cloud provider was installed or uninstalled.
+    See also :py:class:`ICloudProviderListChangedEvent` .
+    """
+
+    __uuid__ = "e28e227a-f231-11ea-9641-9b500c6d5365"
+    __wsmap__ = "managed"
+    id = VBoxEventType.on_cloud_provider_registered
+
+    @property
+    def id_p(self):
+        """Get str value for 'id'"""
+        ret = self._get_attr("id")
+        return ret
+
+    @property
+    def registered(self):
+        """Get bool value for 'registered'"""
+        ret = self._get_attr("registered")
+        return ret
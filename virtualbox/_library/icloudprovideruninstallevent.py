@@ -0,0 +1,40 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from .ievent import IEvent
+from .vboxeventtype import VBoxEventType
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class ICloudProviderUninstallEvent(IEvent):
+    """
+    A cloud provider is about to be uninstalled.
+    Unlike :py:class:`ICloudProviderRegisteredEvent`  this one is
+    waitable and is sent *before* an attempt is made to
+    uninstall a provider.  Listerns should release references to the
+    provider and related objects if they have any, or the
+    uninstallation of the provider is going to fail because it's
+    still in use.
+    """
+
+    __uuid__ = "f01f1066-f231-11ea-8eee-33bb2afb0b6e"
+    __wsmap__ = "managed"
+    id = VBoxEventType.on_cloud_provider_uninstall
+
+    @property
+    def id_p(self):
+        """Get str value for 'id'"""
+        ret = self._get_attr("id")
+        return ret
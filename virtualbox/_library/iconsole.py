@@ -0,0 +1,717 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from ..library_base import Interface
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IConsole(Interface):
+    """
+    The IConsole interface represents an interface to control virtual
+    machine execution.
+
+    A console object gets created when a machine has been locked for a
+    particular session (client process) using :py:func:`IMachine.lock_machine`
+    or :py:func:`IMachine.launch_vm_process` . The console object can
+    then be found in the session's :py:func:`ISession.console`  attribute.
+
+    Methods of the IConsole interface allow the caller to query the current
+    virtual machine execution state, pause the machine or power it down, save
+    the machine state or take a snapshot, attach and detach removable media
+    and so on.
+
+    :py:class:`ISession`
+    """
+
+    __uuid__ = "872da645-4a9b-1727-bee2-5585105b9eed"
+    __wsmap__ = "managed"
+
+    @property
+    def machine(self):
+        """Get IMachine value for 'machine'
+        Machine object for this console session.
+
+        This is a convenience property, it has the same value as
+        :py:func:`ISession.machine`  of the corresponding session
+        object.
+        """
+        ret = self._get_attr("machine")
+        return _lib.IMachine(ret)
+
+    @property
+    def state(self):
+        """Get MachineState value for 'state'
+        Current execution state of the machine.
+
+        This property always returns the same value as the corresponding
+        property of the IMachine object for this console session.
+        For the process that owns (executes) the VM, this is the
+        preferable way of querying the VM state, because no IPC
+        calls are made.
+        """
+        ret = self._get_attr("state")
+        return _lib.MachineState(ret)
+
+    @property
+    def guest(self):
+        """Get IGuest value for 'guest'
+        Guest object.
+        """
+        ret = self._get_attr("guest")
+        return _lib.IGuest(ret)
+
+    @property
+    def keyboard(self):
+        """Get IKeyboard value for 'keyboard'
+        Virtual keyboard object.
+
+        If the machine is not running, any attempt to use
+        the returned object will result in an error.
+        """
+        ret = self._get_attr("keyboard")
+        return _lib.IKeyboard(ret)
+
+    @property
+    def mouse(self):
+        """Get IMouse value for 'mouse'
+        Virtual mouse object.
+
+        If the machine is not running, any attempt to use
+        the returned object will result in an error.
+        """
+        ret = self._get_attr("mouse")
+        return _lib.IMouse(ret)
+
+    @property
+    def display(self):
+        """Get IDisplay value for 'display'
+        Virtual display object.
+
+        If the machine is not running, any attempt to use
+        the returned object will result in an error.
+        """
+        ret = self._get_attr("display")
+        return _lib.IDisplay(ret)
+
+    @property
+    def debugger(self):
+        """Get IMachineDebugger value for 'debugger'
+        Debugging interface.
+        """
+        ret = self._get_attr("debugger")
+        return _lib.IMachineDebugger(ret)
+
+    @property
+    def usb_devices(self):
+        """Get IUSBDevice value for 'USBDevices'
+        Collection of USB devices currently attached to the virtual
+        USB controller.
+
+        The collection is empty if the machine is not running.
+        """
+        ret = self._get_attr("USBDevices")
+        return [_lib.IUSBDevice(a) for a in ret]
+
+    @property
+    def remote_usb_devices(self):
+        """Get IHostUSBDevice value for 'remoteUSBDevices'
+        List of USB devices currently attached to the remote VRDE client.
+        Once a new device is physically attached to the remote host computer,
+        it appears in this list and remains there until detached.
+        """
+        ret = self._get_attr("remoteUSBDevices")
+        return [_lib.IHostUSBDevice(a) for a in ret]
+
+    @property
+    def shared_folders(self):
+        """Get ISharedFolder value for 'sharedFolders'
+        Collection of shared folders for the current session. These folders
+        are called transient shared folders because they are available to the
+        guest OS running inside the associated virtual machine only for the
+        duration of the session (as opposed to
+        :py:func:`IMachine.shared_folders`  which represent permanent shared
+        folders). When the session is closed (e.g. the machine is powered down),
+        these folders are automatically discarded.
+
+        New shared folders are added to the collection using
+        :py:func:`create_shared_folder` . Existing shared folders can be
+        removed using :py:func:`remove_shared_folder` .
+        """
+        ret = self._get_attr("sharedFolders")
+        return [_lib.ISharedFolder(a) for a in ret]
+
+    @property
+    def vrde_server_info(self):
+        """Get IVRDEServerInfo value for 'VRDEServerInfo'
+        Interface that provides information on Remote Desktop Extension (VRDE) connection.
+        """
+        ret = self._get_attr("VRDEServerInfo")
+        return _lib.IVRDEServerInfo(ret)
+
+    @property
+    def event_source(self):
+        """Get IEventSource value for 'eventSource'
+        Event source for console events.
+        """
+        ret = self._get_attr("eventSource")
+        return _lib.IEventSource(ret)
+
+    @property
+    def attached_pci_devices(self):
+        """Get IPCIDeviceAttachment value for 'attachedPCIDevices'
+        Array of PCI devices attached to this machine.
+        """
+        ret = self._get_attr("attachedPCIDevices")
+        return [_lib.IPCIDeviceAttachment(a) for a in ret]
+
+    @property
+    def use_host_clipboard(self):
+        """Get or set bool value for 'useHostClipboard'
+        Whether the guest clipboard should be connected to the host one or
+        whether it should only be allowed access to the VRDE clipboard. This
+        setting may not affect existing guest clipboard connections which
+        are already connected to the host clipboard.
+        """
+        ret = self._get_attr("useHostClipboard")
+        return ret
+
+    @use_host_clipboard.setter
+    def use_host_clipboard(self, value):
+        if not isinstance(value, bool):
+            raise TypeError("value is not an instance of bool")
+        return self._set_attr("useHostClipboard", value)
+
+    @property
+    def emulated_usb(self):
+        """Get IEmulatedUSB value for 'emulatedUSB'
+        Interface that manages emulated USB devices.
+        """
+        ret = self._get_attr("emulatedUSB")
+        return _lib.IEmulatedUSB(ret)
+
+    def power_up(self):
+        """Starts the virtual machine execution using the current machine
+        state (that is, its current execution state, current settings and
+        current storage devices).
+
+
+        This method is only useful for front-ends that want to actually
+        execute virtual machines in their own process (like the VirtualBox
+        or VBoxSDL front-ends). Unless you are intending to write such a
+        front-end, do not call this method. If you simply want to
+        start virtual machine execution using one of the existing front-ends
+        (for example the VirtualBox GUI or headless server), use
+        :py:func:`IMachine.launch_vm_process`  instead; these
+        front-ends will power up the machine automatically for you.
+
+
+        If the machine is powered off or aborted, the execution will
+        start from the beginning (as if the real hardware were just
+        powered on).
+
+        If the machine is in the :py:attr:`MachineState.saved`  state,
+        it will continue its execution the point where the state has
+        been saved.
+
+        If the machine :py:func:`IMachine.teleporter_enabled`  property is
+        enabled on the machine being powered up, the machine will wait for an
+        incoming teleportation in the :py:attr:`MachineState.teleporting_in`
+        state. The returned progress object will have at least three
+        operations where the last three are defined as: (1) powering up and
+        starting TCP server, (2) waiting for incoming teleportations, and
+        (3) perform teleportation. These operations will be reflected as the
+        last three operations of the progress objected returned by
+        :py:func:`IMachine.launch_vm_process`  as well.
+
+        :py:func:`IMachine.save_state`
+
+        return progress of type :class:`IProgress`
+            Progress object to track the operation completion.
+
+        raises :class:`VBoxErrorInvalidVmState`
+            Virtual machine already running.
+
+        raises :class:`VBoxErrorHostError`
+            Host interface does not exist or name not set.
+
+        raises :class:`VBoxErrorFileError`
+            Invalid saved state file.
+
+        """
+        progress = self._call("powerUp")
+        progress = _lib.IProgress(progress)
+        return progress
+
+    def power_up_paused(self):
+        """Identical to powerUp except that the VM will enter the
+        :py:attr:`MachineState.paused`  state, instead of
+        :py:attr:`MachineState.running` .
+
+        :py:func:`power_up`
+
+        return progress of type :class:`IProgress`
+            Progress object to track the operation completion.
+
+        raises :class:`VBoxErrorInvalidVmState`
+            Virtual machine already running.
+
+        raises :class:`VBoxErrorHostError`
+            Host interface does not exist or name not set.
+
+        raises :class:`VBoxErrorFileError`
+            Invalid saved state file.
+
+        """
+        progress = self._call("powerUpPaused")
+        progress = _lib.IProgress(progress)
+        return progress
+
+    def power_down(self):
+        """Initiates the power down procedure to stop the virtual machine
+        execution.
+
+        The completion of the power down procedure is tracked using the returned
+        IProgress object. After the operation is complete, the machine will go
+        to the PoweredOff state.
+
+        return progress of type :class:`IProgress`
+            Progress object to track the operation completion.
+
+        raises :class:`VBoxErrorInvalidVmState`
+            Virtual machine must be Running, Paused or Stuck to be powered down.
+
+        """
+        progress = self._call("powerDown")
+        progress = _lib.IProgress(progress)
+        return progress
+
+    def reset(self):
+        """Resets the virtual machine.
+
+        raises :class:`VBoxErrorInvalidVmState`
+            Virtual machine not in Running state.
+
+        raises :class:`VBoxErrorVmError`
+            Virtual machine error in reset operation.
+
+        """
+        self._call("reset")
+
+    def pause(self):
+        """Pauses the virtual machine execution.
+
+        raises :class:`VBoxErrorInvalidVmState`
+            Virtual machine not in Running state.
+
+        raises :class:`VBoxErrorVmError`
+            Virtual machine error in suspend operation.
+
+        """
+        self._call("pause")
+
+    def resume(self):
+        """Resumes the virtual machine execution.
+
+        raises :class:`VBoxErrorInvalidVmState`
+            Virtual machine not in Paused state.
+
+        raises :class:`VBoxErrorVmError`
+            Virtual machine error in resume operation.
+
+        """
+        self._call("resume")
+
+    def power_button(self):
+        """Sends the ACPI power button event to the guest.
+
+        raises :class:`VBoxErrorInvalidVmState`
+            Virtual machine not in Running state.
+
+        raises :class:`VBoxErrorPdmError`
+            Controlled power off failed.
+
+        """
+        self._call("powerButton")
+
+    def sleep_button(self):
+        """Sends the ACPI sleep button event to the guest.
+
+        raises :class:`VBoxErrorInvalidVmState`
+            Virtual machine not in Running state.
+
+        raises :class:`VBoxErrorPdmError`
+            Sending sleep button event failed.
+
+        """
+        self._call("sleepButton")
+
+    def get_power_button_handled(self):
+        """Checks if the last power button event was handled by guest.
+
+        return handled of type bool
+
+        raises :class:`VBoxErrorPdmError`
+            Checking if the event was handled by the guest OS failed.
+
+        """
+        handled = self._call("getPowerButtonHandled")
+        return handled
+
+    def get_guest_entered_acpi_mode(self):
+        """Checks if the guest entered the ACPI mode G0 (working) or
+        G1 (sleeping). If this method returns @c false, the guest will
+        most likely not respond to external ACPI events.
+
+        return entered of type bool
+
+        raises :class:`VBoxErrorInvalidVmState`
+            Virtual machine not in Running state.
+
+        """
+        entered = self._call("getGuestEnteredACPIMode")
+        return entered
+
+    def get_device_activity(self, type_p):
+        """Gets the current activity type of given devices or device groups.
+
+        in type_p of type :class:`DeviceType`
+
+        return activity of type :class:`DeviceActivity`
+
+        raises :class:`OleErrorInvalidarg`
+            Invalid device type.
+
+        """
+        if not isinstance(type_p, list):
+            raise TypeError("type_p can only be an instance of type list")
+        for a in type_p[:10]:
+            if not isinstance(a, _lib.DeviceType):
+                raise TypeError("array can only contain objects of type DeviceType")
+        activity = self._call("getDeviceActivity", in_p=[type_p])
+        activity = [_lib.DeviceActivity(a) for a in activity]
+        return activity
+
+    def attach_usb_device(self, id_p, capture_filename):
+        """Attaches a host USB device with the given UUID to the
+        USB controller of the virtual machine.
+
+        The device needs to be in one of the following states:
+        :py:attr:`USBDeviceState.busy` ,
+        :py:attr:`USBDeviceState.available`  or
+        :py:attr:`USBDeviceState.held` ,
+        otherwise an error is immediately returned.
+
+        When the device state is
+        :py:attr:`USBDeviceState.busy` Busy, an error may also
+        be returned if the host computer refuses to release it for some reason.
+
+        :py:func:`IUSBDeviceFilters.device_filters` ,
+        :py:class:`USBDeviceState`
+
+        in id_p of type str
+            UUID of the host USB device to attach.
+
+        in capture_filename of type str
+            Filename to capture the USB traffic to.
+
+        raises :class:`VBoxErrorInvalidVmState`
+            Virtual machine state neither Running nor Paused.
+
+        raises :class:`VBoxErrorPdmError`
+            Virtual machine does not have a USB controller.
+
+        """
+        if not isinstance(id_p, basestring):
+            raise TypeError("id_p can only be an instance of type basestring")
+        if not isinstance(capture_filename, basestring):
+            raise TypeError(
+                "capture_filename can only be an instance of type basestring"
+            )
+        self._call("attachUSBDevice", in_p=[id_p, capture_filename])
+
+    def detach_usb_device(self, id_p):
+        """Detaches an USB device with the given UUID from the USB controller
+        of the virtual machine.
+
+        After this method succeeds, the VirtualBox server re-initiates
+        all USB filters as if the device were just physically attached
+        to the host, but filters of this machine are ignored to avoid
+        a possible automatic re-attachment.
+
+        :py:func:`IUSBDeviceFilters.device_filters` ,
+        :py:class:`USBDeviceState`
+
+        in id_p of type str
+            UUID of the USB device to detach.
+
+        return device of type :class:`IUSBDevice`
+            Detached USB device.
+
+        raises :class:`VBoxErrorPdmError`
+            Virtual machine does not have a USB controller.
+
+        raises :class:`OleErrorInvalidarg`
+            USB device not attached to this virtual machine.
+
+        """
+        if not isinstance(id_p, basestring):
+            raise TypeError("id_p can only be an instance of type basestring")
+        device = self._call("detachUSBDevice", in_p=[id_p])
+        device = _lib.IUSBDevice(device)
+        return device
+
+    def find_usb_device_by_address(self, name):
+        """Searches for a USB device with the given host address.
+
+
+
+        :py:func:`IUSBDevice.address`
+
+        in name of type str
+            Address of the USB device (as assigned by the host) to
+            search for.
+
+        return device of type :class:`IUSBDevice`
+            Found USB device object.
+
+        raises :class:`VBoxErrorObjectNotFound`
+            Given @c name does not correspond to any USB device.
+
+        """
+        if not isinstance(name, basestring):
+            raise TypeError("name can only be an instance of type basestring")
+        device = self._call("findUSBDeviceByAddress", in_p=[name])
+        device = _lib.IUSBDevice(device)
+        return device
+
+    def find_usb_device_by_id(self, id_p):
+        """Searches for a USB device with the given UUID.
+
+
+
+        :py:func:`IUSBDevice.id_p`
+
+        in id_p of type str
+            UUID of the USB device to search for.
+
+        return device of type :class:`IUSBDevice`
+            Found USB device object.
+
+        raises :class:`VBoxErrorObjectNotFound`
+            Given @c id does not correspond to any USB device.
+
+        """
+        if not isinstance(id_p, basestring):
+            raise TypeError("id_p can only be an instance of type basestring")
+        device = self._call("findUSBDeviceById", in_p=[id_p])
+        device = _lib.IUSBDevice(device)
+        return device
+
+    def create_shared_folder(
+        self, name, host_path, writable, automount, auto_mount_point
+    ):
+        """Creates a transient new shared folder by associating the given logical
+        name with the given host path, adds it to the collection of shared
+        folders and starts sharing it. Refer to the description of
+        :py:class:`ISharedFolder`  to read more about logical names.
+
+        in name of type str
+            Unique logical name of the shared folder.
+
+        in host_path of type str
+            Full path to the shared folder in the host file system.
+
+        in writable of type bool
+            Whether the share is writable or readonly
+
+        in automount of type bool
+            Whether the share gets automatically mounted by the guest
+            or not.
+
+        in auto_mount_point of type str
+            Where the guest should automatically mount the folder, if possible.
+            For Windows and OS/2 guests this should be a drive letter, while other
+            guests it should be a absolute directory.
+
+        raises :class:`VBoxErrorInvalidVmState`
+            Virtual machine in Saved state or currently changing state.
+
+        raises :class:`VBoxErrorFileError`
+            Shared folder already exists or not accessible.
+
+        """
+        if not isinstance(name, basestring):
+            raise TypeError("name can only be an instance of type basestring")
+        if not isinstance(host_path, basestring):
+            raise TypeError("host_path can only be an instance of type basestring")
+        if not isinstance(writable, bool):
+            raise TypeError("writable can only be an instance of type bool")
+        if not isinstance(automount, bool):
+            raise TypeError("automount can only be an instance of type bool")
+        if not isinstance(auto_mount_point, basestring):
+            raise TypeError(
+                "auto_mount_point can only be an instance of type basestring"
+            )
+        self._call(
+            "createSharedFolder",
+            in_p=[name, host_path, writable, automount, auto_mount_point],
+        )
+
+    def remove_shared_folder(self, name):
+        """Removes a transient shared folder with the given name previously
+        created by :py:func:`create_shared_folder`  from the collection of
+        shared folders and stops sharing it.
+
+        in name of type str
+            Logical name of the shared folder to remove.
+
+        raises :class:`VBoxErrorInvalidVmState`
+            Virtual machine in Saved state or currently changing state.
+
+        raises :class:`VBoxErrorFileError`
+            Shared folder does not exists.
+
+        """
+        if not isinstance(name, basestring):
+            raise TypeError("name can only be an instance of type basestring")
+        self._call("removeSharedFolder", in_p=[name])
+
+    def teleport(self, hostname, tcpport, password, max_downtime):
+        """Teleport the VM to a different host machine or process.
+
+        @todo Explain the details.
+
+        in hostname of type str
+            The name or IP of the host to teleport to.
+
+        in tcpport of type int
+            The TCP port to connect to (1..65535).
+
+        in password of type str
+            The password.
+
+        in max_downtime of type int
+            The maximum allowed downtime given as milliseconds. 0 is not a valid
+            value. Recommended value: 250 ms.
+
+            The higher the value is, the greater the chance for a successful
+            teleportation. A small value may easily result in the teleportation
+            process taking hours and eventually fail.
+
+
+            The current implementation treats this a guideline, not as an
+            absolute rule.
+
+        return progress of type :class:`IProgress`
+            Progress object to track the operation completion.
+
+        raises :class:`VBoxErrorInvalidVmState`
+            Virtual machine not running or paused.
+
+        """
+        if not isinstance(hostname, basestring):
+            raise TypeError("hostname can only be an instance of type basestring")
+        if not isinstance(tcpport, baseinteger):
+            raise TypeError("tcpport can only be an instance of type baseinteger")
+        if not isinstance(password, basestring):
+            raise TypeError("password can only be an instance of type basestring")
+        if not isinstance(max_downtime, baseinteger):
+            raise TypeError("max_downtime can only be an instance of type baseinteger")
+        progress = self._call(
+            "teleport", in_p=[hostname, tcpport, password, max_downtime]
+        )
+        progress = _lib.IProgress(progress)
+        return progress
+
+    def add_disk_encryption_password(self, id_p, password, clear_on_suspend):
+        """Adds a password used for hard disk encryption/decryption.
+
+                in id_p of type str
+                    The identifier used for the password. Must match the identifier
+                    used when the encrypted medium was created.
+
+                in password of type str
+                    The password.
+
+                in clear_on_suspend of type bool
+                    Flag whether to clear the password on VM suspend (due to a suspending host
+                    for example). The password must be supplied again before the VM can resume.
+
+                raises :class:`VBoxErrorPasswordIncorrect`
+                    The password provided wasn't correct for at least one disk using the provided
+        ID.
+
+        """
+        if not isinstance(id_p, basestring):
+            raise TypeError("id_p can only be an instance of type basestring")
+        if not isinstance(password, basestring):
+            raise TypeError("password can only be an instance of type basestring")
+        if not isinstance(clear_on_suspend, bool):
+            raise TypeError("clear_on_suspend can only be an instance of type bool")
+        self._call("addDiskEncryptionPassword", in_p=[id_p, password, clear_on_suspend])
+
+    def add_disk_encryption_passwords(self, ids, passwords, clear_on_suspend):
+        """Adds a password used for hard disk encryption/decryption.
+
+                in ids of type str
+                    List of identifiers for the passwords. Must match the identifier
+                    used when the encrypted medium was created.
+
+                in passwords of type str
+                    List of passwords.
+
+                in clear_on_suspend of type bool
+                    Flag whether to clear the given passwords on VM suspend (due to a suspending host
+                    for example). The passwords must be supplied again before the VM can resume.
+
+                raises :class:`VBoxErrorPasswordIncorrect`
+                    The password provided wasn't correct for at least one disk using the provided
+        ID.
+
+        """
+        if not isinstance(ids, list):
+            raise TypeError("ids can only be an instance of type list")
+        for a in ids[:10]:
+            if not isinstance(a, basestring):
+                raise TypeError("array can only contain objects of type basestring")
+        if not isinstance(passwords, list):
+            raise TypeError("passwords can only be an instance of type list")
+        for a in passwords[:10]:
+            if not isinstance(a, basestring):
+                raise TypeError("array can only contain objects of type basestring")
+        if not isinstance(clear_on_suspend, bool):
+            raise TypeError("clear_on_suspend can only be an instance of type bool")
+        self._call(
+            "addDiskEncryptionPasswords", in_p=[ids, passwords, clear_on_suspend]
+        )
+
+    def remove_disk_encryption_password(self, id_p):
+        """Removes a password used for hard disk encryption/decryption from
+        the running VM. As soon as the medium requiring this password
+        is accessed the VM is paused with an error and the password must be
+        provided again.
+
+        in id_p of type str
+            The identifier used for the password. Must match the identifier
+            used when the encrypted medium was created.
+
+        """
+        if not isinstance(id_p, basestring):
+            raise TypeError("id_p can only be an instance of type basestring")
+        self._call("removeDiskEncryptionPassword", in_p=[id_p])
+
+    def clear_all_disk_encryption_passwords(self):
+        """Clears all provided supplied disk encryption passwords."""
+        self._call("clearAllDiskEncryptionPasswords")
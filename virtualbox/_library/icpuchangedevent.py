@@ -0,0 +1,44 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from .ievent import IEvent
+from .vboxeventtype import VBoxEventType
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class ICPUChangedEvent(IEvent):
+    """
+    Notification when a CPU changes.
+    """
+
+    __uuid__ = "4da2dec7-71b2-4817-9a64-4ed12c17388e"
+    __wsmap__ = "managed"
+    id = VBoxEventType.on_cpu_changed
+
+    @property
+    def cpu(self):
+        """Get int value for 'CPU'
+        The CPU which changed.
+        """
+        ret = self._get_attr("CPU")
+        return ret
+
+    @property
+    def add(self):
+        """Get bool value for 'add'
+        Flag whether the CPU was added or removed.
+        """
+        ret = self._get_attr("add")
+        return ret
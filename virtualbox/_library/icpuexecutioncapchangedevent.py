@@ -0,0 +1,36 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from .ievent import IEvent
+from .vboxeventtype import VBoxEventType
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class ICPUExecutionCapChangedEvent(IEvent):
+    """
+    Notification when the CPU execution cap changes.
+    """
+
+    __uuid__ = "dfa7e4f5-b4a4-44ce-85a8-127ac5eb59dc"
+    __wsmap__ = "managed"
+    id = VBoxEventType.on_cpu_execution_cap_changed
+
+    @property
+    def execution_cap(self):
+        """Get int value for 'executionCap'
+        The new CPU execution cap value. (1-100)
+        """
+        ret = self._get_attr("executionCap")
+        return ret
@@ -0,0 +1,50 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from ..library_base import Interface
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class ICPUProfile(Interface):
+    """
+    CPU profile. Immutable.
+    """
+
+    __uuid__ = "b7fda727-7a08-46ee-8dd8-f8d7308b519c"
+    __wsmap__ = "managed"
+
+    @property
+    def name(self):
+        """Get str value for 'name'
+        The name.
+        """
+        ret = self._get_attr("name")
+        return ret
+
+    @property
+    def full_name(self):
+        """Get str value for 'fullName'
+        The full name.
+        """
+        ret = self._get_attr("fullName")
+        return ret
+
+    @property
+    def architecture(self):
+        """Get CPUArchitecture value for 'architecture'
+        The CPU architecture.
+        """
+        ret = self._get_attr("architecture")
+        return _lib.CPUArchitecture(ret)
@@ -0,0 +1,52 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from .ievent import IEvent
+from .vboxeventtype import VBoxEventType
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class ICursorPositionChangedEvent(IEvent):
+    """
+    The guest reports cursor position data.
+    """
+
+    __uuid__ = "6f302674-c927-11e7-b788-33c248e71fc7"
+    __wsmap__ = "managed"
+    id = VBoxEventType.on_cursor_position_changed
+
+    @property
+    def has_data(self):
+        """Get bool value for 'hasData'
+        Event contains valid data.  If not set, switch back to using the host cursor.
+        """
+        ret = self._get_attr("hasData")
+        return ret
+
+    @property
+    def x(self):
+        """Get int value for 'x'
+        Reported X position
+        """
+        ret = self._get_attr("x")
+        return ret
+
+    @property
+    def y(self):
+        """Get int value for 'y'
+        Reported Y position
+        """
+        ret = self._get_attr("y")
+        return ret
@@ -0,0 +1,62 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from ..library_base import Interface
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IDataStream(Interface):
+    """
+    The IDataStream interface is used to retrieve a data stream. It is
+    returned by :py:func:`IMediumIO.convert_to_stream` .
+    """
+
+    __uuid__ = "a338ed20-58d9-43ae-8b03-c1fd7088ef15"
+    __wsmap__ = "managed"
+
+    @property
+    def read_size(self):
+        """Get int value for 'readSize'
+        Recommended size of a read. Requesting a larger read may be
+        possible in certain situations, but it is not guaranteed.
+        """
+        ret = self._get_attr("readSize")
+        return ret
+
+    def read(self, size, timeout_ms):
+        """Read data from the stream.
+
+        in size of type int
+            How many bytes to try read.
+
+        in timeout_ms of type int
+            Timeout (in ms) for limiting the wait time for data to be available.
+            Pass 0 for an infinite timeout.
+
+        return data of type str
+            Array of data read. This may be shorter than the specified size.
+            Returning a zero-sized array indicates the end of the stream, if the
+            status is successful.
+
+        raises :class:`VBoxErrorTimeout`
+            Waiting time has expired.
+
+        """
+        if not isinstance(size, baseinteger):
+            raise TypeError("size can only be an instance of type baseinteger")
+        if not isinstance(timeout_ms, baseinteger):
+            raise TypeError("timeout_ms can only be an instance of type baseinteger")
+        data = self._call("read", in_p=[size, timeout_ms])
+        return data
@@ -0,0 +1,202 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from ..library_base import Interface
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IDHCPConfig(Interface):
+    """
+    The DHCP server has several configuration levels: global, group and
+    individual MAC.  This interface implements the settings common to
+    each level.
+    """
+
+    __uuid__ = "00f4a8dc-0002-4b81-0077-1dcb004571ba"
+    __wsmap__ = "managed"
+
+    @property
+    def scope(self):
+        """Get DHCPConfigScope value for 'scope'
+        Indicates the kind of config this is (mostly for IDHCPIndividualConfig).
+        """
+        ret = self._get_attr("scope")
+        return _lib.DHCPConfigScope(ret)
+
+    @property
+    def min_lease_time(self):
+        """Get or set int value for 'minLeaseTime'
+        The minimum lease time in seconds, ignored if zero.
+        """
+        ret = self._get_attr("minLeaseTime")
+        return ret
+
+    @min_lease_time.setter
+    def min_lease_time(self, value):
+        if not isinstance(value, baseinteger):
+            raise TypeError("value is not an instance of baseinteger")
+        return self._set_attr("minLeaseTime", value)
+
+    @property
+    def default_lease_time(self):
+        """Get or set int value for 'defaultLeaseTime'
+        The default lease time in seconds, ignored if zero.
+        """
+        ret = self._get_attr("defaultLeaseTime")
+        return ret
+
+    @default_lease_time.setter
+    def default_lease_time(self, value):
+        if not isinstance(value, baseinteger):
+            raise TypeError("value is not an instance of baseinteger")
+        return self._set_attr("defaultLeaseTime", value)
+
+    @property
+    def max_lease_time(self):
+        """Get or set int value for 'maxLeaseTime'
+        The maximum lease time in seconds, ignored if zero.
+        """
+        ret = self._get_attr("maxLeaseTime")
+        return ret
+
+    @max_lease_time.setter
+    def max_lease_time(self, value):
+        if not isinstance(value, baseinteger):
+            raise TypeError("value is not an instance of baseinteger")
+        return self._set_attr("maxLeaseTime", value)
+
+    @property
+    def forced_options(self):
+        """Get or set DHCPOption value for 'forcedOptions'
+        List of DHCP options which should be forced upon the clients in this
+        config scope when they are available, whether the clients asks for them
+        or not.
+        """
+        ret = self._get_attr("forcedOptions")
+        return [_lib.DHCPOption(a) for a in ret]
+
+    @forced_options.setter
+    def forced_options(self, value):
+        if not isinstance(value, _lib.DHCPOption):
+            raise TypeError("value is not an instance of DHCPOption")
+        return self._set_attr("forcedOptions", value)
+
+    @property
+    def suppressed_options(self):
+        """Get or set DHCPOption value for 'suppressedOptions'
+        List of DHCP options which should not be sent to the clients in
+        this config scope.  This is intended for cases where one client or a
+        group of clients shouldn't see one or more (typically global) options.
+        """
+        ret = self._get_attr("suppressedOptions")
+        return [_lib.DHCPOption(a) for a in ret]
+
+    @suppressed_options.setter
+    def suppressed_options(self, value):
+        if not isinstance(value, _lib.DHCPOption):
+            raise TypeError("value is not an instance of DHCPOption")
+        return self._set_attr("suppressedOptions", value)
+
+    def set_option(self, option, encoding, value):
+        """Sets a DHCP option.
+
+        in option of type :class:`DHCPOption`
+            The DHCP option.
+
+        in encoding of type :class:`DHCPOptionEncoding`
+            The value encoding.
+
+        in value of type str
+            The DHCP option value.  The exact format depends on the DHCP
+            @a option value and @a encoding, see see :py:class:`DHCPOption`
+            for the :py:attr:`DHCPOptionEncoding.normal`  format.
+
+        """
+        if not isinstance(option, _lib.DHCPOption):
+            raise TypeError("option can only be an instance of type DHCPOption")
+        if not isinstance(encoding, _lib.DHCPOptionEncoding):
+            raise TypeError(
+                "encoding can only be an instance of type DHCPOptionEncoding"
+            )
+        if not isinstance(value, basestring):
+            raise TypeError("value can only be an instance of type basestring")
+        self._call("setOption", in_p=[option, encoding, value])
+
+    def remove_option(self, option):
+        """Removes the given DHCP option.
+
+        in option of type :class:`DHCPOption`
+
+        """
+        if not isinstance(option, _lib.DHCPOption):
+            raise TypeError("option can only be an instance of type DHCPOption")
+        self._call("removeOption", in_p=[option])
+
+    def remove_all_options(self):
+        """Removes all the options.
+
+        One exception here is the DhcpOpt_SubnetMask option in the global scope
+        that is linked to the :py:func:`IDHCPServer.network_mask`  attribute
+        and therefore cannot be removed.
+
+        """
+        self._call("removeAllOptions")
+
+    def get_option(self, option):
+        """Gets the value of a single DHCP option.
+
+        in option of type :class:`DHCPOption`
+            The DHCP option being sought.
+
+        out encoding of type :class:`DHCPOptionEncoding`
+            The value encoding.
+
+        return value of type str
+            The value of the requested DHCP option. The exact format depends on
+            the DHCP @a option value and the @a encoding, see :py:class:`DHCPOption`
+            for the :py:attr:`DHCPOptionEncoding.normal`  format.
+
+        """
+        if not isinstance(option, _lib.DHCPOption):
+            raise TypeError("option can only be an instance of type DHCPOption")
+        value, encoding = self._call("getOption", in_p=[option])
+        encoding = _lib.DHCPOptionEncoding(encoding)
+        return (value, encoding)
+
+    def get_all_options(self):
+        """Gets all DHCP options and their values
+
+        out options of type :class:`DHCPOption`
+            Array containing the DHCP option numbers.
+
+        out encodings of type :class:`DHCPOptionEncoding`
+            Array of value encodings that runs parallel to @a options.
+
+        return values of type str
+            Array of values that runs parallel to @a options and @a encodings.  The
+            format depends on both of those.
+
+        """
+        values, options, encodings = self._call("getAllOptions")
+        options = [_lib.DHCPOption(a) for a in options]
+        encodings = [_lib.DHCPOptionEncoding(a) for a in encodings]
+        return (values, options, encodings)
+
+    def remove(self):
+        """Remove this group or individual configuration.
+        Will of course not work on global configurations.
+
+        """
+        self._call("remove")
@@ -0,0 +1,26 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from .idhcpconfig import IDHCPConfig
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IDHCPGlobalConfig(IDHCPConfig):
+    """
+    The global DHCP server configuration, see :py:func:`IDHCPServer.global_config` .
+    """
+
+    __uuid__ = "46735de7-f4c4-4020-a185-0d2881bcfa8b"
+    __wsmap__ = "managed"
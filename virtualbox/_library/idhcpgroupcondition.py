@@ -0,0 +1,72 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from ..library_base import Interface
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IDHCPGroupCondition(Interface):
+    """
+    Whether this is an inclusive or exclusive group membership condition
+    """
+
+    __uuid__ = "5ca9e537-5a1d-43f1-6f27-6a0db298a9a8"
+    __wsmap__ = "managed"
+
+    @property
+    def inclusive(self):
+        """Get or set bool value for 'inclusive'
+        Whether this is an inclusive or exclusive group membership condition
+        """
+        ret = self._get_attr("inclusive")
+        return ret
+
+    @inclusive.setter
+    def inclusive(self, value):
+        if not isinstance(value, bool):
+            raise TypeError("value is not an instance of bool")
+        return self._set_attr("inclusive", value)
+
+    @property
+    def type_p(self):
+        """Get or set DHCPGroupConditionType value for 'type'
+        Defines how the :py:func:`IDHCPGroupCondition.value`  is interpreted.
+        """
+        ret = self._get_attr("type")
+        return _lib.DHCPGroupConditionType(ret)
+
+    @type_p.setter
+    def type_p(self, value):
+        if not isinstance(value, _lib.DHCPGroupConditionType):
+            raise TypeError("value is not an instance of DHCPGroupConditionType")
+        return self._set_attr("type", value)
+
+    @property
+    def value(self):
+        """Get or set str value for 'value'
+        The condition value.
+        """
+        ret = self._get_attr("value")
+        return ret
+
+    @value.setter
+    def value(self, value):
+        if not isinstance(value, basestring):
+            raise TypeError("value is not an instance of basestring")
+        return self._set_attr("value", value)
+
+    def remove(self):
+        """Remove this condition from the group."""
+        self._call("remove")
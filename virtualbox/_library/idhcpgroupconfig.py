@@ -0,0 +1,79 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from .idhcpconfig import IDHCPConfig
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IDHCPGroupConfig(IDHCPConfig):
+    """
+    A configuration that applies to a group of NICs.
+    """
+
+    __uuid__ = "537707f7-ebf9-4d5c-7aea-877bfc4256ba"
+    __wsmap__ = "managed"
+
+    @property
+    def name(self):
+        """Get or set str value for 'name'
+        The group name.
+        """
+        ret = self._get_attr("name")
+        return ret
+
+    @name.setter
+    def name(self, value):
+        if not isinstance(value, basestring):
+            raise TypeError("value is not an instance of basestring")
+        return self._set_attr("name", value)
+
+    @property
+    def conditions(self):
+        """Get IDHCPGroupCondition value for 'conditions'
+        Group membership conditions.
+
+        Add new conditions by calling :py:func:`IDHCPGroupConfig.add_condition`
+        and use :py:func:`IDHCPGroupCondition.remove`  to remove.
+        """
+        ret = self._get_attr("conditions")
+        return [_lib.IDHCPGroupCondition(a) for a in ret]
+
+    def add_condition(self, inclusive, type_p, value):
+        """Adds a new condition.
+
+        in inclusive of type bool
+
+        in type_p of type :class:`DHCPGroupConditionType`
+
+        in value of type str
+
+        return condition of type :class:`IDHCPGroupCondition`
+
+        """
+        if not isinstance(inclusive, bool):
+            raise TypeError("inclusive can only be an instance of type bool")
+        if not isinstance(type_p, _lib.DHCPGroupConditionType):
+            raise TypeError(
+                "type_p can only be an instance of type DHCPGroupConditionType"
+            )
+        if not isinstance(value, basestring):
+            raise TypeError("value can only be an instance of type basestring")
+        condition = self._call("addCondition", in_p=[inclusive, type_p, value])
+        condition = _lib.IDHCPGroupCondition(condition)
+        return condition
+
+    def remove_all_conditions(self):
+        """Removes all conditions."""
+        self._call("removeAllConditions")
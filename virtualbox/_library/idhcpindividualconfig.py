@@ -0,0 +1,67 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from .idhcpconfig import IDHCPConfig
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IDHCPIndividualConfig(IDHCPConfig):
+    """
+    Configuration for a single NIC, either given directly by MAC address or by
+    VM + adaptor slot number.
+    """
+
+    __uuid__ = "c40c2b86-73a5-46cc-8227-93fe57d006a6"
+    __wsmap__ = "managed"
+
+    @property
+    def mac_address(self):
+        """Get str value for 'MACAddress'
+        The MAC address.  If a :py:attr:`DHCPConfigScope.machine_nic`  config, this
+        will be queried via the VM ID.
+        """
+        ret = self._get_attr("MACAddress")
+        return ret
+
+    @property
+    def machine_id(self):
+        """Get str value for 'machineId'
+        The virtual machine ID if a :py:attr:`DHCPConfigScope.machine_nic`  config,
+        null UUID for :py:attr:`DHCPConfigScope.mac` .
+        """
+        ret = self._get_attr("machineId")
+        return ret
+
+    @property
+    def slot(self):
+        """Get int value for 'slot'
+        The NIC slot number of the VM if a :py:attr:`DHCPConfigScope.machine_nic`  config.
+        """
+        ret = self._get_attr("slot")
+        return ret
+
+    @property
+    def fixed_address(self):
+        """Get or set str value for 'fixedAddress'
+        Fixed IPv4 address assignment, dynamic if empty.
+        """
+        ret = self._get_attr("fixedAddress")
+        return ret
+
+    @fixed_address.setter
+    def fixed_address(self, value):
+        if not isinstance(value, basestring):
+            raise TypeError("value is not an instance of basestring")
+        return self._set_attr("fixedAddress", value)
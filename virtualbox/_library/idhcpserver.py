@@ -0,0 +1,263 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from ..library_base import Interface
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IDHCPServer(Interface):
+    """
+    The IDHCPServer interface represents the VirtualBox DHCP server configuration.
+
+    To enumerate all the DHCP servers on the host, use the
+    :py:func:`IVirtualBox.dhcp_servers`  attribute.
+    """
+
+    __uuid__ = "cadef0a2-a1a9-4ac2-8e80-c049af69dac8"
+    __wsmap__ = "managed"
+
+    @property
+    def event_source(self):
+        """Get IEventSource value for 'eventSource'"""
+        ret = self._get_attr("eventSource")
+        return _lib.IEventSource(ret)
+
+    @property
+    def enabled(self):
+        """Get or set bool value for 'enabled'
+        specifies if the DHCP server is enabled
+        """
+        ret = self._get_attr("enabled")
+        return ret
+
+    @enabled.setter
+    def enabled(self, value):
+        if not isinstance(value, bool):
+            raise TypeError("value is not an instance of bool")
+        return self._set_attr("enabled", value)
+
+    @property
+    def ip_address(self):
+        """Get str value for 'IPAddress'
+        specifies server IP
+        """
+        ret = self._get_attr("IPAddress")
+        return ret
+
+    @property
+    def network_mask(self):
+        """Get str value for 'networkMask'
+        specifies server network mask
+        """
+        ret = self._get_attr("networkMask")
+        return ret
+
+    @property
+    def network_name(self):
+        """Get str value for 'networkName'
+        specifies internal network name the server is used for
+        """
+        ret = self._get_attr("networkName")
+        return ret
+
+    @property
+    def lower_ip(self):
+        """Get str value for 'lowerIP'
+        specifies from IP address in server address range
+        """
+        ret = self._get_attr("lowerIP")
+        return ret
+
+    @property
+    def upper_ip(self):
+        """Get str value for 'upperIP'
+        specifies to IP address in server address range
+        """
+        ret = self._get_attr("upperIP")
+        return ret
+
+    @property
+    def global_config(self):
+        """Get IDHCPGlobalConfig value for 'globalConfig'
+        Global configuration that applies to all clients.
+        """
+        ret = self._get_attr("globalConfig")
+        return _lib.IDHCPGlobalConfig(ret)
+
+    @property
+    def group_configs(self):
+        """Get IDHCPGroupConfig value for 'groupConfigs'
+        Configuration groups that applies to selected clients, selection is flexible.
+        """
+        ret = self._get_attr("groupConfigs")
+        return [_lib.IDHCPGroupConfig(a) for a in ret]
+
+    @property
+    def individual_configs(self):
+        """Get IDHCPIndividualConfig value for 'individualConfigs'
+        Individual NIC configurations either by MAC address or VM + NIC number.
+        """
+        ret = self._get_attr("individualConfigs")
+        return [_lib.IDHCPIndividualConfig(a) for a in ret]
+
+    def set_configuration(
+        self, ip_address, network_mask, from_ip_address, to_ip_address
+    ):
+        """configures the server
+
+        in ip_address of type str
+            server IP address
+
+        in network_mask of type str
+            server network mask
+
+        in from_ip_address of type str
+            server From IP address for address range
+
+        in to_ip_address of type str
+            server To IP address for address range
+
+        raises :class:`OleErrorInvalidarg`
+            invalid configuration supplied
+
+        """
+        if not isinstance(ip_address, basestring):
+            raise TypeError("ip_address can only be an instance of type basestring")
+        if not isinstance(network_mask, basestring):
+            raise TypeError("network_mask can only be an instance of type basestring")
+        if not isinstance(from_ip_address, basestring):
+            raise TypeError(
+                "from_ip_address can only be an instance of type basestring"
+            )
+        if not isinstance(to_ip_address, basestring):
+            raise TypeError("to_ip_address can only be an instance of type basestring")
+        self._call(
+            "setConfiguration",
+            in_p=[ip_address, network_mask, from_ip_address, to_ip_address],
+        )
+
+    def start(self, trunk_name, trunk_type):
+        """Starts DHCP server process.
+
+        in trunk_name of type str
+            Name of internal network trunk.
+
+        in trunk_type of type str
+            Type of internal network trunk.
+
+        raises :class:`OleErrorFail`
+            Failed to start the process.
+
+        """
+        if not isinstance(trunk_name, basestring):
+            raise TypeError("trunk_name can only be an instance of type basestring")
+        if not isinstance(trunk_type, basestring):
+            raise TypeError("trunk_type can only be an instance of type basestring")
+        self._call("start", in_p=[trunk_name, trunk_type])
+
+    def stop(self):
+        """Stops DHCP server process.
+
+        raises :class:`OleErrorFail`
+            Failed to stop the process.
+
+        """
+        self._call("stop")
+
+    def restart(self):
+        """Restart running DHCP server process.
+
+        raises :class:`OleErrorFail`
+            Failed to restart the process.
+
+        """
+        self._call("restart")
+
+    def find_lease_by_mac(self, mac, type_p):
+        """Queries the persistent lease database by MAC address.
+
+        This is handy if the host wants to connect to a server running inside
+        a VM on a host only network.
+
+        in mac of type str
+            The MAC address to look up.
+
+        in type_p of type int
+            Reserved, MBZ.
+
+        out address of type str
+            The assigned address.
+
+        out state of type str
+            The lease state.
+
+        out issued of type int
+            Timestamp of when the lease was issued, in seconds since 1970-01-01 UTC.
+
+        out expire of type int
+            Timestamp of when the lease expires/expired, in seconds since 1970-01-01 UTC.
+
+        raises :class:`VBoxErrorObjectNotFound`
+            If MAC address not in the database.
+
+        raises :class:`VBoxErrorFileError`
+            If not able to read the lease database file.
+
+        """
+        if not isinstance(mac, basestring):
+            raise TypeError("mac can only be an instance of type basestring")
+        if not isinstance(type_p, baseinteger):
+            raise TypeError("type_p can only be an instance of type baseinteger")
+        address, state, issued, expire = self._call(
+            "findLeaseByMAC", in_p=[mac, type_p]
+        )
+        return (address, state, issued, expire)
+
+    def get_config(self, scope, name, slot, may_add):
+        """Gets or adds a configuration.
+
+        in scope of type :class:`DHCPConfigScope`
+            The kind of configuration being sought or added.
+
+        in name of type str
+            Meaning depends on the @a scope:
+            - Ignored when the @a scope is :py:attr:`DHCPConfigScope.global_p` .
+            - A VM name or UUID for :py:attr:`DHCPConfigScope.machine_nic` .
+            - A MAC address for :py:attr:`DHCPConfigScope.mac` .
+            - A group name for :py:attr:`DHCPConfigScope.group` .
+
+        in slot of type int
+            The NIC slot when @a scope is set to :py:attr:`DHCPConfigScope.machine_nic` ,
+            must be zero for all other scope values.
+
+        in may_add of type bool
+            Set to @c TRUE if the configuration should be added if not found.
+            If set to @c FALSE the method will fail with VBOX_E_OBJECT_NOT_FOUND.
+
+        return config of type :class:`IDHCPConfig`
+            The requested configuration.
+
+        """
+        if not isinstance(scope, _lib.DHCPConfigScope):
+            raise TypeError("scope can only be an instance of type DHCPConfigScope")
+        if not isinstance(name, basestring):
+            raise TypeError("name can only be an instance of type basestring")
+        if not isinstance(slot, baseinteger):
+            raise TypeError("slot can only be an instance of type baseinteger")
+        if not isinstance(may_add, bool):
+            raise TypeError("may_add can only be an instance of type bool")
+        config = self._call("getConfig", in_p=[scope, name, slot, may_add])
+        config = _lib.IDHCPConfig(config)
+        return config
@@ -0,0 +1,64 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from ..library_base import Interface
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IDirectory(Interface):
+    """
+    Abstract parent interface for directories handled by VirtualBox.
+    """
+
+    __uuid__ = "758d7eac-e4b1-486a-8f2e-747ae346c3e9"
+    __wsmap__ = "managed"
+
+    @property
+    def directory_name(self):
+        """Get str value for 'directoryName'
+        The path specified when opening the directory.
+        """
+        ret = self._get_attr("directoryName")
+        return ret
+
+    @property
+    def filter_p(self):
+        """Get str value for 'filter'
+        Directory listing filter to (specified when opening the directory).
+        """
+        ret = self._get_attr("filter")
+        return ret
+
+    def close(self):
+        """Closes this directory. After closing operations like reading the next
+        directory entry will not be possible anymore.
+
+        """
+        self._call("close")
+
+    def read(self):
+        """Reads the next directory entry of this directory.
+
+        return obj_info of type :class:`IFsObjInfo`
+            Object information of the current directory entry read. Also see
+            :py:class:`IFsObjInfo` .
+
+        raises :class:`VBoxErrorObjectNotFound`
+            No more directory entries to read.
+
+        """
+        obj_info = self._call("read")
+        obj_info = _lib.IFsObjInfo(obj_info)
+        return obj_info
@@ -0,0 +1,657 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from ..library_base import Interface
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IDisplay(Interface):
+    """
+    The IDisplay interface represents the virtual machine's display.
+
+    The object implementing this interface is contained in each
+    :py:func:`IConsole.display`  attribute and represents the visual
+    output of the virtual machine.
+
+    The virtual display supports pluggable output targets represented by the
+    IFramebuffer interface. Examples of the output target are a window on
+    the host computer or an RDP session's display on a remote computer.
+    """
+
+    __uuid__ = "4680b2de-8690-11e9-b83d-5719e53cf1de"
+    __wsmap__ = "managed"
+
+    @property
+    def guest_screen_layout(self):
+        """Get IGuestScreenInfo value for 'guestScreenLayout'
+        Layout of the guest screens.
+        """
+        ret = self._get_attr("guestScreenLayout")
+        return [_lib.IGuestScreenInfo(a) for a in ret]
+
+    def get_screen_resolution(self, screen_id):
+        """Queries certain attributes such as display width, height, color depth
+        and the X and Y origin for a given guest screen.
+
+        The parameters @a xOrigin and @a yOrigin return the X and Y
+        coordinates of the framebuffer's origin.
+
+        All return parameters are optional.
+
+        in screen_id of type int
+
+        out width of type int
+
+        out height of type int
+
+        out bits_per_pixel of type int
+
+        out x_origin of type int
+
+        out y_origin of type int
+
+        out guest_monitor_status of type :class:`GuestMonitorStatus`
+
+        """
+        if not isinstance(screen_id, baseinteger):
+            raise TypeError("screen_id can only be an instance of type baseinteger")
+        (
+            width,
+            height,
+            bits_per_pixel,
+            x_origin,
+            y_origin,
+            guest_monitor_status,
+        ) = self._call("getScreenResolution", in_p=[screen_id])
+        guest_monitor_status = _lib.GuestMonitorStatus(guest_monitor_status)
+        return (width, height, bits_per_pixel, x_origin, y_origin, guest_monitor_status)
+
+    def attach_framebuffer(self, screen_id, framebuffer):
+        """Sets the graphics update target for a screen.
+
+        in screen_id of type int
+
+        in framebuffer of type :class:`IFramebuffer`
+
+        return id_p of type str
+
+        """
+        if not isinstance(screen_id, baseinteger):
+            raise TypeError("screen_id can only be an instance of type baseinteger")
+        if not isinstance(framebuffer, _lib.IFramebuffer):
+            raise TypeError("framebuffer can only be an instance of type IFramebuffer")
+        id_p = self._call("attachFramebuffer", in_p=[screen_id, framebuffer])
+        return id_p
+
+    def detach_framebuffer(self, screen_id, id_p):
+        """Removes the graphics updates target for a screen.
+
+        in screen_id of type int
+
+        in id_p of type str
+
+        """
+        if not isinstance(screen_id, baseinteger):
+            raise TypeError("screen_id can only be an instance of type baseinteger")
+        if not isinstance(id_p, basestring):
+            raise TypeError("id_p can only be an instance of type basestring")
+        self._call("detachFramebuffer", in_p=[screen_id, id_p])
+
+    def query_framebuffer(self, screen_id):
+        """Queries the graphics updates targets for a screen.
+
+        in screen_id of type int
+
+        return framebuffer of type :class:`IFramebuffer`
+
+        """
+        if not isinstance(screen_id, baseinteger):
+            raise TypeError("screen_id can only be an instance of type baseinteger")
+        framebuffer = self._call("queryFramebuffer", in_p=[screen_id])
+        framebuffer = _lib.IFramebuffer(framebuffer)
+        return framebuffer
+
+    def set_video_mode_hint(
+        self,
+        display,
+        enabled,
+        change_origin,
+        origin_x,
+        origin_y,
+        width,
+        height,
+        bits_per_pixel,
+        notify,
+    ):
+        """Changes the monitor information reported by a given output of the guest
+        graphics device.  This information can be read by the guest if suitable
+        drivers and driver tools are available, including but not limited to
+        those in the Guest Additions.  The guest will receive monitor hotplug
+        notification when the monitor information is changed, and the
+        information itself will be available to the guest until the next change.
+        The information should not be resent if the guest does not resize in
+        response.  The guest might have chosen to ignore the change, or the
+        resize might happen later when a suitable driver is started.
+
+        Specifying @c 0 for either @a width, @a height or @a bitsPerPixel
+        parameters means that the corresponding values should be taken from the
+        current video mode (i.e. left unchanged).
+
+        @todo Rename this to @a setMonitorInfo for 7.0.
+
+        in display of type int
+            The number of the guest output to change.
+
+        in enabled of type bool
+            @c True if a monitor is connected,
+            @c False otherwise.
+            For historical reasons the Windows drivers can
+            and do override this setting.  Call this a virtual hardware quirk.
+
+        in change_origin of type bool
+            @c True, if the position of the guest screen is specified,
+            @c False otherwise.
+
+        in origin_x of type int
+            The X origin of the guest screen.
+
+        in origin_y of type int
+            The Y origin of the guest screen.
+
+        in width of type int
+            The width of the guest screen.
+
+        in height of type int
+            The height of the guest screen.
+
+        in bits_per_pixel of type int
+            The number of bits per pixel of the guest screen.
+
+        in notify of type bool
+            Whether the guest should be notified of the change.  Normally this
+            is wished, but it might not be when re-setting monitor information
+            from the last session (no hotplug happened, as it is still the same
+            virtual monitor).  Might also be useful if several monitors are to be
+            changed at once, but this would not reflect physical hardware well,
+            and we also have @a setScreenLayout for that.
+
+        raises :class:`OleErrorInvalidarg`
+            The @a display value is higher then the number of outputs.
+
+        """
+        if not isinstance(display, baseinteger):
+            raise TypeError("display can only be an instance of type baseinteger")
+        if not isinstance(enabled, bool):
+            raise TypeError("enabled can only be an instance of type bool")
+        if not isinstance(change_origin, bool):
+            raise TypeError("change_origin can only be an instance of type bool")
+        if not isinstance(origin_x, baseinteger):
+            raise TypeError("origin_x can only be an instance of type baseinteger")
+        if not isinstance(origin_y, baseinteger):
+            raise TypeError("origin_y can only be an instance of type baseinteger")
+        if not isinstance(width, baseinteger):
+            raise TypeError("width can only be an instance of type baseinteger")
+        if not isinstance(height, baseinteger):
+            raise TypeError("height can only be an instance of type baseinteger")
+        if not isinstance(bits_per_pixel, baseinteger):
+            raise TypeError(
+                "bits_per_pixel can only be an instance of type baseinteger"
+            )
+        if not isinstance(notify, bool):
+            raise TypeError("notify can only be an instance of type bool")
+        self._call(
+            "setVideoModeHint",
+            in_p=[
+                display,
+                enabled,
+                change_origin,
+                origin_x,
+                origin_y,
+                width,
+                height,
+                bits_per_pixel,
+                notify,
+            ],
+        )
+
+    def get_video_mode_hint(self, display):
+        """Queries the monitor information for a given guest output.  See
+        @a setVideoModeHint.  If no monitor information has been set yet by a
+        front-end the preferred mode values returned will be zero.
+
+        @todo Rename this to @a getMonitorInfo for 7.0.
+
+        in display of type int
+            The number of the guest output to query.
+
+        out enabled of type bool
+            @c True if a monitor is connected,
+            @c False otherwise.
+            For historical reasons the Windows drivers can
+            and do override the setting requested by the host.
+
+        out change_origin of type bool
+            @c True, if the position of the guest screen was specified,
+            @c False otherwise.
+
+        out origin_x of type int
+            The X origin of the guest screen.
+
+        out origin_y of type int
+            The Y origin of the guest screen.
+
+        out width of type int
+            The width of the monitor preferred mode.
+
+        out height of type int
+            The height of the monitor preferred mode.
+
+        out bits_per_pixel of type int
+            The number of bits per pixel of the monitor preferred mode.
+
+        raises :class:`OleErrorInvalidarg`
+            The @a display value is higher than the number of outputs.
+
+        """
+        if not isinstance(display, baseinteger):
+            raise TypeError("display can only be an instance of type baseinteger")
+        (
+            enabled,
+            change_origin,
+            origin_x,
+            origin_y,
+            width,
+            height,
+            bits_per_pixel,
+        ) = self._call("getVideoModeHint", in_p=[display])
+        return (
+            enabled,
+            change_origin,
+            origin_x,
+            origin_y,
+            width,
+            height,
+            bits_per_pixel,
+        )
+
+    def set_seamless_mode(self, enabled):
+        """Enables or disables seamless guest display rendering (seamless desktop
+        integration) mode.
+
+        Calling this method has no effect if :py:func:`IGuest.get_facility_status`  with facility @c Seamless
+        does not return @c Active.
+
+        in enabled of type bool
+
+        """
+        if not isinstance(enabled, bool):
+            raise TypeError("enabled can only be an instance of type bool")
+        self._call("setSeamlessMode", in_p=[enabled])
+
+    def take_screen_shot(self, screen_id, address, width, height, bitmap_format):
+        """Takes a screen shot of the requested size and format and copies it to the
+        buffer allocated by the caller and pointed to by @a address.
+        The buffer size must be enough for a 32 bits per pixel bitmap,
+        i.e. width * height * 4 bytes.
+
+        This API can be used only locally by a VM process through the
+        COM/XPCOM C++ API as it requires pointer support. It is not
+        available for scripting languages, Java or any webservice clients.
+        Unless you are writing a new VM frontend use
+        :py:func:`take_screen_shot_to_array` .
+
+        in screen_id of type int
+
+        in address of type str
+
+        in width of type int
+
+        in height of type int
+
+        in bitmap_format of type :class:`BitmapFormat`
+
+        """
+        if not isinstance(screen_id, baseinteger):
+            raise TypeError("screen_id can only be an instance of type baseinteger")
+        if not isinstance(address, basestring):
+            raise TypeError("address can only be an instance of type basestring")
+        if not isinstance(width, baseinteger):
+            raise TypeError("width can only be an instance of type baseinteger")
+        if not isinstance(height, baseinteger):
+            raise TypeError("height can only be an instance of type baseinteger")
+        if not isinstance(bitmap_format, _lib.BitmapFormat):
+            raise TypeError(
+                "bitmap_format can only be an instance of type BitmapFormat"
+            )
+        self._call(
+            "takeScreenShot", in_p=[screen_id, address, width, height, bitmap_format]
+        )
+
+    def take_screen_shot_to_array(self, screen_id, width, height, bitmap_format):
+        """Takes a guest screen shot of the requested size and format
+        and returns it as an array of bytes.
+
+        in screen_id of type int
+            The guest monitor to take screenshot from.
+
+        in width of type int
+            Desired image width.
+
+        in height of type int
+            Desired image height.
+
+        in bitmap_format of type :class:`BitmapFormat`
+            The requested format.
+
+        return screen_data of type str
+            Array with resulting screen data.
+
+        """
+        if not isinstance(screen_id, baseinteger):
+            raise TypeError("screen_id can only be an instance of type baseinteger")
+        if not isinstance(width, baseinteger):
+            raise TypeError("width can only be an instance of type baseinteger")
+        if not isinstance(height, baseinteger):
+            raise TypeError("height can only be an instance of type baseinteger")
+        if not isinstance(bitmap_format, _lib.BitmapFormat):
+            raise TypeError(
+                "bitmap_format can only be an instance of type BitmapFormat"
+            )
+        screen_data = self._call(
+            "takeScreenShotToArray", in_p=[screen_id, width, height, bitmap_format]
+        )
+        return screen_data
+
+    def draw_to_screen(self, screen_id, address, x, y, width, height):
+        """Draws a 32-bpp image of the specified size from the given buffer
+        to the given point on the VM display.
+
+        in screen_id of type int
+            Monitor to take the screenshot from.
+
+        in address of type str
+            Address to store the screenshot to
+
+        in x of type int
+            Relative to the screen top left corner.
+
+        in y of type int
+            Relative to the screen top left corner.
+
+        in width of type int
+            Desired image width.
+
+        in height of type int
+            Desired image height.
+
+        raises :class:`OleErrorNotimpl`
+            Feature not implemented.
+
+        raises :class:`VBoxErrorIprtError`
+            Could not draw to screen.
+
+        """
+        if not isinstance(screen_id, baseinteger):
+            raise TypeError("screen_id can only be an instance of type baseinteger")
+        if not isinstance(address, basestring):
+            raise TypeError("address can only be an instance of type basestring")
+        if not isinstance(x, baseinteger):
+            raise TypeError("x can only be an instance of type baseinteger")
+        if not isinstance(y, baseinteger):
+            raise TypeError("y can only be an instance of type baseinteger")
+        if not isinstance(width, baseinteger):
+            raise TypeError("width can only be an instance of type baseinteger")
+        if not isinstance(height, baseinteger):
+            raise TypeError("height can only be an instance of type baseinteger")
+        self._call("drawToScreen", in_p=[screen_id, address, x, y, width, height])
+
+    def invalidate_and_update(self):
+        """Does a full invalidation of the VM display and instructs the VM
+        to update it.
+
+        raises :class:`VBoxErrorIprtError`
+            Could not invalidate and update screen.
+
+        """
+        self._call("invalidateAndUpdate")
+
+    def invalidate_and_update_screen(self, screen_id):
+        """Redraw the specified VM screen.
+
+        in screen_id of type int
+            The guest screen to redraw.
+
+        """
+        if not isinstance(screen_id, baseinteger):
+            raise TypeError("screen_id can only be an instance of type baseinteger")
+        self._call("invalidateAndUpdateScreen", in_p=[screen_id])
+
+    def complete_vhwa_command(self, command):
+        """Signals that the Video HW Acceleration command has completed.
+
+        in command of type str
+            Pointer to VBOXVHWACMD containing the completed command.
+
+        """
+        if not isinstance(command, basestring):
+            raise TypeError("command can only be an instance of type basestring")
+        self._call("completeVHWACommand", in_p=[command])
+
+    def viewport_changed(self, screen_id, x, y, width, height):
+        """Signals that framebuffer window viewport has changed.
+
+        in screen_id of type int
+            Monitor to take the screenshot from.
+
+        in x of type int
+            Framebuffer x offset.
+
+        in y of type int
+            Framebuffer y offset.
+
+        in width of type int
+            Viewport width.
+
+        in height of type int
+            Viewport height.
+
+        raises :class:`OleErrorInvalidarg`
+            The specified viewport data is invalid.
+
+        """
+        if not isinstance(screen_id, baseinteger):
+            raise TypeError("screen_id can only be an instance of type baseinteger")
+        if not isinstance(x, baseinteger):
+            raise TypeError("x can only be an instance of type baseinteger")
+        if not isinstance(y, baseinteger):
+            raise TypeError("y can only be an instance of type baseinteger")
+        if not isinstance(width, baseinteger):
+            raise TypeError("width can only be an instance of type baseinteger")
+        if not isinstance(height, baseinteger):
+            raise TypeError("height can only be an instance of type baseinteger")
+        self._call("viewportChanged", in_p=[screen_id, x, y, width, height])
+
+    def query_source_bitmap(self, screen_id):
+        """Obtains the guest screen bitmap parameters.
+
+        in screen_id of type int
+
+        out display_source_bitmap of type :class:`IDisplaySourceBitmap`
+
+        """
+        if not isinstance(screen_id, baseinteger):
+            raise TypeError("screen_id can only be an instance of type baseinteger")
+        display_source_bitmap = self._call("querySourceBitmap", in_p=[screen_id])
+        display_source_bitmap = _lib.IDisplaySourceBitmap(display_source_bitmap)
+        return display_source_bitmap
+
+    def notify_scale_factor_change(
+        self, screen_id, u32_scale_factor_w_multiplied, u32_scale_factor_h_multiplied
+    ):
+        """Notify OpenGL HGCM host service about graphics content scaling factor change.
+
+        in screen_id of type int
+
+        in u32_scale_factor_w_multiplied of type int
+
+        in u32_scale_factor_h_multiplied of type int
+
+        """
+        if not isinstance(screen_id, baseinteger):
+            raise TypeError("screen_id can only be an instance of type baseinteger")
+        if not isinstance(u32_scale_factor_w_multiplied, baseinteger):
+            raise TypeError(
+                "u32_scale_factor_w_multiplied can only be an instance of type baseinteger"
+            )
+        if not isinstance(u32_scale_factor_h_multiplied, baseinteger):
+            raise TypeError(
+                "u32_scale_factor_h_multiplied can only be an instance of type baseinteger"
+            )
+        self._call(
+            "notifyScaleFactorChange",
+            in_p=[
+                screen_id,
+                u32_scale_factor_w_multiplied,
+                u32_scale_factor_h_multiplied,
+            ],
+        )
+
+    def notify_hi_dpi_output_policy_change(self, f_unscaled_hi_dpi):
+        """Notify OpenGL HGCM host service about HiDPI monitor scaling policy change.
+
+        in f_unscaled_hi_dpi of type bool
+
+        """
+        if not isinstance(f_unscaled_hi_dpi, bool):
+            raise TypeError("f_unscaled_hi_dpi can only be an instance of type bool")
+        self._call("notifyHiDPIOutputPolicyChange", in_p=[f_unscaled_hi_dpi])
+
+    def set_screen_layout(self, screen_layout_mode, guest_screen_info):
+        """Set video modes for the guest screens.
+
+        in screen_layout_mode of type :class:`ScreenLayoutMode`
+
+        in guest_screen_info of type :class:`IGuestScreenInfo`
+
+        """
+        if not isinstance(screen_layout_mode, _lib.ScreenLayoutMode):
+            raise TypeError(
+                "screen_layout_mode can only be an instance of type ScreenLayoutMode"
+            )
+        if not isinstance(guest_screen_info, list):
+            raise TypeError("guest_screen_info can only be an instance of type list")
+        for a in guest_screen_info[:10]:
+            if not isinstance(a, _lib.IGuestScreenInfo):
+                raise TypeError(
+                    "array can only contain objects of type IGuestScreenInfo"
+                )
+        self._call("setScreenLayout", in_p=[screen_layout_mode, guest_screen_info])
+
+    def detach_screens(self, screen_ids):
+        """Unplugs monitors from the virtual graphics card.
+
+        in screen_ids of type int
+
+        """
+        if not isinstance(screen_ids, list):
+            raise TypeError("screen_ids can only be an instance of type list")
+        for a in screen_ids[:10]:
+            if not isinstance(a, baseinteger):
+                raise TypeError("array can only contain objects of type baseinteger")
+        self._call("detachScreens", in_p=[screen_ids])
+
+    def create_guest_screen_info(
+        self,
+        display,
+        status,
+        primary,
+        change_origin,
+        origin_x,
+        origin_y,
+        width,
+        height,
+        bits_per_pixel,
+    ):
+        """Make a IGuestScreenInfo object with the provided parameters.
+
+        in display of type int
+            The number of the guest display.
+
+        in status of type :class:`GuestMonitorStatus`
+            @c True, if this guest screen is enabled,
+            @c False otherwise.
+
+        in primary of type bool
+            Whether this guest monitor must be primary.
+
+        in change_origin of type bool
+            @c True, if the origin of the guest screen should be changed,
+            @c False otherwise.
+
+        in origin_x of type int
+            The X origin of the guest screen.
+
+        in origin_y of type int
+            The Y origin of the guest screen.
+
+        in width of type int
+            The width of the guest screen.
+
+        in height of type int
+            The height of the guest screen.
+
+        in bits_per_pixel of type int
+            The number of bits per pixel of the guest screen.
+
+        return guest_screen_info of type :class:`IGuestScreenInfo`
+            The created object.
+
+        """
+        if not isinstance(display, baseinteger):
+            raise TypeError("display can only be an instance of type baseinteger")
+        if not isinstance(status, _lib.GuestMonitorStatus):
+            raise TypeError("status can only be an instance of type GuestMonitorStatus")
+        if not isinstance(primary, bool):
+            raise TypeError("primary can only be an instance of type bool")
+        if not isinstance(change_origin, bool):
+            raise TypeError("change_origin can only be an instance of type bool")
+        if not isinstance(origin_x, baseinteger):
+            raise TypeError("origin_x can only be an instance of type baseinteger")
+        if not isinstance(origin_y, baseinteger):
+            raise TypeError("origin_y can only be an instance of type baseinteger")
+        if not isinstance(width, baseinteger):
+            raise TypeError("width can only be an instance of type baseinteger")
+        if not isinstance(height, baseinteger):
+            raise TypeError("height can only be an instance of type baseinteger")
+        if not isinstance(bits_per_pixel, baseinteger):
+            raise TypeError(
+                "bits_per_pixel can only be an instance of type baseinteger"
+            )
+        guest_screen_info = self._call(
+            "createGuestScreenInfo",
+            in_p=[
+                display,
+                status,
+                primary,
+                change_origin,
+                origin_x,
+                origin_y,
+                width,
+                height,
+                bits_per_pixel,
+            ],
+        )
+        guest_screen_info = _lib.IGuestScreenInfo(guest_screen_info)
+        return guest_screen_info
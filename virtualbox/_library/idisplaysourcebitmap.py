@@ -0,0 +1,59 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from ..library_base import Interface
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IDisplaySourceBitmap(Interface):
+    """
+    Information about the screen bitmap.
+    """
+
+    __uuid__ = "5094f67a-8084-11e9-b185-dbe296e54799"
+    __wsmap__ = "suppress"
+
+    @property
+    def screen_id(self):
+        """Get int value for 'screenId'"""
+        ret = self._get_attr("screenId")
+        return ret
+
+    def query_bitmap_info(self):
+        """Information about the screen bitmap.
+
+        out address of type str
+
+        out width of type int
+
+        out height of type int
+
+        out bits_per_pixel of type int
+
+        out bytes_per_line of type int
+
+        out bitmap_format of type :class:`BitmapFormat`
+
+        """
+        (
+            address,
+            width,
+            height,
+            bits_per_pixel,
+            bytes_per_line,
+            bitmap_format,
+        ) = self._call("queryBitmapInfo")
+        bitmap_format = _lib.BitmapFormat(bitmap_format)
+        return (address, width, height, bits_per_pixel, bytes_per_line, bitmap_format)
@@ -0,0 +1,77 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from ..library_base import Interface
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IDnDBase(Interface):
+    """
+    Base abstract interface for drag'n drop.
+    """
+
+    __uuid__ = "00727A73-000A-4C4A-006D-E7D300351186"
+    __wsmap__ = "managed"
+
+    @property
+    def formats(self):
+        """Get str value for 'formats'
+        Returns all supported drag'n drop formats.
+        """
+        ret = self._get_attr("formats")
+        return ret
+
+    def is_format_supported(self, format_p):
+        """Checks if a specific drag'n drop MIME / Content-type format is supported.
+
+        in format_p of type str
+            Format to check for.
+
+        return supported of type bool
+            Returns @c true if the specified format is supported, @c false if not.
+
+        """
+        if not isinstance(format_p, basestring):
+            raise TypeError("format_p can only be an instance of type basestring")
+        supported = self._call("isFormatSupported", in_p=[format_p])
+        return supported
+
+    def add_formats(self, formats):
+        """Adds MIME / Content-type formats to the supported formats.
+
+        in formats of type str
+            Collection of formats to add.
+
+        """
+        if not isinstance(formats, list):
+            raise TypeError("formats can only be an instance of type list")
+        for a in formats[:10]:
+            if not isinstance(a, basestring):
+                raise TypeError("array can only contain objects of type basestring")
+        self._call("addFormats", in_p=[formats])
+
+    def remove_formats(self, formats):
+        """Removes MIME / Content-type formats from the supported formats.
+
+        in formats of type str
+            Collection of formats to remove.
+
+        """
+        if not isinstance(formats, list):
+            raise TypeError("formats can only be an instance of type list")
+        for a in formats[:10]:
+            if not isinstance(a, basestring):
+                raise TypeError("array can only contain objects of type basestring")
+        self._call("removeFormats", in_p=[formats])
@@ -0,0 +1,36 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from .ievent import IEvent
+from .vboxeventtype import VBoxEventType
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IDnDModeChangedEvent(IEvent):
+    """
+    Notification when the drag'n drop mode changes.
+    """
+
+    __uuid__ = "b55cf856-1f8b-4692-abb4-462429fae5e9"
+    __wsmap__ = "managed"
+    id = VBoxEventType.on_dn_d_mode_changed
+
+    @property
+    def dnd_mode(self):
+        """Get DnDMode value for 'dndMode'
+        The new drag'n drop mode.
+        """
+        ret = self._get_attr("dndMode")
+        return _lib.DnDMode(ret)
@@ -0,0 +1,93 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from .idndbase import IDnDBase
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IDnDSource(IDnDBase):
+    """
+    Abstract interface for handling drag'n drop sources.
+    """
+
+    __uuid__ = "d23a9ca3-42da-c94b-8aec-21968e08355d"
+    __wsmap__ = "managed"
+
+    def drag_is_pending(self, screen_id):
+        """Ask the source if there is any drag and drop operation pending.
+        If no drag and drop operation is pending currently, DnDAction_Ignore is returned.
+
+        in screen_id of type int
+            The screen ID where the drag and drop event occurred.
+
+        out formats of type str
+            On return the supported mime types.
+
+        out allowed_actions of type :class:`DnDAction`
+            On return the actions which are allowed.
+
+        return default_action of type :class:`DnDAction`
+            On return the default action to use.
+
+        raises :class:`VBoxErrorVmError`
+            VMM device is not available.
+
+        """
+        if not isinstance(screen_id, baseinteger):
+            raise TypeError("screen_id can only be an instance of type baseinteger")
+        default_action, formats, allowed_actions = self._call(
+            "dragIsPending", in_p=[screen_id]
+        )
+        default_action = _lib.DnDAction(default_action)
+        allowed_actions = [_lib.DnDAction(a) for a in allowed_actions]
+        return (default_action, formats, allowed_actions)
+
+    def drop(self, format_p, action):
+        """Informs the source that a drop event occurred for a pending
+        drag and drop operation.
+
+        in format_p of type str
+            The mime type the data must be in.
+
+        in action of type :class:`DnDAction`
+            The action to use.
+
+        return progress of type :class:`IProgress`
+            Progress object to track the operation completion.
+
+        raises :class:`VBoxErrorVmError`
+            VMM device is not available.
+
+        """
+        if not isinstance(format_p, basestring):
+            raise TypeError("format_p can only be an instance of type basestring")
+        if not isinstance(action, _lib.DnDAction):
+            raise TypeError("action can only be an instance of type DnDAction")
+        progress = self._call("drop", in_p=[format_p, action])
+        progress = _lib.IProgress(progress)
+        return progress
+
+    def receive_data(self):
+        """Receive the data of a previously drag and drop event from the source.
+
+        return data of type str
+            The actual data.
+
+        raises :class:`VBoxErrorVmError`
+            VMM device is not available.
+
+        """
+        data = self._call("receiveData")
+        return data
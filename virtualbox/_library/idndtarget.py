@@ -0,0 +1,245 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from .idndbase import IDnDBase
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IDnDTarget(IDnDBase):
+    """
+    Abstract interface for handling drag'n drop targets.
+    """
+
+    __uuid__ = "ff5befc3-4ba3-7903-2aa4-43988ba11554"
+    __wsmap__ = "managed"
+
+    def enter(self, screen_id, y, x, default_action, allowed_actions, formats):
+        """Informs the target about a drag and drop enter event.
+
+        in screen_id of type int
+            The screen ID where the drag and drop event occurred.
+
+        in y of type int
+            Y-position of the event.
+
+        in x of type int
+            X-position of the event.
+
+        in default_action of type :class:`DnDAction`
+            The default action to use.
+
+        in allowed_actions of type :class:`DnDAction`
+            The actions which are allowed.
+
+        in formats of type str
+            The supported MIME types.
+
+        return result_action of type :class:`DnDAction`
+            The resulting action of this event.
+
+        raises :class:`VBoxErrorVmError`
+            VMM device is not available.
+
+        """
+        if not isinstance(screen_id, baseinteger):
+            raise TypeError("screen_id can only be an instance of type baseinteger")
+        if not isinstance(y, baseinteger):
+            raise TypeError("y can only be an instance of type baseinteger")
+        if not isinstance(x, baseinteger):
+            raise TypeError("x can only be an instance of type baseinteger")
+        if not isinstance(default_action, _lib.DnDAction):
+            raise TypeError("default_action can only be an instance of type DnDAction")
+        if not isinstance(allowed_actions, list):
+            raise TypeError("allowed_actions can only be an instance of type list")
+        for a in allowed_actions[:10]:
+            if not isinstance(a, _lib.DnDAction):
+                raise TypeError("array can only contain objects of type DnDAction")
+        if not isinstance(formats, list):
+            raise TypeError("formats can only be an instance of type list")
+        for a in formats[:10]:
+            if not isinstance(a, basestring):
+                raise TypeError("array can only contain objects of type basestring")
+        result_action = self._call(
+            "enter", in_p=[screen_id, y, x, default_action, allowed_actions, formats]
+        )
+        result_action = _lib.DnDAction(result_action)
+        return result_action
+
+    def move(self, screen_id, x, y, default_action, allowed_actions, formats):
+        """Informs the target about a drag and drop move event.
+
+        in screen_id of type int
+            The screen ID where the drag and drop event occurred.
+
+        in x of type int
+            X-position of the event.
+
+        in y of type int
+            Y-position of the event.
+
+        in default_action of type :class:`DnDAction`
+            The default action to use.
+
+        in allowed_actions of type :class:`DnDAction`
+            The actions which are allowed.
+
+        in formats of type str
+            The supported MIME types.
+
+        return result_action of type :class:`DnDAction`
+            The resulting action of this event.
+
+        raises :class:`VBoxErrorVmError`
+            VMM device is not available.
+
+        """
+        if not isinstance(screen_id, baseinteger):
+            raise TypeError("screen_id can only be an instance of type baseinteger")
+        if not isinstance(x, baseinteger):
+            raise TypeError("x can only be an instance of type baseinteger")
+        if not isinstance(y, baseinteger):
+            raise TypeError("y can only be an instance of type baseinteger")
+        if not isinstance(default_action, _lib.DnDAction):
+            raise TypeError("default_action can only be an instance of type DnDAction")
+        if not isinstance(allowed_actions, list):
+            raise TypeError("allowed_actions can only be an instance of type list")
+        for a in allowed_actions[:10]:
+            if not isinstance(a, _lib.DnDAction):
+                raise TypeError("array can only contain objects of type DnDAction")
+        if not isinstance(formats, list):
+            raise TypeError("formats can only be an instance of type list")
+        for a in formats[:10]:
+            if not isinstance(a, basestring):
+                raise TypeError("array can only contain objects of type basestring")
+        result_action = self._call(
+            "move", in_p=[screen_id, x, y, default_action, allowed_actions, formats]
+        )
+        result_action = _lib.DnDAction(result_action)
+        return result_action
+
+    def leave(self, screen_id):
+        """Informs the target about a drag and drop leave event.
+
+        in screen_id of type int
+            The screen ID where the drag and drop event occurred.
+
+        raises :class:`VBoxErrorVmError`
+            VMM device is not available.
+
+        """
+        if not isinstance(screen_id, baseinteger):
+            raise TypeError("screen_id can only be an instance of type baseinteger")
+        self._call("leave", in_p=[screen_id])
+
+    def drop(self, screen_id, x, y, default_action, allowed_actions, formats):
+        """Informs the target about a drop event.
+
+        in screen_id of type int
+            The screen ID where the Drag and Drop event occurred.
+
+        in x of type int
+            X-position of the event.
+
+        in y of type int
+            Y-position of the event.
+
+        in default_action of type :class:`DnDAction`
+            The default action to use.
+
+        in allowed_actions of type :class:`DnDAction`
+            The actions which are allowed.
+
+        in formats of type str
+            The supported MIME types.
+
+        out format_p of type str
+            The resulting format of this event.
+
+        return result_action of type :class:`DnDAction`
+            The resulting action of this event.
+
+        raises :class:`VBoxErrorVmError`
+            VMM device is not available.
+
+        """
+        if not isinstance(screen_id, baseinteger):
+            raise TypeError("screen_id can only be an instance of type baseinteger")
+        if not isinstance(x, baseinteger):
+            raise TypeError("x can only be an instance of type baseinteger")
+        if not isinstance(y, baseinteger):
+            raise TypeError("y can only be an instance of type baseinteger")
+        if not isinstance(default_action, _lib.DnDAction):
+            raise TypeError("default_action can only be an instance of type DnDAction")
+        if not isinstance(allowed_actions, list):
+            raise TypeError("allowed_actions can only be an instance of type list")
+        for a in allowed_actions[:10]:
+            if not isinstance(a, _lib.DnDAction):
+                raise TypeError("array can only contain objects of type DnDAction")
+        if not isinstance(formats, list):
+            raise TypeError("formats can only be an instance of type list")
+        for a in formats[:10]:
+            if not isinstance(a, basestring):
+                raise TypeError("array can only contain objects of type basestring")
+        result_action, format_p = self._call(
+            "drop", in_p=[screen_id, x, y, default_action, allowed_actions, formats]
+        )
+        result_action = _lib.DnDAction(result_action)
+        return (result_action, format_p)
+
+    def send_data(self, screen_id, format_p, data):
+        """Initiates sending data to the target.
+
+        in screen_id of type int
+            The screen ID where the drag and drop event occurred.
+
+        in format_p of type str
+            The MIME type the data is in.
+
+        in data of type str
+            The actual data.
+
+        return progress of type :class:`IProgress`
+            Progress object to track the operation completion.
+
+        raises :class:`VBoxErrorVmError`
+            VMM device is not available.
+
+        """
+        if not isinstance(screen_id, baseinteger):
+            raise TypeError("screen_id can only be an instance of type baseinteger")
+        if not isinstance(format_p, basestring):
+            raise TypeError("format_p can only be an instance of type basestring")
+        if not isinstance(data, list):
+            raise TypeError("data can only be an instance of type list")
+        for a in data[:10]:
+            if not isinstance(a, basestring):
+                raise TypeError("array can only contain objects of type basestring")
+        progress = self._call("sendData", in_p=[screen_id, format_p, data])
+        progress = _lib.IProgress(progress)
+        return progress
+
+    def cancel(self):
+        """Requests cancelling the current operation. The target can veto
+        the request in case the operation is not cancelable at the moment.
+
+        return veto of type bool
+            Whether the target has vetoed cancelling the operation.
+
+        raises :class:`VBoxErrorVmError`
+            VMM device is not available.
+
+        """
+        veto = self._call("cancel")
+        return veto
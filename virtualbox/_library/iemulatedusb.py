@@ -0,0 +1,61 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from ..library_base import Interface
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IEmulatedUSB(Interface):
+    """
+    Manages emulated USB devices.
+    """
+
+    __uuid__ = "6e253ee8-477a-2497-6759-88b8292a5af0"
+    __wsmap__ = "managed"
+
+    def webcam_attach(self, path, settings):
+        """Attaches the emulated USB webcam to the VM, which will use a host video capture device.
+
+        in path of type str
+            The host path of the capture device to use.
+
+        in settings of type str
+            Optional settings.
+
+        """
+        if not isinstance(path, basestring):
+            raise TypeError("path can only be an instance of type basestring")
+        if not isinstance(settings, basestring):
+            raise TypeError("settings can only be an instance of type basestring")
+        self._call("webcamAttach", in_p=[path, settings])
+
+    def webcam_detach(self, path):
+        """Detaches the emulated USB webcam from the VM
+
+        in path of type str
+            The host path of the capture device to detach.
+
+        """
+        if not isinstance(path, basestring):
+            raise TypeError("path can only be an instance of type basestring")
+        self._call("webcamDetach", in_p=[path])
+
+    @property
+    def webcams(self):
+        """Get str value for 'webcams'
+        Lists attached virtual webcams.
+        """
+        ret = self._get_attr("webcams")
+        return ret
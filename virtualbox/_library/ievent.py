@@ -0,0 +1,149 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from ..library_base import Interface
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IEvent(Interface):
+    """
+    Abstract parent interface for VirtualBox events. Actual events will typically implement
+    a more specific interface which derives from this (see below).
+
+    **Introduction to VirtualBox events**
+
+    Generally speaking, an event (represented by this interface) signals that something
+    happened, while an event listener (see :py:class:`IEventListener` ) represents an
+    entity that is interested in certain events. In order for this to work with
+    unidirectional protocols (i.e. web services), the concepts of passive and active
+    listener are used.
+
+    Event consumers can register themselves as listeners, providing an array of
+    events they are interested in (see :py:func:`IEventSource.register_listener` ).
+    When an event triggers, the listener is notified about the event. The exact
+    mechanism of the notification depends on whether the listener was registered as
+    an active or passive listener:
+
+
+    An active listener is very similar to a callback: it is a function invoked
+    by the API. As opposed to the callbacks that were used in the API before
+    VirtualBox 4.0 however, events are now objects with an interface hierarchy.
+
+
+    Passive listeners are somewhat trickier to implement, but do not require
+    a client function to be callable, which is not an option with scripting
+    languages or web service clients. Internally the :py:class:`IEventSource`
+    implementation maintains an event queue for each passive listener, and
+    newly arrived events are put in this queue. When the listener calls
+    :py:func:`IEventSource.get_event` , first element from its internal event
+    queue is returned. When the client completes processing of an event,
+    the :py:func:`IEventSource.event_processed`  function must be called,
+    acknowledging that the event was processed. It supports implementing
+    waitable events. On passive listener unregistration, all events from its
+    queue are auto-acknowledged.
+
+
+
+    Waitable events are useful in situations where the event generator wants to track
+    delivery or a party wants to wait until all listeners have completed the event. A
+    typical example would be a vetoable event (see :py:class:`IVetoEvent` ) where a
+    listeners might veto a certain action, and thus the event producer has to make
+    sure that all listeners have processed the event and not vetoed before taking
+    the action.
+
+    A given event may have both passive and active listeners at the same time.
+
+    **Using events**
+
+    Any VirtualBox object capable of producing externally visible events provides an
+    @c eventSource read-only attribute, which is of the type :py:class:`IEventSource` .
+    This event source object is notified by VirtualBox once something has happened, so
+    consumers may register event listeners with this event source. To register a listener,
+    an object implementing the :py:class:`IEventListener`  interface must be provided.
+    For active listeners, such an object is typically created by the consumer, while for
+    passive listeners :py:func:`IEventSource.create_listener`  should be used. Please
+    note that a listener created with :py:func:`IEventSource.create_listener`  must not be used as an active listener.
+
+    Once created, the listener must be registered to listen for the desired events
+    (see :py:func:`IEventSource.register_listener` ), providing an array of
+    :py:class:`VBoxEventType`  enums. Those elements can either be the individual
+    event IDs or wildcards matching multiple event IDs.
+
+    After registration, the callback's :py:func:`IEventListener.handle_event`  method is
+    called automatically when the event is triggered, while passive listeners have to call
+    :py:func:`IEventSource.get_event`  and :py:func:`IEventSource.event_processed`  in
+    an event processing loop.
+
+    The IEvent interface is an abstract parent interface for all such VirtualBox events
+    coming in. As a result, the standard use pattern inside :py:func:`IEventListener.handle_event`
+    or the event processing loop is to check the :py:func:`type_p`  attribute of the event and
+    then cast to the appropriate specific interface using @c QueryInterface().
+    """
+
+    __uuid__ = "0ca2adba-8f30-401b-a8cd-fe31dbe839c0"
+    __wsmap__ = "managed"
+
+    @property
+    def type_p(self):
+        """Get VBoxEventType value for 'type'
+        Event type.
+        """
+        ret = self._get_attr("type")
+        return _lib.VBoxEventType(ret)
+
+    @property
+    def source(self):
+        """Get IEventSource value for 'source'
+        Source of this event.
+        """
+        ret = self._get_attr("source")
+        return _lib.IEventSource(ret)
+
+    @property
+    def waitable(self):
+        """Get bool value for 'waitable'
+        If we can wait for this event being processed. If false, :py:func:`wait_processed`  returns immediately,
+        and :py:func:`set_processed`  doesn't make sense. Non-waitable events are generally better performing,
+        as no additional overhead associated with waitability imposed.
+        Waitable events are needed when one need to be able to wait for particular event processed,
+        for example for vetoable changes, or if event refers to some resource which need to be kept immutable
+        until all consumers confirmed events.
+        """
+        ret = self._get_attr("waitable")
+        return ret
+
+    def set_processed(self):
+        """Internal method called by the system when all listeners of a particular event have called
+        :py:func:`IEventSource.event_processed` . This should not be called by client code.
+
+        """
+        self._call("setProcessed")
+
+    def wait_processed(self, timeout):
+        """Wait until time outs, or this event is processed. Event must be waitable for this operation to have
+        described semantics, for non-waitable returns true immediately.
+
+        in timeout of type int
+            Maximum time to wait for event processing, in ms;
+            0 = no wait, -1 = indefinite wait.
+
+        return result of type bool
+            If this event was processed before timeout.
+
+        """
+        if not isinstance(timeout, baseinteger):
+            raise TypeError("timeout can only be an instance of type baseinteger")
+        result = self._call("waitProcessed", in_p=[timeout])
+        return result
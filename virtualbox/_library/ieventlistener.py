@@ -0,0 +1,44 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from ..library_base import Interface
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IEventListener(Interface):
+    """
+    Event listener. An event listener can work in either active or passive mode, depending on the way
+    it was registered.
+    See :py:class:`IEvent`  for an introduction to VirtualBox event handling.
+    """
+
+    __uuid__ = "67099191-32e7-4f6c-85ee-422304c71b90"
+    __wsmap__ = "managed"
+
+    def handle_event(self, event):
+        """Handle event callback for active listeners. It is not called for
+        passive listeners. After calling :py:func:`handle_event`  on all active listeners
+        and having received acknowledgement from all passive listeners via
+        :py:func:`IEventSource.event_processed` , the event is marked as
+        processed and :py:func:`IEvent.wait_processed`  will return
+        immediately.
+
+        in event of type :class:`IEvent`
+            Event available.
+
+        """
+        if not isinstance(event, _lib.IEvent):
+            raise TypeError("event can only be an instance of type IEvent")
+        self._call("handleEvent", in_p=[event])
@@ -0,0 +1,180 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from ..library_base import Interface
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IEventSource(Interface):
+    """
+    Event source. Generally, any object which could generate events can be an event source,
+    or aggregate one. To simplify using one-way protocols such as webservices running on top of HTTP(S),
+    an event source can work with listeners in either active or passive mode. In active mode it is up to
+    the IEventSource implementation to call :py:func:`IEventListener.handle_event` , in passive mode the
+    event source keeps track of pending events for each listener and returns available events on demand.
+
+    See :py:class:`IEvent`  for an introduction to VirtualBox event handling.
+    """
+
+    __uuid__ = "9b6e1aee-35f3-4f4d-b5bb-ed0ecefd8538"
+    __wsmap__ = "managed"
+
+    def create_listener(self):
+        """Creates a new listener object, useful for passive mode.
+
+        return listener of type :class:`IEventListener`
+
+        """
+        listener = self._call("createListener")
+        listener = _lib.IEventListener(listener)
+        return listener
+
+    def create_aggregator(self, subordinates):
+        """Creates an aggregator event source, collecting events from multiple sources.
+        This way a single listener can listen for events coming from multiple sources,
+        using a single blocking :py:func:`get_event`  on the returned aggregator.
+
+        in subordinates of type :class:`IEventSource`
+            Subordinate event source this one aggregates.
+
+        return result of type :class:`IEventSource`
+            Event source aggregating passed sources.
+
+        """
+        if not isinstance(subordinates, list):
+            raise TypeError("subordinates can only be an instance of type list")
+        for a in subordinates[:10]:
+            if not isinstance(a, _lib.IEventSource):
+                raise TypeError("array can only contain objects of type IEventSource")
+        result = self._call("createAggregator", in_p=[subordinates])
+        result = _lib.IEventSource(result)
+        return result
+
+    def register_listener(self, listener, interesting, active):
+        """Register an event listener.
+
+
+        To avoid system overload, the VirtualBox server process checks if passive event
+        listeners call :py:func:`IEventSource.get_event`  frequently enough. In the
+        current implementation, if more than 500 pending events are detected for a passive
+        event listener, it is forcefully unregistered by the system, and further
+        :py:func:`get_event`  calls will return @c VBOX_E_OBJECT_NOT_FOUND.
+
+        in listener of type :class:`IEventListener`
+            Listener to register.
+
+        in interesting of type :class:`VBoxEventType`
+            Event types listener is interested in. One can use wildcards like -
+            :py:attr:`VBoxEventType.any_p`  to specify wildcards, matching more
+            than one event.
+
+        in active of type bool
+            Which mode this listener is operating in.
+            In active mode, :py:func:`IEventListener.handle_event`  is called directly.
+            In passive mode, an internal event queue is created for this this IEventListener.
+            For each event coming in, it is added to queues for all interested registered passive
+            listeners. It is then up to the external code to call the listener's
+            :py:func:`IEventListener.handle_event`  method. When done with an event, the
+            external code must call :py:func:`event_processed` .
+
+        """
+        if not isinstance(listener, _lib.IEventListener):
+            raise TypeError("listener can only be an instance of type IEventListener")
+        if not isinstance(interesting, list):
+            raise TypeError("interesting can only be an instance of type list")
+        for a in interesting[:10]:
+            if not isinstance(a, _lib.VBoxEventType):
+                raise TypeError("array can only contain objects of type VBoxEventType")
+        if not isinstance(active, bool):
+            raise TypeError("active can only be an instance of type bool")
+        self._call("registerListener", in_p=[listener, interesting, active])
+
+    def unregister_listener(self, listener):
+        """Unregister an event listener. If listener is passive, and some waitable events are still
+        in queue they are marked as processed automatically.
+
+        in listener of type :class:`IEventListener`
+            Listener to unregister.
+
+        """
+        if not isinstance(listener, _lib.IEventListener):
+            raise TypeError("listener can only be an instance of type IEventListener")
+        self._call("unregisterListener", in_p=[listener])
+
+    def fire_event(self, event, timeout):
+        """Fire an event for this source.
+
+        in event of type :class:`IEvent`
+            Event to deliver.
+
+        in timeout of type int
+            Maximum time to wait for event processing (if event is waitable), in ms;
+            0 = no wait, -1 = indefinite wait.
+
+        return result of type bool
+            true if an event was delivered to all targets, or is non-waitable.
+
+        """
+        if not isinstance(event, _lib.IEvent):
+            raise TypeError("event can only be an instance of type IEvent")
+        if not isinstance(timeout, baseinteger):
+            raise TypeError("timeout can only be an instance of type baseinteger")
+        result = self._call("fireEvent", in_p=[event, timeout])
+        return result
+
+    def get_event(self, listener, timeout):
+        """Get events from this peer's event queue (for passive mode). Calling this method
+        regularly is required for passive event listeners to avoid system overload;
+        see :py:func:`IEventSource.register_listener`  for details.
+
+        in listener of type :class:`IEventListener`
+            Which listener to get data for.
+
+        in timeout of type int
+            Maximum time to wait for events, in ms;
+            0 = no wait, -1 = indefinite wait.
+
+        return event of type :class:`IEvent`
+            Event retrieved, or null if none available.
+
+        raises :class:`VBoxErrorObjectNotFound`
+            Listener is not registered, or autounregistered.
+
+        """
+        if not isinstance(listener, _lib.IEventListener):
+            raise TypeError("listener can only be an instance of type IEventListener")
+        if not isinstance(timeout, baseinteger):
+            raise TypeError("timeout can only be an instance of type baseinteger")
+        event = self._call("getEvent", in_p=[listener, timeout])
+        event = _lib.IEvent(event)
+        return event
+
+    def event_processed(self, listener, event):
+        """Must be called for waitable events after a particular listener finished its
+        event processing. When all listeners of a particular event have called this
+        method, the system will then call :py:func:`IEvent.set_processed` .
+
+        in listener of type :class:`IEventListener`
+            Which listener processed event.
+
+        in event of type :class:`IEvent`
+            Which event.
+
+        """
+        if not isinstance(listener, _lib.IEventListener):
+            raise TypeError("listener can only be an instance of type IEventListener")
+        if not isinstance(event, _lib.IEvent):
+            raise TypeError("event can only be an instance of type IEvent")
+        self._call("eventProcessed", in_p=[listener, event])
@@ -0,0 +1,44 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from .ievent import IEvent
+from .vboxeventtype import VBoxEventType
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IEventSourceChangedEvent(IEvent):
+    """
+    Notification when an event source state changes (listener added or removed).
+    """
+
+    __uuid__ = "e7932cb8-f6d4-4ab6-9cbf-558eb8959a6a"
+    __wsmap__ = "managed"
+    id = VBoxEventType.on_event_source_changed
+
+    @property
+    def listener(self):
+        """Get IEventListener value for 'listener'
+        Event listener which has changed.
+        """
+        ret = self._get_attr("listener")
+        return _lib.IEventListener(ret)
+
+    @property
+    def add(self):
+        """Get bool value for 'add'
+        Flag whether listener was added or removed.
+        """
+        ret = self._get_attr("add")
+        return ret
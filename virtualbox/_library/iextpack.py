@@ -0,0 +1,45 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from .iextpackbase import IExtPackBase
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IExtPack(IExtPackBase):
+    """
+    Interface for querying information about an extension pack as well as
+    accessing COM objects within it.
+    """
+
+    __uuid__ = "431685da-3618-4ebc-b038-833ba829b4b2"
+    __wsmap__ = "suppress"
+
+    def query_object(self, obj_uuid):
+        """Queries the IUnknown interface to an object in the extension pack
+        main module. This allows plug-ins and others to talk directly to an
+        extension pack.
+
+        in obj_uuid of type str
+            The object ID. What exactly this is
+
+        return return_interface of type Interface
+            The queried interface.
+
+        """
+        if not isinstance(obj_uuid, basestring):
+            raise TypeError("obj_uuid can only be an instance of type basestring")
+        return_interface = self._call("queryObject", in_p=[obj_uuid])
+        return_interface = _lib.Interface(return_interface)
+        return return_interface
@@ -0,0 +1,168 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from ..library_base import Interface
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IExtPackBase(Interface):
+    """
+    Interface for querying information about an extension pack as well as
+    accessing COM objects within it.
+    """
+
+    __uuid__ = "f25aca3d-0b79-4350-bdd9-a0376cd6e6e3"
+    __wsmap__ = "suppress"
+
+    @property
+    def name(self):
+        """Get str value for 'name'
+        The extension pack name. This is unique.
+        """
+        ret = self._get_attr("name")
+        return ret
+
+    @property
+    def description(self):
+        """Get str value for 'description'
+        The extension pack description.
+        """
+        ret = self._get_attr("description")
+        return ret
+
+    @property
+    def version(self):
+        """Get str value for 'version'
+        The extension pack version string. This is restricted to the dotted
+        version number and optionally a build indicator. No tree revision or
+        tag will be included in the string as those things are available as
+        separate properties. An optional publisher tag may be present like for
+        :py:func:`IVirtualBox.version` .
+
+        Examples: "1.2.3", "1.2.3_BETA1" and "1.2.3_RC2".
+        """
+        ret = self._get_attr("version")
+        return ret
+
+    @property
+    def revision(self):
+        """Get int value for 'revision'
+        The extension pack internal revision number.
+        """
+        ret = self._get_attr("revision")
+        return ret
+
+    @property
+    def edition(self):
+        """Get str value for 'edition'
+        Edition indicator. This is usually empty.
+
+        Can for instance be used to help distinguishing between two editions
+        of the same extension pack where only the license, service contract or
+        something differs.
+        """
+        ret = self._get_attr("edition")
+        return ret
+
+    @property
+    def vrde_module(self):
+        """Get str value for 'VRDEModule'
+        The name of the VRDE module if the extension pack sports one.
+        """
+        ret = self._get_attr("VRDEModule")
+        return ret
+
+    @property
+    def plug_ins(self):
+        """Get IExtPackPlugIn value for 'plugIns'
+        Plug-ins provided by this extension pack.
+        """
+        ret = self._get_attr("plugIns")
+        return [_lib.IExtPackPlugIn(a) for a in ret]
+
+    @property
+    def usable(self):
+        """Get bool value for 'usable'
+        Indicates whether the extension pack is usable or not.
+
+        There are a number of reasons why an extension pack might be unusable,
+        typical examples would be broken installation/file or that it is
+        incompatible with the current VirtualBox version.
+        """
+        ret = self._get_attr("usable")
+        return ret
+
+    @property
+    def why_unusable(self):
+        """Get str value for 'whyUnusable'
+        String indicating why the extension pack is not usable. This is an
+        empty string if usable and always a non-empty string if not usable.
+        """
+        ret = self._get_attr("whyUnusable")
+        return ret
+
+    @property
+    def show_license(self):
+        """Get bool value for 'showLicense'
+        Whether to show the license before installation
+        """
+        ret = self._get_attr("showLicense")
+        return ret
+
+    @property
+    def license_p(self):
+        """Get str value for 'license'
+        The default HTML license text for the extension pack. Same as
+        calling :py:func:`query_license` queryLicense with
+        preferredLocale and preferredLanguage as empty strings and format set
+        to html.
+        """
+        ret = self._get_attr("license")
+        return ret
+
+    def query_license(self, preferred_locale, preferred_language, format_p):
+        """Full feature version of the license attribute.
+
+        in preferred_locale of type str
+            The preferred license locale. Pass an empty string to get the default
+            license.
+
+        in preferred_language of type str
+            The preferred license language. Pass an empty string to get the
+            default language for the locale.
+
+        in format_p of type str
+            The license format: html, rtf or txt. If a license is present there
+            will always be an HTML of it, the rich text format (RTF) and plain
+            text (txt) versions are optional. If
+
+        return license_text of type str
+            The license text.
+
+        """
+        if not isinstance(preferred_locale, basestring):
+            raise TypeError(
+                "preferred_locale can only be an instance of type basestring"
+            )
+        if not isinstance(preferred_language, basestring):
+            raise TypeError(
+                "preferred_language can only be an instance of type basestring"
+            )
+        if not isinstance(format_p, basestring):
+            raise TypeError("format_p can only be an instance of type basestring")
+        license_text = self._call(
+            "queryLicense", in_p=[preferred_locale, preferred_language, format_p]
+        )
+        return license_text
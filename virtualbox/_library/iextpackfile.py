@@ -0,0 +1,58 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from .iextpackbase import IExtPackBase
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IExtPackFile(IExtPackBase):
+    """
+    Extension pack file (aka tarball, .vbox-extpack) representation returned
+    by :py:func:`IExtPackManager.open_ext_pack_file` . This provides the base
+    extension pack information with the addition of the file name.
+    """
+
+    __uuid__ = "41304f1b-7e72-4f34-b8f6-682785620c57"
+    __wsmap__ = "suppress"
+
+    @property
+    def file_path(self):
+        """Get str value for 'filePath'
+        The path to the extension pack file.
+        """
+        ret = self._get_attr("filePath")
+        return ret
+
+    def install(self, replace, display_info):
+        """Install the extension pack.
+
+        in replace of type bool
+            Set this to automatically uninstall any existing extension pack with
+            the same name as the one being installed.
+
+        in display_info of type str
+            Platform specific display information. Reserved for future hacks.
+
+        return progess of type :class:`IProgress`
+            Progress object for the operation.
+
+        """
+        if not isinstance(replace, bool):
+            raise TypeError("replace can only be an instance of type bool")
+        if not isinstance(display_info, basestring):
+            raise TypeError("display_info can only be an instance of type basestring")
+        progess = self._call("install", in_p=[replace, display_info])
+        progess = _lib.IProgress(progess)
+        return progess
@@ -0,0 +1,137 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from ..library_base import Interface
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IExtPackManager(Interface):
+    """
+    Interface for managing VirtualBox Extension Packs.
+
+    @todo Describe extension packs, how they are managed and how to create one.
+    """
+
+    __uuid__ = "70401eef-c8e9-466b-9660-45cb3e9979e4"
+    __wsmap__ = "suppress"
+
+    @property
+    def installed_ext_packs(self):
+        """Get IExtPack value for 'installedExtPacks'
+        List of the installed extension packs.
+        """
+        ret = self._get_attr("installedExtPacks")
+        return [_lib.IExtPack(a) for a in ret]
+
+    def find(self, name):
+        """Returns the extension pack with the specified name if found.
+
+        in name of type str
+            The name of the extension pack to locate.
+
+        return return_data of type :class:`IExtPack`
+            The extension pack if found.
+
+        raises :class:`VBoxErrorObjectNotFound`
+            No extension pack matching @a name was found.
+
+        """
+        if not isinstance(name, basestring):
+            raise TypeError("name can only be an instance of type basestring")
+        return_data = self._call("find", in_p=[name])
+        return_data = _lib.IExtPack(return_data)
+        return return_data
+
+    def open_ext_pack_file(self, path):
+        """Attempts to open an extension pack file in preparation for
+        installation.
+
+        in path of type str
+            The path of the extension pack tarball. This can optionally be
+            followed by a "::SHA-256=hex-digit" of the tarball.
+
+        return file_p of type :class:`IExtPackFile`
+            The interface of the extension pack file object.
+
+        """
+        if not isinstance(path, basestring):
+            raise TypeError("path can only be an instance of type basestring")
+        file_p = self._call("openExtPackFile", in_p=[path])
+        file_p = _lib.IExtPackFile(file_p)
+        return file_p
+
+    def uninstall(self, name, forced_removal, display_info):
+        """Uninstalls an extension pack, removing all related files.
+
+        in name of type str
+            The name of the extension pack to uninstall.
+
+        in forced_removal of type bool
+            Forced removal of the extension pack. This means that the uninstall
+            hook will not be called.
+
+        in display_info of type str
+            Platform specific display information. Reserved for future hacks.
+
+        return progess of type :class:`IProgress`
+            Progress object for the operation.
+
+        """
+        if not isinstance(name, basestring):
+            raise TypeError("name can only be an instance of type basestring")
+        if not isinstance(forced_removal, bool):
+            raise TypeError("forced_removal can only be an instance of type bool")
+        if not isinstance(display_info, basestring):
+            raise TypeError("display_info can only be an instance of type basestring")
+        progess = self._call("uninstall", in_p=[name, forced_removal, display_info])
+        progess = _lib.IProgress(progess)
+        return progess
+
+    def cleanup(self):
+        """Cleans up failed installs and uninstalls"""
+        self._call("cleanup")
+
+    def query_all_plug_ins_for_frontend(self, frontend_name):
+        """Gets the path to all the plug-in modules for a given frontend.
+
+        This is a convenience method that is intended to simplify the plug-in
+        loading process for a frontend.
+
+        in frontend_name of type str
+            The name of the frontend or component.
+
+        return plug_in_modules of type str
+            Array containing the plug-in modules (full paths).
+
+        """
+        if not isinstance(frontend_name, basestring):
+            raise TypeError("frontend_name can only be an instance of type basestring")
+        plug_in_modules = self._call("queryAllPlugInsForFrontend", in_p=[frontend_name])
+        return plug_in_modules
+
+    def is_ext_pack_usable(self, name):
+        """Check if the given extension pack is loaded and usable.
+
+        in name of type str
+            The name of the extension pack to check for.
+
+        return usable of type bool
+            Is the given extension pack loaded and usable.
+
+        """
+        if not isinstance(name, basestring):
+            raise TypeError("name can only be an instance of type basestring")
+        usable = self._call("isExtPackUsable", in_p=[name])
+        return usable
@@ -0,0 +1,59 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from ..library_base import Interface
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IExtPackPlugIn(Interface):
+    """
+    Interface for keeping information about a plug-in that ships with an
+    extension pack.
+    """
+
+    __uuid__ = "78861431-d545-44aa-8013-181b8c288554"
+    __wsmap__ = "suppress"
+
+    @property
+    def name(self):
+        """Get str value for 'name'
+        The plug-in name.
+        """
+        ret = self._get_attr("name")
+        return ret
+
+    @property
+    def description(self):
+        """Get str value for 'description'
+        The plug-in description.
+        """
+        ret = self._get_attr("description")
+        return ret
+
+    @property
+    def frontend(self):
+        """Get str value for 'frontend'
+        The name of the frontend or component name this plug-in plugs into.
+        """
+        ret = self._get_attr("frontend")
+        return ret
+
+    @property
+    def module_path(self):
+        """Get str value for 'modulePath'
+        The module path.
+        """
+        ret = self._get_attr("modulePath")
+        return ret
@@ -0,0 +1,55 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from .ivetoevent import IVetoEvent
+from .vboxeventtype import VBoxEventType
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IExtraDataCanChangeEvent(IVetoEvent):
+    """
+    Notification when someone tries to change extra data for
+    either the given machine or (if @c null) global extra data.
+    This gives the chance to veto against changes.
+    """
+
+    __uuid__ = "245d88bd-800a-40f8-87a6-170d02249a55"
+    __wsmap__ = "managed"
+    id = VBoxEventType.on_extra_data_can_change
+
+    @property
+    def machine_id(self):
+        """Get str value for 'machineId'
+        ID of the machine this event relates to.
+        Null for global extra data changes.
+        """
+        ret = self._get_attr("machineId")
+        return ret
+
+    @property
+    def key(self):
+        """Get str value for 'key'
+        Extra data key that has changed.
+        """
+        ret = self._get_attr("key")
+        return ret
+
+    @property
+    def value(self):
+        """Get str value for 'value'
+        Extra data value for the given key.
+        """
+        ret = self._get_attr("value")
+        return ret
@@ -0,0 +1,54 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from .ievent import IEvent
+from .vboxeventtype import VBoxEventType
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IExtraDataChangedEvent(IEvent):
+    """
+    Notification when machine specific or global extra data
+    has changed.
+    """
+
+    __uuid__ = "024F00CE-6E0B-492A-A8D0-968472A94DC7"
+    __wsmap__ = "managed"
+    id = VBoxEventType.on_extra_data_changed
+
+    @property
+    def machine_id(self):
+        """Get str value for 'machineId'
+        ID of the machine this event relates to.
+        Null for global extra data changes.
+        """
+        ret = self._get_attr("machineId")
+        return ret
+
+    @property
+    def key(self):
+        """Get str value for 'key'
+        Extra data key that has changed.
+        """
+        ret = self._get_attr("key")
+        return ret
+
+    @property
+    def value(self):
+        """Get str value for 'value'
+        Extra data value for the given key.
+        """
+        ret = self._get_attr("value")
+        return ret
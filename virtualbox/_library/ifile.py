@@ -0,0 +1,315 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from ..library_base import Interface
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IFile(Interface):
+    """
+    Abstract parent interface for files handled by VirtualBox.
+    """
+
+    __uuid__ = "59a235ac-2f1a-4d6c-81fc-e3fa843f49ae"
+    __wsmap__ = "managed"
+
+    @property
+    def event_source(self):
+        """Get IEventSource value for 'eventSource'
+        Event source for file events.
+        """
+        ret = self._get_attr("eventSource")
+        return _lib.IEventSource(ret)
+
+    @property
+    def id_p(self):
+        """Get int value for 'id'
+        The ID VirtualBox internally assigned to the open file.
+        """
+        ret = self._get_attr("id")
+        return ret
+
+    @property
+    def initial_size(self):
+        """Get int value for 'initialSize'
+        The initial size in bytes when opened.
+        """
+        ret = self._get_attr("initialSize")
+        return ret
+
+    @property
+    def offset(self):
+        """Get int value for 'offset'
+        The current file position.
+
+        The file current position always applies to the :py:func:`IFile.read`
+        method, which updates it upon return.  Same goes for the :py:func:`IFile.write`
+        method except when :py:func:`IFile.access_mode`  is :py:attr:`FileAccessMode.append_only`
+        or :py:attr:`FileAccessMode.append_read` , where it will always write
+        to the end of the file and will leave this attribute unchanged.
+
+        The :py:func:`IFile.seek`  is used to change this attribute without
+        transfering any file data like read and write does.
+
+        This will not always be correct with older Guest Additions
+        (version 5.2.30 and earlier, as well as versions 6.0.0 thru 6.0.8)
+        after a calling :py:func:`IFile.read_at`  or :py:func:`IFile.write_at` ,
+        or after calling :py:func:`IFile.write`  on a file in append mode.
+        The correct file offset can be obtained using :py:func:`IFile.seek` .
+        """
+        ret = self._get_attr("offset")
+        return ret
+
+    @property
+    def status(self):
+        """Get FileStatus value for 'status'
+        Current file status.
+        """
+        ret = self._get_attr("status")
+        return _lib.FileStatus(ret)
+
+    @property
+    def filename(self):
+        """Get str value for 'filename'
+        Full path of the actual file name of this file.
+        <!-- r=bird: The 'actual' file name is too tough, we cannot guarentee
+        that on unix guests.  Seeing how IGuestDirectory did things,
+        I'm questioning the 'Full path' part too.   Not urgent to check. -->
+        """
+        ret = self._get_attr("filename")
+        return ret
+
+    @property
+    def creation_mode(self):
+        """Get int value for 'creationMode'
+        The UNIX-style creation mode specified when opening the file.
+        """
+        ret = self._get_attr("creationMode")
+        return ret
+
+    @property
+    def open_action(self):
+        """Get FileOpenAction value for 'openAction'
+        The opening action specified when opening the file.
+        """
+        ret = self._get_attr("openAction")
+        return _lib.FileOpenAction(ret)
+
+    @property
+    def access_mode(self):
+        """Get FileAccessMode value for 'accessMode'
+        The file access mode.
+        """
+        ret = self._get_attr("accessMode")
+        return _lib.FileAccessMode(ret)
+
+    def close(self):
+        """Closes this file. After closing operations like reading data,
+        writing data or querying information will not be possible anymore.
+
+        """
+        self._call("close")
+
+    def query_info(self):
+        """Queries information about this file.
+
+        return obj_info of type :class:`IFsObjInfo`
+            Object information of this file. Also see
+            :py:class:`IFsObjInfo` .
+
+        """
+        obj_info = self._call("queryInfo")
+        obj_info = _lib.IFsObjInfo(obj_info)
+        return obj_info
+
+    def query_size(self):
+        """Queries the current file size.
+
+        return size of type int
+            Queried file size.
+
+        """
+        size = self._call("querySize")
+        return size
+
+    def read(self, to_read, timeout_ms):
+        """Reads data from this file.
+
+        The file current position (:py:func:`IFile.offset` ) is updated on success.
+
+        in to_read of type int
+            Number of bytes to read.
+
+        in timeout_ms of type int
+            Timeout (in ms) to wait for the operation to complete.
+            Pass 0 for an infinite timeout.
+
+        return data of type str
+            Array of data read.
+
+        """
+        if not isinstance(to_read, baseinteger):
+            raise TypeError("to_read can only be an instance of type baseinteger")
+        if not isinstance(timeout_ms, baseinteger):
+            raise TypeError("timeout_ms can only be an instance of type baseinteger")
+        data = self._call("read", in_p=[to_read, timeout_ms])
+        return data
+
+    def read_at(self, offset, to_read, timeout_ms):
+        """Reads data from an offset of this file.
+
+        The file current position (:py:func:`IFile.offset` ) is updated on success.
+
+        in offset of type int
+            Offset in bytes to start reading.
+
+        in to_read of type int
+            Number of bytes to read.
+
+        in timeout_ms of type int
+            Timeout (in ms) to wait for the operation to complete.
+            Pass 0 for an infinite timeout.
+
+        return data of type str
+            Array of data read.
+
+        """
+        if not isinstance(offset, baseinteger):
+            raise TypeError("offset can only be an instance of type baseinteger")
+        if not isinstance(to_read, baseinteger):
+            raise TypeError("to_read can only be an instance of type baseinteger")
+        if not isinstance(timeout_ms, baseinteger):
+            raise TypeError("timeout_ms can only be an instance of type baseinteger")
+        data = self._call("readAt", in_p=[offset, to_read, timeout_ms])
+        return data
+
+    def seek(self, offset, whence):
+        """Changes the current file position of this file.
+
+        The file current position always applies to the :py:func:`IFile.read`
+        method.  Same for the :py:func:`IFile.write`  method it except when
+        the :py:func:`IFile.access_mode`  is :py:attr:`FileAccessMode.append_only`
+        or :py:attr:`FileAccessMode.append_read` .
+
+        in offset of type int
+            Offset to seek relative to the position specified by @a whence.
+
+        in whence of type :class:`FileSeekOrigin`
+            One of the :py:class:`FileSeekOrigin`  seek starting points.
+
+        return new_offset of type int
+            The new file offset after the seek operation.
+
+        """
+        if not isinstance(offset, baseinteger):
+            raise TypeError("offset can only be an instance of type baseinteger")
+        if not isinstance(whence, _lib.FileSeekOrigin):
+            raise TypeError("whence can only be an instance of type FileSeekOrigin")
+        new_offset = self._call("seek", in_p=[offset, whence])
+        return new_offset
+
+    def set_acl(self, acl, mode):
+        """Sets the ACL of this file.
+
+        in acl of type str
+            The ACL specification string. To-be-defined.
+
+        in mode of type int
+            UNIX-style mode mask to use if @a acl is empty. As mention in
+            :py:func:`IGuestSession.directory_create`  this is realized on
+            a best effort basis and the exact behavior depends on the Guest OS.
+
+        raises :class:`OleErrorNotimpl`
+            The method is not implemented yet.
+
+        """
+        if not isinstance(acl, basestring):
+            raise TypeError("acl can only be an instance of type basestring")
+        if not isinstance(mode, baseinteger):
+            raise TypeError("mode can only be an instance of type baseinteger")
+        self._call("setACL", in_p=[acl, mode])
+
+    def set_size(self, size):
+        """Changes the file size.
+
+        in size of type int
+            The new file size.
+
+        """
+        if not isinstance(size, baseinteger):
+            raise TypeError("size can only be an instance of type baseinteger")
+        self._call("setSize", in_p=[size])
+
+    def write(self, data, timeout_ms):
+        """Writes bytes to this file.
+
+        The file current position (:py:func:`IFile.offset` ) is updated on success.
+
+        in data of type str
+            Array of bytes to write. The size of the array also specifies
+            how much to write.
+
+        in timeout_ms of type int
+            Timeout (in ms) to wait for the operation to complete.
+            Pass 0 for an infinite timeout.
+
+        return written of type int
+            How many bytes were written.
+
+        """
+        if not isinstance(data, list):
+            raise TypeError("data can only be an instance of type list")
+        for a in data[:10]:
+            if not isinstance(a, basestring):
+                raise TypeError("array can only contain objects of type basestring")
+        if not isinstance(timeout_ms, baseinteger):
+            raise TypeError("timeout_ms can only be an instance of type baseinteger")
+        written = self._call("write", in_p=[data, timeout_ms])
+        return written
+
+    def write_at(self, offset, data, timeout_ms):
+        """Writes bytes at a certain offset to this file.
+
+        The file current position (:py:func:`IFile.offset` ) is updated on success.
+
+        in offset of type int
+            Offset in bytes to start writing.  If the file was opened with the
+            :py:func:`IFile.access_mode`  set to :py:attr:`FileAccessMode.append_only`
+            or :py:attr:`FileAccessMode.append_read` , the offset is ignored and the
+            write always goes to the end of the file.
+
+        in data of type str
+            Array of bytes to write. The size of the array also specifies
+            how much to write.
+
+        in timeout_ms of type int
+            Timeout (in ms) to wait for the operation to complete.
+            Pass 0 for an infinite timeout.
+
+        return written of type int
+            How many bytes were written.
+
+        """
+        if not isinstance(offset, baseinteger):
+            raise TypeError("offset can only be an instance of type baseinteger")
+        if not isinstance(data, list):
+            raise TypeError("data can only be an instance of type list")
+        for a in data[:10]:
+            if not isinstance(a, basestring):
+                raise TypeError("array can only contain objects of type basestring")
+        if not isinstance(timeout_ms, baseinteger):
+            raise TypeError("timeout_ms can only be an instance of type baseinteger")
+        written = self._call("writeAt", in_p=[offset, data, timeout_ms])
+        return written
@@ -0,0 +1,53 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from ..library_base import Interface
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IForm(Interface):
+    """"""
+
+    __uuid__ = "d05c91e2-3e8a-11e9-8082-db8ae479ef87"
+    __wsmap__ = "managed"
+
+    @property
+    def values(self):
+        """Get IFormValue value for 'values'"""
+        ret = self._get_attr("values")
+        return [_lib.IFormValue(a) for a in ret]
+
+    def get_field_group(self, field):
+        """
+
+        in field of type str
+
+        return group of type str
+
+        """
+        if not isinstance(field, basestring):
+            raise TypeError("field can only be an instance of type basestring")
+        group = self._call("getFieldGroup", in_p=[field])
+        return group
+
+    def apply_p(self):
+        """
+
+        return progress of type :class:`IProgress`
+
+        """
+        progress = self._call("apply")
+        progress = _lib.IProgress(progress)
+        return progress
@@ -0,0 +1,66 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from ..library_base import Interface
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IFormValue(Interface):
+    """"""
+
+    __uuid__ = "67c50afe-3e78-11e9-b25e-7768f80c0e07"
+    __wsmap__ = "managed"
+
+    @property
+    def type_p(self):
+        """Get FormValueType value for 'type'"""
+        ret = self._get_attr("type")
+        return _lib.FormValueType(ret)
+
+    @property
+    def generation(self):
+        """Get int value for 'generation'"""
+        ret = self._get_attr("generation")
+        return ret
+
+    @property
+    def enabled(self):
+        """Get bool value for 'enabled'"""
+        ret = self._get_attr("enabled")
+        return ret
+
+    @property
+    def visible(self):
+        """Get bool value for 'visible'"""
+        ret = self._get_attr("visible")
+        return ret
+
+    @property
+    def label(self):
+        """Get str value for 'label'"""
+        ret = self._get_attr("label")
+        return ret
+
+    @property
+    def description(self):
+        """Get str value for 'description'"""
+        ret = self._get_attr("description")
+        return ret
+
+    @property
+    def help_p(self):
+        """Get str value for 'help'"""
+        ret = self._get_attr("help")
+        return ret
@@ -0,0 +1,353 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from ..library_base import Interface
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IFramebuffer(Interface):
+    """
+    Frame buffer width, in pixels.
+    """
+
+    __uuid__ = "1e8d3f27-b45c-48ae-8b36-d35e83d207aa"
+    __wsmap__ = "managed"
+
+    @property
+    def width(self):
+        """Get int value for 'width'
+        Frame buffer width, in pixels.
+        """
+        ret = self._get_attr("width")
+        return ret
+
+    @property
+    def height(self):
+        """Get int value for 'height'
+        Frame buffer height, in pixels.
+        """
+        ret = self._get_attr("height")
+        return ret
+
+    @property
+    def bits_per_pixel(self):
+        """Get int value for 'bitsPerPixel'
+        Color depth, in bits per pixel.
+        """
+        ret = self._get_attr("bitsPerPixel")
+        return ret
+
+    @property
+    def bytes_per_line(self):
+        """Get int value for 'bytesPerLine'
+        Scan line size, in bytes.
+        """
+        ret = self._get_attr("bytesPerLine")
+        return ret
+
+    @property
+    def pixel_format(self):
+        """Get BitmapFormat value for 'pixelFormat'
+        Frame buffer pixel format. It's one of the values defined by :py:class:`BitmapFormat` .
+
+        This attribute must never (and will never) return :py:attr:`BitmapFormat.opaque`  -- the format of the frame
+        buffer must be always known.
+        """
+        ret = self._get_attr("pixelFormat")
+        return _lib.BitmapFormat(ret)
+
+    @property
+    def height_reduction(self):
+        """Get int value for 'heightReduction'
+        Hint from the frame buffer about how much of the standard
+        screen height it wants to use for itself. This information is
+        exposed to the guest through the VESA BIOS and VMMDev interface
+        so that it can use it for determining its video mode table. It
+        is not guaranteed that the guest respects the value.
+        """
+        ret = self._get_attr("heightReduction")
+        return ret
+
+    @property
+    def overlay(self):
+        """Get IFramebufferOverlay value for 'overlay'
+        An alpha-blended overlay which is superposed over the frame buffer.
+        The initial purpose is to allow the display of icons providing
+        information about the VM state, including disk activity, in front
+        ends which do not have other means of doing that. The overlay is
+        designed to controlled exclusively by IDisplay. It has no locking
+        of its own, and any changes made to it are not guaranteed to be
+        visible until the affected portion of IFramebuffer is updated. The
+        overlay can be created lazily the first time it is requested. This
+        attribute can also return @c null to signal that the overlay is not
+        implemented.
+        """
+        ret = self._get_attr("overlay")
+        return _lib.IFramebufferOverlay(ret)
+
+    @property
+    def win_id(self):
+        """Get int value for 'winId'
+        Platform-dependent identifier of the window where context of this
+        frame buffer is drawn, or zero if there's no such window.
+        """
+        ret = self._get_attr("winId")
+        return ret
+
+    @property
+    def capabilities(self):
+        """Get FramebufferCapabilities value for 'capabilities'
+        Capabilities of the framebuffer instance.
+
+        For the meaning of individual capability flags see
+        :py:class:`FramebufferCapabilities` .
+        """
+        ret = self._get_attr("capabilities")
+        return [_lib.FramebufferCapabilities(a) for a in ret]
+
+    def notify_update(self, x, y, width, height):
+        """Informs about an update.
+        Gets called by the display object where this buffer is
+        registered.
+
+        in x of type int
+            X position of update.
+
+        in y of type int
+            Y position of update.
+
+        in width of type int
+            Width of update.
+
+        in height of type int
+            Height of update.
+
+        """
+        if not isinstance(x, baseinteger):
+            raise TypeError("x can only be an instance of type baseinteger")
+        if not isinstance(y, baseinteger):
+            raise TypeError("y can only be an instance of type baseinteger")
+        if not isinstance(width, baseinteger):
+            raise TypeError("width can only be an instance of type baseinteger")
+        if not isinstance(height, baseinteger):
+            raise TypeError("height can only be an instance of type baseinteger")
+        self._call("notifyUpdate", in_p=[x, y, width, height])
+
+    def notify_update_image(self, x, y, width, height, image):
+        """Informs about an update and provides 32bpp bitmap.
+
+        in x of type int
+            X position of update.
+
+        in y of type int
+            Y position of update.
+
+        in width of type int
+            Width of update.
+
+        in height of type int
+            Height of update.
+
+        in image of type str
+            Array with 32BPP image data.
+
+        """
+        if not isinstance(x, baseinteger):
+            raise TypeError("x can only be an instance of type baseinteger")
+        if not isinstance(y, baseinteger):
+            raise TypeError("y can only be an instance of type baseinteger")
+        if not isinstance(width, baseinteger):
+            raise TypeError("width can only be an instance of type baseinteger")
+        if not isinstance(height, baseinteger):
+            raise TypeError("height can only be an instance of type baseinteger")
+        if not isinstance(image, list):
+            raise TypeError("image can only be an instance of type list")
+        for a in image[:10]:
+            if not isinstance(a, basestring):
+                raise TypeError("array can only contain objects of type basestring")
+        self._call("notifyUpdateImage", in_p=[x, y, width, height, image])
+
+    def notify_change(self, screen_id, x_origin, y_origin, width, height):
+        """Requests a size change.
+
+        in screen_id of type int
+            Logical guest screen number.
+
+        in x_origin of type int
+            Location of the screen in the guest.
+
+        in y_origin of type int
+            Location of the screen in the guest.
+
+        in width of type int
+            Width of the guest display, in pixels.
+
+        in height of type int
+            Height of the guest display, in pixels.
+
+        """
+        if not isinstance(screen_id, baseinteger):
+            raise TypeError("screen_id can only be an instance of type baseinteger")
+        if not isinstance(x_origin, baseinteger):
+            raise TypeError("x_origin can only be an instance of type baseinteger")
+        if not isinstance(y_origin, baseinteger):
+            raise TypeError("y_origin can only be an instance of type baseinteger")
+        if not isinstance(width, baseinteger):
+            raise TypeError("width can only be an instance of type baseinteger")
+        if not isinstance(height, baseinteger):
+            raise TypeError("height can only be an instance of type baseinteger")
+        self._call("notifyChange", in_p=[screen_id, x_origin, y_origin, width, height])
+
+    def video_mode_supported(self, width, height, bpp):
+        """Returns whether the frame buffer implementation is willing to
+        support a given video mode. In case it is not able to render
+        the video mode (or for some reason not willing), it should
+        return @c false. Usually this method is called when the guest
+        asks the VMM device whether a given video mode is supported
+        so the information returned is directly exposed to the guest.
+        It is important that this method returns very quickly.
+
+        in width of type int
+
+        in height of type int
+
+        in bpp of type int
+
+        return supported of type bool
+
+        """
+        if not isinstance(width, baseinteger):
+            raise TypeError("width can only be an instance of type baseinteger")
+        if not isinstance(height, baseinteger):
+            raise TypeError("height can only be an instance of type baseinteger")
+        if not isinstance(bpp, baseinteger):
+            raise TypeError("bpp can only be an instance of type baseinteger")
+        supported = self._call("videoModeSupported", in_p=[width, height, bpp])
+        return supported
+
+    def get_visible_region(self, rectangles, count):
+        """Returns the visible region of this frame buffer.
+
+        If the @a rectangles parameter is @c null then the value of the
+        @a count parameter is ignored and the number of elements necessary to
+        describe the current visible region is returned in @a countCopied.
+
+        If @a rectangles is not @c null but @a count is less
+        than the required number of elements to store region data, the method
+        will report a failure. If @a count is equal or greater than the
+        required number of elements, then the actual number of elements copied
+        to the provided array will be returned in @a countCopied.
+
+
+        The address of the provided array must be in the process space of
+        this IFramebuffer object.
+
+
+        Method not yet implemented.
+
+        in rectangles of type str
+            Pointer to the @c RTRECT array to receive region data.
+
+        in count of type int
+            Number of @c RTRECT elements in the @a rectangles array.
+
+        return count_copied of type int
+            Number of elements copied to the @a rectangles array.
+
+        """
+        if not isinstance(rectangles, basestring):
+            raise TypeError("rectangles can only be an instance of type basestring")
+        if not isinstance(count, baseinteger):
+            raise TypeError("count can only be an instance of type baseinteger")
+        count_copied = self._call("getVisibleRegion", in_p=[rectangles, count])
+        return count_copied
+
+    def set_visible_region(self, rectangles, count):
+        """Suggests a new visible region to this frame buffer. This region
+        represents the area of the VM display which is a union of regions of
+        all top-level windows of the guest operating system running inside the
+        VM (if the Guest Additions for this system support this
+        functionality). This information may be used by the frontends to
+        implement the seamless desktop integration feature.
+
+
+        The address of the provided array must be in the process space of
+        this IFramebuffer object.
+
+
+        The IFramebuffer implementation must make a copy of the provided
+        array of rectangles.
+
+
+        Method not yet implemented.
+
+        in rectangles of type str
+            Pointer to the @c RTRECT array.
+
+        in count of type int
+            Number of @c RTRECT elements in the @a rectangles array.
+
+        """
+        if not isinstance(rectangles, basestring):
+            raise TypeError("rectangles can only be an instance of type basestring")
+        if not isinstance(count, baseinteger):
+            raise TypeError("count can only be an instance of type baseinteger")
+        self._call("setVisibleRegion", in_p=[rectangles, count])
+
+    def process_vhwa_command(self, command, enm_cmd, from_guest):
+        """Posts a Video HW Acceleration Command to the frame buffer for processing.
+        The commands used for 2D video acceleration (DDraw surface creation/destroying, blitting, scaling, color conversion, overlaying, etc.)
+        are posted from quest to the host to be processed by the host hardware.
+
+
+        The address of the provided command must be in the process space of
+        this IFramebuffer object.
+
+        in command of type str
+            Pointer to VBOXVHWACMD containing the command to execute.
+
+        in enm_cmd of type int
+            The validated VBOXVHWACMD::enmCmd value from the command.
+
+        in from_guest of type bool
+            Set when the command origins from the guest, clear if host.
+
+        """
+        if not isinstance(command, basestring):
+            raise TypeError("command can only be an instance of type basestring")
+        if not isinstance(enm_cmd, baseinteger):
+            raise TypeError("enm_cmd can only be an instance of type baseinteger")
+        if not isinstance(from_guest, bool):
+            raise TypeError("from_guest can only be an instance of type bool")
+        self._call("processVHWACommand", in_p=[command, enm_cmd, from_guest])
+
+    def notify3_d_event(self, type_p, data):
+        """Notifies framebuffer about 3D backend event.
+
+        in type_p of type int
+            event type. VBOX3D_NOTIFY_TYPE_* in VBoxVideo3D.h
+
+        in data of type str
+            event-specific data, depends on the supplied event type
+
+        """
+        if not isinstance(type_p, baseinteger):
+            raise TypeError("type_p can only be an instance of type baseinteger")
+        if not isinstance(data, list):
+            raise TypeError("data can only be an instance of type list")
+        for a in data[:10]:
+            if not isinstance(a, basestring):
+                raise TypeError("array can only contain objects of type basestring")
+        self._call("notify3DEvent", in_p=[type_p, data])
@@ -0,0 +1,92 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from .iframebuffer import IFramebuffer
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IFramebufferOverlay(IFramebuffer):
+    """
+    The IFramebufferOverlay interface represents an alpha blended overlay
+    for displaying status icons above an IFramebuffer. It is always created
+    not visible, so that it must be explicitly shown. It only covers a
+    portion of the IFramebuffer, determined by its width, height and
+    co-ordinates. It is always in packed pixel little-endian 32bit ARGB (in
+    that order) format, and may be written to directly. Do re-read the
+    width though, after setting it, as it may be adjusted (increased) to
+    make it more suitable for the front end.
+    """
+
+    __uuid__ = "af398a9a-6b76-4805-8fab-00a9dcf4732b"
+    __wsmap__ = "managed"
+
+    @property
+    def x(self):
+        """Get int value for 'x'
+        X position of the overlay, relative to the frame buffer.
+        """
+        ret = self._get_attr("x")
+        return ret
+
+    @property
+    def y(self):
+        """Get int value for 'y'
+        Y position of the overlay, relative to the frame buffer.
+        """
+        ret = self._get_attr("y")
+        return ret
+
+    @property
+    def visible(self):
+        """Get or set bool value for 'visible'
+        Whether the overlay is currently visible.
+        """
+        ret = self._get_attr("visible")
+        return ret
+
+    @visible.setter
+    def visible(self, value):
+        if not isinstance(value, bool):
+            raise TypeError("value is not an instance of bool")
+        return self._set_attr("visible", value)
+
+    @property
+    def alpha(self):
+        """Get or set int value for 'alpha'
+        The global alpha value for the overlay. This may or may not be
+        supported by a given front end.
+        """
+        ret = self._get_attr("alpha")
+        return ret
+
+    @alpha.setter
+    def alpha(self, value):
+        if not isinstance(value, baseinteger):
+            raise TypeError("value is not an instance of baseinteger")
+        return self._set_attr("alpha", value)
+
+    def move(self, x, y):
+        """Changes the overlay's position relative to the IFramebuffer.
+
+        in x of type int
+
+        in y of type int
+
+        """
+        if not isinstance(x, baseinteger):
+            raise TypeError("x can only be an instance of type baseinteger")
+        if not isinstance(y, baseinteger):
+            raise TypeError("y can only be an instance of type baseinteger")
+        self._call("move", in_p=[x, y])
@@ -0,0 +1,182 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from ..library_base import Interface
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IFsObjInfo(Interface):
+    """
+    Abstract parent interface for VirtualBox file system object information.
+    This can be information about a file or a directory, for example.
+    """
+
+    __uuid__ = "081fc833-c6fa-430e-6020-6a505d086387"
+    __wsmap__ = "managed"
+
+    @property
+    def name(self):
+        """Get str value for 'name'
+        The object's name.
+        """
+        ret = self._get_attr("name")
+        return ret
+
+    @property
+    def type_p(self):
+        """Get FsObjType value for 'type'
+        The object type. See :py:class:`FsObjType`  for more.
+        """
+        ret = self._get_attr("type")
+        return _lib.FsObjType(ret)
+
+    @property
+    def file_attributes(self):
+        """Get str value for 'fileAttributes'
+        File attributes. Not implemented yet.
+        """
+        ret = self._get_attr("fileAttributes")
+        return ret
+
+    @property
+    def object_size(self):
+        """Get int value for 'objectSize'
+        The logical size (st_size). For normal files this is the size of the file.
+        For symbolic links, this is the length of the path name contained in the
+        symbolic link. For other objects this fields needs to be specified.
+        """
+        ret = self._get_attr("objectSize")
+        return ret
+
+    @property
+    def allocated_size(self):
+        """Get int value for 'allocatedSize'
+        Disk allocation size (st_blocks * DEV_BSIZE).
+        """
+        ret = self._get_attr("allocatedSize")
+        return ret
+
+    @property
+    def access_time(self):
+        """Get int value for 'accessTime'
+        Time of last access (st_atime).
+        """
+        ret = self._get_attr("accessTime")
+        return ret
+
+    @property
+    def birth_time(self):
+        """Get int value for 'birthTime'
+        Time of file birth (st_birthtime).
+        """
+        ret = self._get_attr("birthTime")
+        return ret
+
+    @property
+    def change_time(self):
+        """Get int value for 'changeTime'
+        Time of last status change (st_ctime).
+        """
+        ret = self._get_attr("changeTime")
+        return ret
+
+    @property
+    def modification_time(self):
+        """Get int value for 'modificationTime'
+        Time of last data modification (st_mtime).
+        """
+        ret = self._get_attr("modificationTime")
+        return ret
+
+    @property
+    def uid(self):
+        """Get int value for 'UID'
+        The user owning the filesystem object (st_uid).  This is -1 if not available.
+        """
+        ret = self._get_attr("UID")
+        return ret
+
+    @property
+    def user_name(self):
+        """Get str value for 'userName'
+        The user name.
+        """
+        ret = self._get_attr("userName")
+        return ret
+
+    @property
+    def gid(self):
+        """Get int value for 'GID'
+        The group the filesystem object is assigned (st_gid).  This is -1 if not available.
+        """
+        ret = self._get_attr("GID")
+        return ret
+
+    @property
+    def group_name(self):
+        """Get str value for 'groupName'
+        The group name.
+        """
+        ret = self._get_attr("groupName")
+        return ret
+
+    @property
+    def node_id(self):
+        """Get int value for 'nodeId'
+        The unique identifier (within the filesystem) of this filesystem object (st_ino).
+        This is zero if not availalbe.
+        """
+        ret = self._get_attr("nodeId")
+        return ret
+
+    @property
+    def node_id_device(self):
+        """Get int value for 'nodeIdDevice'
+        The device number of the device which this filesystem object resides on (st_dev).
+        """
+        ret = self._get_attr("nodeIdDevice")
+        return ret
+
+    @property
+    def hard_links(self):
+        """Get int value for 'hardLinks'
+        Number of hard links to this filesystem object (st_nlink).
+        """
+        ret = self._get_attr("hardLinks")
+        return ret
+
+    @property
+    def device_number(self):
+        """Get int value for 'deviceNumber'
+        The device number of a character or block device type object (st_rdev).
+        """
+        ret = self._get_attr("deviceNumber")
+        return ret
+
+    @property
+    def generation_id(self):
+        """Get int value for 'generationId'
+        The current generation number (st_gen).
+        """
+        ret = self._get_attr("generationId")
+        return ret
+
+    @property
+    def user_flags(self):
+        """Get int value for 'userFlags'
+        User flags (st_flags).
+        """
+        ret = self._get_attr("userFlags")
+        return ret
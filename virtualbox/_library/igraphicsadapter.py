@@ -0,0 +1,102 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from ..library_base import Interface
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IGraphicsAdapter(Interface):
+    """
+    The IGraphicsAdapter interface represents the graphics adapter
+    of the virtual machine.
+    """
+
+    __uuid__ = "f692806f-febe-4049-b476-1292a8e45b09"
+    __wsmap__ = "managed"
+
+    @property
+    def graphics_controller_type(self):
+        """Get or set GraphicsControllerType value for 'graphicsControllerType'
+        Graphics controller type.
+        """
+        ret = self._get_attr("graphicsControllerType")
+        return _lib.GraphicsControllerType(ret)
+
+    @graphics_controller_type.setter
+    def graphics_controller_type(self, value):
+        if not isinstance(value, _lib.GraphicsControllerType):
+            raise TypeError("value is not an instance of GraphicsControllerType")
+        return self._set_attr("graphicsControllerType", value)
+
+    @property
+    def vram_size(self):
+        """Get or set int value for 'VRAMSize'
+        Video memory size in megabytes.
+        """
+        ret = self._get_attr("VRAMSize")
+        return ret
+
+    @vram_size.setter
+    def vram_size(self, value):
+        if not isinstance(value, baseinteger):
+            raise TypeError("value is not an instance of baseinteger")
+        return self._set_attr("VRAMSize", value)
+
+    @property
+    def accelerate3_d_enabled(self):
+        """Get or set bool value for 'accelerate3DEnabled'
+        This setting determines whether VirtualBox allows this machine to make
+        use of the 3D graphics support available on the host.
+        """
+        ret = self._get_attr("accelerate3DEnabled")
+        return ret
+
+    @accelerate3_d_enabled.setter
+    def accelerate3_d_enabled(self, value):
+        if not isinstance(value, bool):
+            raise TypeError("value is not an instance of bool")
+        return self._set_attr("accelerate3DEnabled", value)
+
+    @property
+    def accelerate2_d_video_enabled(self):
+        """Get or set bool value for 'accelerate2DVideoEnabled'
+        This setting determines whether VirtualBox allows this machine to make
+        use of the 2D video acceleration support available on the host.
+        """
+        ret = self._get_attr("accelerate2DVideoEnabled")
+        return ret
+
+    @accelerate2_d_video_enabled.setter
+    def accelerate2_d_video_enabled(self, value):
+        if not isinstance(value, bool):
+            raise TypeError("value is not an instance of bool")
+        return self._set_attr("accelerate2DVideoEnabled", value)
+
+    @property
+    def monitor_count(self):
+        """Get or set int value for 'monitorCount'
+        Number of virtual monitors.
+
+        Only effective on Windows XP and later guests with
+        Guest Additions installed.
+        """
+        ret = self._get_attr("monitorCount")
+        return ret
+
+    @monitor_count.setter
+    def monitor_count(self, value):
+        if not isinstance(value, baseinteger):
+            raise TypeError("value is not an instance of baseinteger")
+        return self._set_attr("monitorCount", value)
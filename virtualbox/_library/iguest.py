@@ -0,0 +1,457 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from ..library_base import Interface
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IGuest(Interface):
+    """
+    The IGuest interface represents information about the operating system
+    running inside the virtual machine. Used in
+    :py:func:`IConsole.guest` .
+
+    IGuest provides information about the guest operating system, whether
+    Guest Additions are installed and other OS-specific virtual machine
+    properties.
+    """
+
+    __uuid__ = "00892186-A4AF-4627-B21F-FC561CE4473C"
+    __wsmap__ = "managed"
+
+    @property
+    def os_type_id(self):
+        """Get str value for 'OSTypeId'
+        Identifier of the Guest OS type as reported by the Guest
+        Additions.
+        You may use :py:func:`IVirtualBox.get_guest_os_type`  to obtain
+        an IGuestOSType object representing details about the given
+        Guest OS type.
+
+        If Guest Additions are not installed, this value will be
+        the same as :py:func:`IMachine.os_type_id` .
+        """
+        ret = self._get_attr("OSTypeId")
+        return ret
+
+    @property
+    def additions_run_level(self):
+        """Get AdditionsRunLevelType value for 'additionsRunLevel'
+        Current run level of the installed Guest Additions.
+        """
+        ret = self._get_attr("additionsRunLevel")
+        return _lib.AdditionsRunLevelType(ret)
+
+    @property
+    def additions_version(self):
+        """Get str value for 'additionsVersion'
+        Version of the installed Guest Additions in the same format as
+        :py:func:`IVirtualBox.version` .
+        """
+        ret = self._get_attr("additionsVersion")
+        return ret
+
+    @property
+    def additions_revision(self):
+        """Get int value for 'additionsRevision'
+        The internal build revision number of the installed Guest Additions.
+
+        See also :py:func:`IVirtualBox.revision` .
+        """
+        ret = self._get_attr("additionsRevision")
+        return ret
+
+    @property
+    def dn_d_source(self):
+        """Get IGuestDnDSource value for 'dnDSource'
+        Retrieves the drag'n drop source implementation for the guest side, that
+        is, handling and retrieving drag'n drop data from the guest.
+        """
+        ret = self._get_attr("dnDSource")
+        return _lib.IGuestDnDSource(ret)
+
+    @property
+    def dn_d_target(self):
+        """Get IGuestDnDTarget value for 'dnDTarget'
+        Retrieves the drag'n drop source implementation for the host side. This
+        will allow the host to handle and initiate a drag'n drop operation to copy
+        data from the host to the guest.
+        """
+        ret = self._get_attr("dnDTarget")
+        return _lib.IGuestDnDTarget(ret)
+
+    @property
+    def event_source(self):
+        """Get IEventSource value for 'eventSource'
+        Event source for guest events.
+        """
+        ret = self._get_attr("eventSource")
+        return _lib.IEventSource(ret)
+
+    @property
+    def facilities(self):
+        """Get IAdditionsFacility value for 'facilities'
+        Returns a collection of current known facilities. Only returns facilities where
+        a status is known, e.g. facilities with an unknown status will not be returned.
+        """
+        ret = self._get_attr("facilities")
+        return [_lib.IAdditionsFacility(a) for a in ret]
+
+    @property
+    def sessions(self):
+        """Get IGuestSession value for 'sessions'
+        Returns a collection of all opened guest sessions.
+        """
+        ret = self._get_attr("sessions")
+        return [_lib.IGuestSession(a) for a in ret]
+
+    @property
+    def memory_balloon_size(self):
+        """Get or set int value for 'memoryBalloonSize'
+        Guest system memory balloon size in megabytes (transient property).
+        """
+        ret = self._get_attr("memoryBalloonSize")
+        return ret
+
+    @memory_balloon_size.setter
+    def memory_balloon_size(self, value):
+        if not isinstance(value, baseinteger):
+            raise TypeError("value is not an instance of baseinteger")
+        return self._set_attr("memoryBalloonSize", value)
+
+    @property
+    def statistics_update_interval(self):
+        """Get or set int value for 'statisticsUpdateInterval'
+        Interval to update guest statistics in seconds.
+        """
+        ret = self._get_attr("statisticsUpdateInterval")
+        return ret
+
+    @statistics_update_interval.setter
+    def statistics_update_interval(self, value):
+        if not isinstance(value, baseinteger):
+            raise TypeError("value is not an instance of baseinteger")
+        return self._set_attr("statisticsUpdateInterval", value)
+
+    def internal_get_statistics(self):
+        """Internal method; do not use as it might change at any time.
+
+        out cpu_user of type int
+            Percentage of processor time spent in user mode as seen by the guest.
+
+        out cpu_kernel of type int
+            Percentage of processor time spent in kernel mode as seen by the guest.
+
+        out cpu_idle of type int
+            Percentage of processor time spent idling as seen by the guest.
+
+        out mem_total of type int
+            Total amount of physical guest RAM.
+
+        out mem_free of type int
+            Free amount of physical guest RAM.
+
+        out mem_balloon of type int
+            Amount of ballooned physical guest RAM.
+
+        out mem_shared of type int
+            Amount of shared physical guest RAM.
+
+        out mem_cache of type int
+            Total amount of guest (disk) cache memory.
+
+        out paged_total of type int
+            Total amount of space in the page file.
+
+        out mem_alloc_total of type int
+            Total amount of memory allocated by the hypervisor.
+
+        out mem_free_total of type int
+            Total amount of free memory available in the hypervisor.
+
+        out mem_balloon_total of type int
+            Total amount of memory ballooned by the hypervisor.
+
+        out mem_shared_total of type int
+            Total amount of shared memory in the hypervisor.
+
+        """
+        (
+            cpu_user,
+            cpu_kernel,
+            cpu_idle,
+            mem_total,
+            mem_free,
+            mem_balloon,
+            mem_shared,
+            mem_cache,
+            paged_total,
+            mem_alloc_total,
+            mem_free_total,
+            mem_balloon_total,
+            mem_shared_total,
+        ) = self._call("internalGetStatistics")
+        return (
+            cpu_user,
+            cpu_kernel,
+            cpu_idle,
+            mem_total,
+            mem_free,
+            mem_balloon,
+            mem_shared,
+            mem_cache,
+            paged_total,
+            mem_alloc_total,
+            mem_free_total,
+            mem_balloon_total,
+            mem_shared_total,
+        )
+
+    def get_facility_status(self, facility):
+        """Get the current status of a Guest Additions facility.
+
+        in facility of type :class:`AdditionsFacilityType`
+            Facility to check status for.
+
+        out timestamp of type int
+            Timestamp (in ms) of last status update seen by the host.
+
+        return status of type :class:`AdditionsFacilityStatus`
+            The current (latest) facility status.
+
+        """
+        if not isinstance(facility, _lib.AdditionsFacilityType):
+            raise TypeError(
+                "facility can only be an instance of type AdditionsFacilityType"
+            )
+        status, timestamp = self._call("getFacilityStatus", in_p=[facility])
+        status = _lib.AdditionsFacilityStatus(status)
+        return (status, timestamp)
+
+    def get_additions_status(self, level):
+        """Retrieve the current status of a certain Guest Additions run level.
+
+        in level of type :class:`AdditionsRunLevelType`
+            Status level to check
+
+        return active of type bool
+            Flag whether the status level has been reached or not
+
+        raises :class:`VBoxErrorNotSupported`
+            Wrong status level specified.
+
+        """
+        if not isinstance(level, _lib.AdditionsRunLevelType):
+            raise TypeError(
+                "level can only be an instance of type AdditionsRunLevelType"
+            )
+        active = self._call("getAdditionsStatus", in_p=[level])
+        return active
+
+    def set_credentials(self, user_name, password, domain, allow_interactive_logon):
+        """Store login credentials that can be queried by guest operating
+        systems with Additions installed. The credentials are transient
+        to the session and the guest may also choose to erase them. Note
+        that the caller cannot determine whether the guest operating system
+        has queried or made use of the credentials.
+
+        in user_name of type str
+            User name string, can be empty
+
+        in password of type str
+            Password string, can be empty
+
+        in domain of type str
+            Domain name (guest logon scheme specific), can be empty
+
+        in allow_interactive_logon of type bool
+            Flag whether the guest should alternatively allow the user to
+            interactively specify different credentials. This flag might
+            not be supported by all versions of the Additions.
+
+        raises :class:`VBoxErrorVmError`
+            VMM device is not available.
+
+        """
+        if not isinstance(user_name, basestring):
+            raise TypeError("user_name can only be an instance of type basestring")
+        if not isinstance(password, basestring):
+            raise TypeError("password can only be an instance of type basestring")
+        if not isinstance(domain, basestring):
+            raise TypeError("domain can only be an instance of type basestring")
+        if not isinstance(allow_interactive_logon, bool):
+            raise TypeError(
+                "allow_interactive_logon can only be an instance of type bool"
+            )
+        self._call(
+            "setCredentials",
+            in_p=[user_name, password, domain, allow_interactive_logon],
+        )
+
+    def create_session(self, user, password, domain, session_name):
+        """Creates a new guest session for controlling the guest. The new session
+        will be started asynchronously, meaning on return of this function it is
+        not guaranteed that the guest session is in a started and/or usable state.
+        To wait for successful startup, use the :py:func:`IGuestSession.wait_for`
+        call.
+
+        A guest session represents one impersonated user account in the guest, so
+        every operation will use the same credentials specified when creating
+        the session object via :py:func:`IGuest.create_session` . Anonymous
+        sessions, that is, sessions without specifying a valid
+        user account in the guest are not allowed reasons of security.
+
+        There can be a maximum of 32 sessions at once per VM.  An error will
+        be returned if this has been reached.
+
+        For more information please consult :py:class:`IGuestSession`
+
+        in user of type str
+            User name this session will be using to control the guest; has to exist
+            and have the appropriate rights to execute programs in the VM. Must not
+            be empty.
+
+        in password of type str
+            Password of the user account to be used. Empty passwords are allowed.
+
+        in domain of type str
+            Domain name of the user account to be used if the guest is part of
+            a domain. Optional. This feature is not implemented yet.
+
+        in session_name of type str
+            The session's friendly name. Optional, can be empty.
+
+        return guest_session of type :class:`IGuestSession`
+            The newly created session object.
+
+        raises :class:`VBoxErrorIprtError`
+            Error creating guest session.
+
+        raises :class:`VBoxErrorMaximumReached`
+            The maximum of concurrent guest sessions has been reached.
+
+        """
+        if not isinstance(user, basestring):
+            raise TypeError("user can only be an instance of type basestring")
+        if not isinstance(password, basestring):
+            raise TypeError("password can only be an instance of type basestring")
+        if not isinstance(domain, basestring):
+            raise TypeError("domain can only be an instance of type basestring")
+        if not isinstance(session_name, basestring):
+            raise TypeError("session_name can only be an instance of type basestring")
+        guest_session = self._call(
+            "createSession", in_p=[user, password, domain, session_name]
+        )
+        guest_session = _lib.IGuestSession(guest_session)
+        return guest_session
+
+    def find_session(self, session_name):
+        """Finds guest sessions by their friendly name and returns an interface
+        array with all found guest sessions.
+
+        in session_name of type str
+            The session's friendly name to find. Wildcards like ? and * are allowed.
+
+        return sessions of type :class:`IGuestSession`
+            Array with all guest sessions found matching the name specified.
+
+        """
+        if not isinstance(session_name, basestring):
+            raise TypeError("session_name can only be an instance of type basestring")
+        sessions = self._call("findSession", in_p=[session_name])
+        sessions = [_lib.IGuestSession(a) for a in sessions]
+        return sessions
+
+    def shutdown(self, flags):
+        """Shuts down (and optionally halts and/or reboots) the guest.
+                Needs supported Guest Additions installed.
+
+                in flags of type :class:`GuestShutdownFlag`
+                    :py:class:`GuestShutdownFlag`  flags.
+
+                raises :class:`VBoxErrorNotSupported`
+                    Guest OS is not supported for shutting down, or the
+        already installed Guest Additions are not supported.
+
+                raises :class:`VBoxErrorIprtError`
+                    Error while shutting down.
+
+        """
+        if not isinstance(flags, list):
+            raise TypeError("flags can only be an instance of type list")
+        for a in flags[:10]:
+            if not isinstance(a, _lib.GuestShutdownFlag):
+                raise TypeError(
+                    "array can only contain objects of type GuestShutdownFlag"
+                )
+        self._call("shutdown", in_p=[flags])
+
+    def update_guest_additions(self, source, arguments, flags):
+        """Automatically updates already installed Guest Additions in a VM.
+
+                At the moment only Windows and Linux guests are supported.
+
+                Because the VirtualBox Guest Additions drivers are not WHQL-certified
+                yet there might be warning dialogs during the actual Guest Additions
+                update. These need to be confirmed manually in order to continue the
+                installation process. This applies to Windows 2000 and Windows XP guests
+                and therefore these guests can't be updated in a fully automated fashion
+                without user interaction. However, to start a Guest Additions update for
+                the mentioned Windows versions anyway, the flag
+                AdditionsUpdateFlag_WaitForUpdateStartOnly can be specified. See
+                :py:class:`AdditionsUpdateFlag`  for more information.
+
+                The guest needs to be restarted in order to make use of the updated
+                Guest Additions.
+
+                in source of type str
+                    Path to the Guest Additions .ISO file to use for the update.
+
+                in arguments of type str
+                    Optional command line arguments to use for the Guest Additions
+                    installer. Useful for retrofitting features which weren't installed
+                    before in the guest.
+
+                in flags of type :class:`AdditionsUpdateFlag`
+                    :py:class:`AdditionsUpdateFlag`  flags.
+
+                return progress of type :class:`IProgress`
+                    Progress object to track the operation completion.
+
+                raises :class:`VBoxErrorNotSupported`
+                    Guest OS is not supported for automated Guest Additions updates or the
+        already installed Guest Additions are not ready yet.
+
+                raises :class:`VBoxErrorIprtError`
+                    Error while updating.
+
+        """
+        if not isinstance(source, basestring):
+            raise TypeError("source can only be an instance of type basestring")
+        if not isinstance(arguments, list):
+            raise TypeError("arguments can only be an instance of type list")
+        for a in arguments[:10]:
+            if not isinstance(a, basestring):
+                raise TypeError("array can only contain objects of type basestring")
+        if not isinstance(flags, list):
+            raise TypeError("flags can only be an instance of type list")
+        for a in flags[:10]:
+            if not isinstance(a, _lib.AdditionsUpdateFlag):
+                raise TypeError(
+                    "array can only contain objects of type AdditionsUpdateFlag"
+                )
+        progress = self._call("updateGuestAdditions", in_p=[source, arguments, flags])
+        progress = _lib.IProgress(progress)
+        return progress
@@ -0,0 +1,60 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from .ievent import IEvent
+from .vboxeventtype import VBoxEventType
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IGuestAdditionsStatusChangedEvent(IEvent):
+    """
+    The guest addition status changed.
+    """
+
+    __uuid__ = "a443da5b-aa82-4720-bc84-bd097b2b13b8"
+    __wsmap__ = "managed"
+    id = VBoxEventType.on_guest_additions_status_changed
+
+    @property
+    def facility(self):
+        """Get AdditionsFacilityType value for 'facility'
+        Facility this event relates to.
+        """
+        ret = self._get_attr("facility")
+        return _lib.AdditionsFacilityType(ret)
+
+    @property
+    def status(self):
+        """Get AdditionsFacilityStatus value for 'status'
+        The new facility status.
+        """
+        ret = self._get_attr("status")
+        return _lib.AdditionsFacilityStatus(ret)
+
+    @property
+    def run_level(self):
+        """Get AdditionsRunLevelType value for 'runLevel'
+        The new run level.
+        """
+        ret = self._get_attr("runLevel")
+        return _lib.AdditionsRunLevelType(ret)
+
+    @property
+    def timestamp(self):
+        """Get int value for 'timestamp'
+        The millisecond timestamp associated with the event.
+        """
+        ret = self._get_attr("timestamp")
+        return ret
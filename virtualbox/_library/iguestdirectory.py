@@ -0,0 +1,33 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from .idirectory import IDirectory
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IGuestDirectory(IDirectory):
+    """
+    Implementation of the :py:class:`IDirectory`  object
+    for directories in the guest.
+    """
+
+    __uuid__ = "cc830458-4974-a19c-4dc6-cc98c2269626"
+    __wsmap__ = "managed"
+
+    @property
+    def midl_does_not_like_empty_interfaces(self):
+        """Get bool value for 'midlDoesNotLikeEmptyInterfaces'"""
+        ret = self._get_attr("midlDoesNotLikeEmptyInterfaces")
+        return ret
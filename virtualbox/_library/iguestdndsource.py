@@ -0,0 +1,33 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from .idndsource import IDnDSource
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IGuestDnDSource(IDnDSource):
+    """
+    Implementation of the :py:class:`IDnDSource`  object
+    for source drag'n drop operations on the guest.
+    """
+
+    __uuid__ = "dedfb5d9-4c1b-edf7-fdf3-c1be6827dc28"
+    __wsmap__ = "managed"
+
+    @property
+    def midl_does_not_like_empty_interfaces(self):
+        """Get bool value for 'midlDoesNotLikeEmptyInterfaces'"""
+        ret = self._get_attr("midlDoesNotLikeEmptyInterfaces")
+        return ret
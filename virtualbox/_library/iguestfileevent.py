@@ -0,0 +1,34 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from .iguestsessionevent import IGuestSessionEvent
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IGuestFileEvent(IGuestSessionEvent):
+    """
+    Base abstract interface for all guest file events.
+    """
+
+    __uuid__ = "c8adb7b0-057d-4391-b928-f14b06b710c5"
+    __wsmap__ = "managed"
+
+    @property
+    def file_p(self):
+        """Get IGuestFile value for 'file'
+        Guest file object which is related to this event.
+        """
+        ret = self._get_attr("file")
+        return _lib.IGuestFile(ret)
@@ -0,0 +1,42 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from .iguestfileevent import IGuestFileEvent
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IGuestFileIOEvent(IGuestFileEvent):
+    """
+    Base abstract interface for all guest file input/output (IO) events.
+    """
+
+    __uuid__ = "b5191a7c-9536-4ef8-820e-3b0e17e5bbc8"
+    __wsmap__ = "managed"
+
+    @property
+    def offset(self):
+        """Get int value for 'offset'
+        Current offset (in bytes).
+        """
+        ret = self._get_attr("offset")
+        return ret
+
+    @property
+    def processed(self):
+        """Get int value for 'processed'
+        Processed input or output (in bytes).
+        """
+        ret = self._get_attr("processed")
+        return ret
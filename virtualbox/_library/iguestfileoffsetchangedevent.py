@@ -0,0 +1,34 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from .iguestfileioevent import IGuestFileIOEvent
+from .vboxeventtype import VBoxEventType
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IGuestFileOffsetChangedEvent(IGuestFileIOEvent):
+    """
+    Notification when a guest file changed its current offset via :py:func:`IFile.seek` .
+    """
+
+    __uuid__ = "e8f79a21-1207-4179-94cf-ca250036308f"
+    __wsmap__ = "managed"
+    id = VBoxEventType.on_guest_file_offset_changed
+
+    @property
+    def midl_does_not_like_empty_interfaces(self):
+        """Get bool value for 'midlDoesNotLikeEmptyInterfaces'"""
+        ret = self._get_attr("midlDoesNotLikeEmptyInterfaces")
+        return ret
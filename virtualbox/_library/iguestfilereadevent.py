@@ -0,0 +1,36 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from .iguestfileioevent import IGuestFileIOEvent
+from .vboxeventtype import VBoxEventType
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IGuestFileReadEvent(IGuestFileIOEvent):
+    """
+    Notification when data has been read from a guest file.
+    """
+
+    __uuid__ = "4ee3cbcb-486f-40db-9150-deee3fd24189"
+    __wsmap__ = "managed"
+    id = VBoxEventType.on_guest_file_read
+
+    @property
+    def data(self):
+        """Get str value for 'data'
+        Actual data read.
+        """
+        ret = self._get_attr("data")
+        return ret
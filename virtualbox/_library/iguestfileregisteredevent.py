@@ -0,0 +1,37 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from .iguestfileevent import IGuestFileEvent
+from .vboxeventtype import VBoxEventType
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IGuestFileRegisteredEvent(IGuestFileEvent):
+    """
+    Notification when a guest file was registered or unregistered.
+    """
+
+    __uuid__ = "d0d93830-70a2-487e-895e-d3fc9679f7b3"
+    __wsmap__ = "managed"
+    id = VBoxEventType.on_guest_file_registered
+
+    @property
+    def registered(self):
+        """Get bool value for 'registered'
+        If @c true, the guest file was registered, otherwise it was
+        unregistered.
+        """
+        ret = self._get_attr("registered")
+        return ret
@@ -0,0 +1,34 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from .iguestfileevent import IGuestFileEvent
+from .vboxeventtype import VBoxEventType
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IGuestFileSizeChangedEvent(IGuestFileEvent):
+    """
+    Notification when a guest file changed its size via :py:func:`IFile.set_size` .
+    """
+
+    __uuid__ = "d78374e9-486e-472f-481b-969746af2480"
+    __wsmap__ = "managed"
+    id = VBoxEventType.on_guest_file_size_changed
+
+    @property
+    def new_size(self):
+        """Get int value for 'newSize'"""
+        ret = self._get_attr("newSize")
+        return ret
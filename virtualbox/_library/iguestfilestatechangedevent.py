@@ -0,0 +1,48 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from .iguestfileevent import IGuestFileEvent
+from .vboxeventtype import VBoxEventType
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IGuestFileStateChangedEvent(IGuestFileEvent):
+    """
+    Notification when a guest file changed its state.
+    """
+
+    __uuid__ = "d37fe88f-0979-486c-baa1-3abb144dc82d"
+    __wsmap__ = "managed"
+    id = VBoxEventType.on_guest_file_state_changed
+
+    @property
+    def status(self):
+        """Get FileStatus value for 'status'
+        New guest file status.
+        """
+        ret = self._get_attr("status")
+        return _lib.FileStatus(ret)
+
+    @property
+    def error(self):
+        """Get IVirtualBoxErrorInfo value for 'error'
+        Error information in case of new session status is indicating an error.
+
+        The attribute :py:func:`IVirtualBoxErrorInfo.result_detail`  will contain
+        the runtime (IPRT) error code from the guest. See include/iprt/err.h and
+        include/VBox/err.h for details.
+        """
+        ret = self._get_attr("error")
+        return _lib.IVirtualBoxErrorInfo(ret)
@@ -0,0 +1,33 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from .ifsobjinfo import IFsObjInfo
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IGuestFsObjInfo(IFsObjInfo):
+    """
+    Represents the guest implementation of the
+    :py:class:`IFsObjInfo`  object.
+    """
+
+    __uuid__ = "6620db85-44e0-ca69-e9e0-d4907ceccbe5"
+    __wsmap__ = "managed"
+
+    @property
+    def midl_does_not_like_empty_interfaces(self):
+        """Get bool value for 'midlDoesNotLikeEmptyInterfaces'"""
+        ret = self._get_attr("midlDoesNotLikeEmptyInterfaces")
+        return ret
@@ -0,0 +1,36 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from .ievent import IEvent
+from .vboxeventtype import VBoxEventType
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IGuestKeyboardEvent(IEvent):
+    """
+    Notification when guest keyboard event happens.
+    """
+
+    __uuid__ = "88394258-7006-40d4-b339-472ee3801844"
+    __wsmap__ = "managed"
+    id = VBoxEventType.on_guest_keyboard
+
+    @property
+    def scancodes(self):
+        """Get int value for 'scancodes'
+        Array of scancodes.
+        """
+        ret = self._get_attr("scancodes")
+        return ret
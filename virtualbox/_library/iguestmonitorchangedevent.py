@@ -0,0 +1,80 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from .ievent import IEvent
+from .vboxeventtype import VBoxEventType
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IGuestMonitorChangedEvent(IEvent):
+    """
+    Notification when the guest enables one of its monitors.
+    """
+
+    __uuid__ = "0f7b8a22-c71f-4a36-8e5f-a77d01d76090"
+    __wsmap__ = "managed"
+    id = VBoxEventType.on_guest_monitor_changed
+
+    @property
+    def change_type(self):
+        """Get GuestMonitorChangedEventType value for 'changeType'
+        What was changed for this guest monitor.
+        """
+        ret = self._get_attr("changeType")
+        return _lib.GuestMonitorChangedEventType(ret)
+
+    @property
+    def screen_id(self):
+        """Get int value for 'screenId'
+        The monitor which was changed.
+        """
+        ret = self._get_attr("screenId")
+        return ret
+
+    @property
+    def origin_x(self):
+        """Get int value for 'originX'
+        Physical X origin relative to the primary screen.
+        Valid for Enabled and NewOrigin.
+        """
+        ret = self._get_attr("originX")
+        return ret
+
+    @property
+    def origin_y(self):
+        """Get int value for 'originY'
+        Physical Y origin relative to the primary screen.
+        Valid for Enabled and NewOrigin.
+        """
+        ret = self._get_attr("originY")
+        return ret
+
+    @property
+    def width(self):
+        """Get int value for 'width'
+        Width of the screen.
+        Valid for Enabled.
+        """
+        ret = self._get_attr("width")
+        return ret
+
+    @property
+    def height(self):
+        """Get int value for 'height'
+        Height of the screen.
+        Valid for Enabled.
+        """
+        ret = self._get_attr("height")
+        return ret
@@ -0,0 +1,36 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from .ievent import IEvent
+from .vboxeventtype import VBoxEventType
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IGuestMonitorInfoChangedEvent(IEvent):
+    """
+    The guest reports cursor position data.
+    """
+
+    __uuid__ = "0b3cdeb2-808e-11e9-b773-133d9330f849"
+    __wsmap__ = "managed"
+    id = VBoxEventType.on_guest_monitor_info_changed
+
+    @property
+    def output(self):
+        """Get int value for 'output'
+        The virtual display output on which the monitor has changed.
+        """
+        ret = self._get_attr("output")
+        return ret
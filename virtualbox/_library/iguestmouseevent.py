@@ -0,0 +1,76 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from .ireusableevent import IReusableEvent
+from .vboxeventtype import VBoxEventType
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IGuestMouseEvent(IReusableEvent):
+    """
+    Notification when guest mouse event happens.
+    """
+
+    __uuid__ = "179f8647-319c-4e7e-8150-c5837bd265f6"
+    __wsmap__ = "managed"
+    id = VBoxEventType.on_guest_mouse
+
+    @property
+    def mode(self):
+        """Get GuestMouseEventMode value for 'mode'
+        If this event is relative, absolute or multi-touch.
+        """
+        ret = self._get_attr("mode")
+        return _lib.GuestMouseEventMode(ret)
+
+    @property
+    def x(self):
+        """Get int value for 'x'
+        New X position, or X delta.
+        """
+        ret = self._get_attr("x")
+        return ret
+
+    @property
+    def y(self):
+        """Get int value for 'y'
+        New Y position, or Y delta.
+        """
+        ret = self._get_attr("y")
+        return ret
+
+    @property
+    def z(self):
+        """Get int value for 'z'
+        Z delta.
+        """
+        ret = self._get_attr("z")
+        return ret
+
+    @property
+    def w(self):
+        """Get int value for 'w'
+        W delta.
+        """
+        ret = self._get_attr("w")
+        return ret
+
+    @property
+    def buttons(self):
+        """Get int value for 'buttons'
+        Button state bitmask.
+        """
+        ret = self._get_attr("buttons")
+        return ret
@@ -0,0 +1,78 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from .ievent import IEvent
+from .vboxeventtype import VBoxEventType
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IGuestMultiTouchEvent(IEvent):
+    """
+    Notification when guest touch screen event happens.
+    """
+
+    __uuid__ = "be8a0eb5-f4f4-4dd0-9d30-c89b873247ec"
+    __wsmap__ = "managed"
+    id = VBoxEventType.on_guest_multi_touch
+
+    @property
+    def contact_count(self):
+        """Get int value for 'contactCount'
+        Number of contacts in the event.
+        """
+        ret = self._get_attr("contactCount")
+        return ret
+
+    @property
+    def x_positions(self):
+        """Get int value for 'xPositions'
+        X positions.
+        """
+        ret = self._get_attr("xPositions")
+        return ret
+
+    @property
+    def y_positions(self):
+        """Get int value for 'yPositions'
+        Y positions.
+        """
+        ret = self._get_attr("yPositions")
+        return ret
+
+    @property
+    def contact_ids(self):
+        """Get int value for 'contactIds'
+        Contact identifiers.
+        """
+        ret = self._get_attr("contactIds")
+        return ret
+
+    @property
+    def contact_flags(self):
+        """Get int value for 'contactFlags'
+        Contact state.
+        Bit 0: in contact.
+        Bit 1: in range.
+        """
+        ret = self._get_attr("contactFlags")
+        return ret
+
+    @property
+    def scan_time(self):
+        """Get int value for 'scanTime'
+        Timestamp of the event in milliseconds. Only relative time between events is important.
+        """
+        ret = self._get_attr("scanTime")
+        return ret
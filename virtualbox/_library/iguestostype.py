@@ -0,0 +1,280 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from ..library_base import Interface
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IGuestOSType(Interface):
+    """"""
+
+    __uuid__ = "d0d6c6d8-e5db-4d2c-baaa-c71053a6236d"
+    __wsmap__ = "struct"
+
+    @property
+    def family_id(self):
+        """Get str value for 'familyId'
+        Guest OS family identifier string.
+        """
+        ret = self._get_attr("familyId")
+        return ret
+
+    @property
+    def family_description(self):
+        """Get str value for 'familyDescription'
+        Human readable description of the guest OS family.
+        """
+        ret = self._get_attr("familyDescription")
+        return ret
+
+    @property
+    def id_p(self):
+        """Get str value for 'id'
+        Guest OS identifier string.
+        """
+        ret = self._get_attr("id")
+        return ret
+
+    @property
+    def description(self):
+        """Get str value for 'description'
+        Human readable description of the guest OS.
+        """
+        ret = self._get_attr("description")
+        return ret
+
+    @property
+    def is64_bit(self):
+        """Get bool value for 'is64Bit'
+        Returns @c true if the given OS is 64-bit
+        """
+        ret = self._get_attr("is64Bit")
+        return ret
+
+    @property
+    def recommended_ioapic(self):
+        """Get bool value for 'recommendedIOAPIC'
+        Returns @c true if I/O-APIC recommended for this OS type.
+        """
+        ret = self._get_attr("recommendedIOAPIC")
+        return ret
+
+    @property
+    def recommended_virt_ex(self):
+        """Get bool value for 'recommendedVirtEx'
+        Returns @c true if VT-x or AMD-V recommended for this OS type.
+        """
+        ret = self._get_attr("recommendedVirtEx")
+        return ret
+
+    @property
+    def recommended_ram(self):
+        """Get int value for 'recommendedRAM'
+        Recommended RAM size in Megabytes.
+        """
+        ret = self._get_attr("recommendedRAM")
+        return ret
+
+    @property
+    def recommended_graphics_controller(self):
+        """Get GraphicsControllerType value for 'recommendedGraphicsController'
+        Recommended graphics controller type.
+        """
+        ret = self._get_attr("recommendedGraphicsController")
+        return _lib.GraphicsControllerType(ret)
+
+    @property
+    def recommended_vram(self):
+        """Get int value for 'recommendedVRAM'
+        Recommended video RAM size in Megabytes.
+        """
+        ret = self._get_attr("recommendedVRAM")
+        return ret
+
+    @property
+    def recommended2_d_video_acceleration(self):
+        """Get bool value for 'recommended2DVideoAcceleration'
+        Returns @c true if 2D video acceleration is recommended for this OS type.
+        """
+        ret = self._get_attr("recommended2DVideoAcceleration")
+        return ret
+
+    @property
+    def recommended3_d_acceleration(self):
+        """Get bool value for 'recommended3DAcceleration'
+        Returns @c true if 3D acceleration is recommended for this OS type.
+        """
+        ret = self._get_attr("recommended3DAcceleration")
+        return ret
+
+    @property
+    def recommended_hdd(self):
+        """Get int value for 'recommendedHDD'
+        Recommended hard disk size in bytes.
+        """
+        ret = self._get_attr("recommendedHDD")
+        return ret
+
+    @property
+    def adapter_type(self):
+        """Get NetworkAdapterType value for 'adapterType'
+        Returns recommended network adapter for this OS type.
+        """
+        ret = self._get_attr("adapterType")
+        return _lib.NetworkAdapterType(ret)
+
+    @property
+    def recommended_pae(self):
+        """Get bool value for 'recommendedPAE'
+        Returns @c true if using PAE is recommended for this OS type.
+        """
+        ret = self._get_attr("recommendedPAE")
+        return ret
+
+    @property
+    def recommended_dvd_storage_controller(self):
+        """Get StorageControllerType value for 'recommendedDVDStorageController'
+        Recommended storage controller type for DVD/CD drives.
+        """
+        ret = self._get_attr("recommendedDVDStorageController")
+        return _lib.StorageControllerType(ret)
+
+    @property
+    def recommended_dvd_storage_bus(self):
+        """Get StorageBus value for 'recommendedDVDStorageBus'
+        Recommended storage bus type for DVD/CD drives.
+        """
+        ret = self._get_attr("recommendedDVDStorageBus")
+        return _lib.StorageBus(ret)
+
+    @property
+    def recommended_hd_storage_controller(self):
+        """Get StorageControllerType value for 'recommendedHDStorageController'
+        Recommended storage controller type for HD drives.
+        """
+        ret = self._get_attr("recommendedHDStorageController")
+        return _lib.StorageControllerType(ret)
+
+    @property
+    def recommended_hd_storage_bus(self):
+        """Get StorageBus value for 'recommendedHDStorageBus'
+        Recommended storage bus type for HD drives.
+        """
+        ret = self._get_attr("recommendedHDStorageBus")
+        return _lib.StorageBus(ret)
+
+    @property
+    def recommended_firmware(self):
+        """Get FirmwareType value for 'recommendedFirmware'
+        Recommended firmware type.
+        """
+        ret = self._get_attr("recommendedFirmware")
+        return _lib.FirmwareType(ret)
+
+    @property
+    def recommended_usbhid(self):
+        """Get bool value for 'recommendedUSBHID'
+        Returns @c true if using USB Human Interface Devices, such as keyboard and mouse recommended.
+        """
+        ret = self._get_attr("recommendedUSBHID")
+        return ret
+
+    @property
+    def recommended_hpet(self):
+        """Get bool value for 'recommendedHPET'
+        Returns @c true if using HPET is recommended for this OS type.
+        """
+        ret = self._get_attr("recommendedHPET")
+        return ret
+
+    @property
+    def recommended_usb_tablet(self):
+        """Get bool value for 'recommendedUSBTablet'
+        Returns @c true if using a USB Tablet is recommended.
+        """
+        ret = self._get_attr("recommendedUSBTablet")
+        return ret
+
+    @property
+    def recommended_rtc_use_utc(self):
+        """Get bool value for 'recommendedRTCUseUTC'
+        Returns @c true if the RTC of this VM should be set to UTC
+        """
+        ret = self._get_attr("recommendedRTCUseUTC")
+        return ret
+
+    @property
+    def recommended_chipset(self):
+        """Get ChipsetType value for 'recommendedChipset'
+        Recommended chipset type.
+        """
+        ret = self._get_attr("recommendedChipset")
+        return _lib.ChipsetType(ret)
+
+    @property
+    def recommended_audio_controller(self):
+        """Get AudioControllerType value for 'recommendedAudioController'
+        Recommended audio controller type.
+        """
+        ret = self._get_attr("recommendedAudioController")
+        return _lib.AudioControllerType(ret)
+
+    @property
+    def recommended_audio_codec(self):
+        """Get AudioCodecType value for 'recommendedAudioCodec'
+        Recommended audio codec type.
+        """
+        ret = self._get_attr("recommendedAudioCodec")
+        return _lib.AudioCodecType(ret)
+
+    @property
+    def recommended_floppy(self):
+        """Get bool value for 'recommendedFloppy'
+        Returns @c true a floppy drive is recommended for this OS type.
+        """
+        ret = self._get_attr("recommendedFloppy")
+        return ret
+
+    @property
+    def recommended_usb(self):
+        """Get bool value for 'recommendedUSB'
+        Returns @c true a USB controller is recommended for this OS type.
+        """
+        ret = self._get_attr("recommendedUSB")
+        return ret
+
+    @property
+    def recommended_usb3(self):
+        """Get bool value for 'recommendedUSB3'
+        Returns @c true an xHCI (USB 3) controller is recommended for this OS type.
+        """
+        ret = self._get_attr("recommendedUSB3")
+        return ret
+
+    @property
+    def recommended_tf_reset(self):
+        """Get bool value for 'recommendedTFReset'
+        Returns @c true if using VCPU reset on triple fault is recommended for this OS type.
+        """
+        ret = self._get_attr("recommendedTFReset")
+        return ret
+
+    @property
+    def recommended_x2_apic(self):
+        """Get bool value for 'recommendedX2APIC'
+        Returns @c true if X2APIC is recommended for this OS type.
+        """
+        ret = self._get_attr("recommendedX2APIC")
+        return ret
@@ -0,0 +1,42 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from .iguestsessionevent import IGuestSessionEvent
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IGuestProcessEvent(IGuestSessionEvent):
+    """
+    Base abstract interface for all guest process events.
+    """
+
+    __uuid__ = "2405f0e5-6588-40a3-9b0a-68c05ba52c4b"
+    __wsmap__ = "managed"
+
+    @property
+    def process(self):
+        """Get IGuestProcess value for 'process'
+        Guest process object which is related to this event.
+        """
+        ret = self._get_attr("process")
+        return _lib.IGuestProcess(ret)
+
+    @property
+    def pid(self):
+        """Get int value for 'pid'
+        Guest process ID (PID).
+        """
+        ret = self._get_attr("pid")
+        return ret
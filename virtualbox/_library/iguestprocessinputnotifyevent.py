@@ -0,0 +1,37 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from .iguestprocessioevent import IGuestProcessIOEvent
+from .vboxeventtype import VBoxEventType
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IGuestProcessInputNotifyEvent(IGuestProcessIOEvent):
+    """
+    Notification when a guest process' stdin became available.
+    This event is right now not implemented!
+    """
+
+    __uuid__ = "0de887f2-b7db-4616-aac6-cfb94d89ba78"
+    __wsmap__ = "managed"
+    id = VBoxEventType.on_guest_process_input_notify
+
+    @property
+    def status(self):
+        """Get ProcessInputStatus value for 'status'
+        Current process input status.
+        """
+        ret = self._get_attr("status")
+        return _lib.ProcessInputStatus(ret)
@@ -0,0 +1,43 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from .iguestprocessevent import IGuestProcessEvent
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IGuestProcessIOEvent(IGuestProcessEvent):
+    """
+    Base abstract interface for all guest process input/output (IO) events.
+    """
+
+    __uuid__ = "9ea9227c-e9bb-49b3-bfc7-c5171e93ef38"
+    __wsmap__ = "managed"
+
+    @property
+    def handle(self):
+        """Get int value for 'handle'
+        Input/output (IO) handle involved in this event. Usually 0 is stdin,
+        1 is stdout and 2 is stderr.
+        """
+        ret = self._get_attr("handle")
+        return ret
+
+    @property
+    def processed(self):
+        """Get int value for 'processed'
+        Processed input or output (in bytes).
+        """
+        ret = self._get_attr("processed")
+        return ret
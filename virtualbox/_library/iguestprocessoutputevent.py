@@ -0,0 +1,36 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from .iguestprocessioevent import IGuestProcessIOEvent
+from .vboxeventtype import VBoxEventType
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IGuestProcessOutputEvent(IGuestProcessIOEvent):
+    """
+    Notification when there is guest process output available for reading.
+    """
+
+    __uuid__ = "d3d5f1ee-bcb2-4905-a7ab-cc85448a742b"
+    __wsmap__ = "managed"
+    id = VBoxEventType.on_guest_process_output
+
+    @property
+    def data(self):
+        """Get str value for 'data'
+        Actual output data.
+        """
+        ret = self._get_attr("data")
+        return ret
@@ -0,0 +1,37 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from .iguestprocessevent import IGuestProcessEvent
+from .vboxeventtype import VBoxEventType
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IGuestProcessRegisteredEvent(IGuestProcessEvent):
+    """
+    Notification when a guest process was registered or unregistered.
+    """
+
+    __uuid__ = "1d89e2b3-c6ea-45b6-9d43-dc6f70cc9f02"
+    __wsmap__ = "managed"
+    id = VBoxEventType.on_guest_process_registered
+
+    @property
+    def registered(self):
+        """Get bool value for 'registered'
+        If @c true, the guest process was registered, otherwise it was
+        unregistered.
+        """
+        ret = self._get_attr("registered")
+        return ret
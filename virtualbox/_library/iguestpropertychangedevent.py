@@ -0,0 +1,52 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from .imachineevent import IMachineEvent
+from .vboxeventtype import VBoxEventType
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IGuestPropertyChangedEvent(IMachineEvent):
+    """
+    Notification when a guest property has changed.
+    """
+
+    __uuid__ = "3f63597a-26f1-4edb-8dd2-6bddd0912368"
+    __wsmap__ = "managed"
+    id = VBoxEventType.on_guest_property_changed
+
+    @property
+    def name(self):
+        """Get str value for 'name'
+        The name of the property that has changed.
+        """
+        ret = self._get_attr("name")
+        return ret
+
+    @property
+    def value(self):
+        """Get str value for 'value'
+        The new property value.
+        """
+        ret = self._get_attr("value")
+        return ret
+
+    @property
+    def flags(self):
+        """Get str value for 'flags'
+        The new property flags.
+        """
+        ret = self._get_attr("flags")
+        return ret
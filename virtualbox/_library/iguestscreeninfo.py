@@ -0,0 +1,84 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from ..library_base import Interface
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IGuestScreenInfo(Interface):
+    """"""
+
+    __uuid__ = "6b2f98f8-9641-4397-854a-040439d0114b"
+    __wsmap__ = "managed"
+
+    @property
+    def screen_id(self):
+        """Get int value for 'screenId'"""
+        ret = self._get_attr("screenId")
+        return ret
+
+    @property
+    def guest_monitor_status(self):
+        """Get GuestMonitorStatus value for 'guestMonitorStatus'"""
+        ret = self._get_attr("guestMonitorStatus")
+        return _lib.GuestMonitorStatus(ret)
+
+    @property
+    def primary(self):
+        """Get bool value for 'primary'"""
+        ret = self._get_attr("primary")
+        return ret
+
+    @property
+    def origin(self):
+        """Get bool value for 'origin'"""
+        ret = self._get_attr("origin")
+        return ret
+
+    @property
+    def origin_x(self):
+        """Get int value for 'originX'"""
+        ret = self._get_attr("originX")
+        return ret
+
+    @property
+    def origin_y(self):
+        """Get int value for 'originY'"""
+        ret = self._get_attr("originY")
+        return ret
+
+    @property
+    def width(self):
+        """Get int value for 'width'"""
+        ret = self._get_attr("width")
+        return ret
+
+    @property
+    def height(self):
+        """Get int value for 'height'"""
+        ret = self._get_attr("height")
+        return ret
+
+    @property
+    def bits_per_pixel(self):
+        """Get int value for 'bitsPerPixel'"""
+        ret = self._get_attr("bitsPerPixel")
+        return ret
+
+    @property
+    def extended_info(self):
+        """Get str value for 'extendedInfo'"""
+        ret = self._get_attr("extendedInfo")
+        return ret
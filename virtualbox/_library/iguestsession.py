@@ -0,0 +1,1806 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from ..library_base import Interface
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IGuestSession(Interface):
+    """
+    A guest session represents one impersonated user account in the guest, so
+    every operation will use the same credentials specified when creating
+    the session object via :py:func:`IGuest.create_session` .
+
+    There can be a maximum of 32 sessions at once per VM, whereas session 0
+    always is reserved for the root session (the root session is part of that
+    limit).
+
+    This root session is controlling all other guest sessions and also is
+    responsible for actions which require system level privileges.
+
+    Each guest session keeps track of the guest directories and files that
+    it opened as well as guest processes it has created.  To work on guest
+    files or directories a guest session offers methods to open or create
+    such objects (see :py:func:`IGuestSession.file_open`  or
+    :py:func:`IGuestSession.directory_open`  for instance).  Similarly,
+    there a methods for creating guest processes.
+
+    There can be up to 2048 objects (guest processes, files and directories)
+    a time per guest session.  Exceeding the limit will result in an error (see
+    the corresponding functions for more).
+
+    When done with either of these objects, including the guest session itself,
+    use the appropriate close() method to let the object do its cleanup work.
+
+    Closing a session via :py:func:`IGuestSession.close`  will try to close
+    all the mentioned objects above unless these objects are still used by
+    a client.
+
+    A set of environment variables changes is associated with each session
+    (:py:func:`IGuestSession.environment_changes` ).  These are applied to
+    the base environment of the impersonated guest user when creating a new
+    guest process.  For additional flexibility the :py:func:`IGuestSession.process_create`
+    and :py:func:`IGuestSession.process_create_ex`  methods allows you to
+    specify individual environment changes for each process you create.
+    With newer guest addition versions, the base environment is also made
+    available via :py:func:`IGuestSession.environment_base` .  (One reason
+    for why we record changes to a base environment instead of working
+    directly on an environment block is that we need to be compatible
+    with older Guest Additions.  Another reason is that this way it is always
+    possible to undo all the changes you've scheduled.)
+    """
+
+    __uuid__ = "3E14C189-4A75-437E-B0BB-7E7C90D0DF2A"
+    __wsmap__ = "managed"
+
+    @property
+    def user(self):
+        """Get str value for 'user'
+        Returns the user name used by this session to impersonate
+        users in the guest.
+        """
+        ret = self._get_attr("user")
+        return ret
+
+    @property
+    def domain(self):
+        """Get str value for 'domain'
+        Returns the domain name used by this session to impersonate
+        users in the guest.
+        """
+        ret = self._get_attr("domain")
+        return ret
+
+    @property
+    def name(self):
+        """Get str value for 'name'
+        Returns the session's friendly name.
+        """
+        ret = self._get_attr("name")
+        return ret
+
+    @property
+    def id_p(self):
+        """Get int value for 'id'
+        Returns the internal session ID.
+        """
+        ret = self._get_attr("id")
+        return ret
+
+    @property
+    def timeout(self):
+        """Get or set int value for 'timeout'
+        <!-- r=bird: Using 'Returns' for writable attributes is misleading. -->
+        Returns the session timeout (in ms).
+        """
+        ret = self._get_attr("timeout")
+        return ret
+
+    @timeout.setter
+    def timeout(self, value):
+        if not isinstance(value, baseinteger):
+            raise TypeError("value is not an instance of baseinteger")
+        return self._set_attr("timeout", value)
+
+    @property
+    def protocol_version(self):
+        """Get int value for 'protocolVersion'
+        Returns the protocol version which is used by this session to
+        communicate with the guest.
+        """
+        ret = self._get_attr("protocolVersion")
+        return ret
+
+    @property
+    def status(self):
+        """Get GuestSessionStatus value for 'status'
+        Returns the current session status.
+        """
+        ret = self._get_attr("status")
+        return _lib.GuestSessionStatus(ret)
+
+    @property
+    def environment_changes(self):
+        """Get or set str value for 'environmentChanges'
+        The set of scheduled environment changes to the base environment of the
+        session.  They are in putenv format, i.e. "VAR=VALUE" for setting and
+        "VAR" for unsetting.  One entry per variable (change).  The changes are
+        applied when creating new guest processes.
+
+        This is writable, so to undo all the scheduled changes, assign it an
+        empty array.
+        """
+        ret = self._get_attr("environmentChanges")
+        return ret
+
+    @environment_changes.setter
+    def environment_changes(self, value):
+        if not isinstance(value, basestring):
+            raise TypeError("value is not an instance of basestring")
+        return self._set_attr("environmentChanges", value)
+
+    @property
+    def environment_base(self):
+        """Get str value for 'environmentBase'
+        The base environment of the session.  They are on the "VAR=VALUE" form,
+        one array entry per variable.
+        <!-- @todo/TODO/FIXME: This doesn't end up in the PDF.
+        -->
+
+        Access fails with VBOX_E_NOT_SUPPORTED if the Guest Additions does not
+        support the session base environment feature.  Support for this was
+        introduced with protocol version XXXX.
+
+        Access fails with VBOX_E_INVALID_OBJECT_STATE if the Guest Additions
+        has yet to report the session base environment.
+        """
+        ret = self._get_attr("environmentBase")
+        return ret
+
+    @property
+    def processes(self):
+        """Get IGuestProcess value for 'processes'
+        Returns all current guest processes.
+        """
+        ret = self._get_attr("processes")
+        return [_lib.IGuestProcess(a) for a in ret]
+
+    @property
+    def path_style(self):
+        """Get PathStyle value for 'pathStyle'
+        The style of paths used by the guest.  Handy for giving the right kind
+        of path specifications to :py:func:`IGuestSession.file_open`  and similar methods.
+        """
+        ret = self._get_attr("pathStyle")
+        return _lib.PathStyle(ret)
+
+    @property
+    def current_directory(self):
+        """Get or set str value for 'currentDirectory'
+        Gets or sets the current directory of the session.  Guest path style.
+        """
+        ret = self._get_attr("currentDirectory")
+        return ret
+
+    @current_directory.setter
+    def current_directory(self, value):
+        if not isinstance(value, basestring):
+            raise TypeError("value is not an instance of basestring")
+        return self._set_attr("currentDirectory", value)
+
+    @property
+    def user_home(self):
+        """Get str value for 'userHome'
+        Returns the user's home / profile directory.  Guest path style.
+        """
+        ret = self._get_attr("userHome")
+        return ret
+
+    @property
+    def user_documents(self):
+        """Get str value for 'userDocuments'
+        Returns the user's documents directory.  Guest path style.
+        """
+        ret = self._get_attr("userDocuments")
+        return ret
+
+    @property
+    def directories(self):
+        """Get IGuestDirectory value for 'directories'
+        Returns all currently opened guest directories.
+        """
+        ret = self._get_attr("directories")
+        return [_lib.IGuestDirectory(a) for a in ret]
+
+    @property
+    def files(self):
+        """Get IGuestFile value for 'files'
+        Returns all currently opened guest files.
+        """
+        ret = self._get_attr("files")
+        return [_lib.IGuestFile(a) for a in ret]
+
+    @property
+    def event_source(self):
+        """Get IEventSource value for 'eventSource'
+        Event source for guest session events.
+        """
+        ret = self._get_attr("eventSource")
+        return _lib.IEventSource(ret)
+
+    def close(self):
+        """Closes this session. All opened guest directories, files and
+        processes which are not referenced by clients anymore will be
+        closed. Guest processes which fall into this category and still
+        are running in the guest will be terminated automatically.
+
+        """
+        self._call("close")
+
+    def copy_from_guest(self, sources, filters, flags, destination):
+        """Copies directories and/or files from guest to the host.
+
+        This function requires several parallel arrays to be supplied, one
+        set for each source.
+
+        in sources of type str
+            Paths to directories and/or files on the guest side that should be
+            copied to the host. If the path ends with a path delimiter, only
+            the directory's content is being copied. Guest path style.
+
+        in filters of type str
+            Array of source filters. This uses the
+            DOS/NT style wildcard characters '?' and '*'.
+
+        in flags of type str
+            Array of comma-separated list of source flags.
+
+            The following flags are available for directory sources:
+
+
+
+            CopyIntoExisting
+            Allow copying into an existing destination directory.
+
+
+
+            The following flags are available for file sources:
+
+
+
+            NoReplace
+            Do not replace any destination object.
+
+
+            FollowLinks
+            Follows (and handles) (symbolic) links.
+
+
+            Update
+            Only copy when the source file is newer than the destination
+            file or when the destination file is missing.
+
+        in destination of type str
+            Where to put the sources on the host. Host path style.
+
+        return progress of type :class:`IProgress`
+            Progress object to track the operation to completion.
+
+        """
+        if not isinstance(sources, list):
+            raise TypeError("sources can only be an instance of type list")
+        for a in sources[:10]:
+            if not isinstance(a, basestring):
+                raise TypeError("array can only contain objects of type basestring")
+        if not isinstance(filters, list):
+            raise TypeError("filters can only be an instance of type list")
+        for a in filters[:10]:
+            if not isinstance(a, basestring):
+                raise TypeError("array can only contain objects of type basestring")
+        if not isinstance(flags, list):
+            raise TypeError("flags can only be an instance of type list")
+        for a in flags[:10]:
+            if not isinstance(a, basestring):
+                raise TypeError("array can only contain objects of type basestring")
+        if not isinstance(destination, basestring):
+            raise TypeError("destination can only be an instance of type basestring")
+        progress = self._call(
+            "copyFromGuest", in_p=[sources, filters, flags, destination]
+        )
+        progress = _lib.IProgress(progress)
+        return progress
+
+    def copy_to_guest(self, sources, filters, flags, destination):
+        """Copies directories and/or files from host to the guest.
+
+        This function requires several parallel arrays to be supplied, one
+        set for each source.
+
+        in sources of type str
+            Paths to directories and/or files on the host side that should be
+            copied to the guest. If the path ends with a path delimiter, only
+            the directory's content is being copied. Host path style.
+
+        in filters of type str
+            Array of source filters. This uses the
+            DOS/NT style wildcard characters '?' and '*'.
+
+        in flags of type str
+            Array of comma-separated list of source flags.
+
+            The following flags are available for directory sources:
+
+
+
+            CopyIntoExisting
+            Allow copying into an existing destination directory.
+
+
+
+            The following flags are available for file sources:
+
+
+
+            NoReplace
+            Do not replace any destination object.
+
+
+            FollowLinks
+            Follows (and handles) (symbolic) links.
+
+
+            Update
+            Only copy when the source file is newer than the destination
+            file or when the destination file is missing.
+
+        in destination of type str
+            Where to put the sources on the guest. Guest path style.
+
+        return progress of type :class:`IProgress`
+            Progress object to track the operation to completion.
+
+        """
+        if not isinstance(sources, list):
+            raise TypeError("sources can only be an instance of type list")
+        for a in sources[:10]:
+            if not isinstance(a, basestring):
+                raise TypeError("array can only contain objects of type basestring")
+        if not isinstance(filters, list):
+            raise TypeError("filters can only be an instance of type list")
+        for a in filters[:10]:
+            if not isinstance(a, basestring):
+                raise TypeError("array can only contain objects of type basestring")
+        if not isinstance(flags, list):
+            raise TypeError("flags can only be an instance of type list")
+        for a in flags[:10]:
+            if not isinstance(a, basestring):
+                raise TypeError("array can only contain objects of type basestring")
+        if not isinstance(destination, basestring):
+            raise TypeError("destination can only be an instance of type basestring")
+        progress = self._call(
+            "copyToGuest", in_p=[sources, filters, flags, destination]
+        )
+        progress = _lib.IProgress(progress)
+        return progress
+
+    def directory_copy(self, source, destination, flags):
+        """Recursively copies a directory from one guest location to another.
+
+        in source of type str
+            The path to the directory to copy (in the guest).  Guest path style.
+
+        in destination of type str
+            The path to the target directory (in the guest).  Unless the
+            :py:attr:`DirectoryCopyFlag.copy_into_existing`  flag is given, the
+            directory shall not already exist.  Guest path style.
+
+        in flags of type :class:`DirectoryCopyFlag`
+            Zero or more :py:class:`DirectoryCopyFlag`  values.
+
+        return progress of type :class:`IProgress`
+            Progress object to track the operation to completion.
+
+        raises :class:`OleErrorNotimpl`
+            Not yet implemented.
+
+        """
+        if not isinstance(source, basestring):
+            raise TypeError("source can only be an instance of type basestring")
+        if not isinstance(destination, basestring):
+            raise TypeError("destination can only be an instance of type basestring")
+        if not isinstance(flags, list):
+            raise TypeError("flags can only be an instance of type list")
+        for a in flags[:10]:
+            if not isinstance(a, _lib.DirectoryCopyFlag):
+                raise TypeError(
+                    "array can only contain objects of type DirectoryCopyFlag"
+                )
+        progress = self._call("directoryCopy", in_p=[source, destination, flags])
+        progress = _lib.IProgress(progress)
+        return progress
+
+    def directory_copy_from_guest(self, source, destination, flags):
+        """Recursively copies a directory from the guest to the host.
+
+        in source of type str
+            Path to the directory on the guest side that should be copied to
+            the host. Guest path style.
+
+        in destination of type str
+            Where to put the directory on the host.  Unless the
+            :py:attr:`DirectoryCopyFlag.copy_into_existing`  flag is given, the
+            directory shall not already exist.  Host path style.
+
+        in flags of type :class:`DirectoryCopyFlag`
+            Zero or more :py:class:`DirectoryCopyFlag`  values.
+
+        return progress of type :class:`IProgress`
+            Progress object to track the operation to completion.
+
+        """
+        if not isinstance(source, basestring):
+            raise TypeError("source can only be an instance of type basestring")
+        if not isinstance(destination, basestring):
+            raise TypeError("destination can only be an instance of type basestring")
+        if not isinstance(flags, list):
+            raise TypeError("flags can only be an instance of type list")
+        for a in flags[:10]:
+            if not isinstance(a, _lib.DirectoryCopyFlag):
+                raise TypeError(
+                    "array can only contain objects of type DirectoryCopyFlag"
+                )
+        progress = self._call(
+            "directoryCopyFromGuest", in_p=[source, destination, flags]
+        )
+        progress = _lib.IProgress(progress)
+        return progress
+
+    def directory_copy_to_guest(self, source, destination, flags):
+        """Recursively copies a directory from the host to the guest.
+
+        in source of type str
+            Path to the directory on the host side that should be copied to
+            the guest.  Host path style.
+
+        in destination of type str
+            Where to put the file in the guest. Unless the
+            :py:attr:`DirectoryCopyFlag.copy_into_existing`  flag is given, the
+            directory shall not already exist. Guest style path.
+
+        in flags of type :class:`DirectoryCopyFlag`
+            Zero or more :py:class:`DirectoryCopyFlag`  values.
+
+        return progress of type :class:`IProgress`
+            Progress object to track the operation to completion.
+
+        """
+        if not isinstance(source, basestring):
+            raise TypeError("source can only be an instance of type basestring")
+        if not isinstance(destination, basestring):
+            raise TypeError("destination can only be an instance of type basestring")
+        if not isinstance(flags, list):
+            raise TypeError("flags can only be an instance of type list")
+        for a in flags[:10]:
+            if not isinstance(a, _lib.DirectoryCopyFlag):
+                raise TypeError(
+                    "array can only contain objects of type DirectoryCopyFlag"
+                )
+        progress = self._call("directoryCopyToGuest", in_p=[source, destination, flags])
+        progress = _lib.IProgress(progress)
+        return progress
+
+    def directory_create(self, path, mode, flags):
+        """Creates a directory in the guest.
+
+        in path of type str
+            Path to the directory directory to be created. Guest path style.
+
+        in mode of type int
+            The UNIX-style access mode mask to create the directory with.
+            Whether/how all three access groups and associated access rights are
+            realized is guest OS dependent.  The API does the best it can on each
+            OS.
+
+        in flags of type :class:`DirectoryCreateFlag`
+            Zero or more :py:class:`DirectoryCreateFlag`  flags.
+
+        raises :class:`VBoxErrorIprtError`
+            Error while creating the directory.
+
+        """
+        if not isinstance(path, basestring):
+            raise TypeError("path can only be an instance of type basestring")
+        if not isinstance(mode, baseinteger):
+            raise TypeError("mode can only be an instance of type baseinteger")
+        if not isinstance(flags, list):
+            raise TypeError("flags can only be an instance of type list")
+        for a in flags[:10]:
+            if not isinstance(a, _lib.DirectoryCreateFlag):
+                raise TypeError(
+                    "array can only contain objects of type DirectoryCreateFlag"
+                )
+        self._call("directoryCreate", in_p=[path, mode, flags])
+
+    def directory_create_temp(self, template_name, mode, path, secure):
+        """Creates a temporary directory in the guest.
+
+                in template_name of type str
+                    Template for the name of the directory to create. This must
+                    contain at least one 'X' character. The first group of consecutive
+                    'X' characters in the template will be replaced by a random
+                    alphanumeric string to produce a unique name.
+
+                in mode of type int
+                    The UNIX-style access mode mask to create the directory with.
+                    Whether/how all three access groups and associated access rights are
+                    realized is guest OS dependent.  The API does the best it can on each
+                    OS.
+
+                    This parameter is ignore if the @a secure parameter is set to @c true.
+                    It is strongly recommended to use 0700.
+
+                in path of type str
+                    The path to the directory in which the temporary directory should
+                    be created. Guest path style.
+
+                in secure of type bool
+                    Whether to fail if the directory can not be securely created.
+                    Currently this means that another unprivileged user cannot
+                    manipulate the path specified or remove the temporary directory
+                    after it has been created. Also causes the mode specified to be
+                    ignored. May not be supported on all guest types.
+
+                return directory of type str
+                    On success this will contain the full path to the created
+                    directory. Guest path style.
+
+                raises :class:`VBoxErrorNotSupported`
+                    The operation is not possible as requested on this particular
+        guest type.
+
+                raises :class:`OleErrorInvalidarg`
+                    Invalid argument. This includes an incorrectly formatted template,
+        or a non-absolute path.
+
+                raises :class:`VBoxErrorIprtError`
+                    The temporary directory could not be created. Possible reasons
+        include a non-existing path or an insecure path when the secure
+        option was requested.
+
+        """
+        if not isinstance(template_name, basestring):
+            raise TypeError("template_name can only be an instance of type basestring")
+        if not isinstance(mode, baseinteger):
+            raise TypeError("mode can only be an instance of type baseinteger")
+        if not isinstance(path, basestring):
+            raise TypeError("path can only be an instance of type basestring")
+        if not isinstance(secure, bool):
+            raise TypeError("secure can only be an instance of type bool")
+        directory = self._call(
+            "directoryCreateTemp", in_p=[template_name, mode, path, secure]
+        )
+        return directory
+
+    def directory_exists(self, path, follow_symlinks):
+        """Checks whether a directory exists in the guest or not.
+
+        in path of type str
+            Path to the directory to check if exists. Guest path style.
+
+        in follow_symlinks of type bool
+            If @c true, symbolic links in the final component will be followed
+            and the existance of the symlink target made the question for this method.
+            If @c false, a symbolic link in the final component will make the
+            method return @c false (because a symlink isn't a directory).
+
+        return exists of type bool
+            Returns @c true if the directory exists, @c false if not, or is not a directory.
+
+        raises :class:`VBoxErrorIprtError`
+            Error while checking existence of the directory specified.
+
+        """
+        if not isinstance(path, basestring):
+            raise TypeError("path can only be an instance of type basestring")
+        if not isinstance(follow_symlinks, bool):
+            raise TypeError("follow_symlinks can only be an instance of type bool")
+        exists = self._call("directoryExists", in_p=[path, follow_symlinks])
+        return exists
+
+    def directory_open(self, path, filter_p, flags):
+        """Opens a directory in the guest and creates a :py:class:`IGuestDirectory`
+        object that can be used for further operations.
+
+        This method follows symbolic links by default at the moment, this
+        may change in the future.
+
+        One idiosyncrasy of the current implementation is that you will NOT
+        get VBOX_E_OBJECT_NOT_FOUND returned here if the directory doesn't exist.
+        Instead the read function will fail with VBOX_E_IPRT_ERROR.  This will
+        be fixed soon.
+
+        in path of type str
+            Path to the directory to open. Guest path style.
+
+        in filter_p of type str
+            Optional directory listing filter to apply.  This uses the DOS/NT
+            style wildcard characters '?' and '*'.
+
+        in flags of type :class:`DirectoryOpenFlag`
+            Zero or more :py:class:`DirectoryOpenFlag`  flags.
+
+        return directory of type :class:`IGuestDirectory`
+            :py:class:`IGuestDirectory`  object containing the opened directory.
+
+        raises :class:`VBoxErrorObjectNotFound`
+            Directory to open was not found.
+
+        raises :class:`VBoxErrorIprtError`
+            Error while opening the directory.
+
+        raises :class:`VBoxErrorMaximumReached`
+            The maximum of concurrent guest directories has been reached.
+
+        """
+        if not isinstance(path, basestring):
+            raise TypeError("path can only be an instance of type basestring")
+        if not isinstance(filter_p, basestring):
+            raise TypeError("filter_p can only be an instance of type basestring")
+        if not isinstance(flags, list):
+            raise TypeError("flags can only be an instance of type list")
+        for a in flags[:10]:
+            if not isinstance(a, _lib.DirectoryOpenFlag):
+                raise TypeError(
+                    "array can only contain objects of type DirectoryOpenFlag"
+                )
+        directory = self._call("directoryOpen", in_p=[path, filter_p, flags])
+        directory = _lib.IGuestDirectory(directory)
+        return directory
+
+    def directory_remove(self, path):
+        """Removes a guest directory if empty.
+
+        Symbolic links in the final component will not be followed,
+        instead an not-a-directory error is reported.
+
+        in path of type str
+            Path to the directory that should be removed. Guest path style.
+
+        """
+        if not isinstance(path, basestring):
+            raise TypeError("path can only be an instance of type basestring")
+        self._call("directoryRemove", in_p=[path])
+
+    def directory_remove_recursive(self, path, flags):
+        """Removes a guest directory recursively.
+
+        <!--  Add this back when the warning can be removed:
+        Unless :py:attr:`DirectoryRemoveRecFlag.content_and_dir`  or
+        :py:attr:`DirectoryRemoveRecFlag.content_only`  is given, only the
+        directory structure is removed.  Which means it will fail if there are
+        directories which are not empty in the directory tree @a path points to.
+        -->
+
+        WARNING!! THE FLAGS ARE NOT CURRENTLY IMPLEMENTED.  THE IMPLEMENTATION
+        WORKS AS IF FLAGS WAS SET TO :py:attr:`DirectoryRemoveRecFlag.content_and_dir` .
+
+
+        If the final path component is a symbolic link, this method will
+        fail as it can only be applied to directories.
+
+        in path of type str
+            Path of the directory that is to be removed recursively. Guest
+            path style.
+
+        in flags of type :class:`DirectoryRemoveRecFlag`
+            Zero or more :py:class:`DirectoryRemoveRecFlag`  flags.
+            WARNING! SPECIFYING :py:attr:`DirectoryRemoveRecFlag.content_and_dir`  IS
+            MANDATORY AT THE MOMENT!!
+
+        return progress of type :class:`IProgress`
+            Progress object to track the operation completion. This is not implemented
+            yet and therefore this method call will block until deletion is completed.
+
+        """
+        if not isinstance(path, basestring):
+            raise TypeError("path can only be an instance of type basestring")
+        if not isinstance(flags, list):
+            raise TypeError("flags can only be an instance of type list")
+        for a in flags[:10]:
+            if not isinstance(a, _lib.DirectoryRemoveRecFlag):
+                raise TypeError(
+                    "array can only contain objects of type DirectoryRemoveRecFlag"
+                )
+        progress = self._call("directoryRemoveRecursive", in_p=[path, flags])
+        progress = _lib.IProgress(progress)
+        return progress
+
+    def environment_schedule_set(self, name, value):
+        """Schedules setting an environment variable when creating the next guest
+        process.  This affects the :py:func:`IGuestSession.environment_changes`
+        attribute.
+
+        in name of type str
+            Name of the environment variable to set.  This cannot be empty
+            nor can it contain any equal signs.
+
+        in value of type str
+            Value to set the session environment variable to.
+
+        """
+        if not isinstance(name, basestring):
+            raise TypeError("name can only be an instance of type basestring")
+        if not isinstance(value, basestring):
+            raise TypeError("value can only be an instance of type basestring")
+        self._call("environmentScheduleSet", in_p=[name, value])
+
+    def environment_schedule_unset(self, name):
+        """Schedules unsetting (removing) an environment variable when creating
+        the next guest process.  This affects the
+        :py:func:`IGuestSession.environment_changes`  attribute.
+
+        in name of type str
+            Name of the environment variable to unset.  This cannot be empty
+            nor can it contain any equal signs.
+
+        """
+        if not isinstance(name, basestring):
+            raise TypeError("name can only be an instance of type basestring")
+        self._call("environmentScheduleUnset", in_p=[name])
+
+    def environment_get_base_variable(self, name):
+        """Gets an environment variable from the session's base environment
+                (:py:func:`IGuestSession.environment_base` ).
+
+                in name of type str
+                    Name of the environment variable to   get.This cannot be empty
+                    nor can it contain any equal signs.
+
+                return value of type str
+                    The value of the variable.  Empty if not found.  To deal with
+                    variables that may have empty values, use
+                    :py:func:`IGuestSession.environment_does_base_variable_exist` .
+
+                raises :class:`VBoxErrorNotSupported`
+                    If the Guest Additions does not
+        support the session base environment feature.  Support for this was
+        introduced with protocol version XXXX.
+
+                raises :class:`VBoxErrorInvalidObjectState`
+                    If the Guest Additions has
+        yet to report the session base environment.
+
+        """
+        if not isinstance(name, basestring):
+            raise TypeError("name can only be an instance of type basestring")
+        value = self._call("environmentGetBaseVariable", in_p=[name])
+        return value
+
+    def environment_does_base_variable_exist(self, name):
+        """Checks if the given environment variable exists in the session's base
+                environment (:py:func:`IGuestSession.environment_base` ).
+
+                in name of type str
+                    Name of the environment variable to look for.  This cannot be
+                    empty nor can it contain any equal signs.
+
+                return exists of type bool
+                    TRUE if the variable exists, FALSE if not.
+
+                raises :class:`VBoxErrorNotSupported`
+                    If the Guest Additions does not
+        support the session base environment feature.  Support for this was
+        introduced with protocol version XXXX.
+
+                raises :class:`VBoxErrorInvalidObjectState`
+                    If the Guest Additions has
+        yet to report the session base environment.
+
+        """
+        if not isinstance(name, basestring):
+            raise TypeError("name can only be an instance of type basestring")
+        exists = self._call("environmentDoesBaseVariableExist", in_p=[name])
+        return exists
+
+    def file_copy(self, source, destination, flags):
+        """Copies a file from one guest location to another.
+
+        Will overwrite the destination file unless
+        :py:attr:`FileCopyFlag.no_replace`  is specified.
+
+        in source of type str
+            The path to the file to copy (in the guest).  Guest path style.
+
+        in destination of type str
+            The path to the target file (in the guest).  This cannot be a
+            directory.  Guest path style.
+
+        in flags of type :class:`FileCopyFlag`
+            Zero or more :py:class:`FileCopyFlag`  values.
+
+        return progress of type :class:`IProgress`
+            Progress object to track the operation to completion.
+
+        raises :class:`OleErrorNotimpl`
+            Not yet implemented.
+
+        """
+        if not isinstance(source, basestring):
+            raise TypeError("source can only be an instance of type basestring")
+        if not isinstance(destination, basestring):
+            raise TypeError("destination can only be an instance of type basestring")
+        if not isinstance(flags, list):
+            raise TypeError("flags can only be an instance of type list")
+        for a in flags[:10]:
+            if not isinstance(a, _lib.FileCopyFlag):
+                raise TypeError("array can only contain objects of type FileCopyFlag")
+        progress = self._call("fileCopy", in_p=[source, destination, flags])
+        progress = _lib.IProgress(progress)
+        return progress
+
+    def file_copy_from_guest(self, source, destination, flags):
+        """Copies a file from the guest to the host.
+
+        Will overwrite the destination file unless
+        :py:attr:`FileCopyFlag.no_replace`  is specified.
+
+        in source of type str
+            Path to the file on the guest side that should be copied to the
+            host.  Guest path style.
+
+        in destination of type str
+            Where to put the file on the host (file, not directory). Host
+            path style.
+
+        in flags of type :class:`FileCopyFlag`
+            Zero or more :py:class:`FileCopyFlag`  values.
+
+        return progress of type :class:`IProgress`
+            Progress object to track the operation to completion.
+
+        raises :class:`VBoxErrorIprtError`
+            Error starting the copy operation.
+
+        """
+        if not isinstance(source, basestring):
+            raise TypeError("source can only be an instance of type basestring")
+        if not isinstance(destination, basestring):
+            raise TypeError("destination can only be an instance of type basestring")
+        if not isinstance(flags, list):
+            raise TypeError("flags can only be an instance of type list")
+        for a in flags[:10]:
+            if not isinstance(a, _lib.FileCopyFlag):
+                raise TypeError("array can only contain objects of type FileCopyFlag")
+        progress = self._call("fileCopyFromGuest", in_p=[source, destination, flags])
+        progress = _lib.IProgress(progress)
+        return progress
+
+    def file_copy_to_guest(self, source, destination, flags):
+        """Copies a file from the host to the guest.
+
+        Will overwrite the destination file unless
+        :py:attr:`FileCopyFlag.no_replace`  is specified.
+
+        in source of type str
+            Path to the file on the host side that should be copied to the
+            guest.  Host path style.
+
+        in destination of type str
+            Where to put the file in the guest (file, not directory).  Guest
+            style path.
+
+        in flags of type :class:`FileCopyFlag`
+            Zero or more :py:class:`FileCopyFlag`  values.
+
+        return progress of type :class:`IProgress`
+            Progress object to track the operation to completion.
+
+        raises :class:`VBoxErrorIprtError`
+            Error starting the copy operation.
+
+        """
+        if not isinstance(source, basestring):
+            raise TypeError("source can only be an instance of type basestring")
+        if not isinstance(destination, basestring):
+            raise TypeError("destination can only be an instance of type basestring")
+        if not isinstance(flags, list):
+            raise TypeError("flags can only be an instance of type list")
+        for a in flags[:10]:
+            if not isinstance(a, _lib.FileCopyFlag):
+                raise TypeError("array can only contain objects of type FileCopyFlag")
+        progress = self._call("fileCopyToGuest", in_p=[source, destination, flags])
+        progress = _lib.IProgress(progress)
+        return progress
+
+    def file_create_temp(self, template_name, mode, path, secure):
+        """Creates a temporary file in the guest.
+
+                in template_name of type str
+                    Template for the name of the file to create. This must contain
+                    at least one 'X' character. The first group of consecutive 'X'
+                    characters in the template will be replaced by a random
+                    alphanumeric string to produce a unique name.
+
+                in mode of type int
+                    The UNIX-style access mode mask to create the file with.
+                    Whether/how all three access groups and associated access rights are
+                    realized is guest OS dependent.  The API does the best it can on each
+                    OS.
+
+                    This parameter is ignore if the @a secure parameter is set to @c true.
+                    It is strongly recommended to use 0600.
+
+                in path of type str
+                    The path to the directory in which the temporary file should be
+                    created.
+
+                in secure of type bool
+                    Whether to fail if the file can not be securely created.
+                    Currently this means that another unprivileged user cannot
+                    manipulate the path specified or remove the temporary file after
+                    it has been created. Also causes the mode specified to be ignored.
+                    May not be supported on all guest types.
+
+                return file_p of type :class:`IGuestFile`
+                    On success this will contain an open file object for the new
+                    temporary file.
+
+                raises :class:`VBoxErrorNotSupported`
+                    The operation is not possible as requested on this particular
+        guest OS.
+
+                raises :class:`OleErrorInvalidarg`
+                    Invalid argument. This includes an incorrectly formatted template,
+        or a non-absolute path.
+
+                raises :class:`VBoxErrorIprtError`
+                    The temporary file could not be created. Possible reasons include
+        a non-existing path or an insecure path when the secure
+        option was requested.
+
+        """
+        if not isinstance(template_name, basestring):
+            raise TypeError("template_name can only be an instance of type basestring")
+        if not isinstance(mode, baseinteger):
+            raise TypeError("mode can only be an instance of type baseinteger")
+        if not isinstance(path, basestring):
+            raise TypeError("path can only be an instance of type basestring")
+        if not isinstance(secure, bool):
+            raise TypeError("secure can only be an instance of type bool")
+        file_p = self._call("fileCreateTemp", in_p=[template_name, mode, path, secure])
+        file_p = _lib.IGuestFile(file_p)
+        return file_p
+
+    def file_exists(self, path, follow_symlinks):
+        """Checks whether a regular file exists in the guest or not.
+
+        in path of type str
+            Path to the alleged regular file.  Guest path style.
+
+        in follow_symlinks of type bool
+            If @c true, symbolic links in the final component will be followed
+            and the existance of the symlink target made the question for this method.
+            If @c false, a symbolic link in the final component will make the
+            method return @c false (because a symlink isn't a regular file).
+
+        return exists of type bool
+            Returns @c true if the file exists, @c false if not.  @c false is
+            also return if this @a path does not point to a file object.
+
+        raises :class:`VBoxErrorIprtError`
+            Error while checking existence of the file specified.
+
+        """
+        if not isinstance(path, basestring):
+            raise TypeError("path can only be an instance of type basestring")
+        if not isinstance(follow_symlinks, bool):
+            raise TypeError("follow_symlinks can only be an instance of type bool")
+        exists = self._call("fileExists", in_p=[path, follow_symlinks])
+        return exists
+
+    def file_open(self, path, access_mode, open_action, creation_mode):
+        """Opens a file and creates a :py:class:`IGuestFile`  object that
+        can be used for further operations.
+
+        in path of type str
+            Path to file to open.  Guest path style.
+
+        in access_mode of type :class:`FileAccessMode`
+            The file access mode (read, write and/or append).
+            See :py:class:`FileAccessMode`  for details.
+
+        in open_action of type :class:`FileOpenAction`
+            What action to take depending on whether the file exists or not.
+            See :py:class:`FileOpenAction`  for details.
+
+        in creation_mode of type int
+            The UNIX-style access mode mask to create the file with if @a openAction
+            requested the file to be created (otherwise ignored).  Whether/how all
+            three access groups and associated access rights are realized is guest
+            OS dependent.  The API does the best it can on each OS.
+
+        return file_p of type :class:`IGuestFile`
+            :py:class:`IGuestFile`  object representing the opened file.
+
+        raises :class:`VBoxErrorObjectNotFound`
+            File to open was not found.
+
+        raises :class:`VBoxErrorIprtError`
+            Error while opening the file.
+
+        raises :class:`VBoxErrorMaximumReached`
+            The maximum of concurrent guest files has been reached.
+
+        """
+        if not isinstance(path, basestring):
+            raise TypeError("path can only be an instance of type basestring")
+        if not isinstance(access_mode, _lib.FileAccessMode):
+            raise TypeError(
+                "access_mode can only be an instance of type FileAccessMode"
+            )
+        if not isinstance(open_action, _lib.FileOpenAction):
+            raise TypeError(
+                "open_action can only be an instance of type FileOpenAction"
+            )
+        if not isinstance(creation_mode, baseinteger):
+            raise TypeError("creation_mode can only be an instance of type baseinteger")
+        file_p = self._call(
+            "fileOpen", in_p=[path, access_mode, open_action, creation_mode]
+        )
+        file_p = _lib.IGuestFile(file_p)
+        return file_p
+
+    def file_open_ex(
+        self, path, access_mode, open_action, sharing_mode, creation_mode, flags
+    ):
+        """Opens a file and creates a :py:class:`IGuestFile`  object that
+        can be used for further operations, extended version.
+
+        in path of type str
+            Path to file to open.  Guest path style.
+
+        in access_mode of type :class:`FileAccessMode`
+            The file access mode (read, write and/or append).
+            See :py:class:`FileAccessMode`  for details.
+
+        in open_action of type :class:`FileOpenAction`
+            What action to take depending on whether the file exists or not.
+            See :py:class:`FileOpenAction`  for details.
+
+        in sharing_mode of type :class:`FileSharingMode`
+            The file sharing mode in the guest. This parameter is currently
+            ignore for all guest OSes.  It will in the future be implemented for
+            Windows, OS/2 and maybe Solaris guests only, the others will ignore it.
+            Use :py:attr:`FileSharingMode.all_p` .
+
+        in creation_mode of type int
+            The UNIX-style access mode mask to create the file with if @a openAction
+            requested the file to be created (otherwise ignored).  Whether/how all
+            three access groups and associated access rights are realized is guest
+            OS dependent.  The API does the best it can on each OS.
+
+        in flags of type :class:`FileOpenExFlag`
+            Zero or more :py:class:`FileOpenExFlag`  values.
+
+        return file_p of type :class:`IGuestFile`
+            :py:class:`IGuestFile`  object representing the opened file.
+
+        raises :class:`VBoxErrorObjectNotFound`
+            File to open was not found.
+
+        raises :class:`VBoxErrorIprtError`
+            Error while opening the file.
+
+        """
+        if not isinstance(path, basestring):
+            raise TypeError("path can only be an instance of type basestring")
+        if not isinstance(access_mode, _lib.FileAccessMode):
+            raise TypeError(
+                "access_mode can only be an instance of type FileAccessMode"
+            )
+        if not isinstance(open_action, _lib.FileOpenAction):
+            raise TypeError(
+                "open_action can only be an instance of type FileOpenAction"
+            )
+        if not isinstance(sharing_mode, _lib.FileSharingMode):
+            raise TypeError(
+                "sharing_mode can only be an instance of type FileSharingMode"
+            )
+        if not isinstance(creation_mode, baseinteger):
+            raise TypeError("creation_mode can only be an instance of type baseinteger")
+        if not isinstance(flags, list):
+            raise TypeError("flags can only be an instance of type list")
+        for a in flags[:10]:
+            if not isinstance(a, _lib.FileOpenExFlag):
+                raise TypeError("array can only contain objects of type FileOpenExFlag")
+        file_p = self._call(
+            "fileOpenEx",
+            in_p=[path, access_mode, open_action, sharing_mode, creation_mode, flags],
+        )
+        file_p = _lib.IGuestFile(file_p)
+        return file_p
+
+    def file_query_size(self, path, follow_symlinks):
+        """Queries the size of a regular file in the guest.
+
+        in path of type str
+            Path to the file which size is requested.  Guest path style.
+
+        in follow_symlinks of type bool
+            It @c true, symbolic links in the final path component will be
+            followed to their target, and the size of the target is returned.
+            If @c false, symbolic links in the final path component will make
+            the method call fail (symblink is not a regular file).
+
+        return size of type int
+            Queried file size.
+
+        raises :class:`VBoxErrorObjectNotFound`
+            File to was not found.
+
+        raises :class:`VBoxErrorIprtError`
+            Error querying file size.
+
+        """
+        if not isinstance(path, basestring):
+            raise TypeError("path can only be an instance of type basestring")
+        if not isinstance(follow_symlinks, bool):
+            raise TypeError("follow_symlinks can only be an instance of type bool")
+        size = self._call("fileQuerySize", in_p=[path, follow_symlinks])
+        return size
+
+    def fs_obj_exists(self, path, follow_symlinks):
+        """Checks whether a file system object (file, directory, etc) exists in
+        the guest or not.
+
+        in path of type str
+            Path to the file system object to check the existance of.  Guest
+            path style.
+
+        in follow_symlinks of type bool
+            If @c true, symbolic links in the final component will be followed
+            and the method will instead check if the target exists.
+            If @c false, symbolic links in the final component will satisfy the
+            method and it will return @c true in @a exists.
+
+        return exists of type bool
+            Returns @c true if the file exists, @c false if not.
+
+        raises :class:`VBoxErrorIprtError`
+            Error while checking existence of the file specified.
+
+        """
+        if not isinstance(path, basestring):
+            raise TypeError("path can only be an instance of type basestring")
+        if not isinstance(follow_symlinks, bool):
+            raise TypeError("follow_symlinks can only be an instance of type bool")
+        exists = self._call("fsObjExists", in_p=[path, follow_symlinks])
+        return exists
+
+    def fs_obj_query_info(self, path, follow_symlinks):
+        """Queries information about a file system object (file, directory, etc)
+        in the guest.
+
+        in path of type str
+            Path to the file system object to gather information about.
+            Guest path style.
+
+        in follow_symlinks of type bool
+            Information about symbolic links is returned if @c false.  Otherwise,
+            symbolic links are followed and the returned information concerns
+            itself with the symlink target if @c true.
+
+        return info of type :class:`IGuestFsObjInfo`
+            :py:class:`IGuestFsObjInfo`  object containing the information.
+
+        raises :class:`VBoxErrorObjectNotFound`
+            The file system object was not found.
+
+        raises :class:`VBoxErrorIprtError`
+            Error while querying information.
+
+        """
+        if not isinstance(path, basestring):
+            raise TypeError("path can only be an instance of type basestring")
+        if not isinstance(follow_symlinks, bool):
+            raise TypeError("follow_symlinks can only be an instance of type bool")
+        info = self._call("fsObjQueryInfo", in_p=[path, follow_symlinks])
+        info = _lib.IGuestFsObjInfo(info)
+        return info
+
+    def fs_obj_remove(self, path):
+        """Removes a file system object (file, symlink, etc) in the guest.  Will
+        not work on directories, use :py:func:`IGuestSession.directory_remove`
+        to remove directories.
+
+        This method will remove symbolic links in the final path
+        component, not follow them.
+
+        in path of type str
+            Path to the file system object to remove.  Guest style path.
+
+        raises :class:`OleErrorNotimpl`
+            The method has not been implemented yet.
+
+        raises :class:`VBoxErrorObjectNotFound`
+            The file system object was not found.
+
+        raises :class:`VBoxErrorIprtError`
+            For most other errors. We know this is unhelpful, will fix shortly...
+
+        """
+        if not isinstance(path, basestring):
+            raise TypeError("path can only be an instance of type basestring")
+        self._call("fsObjRemove", in_p=[path])
+
+    def fs_obj_remove_array(self, path):
+        """Removes multiple file system objects (files, directories, symlinks, etc)
+        in the guest. Use with caution.
+
+        This method is not implemented yet and will return E_NOTIMPL.
+
+        This method will remove symbolic links in the final path
+        component, not follow them.
+
+        in path of type str
+            Array of paths to the file system objects to remove.  Guest style path.
+
+        return progress of type :class:`IProgress`
+            Progress object to track the operation to completion.
+
+        raises :class:`OleErrorNotimpl`
+            The method has not been implemented yet.
+
+        """
+        if not isinstance(path, list):
+            raise TypeError("path can only be an instance of type list")
+        for a in path[:10]:
+            if not isinstance(a, basestring):
+                raise TypeError("array can only contain objects of type basestring")
+        progress = self._call("fsObjRemoveArray", in_p=[path])
+        progress = _lib.IProgress(progress)
+        return progress
+
+    def fs_obj_rename(self, old_path, new_path, flags):
+        """Renames a file system object (file, directory, symlink, etc) in the
+        guest.
+
+        in old_path of type str
+            The current path to the object.  Guest path style.
+
+        in new_path of type str
+            The new path to the object.  Guest path style.
+
+        in flags of type :class:`FsObjRenameFlag`
+            Zero or more :py:class:`FsObjRenameFlag`  values.
+
+        raises :class:`VBoxErrorObjectNotFound`
+            The file system object was not found.
+
+        raises :class:`VBoxErrorIprtError`
+            For most other errors. We know this is unhelpful, will fix shortly...
+
+        """
+        if not isinstance(old_path, basestring):
+            raise TypeError("old_path can only be an instance of type basestring")
+        if not isinstance(new_path, basestring):
+            raise TypeError("new_path can only be an instance of type basestring")
+        if not isinstance(flags, list):
+            raise TypeError("flags can only be an instance of type list")
+        for a in flags[:10]:
+            if not isinstance(a, _lib.FsObjRenameFlag):
+                raise TypeError(
+                    "array can only contain objects of type FsObjRenameFlag"
+                )
+        self._call("fsObjRename", in_p=[old_path, new_path, flags])
+
+    def fs_obj_move(self, source, destination, flags):
+        """Moves a file system object (file, directory, symlink, etc) from one
+        guest location to another.
+
+        This differs from :py:func:`IGuestSession.fs_obj_rename`  in that it
+        can move accross file system boundraries.  In that case it will
+        perform a copy and then delete the original.  For directories, this
+        can take a while and is subject to races.
+
+        in source of type str
+            Path to the file to move.  Guest path style.
+
+        in destination of type str
+            Where to move the file to (file, not directory).  Guest path
+            style.
+
+        in flags of type :class:`FsObjMoveFlag`
+            Zero or more :py:class:`FsObjMoveFlag`  values.
+
+        return progress of type :class:`IProgress`
+            Progress object to track the operation to completion.
+
+        raises :class:`OleErrorNotimpl`
+            Not yet implemented.
+
+        """
+        if not isinstance(source, basestring):
+            raise TypeError("source can only be an instance of type basestring")
+        if not isinstance(destination, basestring):
+            raise TypeError("destination can only be an instance of type basestring")
+        if not isinstance(flags, list):
+            raise TypeError("flags can only be an instance of type list")
+        for a in flags[:10]:
+            if not isinstance(a, _lib.FsObjMoveFlag):
+                raise TypeError("array can only contain objects of type FsObjMoveFlag")
+        progress = self._call("fsObjMove", in_p=[source, destination, flags])
+        progress = _lib.IProgress(progress)
+        return progress
+
+    def fs_obj_move_array(self, source, destination, flags):
+        """Moves file system objects (files, directories, symlinks, etc) from one
+        guest location to another.
+
+        in source of type str
+            Array of paths to the file system objects to move.  Guest style path.
+
+        in destination of type str
+            Where to move the file system objects to (directory).  Guest path
+            style.
+
+        in flags of type :class:`FsObjMoveFlag`
+            Zero or more :py:class:`FsObjMoveFlag`  values.
+
+        return progress of type :class:`IProgress`
+            Progress object to track the operation to completion.
+
+        raises :class:`OleErrorNotimpl`
+            Not yet implemented.
+
+        """
+        if not isinstance(source, list):
+            raise TypeError("source can only be an instance of type list")
+        for a in source[:10]:
+            if not isinstance(a, basestring):
+                raise TypeError("array can only contain objects of type basestring")
+        if not isinstance(destination, basestring):
+            raise TypeError("destination can only be an instance of type basestring")
+        if not isinstance(flags, list):
+            raise TypeError("flags can only be an instance of type list")
+        for a in flags[:10]:
+            if not isinstance(a, _lib.FsObjMoveFlag):
+                raise TypeError("array can only contain objects of type FsObjMoveFlag")
+        progress = self._call("fsObjMoveArray", in_p=[source, destination, flags])
+        progress = _lib.IProgress(progress)
+        return progress
+
+    def fs_obj_copy_array(self, source, destination, flags):
+        """Copies file system objects (files, directories, symlinks, etc) from one
+        guest location to another.
+
+        in source of type str
+            Array of paths to the file system objects to copy.  Guest style path.
+
+        in destination of type str
+            Where to copy the file system objects to (directory).  Guest path
+            style.
+
+        in flags of type :class:`FileCopyFlag`
+            Zero or more :py:class:`FileCopyFlag`  values.
+
+        return progress of type :class:`IProgress`
+            Progress object to track the operation to completion.
+
+        raises :class:`OleErrorNotimpl`
+            Not yet implemented.
+
+        """
+        if not isinstance(source, list):
+            raise TypeError("source can only be an instance of type list")
+        for a in source[:10]:
+            if not isinstance(a, basestring):
+                raise TypeError("array can only contain objects of type basestring")
+        if not isinstance(destination, basestring):
+            raise TypeError("destination can only be an instance of type basestring")
+        if not isinstance(flags, list):
+            raise TypeError("flags can only be an instance of type list")
+        for a in flags[:10]:
+            if not isinstance(a, _lib.FileCopyFlag):
+                raise TypeError("array can only contain objects of type FileCopyFlag")
+        progress = self._call("fsObjCopyArray", in_p=[source, destination, flags])
+        progress = _lib.IProgress(progress)
+        return progress
+
+    def fs_obj_set_acl(self, path, follow_symlinks, acl, mode):
+        """Sets the access control list (ACL) of a file system object (file,
+        directory, etc) in the guest.
+
+        in path of type str
+            Full path of the file system object which ACL to set
+
+        in follow_symlinks of type bool
+            If @c true symbolic links in the final component will be followed,
+            otherwise, if @c false, the method will work directly on a symbolic
+            link in the final component.
+
+        in acl of type str
+            The ACL specification string. To-be-defined.
+
+        in mode of type int
+            UNIX-style mode mask to use if @a acl is empty. As mention in
+            :py:func:`IGuestSession.directory_create`  this is realized on
+            a best effort basis and the exact behavior depends on the Guest OS.
+
+        raises :class:`OleErrorNotimpl`
+            The method is not implemented yet.
+
+        """
+        if not isinstance(path, basestring):
+            raise TypeError("path can only be an instance of type basestring")
+        if not isinstance(follow_symlinks, bool):
+            raise TypeError("follow_symlinks can only be an instance of type bool")
+        if not isinstance(acl, basestring):
+            raise TypeError("acl can only be an instance of type basestring")
+        if not isinstance(mode, baseinteger):
+            raise TypeError("mode can only be an instance of type baseinteger")
+        self._call("fsObjSetACL", in_p=[path, follow_symlinks, acl, mode])
+
+    def process_create(
+        self, executable, arguments, environment_changes, flags, timeout_ms
+    ):
+        """Creates a new process running in the guest. The new process will be
+        started asynchronously, meaning on return of this function it is not
+        be guaranteed that the guest process is in a started state. To wait for
+        successful startup, use the :py:func:`IProcess.wait_for`  call.
+
+
+        Starting at VirtualBox 4.2 guest process execution by is default limited
+        to serve up to 255 guest processes at a time. If all 255 guest processes
+        are active and running, creating a new guest process will result in an
+        error.
+
+        If ProcessCreateFlag_WaitForStdOut and/or ProcessCreateFlag_WaitForStdErr
+        are set, the guest process will not enter the terminated state until
+        all data from the specified streams have been read read.
+
+        in executable of type str
+            Full path to the file to execute in the guest.  The file has to
+            exists in the guest VM with executable right to the session user in
+            order to succeed.  If empty/null, the first entry in the
+            @a arguments array will be used instead (i.e. argv[0]).
+
+        in arguments of type str
+            Array of arguments passed to the new process.
+
+            Starting with VirtualBox 5.0 this array starts with argument 0
+            instead of argument 1 as in previous versions.  Whether the zeroth
+            argument can be passed to the guest depends on the VBoxService
+            version running there.  If you depend on this, check that the
+            :py:func:`IGuestSession.protocol_version`  is 3 or higher.
+
+        in environment_changes of type str
+            Set of environment changes to complement
+            :py:func:`IGuestSession.environment_changes` .  Takes precedence
+            over the session ones.  The changes are in putenv format, i.e.
+            "VAR=VALUE" for setting and "VAR" for unsetting.
+
+            The changes are applied to the base environment of the impersonated
+            guest user (:py:func:`IGuestSession.environment_base` ) when
+            creating the process.  (This is done on the guest side of things in
+            order to be compatible with older Guest Additions.  That is one of
+            the motivations for not passing in the whole environment here.)
+
+        in flags of type :class:`ProcessCreateFlag`
+            Process creation flags;
+            see :py:class:`ProcessCreateFlag`  for more information.
+
+        in timeout_ms of type int
+            Timeout (in ms) for limiting the guest process' running time.
+            Pass 0 for an infinite timeout. On timeout the guest process will be
+            killed and its status will be put to an appropriate value. See
+            :py:class:`ProcessStatus`  for more information.
+
+        return guest_process of type :class:`IGuestProcess`
+            Guest process object of the newly created process.
+
+        raises :class:`VBoxErrorIprtError`
+            Error creating guest process.
+
+        raises :class:`VBoxErrorMaximumReached`
+            The maximum of concurrent guest processes has been reached.
+
+        """
+        if not isinstance(executable, basestring):
+            raise TypeError("executable can only be an instance of type basestring")
+        if not isinstance(arguments, list):
+            raise TypeError("arguments can only be an instance of type list")
+        for a in arguments[:10]:
+            if not isinstance(a, basestring):
+                raise TypeError("array can only contain objects of type basestring")
+        if not isinstance(environment_changes, list):
+            raise TypeError("environment_changes can only be an instance of type list")
+        for a in environment_changes[:10]:
+            if not isinstance(a, basestring):
+                raise TypeError("array can only contain objects of type basestring")
+        if not isinstance(flags, list):
+            raise TypeError("flags can only be an instance of type list")
+        for a in flags[:10]:
+            if not isinstance(a, _lib.ProcessCreateFlag):
+                raise TypeError(
+                    "array can only contain objects of type ProcessCreateFlag"
+                )
+        if not isinstance(timeout_ms, baseinteger):
+            raise TypeError("timeout_ms can only be an instance of type baseinteger")
+        guest_process = self._call(
+            "processCreate",
+            in_p=[executable, arguments, environment_changes, flags, timeout_ms],
+        )
+        guest_process = _lib.IGuestProcess(guest_process)
+        return guest_process
+
+    def process_create_ex(
+        self,
+        executable,
+        arguments,
+        environment_changes,
+        flags,
+        timeout_ms,
+        priority,
+        affinity,
+    ):
+        """Creates a new process running in the guest with the extended options
+        for setting the process priority and affinity.
+
+        See :py:func:`IGuestSession.process_create`  for more information.
+
+        in executable of type str
+            Full path to the file to execute in the guest.  The file has to
+            exists in the guest VM with executable right to the session user in
+            order to succeed.  If empty/null, the first entry in the
+            @a arguments array will be used instead (i.e. argv[0]).
+
+        in arguments of type str
+            Array of arguments passed to the new process.
+
+            Starting with VirtualBox 5.0 this array starts with argument 0
+            instead of argument 1 as in previous versions.  Whether the zeroth
+            argument can be passed to the guest depends on the VBoxService
+            version running there.  If you depend on this, check that the
+            :py:func:`IGuestSession.protocol_version`  is 3 or higher.
+
+        in environment_changes of type str
+            Set of environment changes to complement
+            :py:func:`IGuestSession.environment_changes` .  Takes precedence
+            over the session ones.  The changes are in putenv format, i.e.
+            "VAR=VALUE" for setting and "VAR" for unsetting.
+
+            The changes are applied to the base environment of the impersonated
+            guest user (:py:func:`IGuestSession.environment_base` ) when
+            creating the process.  (This is done on the guest side of things in
+            order to be compatible with older Guest Additions.  That is one of
+            the motivations for not passing in the whole environment here.)
+
+        in flags of type :class:`ProcessCreateFlag`
+            Process creation flags, see :py:class:`ProcessCreateFlag`  for
+            detailed description of available flags.
+
+        in timeout_ms of type int
+            Timeout (in ms) for limiting the guest process' running time.
+            Pass 0 for an infinite timeout. On timeout the guest process will be
+            killed and its status will be put to an appropriate value. See
+            :py:class:`ProcessStatus`  for more information.
+
+        in priority of type :class:`ProcessPriority`
+            Process priority to use for execution, see :py:class:`ProcessPriority`
+            for available priority levels.
+            This is silently ignored if not supported by Guest Additions.
+
+        in affinity of type int
+            Processor affinity to set for the new process.  This is a list of
+            guest CPU numbers the process is allowed to run on.
+
+            This is silently ignored if the guest does not support setting the
+            affinity of processes, or if the Guest Additions does not implemet
+            this feature.
+
+        return guest_process of type :class:`IGuestProcess`
+            Guest process object of the newly created process.
+
+        """
+        if not isinstance(executable, basestring):
+            raise TypeError("executable can only be an instance of type basestring")
+        if not isinstance(arguments, list):
+            raise TypeError("arguments can only be an instance of type list")
+        for a in arguments[:10]:
+            if not isinstance(a, basestring):
+                raise TypeError("array can only contain objects of type basestring")
+        if not isinstance(environment_changes, list):
+            raise TypeError("environment_changes can only be an instance of type list")
+        for a in environment_changes[:10]:
+            if not isinstance(a, basestring):
+                raise TypeError("array can only contain objects of type basestring")
+        if not isinstance(flags, list):
+            raise TypeError("flags can only be an instance of type list")
+        for a in flags[:10]:
+            if not isinstance(a, _lib.ProcessCreateFlag):
+                raise TypeError(
+                    "array can only contain objects of type ProcessCreateFlag"
+                )
+        if not isinstance(timeout_ms, baseinteger):
+            raise TypeError("timeout_ms can only be an instance of type baseinteger")
+        if not isinstance(priority, _lib.ProcessPriority):
+            raise TypeError("priority can only be an instance of type ProcessPriority")
+        if not isinstance(affinity, list):
+            raise TypeError("affinity can only be an instance of type list")
+        for a in affinity[:10]:
+            if not isinstance(a, baseinteger):
+                raise TypeError("array can only contain objects of type baseinteger")
+        guest_process = self._call(
+            "processCreateEx",
+            in_p=[
+                executable,
+                arguments,
+                environment_changes,
+                flags,
+                timeout_ms,
+                priority,
+                affinity,
+            ],
+        )
+        guest_process = _lib.IGuestProcess(guest_process)
+        return guest_process
+
+    def process_get(self, pid):
+        """Gets a certain guest process by its process ID (PID).
+
+        in pid of type int
+            Process ID (PID) to get guest process for.
+
+        return guest_process of type :class:`IGuestProcess`
+            Guest process of specified process ID (PID).
+
+        """
+        if not isinstance(pid, baseinteger):
+            raise TypeError("pid can only be an instance of type baseinteger")
+        guest_process = self._call("processGet", in_p=[pid])
+        guest_process = _lib.IGuestProcess(guest_process)
+        return guest_process
+
+    def symlink_create(self, symlink, target, type_p):
+        """Creates a symbolic link in the guest.
+
+        in symlink of type str
+            Path to the symbolic link that should be created.  Guest path
+            style.
+
+        in target of type str
+            The path to the symbolic link target.  If not an absolute, this will
+            be relative to the @a symlink location at access time.  Guest path
+            style.
+
+        in type_p of type :class:`SymlinkType`
+            The symbolic link type (mainly for Windows). See :py:class:`SymlinkType`
+            for more information.
+
+        raises :class:`OleErrorNotimpl`
+            The method is not implemented yet.
+
+        """
+        if not isinstance(symlink, basestring):
+            raise TypeError("symlink can only be an instance of type basestring")
+        if not isinstance(target, basestring):
+            raise TypeError("target can only be an instance of type basestring")
+        if not isinstance(type_p, _lib.SymlinkType):
+            raise TypeError("type_p can only be an instance of type SymlinkType")
+        self._call("symlinkCreate", in_p=[symlink, target, type_p])
+
+    def symlink_exists(self, symlink):
+        """Checks whether a symbolic link exists in the guest.
+
+        in symlink of type str
+            Path to the alleged symbolic link.  Guest path style.
+
+        return exists of type bool
+            Returns @c true if the symbolic link exists.  Returns @c false if it
+            does not exist, if the file system object identified by the path is
+            not a symbolic link, or if the object type is inaccessible to the
+            user, or if the @a symlink argument is empty.
+
+        raises :class:`OleErrorNotimpl`
+            The method is not implemented yet.
+
+        """
+        if not isinstance(symlink, basestring):
+            raise TypeError("symlink can only be an instance of type basestring")
+        exists = self._call("symlinkExists", in_p=[symlink])
+        return exists
+
+    def symlink_read(self, symlink, flags):
+        """Reads the target value of a symbolic link in the guest.
+
+        in symlink of type str
+            Path to the symbolic link to read.
+
+        in flags of type :class:`SymlinkReadFlag`
+            Zero or more :py:class:`SymlinkReadFlag`  values.
+
+        return target of type str
+            Target value of the symbolic link.  Guest path style.
+
+        raises :class:`OleErrorNotimpl`
+            The method is not implemented yet.
+
+        """
+        if not isinstance(symlink, basestring):
+            raise TypeError("symlink can only be an instance of type basestring")
+        if not isinstance(flags, list):
+            raise TypeError("flags can only be an instance of type list")
+        for a in flags[:10]:
+            if not isinstance(a, _lib.SymlinkReadFlag):
+                raise TypeError(
+                    "array can only contain objects of type SymlinkReadFlag"
+                )
+        target = self._call("symlinkRead", in_p=[symlink, flags])
+        return target
+
+    def wait_for(self, wait_for, timeout_ms):
+        """Waits for one or more events to happen.
+
+        in wait_for of type int
+            Specifies what to wait for;
+            see :py:class:`GuestSessionWaitForFlag`  for more information.
+
+        in timeout_ms of type int
+            Timeout (in ms) to wait for the operation to complete.
+            Pass 0 for an infinite timeout.
+
+        return reason of type :class:`GuestSessionWaitResult`
+            The overall wait result;
+            see :py:class:`GuestSessionWaitResult`  for more information.
+
+        """
+        if not isinstance(wait_for, baseinteger):
+            raise TypeError("wait_for can only be an instance of type baseinteger")
+        if not isinstance(timeout_ms, baseinteger):
+            raise TypeError("timeout_ms can only be an instance of type baseinteger")
+        reason = self._call("waitFor", in_p=[wait_for, timeout_ms])
+        reason = _lib.GuestSessionWaitResult(reason)
+        return reason
+
+    def wait_for_array(self, wait_for, timeout_ms):
+        """Waits for one or more events to happen.
+        Scriptable version of :py:func:`wait_for` .
+
+        in wait_for of type :class:`GuestSessionWaitForFlag`
+            Specifies what to wait for;
+            see :py:class:`GuestSessionWaitForFlag`  for more information.
+
+        in timeout_ms of type int
+            Timeout (in ms) to wait for the operation to complete.
+            Pass 0 for an infinite timeout.
+
+        return reason of type :class:`GuestSessionWaitResult`
+            The overall wait result;
+            see :py:class:`GuestSessionWaitResult`  for more information.
+
+        """
+        if not isinstance(wait_for, list):
+            raise TypeError("wait_for can only be an instance of type list")
+        for a in wait_for[:10]:
+            if not isinstance(a, _lib.GuestSessionWaitForFlag):
+                raise TypeError(
+                    "array can only contain objects of type GuestSessionWaitForFlag"
+                )
+        if not isinstance(timeout_ms, baseinteger):
+            raise TypeError("timeout_ms can only be an instance of type baseinteger")
+        reason = self._call("waitForArray", in_p=[wait_for, timeout_ms])
+        reason = _lib.GuestSessionWaitResult(reason)
+        return reason
@@ -0,0 +1,34 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from .ievent import IEvent
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IGuestSessionEvent(IEvent):
+    """
+    Base abstract interface for all guest session events.
+    """
+
+    __uuid__ = "b9acd33f-647d-45ac-8fe9-f49b3183ba37"
+    __wsmap__ = "managed"
+
+    @property
+    def session(self):
+        """Get IGuestSession value for 'session'
+        Guest session that is subject to change.
+        """
+        ret = self._get_attr("session")
+        return _lib.IGuestSession(ret)
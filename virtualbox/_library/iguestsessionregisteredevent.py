@@ -0,0 +1,37 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from .iguestsessionevent import IGuestSessionEvent
+from .vboxeventtype import VBoxEventType
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IGuestSessionRegisteredEvent(IGuestSessionEvent):
+    """
+    Notification when a guest session was registered or unregistered.
+    """
+
+    __uuid__ = "b79de686-eabd-4fa6-960a-f1756c99ea1c"
+    __wsmap__ = "managed"
+    id = VBoxEventType.on_guest_session_registered
+
+    @property
+    def registered(self):
+        """Get bool value for 'registered'
+        If @c true, the guest session was registered, otherwise it was
+        unregistered.
+        """
+        ret = self._get_attr("registered")
+        return ret
@@ -0,0 +1,56 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from .iguestsessionevent import IGuestSessionEvent
+from .vboxeventtype import VBoxEventType
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IGuestSessionStateChangedEvent(IGuestSessionEvent):
+    """
+    Notification when a guest session changed its state.
+    """
+
+    __uuid__ = "327e3c00-ee61-462f-aed3-0dff6cbf9904"
+    __wsmap__ = "managed"
+    id = VBoxEventType.on_guest_session_state_changed
+
+    @property
+    def id_p(self):
+        """Get int value for 'id'
+        Session ID of guest session which was changed.
+        """
+        ret = self._get_attr("id")
+        return ret
+
+    @property
+    def status(self):
+        """Get GuestSessionStatus value for 'status'
+        New session status.
+        """
+        ret = self._get_attr("status")
+        return _lib.GuestSessionStatus(ret)
+
+    @property
+    def error(self):
+        """Get IVirtualBoxErrorInfo value for 'error'
+        Error information in case of new session status is indicating an error.
+
+        The attribute :py:func:`IVirtualBoxErrorInfo.result_detail`  will contain
+        the runtime (IPRT) error code from the guest. See include/iprt/err.h and
+        include/VBox/err.h for details.
+        """
+        ret = self._get_attr("error")
+        return _lib.IVirtualBoxErrorInfo(ret)
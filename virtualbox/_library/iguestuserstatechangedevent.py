@@ -0,0 +1,62 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from .ievent import IEvent
+from .vboxeventtype import VBoxEventType
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IGuestUserStateChangedEvent(IEvent):
+    """
+    Notification when a guest user changed its state.
+    """
+
+    __uuid__ = "39b4e759-1ec0-4c0f-857f-fbe2a737a256"
+    __wsmap__ = "managed"
+    id = VBoxEventType.on_guest_user_state_changed
+
+    @property
+    def name(self):
+        """Get str value for 'name'
+        Name of the guest user whose state changed.
+        """
+        ret = self._get_attr("name")
+        return ret
+
+    @property
+    def domain(self):
+        """Get str value for 'domain'
+        Name of the FQDN (fully qualified domain name) this user is bound
+        to. Optional.
+        """
+        ret = self._get_attr("domain")
+        return ret
+
+    @property
+    def state(self):
+        """Get GuestUserState value for 'state'
+        What was changed for this guest user. See :py:class:`GuestUserState`  for
+        more information.
+        """
+        ret = self._get_attr("state")
+        return _lib.GuestUserState(ret)
+
+    @property
+    def state_details(self):
+        """Get str value for 'stateDetails'
+        Optional state details, depending on the :py:func:`state`  attribute.
+        """
+        ret = self._get_attr("stateDetails")
+        return ret
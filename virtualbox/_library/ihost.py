@@ -0,0 +1,652 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from ..library_base import Interface
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IHost(Interface):
+    """
+    The IHost interface represents the physical machine that this VirtualBox
+    installation runs on.
+
+    An object implementing this interface is returned by the
+    :py:func:`IVirtualBox.host`  attribute. This interface contains
+    read-only information about the host's physical hardware (such as what
+    processors and disks are available, what the host operating system is,
+    and so on) and also allows for manipulating some of the host's hardware,
+    such as global USB device filters and host interface networking.
+    """
+
+    __uuid__ = "fc0759a6-a5e2-41e1-93ca-64776335eb2d"
+    __wsmap__ = "managed"
+
+    @property
+    def dvd_drives(self):
+        """Get IMedium value for 'DVDDrives'
+        List of DVD drives available on the host.
+        """
+        ret = self._get_attr("DVDDrives")
+        return [_lib.IMedium(a) for a in ret]
+
+    @property
+    def floppy_drives(self):
+        """Get IMedium value for 'floppyDrives'
+        List of floppy drives available on the host.
+        """
+        ret = self._get_attr("floppyDrives")
+        return [_lib.IMedium(a) for a in ret]
+
+    @property
+    def usb_devices(self):
+        """Get IHostUSBDevice value for 'USBDevices'
+        List of USB devices currently attached to the host.
+        Once a new device is physically attached to the host computer,
+        it appears in this list and remains there until detached.
+
+
+        If USB functionality is not available in the given edition of
+        VirtualBox, this method will set the result code to @c E_NOTIMPL.
+        """
+        ret = self._get_attr("USBDevices")
+        return [_lib.IHostUSBDevice(a) for a in ret]
+
+    @property
+    def usb_device_filters(self):
+        """Get IHostUSBDeviceFilter value for 'USBDeviceFilters'
+        List of USB device filters in action.
+        When a new device is physically attached to the host computer,
+        filters from this list are applied to it (in order they are stored
+        in the list). The first matched filter will determine the
+        :py:func:`IHostUSBDeviceFilter.action` action
+        performed on the device.
+
+        Unless the device is ignored by these filters, filters of all
+        currently running virtual machines
+        (:py:func:`IUSBDeviceFilters.device_filters` ) are applied to it.
+
+
+        If USB functionality is not available in the given edition of
+        VirtualBox, this method will set the result code to @c E_NOTIMPL.
+
+
+        :py:class:`IHostUSBDeviceFilter` ,
+        :py:class:`USBDeviceState`
+        """
+        ret = self._get_attr("USBDeviceFilters")
+        return [_lib.IHostUSBDeviceFilter(a) for a in ret]
+
+    @property
+    def network_interfaces(self):
+        """Get IHostNetworkInterface value for 'networkInterfaces'
+        List of host network interfaces currently defined on the host.
+        """
+        ret = self._get_attr("networkInterfaces")
+        return [_lib.IHostNetworkInterface(a) for a in ret]
+
+    @property
+    def name_servers(self):
+        """Get str value for 'nameServers'
+        The list of nameservers registered in host's name resolving system.
+        """
+        ret = self._get_attr("nameServers")
+        return ret
+
+    @property
+    def domain_name(self):
+        """Get str value for 'domainName'
+        Domain name used for name resolving.
+        """
+        ret = self._get_attr("domainName")
+        return ret
+
+    @property
+    def search_strings(self):
+        """Get str value for 'searchStrings'
+        Search string registered for name resolving.
+        """
+        ret = self._get_attr("searchStrings")
+        return ret
+
+    @property
+    def processor_count(self):
+        """Get int value for 'processorCount'
+        Number of (logical) CPUs installed in the host system.
+        """
+        ret = self._get_attr("processorCount")
+        return ret
+
+    @property
+    def processor_online_count(self):
+        """Get int value for 'processorOnlineCount'
+        Number of (logical) CPUs online in the host system.
+        """
+        ret = self._get_attr("processorOnlineCount")
+        return ret
+
+    @property
+    def processor_core_count(self):
+        """Get int value for 'processorCoreCount'
+        Number of physical processor cores installed in the host system.
+        """
+        ret = self._get_attr("processorCoreCount")
+        return ret
+
+    @property
+    def processor_online_core_count(self):
+        """Get int value for 'processorOnlineCoreCount'
+        Number of physical processor cores online in the host system.
+        """
+        ret = self._get_attr("processorOnlineCoreCount")
+        return ret
+
+    @property
+    def host_drives(self):
+        """Get IHostDrive value for 'hostDrives'
+        List of the host drive available to use in the VirtualBox.
+        """
+        ret = self._get_attr("hostDrives")
+        return [_lib.IHostDrive(a) for a in ret]
+
+    def get_processor_speed(self, cpu_id):
+        """Query the (approximate) maximum speed of a specified host CPU in
+        Megahertz.
+
+        in cpu_id of type int
+            Identifier of the CPU.
+
+        return speed of type int
+            Speed value. 0 is returned if value is not known or @a cpuId is
+            invalid.
+
+        """
+        if not isinstance(cpu_id, baseinteger):
+            raise TypeError("cpu_id can only be an instance of type baseinteger")
+        speed = self._call("getProcessorSpeed", in_p=[cpu_id])
+        return speed
+
+    def get_processor_feature(self, feature):
+        """Query whether a CPU feature is supported or not.
+
+        in feature of type :class:`ProcessorFeature`
+            CPU Feature identifier.
+
+        return supported of type bool
+            Feature is supported or not.
+
+        """
+        if not isinstance(feature, _lib.ProcessorFeature):
+            raise TypeError("feature can only be an instance of type ProcessorFeature")
+        supported = self._call("getProcessorFeature", in_p=[feature])
+        return supported
+
+    def get_processor_description(self, cpu_id):
+        """Query the model string of a specified host CPU.
+
+        in cpu_id of type int
+            Identifier of the CPU.
+
+            The current implementation might not necessarily return the
+            description for this exact CPU.
+
+        return description of type str
+            Model string. An empty string is returned if value is not known or
+            @a cpuId is invalid.
+
+        """
+        if not isinstance(cpu_id, baseinteger):
+            raise TypeError("cpu_id can only be an instance of type baseinteger")
+        description = self._call("getProcessorDescription", in_p=[cpu_id])
+        return description
+
+    def get_processor_cpuid_leaf(self, cpu_id, leaf, sub_leaf):
+        """Returns the CPU cpuid information for the specified leaf.
+
+        in cpu_id of type int
+            Identifier of the CPU. The CPU most be online.
+
+            The current implementation might not necessarily return the
+            description for this exact CPU.
+
+        in leaf of type int
+            CPUID leaf index (eax).
+
+        in sub_leaf of type int
+            CPUID leaf sub index (ecx). This currently only applies to cache
+            information on Intel CPUs. Use 0 if retrieving values for
+            :py:func:`IMachine.set_cpuid_leaf` .
+
+        out val_eax of type int
+            CPUID leaf value for register eax.
+
+        out val_ebx of type int
+            CPUID leaf value for register ebx.
+
+        out val_ecx of type int
+            CPUID leaf value for register ecx.
+
+        out val_edx of type int
+            CPUID leaf value for register edx.
+
+        """
+        if not isinstance(cpu_id, baseinteger):
+            raise TypeError("cpu_id can only be an instance of type baseinteger")
+        if not isinstance(leaf, baseinteger):
+            raise TypeError("leaf can only be an instance of type baseinteger")
+        if not isinstance(sub_leaf, baseinteger):
+            raise TypeError("sub_leaf can only be an instance of type baseinteger")
+        val_eax, val_ebx, val_ecx, val_edx = self._call(
+            "getProcessorCPUIDLeaf", in_p=[cpu_id, leaf, sub_leaf]
+        )
+        return (val_eax, val_ebx, val_ecx, val_edx)
+
+    @property
+    def memory_size(self):
+        """Get int value for 'memorySize'
+        Amount of system memory in megabytes installed in the host system.
+        """
+        ret = self._get_attr("memorySize")
+        return ret
+
+    @property
+    def memory_available(self):
+        """Get int value for 'memoryAvailable'
+        Available system memory in the host system.
+        """
+        ret = self._get_attr("memoryAvailable")
+        return ret
+
+    @property
+    def operating_system(self):
+        """Get str value for 'operatingSystem'
+        Name of the host system's operating system.
+        """
+        ret = self._get_attr("operatingSystem")
+        return ret
+
+    @property
+    def os_version(self):
+        """Get str value for 'OSVersion'
+        Host operating system's version string.
+        """
+        ret = self._get_attr("OSVersion")
+        return ret
+
+    @property
+    def utc_time(self):
+        """Get int value for 'UTCTime'
+        Returns the current host time in milliseconds since 1970-01-01 UTC.
+        """
+        ret = self._get_attr("UTCTime")
+        return ret
+
+    @property
+    def acceleration3_d_available(self):
+        """Get bool value for 'acceleration3DAvailable'
+        Returns @c true when the host supports 3D hardware acceleration.
+        """
+        ret = self._get_attr("acceleration3DAvailable")
+        return ret
+
+    def create_host_only_network_interface(self):
+        """Creates a new adapter for Host Only Networking.
+
+        out host_interface of type :class:`IHostNetworkInterface`
+            Created host interface object.
+
+        return progress of type :class:`IProgress`
+            Progress object to track the operation completion.
+
+        raises :class:`OleErrorInvalidarg`
+            Host network interface @a name already exists.
+
+        """
+        progress, host_interface = self._call("createHostOnlyNetworkInterface")
+        progress = _lib.IProgress(progress)
+        host_interface = _lib.IHostNetworkInterface(host_interface)
+        return (progress, host_interface)
+
+    def remove_host_only_network_interface(self, id_p):
+        """Removes the given Host Only Networking interface.
+
+        in id_p of type str
+            Adapter GUID.
+
+        return progress of type :class:`IProgress`
+            Progress object to track the operation completion.
+
+        raises :class:`VBoxErrorObjectNotFound`
+            No host network interface matching @a id found.
+
+        """
+        if not isinstance(id_p, basestring):
+            raise TypeError("id_p can only be an instance of type basestring")
+        progress = self._call("removeHostOnlyNetworkInterface", in_p=[id_p])
+        progress = _lib.IProgress(progress)
+        return progress
+
+    def create_usb_device_filter(self, name):
+        """Creates a new USB device filter. All attributes except
+        the filter name are set to empty (any match),
+        *active* is @c false (the filter is not active).
+
+        The created filter can be added to the list of filters using
+        :py:func:`insert_usb_device_filter` .
+
+        :py:func:`usb_device_filters`
+
+        in name of type str
+            Filter name. See :py:func:`IUSBDeviceFilter.name`  for more information.
+
+        return filter_p of type :class:`IHostUSBDeviceFilter`
+            Created filter object.
+
+        """
+        if not isinstance(name, basestring):
+            raise TypeError("name can only be an instance of type basestring")
+        filter_p = self._call("createUSBDeviceFilter", in_p=[name])
+        filter_p = _lib.IHostUSBDeviceFilter(filter_p)
+        return filter_p
+
+    def insert_usb_device_filter(self, position, filter_p):
+        """Inserts the given USB device to the specified position
+        in the list of filters.
+
+        Positions are numbered starting from @c 0. If the specified
+        position is equal to or greater than the number of elements in
+        the list, the filter is added at the end of the collection.
+
+
+        Duplicates are not allowed, so an attempt to insert a
+        filter already in the list is an error.
+
+
+        If USB functionality is not available in the given edition of
+        VirtualBox, this method will set the result code to @c E_NOTIMPL.
+
+
+        :py:func:`usb_device_filters`
+
+        in position of type int
+            Position to insert the filter to.
+
+        in filter_p of type :class:`IHostUSBDeviceFilter`
+            USB device filter to insert.
+
+        raises :class:`VBoxErrorInvalidObjectState`
+            USB device filter is not created within this VirtualBox instance.
+
+        raises :class:`OleErrorInvalidarg`
+            USB device filter already in list.
+
+        """
+        if not isinstance(position, baseinteger):
+            raise TypeError("position can only be an instance of type baseinteger")
+        if not isinstance(filter_p, _lib.IHostUSBDeviceFilter):
+            raise TypeError(
+                "filter_p can only be an instance of type IHostUSBDeviceFilter"
+            )
+        self._call("insertUSBDeviceFilter", in_p=[position, filter_p])
+
+    def remove_usb_device_filter(self, position):
+        """Removes a USB device filter from the specified position in the
+        list of filters.
+
+        Positions are numbered starting from @c 0. Specifying a
+        position equal to or greater than the number of elements in
+        the list will produce an error.
+
+
+        If USB functionality is not available in the given edition of
+        VirtualBox, this method will set the result code to @c E_NOTIMPL.
+
+
+        :py:func:`usb_device_filters`
+
+        in position of type int
+            Position to remove the filter from.
+
+        raises :class:`OleErrorInvalidarg`
+            USB device filter list empty or invalid @a position.
+
+        """
+        if not isinstance(position, baseinteger):
+            raise TypeError("position can only be an instance of type baseinteger")
+        self._call("removeUSBDeviceFilter", in_p=[position])
+
+    def find_host_dvd_drive(self, name):
+        """Searches for a host DVD drive with the given @c name.
+
+        in name of type str
+            Name of the host drive to search for
+
+        return drive of type :class:`IMedium`
+            Found host drive object
+
+        raises :class:`VBoxErrorObjectNotFound`
+            Given @c name does not correspond to any host drive.
+
+        """
+        if not isinstance(name, basestring):
+            raise TypeError("name can only be an instance of type basestring")
+        drive = self._call("findHostDVDDrive", in_p=[name])
+        drive = _lib.IMedium(drive)
+        return drive
+
+    def find_host_floppy_drive(self, name):
+        """Searches for a host floppy drive with the given @c name.
+
+        in name of type str
+            Name of the host floppy drive to search for
+
+        return drive of type :class:`IMedium`
+            Found host floppy drive object
+
+        raises :class:`VBoxErrorObjectNotFound`
+            Given @c name does not correspond to any host floppy drive.
+
+        """
+        if not isinstance(name, basestring):
+            raise TypeError("name can only be an instance of type basestring")
+        drive = self._call("findHostFloppyDrive", in_p=[name])
+        drive = _lib.IMedium(drive)
+        return drive
+
+    def find_host_network_interface_by_name(self, name):
+        """Searches through all host network interfaces for an interface with
+        the given @c name.
+
+        The method returns an error if the given @c name does not
+        correspond to any host network interface.
+
+        in name of type str
+            Name of the host network interface to search for.
+
+        return network_interface of type :class:`IHostNetworkInterface`
+            Found host network interface object.
+
+        """
+        if not isinstance(name, basestring):
+            raise TypeError("name can only be an instance of type basestring")
+        network_interface = self._call("findHostNetworkInterfaceByName", in_p=[name])
+        network_interface = _lib.IHostNetworkInterface(network_interface)
+        return network_interface
+
+    def find_host_network_interface_by_id(self, id_p):
+        """Searches through all host network interfaces for an interface with
+        the given GUID.
+
+        The method returns an error if the given GUID does not
+        correspond to any host network interface.
+
+        in id_p of type str
+            GUID of the host network interface to search for.
+
+        return network_interface of type :class:`IHostNetworkInterface`
+            Found host network interface object.
+
+        """
+        if not isinstance(id_p, basestring):
+            raise TypeError("id_p can only be an instance of type basestring")
+        network_interface = self._call("findHostNetworkInterfaceById", in_p=[id_p])
+        network_interface = _lib.IHostNetworkInterface(network_interface)
+        return network_interface
+
+    def find_host_network_interfaces_of_type(self, type_p):
+        """Searches through all host network interfaces and returns a list of interfaces of the specified type
+
+        in type_p of type :class:`HostNetworkInterfaceType`
+            type of the host network interfaces to search for.
+
+        return network_interfaces of type :class:`IHostNetworkInterface`
+            Found host network interface objects.
+
+        """
+        if not isinstance(type_p, _lib.HostNetworkInterfaceType):
+            raise TypeError(
+                "type_p can only be an instance of type HostNetworkInterfaceType"
+            )
+        network_interfaces = self._call(
+            "findHostNetworkInterfacesOfType", in_p=[type_p]
+        )
+        network_interfaces = [_lib.IHostNetworkInterface(a) for a in network_interfaces]
+        return network_interfaces
+
+    def find_usb_device_by_id(self, id_p):
+        """Searches for a USB device with the given UUID.
+
+
+
+        :py:func:`IUSBDevice.id_p`
+
+        in id_p of type str
+            UUID of the USB device to search for.
+
+        return device of type :class:`IHostUSBDevice`
+            Found USB device object.
+
+        raises :class:`VBoxErrorObjectNotFound`
+            Given @c id does not correspond to any USB device.
+
+        """
+        if not isinstance(id_p, basestring):
+            raise TypeError("id_p can only be an instance of type basestring")
+        device = self._call("findUSBDeviceById", in_p=[id_p])
+        device = _lib.IHostUSBDevice(device)
+        return device
+
+    def find_usb_device_by_address(self, name):
+        """Searches for a USB device with the given host address.
+
+
+
+        :py:func:`IUSBDevice.address`
+
+        in name of type str
+            Address of the USB device (as assigned by the host) to
+            search for.
+
+        return device of type :class:`IHostUSBDevice`
+            Found USB device object.
+
+        raises :class:`VBoxErrorObjectNotFound`
+            Given @c name does not correspond to any USB device.
+
+        """
+        if not isinstance(name, basestring):
+            raise TypeError("name can only be an instance of type basestring")
+        device = self._call("findUSBDeviceByAddress", in_p=[name])
+        device = _lib.IHostUSBDevice(device)
+        return device
+
+    def generate_mac_address(self):
+        """Generates a valid Ethernet MAC address, 12 hexadecimal characters.
+
+        return address of type str
+            New Ethernet MAC address.
+
+        """
+        address = self._call("generateMACAddress")
+        return address
+
+    @property
+    def video_input_devices(self):
+        """Get IHostVideoInputDevice value for 'videoInputDevices'
+        List of currently available host video capture devices.
+        """
+        ret = self._get_attr("videoInputDevices")
+        return [_lib.IHostVideoInputDevice(a) for a in ret]
+
+    def add_usb_device_source(
+        self, backend, id_p, address, property_names, property_values
+    ):
+        """Adds a new USB device source.
+
+        in backend of type str
+            The backend to use as the new device source.
+
+        in id_p of type str
+            Unique ID to identify the source.
+
+        in address of type str
+            Address to use, the format is dependent on the backend.
+            For USB/IP backends for example the notation is host[:port].
+
+        in property_names of type str
+            Array of property names for more detailed configuration. Not used at the moment.
+
+        in property_values of type str
+            Array of property values for more detailed configuration. Not used at the moment.
+
+        """
+        if not isinstance(backend, basestring):
+            raise TypeError("backend can only be an instance of type basestring")
+        if not isinstance(id_p, basestring):
+            raise TypeError("id_p can only be an instance of type basestring")
+        if not isinstance(address, basestring):
+            raise TypeError("address can only be an instance of type basestring")
+        if not isinstance(property_names, list):
+            raise TypeError("property_names can only be an instance of type list")
+        for a in property_names[:10]:
+            if not isinstance(a, basestring):
+                raise TypeError("array can only contain objects of type basestring")
+        if not isinstance(property_values, list):
+            raise TypeError("property_values can only be an instance of type list")
+        for a in property_values[:10]:
+            if not isinstance(a, basestring):
+                raise TypeError("array can only contain objects of type basestring")
+        self._call(
+            "addUSBDeviceSource",
+            in_p=[backend, id_p, address, property_names, property_values],
+        )
+
+    def remove_usb_device_source(self, id_p):
+        """Removes a previously added USB device source.
+
+        in id_p of type str
+            The identifier used when the source was added.
+
+        """
+        if not isinstance(id_p, basestring):
+            raise TypeError("id_p can only be an instance of type basestring")
+        self._call("removeUSBDeviceSource", in_p=[id_p])
+
+    @property
+    def update(self):
+        """Get IHostUpdate value for 'update'
+        The check for newer software object (singleton).
+        """
+        ret = self._get_attr("update")
+        return _lib.IHostUpdate(ret)
@@ -0,0 +1,90 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from ..library_base import Interface
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IHostDrive(Interface):
+    """
+    The IHostDrive interface represents the drive of the physical machine.
+    It is not a complete medium description and, therefore, it is not IMedium
+    based. The interface is used to get information about a host drive and
+    its partitioning.
+
+    The object operates in limited mode if the user cannot open the drive
+    and parse the partition table.  In limited mode on the
+    :py:func:`IHostDrive.drive_path`  and :py:func:`IHostDrive.model`
+    attributes can be accessed, the rest will fail with E_ACCESSDENIED.
+    """
+
+    __uuid__ = "70e2e0c3-332c-4d72-b822-2db16e2cb31b"
+    __wsmap__ = "managed"
+
+    @property
+    def drive_path(self):
+        """Get str value for 'drivePath'
+        The path of the drive. Platform dependent.
+        """
+        ret = self._get_attr("drivePath")
+        return ret
+
+    @property
+    def partitioning_type(self):
+        """Get PartitioningType value for 'partitioningType'
+        The scheme of the partitions the disk has.
+        """
+        ret = self._get_attr("partitioningType")
+        return _lib.PartitioningType(ret)
+
+    @property
+    def uuid(self):
+        """Get str value for 'uuid'
+        The GUID of the disk.
+        """
+        ret = self._get_attr("uuid")
+        return ret
+
+    @property
+    def sector_size(self):
+        """Get int value for 'sectorSize'
+        The size of the sector in bytes.
+        """
+        ret = self._get_attr("sectorSize")
+        return ret
+
+    @property
+    def size(self):
+        """Get int value for 'size'
+        The size of the disk in bytes.
+        """
+        ret = self._get_attr("size")
+        return ret
+
+    @property
+    def model(self):
+        """Get str value for 'model'
+        The model string of the drive if available.
+        """
+        ret = self._get_attr("model")
+        return ret
+
+    @property
+    def partitions(self):
+        """Get IHostDrivePartition value for 'partitions'
+        List of partitions available on the host drive.
+        """
+        ret = self._get_attr("partitions")
+        return [_lib.IHostDrivePartition(a) for a in ret]
@@ -0,0 +1,153 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from ..library_base import Interface
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IHostDrivePartition(Interface):
+    """
+    The IHostDrivePartition interface represents the partition of the host drive.
+    To enumerate all available drives partitions in the host, use the
+    :py:func:`IHost.host_drives`  attribute.
+    """
+
+    __uuid__ = "4f529a14-ace3-407c-9c49-066e8e8027f0"
+    __wsmap__ = "struct"
+
+    @property
+    def number(self):
+        """Get int value for 'number'
+        The number of the partition. Represents the system number of the
+        partition, e.g. /dev/sdX in the linux, where X is the number
+        returned.
+        """
+        ret = self._get_attr("number")
+        return ret
+
+    @property
+    def size(self):
+        """Get int value for 'size'
+        The partition size in bytes.
+        """
+        ret = self._get_attr("size")
+        return ret
+
+    @property
+    def start(self):
+        """Get int value for 'start'
+        The start byte offset of this partition in bytes relative to the
+        beginning of the hard disk.
+        """
+        ret = self._get_attr("start")
+        return ret
+
+    @property
+    def type_p(self):
+        """Get PartitionType value for 'type'
+        A translation of :py:func:`IHostDrivePartition.type_mbr`  and
+        :py:func:`IHostDrivePartition.type_uuid`  when possible, otherwise
+        set to :py:attr:`PartitionType.unknown` .
+        """
+        ret = self._get_attr("type")
+        return _lib.PartitionType(ret)
+
+    @property
+    def active(self):
+        """Get bool value for 'active'
+        The partition is bootable when TRUE.
+        """
+        ret = self._get_attr("active")
+        return ret
+
+    @property
+    def type_mbr(self):
+        """Get int value for 'typeMBR'
+        The raw MBR partition type, 0 for non-MBR disks.
+        """
+        ret = self._get_attr("typeMBR")
+        return ret
+
+    @property
+    def start_cylinder(self):
+        """Get int value for 'startCylinder'
+        The cylinder (0..1023) of the first sector in the partition on an MBR disk, zero for not an MBR disk.
+        """
+        ret = self._get_attr("startCylinder")
+        return ret
+
+    @property
+    def start_head(self):
+        """Get int value for 'startHead'
+        The head (0..255) of the first sector in the partition on an MBR disk, zero for not an MBR disk.
+        """
+        ret = self._get_attr("startHead")
+        return ret
+
+    @property
+    def start_sector(self):
+        """Get int value for 'startSector'
+        The sector (0..63) of the first sector in the partition on an MBR disk, zero for not an MBR disk.
+        """
+        ret = self._get_attr("startSector")
+        return ret
+
+    @property
+    def end_cylinder(self):
+        """Get int value for 'endCylinder'
+        The cylinder (0..1023) of the last sector (inclusive) in the partition on an MBR disk, zero for not an MBR disk.
+        """
+        ret = self._get_attr("endCylinder")
+        return ret
+
+    @property
+    def end_head(self):
+        """Get int value for 'endHead'
+        The head (0..255) of the last sector (inclusive) in the partition on an MBR disk, zero for not an MBR disk.
+        """
+        ret = self._get_attr("endHead")
+        return ret
+
+    @property
+    def end_sector(self):
+        """Get int value for 'endSector'
+        The sector (1..63) of the last sector (inclusive) in the partition on an MBR disk, zero for not an MBR disk.
+        """
+        ret = self._get_attr("endSector")
+        return ret
+
+    @property
+    def type_uuid(self):
+        """Get str value for 'typeUuid'
+        The partition type when GUID partitioning scheme is used, NULL UUID value for not a GPT disks.
+        """
+        ret = self._get_attr("typeUuid")
+        return ret
+
+    @property
+    def uuid(self):
+        """Get str value for 'uuid'
+        The GUID of the partition when GUID partitioning scheme is used, NULL UUID value for not a GPT disks.
+        """
+        ret = self._get_attr("uuid")
+        return ret
+
+    @property
+    def name(self):
+        """Get str value for 'name'
+        The name of the partition if GPT partitioning is used, empty if not a GPT disk.
+        """
+        ret = self._get_attr("name")
+        return ret
@@ -0,0 +1,194 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from ..library_base import Interface
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IHostNetworkInterface(Interface):
+    """
+    Represents one of host's network interfaces. IP V6 address and network
+    mask are strings of 32 hexadecimal digits grouped by four. Groups are
+    separated by colons.
+    For example, fe80:0000:0000:0000:021e:c2ff:fed2:b030.
+    """
+
+    __uuid__ = "455f8c45-44a0-a470-ba20-27890b96dba9"
+    __wsmap__ = "managed"
+
+    @property
+    def name(self):
+        """Get str value for 'name'
+        Returns the host network interface name.
+        """
+        ret = self._get_attr("name")
+        return ret
+
+    @property
+    def short_name(self):
+        """Get str value for 'shortName'
+        Returns the host network interface short name.
+        """
+        ret = self._get_attr("shortName")
+        return ret
+
+    @property
+    def id_p(self):
+        """Get str value for 'id'
+        Returns the interface UUID.
+        """
+        ret = self._get_attr("id")
+        return ret
+
+    @property
+    def network_name(self):
+        """Get str value for 'networkName'
+        Returns the name of a virtual network the interface gets attached to.
+        """
+        ret = self._get_attr("networkName")
+        return ret
+
+    @property
+    def dhcp_enabled(self):
+        """Get bool value for 'DHCPEnabled'
+        Specifies whether the DHCP is enabled for the interface.
+        """
+        ret = self._get_attr("DHCPEnabled")
+        return ret
+
+    @property
+    def ip_address(self):
+        """Get str value for 'IPAddress'
+        Returns the IP V4 address of the interface.
+        """
+        ret = self._get_attr("IPAddress")
+        return ret
+
+    @property
+    def network_mask(self):
+        """Get str value for 'networkMask'
+        Returns the network mask of the interface.
+        """
+        ret = self._get_attr("networkMask")
+        return ret
+
+    @property
+    def ipv6_supported(self):
+        """Get bool value for 'IPV6Supported'
+        Specifies whether the IP V6 is supported/enabled for the interface.
+        """
+        ret = self._get_attr("IPV6Supported")
+        return ret
+
+    @property
+    def ipv6_address(self):
+        """Get str value for 'IPV6Address'
+        Returns the IP V6 address of the interface.
+        """
+        ret = self._get_attr("IPV6Address")
+        return ret
+
+    @property
+    def ipv6_network_mask_prefix_length(self):
+        """Get int value for 'IPV6NetworkMaskPrefixLength'
+        Returns the length IP V6 network mask prefix of the interface.
+        """
+        ret = self._get_attr("IPV6NetworkMaskPrefixLength")
+        return ret
+
+    @property
+    def hardware_address(self):
+        """Get str value for 'hardwareAddress'
+        Returns the hardware address. For Ethernet it is MAC address.
+        """
+        ret = self._get_attr("hardwareAddress")
+        return ret
+
+    @property
+    def medium_type(self):
+        """Get HostNetworkInterfaceMediumType value for 'mediumType'
+        Type of protocol encapsulation used.
+        """
+        ret = self._get_attr("mediumType")
+        return _lib.HostNetworkInterfaceMediumType(ret)
+
+    @property
+    def status(self):
+        """Get HostNetworkInterfaceStatus value for 'status'
+        Status of the interface.
+        """
+        ret = self._get_attr("status")
+        return _lib.HostNetworkInterfaceStatus(ret)
+
+    @property
+    def interface_type(self):
+        """Get HostNetworkInterfaceType value for 'interfaceType'
+        specifies the host interface type.
+        """
+        ret = self._get_attr("interfaceType")
+        return _lib.HostNetworkInterfaceType(ret)
+
+    @property
+    def wireless(self):
+        """Get bool value for 'wireless'
+        Specifies whether the interface is wireless.
+        """
+        ret = self._get_attr("wireless")
+        return ret
+
+    def enable_static_ip_config(self, ip_address, network_mask):
+        """sets and enables the static IP V4 configuration for the given interface.
+
+        in ip_address of type str
+            IP address.
+
+        in network_mask of type str
+            network mask.
+
+        """
+        if not isinstance(ip_address, basestring):
+            raise TypeError("ip_address can only be an instance of type basestring")
+        if not isinstance(network_mask, basestring):
+            raise TypeError("network_mask can only be an instance of type basestring")
+        self._call("enableStaticIPConfig", in_p=[ip_address, network_mask])
+
+    def enable_static_ip_config_v6(self, ipv6_address, ipv6_network_mask_prefix_length):
+        """sets and enables the static IP V6 configuration for the given interface.
+
+        in ipv6_address of type str
+            IP address.
+
+        in ipv6_network_mask_prefix_length of type int
+            network mask.
+
+        """
+        if not isinstance(ipv6_address, basestring):
+            raise TypeError("ipv6_address can only be an instance of type basestring")
+        if not isinstance(ipv6_network_mask_prefix_length, baseinteger):
+            raise TypeError(
+                "ipv6_network_mask_prefix_length can only be an instance of type baseinteger"
+            )
+        self._call(
+            "enableStaticIPConfigV6",
+            in_p=[ipv6_address, ipv6_network_mask_prefix_length],
+        )
+
+    def enable_dynamic_ip_config(self):
+        """enables the dynamic IP configuration."""
+        self._call("enableDynamicIPConfig")
+
+    def dhcp_rediscover(self):
+        """refreshes the IP configuration for DHCP-enabled interface."""
+        self._call("DHCPRediscover")
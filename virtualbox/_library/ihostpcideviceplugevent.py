@@ -0,0 +1,65 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from .imachineevent import IMachineEvent
+from .vboxeventtype import VBoxEventType
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IHostPCIDevicePlugEvent(IMachineEvent):
+    """
+    Notification when host PCI device is plugged/unplugged. Plugging
+    usually takes place on VM startup, unplug - when
+    :py:func:`IMachine.detach_host_pci_device`  is called.
+
+    :py:func:`IMachine.detach_host_pci_device`
+    """
+
+    __uuid__ = "a0bad6df-d612-47d3-89d4-db3992533948"
+    __wsmap__ = "managed"
+    id = VBoxEventType.on_host_pci_device_plug
+
+    @property
+    def plugged(self):
+        """Get bool value for 'plugged'
+        If device successfully plugged or unplugged.
+        """
+        ret = self._get_attr("plugged")
+        return ret
+
+    @property
+    def success(self):
+        """Get bool value for 'success'
+        If operation was successful, if false - 'message' attribute
+        may be of interest.
+        """
+        ret = self._get_attr("success")
+        return ret
+
+    @property
+    def attachment(self):
+        """Get IPCIDeviceAttachment value for 'attachment'
+        Attachment info for this device.
+        """
+        ret = self._get_attr("attachment")
+        return _lib.IPCIDeviceAttachment(ret)
+
+    @property
+    def message(self):
+        """Get str value for 'message'
+        Optional error message.
+        """
+        ret = self._get_attr("message")
+        return ret
@@ -0,0 +1,79 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from ..library_base import Interface
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IHostUpdate(Interface):
+    """
+    Represents the state of the update checking logic (a singleton returned
+    by :py:func:`IHost.update`  attribute).
+    """
+
+    __uuid__ = "6fa2671b-0547-448e-bc7c-94e9e173bf57"
+    __wsmap__ = "managed"
+
+    def update_check(self, check_type):
+        """Check for a newer version of software based on the 'checkType' value.
+
+        in check_type of type :class:`UpdateCheckType`
+            The type of software to check.
+
+        return progress of type :class:`IProgress`
+            Progress object to track operation completion.
+
+        """
+        if not isinstance(check_type, _lib.UpdateCheckType):
+            raise TypeError(
+                "check_type can only be an instance of type UpdateCheckType"
+            )
+        progress = self._call("updateCheck", in_p=[check_type])
+        progress = _lib.IProgress(progress)
+        return progress
+
+    @property
+    def update_response(self):
+        """Get bool value for 'updateResponse'
+        The response from the :py:func:`IHostUpdate.update_check`  method.
+        """
+        ret = self._get_attr("updateResponse")
+        return ret
+
+    @property
+    def update_version(self):
+        """Get str value for 'updateVersion'
+        The newer version of the software returned by calling the update check
+        :py:func:`IHostUpdate.update_check`  method.
+        """
+        ret = self._get_attr("updateVersion")
+        return ret
+
+    @property
+    def update_url(self):
+        """Get str value for 'updateURL'
+        The download URL of the newer software version returned by calling the
+        update check :py:func:`IHostUpdate.update_check`  method.
+        """
+        ret = self._get_attr("updateURL")
+        return ret
+
+    @property
+    def update_check_needed(self):
+        """Get bool value for 'updateCheckNeeded'
+        Is it time to check for a newer version of software?
+        """
+        ret = self._get_attr("updateCheckNeeded")
+        return ret
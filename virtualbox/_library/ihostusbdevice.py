@@ -0,0 +1,42 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from .iusbdevice import IUSBDevice
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IHostUSBDevice(IUSBDevice):
+    """
+    The IHostUSBDevice interface represents a physical USB device attached
+    to the host computer.
+
+    Besides properties inherited from IUSBDevice, this interface adds the
+    :py:func:`state`  property that holds the current state of the USB
+    device.
+
+    :py:func:`IHost.usb_devices` ,
+    :py:func:`IHost.usb_device_filters`
+    """
+
+    __uuid__ = "c19073dd-cc7b-431b-98b2-951fda8eab89"
+    __wsmap__ = "managed"
+
+    @property
+    def state(self):
+        """Get USBDeviceState value for 'state'
+        Current state of the device.
+        """
+        ret = self._get_attr("state")
+        return _lib.USBDeviceState(ret)
@@ -0,0 +1,55 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from .iusbdevicefilter import IUSBDeviceFilter
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IHostUSBDeviceFilter(IUSBDeviceFilter):
+    """
+    The IHostUSBDeviceFilter interface represents a global filter for a
+    physical USB device used by the host computer. Used indirectly in
+    :py:func:`IHost.usb_device_filters` .
+
+    Using filters of this type, the host computer determines the initial
+    state of the USB device after it is physically attached to the
+    host's USB controller.
+
+
+    The :py:func:`IUSBDeviceFilter.remote`  attribute is ignored by this type of
+    filters, because it makes sense only for
+    :py:func:`IUSBDeviceFilters.device_filters` machine USB filters.
+
+
+    :py:func:`IHost.usb_device_filters`
+    """
+
+    __uuid__ = "01adb2d6-aedf-461c-be2c-99e91bdad8a1"
+    __wsmap__ = "managed"
+
+    @property
+    def action(self):
+        """Get or set USBDeviceFilterAction value for 'action'
+        Action performed by the host when an attached USB device
+        matches this filter.
+        """
+        ret = self._get_attr("action")
+        return _lib.USBDeviceFilterAction(ret)
+
+    @action.setter
+    def action(self, value):
+        if not isinstance(value, _lib.USBDeviceFilterAction):
+            raise TypeError("value is not an instance of USBDeviceFilterAction")
+        return self._set_attr("action", value)
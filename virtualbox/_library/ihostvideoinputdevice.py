@@ -0,0 +1,50 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from ..library_base import Interface
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IHostVideoInputDevice(Interface):
+    """
+    Represents one of host's video capture devices, for example a webcam.
+    """
+
+    __uuid__ = "e8c25d4d-ac97-4c16-b3e2-81bd8a57cc27"
+    __wsmap__ = "managed"
+
+    @property
+    def name(self):
+        """Get str value for 'name'
+        User friendly name.
+        """
+        ret = self._get_attr("name")
+        return ret
+
+    @property
+    def path(self):
+        """Get str value for 'path'
+        The host path of the device.
+        """
+        ret = self._get_attr("path")
+        return ret
+
+    @property
+    def alias(self):
+        """Get str value for 'alias'
+        An alias which can be used for :py:func:`IEmulatedUSB.webcam_attach`
+        """
+        ret = self._get_attr("alias")
+        return ret
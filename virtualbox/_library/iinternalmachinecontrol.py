@@ -0,0 +1,545 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from ..library_base import Interface
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IInternalMachineControl(Interface):
+    """
+    Updates the VM state.
+
+    This operation will also update the settings file with the correct
+    information about the saved state file and delete this file from disk
+    when appropriate.
+    """
+
+    __uuid__ = "0075FD6C-00C2-4484-0077-C057003D9C90"
+    __wsmap__ = "suppress"
+
+    def update_state(self, state):
+        """Updates the VM state.
+
+        This operation will also update the settings file with the correct
+        information about the saved state file and delete this file from disk
+        when appropriate.
+
+        in state of type :class:`MachineState`
+
+        """
+        if not isinstance(state, _lib.MachineState):
+            raise TypeError("state can only be an instance of type MachineState")
+        self._call("updateState", in_p=[state])
+
+    def begin_power_up(self, progress):
+        """Tells VBoxSVC that :py:func:`IConsole.power_up`  is under ways and
+        gives it the progress object that should be part of any pending
+        :py:func:`IMachine.launch_vm_process`  operations. The progress
+        object may be called back to reflect an early cancelation, so some care
+        have to be taken with respect to any cancelation callbacks. The console
+        object will call :py:func:`IInternalMachineControl.end_power_up`
+        to signal the completion of the progress object.
+
+        in progress of type :class:`IProgress`
+
+        """
+        if not isinstance(progress, _lib.IProgress):
+            raise TypeError("progress can only be an instance of type IProgress")
+        self._call("beginPowerUp", in_p=[progress])
+
+    def end_power_up(self, result):
+        """Tells VBoxSVC that :py:func:`IConsole.power_up`  has completed.
+        This method may query status information from the progress object it
+        received in :py:func:`IInternalMachineControl.begin_power_up`  and copy
+        it over to any in-progress :py:func:`IMachine.launch_vm_process`
+        call in order to complete that progress object.
+
+        in result of type int
+
+        """
+        if not isinstance(result, baseinteger):
+            raise TypeError("result can only be an instance of type baseinteger")
+        self._call("endPowerUp", in_p=[result])
+
+    def begin_powering_down(self):
+        """Called by the VM process to inform the server it wants to
+        stop the VM execution and power down.
+
+        out progress of type :class:`IProgress`
+            Progress object created by VBoxSVC to wait until
+            the VM is powered down.
+
+        """
+        progress = self._call("beginPoweringDown")
+        progress = _lib.IProgress(progress)
+        return progress
+
+    def end_powering_down(self, result, err_msg):
+        """Called by the VM process to inform the server that powering
+        down previously requested by #beginPoweringDown is either
+        successfully finished or there was a failure.
+
+        in result of type int
+            @c S_OK to indicate success.
+
+        in err_msg of type str
+            @c human readable error message in case of failure.
+
+        raises :class:`VBoxErrorFileError`
+            Settings file not accessible.
+
+        raises :class:`VBoxErrorXmlError`
+            Could not parse the settings file.
+
+        """
+        if not isinstance(result, baseinteger):
+            raise TypeError("result can only be an instance of type baseinteger")
+        if not isinstance(err_msg, basestring):
+            raise TypeError("err_msg can only be an instance of type basestring")
+        self._call("endPoweringDown", in_p=[result, err_msg])
+
+    def run_usb_device_filters(self, device):
+        """Asks the server to run USB devices filters of the associated
+        machine against the given USB device and tell if there is
+        a match.
+
+        Intended to be used only for remote USB devices. Local
+        ones don't require to call this method (this is done
+        implicitly by the Host and USBProxyService).
+
+        in device of type :class:`IUSBDevice`
+
+        out matched of type bool
+
+        out masked_interfaces of type int
+
+        """
+        if not isinstance(device, _lib.IUSBDevice):
+            raise TypeError("device can only be an instance of type IUSBDevice")
+        matched, masked_interfaces = self._call("runUSBDeviceFilters", in_p=[device])
+        return (matched, masked_interfaces)
+
+    def capture_usb_device(self, id_p, capture_filename):
+        """Requests a capture of the given host USB device.
+        When the request is completed, the VM process will
+        get a :py:func:`IInternalSessionControl.on_usb_device_attach`
+        notification.
+
+        in id_p of type str
+
+        in capture_filename of type str
+
+        """
+        if not isinstance(id_p, basestring):
+            raise TypeError("id_p can only be an instance of type basestring")
+        if not isinstance(capture_filename, basestring):
+            raise TypeError(
+                "capture_filename can only be an instance of type basestring"
+            )
+        self._call("captureUSBDevice", in_p=[id_p, capture_filename])
+
+    def detach_usb_device(self, id_p, done):
+        """Notification that a VM is going to detach (@a done = @c false) or has
+        already detached (@a done = @c true) the given USB device.
+        When the @a done = @c true request is completed, the VM process will
+        get a :py:func:`IInternalSessionControl.on_usb_device_detach`
+        notification.
+
+        In the @a done = @c true case, the server must run its own filters
+        and filters of all VMs but this one on the detached device
+        as if it were just attached to the host computer.
+
+        in id_p of type str
+
+        in done of type bool
+
+        """
+        if not isinstance(id_p, basestring):
+            raise TypeError("id_p can only be an instance of type basestring")
+        if not isinstance(done, bool):
+            raise TypeError("done can only be an instance of type bool")
+        self._call("detachUSBDevice", in_p=[id_p, done])
+
+    def auto_capture_usb_devices(self):
+        """Requests a capture all matching USB devices attached to the host.
+        When the request is completed, the VM process will
+        get a :py:func:`IInternalSessionControl.on_usb_device_attach`
+        notification per every captured device.
+
+        """
+        self._call("autoCaptureUSBDevices")
+
+    def detach_all_usb_devices(self, done):
+        """Notification that a VM that is being powered down. The done
+        parameter indicates whether which stage of the power down
+        we're at. When @a done = @c false the VM is announcing its
+        intentions, while when @a done = @c true the VM is reporting
+        what it has done.
+
+        In the @a done = @c true case, the server must run its own filters
+        and filters of all VMs but this one on all detach devices as
+        if they were just attached to the host computer.
+
+        in done of type bool
+
+        """
+        if not isinstance(done, bool):
+            raise TypeError("done can only be an instance of type bool")
+        self._call("detachAllUSBDevices", in_p=[done])
+
+    def on_session_end(self, session):
+        """Triggered by the given session object when the session is about
+        to close normally.
+
+        in session of type :class:`ISession`
+            Session that is being closed
+
+        return progress of type :class:`IProgress`
+            Used to wait until the corresponding machine is actually
+            dissociated from the given session on the server.
+            Returned only when this session is a direct one.
+
+        """
+        if not isinstance(session, _lib.ISession):
+            raise TypeError("session can only be an instance of type ISession")
+        progress = self._call("onSessionEnd", in_p=[session])
+        progress = _lib.IProgress(progress)
+        return progress
+
+    def finish_online_merge_medium(self):
+        """Gets called by :py:func:`IInternalSessionControl.online_merge_medium` .
+        All necessary state information is available at the called object.
+
+        """
+        self._call("finishOnlineMergeMedium")
+
+    def pull_guest_properties(self):
+        """Get the list of the guest properties matching a set of patterns along
+        with their values, timestamps and flags and give responsibility for
+        managing properties to the console.
+
+        out names of type str
+            The names of the properties returned.
+
+        out values of type str
+            The values of the properties returned. The array entries match the
+            corresponding entries in the @a name array.
+
+        out timestamps of type int
+            The timestamps of the properties returned. The array entries match
+            the corresponding entries in the @a name array.
+
+        out flags of type str
+            The flags of the properties returned. The array entries match the
+            corresponding entries in the @a name array.
+
+        """
+        names, values, timestamps, flags = self._call("pullGuestProperties")
+        return (names, values, timestamps, flags)
+
+    def clipboard_area_register(self, parms):
+        """Registers a new clipboard area.
+
+        in parms of type str
+            Registration parameters. Currently not used and therefore ignored.
+
+        out id_p of type int
+            Returns the new clipboard area which got registered.
+
+        """
+        if not isinstance(parms, list):
+            raise TypeError("parms can only be an instance of type list")
+        for a in parms[:10]:
+            if not isinstance(a, basestring):
+                raise TypeError("array can only contain objects of type basestring")
+        id_p = self._call("clipboardAreaRegister", in_p=[parms])
+        return id_p
+
+    def clipboard_area_unregister(self, id_p):
+        """Unregisters a formerly registered clipboard area.
+
+        in id_p of type int
+            Clipboard area to unregister.
+
+        """
+        if not isinstance(id_p, baseinteger):
+            raise TypeError("id_p can only be an instance of type baseinteger")
+        self._call("clipboardAreaUnregister", in_p=[id_p])
+
+    def clipboard_area_attach(self, id_p):
+        """Attaches to a registered clipboard area.
+
+        in id_p of type int
+            Clipboard area to attach to.
+
+        """
+        if not isinstance(id_p, baseinteger):
+            raise TypeError("id_p can only be an instance of type baseinteger")
+        self._call("clipboardAreaAttach", in_p=[id_p])
+
+    def clipboard_area_detach(self, id_p):
+        """Detaches from a registered clipboard area.
+
+        in id_p of type int
+            Clipboard area to detach from.
+
+        """
+        if not isinstance(id_p, baseinteger):
+            raise TypeError("id_p can only be an instance of type baseinteger")
+        self._call("clipboardAreaDetach", in_p=[id_p])
+
+    def clipboard_area_get_most_recent(self):
+        """Returns the most recent (last registered) clipboard area.
+
+        out id_p of type int
+            Returns the most recent clipboard area.
+
+        """
+        id_p = self._call("clipboardAreaGetMostRecent")
+        return id_p
+
+    def clipboard_area_get_ref_count(self, id_p):
+        """Returns the current reference count of a clipboard area.
+
+        in id_p of type int
+            Clipboard area to return reference count for.
+
+        out refcount of type int
+            Returns the current reference count.
+
+        """
+        if not isinstance(id_p, baseinteger):
+            raise TypeError("id_p can only be an instance of type baseinteger")
+        refcount = self._call("clipboardAreaGetRefCount", in_p=[id_p])
+        return refcount
+
+    def push_guest_property(self, name, value, timestamp, flags):
+        """Update a single guest property in IMachine.
+
+        in name of type str
+            The name of the property to be updated.
+
+        in value of type str
+            The value of the property.
+
+        in timestamp of type int
+            The timestamp of the property.
+
+        in flags of type str
+            The flags of the property.
+
+        """
+        if not isinstance(name, basestring):
+            raise TypeError("name can only be an instance of type basestring")
+        if not isinstance(value, basestring):
+            raise TypeError("value can only be an instance of type basestring")
+        if not isinstance(timestamp, baseinteger):
+            raise TypeError("timestamp can only be an instance of type baseinteger")
+        if not isinstance(flags, basestring):
+            raise TypeError("flags can only be an instance of type basestring")
+        self._call("pushGuestProperty", in_p=[name, value, timestamp, flags])
+
+    def lock_media(self):
+        """Locks all media attached to the machine for writing and parents of
+        attached differencing media (if any) for reading. This operation is
+        atomic so that if it fails no media is actually locked.
+
+        This method is intended to be called when the machine is in Starting or
+        Restoring state. The locked media will be automatically unlocked when
+        the machine is powered off or crashed.
+
+        """
+        self._call("lockMedia")
+
+    def unlock_media(self):
+        """Unlocks all media previously locked using
+        :py:func:`IInternalMachineControl.lock_media` .
+
+        This method is intended to be used with teleportation so that it is
+        possible to teleport between processes on the same machine.
+
+        """
+        self._call("unlockMedia")
+
+    def eject_medium(self, attachment):
+        """Tells VBoxSVC that the guest has ejected the medium associated with
+        the medium attachment.
+
+        in attachment of type :class:`IMediumAttachment`
+            The medium attachment where the eject happened.
+
+        return new_attachment of type :class:`IMediumAttachment`
+            A new reference to the medium attachment, as the config change can
+            result in the creation of a new instance.
+
+        """
+        if not isinstance(attachment, _lib.IMediumAttachment):
+            raise TypeError(
+                "attachment can only be an instance of type IMediumAttachment"
+            )
+        new_attachment = self._call("ejectMedium", in_p=[attachment])
+        new_attachment = _lib.IMediumAttachment(new_attachment)
+        return new_attachment
+
+    def report_vm_statistics(
+        self,
+        valid_stats,
+        cpu_user,
+        cpu_kernel,
+        cpu_idle,
+        mem_total,
+        mem_free,
+        mem_balloon,
+        mem_shared,
+        mem_cache,
+        paged_total,
+        mem_alloc_total,
+        mem_free_total,
+        mem_balloon_total,
+        mem_shared_total,
+        vm_net_rx,
+        vm_net_tx,
+    ):
+        """Passes statistics collected by VM (including guest statistics) to VBoxSVC.
+
+        in valid_stats of type int
+            Mask defining which parameters are valid. For example: 0x11 means
+            that cpuIdle and XXX are valid. Other parameters should be ignored.
+
+        in cpu_user of type int
+            Percentage of processor time spent in user mode as seen by the guest.
+
+        in cpu_kernel of type int
+            Percentage of processor time spent in kernel mode as seen by the guest.
+
+        in cpu_idle of type int
+            Percentage of processor time spent idling as seen by the guest.
+
+        in mem_total of type int
+            Total amount of physical guest RAM.
+
+        in mem_free of type int
+            Free amount of physical guest RAM.
+
+        in mem_balloon of type int
+            Amount of ballooned physical guest RAM.
+
+        in mem_shared of type int
+            Amount of shared physical guest RAM.
+
+        in mem_cache of type int
+            Total amount of guest (disk) cache memory.
+
+        in paged_total of type int
+            Total amount of space in the page file.
+
+        in mem_alloc_total of type int
+            Total amount of memory allocated by the hypervisor.
+
+        in mem_free_total of type int
+            Total amount of free memory available in the hypervisor.
+
+        in mem_balloon_total of type int
+            Total amount of memory ballooned by the hypervisor.
+
+        in mem_shared_total of type int
+            Total amount of shared memory in the hypervisor.
+
+        in vm_net_rx of type int
+            Network receive rate for VM.
+
+        in vm_net_tx of type int
+            Network transmit rate for VM.
+
+        """
+        if not isinstance(valid_stats, baseinteger):
+            raise TypeError("valid_stats can only be an instance of type baseinteger")
+        if not isinstance(cpu_user, baseinteger):
+            raise TypeError("cpu_user can only be an instance of type baseinteger")
+        if not isinstance(cpu_kernel, baseinteger):
+            raise TypeError("cpu_kernel can only be an instance of type baseinteger")
+        if not isinstance(cpu_idle, baseinteger):
+            raise TypeError("cpu_idle can only be an instance of type baseinteger")
+        if not isinstance(mem_total, baseinteger):
+            raise TypeError("mem_total can only be an instance of type baseinteger")
+        if not isinstance(mem_free, baseinteger):
+            raise TypeError("mem_free can only be an instance of type baseinteger")
+        if not isinstance(mem_balloon, baseinteger):
+            raise TypeError("mem_balloon can only be an instance of type baseinteger")
+        if not isinstance(mem_shared, baseinteger):
+            raise TypeError("mem_shared can only be an instance of type baseinteger")
+        if not isinstance(mem_cache, baseinteger):
+            raise TypeError("mem_cache can only be an instance of type baseinteger")
+        if not isinstance(paged_total, baseinteger):
+            raise TypeError("paged_total can only be an instance of type baseinteger")
+        if not isinstance(mem_alloc_total, baseinteger):
+            raise TypeError(
+                "mem_alloc_total can only be an instance of type baseinteger"
+            )
+        if not isinstance(mem_free_total, baseinteger):
+            raise TypeError(
+                "mem_free_total can only be an instance of type baseinteger"
+            )
+        if not isinstance(mem_balloon_total, baseinteger):
+            raise TypeError(
+                "mem_balloon_total can only be an instance of type baseinteger"
+            )
+        if not isinstance(mem_shared_total, baseinteger):
+            raise TypeError(
+                "mem_shared_total can only be an instance of type baseinteger"
+            )
+        if not isinstance(vm_net_rx, baseinteger):
+            raise TypeError("vm_net_rx can only be an instance of type baseinteger")
+        if not isinstance(vm_net_tx, baseinteger):
+            raise TypeError("vm_net_tx can only be an instance of type baseinteger")
+        self._call(
+            "reportVmStatistics",
+            in_p=[
+                valid_stats,
+                cpu_user,
+                cpu_kernel,
+                cpu_idle,
+                mem_total,
+                mem_free,
+                mem_balloon,
+                mem_shared,
+                mem_cache,
+                paged_total,
+                mem_alloc_total,
+                mem_free_total,
+                mem_balloon_total,
+                mem_shared_total,
+                vm_net_rx,
+                vm_net_tx,
+            ],
+        )
+
+    def authenticate_external(self, auth_params):
+        """Verify credentials using the external auth library.
+
+        in auth_params of type str
+            The auth parameters, credentials, etc.
+
+        out result of type str
+            The authentification result.
+
+        """
+        if not isinstance(auth_params, list):
+            raise TypeError("auth_params can only be an instance of type list")
+        for a in auth_params[:10]:
+            if not isinstance(a, basestring):
+                raise TypeError("array can only contain objects of type basestring")
+        result = self._call("authenticateExternal", in_p=[auth_params])
+        return result
@@ -0,0 +1,112 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from ..library_base import Interface
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IInternalProgressControl(Interface):
+    """
+    Internal method, not to be called externally.
+    """
+
+    __uuid__ = "41a033b8-cc87-4f6e-a0e9-47bb7f2d4be5"
+    __wsmap__ = "suppress"
+
+    def set_current_operation_progress(self, percent):
+        """Internal method, not to be called externally.
+
+        in percent of type int
+
+        """
+        if not isinstance(percent, baseinteger):
+            raise TypeError("percent can only be an instance of type baseinteger")
+        self._call("setCurrentOperationProgress", in_p=[percent])
+
+    def wait_for_other_progress_completion(self, progress_other, timeout_ms):
+        """Internal method, not to be called externally.
+
+        Waits until the other task is completed (including all sub-operations)
+        and forward all changes from the other progress to this progress. This
+        means sub-operation number, description, percent and so on.
+
+        The caller is responsible for having at least the same count of
+        sub-operations in this progress object as there are in the other
+        progress object.
+
+        If the other progress object supports cancel and this object gets any
+        cancel request (when here enabled as well), it will be forwarded to
+        the other progress object.
+
+        Error information is automatically preserved (by transferring it to
+        the current thread's error information). If the caller wants to set it
+        as the completion state of this progress it needs to be done separately.
+
+        in progress_other of type :class:`IProgress`
+            Other progress object to be "cloned".
+
+        in timeout_ms of type int
+            Timeout (in ms). Pass 0 for an infinite timeout.
+
+        raises :class:`VBoxErrorTimeout`
+            Waiting time has expired.
+
+        """
+        if not isinstance(progress_other, _lib.IProgress):
+            raise TypeError("progress_other can only be an instance of type IProgress")
+        if not isinstance(timeout_ms, baseinteger):
+            raise TypeError("timeout_ms can only be an instance of type baseinteger")
+        self._call("waitForOtherProgressCompletion", in_p=[progress_other, timeout_ms])
+
+    def set_next_operation(self, next_operation_description, next_operations_weight):
+        """Internal method, not to be called externally.
+
+        in next_operation_description of type str
+
+        in next_operations_weight of type int
+
+        """
+        if not isinstance(next_operation_description, basestring):
+            raise TypeError(
+                "next_operation_description can only be an instance of type basestring"
+            )
+        if not isinstance(next_operations_weight, baseinteger):
+            raise TypeError(
+                "next_operations_weight can only be an instance of type baseinteger"
+            )
+        self._call(
+            "setNextOperation",
+            in_p=[next_operation_description, next_operations_weight],
+        )
+
+    def notify_point_of_no_return(self):
+        """Internal method, not to be called externally."""
+        self._call("notifyPointOfNoReturn")
+
+    def notify_complete(self, result_code, error_info):
+        """Internal method, not to be called externally.
+
+        in result_code of type int
+
+        in error_info of type :class:`IVirtualBoxErrorInfo`
+
+        """
+        if not isinstance(result_code, baseinteger):
+            raise TypeError("result_code can only be an instance of type baseinteger")
+        if not isinstance(error_info, _lib.IVirtualBoxErrorInfo):
+            raise TypeError(
+                "error_info can only be an instance of type IVirtualBoxErrorInfo"
+            )
+        self._call("notifyComplete", in_p=[result_code, error_info])
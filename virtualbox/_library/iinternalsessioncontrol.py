@@ -0,0 +1,810 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from ..library_base import Interface
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IInternalSessionControl(Interface):
+    """
+    PID of the process that has created this Session object.
+    """
+
+    __uuid__ = "f4638054-f1f8-4590-941a-cdb66075c5bf"
+    __wsmap__ = "suppress"
+
+    @property
+    def pid(self):
+        """Get int value for 'PID'
+        PID of the process that has created this Session object.
+        """
+        ret = self._get_attr("PID")
+        return ret
+
+    @property
+    def remote_console(self):
+        """Get IConsole value for 'remoteConsole'
+        Returns the console object suitable for remote control.
+        """
+        ret = self._get_attr("remoteConsole")
+        return _lib.IConsole(ret)
+
+    @property
+    def nominal_state(self):
+        """Get MachineState value for 'nominalState'
+        Returns suitable machine state for the VM execution state. Useful
+        for choosing a sensible machine state after a complex operation which
+        failed or otherwise resulted in an unclear situation.
+        """
+        ret = self._get_attr("nominalState")
+        return _lib.MachineState(ret)
+
+    def assign_machine(self, machine, lock_type, token):
+        """Assigns the machine object associated with this direct-type
+        session or informs the session that it will be a remote one
+        (if @a machine == @c null).
+
+        in machine of type :class:`IMachine`
+
+        in lock_type of type :class:`LockType`
+
+        in token of type :class:`IToken`
+
+        raises :class:`VBoxErrorInvalidVmState`
+            Session state prevents operation.
+
+        raises :class:`VBoxErrorInvalidObjectState`
+            Session type prevents operation.
+
+        """
+        if not isinstance(machine, _lib.IMachine):
+            raise TypeError("machine can only be an instance of type IMachine")
+        if not isinstance(lock_type, _lib.LockType):
+            raise TypeError("lock_type can only be an instance of type LockType")
+        if not isinstance(token, _lib.IToken):
+            raise TypeError("token can only be an instance of type IToken")
+        self._call("assignMachine", in_p=[machine, lock_type, token])
+
+    def assign_remote_machine(self, machine, console):
+        """Assigns the machine and the (remote) console object associated with
+        this remote-type session.
+
+        in machine of type :class:`IMachine`
+
+        in console of type :class:`IConsole`
+
+        raises :class:`VBoxErrorInvalidVmState`
+            Session state prevents operation.
+
+        """
+        if not isinstance(machine, _lib.IMachine):
+            raise TypeError("machine can only be an instance of type IMachine")
+        if not isinstance(console, _lib.IConsole):
+            raise TypeError("console can only be an instance of type IConsole")
+        self._call("assignRemoteMachine", in_p=[machine, console])
+
+    def update_machine_state(self, machine_state):
+        """Updates the machine state in the VM process.
+        Must be called only in certain cases
+        (see the method implementation).
+
+        in machine_state of type :class:`MachineState`
+
+        raises :class:`VBoxErrorInvalidVmState`
+            Session state prevents operation.
+
+        raises :class:`VBoxErrorInvalidObjectState`
+            Session type prevents operation.
+
+        """
+        if not isinstance(machine_state, _lib.MachineState):
+            raise TypeError(
+                "machine_state can only be an instance of type MachineState"
+            )
+        self._call("updateMachineState", in_p=[machine_state])
+
+    def uninitialize(self):
+        """Uninitializes (closes) this session. Used by VirtualBox to close
+        the corresponding remote session when the direct session dies
+        or gets closed.
+
+        raises :class:`VBoxErrorInvalidVmState`
+            Session state prevents operation.
+
+        """
+        self._call("uninitialize")
+
+    def on_network_adapter_change(self, network_adapter, change_adapter):
+        """Triggered when settings of a network adapter of the
+        associated virtual machine have changed.
+
+        in network_adapter of type :class:`INetworkAdapter`
+
+        in change_adapter of type bool
+
+        raises :class:`VBoxErrorInvalidVmState`
+            Session state prevents operation.
+
+        raises :class:`VBoxErrorInvalidObjectState`
+            Session type prevents operation.
+
+        """
+        if not isinstance(network_adapter, _lib.INetworkAdapter):
+            raise TypeError(
+                "network_adapter can only be an instance of type INetworkAdapter"
+            )
+        if not isinstance(change_adapter, bool):
+            raise TypeError("change_adapter can only be an instance of type bool")
+        self._call("onNetworkAdapterChange", in_p=[network_adapter, change_adapter])
+
+    def on_audio_adapter_change(self, audio_adapter):
+        """Triggerd when settings of the audio adapter of the
+        associated virtual machine have changed.
+
+        in audio_adapter of type :class:`IAudioAdapter`
+
+        raises :class:`VBoxErrorInvalidVmState`
+            Session state prevents operation.
+
+        raises :class:`VBoxErrorInvalidObjectState`
+            Session type prevents operation.
+
+        """
+        if not isinstance(audio_adapter, _lib.IAudioAdapter):
+            raise TypeError(
+                "audio_adapter can only be an instance of type IAudioAdapter"
+            )
+        self._call("onAudioAdapterChange", in_p=[audio_adapter])
+
+    def on_serial_port_change(self, serial_port):
+        """Triggered when settings of a serial port of the
+        associated virtual machine have changed.
+
+        in serial_port of type :class:`ISerialPort`
+
+        raises :class:`VBoxErrorInvalidVmState`
+            Session state prevents operation.
+
+        raises :class:`VBoxErrorInvalidObjectState`
+            Session type prevents operation.
+
+        """
+        if not isinstance(serial_port, _lib.ISerialPort):
+            raise TypeError("serial_port can only be an instance of type ISerialPort")
+        self._call("onSerialPortChange", in_p=[serial_port])
+
+    def on_parallel_port_change(self, parallel_port):
+        """Triggered when settings of a parallel port of the
+        associated virtual machine have changed.
+
+        in parallel_port of type :class:`IParallelPort`
+
+        raises :class:`VBoxErrorInvalidVmState`
+            Session state prevents operation.
+
+        raises :class:`VBoxErrorInvalidObjectState`
+            Session type prevents operation.
+
+        """
+        if not isinstance(parallel_port, _lib.IParallelPort):
+            raise TypeError(
+                "parallel_port can only be an instance of type IParallelPort"
+            )
+        self._call("onParallelPortChange", in_p=[parallel_port])
+
+    def on_storage_controller_change(self, machine_id, controller_name):
+        """Triggered when settings of a storage controller of the
+        associated virtual machine have changed.
+
+        in machine_id of type str
+            The id of the machine containing the storage controller.
+
+        in controller_name of type str
+            The name of the storage controller.
+
+        raises :class:`VBoxErrorInvalidVmState`
+            Session state prevents operation.
+
+        raises :class:`VBoxErrorInvalidObjectState`
+            Session type prevents operation.
+
+        """
+        if not isinstance(machine_id, basestring):
+            raise TypeError("machine_id can only be an instance of type basestring")
+        if not isinstance(controller_name, basestring):
+            raise TypeError(
+                "controller_name can only be an instance of type basestring"
+            )
+        self._call("onStorageControllerChange", in_p=[machine_id, controller_name])
+
+    def on_medium_change(self, medium_attachment, force):
+        """Triggered when attached media of the
+        associated virtual machine have changed.
+
+        in medium_attachment of type :class:`IMediumAttachment`
+            The medium attachment which changed.
+
+        in force of type bool
+            If the medium change was forced.
+
+        raises :class:`VBoxErrorInvalidVmState`
+            Session state prevents operation.
+
+        raises :class:`VBoxErrorInvalidObjectState`
+            Session type prevents operation.
+
+        """
+        if not isinstance(medium_attachment, _lib.IMediumAttachment):
+            raise TypeError(
+                "medium_attachment can only be an instance of type IMediumAttachment"
+            )
+        if not isinstance(force, bool):
+            raise TypeError("force can only be an instance of type bool")
+        self._call("onMediumChange", in_p=[medium_attachment, force])
+
+    def on_storage_device_change(self, medium_attachment, remove, silent):
+        """Triggered when attached storage devices of the
+        associated virtual machine have changed.
+
+        in medium_attachment of type :class:`IMediumAttachment`
+            The medium attachment which changed.
+
+        in remove of type bool
+            TRUE if the device is removed, FALSE if it was added.
+
+        in silent of type bool
+            TRUE if the device is is silently reconfigured without
+            notifying the guest about it.
+
+        raises :class:`VBoxErrorInvalidVmState`
+            Session state prevents operation.
+
+        raises :class:`VBoxErrorInvalidObjectState`
+            Session type prevents operation.
+
+        """
+        if not isinstance(medium_attachment, _lib.IMediumAttachment):
+            raise TypeError(
+                "medium_attachment can only be an instance of type IMediumAttachment"
+            )
+        if not isinstance(remove, bool):
+            raise TypeError("remove can only be an instance of type bool")
+        if not isinstance(silent, bool):
+            raise TypeError("silent can only be an instance of type bool")
+        self._call("onStorageDeviceChange", in_p=[medium_attachment, remove, silent])
+
+    def on_vm_process_priority_change(self, priority):
+        """Triggered when process priority of the
+        associated virtual machine have changed.
+
+        in priority of type :class:`VMProcPriority`
+            The priority which set.
+
+        raises :class:`VBoxErrorInvalidVmState`
+            Session state prevents operation.
+
+        raises :class:`VBoxErrorInvalidObjectState`
+            Session type prevents operation.
+
+        raises :class:`VBoxErrorVmError`
+            Error from underlying level. See additional error info.
+
+        """
+        if not isinstance(priority, _lib.VMProcPriority):
+            raise TypeError("priority can only be an instance of type VMProcPriority")
+        self._call("onVMProcessPriorityChange", in_p=[priority])
+
+    def on_clipboard_mode_change(self, clipboard_mode):
+        """Notification when the shared clipboard mode changes.
+
+        in clipboard_mode of type :class:`ClipboardMode`
+            The new shared clipboard mode.
+
+        """
+        if not isinstance(clipboard_mode, _lib.ClipboardMode):
+            raise TypeError(
+                "clipboard_mode can only be an instance of type ClipboardMode"
+            )
+        self._call("onClipboardModeChange", in_p=[clipboard_mode])
+
+    def on_clipboard_file_transfer_mode_change(self, enabled):
+        """Notification when the shared clipboard file transfers mode changes.
+
+        in enabled of type bool
+            Flag whether clipboard file transfers are allowed or not.
+
+        """
+        if not isinstance(enabled, bool):
+            raise TypeError("enabled can only be an instance of type bool")
+        self._call("onClipboardFileTransferModeChange", in_p=[enabled])
+
+    def on_dn_d_mode_change(self, dnd_mode):
+        """Notification when the drag'n drop mode changes.
+
+        in dnd_mode of type :class:`DnDMode`
+            The new mode for drag'n drop.
+
+        """
+        if not isinstance(dnd_mode, _lib.DnDMode):
+            raise TypeError("dnd_mode can only be an instance of type DnDMode")
+        self._call("onDnDModeChange", in_p=[dnd_mode])
+
+    def on_cpu_change(self, cpu, add):
+        """Notification when a CPU changes.
+
+        in cpu of type int
+            The CPU which changed
+
+        in add of type bool
+            Flag whether the CPU was added or removed
+
+        """
+        if not isinstance(cpu, baseinteger):
+            raise TypeError("cpu can only be an instance of type baseinteger")
+        if not isinstance(add, bool):
+            raise TypeError("add can only be an instance of type bool")
+        self._call("onCPUChange", in_p=[cpu, add])
+
+    def on_cpu_execution_cap_change(self, execution_cap):
+        """Notification when the CPU execution cap changes.
+
+        in execution_cap of type int
+            The new CPU execution cap value. (1-100)
+
+        """
+        if not isinstance(execution_cap, baseinteger):
+            raise TypeError("execution_cap can only be an instance of type baseinteger")
+        self._call("onCPUExecutionCapChange", in_p=[execution_cap])
+
+    def on_vrde_server_change(self, restart):
+        """Triggered when settings of the VRDE server object of the
+        associated virtual machine have changed.
+
+        in restart of type bool
+            Flag whether the server must be restarted
+
+        raises :class:`VBoxErrorInvalidVmState`
+            Session state prevents operation.
+
+        raises :class:`VBoxErrorInvalidObjectState`
+            Session type prevents operation.
+
+        """
+        if not isinstance(restart, bool):
+            raise TypeError("restart can only be an instance of type bool")
+        self._call("onVRDEServerChange", in_p=[restart])
+
+    def on_recording_change(self, enable):
+        """Triggered when recording settings have changed.
+
+        in enable of type bool
+            TODO
+
+        """
+        if not isinstance(enable, bool):
+            raise TypeError("enable can only be an instance of type bool")
+        self._call("onRecordingChange", in_p=[enable])
+
+    def on_usb_controller_change(self):
+        """Triggered when settings of the USB controller object of the
+        associated virtual machine have changed.
+
+        raises :class:`VBoxErrorInvalidVmState`
+            Session state prevents operation.
+
+        raises :class:`VBoxErrorInvalidObjectState`
+            Session type prevents operation.
+
+        """
+        self._call("onUSBControllerChange")
+
+    def on_shared_folder_change(self, global_p):
+        """Triggered when a permanent (global or machine) shared folder has been
+        created or removed.
+
+        We don't pass shared folder parameters in this notification because
+        the order in which parallel notifications are delivered is not defined,
+        therefore it could happen that these parameters were outdated by the
+        time of processing this notification.
+
+        in global_p of type bool
+
+        raises :class:`VBoxErrorInvalidVmState`
+            Session state prevents operation.
+
+        raises :class:`VBoxErrorInvalidObjectState`
+            Session type prevents operation.
+
+        """
+        if not isinstance(global_p, bool):
+            raise TypeError("global_p can only be an instance of type bool")
+        self._call("onSharedFolderChange", in_p=[global_p])
+
+    def on_usb_device_attach(self, device, error, masked_interfaces, capture_filename):
+        """Triggered when a request to capture a USB device (as a result
+        of matched USB filters or direct call to
+        :py:func:`IConsole.attach_usb_device` ) has completed.
+        A @c null @a error object means success, otherwise it
+        describes a failure.
+
+        in device of type :class:`IUSBDevice`
+
+        in error of type :class:`IVirtualBoxErrorInfo`
+
+        in masked_interfaces of type int
+
+        in capture_filename of type str
+
+        raises :class:`VBoxErrorInvalidVmState`
+            Session state prevents operation.
+
+        raises :class:`VBoxErrorInvalidObjectState`
+            Session type prevents operation.
+
+        """
+        if not isinstance(device, _lib.IUSBDevice):
+            raise TypeError("device can only be an instance of type IUSBDevice")
+        if not isinstance(error, _lib.IVirtualBoxErrorInfo):
+            raise TypeError(
+                "error can only be an instance of type IVirtualBoxErrorInfo"
+            )
+        if not isinstance(masked_interfaces, baseinteger):
+            raise TypeError(
+                "masked_interfaces can only be an instance of type baseinteger"
+            )
+        if not isinstance(capture_filename, basestring):
+            raise TypeError(
+                "capture_filename can only be an instance of type basestring"
+            )
+        self._call(
+            "onUSBDeviceAttach",
+            in_p=[device, error, masked_interfaces, capture_filename],
+        )
+
+    def on_usb_device_detach(self, id_p, error):
+        """Triggered when a request to release the USB device (as a result
+        of machine termination or direct call to
+        :py:func:`IConsole.detach_usb_device` ) has completed.
+        A @c null @a error object means success, otherwise it
+        describes a failure.
+
+        in id_p of type str
+
+        in error of type :class:`IVirtualBoxErrorInfo`
+
+        raises :class:`VBoxErrorInvalidVmState`
+            Session state prevents operation.
+
+        raises :class:`VBoxErrorInvalidObjectState`
+            Session type prevents operation.
+
+        """
+        if not isinstance(id_p, basestring):
+            raise TypeError("id_p can only be an instance of type basestring")
+        if not isinstance(error, _lib.IVirtualBoxErrorInfo):
+            raise TypeError(
+                "error can only be an instance of type IVirtualBoxErrorInfo"
+            )
+        self._call("onUSBDeviceDetach", in_p=[id_p, error])
+
+    def on_show_window(self, check):
+        """Called by :py:func:`IMachine.can_show_console_window`  and by
+        :py:func:`IMachine.show_console_window`  in order to notify
+        console listeners
+        :py:class:`ICanShowWindowEvent`
+        and :py:class:`IShowWindowEvent` .
+
+        in check of type bool
+
+        out can_show of type bool
+
+        out win_id of type int
+
+        raises :class:`VBoxErrorInvalidObjectState`
+            Session type prevents operation.
+
+        """
+        if not isinstance(check, bool):
+            raise TypeError("check can only be an instance of type bool")
+        can_show, win_id = self._call("onShowWindow", in_p=[check])
+        return (can_show, win_id)
+
+    def on_bandwidth_group_change(self, bandwidth_group):
+        """Notification when one of the bandwidth groups change.
+
+        in bandwidth_group of type :class:`IBandwidthGroup`
+            The bandwidth group which changed.
+
+        """
+        if not isinstance(bandwidth_group, _lib.IBandwidthGroup):
+            raise TypeError(
+                "bandwidth_group can only be an instance of type IBandwidthGroup"
+            )
+        self._call("onBandwidthGroupChange", in_p=[bandwidth_group])
+
+    def access_guest_property(self, name, value, flags, access_mode):
+        """Called by :py:func:`IMachine.get_guest_property`  and by
+        :py:func:`IMachine.set_guest_property`  in order to read and
+        modify guest properties.
+
+        in name of type str
+            Name of guest property.
+
+        in value of type str
+            Value of guest property.
+
+        in flags of type str
+            Flags of guest property.
+
+        in access_mode of type int
+            0 = get, 1 = set, 2 = delete.
+
+        out ret_value of type str
+            When getting: Value of guest property.
+
+        out ret_timestamp of type int
+            When getting: Timestamp of guest property.
+
+        out ret_flags of type str
+            When getting: Flags of guest property.
+
+        raises :class:`VBoxErrorInvalidVmState`
+            Machine session is not open.
+
+        raises :class:`VBoxErrorInvalidObjectState`
+            Session type is not direct.
+
+        """
+        if not isinstance(name, basestring):
+            raise TypeError("name can only be an instance of type basestring")
+        if not isinstance(value, basestring):
+            raise TypeError("value can only be an instance of type basestring")
+        if not isinstance(flags, basestring):
+            raise TypeError("flags can only be an instance of type basestring")
+        if not isinstance(access_mode, baseinteger):
+            raise TypeError("access_mode can only be an instance of type baseinteger")
+        ret_value, ret_timestamp, ret_flags = self._call(
+            "accessGuestProperty", in_p=[name, value, flags, access_mode]
+        )
+        return (ret_value, ret_timestamp, ret_flags)
+
+    def enumerate_guest_properties(self, patterns):
+        """Return a list of the guest properties matching a set of patterns along
+        with their values, timestamps and flags.
+
+        in patterns of type str
+            The patterns to match the properties against as a comma-separated
+            string. If this is empty, all properties currently set will be
+            returned.
+
+        out keys of type str
+            The key names of the properties returned.
+
+        out values of type str
+            The values of the properties returned. The array entries match the
+            corresponding entries in the @a key array.
+
+        out timestamps of type int
+            The timestamps of the properties returned. The array entries match
+            the corresponding entries in the @a key array.
+
+        out flags of type str
+            The flags of the properties returned. The array entries match the
+            corresponding entries in the @a key array.
+
+        raises :class:`VBoxErrorInvalidVmState`
+            Machine session is not open.
+
+        raises :class:`VBoxErrorInvalidObjectState`
+            Session type is not direct.
+
+        """
+        if not isinstance(patterns, basestring):
+            raise TypeError("patterns can only be an instance of type basestring")
+        keys, values, timestamps, flags = self._call(
+            "enumerateGuestProperties", in_p=[patterns]
+        )
+        return (keys, values, timestamps, flags)
+
+    def online_merge_medium(self, medium_attachment, source_idx, target_idx, progress):
+        """Triggers online merging of a hard disk. Used internally when deleting
+        a snapshot while a VM referring to the same hard disk chain is running.
+
+        in medium_attachment of type :class:`IMediumAttachment`
+            The medium attachment to identify the medium chain.
+
+        in source_idx of type int
+            The index of the source image in the chain.
+            Redundant, but drastically reduces IPC.
+
+        in target_idx of type int
+            The index of the target image in the chain.
+            Redundant, but drastically reduces IPC.
+
+        in progress of type :class:`IProgress`
+            Progress object for this operation.
+
+        raises :class:`VBoxErrorInvalidVmState`
+            Machine session is not open.
+
+        raises :class:`VBoxErrorInvalidObjectState`
+            Session type is not direct.
+
+        """
+        if not isinstance(medium_attachment, _lib.IMediumAttachment):
+            raise TypeError(
+                "medium_attachment can only be an instance of type IMediumAttachment"
+            )
+        if not isinstance(source_idx, baseinteger):
+            raise TypeError("source_idx can only be an instance of type baseinteger")
+        if not isinstance(target_idx, baseinteger):
+            raise TypeError("target_idx can only be an instance of type baseinteger")
+        if not isinstance(progress, _lib.IProgress):
+            raise TypeError("progress can only be an instance of type IProgress")
+        self._call(
+            "onlineMergeMedium",
+            in_p=[medium_attachment, source_idx, target_idx, progress],
+        )
+
+    def reconfigure_medium_attachments(self, attachments):
+        """Reconfigure all specified medium attachments in one go, making sure
+        the current state corresponds to the specified medium.
+
+        in attachments of type :class:`IMediumAttachment`
+            Array containing the medium attachments which need to be
+            reconfigured.
+
+        raises :class:`VBoxErrorInvalidVmState`
+            Machine session is not open.
+
+        raises :class:`VBoxErrorInvalidObjectState`
+            Session type is not direct.
+
+        """
+        if not isinstance(attachments, list):
+            raise TypeError("attachments can only be an instance of type list")
+        for a in attachments[:10]:
+            if not isinstance(a, _lib.IMediumAttachment):
+                raise TypeError(
+                    "array can only contain objects of type IMediumAttachment"
+                )
+        self._call("reconfigureMediumAttachments", in_p=[attachments])
+
+    def enable_vmm_statistics(self, enable):
+        """Enables or disables collection of VMM RAM statistics.
+
+        in enable of type bool
+            True enables statistics collection.
+
+        raises :class:`VBoxErrorInvalidVmState`
+            Machine session is not open.
+
+        raises :class:`VBoxErrorInvalidObjectState`
+            Session type is not direct.
+
+        """
+        if not isinstance(enable, bool):
+            raise TypeError("enable can only be an instance of type bool")
+        self._call("enableVMMStatistics", in_p=[enable])
+
+    def pause_with_reason(self, reason):
+        """Internal method for triggering a VM pause with a specified reason code.
+        The reason code can be interpreted by device/drivers and thus it might
+        behave slightly differently than a normal VM pause.
+
+
+        :py:func:`IConsole.pause`
+
+        in reason of type :class:`Reason`
+            Specify the best matching reason code please.
+
+        raises :class:`VBoxErrorInvalidVmState`
+            Virtual machine not in Running state.
+
+        raises :class:`VBoxErrorVmError`
+            Virtual machine error in suspend operation.
+
+        """
+        if not isinstance(reason, _lib.Reason):
+            raise TypeError("reason can only be an instance of type Reason")
+        self._call("pauseWithReason", in_p=[reason])
+
+    def resume_with_reason(self, reason):
+        """Internal method for triggering a VM resume with a specified reason code.
+        The reason code can be interpreted by device/drivers and thus it might
+        behave slightly differently than a normal VM resume.
+
+
+        :py:func:`IConsole.resume`
+
+        in reason of type :class:`Reason`
+            Specify the best matching reason code please.
+
+        raises :class:`VBoxErrorInvalidVmState`
+            Virtual machine not in Paused state.
+
+        raises :class:`VBoxErrorVmError`
+            Virtual machine error in resume operation.
+
+        """
+        if not isinstance(reason, _lib.Reason):
+            raise TypeError("reason can only be an instance of type Reason")
+        self._call("resumeWithReason", in_p=[reason])
+
+    def save_state_with_reason(
+        self, reason, progress, snapshot, state_file_path, pause_vm
+    ):
+        """Internal method for triggering a VM save state with a specified reason
+        code. The reason code can be interpreted by device/drivers and thus it
+        might behave slightly differently than a normal VM save state.
+
+        This call is fully synchronous, and the caller is expected to have set
+        the machine state appropriately (and has to set the follow-up machine
+        state if this call failed).
+
+
+        :py:func:`IMachine.save_state`
+
+        in reason of type :class:`Reason`
+            Specify the best matching reason code please.
+
+        in progress of type :class:`IProgress`
+            Progress object to track the operation completion.
+
+        in snapshot of type :class:`ISnapshot`
+            Snapshot object for which this save state operation is executed.
+
+        in state_file_path of type str
+            File path the VM process must save the execution state to.
+
+        in pause_vm of type bool
+            The VM should be paused before saving state. It is automatically
+            unpaused on error in the "vanilla save state" case.
+
+        return left_paused of type bool
+            Returns if the VM was left in paused state, which is necessary
+            in many situations (snapshots, teleportation).
+
+        raises :class:`VBoxErrorInvalidVmState`
+            Virtual machine state is not one of the expected values.
+
+        raises :class:`VBoxErrorFileError`
+            Failed to create directory for saved state file.
+
+        """
+        if not isinstance(reason, _lib.Reason):
+            raise TypeError("reason can only be an instance of type Reason")
+        if not isinstance(progress, _lib.IProgress):
+            raise TypeError("progress can only be an instance of type IProgress")
+        if not isinstance(snapshot, _lib.ISnapshot):
+            raise TypeError("snapshot can only be an instance of type ISnapshot")
+        if not isinstance(state_file_path, basestring):
+            raise TypeError(
+                "state_file_path can only be an instance of type basestring"
+            )
+        if not isinstance(pause_vm, bool):
+            raise TypeError("pause_vm can only be an instance of type bool")
+        left_paused = self._call(
+            "saveStateWithReason",
+            in_p=[reason, progress, snapshot, state_file_path, pause_vm],
+        )
+        return left_paused
+
+    def cancel_save_state_with_reason(self):
+        """Internal method for cancelling a VM save state.
+        :py:func:`IInternalSessionControl.save_state_with_reason`
+
+        """
+        self._call("cancelSaveStateWithReason")
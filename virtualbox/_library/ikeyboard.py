@@ -0,0 +1,122 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from ..library_base import Interface
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IKeyboard(Interface):
+    """
+    The IKeyboard interface represents the virtual machine's keyboard. Used
+    in :py:func:`IConsole.keyboard` .
+
+    Use this interface to send keystrokes or the Ctrl-Alt-Del sequence
+    to the virtual machine.
+    """
+
+    __uuid__ = "755e6bdf-1640-41f9-bd74-3ef5fd653250"
+    __wsmap__ = "managed"
+
+    @property
+    def keyboard_le_ds(self):
+        """Get KeyboardLED value for 'keyboardLEDs'
+        Current status of the guest keyboard LEDs.
+        """
+        ret = self._get_attr("keyboardLEDs")
+        return [_lib.KeyboardLED(a) for a in ret]
+
+    def put_scancode(self, scancode):
+        """Sends a scancode to the keyboard.
+
+        in scancode of type int
+
+        raises :class:`VBoxErrorIprtError`
+            Could not send scan code to virtual keyboard.
+
+        """
+        if not isinstance(scancode, baseinteger):
+            raise TypeError("scancode can only be an instance of type baseinteger")
+        self._call("putScancode", in_p=[scancode])
+
+    def put_scancodes(self, scancodes):
+        """Sends an array of scancodes to the keyboard.
+
+        in scancodes of type int
+
+        return codes_stored of type int
+
+        raises :class:`VBoxErrorIprtError`
+            Could not send all scan codes to virtual keyboard.
+
+        """
+        if not isinstance(scancodes, list):
+            raise TypeError("scancodes can only be an instance of type list")
+        for a in scancodes[:10]:
+            if not isinstance(a, baseinteger):
+                raise TypeError("array can only contain objects of type baseinteger")
+        codes_stored = self._call("putScancodes", in_p=[scancodes])
+        return codes_stored
+
+    def put_cad(self):
+        """Sends the Ctrl-Alt-Del sequence to the keyboard. This
+        function is nothing special, it is just a convenience function
+        calling :py:func:`IKeyboard.put_scancodes`  with the proper scancodes.
+
+        raises :class:`VBoxErrorIprtError`
+            Could not send all scan codes to virtual keyboard.
+
+        """
+        self._call("putCAD")
+
+    def release_keys(self):
+        """Causes the virtual keyboard to release any keys which are
+        currently pressed. Useful when host and guest keyboard may be out
+        of sync.
+
+        raises :class:`VBoxErrorIprtError`
+            Could not release some or all keys.
+
+        """
+        self._call("releaseKeys")
+
+    def put_usage_code(self, usage_code, usage_page, key_release):
+        """Sends a USB HID usage code and page to the keyboard. The
+        keyRelease flag is set when the key is being released.
+
+        in usage_code of type int
+
+        in usage_page of type int
+
+        in key_release of type bool
+
+        raises :class:`VBoxErrorIprtError`
+            Could not send usage code to virtual keyboard.
+
+        """
+        if not isinstance(usage_code, baseinteger):
+            raise TypeError("usage_code can only be an instance of type baseinteger")
+        if not isinstance(usage_page, baseinteger):
+            raise TypeError("usage_page can only be an instance of type baseinteger")
+        if not isinstance(key_release, bool):
+            raise TypeError("key_release can only be an instance of type bool")
+        self._call("putUsageCode", in_p=[usage_code, usage_page, key_release])
+
+    @property
+    def event_source(self):
+        """Get IEventSource value for 'eventSource'
+        Event source for keyboard events.
+        """
+        ret = self._get_attr("eventSource")
+        return _lib.IEventSource(ret)
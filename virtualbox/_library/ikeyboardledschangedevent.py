@@ -0,0 +1,53 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from .ievent import IEvent
+from .vboxeventtype import VBoxEventType
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IKeyboardLedsChangedEvent(IEvent):
+    """
+    Notification when the guest OS executes the KBD_CMD_SET_LEDS command
+    to alter the state of the keyboard LEDs.
+    """
+
+    __uuid__ = "6DDEF35E-4737-457B-99FC-BC52C851A44F"
+    __wsmap__ = "managed"
+    id = VBoxEventType.on_keyboard_leds_changed
+
+    @property
+    def num_lock(self):
+        """Get bool value for 'numLock'
+        NumLock status.
+        """
+        ret = self._get_attr("numLock")
+        return ret
+
+    @property
+    def caps_lock(self):
+        """Get bool value for 'capsLock'
+        CapsLock status.
+        """
+        ret = self._get_attr("capsLock")
+        return ret
+
+    @property
+    def scroll_lock(self):
+        """Get bool value for 'scrollLock'
+        ScrollLock status.
+        """
+        ret = self._get_attr("scrollLock")
+        return ret
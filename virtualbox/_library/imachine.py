@@ -0,0 +1,4100 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from ..library_base import Interface
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IMachine(Interface):
+    """
+    The IMachine interface represents a virtual machine, or guest, created
+    in VirtualBox.
+
+    This interface is used in two contexts. First of all, a collection of
+    objects implementing this interface is stored in the
+    :py:func:`IVirtualBox.machines`  attribute which lists all the virtual
+    machines that are currently registered with this VirtualBox
+    installation. Also, once a session has been opened for the given virtual
+    machine (e.g. the virtual machine is running), the machine object
+    associated with the open session can be queried from the session object;
+    see :py:class:`ISession`  for details.
+
+    The main role of this interface is to expose the settings of the virtual
+    machine and provide methods to change various aspects of the virtual
+    machine's configuration. For machine objects stored in the
+    :py:func:`IVirtualBox.machines`  collection, all attributes are
+    read-only unless explicitly stated otherwise in individual attribute
+    and method descriptions.
+
+    In order to change a machine setting, a session for this machine must be
+    opened using one of the :py:func:`IMachine.lock_machine`  or
+    :py:func:`IMachine.launch_vm_process`  methods. After the
+    machine has been successfully locked for a session, a mutable machine object
+    needs to be queried from the session object and then the desired settings
+    changes can be applied to the returned object using IMachine attributes and
+    methods. See the :py:class:`ISession`  interface description for more
+    information about sessions.
+
+    Note that IMachine does not provide methods to control virtual machine
+    execution (such as start the machine, or power it down) -- these methods
+    are grouped in a separate interface called :py:class:`IConsole` .
+
+    :py:class:`ISession` , :py:class:`IConsole`
+    """
+
+    __uuid__ = "85632c68-b5bb-4316-a900-5eb28d3413df"
+    __wsmap__ = "managed"
+
+    @property
+    def parent(self):
+        """Get IVirtualBox value for 'parent'
+        Associated parent object.
+        """
+        ret = self._get_attr("parent")
+        return _lib.IVirtualBox(ret)
+
+    @property
+    def icon(self):
+        """Get or set str value for 'icon'
+        Overridden VM Icon details.
+        """
+        ret = self._get_attr("icon")
+        return ret
+
+    @icon.setter
+    def icon(self, value):
+        if not isinstance(value, basestring):
+            raise TypeError("value is not an instance of basestring")
+        return self._set_attr("icon", value)
+
+    @property
+    def accessible(self):
+        """Get bool value for 'accessible'
+        Whether this virtual machine is currently accessible or not.
+
+        A machine is always deemed accessible unless it is registered *and*
+        its settings file cannot be read or parsed (either because the file itself
+        is unavailable or has invalid XML contents).
+
+        Every time this property is read, the accessibility state of
+        this machine is re-evaluated. If the returned value is @c false,
+        the :py:func:`access_error`  property may be used to get the
+        detailed error information describing the reason of
+        inaccessibility, including XML error messages.
+
+        When the machine is inaccessible, only the following properties
+        can be used on it:
+
+        :py:func:`parent`
+        :py:func:`id_p`
+        :py:func:`settings_file_path`
+        :py:func:`accessible`
+        :py:func:`access_error`
+
+
+        An attempt to access any other property or method will return
+        an error.
+
+        The only possible action you can perform on an inaccessible
+        machine is to unregister it using the
+        :py:func:`IMachine.unregister`  call (or, to check
+        for the accessibility state once more by querying this
+        property).
+
+
+        In the current implementation, once this property returns
+        @c true, the machine will never become inaccessible
+        later, even if its settings file cannot be successfully
+        read/written any more (at least, until the VirtualBox
+        server is restarted). This limitation may be removed in
+        future releases.
+        """
+        ret = self._get_attr("accessible")
+        return ret
+
+    @property
+    def access_error(self):
+        """Get IVirtualBoxErrorInfo value for 'accessError'
+        Error information describing the reason of machine
+        inaccessibility.
+
+        Reading this property is only valid after the last call to
+        :py:func:`accessible`  returned @c false (i.e. the
+        machine is currently inaccessible). Otherwise, a @c null
+        IVirtualBoxErrorInfo object will be returned.
+        """
+        ret = self._get_attr("accessError")
+        return _lib.IVirtualBoxErrorInfo(ret)
+
+    @property
+    def name(self):
+        """Get or set str value for 'name'
+        Name of the virtual machine.
+
+        Besides being used for human-readable identification purposes
+        everywhere in VirtualBox, the virtual machine name is also used
+        as a name of the machine's settings file and as a name of the
+        subdirectory this settings file resides in. Thus, every time you
+        change the value of this property, the settings file will be
+        renamed once you call :py:func:`save_settings`  to confirm the
+        change. The containing subdirectory will be also renamed, but
+        only if it has exactly the same name as the settings file
+        itself prior to changing this property (for backward compatibility
+        with previous API releases). The above implies the following
+        limitations:
+
+        The machine name cannot be empty.
+        The machine name can contain only characters that are valid
+        file name characters according to the rules of the file
+        system used to store VirtualBox configuration.
+        You cannot have two or more machines with the same name
+        if they use the same subdirectory for storing the machine
+        settings files.
+        You cannot change the name of the machine if it is running,
+        or if any file in the directory containing the settings file
+        is being used by another running machine or by any other
+        process in the host operating system at a time when
+        :py:func:`save_settings`  is called.
+
+
+        If any of the above limitations are hit, :py:func:`save_settings`
+        will return an appropriate error message explaining the exact
+        reason and the changes you made to this machine will not be saved.
+
+        Starting with VirtualBox 4.0, a ".vbox" extension of the settings
+        file is recommended, but not enforced. (Previous versions always
+        used a generic ".xml" extension.)
+        """
+        ret = self._get_attr("name")
+        return ret
+
+    @name.setter
+    def name(self, value):
+        if not isinstance(value, basestring):
+            raise TypeError("value is not an instance of basestring")
+        return self._set_attr("name", value)
+
+    @property
+    def description(self):
+        """Get or set str value for 'description'
+        Description of the virtual machine.
+
+        The description attribute can contain any text and is
+        typically used to describe the hardware and software
+        configuration of the virtual machine in detail (i.e. network
+        settings, versions of the installed software and so on).
+        """
+        ret = self._get_attr("description")
+        return ret
+
+    @description.setter
+    def description(self, value):
+        if not isinstance(value, basestring):
+            raise TypeError("value is not an instance of basestring")
+        return self._set_attr("description", value)
+
+    @property
+    def id_p(self):
+        """Get str value for 'id'
+        UUID of the virtual machine.
+        """
+        ret = self._get_attr("id")
+        return ret
+
+    @property
+    def groups(self):
+        """Get or set str value for 'groups'
+        Array of machine group names of which this machine is a member.
+        "" and "/" are synonyms for the toplevel group. Each
+        group is only listed once, however they are listed in no particular
+        order and there is no guarantee that there are no gaps in the group
+        hierarchy (i.e. "/group",
+        "/group/subgroup/subsubgroup" is a valid result).
+        """
+        ret = self._get_attr("groups")
+        return ret
+
+    @groups.setter
+    def groups(self, value):
+        if not isinstance(value, basestring):
+            raise TypeError("value is not an instance of basestring")
+        return self._set_attr("groups", value)
+
+    @property
+    def os_type_id(self):
+        """Get or set str value for 'OSTypeId'
+        User-defined identifier of the Guest OS type.
+        You may use :py:func:`IVirtualBox.get_guest_os_type`  to obtain
+        an IGuestOSType object representing details about the given
+        Guest OS type. All Guest OS types are considered valid, even those
+        which are not known to :py:func:`IVirtualBox.get_guest_os_type` .
+
+        This value may differ from the value returned by
+        :py:func:`IGuest.os_type_id`  if Guest Additions are
+        installed to the guest OS.
+        """
+        ret = self._get_attr("OSTypeId")
+        return ret
+
+    @os_type_id.setter
+    def os_type_id(self, value):
+        if not isinstance(value, basestring):
+            raise TypeError("value is not an instance of basestring")
+        return self._set_attr("OSTypeId", value)
+
+    @property
+    def hardware_version(self):
+        """Get or set str value for 'hardwareVersion'
+        Hardware version identifier. Internal use only for now.
+        """
+        ret = self._get_attr("hardwareVersion")
+        return ret
+
+    @hardware_version.setter
+    def hardware_version(self, value):
+        if not isinstance(value, basestring):
+            raise TypeError("value is not an instance of basestring")
+        return self._set_attr("hardwareVersion", value)
+
+    @property
+    def hardware_uuid(self):
+        """Get or set str value for 'hardwareUUID'
+        The UUID presented to the guest via memory tables, hardware and guest
+        properties. For most VMs this is the same as the @a id, but for VMs
+        which have been cloned or teleported it may be the same as the source
+        VM. The latter is because the guest shouldn't notice that it was
+        cloned or teleported.
+        """
+        ret = self._get_attr("hardwareUUID")
+        return ret
+
+    @hardware_uuid.setter
+    def hardware_uuid(self, value):
+        if not isinstance(value, basestring):
+            raise TypeError("value is not an instance of basestring")
+        return self._set_attr("hardwareUUID", value)
+
+    @property
+    def cpu_count(self):
+        """Get or set int value for 'CPUCount'
+        Number of virtual CPUs in the VM.
+        """
+        ret = self._get_attr("CPUCount")
+        return ret
+
+    @cpu_count.setter
+    def cpu_count(self, value):
+        if not isinstance(value, baseinteger):
+            raise TypeError("value is not an instance of baseinteger")
+        return self._set_attr("CPUCount", value)
+
+    @property
+    def cpu_hot_plug_enabled(self):
+        """Get or set bool value for 'CPUHotPlugEnabled'
+        This setting determines whether VirtualBox allows CPU
+        hotplugging for this machine.
+        """
+        ret = self._get_attr("CPUHotPlugEnabled")
+        return ret
+
+    @cpu_hot_plug_enabled.setter
+    def cpu_hot_plug_enabled(self, value):
+        if not isinstance(value, bool):
+            raise TypeError("value is not an instance of bool")
+        return self._set_attr("CPUHotPlugEnabled", value)
+
+    @property
+    def cpu_execution_cap(self):
+        """Get or set int value for 'CPUExecutionCap'
+        Means to limit the number of CPU cycles a guest can use. The unit
+        is percentage of host CPU cycles per second. The valid range
+        is 1 - 100. 100 (the default) implies no limit.
+        """
+        ret = self._get_attr("CPUExecutionCap")
+        return ret
+
+    @cpu_execution_cap.setter
+    def cpu_execution_cap(self, value):
+        if not isinstance(value, baseinteger):
+            raise TypeError("value is not an instance of baseinteger")
+        return self._set_attr("CPUExecutionCap", value)
+
+    @property
+    def cpuid_portability_level(self):
+        """Get or set int value for 'CPUIDPortabilityLevel'
+        Virtual CPUID portability level, the higher number the fewer newer
+        or vendor specific CPU feature is reported to the guest (via the CPUID
+        instruction).  The default level of zero (0) means that all virtualized
+        features supported by the host is pass thru to the guest.  While the
+        three (3) is currently the level supressing the most features.
+
+        Exactly which of the CPUID features are left out by the VMM at which
+        level is subject to change with each major version.
+        """
+        ret = self._get_attr("CPUIDPortabilityLevel")
+        return ret
+
+    @cpuid_portability_level.setter
+    def cpuid_portability_level(self, value):
+        if not isinstance(value, baseinteger):
+            raise TypeError("value is not an instance of baseinteger")
+        return self._set_attr("CPUIDPortabilityLevel", value)
+
+    @property
+    def memory_size(self):
+        """Get or set int value for 'memorySize'
+        System memory size in megabytes.
+        """
+        ret = self._get_attr("memorySize")
+        return ret
+
+    @memory_size.setter
+    def memory_size(self, value):
+        if not isinstance(value, baseinteger):
+            raise TypeError("value is not an instance of baseinteger")
+        return self._set_attr("memorySize", value)
+
+    @property
+    def memory_balloon_size(self):
+        """Get or set int value for 'memoryBalloonSize'
+        Memory balloon size in megabytes.
+        """
+        ret = self._get_attr("memoryBalloonSize")
+        return ret
+
+    @memory_balloon_size.setter
+    def memory_balloon_size(self, value):
+        if not isinstance(value, baseinteger):
+            raise TypeError("value is not an instance of baseinteger")
+        return self._set_attr("memoryBalloonSize", value)
+
+    @property
+    def page_fusion_enabled(self):
+        """Get or set bool value for 'pageFusionEnabled'
+        This setting determines whether VirtualBox allows page
+        fusion for this machine (64-bit hosts only).
+        """
+        ret = self._get_attr("pageFusionEnabled")
+        return ret
+
+    @page_fusion_enabled.setter
+    def page_fusion_enabled(self, value):
+        if not isinstance(value, bool):
+            raise TypeError("value is not an instance of bool")
+        return self._set_attr("pageFusionEnabled", value)
+
+    @property
+    def graphics_adapter(self):
+        """Get IGraphicsAdapter value for 'graphicsAdapter'
+        Graphics adapter object.
+        """
+        ret = self._get_attr("graphicsAdapter")
+        return _lib.IGraphicsAdapter(ret)
+
+    @property
+    def bios_settings(self):
+        """Get IBIOSSettings value for 'BIOSSettings'
+        Object containing all BIOS settings.
+        """
+        ret = self._get_attr("BIOSSettings")
+        return _lib.IBIOSSettings(ret)
+
+    @property
+    def recording_settings(self):
+        """Get IRecordingSettings value for 'recordingSettings'
+        Object containing all recording settings.
+        """
+        ret = self._get_attr("recordingSettings")
+        return _lib.IRecordingSettings(ret)
+
+    @property
+    def firmware_type(self):
+        """Get or set FirmwareType value for 'firmwareType'
+        Type of firmware (such as legacy BIOS or EFI), used for initial
+        bootstrap in this VM.
+        """
+        ret = self._get_attr("firmwareType")
+        return _lib.FirmwareType(ret)
+
+    @firmware_type.setter
+    def firmware_type(self, value):
+        if not isinstance(value, _lib.FirmwareType):
+            raise TypeError("value is not an instance of FirmwareType")
+        return self._set_attr("firmwareType", value)
+
+    @property
+    def pointing_hid_type(self):
+        """Get or set PointingHIDType value for 'pointingHIDType'
+        Type of pointing HID (such as mouse or tablet) used in this VM.
+        The default is typically "PS2Mouse" but can vary depending on the
+        requirements of the guest operating system.
+        """
+        ret = self._get_attr("pointingHIDType")
+        return _lib.PointingHIDType(ret)
+
+    @pointing_hid_type.setter
+    def pointing_hid_type(self, value):
+        if not isinstance(value, _lib.PointingHIDType):
+            raise TypeError("value is not an instance of PointingHIDType")
+        return self._set_attr("pointingHIDType", value)
+
+    @property
+    def keyboard_hid_type(self):
+        """Get or set KeyboardHIDType value for 'keyboardHIDType'
+        Type of keyboard HID used in this VM.
+        The default is typically "PS2Keyboard" but can vary depending on the
+        requirements of the guest operating system.
+        """
+        ret = self._get_attr("keyboardHIDType")
+        return _lib.KeyboardHIDType(ret)
+
+    @keyboard_hid_type.setter
+    def keyboard_hid_type(self, value):
+        if not isinstance(value, _lib.KeyboardHIDType):
+            raise TypeError("value is not an instance of KeyboardHIDType")
+        return self._set_attr("keyboardHIDType", value)
+
+    @property
+    def hpet_enabled(self):
+        """Get or set bool value for 'HPETEnabled'
+        This attribute controls if High Precision Event Timer (HPET) is
+        enabled in this VM. Use this property if you want to provide guests
+        with additional time source, or if guest requires HPET to function correctly.
+        Default is false.
+        """
+        ret = self._get_attr("HPETEnabled")
+        return ret
+
+    @hpet_enabled.setter
+    def hpet_enabled(self, value):
+        if not isinstance(value, bool):
+            raise TypeError("value is not an instance of bool")
+        return self._set_attr("HPETEnabled", value)
+
+    @property
+    def chipset_type(self):
+        """Get or set ChipsetType value for 'chipsetType'
+        Chipset type used in this VM.
+        """
+        ret = self._get_attr("chipsetType")
+        return _lib.ChipsetType(ret)
+
+    @chipset_type.setter
+    def chipset_type(self, value):
+        if not isinstance(value, _lib.ChipsetType):
+            raise TypeError("value is not an instance of ChipsetType")
+        return self._set_attr("chipsetType", value)
+
+    @property
+    def snapshot_folder(self):
+        """Get or set str value for 'snapshotFolder'
+        Full path to the directory used to store snapshot data
+        (differencing media and saved state files) of this machine.
+
+        The initial value of this property is
+        <:py:func:`settings_file_path` path_to_settings_file>/<
+        :py:func:`id_p` machine_uuid
+        >.
+
+        Currently, it is an error to try to change this property on
+        a machine that has snapshots (because this would require to
+        move possibly large files to a different location).
+        A separate method will be available for this purpose later.
+
+
+        Setting this property to @c null or to an empty string will restore
+        the initial value.
+
+
+        When setting this property, the specified path can be
+        absolute (full path) or relative to the directory where the
+        :py:func:`settings_file_path` machine settings file
+        is located. When reading this property, a full path is
+        always returned.
+
+
+        The specified path may not exist, it will be created
+        when necessary.
+        """
+        ret = self._get_attr("snapshotFolder")
+        return ret
+
+    @snapshot_folder.setter
+    def snapshot_folder(self, value):
+        if not isinstance(value, basestring):
+            raise TypeError("value is not an instance of basestring")
+        return self._set_attr("snapshotFolder", value)
+
+    @property
+    def vrde_server(self):
+        """Get IVRDEServer value for 'VRDEServer'
+        VirtualBox Remote Desktop Extension (VRDE) server object.
+        """
+        ret = self._get_attr("VRDEServer")
+        return _lib.IVRDEServer(ret)
+
+    @property
+    def emulated_usb_card_reader_enabled(self):
+        """Get or set bool value for 'emulatedUSBCardReaderEnabled'"""
+        ret = self._get_attr("emulatedUSBCardReaderEnabled")
+        return ret
+
+    @emulated_usb_card_reader_enabled.setter
+    def emulated_usb_card_reader_enabled(self, value):
+        if not isinstance(value, bool):
+            raise TypeError("value is not an instance of bool")
+        return self._set_attr("emulatedUSBCardReaderEnabled", value)
+
+    @property
+    def medium_attachments(self):
+        """Get IMediumAttachment value for 'mediumAttachments'
+        Array of media attached to this machine.
+        """
+        ret = self._get_attr("mediumAttachments")
+        return [_lib.IMediumAttachment(a) for a in ret]
+
+    @property
+    def usb_controllers(self):
+        """Get IUSBController value for 'USBControllers'
+        Array of USB controllers attached to this machine.
+
+
+        If USB functionality is not available in the given edition of
+        VirtualBox, this method will set the result code to @c E_NOTIMPL.
+        """
+        ret = self._get_attr("USBControllers")
+        return [_lib.IUSBController(a) for a in ret]
+
+    @property
+    def usb_device_filters(self):
+        """Get IUSBDeviceFilters value for 'USBDeviceFilters'
+        Associated USB device filters object.
+
+
+        If USB functionality is not available in the given edition of
+        VirtualBox, this method will set the result code to @c E_NOTIMPL.
+        """
+        ret = self._get_attr("USBDeviceFilters")
+        return _lib.IUSBDeviceFilters(ret)
+
+    @property
+    def audio_adapter(self):
+        """Get IAudioAdapter value for 'audioAdapter'
+        Associated audio adapter, always present.
+        """
+        ret = self._get_attr("audioAdapter")
+        return _lib.IAudioAdapter(ret)
+
+    @property
+    def storage_controllers(self):
+        """Get IStorageController value for 'storageControllers'
+        Array of storage controllers attached to this machine.
+        """
+        ret = self._get_attr("storageControllers")
+        return [_lib.IStorageController(a) for a in ret]
+
+    @property
+    def settings_file_path(self):
+        """Get str value for 'settingsFilePath'
+        Full name of the file containing machine settings data.
+        """
+        ret = self._get_attr("settingsFilePath")
+        return ret
+
+    @property
+    def settings_aux_file_path(self):
+        """Get str value for 'settingsAuxFilePath'
+        Full name of the file containing auxiliary machine settings data.
+        """
+        ret = self._get_attr("settingsAuxFilePath")
+        return ret
+
+    @property
+    def settings_modified(self):
+        """Get bool value for 'settingsModified'
+        Whether the settings of this machine have been modified
+        (but neither yet saved nor discarded).
+
+        Reading this property is only valid on instances returned
+        by :py:func:`ISession.machine`  and on new machines
+        created by :py:func:`IVirtualBox.create_machine`  or opened
+        by :py:func:`IVirtualBox.open_machine`  but not
+        yet registered, or on unregistered machines after calling
+        :py:func:`IMachine.unregister` . For all other
+        cases, the settings can never be modified.
+
+
+        For newly created unregistered machines, the value of this
+        property is always @c true until :py:func:`save_settings`
+        is called (no matter if any machine settings have been
+        changed after the creation or not). For opened machines
+        the value is set to @c false (and then follows to normal rules).
+        """
+        ret = self._get_attr("settingsModified")
+        return ret
+
+    @property
+    def session_state(self):
+        """Get SessionState value for 'sessionState'
+        Current session state for this machine.
+        """
+        ret = self._get_attr("sessionState")
+        return _lib.SessionState(ret)
+
+    @property
+    def session_name(self):
+        """Get str value for 'sessionName'
+        Name of the session. If :py:func:`session_state`  is
+        Spawning or Locked, this attribute contains the
+        same value as passed to the
+        :py:func:`IMachine.launch_vm_process`  method in the
+        @a name parameter. If the session was established with
+        :py:func:`IMachine.lock_machine` , it is the name of the session
+        (if set, otherwise empty string). If
+        :py:func:`session_state`  is SessionClosed, the value of this
+        attribute is an empty string.
+        """
+        ret = self._get_attr("sessionName")
+        return ret
+
+    @property
+    def session_pid(self):
+        """Get int value for 'sessionPID'
+        Identifier of the session process. This attribute contains the
+        platform-dependent identifier of the process whose session was
+        used with :py:func:`IMachine.lock_machine`  call. The returned
+        value is only valid if :py:func:`session_state`  is Locked or
+        Unlocking by the time this property is read.
+        """
+        ret = self._get_attr("sessionPID")
+        return ret
+
+    @property
+    def state(self):
+        """Get MachineState value for 'state'
+        Current execution state of this machine.
+        """
+        ret = self._get_attr("state")
+        return _lib.MachineState(ret)
+
+    @property
+    def last_state_change(self):
+        """Get int value for 'lastStateChange'
+        Timestamp of the last execution state change,
+        in milliseconds since 1970-01-01 UTC.
+        """
+        ret = self._get_attr("lastStateChange")
+        return ret
+
+    @property
+    def state_file_path(self):
+        """Get str value for 'stateFilePath'
+        Full path to the file that stores the execution state of
+        the machine when it is in the :py:attr:`MachineState.saved`  state.
+
+        When the machine is not in the Saved state, this attribute is
+        an empty string.
+        """
+        ret = self._get_attr("stateFilePath")
+        return ret
+
+    @property
+    def log_folder(self):
+        """Get str value for 'logFolder'
+        Full path to the folder that stores a set of rotated log files
+        recorded during machine execution. The most recent log file is
+        named VBox.log, the previous log file is
+        named VBox.log.1 and so on (up to VBox.log.3
+        in the current version).
+        """
+        ret = self._get_attr("logFolder")
+        return ret
+
+    @property
+    def current_snapshot(self):
+        """Get ISnapshot value for 'currentSnapshot'
+        Current snapshot of this machine. This is @c null if the machine
+        currently has no snapshots. If it is not @c null, then it was
+        set by one of :py:func:`take_snapshot` , :py:func:`delete_snapshot`
+        or :py:func:`restore_snapshot` , depending on which was called last.
+        See :py:class:`ISnapshot`  for details.
+        """
+        ret = self._get_attr("currentSnapshot")
+        return _lib.ISnapshot(ret)
+
+    @property
+    def snapshot_count(self):
+        """Get int value for 'snapshotCount'
+        Number of snapshots taken on this machine. Zero means the
+        machine doesn't have any snapshots.
+        """
+        ret = self._get_attr("snapshotCount")
+        return ret
+
+    @property
+    def current_state_modified(self):
+        """Get bool value for 'currentStateModified'
+        Returns @c true if the current state of the machine is not
+        identical to the state stored in the current snapshot.
+
+        The current state is identical to the current snapshot only
+        directly after one of the following calls are made:
+
+
+        :py:func:`restore_snapshot`
+
+        :py:func:`take_snapshot`  (issued on a "powered off" or "saved"
+        machine, for which :py:func:`settings_modified`  returns @c false)
+
+
+
+        The current state remains identical until one of the following
+        happens:
+
+        settings of the machine are changed
+        the saved state is deleted
+        the current snapshot is deleted
+        an attempt to execute the machine is made
+
+
+
+        For machines that don't have snapshots, this property is
+        always @c false.
+        """
+        ret = self._get_attr("currentStateModified")
+        return ret
+
+    @property
+    def shared_folders(self):
+        """Get ISharedFolder value for 'sharedFolders'
+        Collection of shared folders for this machine (permanent shared
+        folders). These folders are shared automatically at machine startup
+        and available only to the guest OS installed within this machine.
+
+        New shared folders are added to the collection using
+        :py:func:`create_shared_folder` . Existing shared folders can be
+        removed using :py:func:`remove_shared_folder` .
+        """
+        ret = self._get_attr("sharedFolders")
+        return [_lib.ISharedFolder(a) for a in ret]
+
+    @property
+    def clipboard_mode(self):
+        """Get or set ClipboardMode value for 'clipboardMode'
+        Synchronization mode between the host OS clipboard
+        and the guest OS clipboard.
+        """
+        ret = self._get_attr("clipboardMode")
+        return _lib.ClipboardMode(ret)
+
+    @clipboard_mode.setter
+    def clipboard_mode(self, value):
+        if not isinstance(value, _lib.ClipboardMode):
+            raise TypeError("value is not an instance of ClipboardMode")
+        return self._set_attr("clipboardMode", value)
+
+    @property
+    def clipboard_file_transfers_enabled(self):
+        """Get or set bool value for 'clipboardFileTransfersEnabled'
+        Sets or retrieves whether clipboard file transfers are allowed or not.
+
+        When set to @a true, clipboard file transfers between supported
+        host and guest OSes are allowed.
+        """
+        ret = self._get_attr("clipboardFileTransfersEnabled")
+        return ret
+
+    @clipboard_file_transfers_enabled.setter
+    def clipboard_file_transfers_enabled(self, value):
+        if not isinstance(value, bool):
+            raise TypeError("value is not an instance of bool")
+        return self._set_attr("clipboardFileTransfersEnabled", value)
+
+    @property
+    def dn_d_mode(self):
+        """Get or set DnDMode value for 'dnDMode'
+        Sets or retrieves the current drag'n drop mode.
+        """
+        ret = self._get_attr("dnDMode")
+        return _lib.DnDMode(ret)
+
+    @dn_d_mode.setter
+    def dn_d_mode(self, value):
+        if not isinstance(value, _lib.DnDMode):
+            raise TypeError("value is not an instance of DnDMode")
+        return self._set_attr("dnDMode", value)
+
+    @property
+    def teleporter_enabled(self):
+        """Get or set bool value for 'teleporterEnabled'
+        When set to @a true, the virtual machine becomes a target teleporter
+        the next time it is powered on. This can only set to @a true when the
+        VM is in the @a PoweredOff or @a Aborted state.
+
+        <!-- This property is automatically set to @a false when the VM is powered
+        on. (bird: This doesn't work yet ) -->
+        """
+        ret = self._get_attr("teleporterEnabled")
+        return ret
+
+    @teleporter_enabled.setter
+    def teleporter_enabled(self, value):
+        if not isinstance(value, bool):
+            raise TypeError("value is not an instance of bool")
+        return self._set_attr("teleporterEnabled", value)
+
+    @property
+    def teleporter_port(self):
+        """Get or set int value for 'teleporterPort'
+        The TCP port the target teleporter will listen for incoming
+        teleportations on.
+
+        0 means the port is automatically selected upon power on. The actual
+        value can be read from this property while the machine is waiting for
+        incoming teleportations.
+        """
+        ret = self._get_attr("teleporterPort")
+        return ret
+
+    @teleporter_port.setter
+    def teleporter_port(self, value):
+        if not isinstance(value, baseinteger):
+            raise TypeError("value is not an instance of baseinteger")
+        return self._set_attr("teleporterPort", value)
+
+    @property
+    def teleporter_address(self):
+        """Get or set str value for 'teleporterAddress'
+        The address the target teleporter will listen on. If set to an empty
+        string, it will listen on all addresses.
+        """
+        ret = self._get_attr("teleporterAddress")
+        return ret
+
+    @teleporter_address.setter
+    def teleporter_address(self, value):
+        if not isinstance(value, basestring):
+            raise TypeError("value is not an instance of basestring")
+        return self._set_attr("teleporterAddress", value)
+
+    @property
+    def teleporter_password(self):
+        """Get or set str value for 'teleporterPassword'
+        The password to check for on the target teleporter. This is just a
+        very basic measure to prevent simple hacks and operators accidentally
+        beaming a virtual machine to the wrong place.
+
+        Note that you SET a plain text password while reading back a HASHED
+        password. Setting a hashed password is currently not supported.
+        """
+        ret = self._get_attr("teleporterPassword")
+        return ret
+
+    @teleporter_password.setter
+    def teleporter_password(self, value):
+        if not isinstance(value, basestring):
+            raise TypeError("value is not an instance of basestring")
+        return self._set_attr("teleporterPassword", value)
+
+    @property
+    def paravirt_provider(self):
+        """Get or set ParavirtProvider value for 'paravirtProvider'
+        The paravirtualized guest interface provider.
+        """
+        ret = self._get_attr("paravirtProvider")
+        return _lib.ParavirtProvider(ret)
+
+    @paravirt_provider.setter
+    def paravirt_provider(self, value):
+        if not isinstance(value, _lib.ParavirtProvider):
+            raise TypeError("value is not an instance of ParavirtProvider")
+        return self._set_attr("paravirtProvider", value)
+
+    @property
+    def rtc_use_utc(self):
+        """Get or set bool value for 'RTCUseUTC'
+        When set to @a true, the RTC device of the virtual machine will run
+        in UTC time, otherwise in local time. Especially Unix guests prefer
+        the time in UTC.
+        """
+        ret = self._get_attr("RTCUseUTC")
+        return ret
+
+    @rtc_use_utc.setter
+    def rtc_use_utc(self, value):
+        if not isinstance(value, bool):
+            raise TypeError("value is not an instance of bool")
+        return self._set_attr("RTCUseUTC", value)
+
+    @property
+    def io_cache_enabled(self):
+        """Get or set bool value for 'IOCacheEnabled'
+        When set to @a true, the builtin I/O cache of the virtual machine
+        will be enabled.
+        """
+        ret = self._get_attr("IOCacheEnabled")
+        return ret
+
+    @io_cache_enabled.setter
+    def io_cache_enabled(self, value):
+        if not isinstance(value, bool):
+            raise TypeError("value is not an instance of bool")
+        return self._set_attr("IOCacheEnabled", value)
+
+    @property
+    def io_cache_size(self):
+        """Get or set int value for 'IOCacheSize'
+        Maximum size of the I/O cache in MB.
+        """
+        ret = self._get_attr("IOCacheSize")
+        return ret
+
+    @io_cache_size.setter
+    def io_cache_size(self, value):
+        if not isinstance(value, baseinteger):
+            raise TypeError("value is not an instance of baseinteger")
+        return self._set_attr("IOCacheSize", value)
+
+    @property
+    def pci_device_assignments(self):
+        """Get IPCIDeviceAttachment value for 'PCIDeviceAssignments'
+        Array of PCI devices assigned to this machine, to get list of all
+        PCI devices attached to the machine use
+        :py:func:`IConsole.attached_pci_devices`  attribute, as this attribute
+        is intended to list only devices additional to what described in
+        virtual hardware config. Usually, this list keeps host's physical
+        devices assigned to the particular machine.
+        """
+        ret = self._get_attr("PCIDeviceAssignments")
+        return [_lib.IPCIDeviceAttachment(a) for a in ret]
+
+    @property
+    def bandwidth_control(self):
+        """Get IBandwidthControl value for 'bandwidthControl'
+        Bandwidth control manager.
+        """
+        ret = self._get_attr("bandwidthControl")
+        return _lib.IBandwidthControl(ret)
+
+    @property
+    def tracing_enabled(self):
+        """Get or set bool value for 'tracingEnabled'
+        Enables the tracing facility in the VMM (including PDM devices +
+        drivers). The VMM will consume about 0.5MB of more memory when
+        enabled and there may be some extra overhead from tracepoints that are
+        always enabled.
+        """
+        ret = self._get_attr("tracingEnabled")
+        return ret
+
+    @tracing_enabled.setter
+    def tracing_enabled(self, value):
+        if not isinstance(value, bool):
+            raise TypeError("value is not an instance of bool")
+        return self._set_attr("tracingEnabled", value)
+
+    @property
+    def tracing_config(self):
+        """Get or set str value for 'tracingConfig'
+        Tracepoint configuration to apply at startup when
+        :py:func:`IMachine.tracing_enabled`  is true. The string specifies
+        a space separated of tracepoint group names to enable. The special
+        group 'all' enables all tracepoints. Check DBGFR3TracingConfig for
+        more details on available tracepoint groups and such.
+
+        Note that on hosts supporting DTrace (or similar), a lot of the
+        tracepoints may be implemented exclusively as DTrace probes. So, the
+        effect of the same config may differ between Solaris and Windows for
+        example.
+        """
+        ret = self._get_attr("tracingConfig")
+        return ret
+
+    @tracing_config.setter
+    def tracing_config(self, value):
+        if not isinstance(value, basestring):
+            raise TypeError("value is not an instance of basestring")
+        return self._set_attr("tracingConfig", value)
+
+    @property
+    def allow_tracing_to_access_vm(self):
+        """Get or set bool value for 'allowTracingToAccessVM'
+        Enables tracepoints in PDM devices and drivers to use the VMCPU or VM
+        structures when firing off trace points. This is especially useful
+        with DTrace tracepoints, as it allows you to use the VMCPU or VM
+        pointer to obtain useful information such as guest register state.
+
+        This is disabled by default because devices and drivers normally has no
+        business accessing the VMCPU or VM structures, and are therefore unable
+        to get any pointers to these.
+        """
+        ret = self._get_attr("allowTracingToAccessVM")
+        return ret
+
+    @allow_tracing_to_access_vm.setter
+    def allow_tracing_to_access_vm(self, value):
+        if not isinstance(value, bool):
+            raise TypeError("value is not an instance of bool")
+        return self._set_attr("allowTracingToAccessVM", value)
+
+    @property
+    def autostart_enabled(self):
+        """Get or set bool value for 'autostartEnabled'
+        Enables autostart of the VM during system boot.
+        """
+        ret = self._get_attr("autostartEnabled")
+        return ret
+
+    @autostart_enabled.setter
+    def autostart_enabled(self, value):
+        if not isinstance(value, bool):
+            raise TypeError("value is not an instance of bool")
+        return self._set_attr("autostartEnabled", value)
+
+    @property
+    def autostart_delay(self):
+        """Get or set int value for 'autostartDelay'
+        Number of seconds to wait until the VM should be started during system boot.
+        """
+        ret = self._get_attr("autostartDelay")
+        return ret
+
+    @autostart_delay.setter
+    def autostart_delay(self, value):
+        if not isinstance(value, baseinteger):
+            raise TypeError("value is not an instance of baseinteger")
+        return self._set_attr("autostartDelay", value)
+
+    @property
+    def autostop_type(self):
+        """Get or set AutostopType value for 'autostopType'
+        Action type to do when the system is shutting down.
+        """
+        ret = self._get_attr("autostopType")
+        return _lib.AutostopType(ret)
+
+    @autostop_type.setter
+    def autostop_type(self, value):
+        if not isinstance(value, _lib.AutostopType):
+            raise TypeError("value is not an instance of AutostopType")
+        return self._set_attr("autostopType", value)
+
+    @property
+    def default_frontend(self):
+        """Get or set str value for 'defaultFrontend'
+        Selects which VM frontend should be used by default when launching
+        this VM through the :py:func:`IMachine.launch_vm_process`  method.
+        Empty or @c null strings do not define a particular default, it is up
+        to :py:func:`IMachine.launch_vm_process`  to select one. See the
+        description of :py:func:`IMachine.launch_vm_process`  for the valid
+        frontend types.
+
+        This per-VM setting overrides the default defined by
+        :py:func:`ISystemProperties.default_frontend`  attribute, and is
+        overridden by a frontend type passed to
+        :py:func:`IMachine.launch_vm_process` .
+        """
+        ret = self._get_attr("defaultFrontend")
+        return ret
+
+    @default_frontend.setter
+    def default_frontend(self, value):
+        if not isinstance(value, basestring):
+            raise TypeError("value is not an instance of basestring")
+        return self._set_attr("defaultFrontend", value)
+
+    @property
+    def usb_proxy_available(self):
+        """Get bool value for 'USBProxyAvailable'
+        Returns whether there is an USB proxy available.
+        """
+        ret = self._get_attr("USBProxyAvailable")
+        return ret
+
+    @property
+    def vm_process_priority(self):
+        """Get or set VMProcPriority value for 'VMProcessPriority'
+        Sets the priority of the VM process. It is a VM setting which can
+        be changed both before starting the VM and at runtime.
+
+        The default value is 'Default', which selects the default
+        process priority.
+        """
+        ret = self._get_attr("VMProcessPriority")
+        return _lib.VMProcPriority(ret)
+
+    @vm_process_priority.setter
+    def vm_process_priority(self, value):
+        if not isinstance(value, _lib.VMProcPriority):
+            raise TypeError("value is not an instance of VMProcPriority")
+        return self._set_attr("VMProcessPriority", value)
+
+    @property
+    def paravirt_debug(self):
+        """Get or set str value for 'paravirtDebug'
+        Debug parameters for the paravirtualized guest interface provider.
+        """
+        ret = self._get_attr("paravirtDebug")
+        return ret
+
+    @paravirt_debug.setter
+    def paravirt_debug(self, value):
+        if not isinstance(value, basestring):
+            raise TypeError("value is not an instance of basestring")
+        return self._set_attr("paravirtDebug", value)
+
+    @property
+    def cpu_profile(self):
+        """Get or set str value for 'CPUProfile'
+        Experimental feature to select the guest CPU profile.  The default
+        is "host", which indicates the host CPU.  All other names are subject
+        to change.
+
+        Use the :py:func:`ISystemProperties.get_cpu_profiles`  method to get
+        currently available CPU profiles.
+        """
+        ret = self._get_attr("CPUProfile")
+        return ret
+
+    @cpu_profile.setter
+    def cpu_profile(self, value):
+        if not isinstance(value, basestring):
+            raise TypeError("value is not an instance of basestring")
+        return self._set_attr("CPUProfile", value)
+
+    def lock_machine(self, session, lock_type):
+        """Locks the machine for the given session to enable the caller
+        to make changes to the machine or start the VM or control
+        VM execution.
+
+        There are two ways to lock a machine for such uses:
+
+
+        If you want to make changes to the machine settings,
+        you must obtain an exclusive write lock on the machine
+        by setting @a lockType to @c Write.
+
+        This will only succeed if no other process has locked
+        the machine to prevent conflicting changes. Only after
+        an exclusive write lock has been obtained using this method, one
+        can change all VM settings or execute the VM in the process
+        space of the session object. (Note that the latter is only of
+        interest if you actually want to write a new front-end for
+        virtual machines; but this API gets called internally by
+        the existing front-ends such as VBoxHeadless and the VirtualBox
+        GUI to acquire a write lock on the machine that they are running.)
+
+        On success, write-locking the machine for a session creates
+        a second copy of the IMachine object. It is this second object
+        upon which changes can be made; in VirtualBox terminology, the
+        second copy is "mutable". It is only this second, mutable machine
+        object upon which you can call methods that change the
+        machine state. After having called this method, you can
+        obtain this second, mutable machine object using the
+        :py:func:`ISession.machine`  attribute.
+
+        If you only want to check the machine state or control
+        machine execution without actually changing machine
+        settings (e.g. to get access to VM statistics or take
+        a snapshot or save the machine state), then set the
+        @a lockType argument to @c Shared.
+
+        If no other session has obtained a lock, you will obtain an
+        exclusive write lock as described above. However, if another
+        session has already obtained such a lock, then a link to that
+        existing session will be established which allows you
+        to control that existing session.
+
+        To find out which type of lock was obtained, you can
+        inspect :py:func:`ISession.type_p` , which will have been
+        set to either @c WriteLock or @c Shared.
+
+
+
+        In either case, you can get access to the :py:class:`IConsole`
+        object which controls VM execution.
+
+        Also in all of the above cases, one must always call
+        :py:func:`ISession.unlock_machine`  to release the lock on the machine, or
+        the machine's state will eventually be set to "Aborted".
+
+        To change settings on a machine, the following sequence is typically
+        performed:
+
+
+        Call this method to obtain an exclusive write lock for the current session.
+
+        Obtain a mutable IMachine object from :py:func:`ISession.machine` .
+
+        Change the settings of the machine by invoking IMachine methods.
+
+        Call :py:func:`IMachine.save_settings` .
+
+        Release the write lock by calling :py:func:`ISession.unlock_machine` .
+
+        in session of type :class:`ISession`
+            Session object for which the machine will be locked.
+
+        in lock_type of type :class:`LockType`
+            If set to @c Write, then attempt to acquire an exclusive write lock or fail.
+            If set to @c Shared, then either acquire an exclusive write lock or establish
+            a link to an existing session.
+
+        raises :class:`OleErrorUnexpected`
+            Virtual machine not registered.
+
+        raises :class:`OleErrorAccessdenied`
+            Process not started by
+
+        raises :class:`VBoxErrorInvalidObjectState`
+            Session already open or being opened.
+
+        raises :class:`VBoxErrorVmError`
+            Failed to assign machine to session.
+
+        """
+        if not isinstance(session, _lib.ISession):
+            raise TypeError("session can only be an instance of type ISession")
+        if not isinstance(lock_type, _lib.LockType):
+            raise TypeError("lock_type can only be an instance of type LockType")
+        self._call("lockMachine", in_p=[session, lock_type])
+
+    def launch_vm_process(self, session, name, environment_changes):
+        """Spawns a new process that will execute the virtual machine and obtains a shared
+        lock on the machine for the calling session.
+
+        If launching the VM succeeds, the new VM process will create its own session
+        and write-lock the machine for it, preventing conflicting changes from other
+        processes. If the machine is already locked (because it is already running or
+        because another session has a write lock), launching the VM process will therefore
+        fail. Reversely, future attempts to obtain a write lock will also fail while the
+        machine is running.
+
+        The caller's session object remains separate from the session opened by the new
+        VM process. It receives its own :py:class:`IConsole`  object which can be used
+        to control machine execution, but it cannot be used to change all VM settings
+        which would be available after a :py:func:`lock_machine`  call.
+
+        The caller must eventually release the session's shared lock by calling
+        :py:func:`ISession.unlock_machine`  on the local session object once this call
+        has returned. However, the session's state (see :py:func:`ISession.state` )
+        will not return to "Unlocked" until the remote session has also unlocked
+        the machine (i.e. the machine has stopped running).
+
+        Launching a VM process can take some time (a new VM is started in a new process,
+        for which memory and other resources need to be set up). Because of this,
+        an :py:class:`IProgress`  object is returned to allow the caller to wait
+        for this asynchronous operation to be completed. Until then, the caller's
+        session object remains in the "Unlocked" state, and its :py:func:`ISession.machine`
+        and :py:func:`ISession.console`  attributes cannot be accessed.
+        It is recommended to use :py:func:`IProgress.wait_for_completion`  or
+        similar calls to wait for completion. Completion is signalled when the VM
+        is powered on. If launching the VM fails, error messages can be queried
+        via the progress object, if available.
+
+        The progress object will have at least 2 sub-operations. The first
+        operation covers the period up to the new VM process calls powerUp.
+        The subsequent operations mirror the :py:func:`IConsole.power_up`
+        progress object. Because :py:func:`IConsole.power_up`  may require
+        some extra sub-operations, the :py:func:`IProgress.operation_count`
+        may change at the completion of operation.
+
+        For details on the teleportation progress operation, see
+        :py:func:`IConsole.power_up` .
+
+        The @a environmentChanges argument is a list of strings where every string contains
+        environment variable in the putenv style, i.e. "VAR=VALUE" for setting/replacing
+        and "VAR" for unsetting. These environment variables will be applied to the environment
+        of the VirtualBox server process. If an environment variable exists both in the server
+        process and in this list, the value from this list takes precedence over the
+        server's variable. If the value of the environment variable is omitted, this variable
+        will be removed from the resulting environment. If the list is empty, the server
+        environment is inherited by the started process as is.
+
+        in session of type :class:`ISession`
+            Client session object to which the VM process will be connected (this
+            must be in "Unlocked" state).
+
+        in name of type str
+            Front-end to use for the new VM process. The following are currently supported:
+
+            "gui": VirtualBox Qt GUI front-end
+            "headless": VBoxHeadless (VRDE Server) front-end
+            "sdl": VirtualBox SDL front-end
+            "emergencystop": reserved value, used for aborting
+            the currently running VM or session owner. In this case the
+            @a session parameter may be @c null (if it is non-null it isn't
+            used in any way), and the @a progress return value will be always
+            @c null. The operation completes immediately.
+            "": use the per-VM default frontend if set, otherwise
+            the global default defined in the system properties. If neither
+            are set, the API will launch a "gui" session, which may
+            fail if there is no windowing environment available. See
+            :py:func:`IMachine.default_frontend`  and
+            :py:func:`ISystemProperties.default_frontend` .
+
+        in environment_changes of type str
+            The list of putenv-style changes to the VM process environment.
+
+        return progress of type :class:`IProgress`
+            Progress object to track the operation completion.
+
+        raises :class:`OleErrorUnexpected`
+            Virtual machine not registered.
+
+        raises :class:`OleErrorInvalidarg`
+            Invalid session type @a type.
+
+        raises :class:`VBoxErrorObjectNotFound`
+            No machine matching @a machineId found.
+
+        raises :class:`VBoxErrorInvalidObjectState`
+            Session already open or being opened.
+
+        raises :class:`VBoxErrorIprtError`
+            Launching process for machine failed.
+
+        raises :class:`VBoxErrorVmError`
+            Failed to assign machine to session.
+
+        """
+        if not isinstance(session, _lib.ISession):
+            raise TypeError("session can only be an instance of type ISession")
+        if not isinstance(name, basestring):
+            raise TypeError("name can only be an instance of type basestring")
+        if not isinstance(environment_changes, list):
+            raise TypeError("environment_changes can only be an instance of type list")
+        for a in environment_changes[:10]:
+            if not isinstance(a, basestring):
+                raise TypeError("array can only contain objects of type basestring")
+        progress = self._call(
+            "launchVMProcess", in_p=[session, name, environment_changes]
+        )
+        progress = _lib.IProgress(progress)
+        return progress
+
+    def set_boot_order(self, position, device):
+        """Puts the given device to the specified position in
+        the boot order.
+
+        To indicate that no device is associated with the given position,
+        :py:attr:`DeviceType.null`  should be used.
+
+        @todo setHardDiskBootOrder(), setNetworkBootOrder()
+
+        in position of type int
+            Position in the boot order (@c 1 to the total number of
+            devices the machine can boot from, as returned by
+            :py:func:`ISystemProperties.max_boot_position` ).
+
+        in device of type :class:`DeviceType`
+            The type of the device used to boot at the given position.
+
+        raises :class:`OleErrorInvalidarg`
+            Boot @a position out of range.
+
+        raises :class:`OleErrorNotimpl`
+            Booting from USB @a device currently not supported.
+
+        """
+        if not isinstance(position, baseinteger):
+            raise TypeError("position can only be an instance of type baseinteger")
+        if not isinstance(device, _lib.DeviceType):
+            raise TypeError("device can only be an instance of type DeviceType")
+        self._call("setBootOrder", in_p=[position, device])
+
+    def get_boot_order(self, position):
+        """Returns the device type that occupies the specified
+        position in the boot order.
+
+        @todo [remove?]
+        If the machine can have more than one device of the returned type
+        (such as hard disks), then a separate method should be used to
+        retrieve the individual device that occupies the given position.
+
+        If here are no devices at the given position, then
+        :py:attr:`DeviceType.null`  is returned.
+
+        @todo getHardDiskBootOrder(), getNetworkBootOrder()
+
+        in position of type int
+            Position in the boot order (@c 1 to the total number of
+            devices the machine can boot from, as returned by
+            :py:func:`ISystemProperties.max_boot_position` ).
+
+        return device of type :class:`DeviceType`
+            Device at the given position.
+
+        raises :class:`OleErrorInvalidarg`
+            Boot @a position out of range.
+
+        """
+        if not isinstance(position, baseinteger):
+            raise TypeError("position can only be an instance of type baseinteger")
+        device = self._call("getBootOrder", in_p=[position])
+        device = _lib.DeviceType(device)
+        return device
+
+    def attach_device(self, name, controller_port, device, type_p, medium):
+        """Attaches a device and optionally mounts a medium to the given storage
+                controller (:py:class:`IStorageController` , identified by @a name),
+                at the indicated port and device.
+
+                This method is intended for managing storage devices in general while a
+                machine is powered off. It can be used to attach and detach fixed
+                and removable media. The following kind of media can be attached
+                to a machine:
+
+
+                For fixed and removable media, you can pass in a medium that was
+                previously opened using :py:func:`IVirtualBox.open_medium` .
+
+
+                Only for storage devices supporting removable media (such as
+                DVDs and floppies), you can also specify a null pointer to
+                indicate an empty drive or one of the medium objects listed
+                in the :py:func:`IHost.dvd_drives`  and :py:func:`IHost.floppy_drives`
+                arrays to indicate a host drive.
+                For removable devices, you can also use :py:func:`IMachine.mount_medium`
+                to change the media while the machine is running.
+
+
+
+                In a VM's default configuration of virtual machines, the secondary
+                master of the IDE controller is used for a CD/DVD drive.
+
+                After calling this returns successfully, a new instance of
+                :py:class:`IMediumAttachment`  will appear in the machine's list of medium
+                attachments (see :py:func:`IMachine.medium_attachments` ).
+
+                See :py:class:`IMedium`  and :py:class:`IMediumAttachment`  for more
+                information about attaching media.
+
+                The specified device slot must not have a device attached to it,
+                or this method will fail.
+
+
+                You cannot attach a device to a newly created machine until
+                this machine's settings are saved to disk using
+                :py:func:`save_settings` .
+
+
+                If the medium is being attached indirectly, a new differencing medium
+                will implicitly be created for it and attached instead. If the
+                changes made to the machine settings (including this indirect
+                attachment) are later cancelled using :py:func:`discard_settings` ,
+                this implicitly created differencing medium will implicitly
+                be deleted.
+
+                in name of type str
+                    Name of the storage controller to attach the device to.
+
+                in controller_port of type int
+                    Port to attach the device to. For an IDE controller, 0 specifies
+                    the primary controller and 1 specifies the secondary controller.
+                    For a SCSI controller, this must range from 0 to 15; for a SATA controller,
+                    from 0 to 29; for an SAS controller, from 0 to 7.
+
+                in device of type int
+                    Device slot in the given port to attach the device to. This is only
+                    relevant for IDE controllers, for which 0 specifies the master device and
+                    1 specifies the slave device. For all other controller types, this must
+                    be 0.
+
+                in type_p of type :class:`DeviceType`
+                    Device type of the attached device. For media opened by
+                    :py:func:`IVirtualBox.open_medium` , this must match the device type
+                    specified there.
+
+                in medium of type :class:`IMedium`
+                    Medium to mount or @c null for an empty drive.
+
+                raises :class:`OleErrorInvalidarg`
+                    SATA device, SATA port, IDE port or IDE slot out of range, or
+        file or UUID not found.
+
+                raises :class:`VBoxErrorInvalidObjectState`
+                    Machine must be registered before media can be attached.
+
+                raises :class:`VBoxErrorInvalidVmState`
+                    Invalid machine state.
+
+                raises :class:`VBoxErrorObjectInUse`
+                    A medium is already attached to this or another virtual machine.
+
+        """
+        if not isinstance(name, basestring):
+            raise TypeError("name can only be an instance of type basestring")
+        if not isinstance(controller_port, baseinteger):
+            raise TypeError(
+                "controller_port can only be an instance of type baseinteger"
+            )
+        if not isinstance(device, baseinteger):
+            raise TypeError("device can only be an instance of type baseinteger")
+        if not isinstance(type_p, _lib.DeviceType):
+            raise TypeError("type_p can only be an instance of type DeviceType")
+        if not isinstance(medium, _lib.IMedium):
+            raise TypeError("medium can only be an instance of type IMedium")
+        self._call("attachDevice", in_p=[name, controller_port, device, type_p, medium])
+
+    def attach_device_without_medium(self, name, controller_port, device, type_p):
+        """Attaches a device and optionally mounts a medium to the given storage
+                controller (:py:class:`IStorageController` , identified by @a name),
+                at the indicated port and device.
+
+                This method is intended for managing storage devices in general while a
+                machine is powered off. It can be used to attach and detach fixed
+                and removable media. The following kind of media can be attached
+                to a machine:
+
+
+                For fixed and removable media, you can pass in a medium that was
+                previously opened using :py:func:`IVirtualBox.open_medium` .
+
+
+                Only for storage devices supporting removable media (such as
+                DVDs and floppies) with an empty drive or one of the medium objects listed
+                in the :py:func:`IHost.dvd_drives`  and :py:func:`IHost.floppy_drives`
+                arrays to indicate a host drive.
+                For removable devices, you can also use :py:func:`IMachine.mount_medium`
+                to change the media while the machine is running.
+
+
+
+                In a VM's default configuration of virtual machines, the secondary
+                master of the IDE controller is used for a CD/DVD drive.
+                :py:class:`IMediumAttachment`  will appear in the machine's list of medium
+                attachments (see :py:func:`IMachine.medium_attachments` ).
+
+                See :py:class:`IMedium`  and :py:class:`IMediumAttachment`  for more
+                information about attaching media.
+
+                The specified device slot must not have a device attached to it,
+                or this method will fail.
+
+                You cannot attach a device to a newly created machine until
+                this machine's settings are saved to disk using
+                :py:func:`save_settings` .
+
+
+                If the medium is being attached indirectly, a new differencing medium
+                will implicitly be created for it and attached instead. If the
+                changes made to the machine settings (including this indirect
+                attachment) are later cancelled using :py:func:`discard_settings` ,
+                this implicitly created differencing medium will implicitly
+                be deleted.
+
+                in name of type str
+                    Name of the storage controller to attach the device to.
+
+                in controller_port of type int
+                    Port to attach the device to. For an IDE controller, 0 specifies
+                    the primary controller and 1 specifies the secondary controller.
+                    For a SCSI controller, this must range from 0 to 15; for a SATA controller,
+                    from 0 to 29; for an SAS controller, from 0 to 7.
+
+                in device of type int
+                    Device slot in the given port to attach the device to. This is only
+                    relevant for IDE controllers, for which 0 specifies the master device and
+                    1 specifies the slave device. For all other controller types, this must
+                    be 0.
+
+                in type_p of type :class:`DeviceType`
+                    Device type of the attached device. For media opened by
+                    :py:func:`IVirtualBox.open_medium` , this must match the device type
+                    specified there.
+
+                raises :class:`OleErrorInvalidarg`
+                    SATA device, SATA port, IDE port or IDE slot out of range, or
+        file or UUID not found.
+
+                raises :class:`VBoxErrorInvalidObjectState`
+                    Machine must be registered before media can be attached.
+
+                raises :class:`VBoxErrorInvalidVmState`
+                    Invalid machine state.
+
+                raises :class:`VBoxErrorObjectInUse`
+                    A medium is already attached to this or another virtual machine.
+
+        """
+        if not isinstance(name, basestring):
+            raise TypeError("name can only be an instance of type basestring")
+        if not isinstance(controller_port, baseinteger):
+            raise TypeError(
+                "controller_port can only be an instance of type baseinteger"
+            )
+        if not isinstance(device, baseinteger):
+            raise TypeError("device can only be an instance of type baseinteger")
+        if not isinstance(type_p, _lib.DeviceType):
+            raise TypeError("type_p can only be an instance of type DeviceType")
+        self._call(
+            "attachDeviceWithoutMedium", in_p=[name, controller_port, device, type_p]
+        )
+
+    def detach_device(self, name, controller_port, device):
+        """Detaches the device attached to a device slot of the specified bus.
+
+                Detaching the device from the virtual machine is deferred. This means
+                that the medium remains associated with the machine when this method
+                returns and gets actually de-associated only after a successful
+                :py:func:`save_settings`  call. See :py:class:`IMedium`
+                for more detailed information about attaching media.
+
+
+                You cannot detach a device from a running machine.
+
+
+                Detaching differencing media implicitly created by :py:func:`attach_device`  for the indirect attachment using this
+                method will **not** implicitly delete them. The
+                :py:func:`IMedium.delete_storage`  operation should be
+                explicitly performed by the caller after the medium is successfully
+                detached and the settings are saved with
+                :py:func:`save_settings` , if it is the desired action.
+
+                in name of type str
+                    Name of the storage controller to detach the medium from.
+
+                in controller_port of type int
+                    Port number to detach the medium from.
+
+                in device of type int
+                    Device slot number to detach the medium from.
+
+                raises :class:`VBoxErrorInvalidVmState`
+                    Attempt to detach medium from a running virtual machine.
+
+                raises :class:`VBoxErrorObjectNotFound`
+                    No medium attached to given slot/bus.
+
+                raises :class:`VBoxErrorNotSupported`
+                    Medium format does not support storage deletion (only for implicitly
+        created differencing media, should not happen).
+
+        """
+        if not isinstance(name, basestring):
+            raise TypeError("name can only be an instance of type basestring")
+        if not isinstance(controller_port, baseinteger):
+            raise TypeError(
+                "controller_port can only be an instance of type baseinteger"
+            )
+        if not isinstance(device, baseinteger):
+            raise TypeError("device can only be an instance of type baseinteger")
+        self._call("detachDevice", in_p=[name, controller_port, device])
+
+    def passthrough_device(self, name, controller_port, device, passthrough):
+        """Sets the passthrough mode of an existing DVD device. Changing the
+        setting while the VM is running is forbidden. The setting is only used
+        if at VM start the device is configured as a host DVD drive, in all
+        other cases it is ignored. The device must already exist; see
+        :py:func:`IMachine.attach_device`  for how to attach a new device.
+
+        The @a controllerPort and @a device parameters specify the device slot and
+        have have the same meaning as with :py:func:`IMachine.attach_device` .
+
+        in name of type str
+            Name of the storage controller.
+
+        in controller_port of type int
+            Storage controller port.
+
+        in device of type int
+            Device slot in the given port.
+
+        in passthrough of type bool
+            New value for the passthrough setting.
+
+        raises :class:`OleErrorInvalidarg`
+            SATA device, SATA port, IDE port or IDE slot out of range.
+
+        raises :class:`VBoxErrorInvalidObjectState`
+            Attempt to modify an unregistered virtual machine.
+
+        raises :class:`VBoxErrorInvalidVmState`
+            Invalid machine state.
+
+        """
+        if not isinstance(name, basestring):
+            raise TypeError("name can only be an instance of type basestring")
+        if not isinstance(controller_port, baseinteger):
+            raise TypeError(
+                "controller_port can only be an instance of type baseinteger"
+            )
+        if not isinstance(device, baseinteger):
+            raise TypeError("device can only be an instance of type baseinteger")
+        if not isinstance(passthrough, bool):
+            raise TypeError("passthrough can only be an instance of type bool")
+        self._call(
+            "passthroughDevice", in_p=[name, controller_port, device, passthrough]
+        )
+
+    def temporary_eject_device(self, name, controller_port, device, temporary_eject):
+        """Sets the behavior for guest-triggered medium eject. In some situations
+        it is desirable that such ejects update the VM configuration, and in
+        others the eject should keep the VM configuration. The device must
+        already exist; see :py:func:`IMachine.attach_device`  for how to
+        attach a new device.
+
+        The @a controllerPort and @a device parameters specify the device slot and
+        have have the same meaning as with :py:func:`IMachine.attach_device` .
+
+        in name of type str
+            Name of the storage controller.
+
+        in controller_port of type int
+            Storage controller port.
+
+        in device of type int
+            Device slot in the given port.
+
+        in temporary_eject of type bool
+            New value for the eject behavior.
+
+        raises :class:`OleErrorInvalidarg`
+            SATA device, SATA port, IDE port or IDE slot out of range.
+
+        raises :class:`VBoxErrorInvalidObjectState`
+            Attempt to modify an unregistered virtual machine.
+
+        raises :class:`VBoxErrorInvalidVmState`
+            Invalid machine state.
+
+        """
+        if not isinstance(name, basestring):
+            raise TypeError("name can only be an instance of type basestring")
+        if not isinstance(controller_port, baseinteger):
+            raise TypeError(
+                "controller_port can only be an instance of type baseinteger"
+            )
+        if not isinstance(device, baseinteger):
+            raise TypeError("device can only be an instance of type baseinteger")
+        if not isinstance(temporary_eject, bool):
+            raise TypeError("temporary_eject can only be an instance of type bool")
+        self._call(
+            "temporaryEjectDevice",
+            in_p=[name, controller_port, device, temporary_eject],
+        )
+
+    def non_rotational_device(self, name, controller_port, device, non_rotational):
+        """Sets a flag in the device information which indicates that the medium
+        is not based on rotational technology, i.e. that the access times are
+        more or less independent of the position on the medium. This may or may
+        not be supported by a particular drive, and is silently ignored in the
+        latter case. At the moment only hard disks (which is a misnomer in this
+        context) accept this setting. Changing the setting while the VM is
+        running is forbidden. The device must already exist; see
+        :py:func:`IMachine.attach_device`  for how to attach a new device.
+
+        The @a controllerPort and @a device parameters specify the device slot and
+        have have the same meaning as with :py:func:`IMachine.attach_device` .
+
+        in name of type str
+            Name of the storage controller.
+
+        in controller_port of type int
+            Storage controller port.
+
+        in device of type int
+            Device slot in the given port.
+
+        in non_rotational of type bool
+            New value for the non-rotational device flag.
+
+        raises :class:`OleErrorInvalidarg`
+            SATA device, SATA port, IDE port or IDE slot out of range.
+
+        raises :class:`VBoxErrorInvalidObjectState`
+            Attempt to modify an unregistered virtual machine.
+
+        raises :class:`VBoxErrorInvalidVmState`
+            Invalid machine state.
+
+        """
+        if not isinstance(name, basestring):
+            raise TypeError("name can only be an instance of type basestring")
+        if not isinstance(controller_port, baseinteger):
+            raise TypeError(
+                "controller_port can only be an instance of type baseinteger"
+            )
+        if not isinstance(device, baseinteger):
+            raise TypeError("device can only be an instance of type baseinteger")
+        if not isinstance(non_rotational, bool):
+            raise TypeError("non_rotational can only be an instance of type bool")
+        self._call(
+            "nonRotationalDevice", in_p=[name, controller_port, device, non_rotational]
+        )
+
+    def set_auto_discard_for_device(self, name, controller_port, device, discard):
+        """Sets a flag in the device information which indicates that the medium
+        supports discarding unused blocks (called trimming for SATA or unmap
+        for SCSI devices) .This may or may not be supported by a particular drive,
+        and is silently ignored in the latter case. At the moment only hard disks
+        (which is a misnomer in this context) accept this setting. Changing the
+        setting while the VM is running is forbidden. The device must already
+        exist; see :py:func:`IMachine.attach_device`  for how to attach a new
+        device.
+
+        The @a controllerPort and @a device parameters specify the device slot and
+        have have the same meaning as with :py:func:`IMachine.attach_device` .
+
+        in name of type str
+            Name of the storage controller.
+
+        in controller_port of type int
+            Storage controller port.
+
+        in device of type int
+            Device slot in the given port.
+
+        in discard of type bool
+            New value for the discard device flag.
+
+        raises :class:`OleErrorInvalidarg`
+            SATA device, SATA port, SCSI port out of range.
+
+        raises :class:`VBoxErrorInvalidObjectState`
+            Attempt to modify an unregistered virtual machine.
+
+        raises :class:`VBoxErrorInvalidVmState`
+            Invalid machine state.
+
+        """
+        if not isinstance(name, basestring):
+            raise TypeError("name can only be an instance of type basestring")
+        if not isinstance(controller_port, baseinteger):
+            raise TypeError(
+                "controller_port can only be an instance of type baseinteger"
+            )
+        if not isinstance(device, baseinteger):
+            raise TypeError("device can only be an instance of type baseinteger")
+        if not isinstance(discard, bool):
+            raise TypeError("discard can only be an instance of type bool")
+        self._call(
+            "setAutoDiscardForDevice", in_p=[name, controller_port, device, discard]
+        )
+
+    def set_hot_pluggable_for_device(
+        self, name, controller_port, device, hot_pluggable
+    ):
+        """Sets a flag in the device information which indicates that the attached
+        device is hot pluggable or not. This may or may not be supported by a
+        particular controller and/or drive, and is silently ignored in the
+        latter case. Changing the setting while the VM is running is forbidden.
+        The device must already exist; see :py:func:`IMachine.attach_device`
+        for how to attach a new device.
+
+        The @a controllerPort and @a device parameters specify the device slot and
+        have have the same meaning as with :py:func:`IMachine.attach_device` .
+
+        in name of type str
+            Name of the storage controller.
+
+        in controller_port of type int
+            Storage controller port.
+
+        in device of type int
+            Device slot in the given port.
+
+        in hot_pluggable of type bool
+            New value for the hot-pluggable device flag.
+
+        raises :class:`OleErrorInvalidarg`
+            SATA device, SATA port, IDE port or IDE slot out of range.
+
+        raises :class:`VBoxErrorInvalidObjectState`
+            Attempt to modify an unregistered virtual machine.
+
+        raises :class:`VBoxErrorInvalidVmState`
+            Invalid machine state.
+
+        raises :class:`VBoxErrorNotSupported`
+            Controller doesn't support hot plugging.
+
+        """
+        if not isinstance(name, basestring):
+            raise TypeError("name can only be an instance of type basestring")
+        if not isinstance(controller_port, baseinteger):
+            raise TypeError(
+                "controller_port can only be an instance of type baseinteger"
+            )
+        if not isinstance(device, baseinteger):
+            raise TypeError("device can only be an instance of type baseinteger")
+        if not isinstance(hot_pluggable, bool):
+            raise TypeError("hot_pluggable can only be an instance of type bool")
+        self._call(
+            "setHotPluggableForDevice",
+            in_p=[name, controller_port, device, hot_pluggable],
+        )
+
+    def set_bandwidth_group_for_device(
+        self, name, controller_port, device, bandwidth_group
+    ):
+        """Sets the bandwidth group of an existing storage device.
+        The device must already exist; see :py:func:`IMachine.attach_device`
+        for how to attach a new device.
+
+        The @a controllerPort and @a device parameters specify the device slot and
+        have have the same meaning as with :py:func:`IMachine.attach_device` .
+
+        in name of type str
+            Name of the storage controller.
+
+        in controller_port of type int
+            Storage controller port.
+
+        in device of type int
+            Device slot in the given port.
+
+        in bandwidth_group of type :class:`IBandwidthGroup`
+            New value for the bandwidth group or @c null for no group.
+
+        raises :class:`OleErrorInvalidarg`
+            SATA device, SATA port, IDE port or IDE slot out of range.
+
+        raises :class:`VBoxErrorInvalidObjectState`
+            Attempt to modify an unregistered virtual machine.
+
+        raises :class:`VBoxErrorInvalidVmState`
+            Invalid machine state.
+
+        """
+        if not isinstance(name, basestring):
+            raise TypeError("name can only be an instance of type basestring")
+        if not isinstance(controller_port, baseinteger):
+            raise TypeError(
+                "controller_port can only be an instance of type baseinteger"
+            )
+        if not isinstance(device, baseinteger):
+            raise TypeError("device can only be an instance of type baseinteger")
+        if not isinstance(bandwidth_group, _lib.IBandwidthGroup):
+            raise TypeError(
+                "bandwidth_group can only be an instance of type IBandwidthGroup"
+            )
+        self._call(
+            "setBandwidthGroupForDevice",
+            in_p=[name, controller_port, device, bandwidth_group],
+        )
+
+    def set_no_bandwidth_group_for_device(self, name, controller_port, device):
+        """Sets no bandwidth group for an existing storage device.
+        The device must already exist; see :py:func:`IMachine.attach_device`
+        for how to attach a new device.
+        The @a controllerPort and @a device parameters specify the device slot and
+        have have the same meaning as with :py:func:`IMachine.attach_device` .
+
+        in name of type str
+            Name of the storage controller.
+
+        in controller_port of type int
+            Storage controller port.
+
+        in device of type int
+            Device slot in the given port.
+
+        raises :class:`OleErrorInvalidarg`
+            SATA device, SATA port, IDE port or IDE slot out of range.
+
+        raises :class:`VBoxErrorInvalidObjectState`
+            Attempt to modify an unregistered virtual machine.
+
+        raises :class:`VBoxErrorInvalidVmState`
+            Invalid machine state.
+
+        """
+        if not isinstance(name, basestring):
+            raise TypeError("name can only be an instance of type basestring")
+        if not isinstance(controller_port, baseinteger):
+            raise TypeError(
+                "controller_port can only be an instance of type baseinteger"
+            )
+        if not isinstance(device, baseinteger):
+            raise TypeError("device can only be an instance of type baseinteger")
+        self._call("setNoBandwidthGroupForDevice", in_p=[name, controller_port, device])
+
+    def unmount_medium(self, name, controller_port, device, force):
+        """Unmounts any currently mounted medium (:py:class:`IMedium` ,
+        identified by the given UUID @a id) to the given storage controller
+        (:py:class:`IStorageController` , identified by @a name),
+        at the indicated port and device. The device must already exist;
+
+        This method is intended only for managing removable media, where the
+        device is fixed but media is changeable at runtime (such as DVDs
+        and floppies). It cannot be used for fixed media such as hard disks.
+
+        The @a controllerPort and @a device parameters specify the device slot
+        and have have the same meaning as with
+        :py:func:`IMachine.attach_device` .
+
+        The specified device slot must have a medium mounted, which will be
+        unmounted. If there is no mounted medium it will do nothing.
+        See :py:class:`IMedium`  for more detailed information about
+        attaching/unmounting media.
+
+        in name of type str
+            Name of the storage controller to unmount the medium from.
+
+        in controller_port of type int
+            Port to unmount the medium from.
+
+        in device of type int
+            Device slot in the given port to unmount the medium from.
+
+        in force of type bool
+            Allows to force unmount of a medium which is locked by
+            the device slot in the given port medium is attached to.
+
+        raises :class:`OleErrorInvalidarg`
+            SATA device, SATA port, IDE port or IDE slot out of range.
+
+        raises :class:`VBoxErrorInvalidObjectState`
+            Attempt to unmount medium that is not removable - not DVD or floppy.
+
+        raises :class:`VBoxErrorInvalidVmState`
+            Invalid machine state.
+
+        raises :class:`VBoxErrorObjectInUse`
+            Medium already attached to this or another virtual machine.
+
+        raises :class:`VBoxErrorObjectNotFound`
+            Medium not attached to specified port, device, controller.
+
+        """
+        if not isinstance(name, basestring):
+            raise TypeError("name can only be an instance of type basestring")
+        if not isinstance(controller_port, baseinteger):
+            raise TypeError(
+                "controller_port can only be an instance of type baseinteger"
+            )
+        if not isinstance(device, baseinteger):
+            raise TypeError("device can only be an instance of type baseinteger")
+        if not isinstance(force, bool):
+            raise TypeError("force can only be an instance of type bool")
+        self._call("unmountMedium", in_p=[name, controller_port, device, force])
+
+    def mount_medium(self, name, controller_port, device, medium, force):
+        """Mounts a medium (:py:class:`IMedium` , identified
+        by the given UUID @a id) to the given storage controller
+        (:py:class:`IStorageController` , identified by @a name),
+        at the indicated port and device. The device must already exist;
+        see :py:func:`IMachine.attach_device`  for how to attach a new device.
+
+        This method is intended only for managing removable media, where the
+        device is fixed but media is changeable at runtime (such as DVDs
+        and floppies). It cannot be used for fixed media such as hard disks.
+
+        The @a controllerPort and @a device parameters specify the device slot and
+        have have the same meaning as with :py:func:`IMachine.attach_device` .
+
+        The specified device slot can have a medium mounted, which will be
+        unmounted first. Specifying a zero UUID (or an empty string) for
+        @a medium does just an unmount.
+
+        See :py:class:`IMedium`  for more detailed information about
+        attaching media.
+
+        in name of type str
+            Name of the storage controller to attach the medium to.
+
+        in controller_port of type int
+            Port to attach the medium to.
+
+        in device of type int
+            Device slot in the given port to attach the medium to.
+
+        in medium of type :class:`IMedium`
+            Medium to mount or @c null for an empty drive.
+
+        in force of type bool
+            Allows to force unmount/mount of a medium which is locked by
+            the device slot in the given port to attach the medium to.
+
+        raises :class:`OleErrorInvalidarg`
+            SATA device, SATA port, IDE port or IDE slot out of range.
+
+        raises :class:`VBoxErrorInvalidObjectState`
+            Attempt to attach medium to an unregistered virtual machine.
+
+        raises :class:`VBoxErrorInvalidVmState`
+            Invalid machine state.
+
+        raises :class:`VBoxErrorObjectInUse`
+            Medium already attached to this or another virtual machine.
+
+        """
+        if not isinstance(name, basestring):
+            raise TypeError("name can only be an instance of type basestring")
+        if not isinstance(controller_port, baseinteger):
+            raise TypeError(
+                "controller_port can only be an instance of type baseinteger"
+            )
+        if not isinstance(device, baseinteger):
+            raise TypeError("device can only be an instance of type baseinteger")
+        if not isinstance(medium, _lib.IMedium):
+            raise TypeError("medium can only be an instance of type IMedium")
+        if not isinstance(force, bool):
+            raise TypeError("force can only be an instance of type bool")
+        self._call("mountMedium", in_p=[name, controller_port, device, medium, force])
+
+    def get_medium(self, name, controller_port, device):
+        """Returns the virtual medium attached to a device slot of the specified
+        bus.
+
+        Note that if the medium was indirectly attached by
+        :py:func:`mount_medium`  to the given device slot then this
+        method will return not the same object as passed to the
+        :py:func:`mount_medium`  call. See :py:class:`IMedium`  for
+        more detailed information about mounting a medium.
+
+        in name of type str
+            Name of the storage controller the medium is attached to.
+
+        in controller_port of type int
+            Port to query.
+
+        in device of type int
+            Device slot in the given port to query.
+
+        return medium of type :class:`IMedium`
+            Attached medium object.
+
+        raises :class:`VBoxErrorObjectNotFound`
+            No medium attached to given slot/bus.
+
+        """
+        if not isinstance(name, basestring):
+            raise TypeError("name can only be an instance of type basestring")
+        if not isinstance(controller_port, baseinteger):
+            raise TypeError(
+                "controller_port can only be an instance of type baseinteger"
+            )
+        if not isinstance(device, baseinteger):
+            raise TypeError("device can only be an instance of type baseinteger")
+        medium = self._call("getMedium", in_p=[name, controller_port, device])
+        medium = _lib.IMedium(medium)
+        return medium
+
+    def get_medium_attachments_of_controller(self, name):
+        """Returns an array of medium attachments which are attached to the
+        the controller with the given name.
+
+        in name of type str
+
+        return medium_attachments of type :class:`IMediumAttachment`
+
+        raises :class:`VBoxErrorObjectNotFound`
+            A storage controller with given name doesn't exist.
+
+        """
+        if not isinstance(name, basestring):
+            raise TypeError("name can only be an instance of type basestring")
+        medium_attachments = self._call("getMediumAttachmentsOfController", in_p=[name])
+        medium_attachments = [_lib.IMediumAttachment(a) for a in medium_attachments]
+        return medium_attachments
+
+    def get_medium_attachment(self, name, controller_port, device):
+        """Returns a medium attachment which corresponds to the controller with
+        the given name, on the given port and device slot.
+
+        in name of type str
+
+        in controller_port of type int
+
+        in device of type int
+
+        return attachment of type :class:`IMediumAttachment`
+
+        raises :class:`VBoxErrorObjectNotFound`
+            No attachment exists for the given controller/port/device combination.
+
+        """
+        if not isinstance(name, basestring):
+            raise TypeError("name can only be an instance of type basestring")
+        if not isinstance(controller_port, baseinteger):
+            raise TypeError(
+                "controller_port can only be an instance of type baseinteger"
+            )
+        if not isinstance(device, baseinteger):
+            raise TypeError("device can only be an instance of type baseinteger")
+        attachment = self._call(
+            "getMediumAttachment", in_p=[name, controller_port, device]
+        )
+        attachment = _lib.IMediumAttachment(attachment)
+        return attachment
+
+    def attach_host_pci_device(
+        self, host_address, desired_guest_address, try_to_unbind
+    ):
+        """Attaches host PCI device with the given (host) PCI address to the
+        PCI bus of the virtual machine. Please note, that this operation
+        is two phase, as real attachment will happen when VM will start,
+        and most information will be delivered as IHostPCIDevicePlugEvent
+        on IVirtualBox event source.
+
+        :py:class:`IHostPCIDevicePlugEvent`
+
+        in host_address of type int
+            Address of the host PCI device.
+
+        in desired_guest_address of type int
+            Desired position of this device on guest PCI bus.
+
+        in try_to_unbind of type bool
+            If VMM shall try to unbind existing drivers from the
+            device before attaching it to the guest.
+
+        raises :class:`VBoxErrorInvalidVmState`
+            Virtual machine state is not stopped (PCI hotplug not yet implemented).
+
+        raises :class:`VBoxErrorPdmError`
+            Virtual machine does not have a PCI controller allowing attachment of physical devices.
+
+        raises :class:`VBoxErrorNotSupported`
+            Hardware or host OS doesn't allow PCI device passthrough.
+
+        """
+        if not isinstance(host_address, baseinteger):
+            raise TypeError("host_address can only be an instance of type baseinteger")
+        if not isinstance(desired_guest_address, baseinteger):
+            raise TypeError(
+                "desired_guest_address can only be an instance of type baseinteger"
+            )
+        if not isinstance(try_to_unbind, bool):
+            raise TypeError("try_to_unbind can only be an instance of type bool")
+        self._call(
+            "attachHostPCIDevice",
+            in_p=[host_address, desired_guest_address, try_to_unbind],
+        )
+
+    def detach_host_pci_device(self, host_address):
+        """Detach host PCI device from the virtual machine.
+        Also HostPCIDevicePlugEvent on IVirtualBox event source
+        will be delivered. As currently we don't support hot device
+        unplug, IHostPCIDevicePlugEvent event is delivered immediately.
+
+        :py:class:`IHostPCIDevicePlugEvent`
+
+        in host_address of type int
+            Address of the host PCI device.
+
+        raises :class:`VBoxErrorInvalidVmState`
+            Virtual machine state is not stopped (PCI hotplug not yet implemented).
+
+        raises :class:`VBoxErrorObjectNotFound`
+            This host device is not attached to this machine.
+
+        raises :class:`VBoxErrorPdmError`
+            Virtual machine does not have a PCI controller allowing attachment of physical devices.
+
+        raises :class:`VBoxErrorNotSupported`
+            Hardware or host OS doesn't allow PCI device passthrough.
+
+        """
+        if not isinstance(host_address, baseinteger):
+            raise TypeError("host_address can only be an instance of type baseinteger")
+        self._call("detachHostPCIDevice", in_p=[host_address])
+
+    def get_network_adapter(self, slot):
+        """Returns the network adapter associated with the given slot.
+        Slots are numbered sequentially, starting with zero. The total
+        number of adapters per machine is defined by the
+        :py:func:`ISystemProperties.get_max_network_adapters`  property,
+        so the maximum slot number is one less than that property's value.
+
+        in slot of type int
+
+        return adapter of type :class:`INetworkAdapter`
+
+        raises :class:`OleErrorInvalidarg`
+            Invalid @a slot number.
+
+        """
+        if not isinstance(slot, baseinteger):
+            raise TypeError("slot can only be an instance of type baseinteger")
+        adapter = self._call("getNetworkAdapter", in_p=[slot])
+        adapter = _lib.INetworkAdapter(adapter)
+        return adapter
+
+    def add_storage_controller(self, name, connection_type):
+        """Adds a new storage controller (SCSI, SAS or SATA controller) to the
+        machine and returns it as an instance of
+        :py:class:`IStorageController` .
+
+        @a name identifies the controller for subsequent calls such as
+        :py:func:`get_storage_controller_by_name` ,
+        :py:func:`get_storage_controller_by_instance` ,
+        :py:func:`remove_storage_controller` ,
+        :py:func:`attach_device`  or :py:func:`mount_medium` .
+
+        After the controller has been added, you can set its exact
+        type by setting the :py:func:`IStorageController.controller_type` .
+
+        in name of type str
+
+        in connection_type of type :class:`StorageBus`
+
+        return controller of type :class:`IStorageController`
+
+        raises :class:`VBoxErrorObjectInUse`
+            A storage controller with given name exists already.
+
+        raises :class:`OleErrorInvalidarg`
+            Invalid @a controllerType.
+
+        """
+        if not isinstance(name, basestring):
+            raise TypeError("name can only be an instance of type basestring")
+        if not isinstance(connection_type, _lib.StorageBus):
+            raise TypeError(
+                "connection_type can only be an instance of type StorageBus"
+            )
+        controller = self._call("addStorageController", in_p=[name, connection_type])
+        controller = _lib.IStorageController(controller)
+        return controller
+
+    def get_storage_controller_by_name(self, name):
+        """Returns a storage controller with the given name.
+
+        in name of type str
+
+        return storage_controller of type :class:`IStorageController`
+
+        raises :class:`VBoxErrorObjectNotFound`
+            A storage controller with given name doesn't exist.
+
+        """
+        if not isinstance(name, basestring):
+            raise TypeError("name can only be an instance of type basestring")
+        storage_controller = self._call("getStorageControllerByName", in_p=[name])
+        storage_controller = _lib.IStorageController(storage_controller)
+        return storage_controller
+
+    def get_storage_controller_by_instance(self, connection_type, instance):
+        """Returns a storage controller of a specific storage bus
+        with the given instance number.
+
+        in connection_type of type :class:`StorageBus`
+
+        in instance of type int
+
+        return storage_controller of type :class:`IStorageController`
+
+        raises :class:`VBoxErrorObjectNotFound`
+            A storage controller with given instance number doesn't exist.
+
+        """
+        if not isinstance(connection_type, _lib.StorageBus):
+            raise TypeError(
+                "connection_type can only be an instance of type StorageBus"
+            )
+        if not isinstance(instance, baseinteger):
+            raise TypeError("instance can only be an instance of type baseinteger")
+        storage_controller = self._call(
+            "getStorageControllerByInstance", in_p=[connection_type, instance]
+        )
+        storage_controller = _lib.IStorageController(storage_controller)
+        return storage_controller
+
+    def remove_storage_controller(self, name):
+        """Removes a storage controller from the machine with all devices attached to it.
+
+                in name of type str
+
+                raises :class:`VBoxErrorObjectNotFound`
+                    A storage controller with given name doesn't exist.
+
+                raises :class:`VBoxErrorNotSupported`
+                    Medium format does not support storage deletion (only for implicitly
+        created differencing media, should not happen).
+
+        """
+        if not isinstance(name, basestring):
+            raise TypeError("name can only be an instance of type basestring")
+        self._call("removeStorageController", in_p=[name])
+
+    def set_storage_controller_bootable(self, name, bootable):
+        """Sets the bootable flag of the storage controller with the given name.
+
+        in name of type str
+
+        in bootable of type bool
+
+        raises :class:`VBoxErrorObjectNotFound`
+            A storage controller with given name doesn't exist.
+
+        raises :class:`VBoxErrorObjectInUse`
+            Another storage controller is marked as bootable already.
+
+        """
+        if not isinstance(name, basestring):
+            raise TypeError("name can only be an instance of type basestring")
+        if not isinstance(bootable, bool):
+            raise TypeError("bootable can only be an instance of type bool")
+        self._call("setStorageControllerBootable", in_p=[name, bootable])
+
+    def add_usb_controller(self, name, type_p):
+        """Adds a new USB controller to the machine and returns it as an instance of
+        :py:class:`IUSBController` .
+
+        in name of type str
+
+        in type_p of type :class:`USBControllerType`
+
+        return controller of type :class:`IUSBController`
+
+        raises :class:`VBoxErrorObjectInUse`
+            A USB controller with given type exists already.
+
+        raises :class:`OleErrorInvalidarg`
+            Invalid @a controllerType.
+
+        """
+        if not isinstance(name, basestring):
+            raise TypeError("name can only be an instance of type basestring")
+        if not isinstance(type_p, _lib.USBControllerType):
+            raise TypeError("type_p can only be an instance of type USBControllerType")
+        controller = self._call("addUSBController", in_p=[name, type_p])
+        controller = _lib.IUSBController(controller)
+        return controller
+
+    def remove_usb_controller(self, name):
+        """Removes a USB controller from the machine.
+
+        in name of type str
+
+        raises :class:`VBoxErrorObjectNotFound`
+            A USB controller with given type doesn't exist.
+
+        """
+        if not isinstance(name, basestring):
+            raise TypeError("name can only be an instance of type basestring")
+        self._call("removeUSBController", in_p=[name])
+
+    def get_usb_controller_by_name(self, name):
+        """Returns a USB controller with the given type.
+
+        in name of type str
+
+        return controller of type :class:`IUSBController`
+
+        raises :class:`VBoxErrorObjectNotFound`
+            A USB controller with given name doesn't exist.
+
+        """
+        if not isinstance(name, basestring):
+            raise TypeError("name can only be an instance of type basestring")
+        controller = self._call("getUSBControllerByName", in_p=[name])
+        controller = _lib.IUSBController(controller)
+        return controller
+
+    def get_usb_controller_count_by_type(self, type_p):
+        """Returns the number of USB controllers of the given type attached to the VM.
+
+        in type_p of type :class:`USBControllerType`
+
+        return controllers of type int
+
+        """
+        if not isinstance(type_p, _lib.USBControllerType):
+            raise TypeError("type_p can only be an instance of type USBControllerType")
+        controllers = self._call("getUSBControllerCountByType", in_p=[type_p])
+        return controllers
+
+    def get_serial_port(self, slot):
+        """Returns the serial port associated with the given slot.
+        Slots are numbered sequentially, starting with zero. The total
+        number of serial ports per machine is defined by the
+        :py:func:`ISystemProperties.serial_port_count`  property,
+        so the maximum slot number is one less than that property's value.
+
+        in slot of type int
+
+        return port of type :class:`ISerialPort`
+
+        raises :class:`OleErrorInvalidarg`
+            Invalid @a slot number.
+
+        """
+        if not isinstance(slot, baseinteger):
+            raise TypeError("slot can only be an instance of type baseinteger")
+        port = self._call("getSerialPort", in_p=[slot])
+        port = _lib.ISerialPort(port)
+        return port
+
+    def get_parallel_port(self, slot):
+        """Returns the parallel port associated with the given slot.
+        Slots are numbered sequentially, starting with zero. The total
+        number of parallel ports per machine is defined by the
+        :py:func:`ISystemProperties.parallel_port_count`  property,
+        so the maximum slot number is one less than that property's value.
+
+        in slot of type int
+
+        return port of type :class:`IParallelPort`
+
+        raises :class:`OleErrorInvalidarg`
+            Invalid @a slot number.
+
+        """
+        if not isinstance(slot, baseinteger):
+            raise TypeError("slot can only be an instance of type baseinteger")
+        port = self._call("getParallelPort", in_p=[slot])
+        port = _lib.IParallelPort(port)
+        return port
+
+    def get_extra_data_keys(self):
+        """Returns an array representing the machine-specific extra data keys
+        which currently have values defined.
+
+        return keys of type str
+            Array of extra data keys.
+
+        """
+        keys = self._call("getExtraDataKeys")
+        return keys
+
+    def get_extra_data(self, key):
+        """Returns associated machine-specific extra data.
+
+        If the requested data @a key does not exist, this function will
+        succeed and return an empty string in the @a value argument.
+
+        in key of type str
+            Name of the data key to get.
+
+        return value of type str
+            Value of the requested data key.
+
+        raises :class:`VBoxErrorFileError`
+            Settings file not accessible.
+
+        raises :class:`VBoxErrorXmlError`
+            Could not parse the settings file.
+
+        """
+        if not isinstance(key, basestring):
+            raise TypeError("key can only be an instance of type basestring")
+        value = self._call("getExtraData", in_p=[key])
+        return value
+
+    def set_extra_data(self, key, value):
+        """Sets associated machine-specific extra data.
+
+        If you pass @c null or an empty string as a key @a value, the given
+        @a key will be deleted.
+
+
+        Key must contain printable (non-control) UTF-8 characters only.
+
+
+        Before performing the actual data change, this method will ask all
+        registered event listeners using the
+        :py:class:`IExtraDataCanChangeEvent`
+        notification for a permission. If one of the listeners refuses the
+        new value, the change will not be performed.
+
+
+        On success, the
+        :py:class:`IExtraDataChangedEvent`  notification
+        is called to inform all registered listeners about a successful data
+        change.
+
+
+        This method can be called outside the machine session and therefore
+        it's a caller's responsibility to handle possible race conditions
+        when several clients change the same key at the same time.
+
+        in key of type str
+            Name of the data key to set.
+
+        in value of type str
+            Value to assign to the key.
+
+        raises :class:`VBoxErrorFileError`
+            Settings file not accessible.
+
+        raises :class:`VBoxErrorXmlError`
+            Could not parse the settings file.
+
+        raises :class:`OleErrorInvalidarg`
+            Key contains invalid characters.
+
+        """
+        if not isinstance(key, basestring):
+            raise TypeError("key can only be an instance of type basestring")
+        if not isinstance(value, basestring):
+            raise TypeError("value can only be an instance of type basestring")
+        self._call("setExtraData", in_p=[key, value])
+
+    def get_cpu_property(self, property_p):
+        """Returns the virtual CPU boolean value of the specified property.
+
+        in property_p of type :class:`CPUPropertyType`
+            Property type to query.
+
+        return value of type bool
+            Property value.
+
+        raises :class:`OleErrorInvalidarg`
+            Invalid property.
+
+        """
+        if not isinstance(property_p, _lib.CPUPropertyType):
+            raise TypeError(
+                "property_p can only be an instance of type CPUPropertyType"
+            )
+        value = self._call("getCPUProperty", in_p=[property_p])
+        return value
+
+    def set_cpu_property(self, property_p, value):
+        """Sets the virtual CPU boolean value of the specified property.
+
+        in property_p of type :class:`CPUPropertyType`
+            Property type to query.
+
+        in value of type bool
+            Property value.
+
+        raises :class:`OleErrorInvalidarg`
+            Invalid property.
+
+        """
+        if not isinstance(property_p, _lib.CPUPropertyType):
+            raise TypeError(
+                "property_p can only be an instance of type CPUPropertyType"
+            )
+        if not isinstance(value, bool):
+            raise TypeError("value can only be an instance of type bool")
+        self._call("setCPUProperty", in_p=[property_p, value])
+
+    def get_cpuid_leaf_by_ordinal(self, ordinal):
+        """Used to enumerate CPUID information override values.
+
+        in ordinal of type int
+            The ordinal number of the leaf to get.
+
+        out idx of type int
+            CPUID leaf index.
+
+        out idx_sub of type int
+            CPUID leaf sub-index.
+
+        out val_eax of type int
+            CPUID leaf value for register eax.
+
+        out val_ebx of type int
+            CPUID leaf value for register ebx.
+
+        out val_ecx of type int
+            CPUID leaf value for register ecx.
+
+        out val_edx of type int
+            CPUID leaf value for register edx.
+
+        raises :class:`OleErrorInvalidarg`
+            Invalid ordinal number is out of range.
+
+        """
+        if not isinstance(ordinal, baseinteger):
+            raise TypeError("ordinal can only be an instance of type baseinteger")
+        idx, idx_sub, val_eax, val_ebx, val_ecx, val_edx = self._call(
+            "getCPUIDLeafByOrdinal", in_p=[ordinal]
+        )
+        return (idx, idx_sub, val_eax, val_ebx, val_ecx, val_edx)
+
+    def get_cpuid_leaf(self, idx, idx_sub):
+        """Returns the virtual CPU cpuid information for the specified leaf.
+
+        Currently supported index values for cpuid:
+        Standard CPUID leaves: 0 - 0x1f
+        Extended CPUID leaves: 0x80000000 - 0x8000001f
+        VIA CPUID leaves:      0xc0000000 - 0xc000000f
+
+        See the Intel, AMD and VIA programmer's manuals for detailed information
+        about the CPUID instruction and its leaves.
+
+        in idx of type int
+            CPUID leaf index.
+
+        in idx_sub of type int
+            CPUID leaf sub-index (ECX).  Set to 0xffffffff (or 0) if not applicable.
+
+        out val_eax of type int
+            CPUID leaf value for register eax.
+
+        out val_ebx of type int
+            CPUID leaf value for register ebx.
+
+        out val_ecx of type int
+            CPUID leaf value for register ecx.
+
+        out val_edx of type int
+            CPUID leaf value for register edx.
+
+        raises :class:`OleErrorInvalidarg`
+            Invalid index.
+
+        """
+        if not isinstance(idx, baseinteger):
+            raise TypeError("idx can only be an instance of type baseinteger")
+        if not isinstance(idx_sub, baseinteger):
+            raise TypeError("idx_sub can only be an instance of type baseinteger")
+        val_eax, val_ebx, val_ecx, val_edx = self._call(
+            "getCPUIDLeaf", in_p=[idx, idx_sub]
+        )
+        return (val_eax, val_ebx, val_ecx, val_edx)
+
+    def set_cpuid_leaf(self, idx, idx_sub, val_eax, val_ebx, val_ecx, val_edx):
+        """Sets the virtual CPU cpuid information for the specified leaf. Note that these values
+        are not passed unmodified. VirtualBox clears features that it doesn't support.
+
+        Currently supported index values for cpuid:
+        Standard CPUID leaves: 0 - 0x1f
+        Extended CPUID leaves: 0x80000000 - 0x8000001f
+        VIA CPUID leaves:      0xc0000000 - 0xc000000f
+
+        The subleaf index is only applicable to certain leaves (see manuals as this is
+        subject to change).
+
+        See the Intel, AMD and VIA programmer's manuals for detailed information
+        about the cpuid instruction and its leaves.
+
+        Do not use this method unless you know exactly what you're doing. Misuse can lead to
+        random crashes inside VMs.
+
+        in idx of type int
+            CPUID leaf index.
+
+        in idx_sub of type int
+            CPUID leaf sub-index (ECX).  Set to 0xffffffff (or 0) if not applicable.
+            The 0xffffffff causes it to remove all other subleaves before adding one
+            with sub-index 0.
+
+        in val_eax of type int
+            CPUID leaf value for register eax.
+
+        in val_ebx of type int
+            CPUID leaf value for register ebx.
+
+        in val_ecx of type int
+            CPUID leaf value for register ecx.
+
+        in val_edx of type int
+            CPUID leaf value for register edx.
+
+        raises :class:`OleErrorInvalidarg`
+            Invalid index.
+
+        """
+        if not isinstance(idx, baseinteger):
+            raise TypeError("idx can only be an instance of type baseinteger")
+        if not isinstance(idx_sub, baseinteger):
+            raise TypeError("idx_sub can only be an instance of type baseinteger")
+        if not isinstance(val_eax, baseinteger):
+            raise TypeError("val_eax can only be an instance of type baseinteger")
+        if not isinstance(val_ebx, baseinteger):
+            raise TypeError("val_ebx can only be an instance of type baseinteger")
+        if not isinstance(val_ecx, baseinteger):
+            raise TypeError("val_ecx can only be an instance of type baseinteger")
+        if not isinstance(val_edx, baseinteger):
+            raise TypeError("val_edx can only be an instance of type baseinteger")
+        self._call(
+            "setCPUIDLeaf", in_p=[idx, idx_sub, val_eax, val_ebx, val_ecx, val_edx]
+        )
+
+    def remove_cpuid_leaf(self, idx, idx_sub):
+        """Removes the virtual CPU cpuid leaf for the specified index
+
+        in idx of type int
+            CPUID leaf index.
+
+        in idx_sub of type int
+            CPUID leaf sub-index (ECX).  Set to 0xffffffff (or 0) if not applicable.
+            The 0xffffffff value works like a wildcard.
+
+        raises :class:`OleErrorInvalidarg`
+            Invalid index.
+
+        """
+        if not isinstance(idx, baseinteger):
+            raise TypeError("idx can only be an instance of type baseinteger")
+        if not isinstance(idx_sub, baseinteger):
+            raise TypeError("idx_sub can only be an instance of type baseinteger")
+        self._call("removeCPUIDLeaf", in_p=[idx, idx_sub])
+
+    def remove_all_cpuid_leaves(self):
+        """Removes all the virtual CPU cpuid leaves"""
+        self._call("removeAllCPUIDLeaves")
+
+    def get_hw_virt_ex_property(self, property_p):
+        """Returns the value of the specified hardware virtualization boolean property.
+
+        in property_p of type :class:`HWVirtExPropertyType`
+            Property type to query.
+
+        return value of type bool
+            Property value.
+
+        raises :class:`OleErrorInvalidarg`
+            Invalid property.
+
+        """
+        if not isinstance(property_p, _lib.HWVirtExPropertyType):
+            raise TypeError(
+                "property_p can only be an instance of type HWVirtExPropertyType"
+            )
+        value = self._call("getHWVirtExProperty", in_p=[property_p])
+        return value
+
+    def set_hw_virt_ex_property(self, property_p, value):
+        """Sets a new value for the specified hardware virtualization boolean property.
+
+        in property_p of type :class:`HWVirtExPropertyType`
+            Property type to set.
+
+        in value of type bool
+            New property value.
+
+        raises :class:`OleErrorInvalidarg`
+            Invalid property.
+
+        """
+        if not isinstance(property_p, _lib.HWVirtExPropertyType):
+            raise TypeError(
+                "property_p can only be an instance of type HWVirtExPropertyType"
+            )
+        if not isinstance(value, bool):
+            raise TypeError("value can only be an instance of type bool")
+        self._call("setHWVirtExProperty", in_p=[property_p, value])
+
+    def set_settings_file_path(self, settings_file_path):
+        """Currently, it is an error to change this property on any machine.
+        Later this will allow setting a new path for the settings file, with
+        automatic relocation of all files (including snapshots and disk images)
+        which are inside the base directory. This operation is only allowed
+        when there are no pending unsaved settings.
+
+
+        Setting this property to @c null or to an empty string is forbidden.
+        When setting this property, the specified path must be absolute.
+        The specified path may not exist, it will be created when necessary.
+
+        in settings_file_path of type str
+            New settings file path, will be used to determine the new
+            location for the attached media if it is in the same directory or
+            below as the original settings file.
+
+        return progress of type :class:`IProgress`
+            Progress object to track the operation completion.
+
+        raises :class:`OleErrorNotimpl`
+            The operation is not implemented yet.
+
+        """
+        if not isinstance(settings_file_path, basestring):
+            raise TypeError(
+                "settings_file_path can only be an instance of type basestring"
+            )
+        progress = self._call("setSettingsFilePath", in_p=[settings_file_path])
+        progress = _lib.IProgress(progress)
+        return progress
+
+    def save_settings(self):
+        """Saves any changes to machine settings made since the session
+        has been opened or a new machine has been created, or since the
+        last call to :py:func:`save_settings`  or :py:func:`discard_settings` .
+        For registered machines, new settings become visible to all
+        other VirtualBox clients after successful invocation of this
+        method.
+
+        The method sends :py:class:`IMachineDataChangedEvent`
+        notification event after the configuration has been successfully
+        saved (only for registered machines).
+
+
+        Calling this method is only valid on instances returned
+        by :py:func:`ISession.machine`  and on new machines
+        created by :py:func:`IVirtualBox.create_machine`  but not
+        yet registered, or on unregistered machines after calling
+        :py:func:`IMachine.unregister` .
+
+        raises :class:`VBoxErrorFileError`
+            Settings file not accessible.
+
+        raises :class:`VBoxErrorXmlError`
+            Could not parse the settings file.
+
+        raises :class:`OleErrorAccessdenied`
+            Modification request refused.
+
+        """
+        self._call("saveSettings")
+
+    def discard_settings(self):
+        """Discards any changes to the machine settings made since the session
+        has been opened or since the last call to :py:func:`save_settings`
+        or :py:func:`discard_settings` .
+
+        Calling this method is only valid on instances returned
+        by :py:func:`ISession.machine`  and on new machines
+        created by :py:func:`IVirtualBox.create_machine`  or
+        opened by :py:func:`IVirtualBox.open_machine`  but not
+        yet registered, or on unregistered machines after calling
+        :py:func:`IMachine.unregister` .
+
+        raises :class:`VBoxErrorInvalidVmState`
+            Virtual machine is not mutable.
+
+        """
+        self._call("discardSettings")
+
+    def unregister(self, cleanup_mode):
+        """Unregisters a machine previously registered with
+        :py:func:`IVirtualBox.register_machine`  and optionally do additional
+        cleanup before the machine is unregistered.
+
+        This method does not delete any files. It only changes the machine configuration and
+        the list of registered machines in the VirtualBox object. To delete the files which
+        belonged to the machine, including the XML file of the machine itself, call
+        :py:func:`delete_config` , optionally with the array of IMedium objects which was returned
+        from this method.
+
+        How thoroughly this method cleans up the machine configuration before unregistering
+        the machine depends on the @a cleanupMode argument.
+
+
+        With "UnregisterOnly", the machine will only be unregistered, but no additional
+        cleanup will be performed. The call will fail if the machine is in "Saved" state
+        or has any snapshots or any media attached (see :py:class:`IMediumAttachment` ).
+        It is the responsibility of the caller to delete all such configuration in this mode.
+        In this mode, the API behaves like the former @c IVirtualBox::unregisterMachine() API
+        which it replaces.
+        With "DetachAllReturnNone", the call will succeed even if the machine is in "Saved"
+        state or if it has snapshots or media attached. All media attached to the current machine
+        state or in snapshots will be detached. No medium objects will be returned;
+        all of the machine's media will remain open.
+        With "DetachAllReturnHardDisksOnly", the call will behave like with "DetachAllReturnNone",
+        except that all the hard disk medium objects which were detached from the machine will
+        be returned as an array. This allows for quickly passing them to the :py:func:`delete_config`
+        API for closing and deletion.
+        With "Full", the call will behave like with "DetachAllReturnHardDisksOnly", except
+        that all media will be returned in the array, including removable media like DVDs and
+        floppies. This might be useful if the user wants to inspect in detail which media were
+        attached to the machine. Be careful when passing the media array to :py:func:`delete_config`
+        in that case because users will typically want to preserve ISO and RAW image files.
+
+
+        A typical implementation will use "DetachAllReturnHardDisksOnly" and then pass the
+        resulting IMedium array to :py:func:`delete_config` . This way, the machine is completely
+        deleted with all its saved states and hard disk images, but images for removable
+        drives (such as ISO and RAW files) will remain on disk.
+
+        This API does not verify whether the media files returned in the array are still
+        attached to other machines (i.e. shared between several machines). If such a shared
+        image is passed to :py:func:`delete_config`  however, closing the image will fail there
+        and the image will be silently skipped.
+
+        This API may, however, move media from this machine's media registry to other media
+        registries (see :py:class:`IMedium`  for details on media registries). For machines
+        created with VirtualBox 4.0 or later, if media from this machine's media registry
+        are also attached to another machine (shared attachments), each such medium will be
+        moved to another machine's registry. This is because without this machine's media
+        registry, the other machine cannot find its media any more and would become inaccessible.
+
+        This API implicitly calls :py:func:`save_settings`  to save all current machine settings
+        before unregistering it. It may also silently call :py:func:`save_settings`  on other machines
+        if media are moved to other machines' media registries.
+
+        After successful method invocation, the :py:class:`IMachineRegisteredEvent`  event
+        is fired.
+
+        The call will fail if the machine is currently locked (see :py:class:`ISession` ).
+
+
+        If the given machine is inaccessible (see :py:func:`accessible` ), it
+        will be unregistered and fully uninitialized right afterwards. As a result,
+        the returned machine object will be unusable and an attempt to call
+        **any** method will return the "Object not ready" error.
+
+        in cleanup_mode of type :class:`CleanupMode`
+            How to clean up after the machine has been unregistered.
+
+        return media of type :class:`IMedium`
+            List of media detached from the machine, depending on the @a cleanupMode parameter.
+
+        raises :class:`VBoxErrorInvalidObjectState`
+            Machine is currently locked for a session.
+
+        """
+        if not isinstance(cleanup_mode, _lib.CleanupMode):
+            raise TypeError("cleanup_mode can only be an instance of type CleanupMode")
+        media = self._call("unregister", in_p=[cleanup_mode])
+        media = [_lib.IMedium(a) for a in media]
+        return media
+
+    def delete_config(self, media):
+        """Deletes the files associated with this machine from disk. If medium objects are passed
+        in with the @a aMedia argument, they are closed and, if closing was successful, their
+        storage files are deleted as well. For convenience, this array of media files can be
+        the same as the one returned from a previous :py:func:`unregister`  call.
+
+        This method must only be called on machines which are either write-locked (i.e. on instances
+        returned by :py:func:`ISession.machine` ) or on unregistered machines (i.e. not yet
+        registered machines created by :py:func:`IVirtualBox.create_machine`  or opened by
+        :py:func:`IVirtualBox.open_machine` , or after having called :py:func:`unregister` ).
+
+        The following files will be deleted by this method:
+
+        If :py:func:`unregister`  had been previously called with a @a cleanupMode
+        argument other than "UnregisterOnly", this will delete all saved state files that
+        the machine had in use; possibly one if the machine was in "Saved" state and one
+        for each online snapshot that the machine had.
+        On each medium object passed in the @a aMedia array, this will call
+        :py:func:`IMedium.close` . If that succeeds, this will attempt to delete the
+        medium's storage on disk. Since the :py:func:`IMedium.close`  call will fail if the medium is still
+        in use, e.g. because it is still attached to a second machine; in that case the
+        storage will not be deleted.
+        Finally, the machine's own XML file will be deleted.
+
+
+        Since deleting large disk image files can be a time-consuming I/O operation, this
+        method operates asynchronously and returns an IProgress object to allow the caller
+        to monitor the progress. There will be one sub-operation for each file that is
+        being deleted (saved state or medium storage file).
+
+
+        :py:func:`settings_modified`  will return @c true after this
+        method successfully returns.
+
+        in media of type :class:`IMedium`
+            List of media to be closed and whose storage files will be deleted.
+
+        return progress of type :class:`IProgress`
+            Progress object to track the operation completion.
+
+        raises :class:`VBoxErrorInvalidVmState`
+            Machine is registered but not write-locked.
+
+        raises :class:`VBoxErrorIprtError`
+            Could not delete the settings file.
+
+        """
+        if not isinstance(media, list):
+            raise TypeError("media can only be an instance of type list")
+        for a in media[:10]:
+            if not isinstance(a, _lib.IMedium):
+                raise TypeError("array can only contain objects of type IMedium")
+        progress = self._call("deleteConfig", in_p=[media])
+        progress = _lib.IProgress(progress)
+        return progress
+
+    def export_to(self, appliance, location):
+        """Exports the machine to an OVF appliance. See :py:class:`IAppliance`  for the
+        steps required to export VirtualBox machines to OVF.
+
+        in appliance of type :class:`IAppliance`
+            Appliance to export this machine to.
+
+        in location of type str
+            The target location.
+
+        return description of type :class:`IVirtualSystemDescription`
+            VirtualSystemDescription object which is created for this machine.
+
+        """
+        if not isinstance(appliance, _lib.IAppliance):
+            raise TypeError("appliance can only be an instance of type IAppliance")
+        if not isinstance(location, basestring):
+            raise TypeError("location can only be an instance of type basestring")
+        description = self._call("exportTo", in_p=[appliance, location])
+        description = _lib.IVirtualSystemDescription(description)
+        return description
+
+    def find_snapshot(self, name_or_id):
+        """Returns a snapshot of this machine with the given name or UUID.
+
+        Returns a snapshot of this machine with the given UUID.
+        A @c null argument can be used to obtain the first snapshot
+        taken on this machine. To traverse the whole tree of snapshots
+        starting from the root, inspect the root snapshot's
+        :py:func:`ISnapshot.children`  attribute and recurse over those children.
+
+        in name_or_id of type str
+            What to search for. Name or UUID of the snapshot to find
+
+        return snapshot of type :class:`ISnapshot`
+            Snapshot object with the given name.
+
+        raises :class:`VBoxErrorObjectNotFound`
+            Virtual machine has no snapshots or snapshot not found.
+
+        """
+        if not isinstance(name_or_id, basestring):
+            raise TypeError("name_or_id can only be an instance of type basestring")
+        snapshot = self._call("findSnapshot", in_p=[name_or_id])
+        snapshot = _lib.ISnapshot(snapshot)
+        return snapshot
+
+    def create_shared_folder(
+        self, name, host_path, writable, automount, auto_mount_point
+    ):
+        """Creates a new permanent shared folder by associating the given logical
+        name with the given host path, adds it to the collection of shared
+        folders and starts sharing it. Refer to the description of
+        :py:class:`ISharedFolder`  to read more about logical names.
+
+        in name of type str
+            Unique logical name of the shared folder.
+
+        in host_path of type str
+            Full path to the shared folder in the host file system.
+
+        in writable of type bool
+            Whether the share is writable or read-only.
+
+        in automount of type bool
+            Whether the share gets automatically mounted by the guest
+            or not.
+
+        in auto_mount_point of type str
+            Where the guest should automatically mount the folder, if possible.
+            For Windows and OS/2 guests this should be a drive letter, while other
+            guests it should be a absolute directory.
+
+        raises :class:`VBoxErrorObjectInUse`
+            Shared folder already exists.
+
+        raises :class:`VBoxErrorFileError`
+            Shared folder @a hostPath not accessible.
+
+        """
+        if not isinstance(name, basestring):
+            raise TypeError("name can only be an instance of type basestring")
+        if not isinstance(host_path, basestring):
+            raise TypeError("host_path can only be an instance of type basestring")
+        if not isinstance(writable, bool):
+            raise TypeError("writable can only be an instance of type bool")
+        if not isinstance(automount, bool):
+            raise TypeError("automount can only be an instance of type bool")
+        if not isinstance(auto_mount_point, basestring):
+            raise TypeError(
+                "auto_mount_point can only be an instance of type basestring"
+            )
+        self._call(
+            "createSharedFolder",
+            in_p=[name, host_path, writable, automount, auto_mount_point],
+        )
+
+    def remove_shared_folder(self, name):
+        """Removes the permanent shared folder with the given name previously
+        created by :py:func:`create_shared_folder`  from the collection of
+        shared folders and stops sharing it.
+
+        in name of type str
+            Logical name of the shared folder to remove.
+
+        raises :class:`VBoxErrorInvalidVmState`
+            Virtual machine is not mutable.
+
+        raises :class:`VBoxErrorObjectNotFound`
+            Shared folder @a name does not exist.
+
+        """
+        if not isinstance(name, basestring):
+            raise TypeError("name can only be an instance of type basestring")
+        self._call("removeSharedFolder", in_p=[name])
+
+    def can_show_console_window(self):
+        """Returns @c true if the VM console process can activate the
+        console window and bring it to foreground on the desktop of
+        the host PC.
+
+        This method will fail if a session for this machine is not
+        currently open.
+
+        return can_show of type bool
+            @c true if the console window can be shown and @c false otherwise.
+
+        raises :class:`VBoxErrorInvalidVmState`
+            Machine session is not open.
+
+        """
+        can_show = self._call("canShowConsoleWindow")
+        return can_show
+
+    def show_console_window(self):
+        """Activates the console window and brings it to foreground on
+        the desktop of the host PC. Many modern window managers on
+        many platforms implement some sort of focus stealing
+        prevention logic, so that it may be impossible to activate
+        a window without the help of the currently active
+        application. In this case, this method will return a non-zero
+        identifier that represents the top-level window of the VM
+        console process. The caller, if it represents a currently
+        active process, is responsible to use this identifier (in a
+        platform-dependent manner) to perform actual window
+        activation.
+
+        This method will fail if a session for this machine is not
+        currently open.
+
+        return win_id of type int
+            Platform-dependent identifier of the top-level VM console
+            window, or zero if this method has performed all actions
+            necessary to implement the *show window* semantics for
+            the given platform and/or VirtualBox front-end.
+
+        raises :class:`VBoxErrorInvalidVmState`
+            Machine session is not open.
+
+        """
+        win_id = self._call("showConsoleWindow")
+        return win_id
+
+    def get_guest_property(self, name):
+        """Reads an entry from the machine's guest property store.
+
+        in name of type str
+            The name of the property to read.
+
+        out value of type str
+            The value of the property. If the property does not exist then this
+            will be empty.
+
+        out timestamp of type int
+            The time at which the property was last modified, as seen by the
+            server process.
+
+        out flags of type str
+            Additional property parameters, passed as a comma-separated list of
+            "name=value" type entries.
+
+        raises :class:`VBoxErrorInvalidVmState`
+            Machine session is not open.
+
+        """
+        if not isinstance(name, basestring):
+            raise TypeError("name can only be an instance of type basestring")
+        value, timestamp, flags = self._call("getGuestProperty", in_p=[name])
+        return (value, timestamp, flags)
+
+    def get_guest_property_value(self, property_p):
+        """Reads a value from the machine's guest property store.
+
+        in property_p of type str
+            The name of the property to read.
+
+        return value of type str
+            The value of the property. If the property does not exist then this
+            will be empty.
+
+        raises :class:`VBoxErrorInvalidVmState`
+            Machine session is not open.
+
+        """
+        if not isinstance(property_p, basestring):
+            raise TypeError("property_p can only be an instance of type basestring")
+        value = self._call("getGuestPropertyValue", in_p=[property_p])
+        return value
+
+    def get_guest_property_timestamp(self, property_p):
+        """Reads a property timestamp from the machine's guest property store.
+
+        in property_p of type str
+            The name of the property to read.
+
+        return value of type int
+            The timestamp. If the property does not exist then this will be
+            empty.
+
+        raises :class:`VBoxErrorInvalidVmState`
+            Machine session is not open.
+
+        """
+        if not isinstance(property_p, basestring):
+            raise TypeError("property_p can only be an instance of type basestring")
+        value = self._call("getGuestPropertyTimestamp", in_p=[property_p])
+        return value
+
+    def set_guest_property(self, property_p, value, flags):
+        """Sets, changes or deletes an entry in the machine's guest property
+        store.
+
+        in property_p of type str
+            The name of the property to set, change or delete.
+
+        in value of type str
+            The new value of the property to set, change or delete. If the
+            property does not yet exist and value is non-empty, it will be
+            created. If the value is @c null or empty, the property will be
+            deleted if it exists.
+
+        in flags of type str
+            Additional property parameters, passed as a comma-separated list of
+            "name=value" type entries.
+
+        raises :class:`OleErrorAccessdenied`
+            Property cannot be changed.
+
+        raises :class:`OleErrorInvalidarg`
+            Invalid @a flags.
+
+        raises :class:`VBoxErrorInvalidVmState`
+            Virtual machine is not mutable or session not open.
+
+        raises :class:`VBoxErrorInvalidObjectState`
+            Cannot set transient property when machine not running.
+
+        """
+        if not isinstance(property_p, basestring):
+            raise TypeError("property_p can only be an instance of type basestring")
+        if not isinstance(value, basestring):
+            raise TypeError("value can only be an instance of type basestring")
+        if not isinstance(flags, basestring):
+            raise TypeError("flags can only be an instance of type basestring")
+        self._call("setGuestProperty", in_p=[property_p, value, flags])
+
+    def set_guest_property_value(self, property_p, value):
+        """Sets or changes a value in the machine's guest property
+        store. The flags field will be left unchanged or created empty for a
+        new property.
+
+        in property_p of type str
+            The name of the property to set or change.
+
+        in value of type str
+            The new value of the property to set or change. If the
+            property does not yet exist and value is non-empty, it will be
+            created.
+
+        raises :class:`OleErrorAccessdenied`
+            Property cannot be changed.
+
+        raises :class:`VBoxErrorInvalidVmState`
+            Virtual machine is not mutable or session not open.
+
+        raises :class:`VBoxErrorInvalidObjectState`
+            Cannot set transient property when machine not running.
+
+        """
+        if not isinstance(property_p, basestring):
+            raise TypeError("property_p can only be an instance of type basestring")
+        if not isinstance(value, basestring):
+            raise TypeError("value can only be an instance of type basestring")
+        self._call("setGuestPropertyValue", in_p=[property_p, value])
+
+    def delete_guest_property(self, name):
+        """Deletes an entry from the machine's guest property store.
+
+        in name of type str
+            The name of the property to delete.
+
+        raises :class:`VBoxErrorInvalidVmState`
+            Machine session is not open.
+
+        """
+        if not isinstance(name, basestring):
+            raise TypeError("name can only be an instance of type basestring")
+        self._call("deleteGuestProperty", in_p=[name])
+
+    def enumerate_guest_properties(self, patterns):
+        """Return a list of the guest properties matching a set of patterns along
+        with their values, timestamps and flags.
+
+        in patterns of type str
+            The patterns to match the properties against, separated by '|'
+            characters. If this is empty or @c null, all properties will match.
+
+        out names of type str
+            The names of the properties returned.
+
+        out values of type str
+            The values of the properties returned. The array entries match the
+            corresponding entries in the @a name array.
+
+        out timestamps of type int
+            The timestamps of the properties returned. The array entries match
+            the corresponding entries in the @a name array.
+
+        out flags of type str
+            The flags of the properties returned. The array entries match the
+            corresponding entries in the @a name array.
+
+        """
+        if not isinstance(patterns, basestring):
+            raise TypeError("patterns can only be an instance of type basestring")
+        names, values, timestamps, flags = self._call(
+            "enumerateGuestProperties", in_p=[patterns]
+        )
+        return (names, values, timestamps, flags)
+
+    def query_saved_guest_screen_info(self, screen_id):
+        """Returns the guest dimensions from the saved state.
+
+        in screen_id of type int
+            Saved guest screen to query info from.
+
+        out origin_x of type int
+            The X position of the guest monitor top left corner.
+
+        out origin_y of type int
+            The Y position of the guest monitor top left corner.
+
+        out width of type int
+            Guest width at the time of the saved state was taken.
+
+        out height of type int
+            Guest height at the time of the saved state was taken.
+
+        out enabled of type bool
+            Whether the monitor is enabled in the guest.
+
+        """
+        if not isinstance(screen_id, baseinteger):
+            raise TypeError("screen_id can only be an instance of type baseinteger")
+        origin_x, origin_y, width, height, enabled = self._call(
+            "querySavedGuestScreenInfo", in_p=[screen_id]
+        )
+        return (origin_x, origin_y, width, height, enabled)
+
+    def read_saved_thumbnail_to_array(self, screen_id, bitmap_format):
+        """Thumbnail is retrieved to an array of bytes in the requested format.
+
+        in screen_id of type int
+            Saved guest screen to read from.
+
+        in bitmap_format of type :class:`BitmapFormat`
+            The requested format.
+
+        out width of type int
+            Bitmap width.
+
+        out height of type int
+            Bitmap height.
+
+        return data of type str
+            Array with resulting bitmap data.
+
+        """
+        if not isinstance(screen_id, baseinteger):
+            raise TypeError("screen_id can only be an instance of type baseinteger")
+        if not isinstance(bitmap_format, _lib.BitmapFormat):
+            raise TypeError(
+                "bitmap_format can only be an instance of type BitmapFormat"
+            )
+        data, width, height = self._call(
+            "readSavedThumbnailToArray", in_p=[screen_id, bitmap_format]
+        )
+        return (data, width, height)
+
+    def query_saved_screenshot_info(self, screen_id):
+        """Returns available formats and size of the screenshot from saved state.
+
+        in screen_id of type int
+            Saved guest screen to query info from.
+
+        out width of type int
+            Image width.
+
+        out height of type int
+            Image height.
+
+        return bitmap_formats of type :class:`BitmapFormat`
+            Formats supported by readSavedScreenshotToArray.
+
+        """
+        if not isinstance(screen_id, baseinteger):
+            raise TypeError("screen_id can only be an instance of type baseinteger")
+        bitmap_formats, width, height = self._call(
+            "querySavedScreenshotInfo", in_p=[screen_id]
+        )
+        bitmap_formats = [_lib.BitmapFormat(a) for a in bitmap_formats]
+        return (bitmap_formats, width, height)
+
+    def read_saved_screenshot_to_array(self, screen_id, bitmap_format):
+        """Screenshot in requested format is retrieved to an array of bytes.
+
+        in screen_id of type int
+            Saved guest screen to read from.
+
+        in bitmap_format of type :class:`BitmapFormat`
+            The requested format.
+
+        out width of type int
+            Image width.
+
+        out height of type int
+            Image height.
+
+        return data of type str
+            Array with resulting image data.
+
+        """
+        if not isinstance(screen_id, baseinteger):
+            raise TypeError("screen_id can only be an instance of type baseinteger")
+        if not isinstance(bitmap_format, _lib.BitmapFormat):
+            raise TypeError(
+                "bitmap_format can only be an instance of type BitmapFormat"
+            )
+        data, width, height = self._call(
+            "readSavedScreenshotToArray", in_p=[screen_id, bitmap_format]
+        )
+        return (data, width, height)
+
+    def hot_plug_cpu(self, cpu):
+        """Plugs a CPU into the machine.
+
+        in cpu of type int
+            The CPU id to insert.
+
+        """
+        if not isinstance(cpu, baseinteger):
+            raise TypeError("cpu can only be an instance of type baseinteger")
+        self._call("hotPlugCPU", in_p=[cpu])
+
+    def hot_unplug_cpu(self, cpu):
+        """Removes a CPU from the machine.
+
+        in cpu of type int
+            The CPU id to remove.
+
+        """
+        if not isinstance(cpu, baseinteger):
+            raise TypeError("cpu can only be an instance of type baseinteger")
+        self._call("hotUnplugCPU", in_p=[cpu])
+
+    def get_cpu_status(self, cpu):
+        """Returns the current status of the given CPU.
+
+        in cpu of type int
+            The CPU id to check for.
+
+        return attached of type bool
+            Status of the CPU.
+
+        """
+        if not isinstance(cpu, baseinteger):
+            raise TypeError("cpu can only be an instance of type baseinteger")
+        attached = self._call("getCPUStatus", in_p=[cpu])
+        return attached
+
+    def get_effective_paravirt_provider(self):
+        """Returns the effective paravirtualization provider for this VM.
+
+        return paravirt_provider of type :class:`ParavirtProvider`
+            The effective paravirtualization provider for this VM.
+
+        """
+        paravirt_provider = self._call("getEffectiveParavirtProvider")
+        paravirt_provider = _lib.ParavirtProvider(paravirt_provider)
+        return paravirt_provider
+
+    def query_log_filename(self, idx):
+        """Queries for the VM log file name of an given index. Returns an empty
+        string if a log file with that index doesn't exists.
+
+        in idx of type int
+            Which log file name to query. 0=current log file.
+
+        return filename of type str
+            On return the full path to the log file or an empty string on error.
+
+        """
+        if not isinstance(idx, baseinteger):
+            raise TypeError("idx can only be an instance of type baseinteger")
+        filename = self._call("queryLogFilename", in_p=[idx])
+        return filename
+
+    def read_log(self, idx, offset, size):
+        """Reads the VM log file. The chunk size is limited, so even if you
+        ask for a big piece there might be less data returned.
+
+        in idx of type int
+            Which log file to read. 0=current log file.
+
+        in offset of type int
+            Offset in the log file.
+
+        in size of type int
+            Chunk size to read in the log file.
+
+        return data of type str
+            Data read from the log file. A data size of 0 means end of file
+            if the requested chunk size was not 0. This is the unprocessed
+            file data, i.e. the line ending style depends on the platform of
+            the system the server is running on.
+
+        """
+        if not isinstance(idx, baseinteger):
+            raise TypeError("idx can only be an instance of type baseinteger")
+        if not isinstance(offset, baseinteger):
+            raise TypeError("offset can only be an instance of type baseinteger")
+        if not isinstance(size, baseinteger):
+            raise TypeError("size can only be an instance of type baseinteger")
+        data = self._call("readLog", in_p=[idx, offset, size])
+        return data
+
+    def clone_to(self, target, mode, options):
+        """Creates a clone of this machine, either as a full clone (which means
+        creating independent copies of the hard disk media, save states and so
+        on), or as a linked clone (which uses its own differencing media,
+        sharing the parent media with the source machine).
+
+        The target machine object must have been created previously with :py:func:`IVirtualBox.create_machine` , and all the settings will be
+        transferred except the VM name and the hardware UUID. You can set the
+        VM name and the new hardware UUID when creating the target machine. The
+        network MAC addresses are newly created for all enabled network
+        adapters. You can change that behaviour with the options parameter.
+        The operation is performed asynchronously, so the machine object will
+        be not be usable until the @a progress object signals completion.
+
+        in target of type :class:`IMachine`
+            Target machine object.
+
+        in mode of type :class:`CloneMode`
+            Which states should be cloned.
+
+        in options of type :class:`CloneOptions`
+            Options for the cloning operation.
+
+        return progress of type :class:`IProgress`
+            Progress object to track the operation completion.
+
+        raises :class:`OleErrorInvalidarg`
+            @a target is @c null.
+
+        """
+        if not isinstance(target, _lib.IMachine):
+            raise TypeError("target can only be an instance of type IMachine")
+        if not isinstance(mode, _lib.CloneMode):
+            raise TypeError("mode can only be an instance of type CloneMode")
+        if not isinstance(options, list):
+            raise TypeError("options can only be an instance of type list")
+        for a in options[:10]:
+            if not isinstance(a, _lib.CloneOptions):
+                raise TypeError("array can only contain objects of type CloneOptions")
+        progress = self._call("cloneTo", in_p=[target, mode, options])
+        progress = _lib.IProgress(progress)
+        return progress
+
+    def move_to(self, folder, type_p):
+        """Move machine on to new place/folder
+
+        in folder of type str
+            Target folder where machine is moved.
+
+        in type_p of type str
+            Type of moving.
+            Possible values:
+            basic - Only the files which belong solely to this machine
+            are moved from the original machine's folder to
+            a new folder.
+
+        return progress of type :class:`IProgress`
+            Progress object to track the operation completion.
+
+        raises :class:`OleErrorInvalidarg`
+            @a target is @c null.
+
+        """
+        if not isinstance(folder, basestring):
+            raise TypeError("folder can only be an instance of type basestring")
+        if not isinstance(type_p, basestring):
+            raise TypeError("type_p can only be an instance of type basestring")
+        progress = self._call("moveTo", in_p=[folder, type_p])
+        progress = _lib.IProgress(progress)
+        return progress
+
+    def save_state(self):
+        """Saves the current execution state of a running virtual machine
+        and stops its execution.
+
+        After this operation completes, the machine will go to the
+        Saved state. Next time it is powered up, this state will
+        be restored and the machine will continue its execution from
+        the place where it was saved.
+
+        This operation differs from taking a snapshot to the effect
+        that it doesn't create new differencing media. Also, once
+        the machine is powered up from the state saved using this method,
+        the saved state is deleted, so it will be impossible to return
+        to this state later.
+
+
+        On success, this method implicitly calls
+        :py:func:`save_settings`  to save all current machine
+        settings (including runtime changes to the DVD medium, etc.).
+        Together with the impossibility to change any VM settings when it is
+        in the Saved state, this guarantees adequate hardware
+        configuration of the machine when it is restored from the saved
+        state file.
+
+
+
+        The machine must be in the Running or Paused state, otherwise
+        the operation will fail.
+
+
+
+        :py:func:`take_snapshot`
+
+        return progress of type :class:`IProgress`
+            Progress object to track the operation completion.
+
+        raises :class:`VBoxErrorInvalidVmState`
+            Virtual machine state neither Running nor Paused.
+
+        raises :class:`VBoxErrorFileError`
+            Failed to create directory for saved state file.
+
+        """
+        progress = self._call("saveState")
+        progress = _lib.IProgress(progress)
+        return progress
+
+    def adopt_saved_state(self, saved_state_file):
+        """Associates the given saved state file to the virtual machine.
+
+        On success, the machine will go to the Saved state. Next time it is
+        powered up, it will be restored from the adopted saved state and
+        continue execution from the place where the saved state file was
+        created.
+
+        The specified saved state file path may be absolute or relative to the
+        folder the VM normally saves the state to (usually,
+        :py:func:`snapshot_folder` ).
+
+
+        It's a caller's responsibility to make sure the given saved state
+        file is compatible with the settings of this virtual machine that
+        represent its virtual hardware (memory size, storage disk configuration
+        etc.). If there is a mismatch, the behavior of the virtual machine
+        is undefined.
+
+        in saved_state_file of type str
+            Path to the saved state file to adopt.
+
+        raises :class:`VBoxErrorInvalidVmState`
+            Virtual machine state neither PoweredOff nor Aborted.
+
+        """
+        if not isinstance(saved_state_file, basestring):
+            raise TypeError(
+                "saved_state_file can only be an instance of type basestring"
+            )
+        self._call("adoptSavedState", in_p=[saved_state_file])
+
+    def discard_saved_state(self, f_remove_file):
+        """Forcibly resets the machine to "Powered Off" state if it is
+        currently in the "Saved" state (previously created by :py:func:`save_state` ).
+        Next time the machine is powered up, a clean boot will occur.
+
+        This operation is equivalent to resetting or powering off
+        the machine without doing a proper shutdown of the guest
+        operating system; as with resetting a running phyiscal
+        computer, it can can lead to data loss.
+
+        If @a fRemoveFile is @c true, the file in the machine directory
+        into which the machine state was saved is also deleted. If
+        this is @c false, then the state can be recovered and later
+        re-inserted into a machine using :py:func:`adopt_saved_state` .
+        The location of the file can be found in the
+        :py:func:`state_file_path`  attribute.
+
+        in f_remove_file of type bool
+            Whether to also remove the saved state file.
+
+        raises :class:`VBoxErrorInvalidVmState`
+            Virtual machine not in state Saved.
+
+        """
+        if not isinstance(f_remove_file, bool):
+            raise TypeError("f_remove_file can only be an instance of type bool")
+        self._call("discardSavedState", in_p=[f_remove_file])
+
+    def take_snapshot(self, name, description, pause):
+        """Saves the current execution state
+        and all settings of the machine and creates differencing images
+        for all normal (non-independent) media.
+        See :py:class:`ISnapshot`  for an introduction to snapshots.
+
+        This method can be called for a PoweredOff, Saved (see
+        :py:func:`save_state` ), Running or
+        Paused virtual machine. When the machine is PoweredOff, an
+        offline snapshot is created. When the machine is Running a live
+        snapshot is created, and an online snapshot is created when Paused.
+
+        The taken snapshot is always based on the
+        :py:func:`current_snapshot` current snapshot
+        of the associated virtual machine and becomes a new current snapshot.
+
+
+        This method implicitly calls :py:func:`save_settings`  to
+        save all current machine settings before taking an offline snapshot.
+
+        in name of type str
+            Short name for the snapshot.
+
+        in description of type str
+            Optional description of the snapshot.
+
+        in pause of type bool
+            Whether the VM should be paused while taking the snapshot. Only
+            relevant when the VM is running, and distinguishes between online
+            (@c true) and live (@c false) snapshots. When the VM is not running
+            the result is always an offline snapshot.
+
+        out id_p of type str
+            UUID of the snapshot which will be created. Useful for follow-up
+            operations after the snapshot has been created.
+
+        return progress of type :class:`IProgress`
+            Progress object to track the operation completion.
+
+        raises :class:`VBoxErrorInvalidVmState`
+            Virtual machine currently changing state.
+
+        """
+        if not isinstance(name, basestring):
+            raise TypeError("name can only be an instance of type basestring")
+        if not isinstance(description, basestring):
+            raise TypeError("description can only be an instance of type basestring")
+        if not isinstance(pause, bool):
+            raise TypeError("pause can only be an instance of type bool")
+        progress, id_p = self._call("takeSnapshot", in_p=[name, description, pause])
+        progress = _lib.IProgress(progress)
+        return (progress, id_p)
+
+    def delete_snapshot(self, id_p):
+        """Starts deleting the specified snapshot asynchronously.
+                See :py:class:`ISnapshot`  for an introduction to snapshots.
+
+                The execution state and settings of the associated machine stored in
+                the snapshot will be deleted. The contents of all differencing media of
+                this snapshot will be merged with the contents of their dependent child
+                media to keep the medium chain valid (in other words, all changes
+                represented by media being deleted will be propagated to their child
+                medium). After that, this snapshot's differencing medium will be
+                deleted. The parent of this snapshot will become a new parent for all
+                its child snapshots.
+
+                If the deleted snapshot is the current one, its parent snapshot will
+                become a new current snapshot. The current machine state is not directly
+                affected in this case, except that currently attached differencing
+                media based on media of the deleted snapshot will be also merged as
+                described above.
+
+                If the deleted snapshot is the first or current snapshot, then the
+                respective IMachine attributes will be adjusted. Deleting the current
+                snapshot will also implicitly call :py:func:`save_settings`
+                to make all current machine settings permanent.
+
+                Deleting a snapshot has the following preconditions:
+
+
+                Child media of all normal media of the deleted snapshot
+                must be accessible (see :py:func:`IMedium.state` ) for this
+                operation to succeed. If only one running VM refers to all images
+                which participates in merging the operation can be performed while
+                the VM is running. Otherwise all virtual machines whose media are
+                directly or indirectly based on the media of deleted snapshot must
+                be powered off. In any case, online snapshot deleting usually is
+                slower than the same operation without any running VM.
+
+                You cannot delete the snapshot if a medium attached to it has
+                more than one child medium (differencing images) because otherwise
+                merging would be impossible. This might be the case if there is
+                more than one child snapshot or differencing images were created
+                for other reason (e.g. implicitly because of multiple machine
+                attachments).
+
+
+                The virtual machine's :py:func:`state` state is
+                changed to "DeletingSnapshot", "DeletingSnapshotOnline" or
+                "DeletingSnapshotPaused" while this operation is in progress.
+
+
+                Merging medium contents can be very time and disk space
+                consuming, if these media are big in size and have many
+                children. However, if the snapshot being deleted is the last
+                (head) snapshot on the branch, the operation will be rather
+                quick.
+
+                in id_p of type str
+                    UUID of the snapshot to delete.
+
+                return progress of type :class:`IProgress`
+                    Progress object to track the operation completion.
+
+                raises :class:`VBoxErrorInvalidVmState`
+                    The running virtual machine prevents deleting this snapshot. This
+        happens only in very specific situations, usually snapshots can be
+        deleted without trouble while a VM is running. The error message
+        text explains the reason for the failure.
+
+        """
+        if not isinstance(id_p, basestring):
+            raise TypeError("id_p can only be an instance of type basestring")
+        progress = self._call("deleteSnapshot", in_p=[id_p])
+        progress = _lib.IProgress(progress)
+        return progress
+
+    def delete_snapshot_and_all_children(self, id_p):
+        """Starts deleting the specified snapshot and all its children
+                asynchronously. See :py:class:`ISnapshot`  for an introduction to
+                snapshots. The conditions and many details are the same as with
+                :py:func:`delete_snapshot` .
+
+                This operation is very fast if the snapshot subtree does not include
+                the current state. It is still significantly faster than deleting the
+                snapshots one by one if the current state is in the subtree and there
+                are more than one snapshots from current state to the snapshot which
+                marks the subtree, since it eliminates the incremental image merging.
+
+                This API method is right now not implemented!
+
+                in id_p of type str
+                    UUID of the snapshot to delete, including all its children.
+
+                return progress of type :class:`IProgress`
+                    Progress object to track the operation completion.
+
+                raises :class:`VBoxErrorInvalidVmState`
+                    The running virtual machine prevents deleting this snapshot. This
+        happens only in very specific situations, usually snapshots can be
+        deleted without trouble while a VM is running. The error message
+        text explains the reason for the failure.
+
+                raises :class:`OleErrorNotimpl`
+                    The method is not implemented yet.
+
+        """
+        if not isinstance(id_p, basestring):
+            raise TypeError("id_p can only be an instance of type basestring")
+        progress = self._call("deleteSnapshotAndAllChildren", in_p=[id_p])
+        progress = _lib.IProgress(progress)
+        return progress
+
+    def delete_snapshot_range(self, start_id, end_id):
+        """Starts deleting the specified snapshot range. This is limited to
+                linear snapshot lists, which means there may not be any other child
+                snapshots other than the direct sequence between the start and end
+                snapshot. If the start and end snapshot point to the same snapshot this
+                method is completely equivalent to :py:func:`delete_snapshot` . See
+                :py:class:`ISnapshot`  for an introduction to snapshots. The
+                conditions and many details are the same as with
+                :py:func:`delete_snapshot` .
+
+                This operation is generally faster than deleting snapshots one by one
+                and often also needs less extra disk space before freeing up disk space
+                by deleting the removed disk images corresponding to the snapshot.
+
+                This API method is right now not implemented!
+
+                in start_id of type str
+                    UUID of the first snapshot to delete.
+
+                in end_id of type str
+                    UUID of the last snapshot to delete.
+
+                return progress of type :class:`IProgress`
+                    Progress object to track the operation completion.
+
+                raises :class:`VBoxErrorInvalidVmState`
+                    The running virtual machine prevents deleting this snapshot. This
+        happens only in very specific situations, usually snapshots can be
+        deleted without trouble while a VM is running. The error message
+        text explains the reason for the failure.
+
+                raises :class:`OleErrorNotimpl`
+                    The method is not implemented yet.
+
+        """
+        if not isinstance(start_id, basestring):
+            raise TypeError("start_id can only be an instance of type basestring")
+        if not isinstance(end_id, basestring):
+            raise TypeError("end_id can only be an instance of type basestring")
+        progress = self._call("deleteSnapshotRange", in_p=[start_id, end_id])
+        progress = _lib.IProgress(progress)
+        return progress
+
+    def restore_snapshot(self, snapshot):
+        """Starts resetting the machine's current state to the state contained
+        in the given snapshot, asynchronously. All current settings of the
+        machine will be reset and changes stored in differencing media
+        will be lost.
+        See :py:class:`ISnapshot`  for an introduction to snapshots.
+
+        After this operation is successfully completed, new empty differencing
+        media are created for all normal media of the machine.
+
+        If the given snapshot is an online snapshot, the machine will go to
+        the :py:attr:`MachineState.saved` saved state, so that the
+        next time it is powered on, the execution state will be restored
+        from the state of the snapshot.
+
+
+        The machine must not be running, otherwise the operation will fail.
+
+
+
+        If the machine state is :py:attr:`MachineState.saved` Saved
+        prior to this operation, the saved state file will be implicitly
+        deleted (as if :py:func:`IMachine.discard_saved_state`  were
+        called).
+
+        in snapshot of type :class:`ISnapshot`
+            The snapshot to restore the VM state from.
+
+        return progress of type :class:`IProgress`
+            Progress object to track the operation completion.
+
+        raises :class:`VBoxErrorInvalidVmState`
+            Virtual machine is running.
+
+        """
+        if not isinstance(snapshot, _lib.ISnapshot):
+            raise TypeError("snapshot can only be an instance of type ISnapshot")
+        progress = self._call("restoreSnapshot", in_p=[snapshot])
+        progress = _lib.IProgress(progress)
+        return progress
+
+    def apply_defaults(self, flags):
+        """Applies the defaults for the configured guest OS type. This is
+                primarily for getting sane settings straight after creating a
+                new VM, but it can also be applied later.
+
+
+                This is primarily a shortcut, centralizing the tedious job of
+                getting the recommended settings and translating them into
+                settings updates. The settings are made at the end of the call,
+                but not saved.
+
+                in flags of type str
+                    Additional flags, to be defined later.
+
+                raises :class:`OleErrorFail`
+                    General error.
+
+                raises :class:`VBoxErrorInvalidVmState`
+                    The machine is in invalid state.
+
+                raises :class:`VBoxErrorObjectInUse`
+                    Some of the applied objects already exist. The method has been
+        called to already configured machine.
+
+        """
+        if not isinstance(flags, basestring):
+            raise TypeError("flags can only be an instance of type basestring")
+        self._call("applyDefaults", in_p=[flags])
@@ -0,0 +1,39 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from .imachineevent import IMachineEvent
+from .vboxeventtype import VBoxEventType
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IMachineDataChangedEvent(IMachineEvent):
+    """
+    Any of the settings of the given machine has changed.
+    """
+
+    __uuid__ = "abe94809-2e88-4436-83d7-50f3e64d0503"
+    __wsmap__ = "managed"
+    id = VBoxEventType.on_machine_data_changed
+
+    @property
+    def temporary(self):
+        """Get bool value for 'temporary'
+        @c true if the settings change is temporary. All permanent
+        settings changes will trigger an event, and only temporary settings
+        changes for running VMs will trigger an event. Note: sending events
+        for temporary changes is NOT IMPLEMENTED.
+        """
+        ret = self._get_attr("temporary")
+        return ret
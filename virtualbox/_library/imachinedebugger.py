@@ -0,0 +1,748 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from ..library_base import Interface
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IMachineDebugger(Interface):
+    """
+    Takes a core dump of the guest.
+
+    See include/VBox/dbgfcorefmt.h for details on the file format.
+    """
+
+    __uuid__ = "00ae6af4-00a7-4104-0009-49bc00b2da80"
+    __wsmap__ = "managed"
+
+    def dump_guest_core(self, filename, compression):
+        """Takes a core dump of the guest.
+
+        See include/VBox/dbgfcorefmt.h for details on the file format.
+
+        in filename of type str
+            The name of the output file. The file must not exist.
+
+        in compression of type str
+            Reserved for future compression method indicator.
+
+        """
+        if not isinstance(filename, basestring):
+            raise TypeError("filename can only be an instance of type basestring")
+        if not isinstance(compression, basestring):
+            raise TypeError("compression can only be an instance of type basestring")
+        self._call("dumpGuestCore", in_p=[filename, compression])
+
+    def dump_host_process_core(self, filename, compression):
+        """Takes a core dump of the VM process on the host.
+
+        This feature is not implemented in the 4.0.0 release but it may show up
+        in a dot release.
+
+        in filename of type str
+            The name of the output file. The file must not exist.
+
+        in compression of type str
+            Reserved for future compression method indicator.
+
+        """
+        if not isinstance(filename, basestring):
+            raise TypeError("filename can only be an instance of type basestring")
+        if not isinstance(compression, basestring):
+            raise TypeError("compression can only be an instance of type basestring")
+        self._call("dumpHostProcessCore", in_p=[filename, compression])
+
+    def info(self, name, args):
+        """Interfaces with the info dumpers (DBGFInfo).
+
+        This feature is not implemented in the 4.0.0 release but it may show up
+        in a dot release.
+
+        in name of type str
+            The name of the info item.
+
+        in args of type str
+            Arguments to the info dumper.
+
+        return info of type str
+            The into string.
+
+        """
+        if not isinstance(name, basestring):
+            raise TypeError("name can only be an instance of type basestring")
+        if not isinstance(args, basestring):
+            raise TypeError("args can only be an instance of type basestring")
+        info = self._call("info", in_p=[name, args])
+        return info
+
+    def inject_nmi(self):
+        """Inject an NMI into a running VT-x/AMD-V VM."""
+        self._call("injectNMI")
+
+    def modify_log_groups(self, settings):
+        """Modifies the group settings of the debug or release logger.
+
+        in settings of type str
+            The group settings string. See iprt/log.h for details. To target the
+            release logger, prefix the string with "release:".
+
+        """
+        if not isinstance(settings, basestring):
+            raise TypeError("settings can only be an instance of type basestring")
+        self._call("modifyLogGroups", in_p=[settings])
+
+    def modify_log_flags(self, settings):
+        """Modifies the debug or release logger flags.
+
+        in settings of type str
+            The flags settings string. See iprt/log.h for details. To target the
+            release logger, prefix the string with "release:".
+
+        """
+        if not isinstance(settings, basestring):
+            raise TypeError("settings can only be an instance of type basestring")
+        self._call("modifyLogFlags", in_p=[settings])
+
+    def modify_log_destinations(self, settings):
+        """Modifies the debug or release logger destinations.
+
+        in settings of type str
+            The destination settings string. See iprt/log.h for details. To target the
+            release logger, prefix the string with "release:".
+
+        """
+        if not isinstance(settings, basestring):
+            raise TypeError("settings can only be an instance of type basestring")
+        self._call("modifyLogDestinations", in_p=[settings])
+
+    def read_physical_memory(self, address, size):
+        """Reads guest physical memory, no side effects (MMIO++).
+
+        This feature is not implemented in the 4.0.0 release but may show up
+        in a dot release.
+
+        in address of type int
+            The guest physical address.
+
+        in size of type int
+            The number of bytes to read.
+
+        return bytes_p of type str
+            The bytes read.
+
+        """
+        if not isinstance(address, baseinteger):
+            raise TypeError("address can only be an instance of type baseinteger")
+        if not isinstance(size, baseinteger):
+            raise TypeError("size can only be an instance of type baseinteger")
+        bytes_p = self._call("readPhysicalMemory", in_p=[address, size])
+        return bytes_p
+
+    def write_physical_memory(self, address, size, bytes_p):
+        """Writes guest physical memory, access handles (MMIO++) are ignored.
+
+        This feature is not implemented in the 4.0.0 release but may show up
+        in a dot release.
+
+        in address of type int
+            The guest physical address.
+
+        in size of type int
+            The number of bytes to read.
+
+        in bytes_p of type str
+            The bytes to write.
+
+        """
+        if not isinstance(address, baseinteger):
+            raise TypeError("address can only be an instance of type baseinteger")
+        if not isinstance(size, baseinteger):
+            raise TypeError("size can only be an instance of type baseinteger")
+        if not isinstance(bytes_p, list):
+            raise TypeError("bytes_p can only be an instance of type list")
+        for a in bytes_p[:10]:
+            if not isinstance(a, basestring):
+                raise TypeError("array can only contain objects of type basestring")
+        self._call("writePhysicalMemory", in_p=[address, size, bytes_p])
+
+    def read_virtual_memory(self, cpu_id, address, size):
+        """Reads guest virtual memory, no side effects (MMIO++).
+
+        This feature is not implemented in the 4.0.0 release but may show up
+        in a dot release.
+
+        in cpu_id of type int
+            The identifier of the Virtual CPU.
+
+        in address of type int
+            The guest virtual address.
+
+        in size of type int
+            The number of bytes to read.
+
+        return bytes_p of type str
+            The bytes read.
+
+        """
+        if not isinstance(cpu_id, baseinteger):
+            raise TypeError("cpu_id can only be an instance of type baseinteger")
+        if not isinstance(address, baseinteger):
+            raise TypeError("address can only be an instance of type baseinteger")
+        if not isinstance(size, baseinteger):
+            raise TypeError("size can only be an instance of type baseinteger")
+        bytes_p = self._call("readVirtualMemory", in_p=[cpu_id, address, size])
+        return bytes_p
+
+    def write_virtual_memory(self, cpu_id, address, size, bytes_p):
+        """Writes guest virtual memory, access handles (MMIO++) are ignored.
+
+        This feature is not implemented in the 4.0.0 release but may show up
+        in a dot release.
+
+        in cpu_id of type int
+            The identifier of the Virtual CPU.
+
+        in address of type int
+            The guest virtual address.
+
+        in size of type int
+            The number of bytes to read.
+
+        in bytes_p of type str
+            The bytes to write.
+
+        """
+        if not isinstance(cpu_id, baseinteger):
+            raise TypeError("cpu_id can only be an instance of type baseinteger")
+        if not isinstance(address, baseinteger):
+            raise TypeError("address can only be an instance of type baseinteger")
+        if not isinstance(size, baseinteger):
+            raise TypeError("size can only be an instance of type baseinteger")
+        if not isinstance(bytes_p, list):
+            raise TypeError("bytes_p can only be an instance of type list")
+        for a in bytes_p[:10]:
+            if not isinstance(a, basestring):
+                raise TypeError("array can only contain objects of type basestring")
+        self._call("writeVirtualMemory", in_p=[cpu_id, address, size, bytes_p])
+
+    def load_plug_in(self, name):
+        """Loads a DBGF plug-in.
+
+        in name of type str
+            The plug-in name or DLL. Special name 'all' loads all installed plug-ins.
+
+        return plug_in_name of type str
+            The name of the loaded plug-in.
+
+        """
+        if not isinstance(name, basestring):
+            raise TypeError("name can only be an instance of type basestring")
+        plug_in_name = self._call("loadPlugIn", in_p=[name])
+        return plug_in_name
+
+    def unload_plug_in(self, name):
+        """Unloads a DBGF plug-in.
+
+        in name of type str
+            The plug-in name or DLL. Special name 'all' unloads all plug-ins.
+
+        """
+        if not isinstance(name, basestring):
+            raise TypeError("name can only be an instance of type basestring")
+        self._call("unloadPlugIn", in_p=[name])
+
+    def detect_os(self):
+        """Tries to (re-)detect the guest OS kernel.
+
+        This feature is not implemented in the 4.0.0 release but may show up
+        in a dot release.
+
+        return os of type str
+            The detected OS kernel on success.
+
+        """
+        os = self._call("detectOS")
+        return os
+
+    def query_os_kernel_log(self, max_messages):
+        """Tries to get the kernel log (dmesg) of the guest OS.
+
+        in max_messages of type int
+            Max number of messages to return, counting from the end of the
+            log.  If 0, there is no limit.
+
+        return dmesg of type str
+            The kernel log.
+
+        """
+        if not isinstance(max_messages, baseinteger):
+            raise TypeError("max_messages can only be an instance of type baseinteger")
+        dmesg = self._call("queryOSKernelLog", in_p=[max_messages])
+        return dmesg
+
+    def get_register(self, cpu_id, name):
+        """Gets one register.
+
+        in cpu_id of type int
+            The identifier of the Virtual CPU.
+
+        in name of type str
+            The register name, case is ignored.
+
+        return value of type str
+            The register value. This is usually a hex value (always 0x prefixed)
+            but other format may be used for floating point registers (TBD).
+
+        """
+        if not isinstance(cpu_id, baseinteger):
+            raise TypeError("cpu_id can only be an instance of type baseinteger")
+        if not isinstance(name, basestring):
+            raise TypeError("name can only be an instance of type basestring")
+        value = self._call("getRegister", in_p=[cpu_id, name])
+        return value
+
+    def get_registers(self, cpu_id):
+        """Gets all the registers for the given CPU.
+
+        in cpu_id of type int
+            The identifier of the Virtual CPU.
+
+        out names of type str
+            Array containing the lowercase register names.
+
+        out values of type str
+            Array parallel to the names holding the register values as if the
+            register was returned by :py:func:`IMachineDebugger.get_register` .
+
+        """
+        if not isinstance(cpu_id, baseinteger):
+            raise TypeError("cpu_id can only be an instance of type baseinteger")
+        names, values = self._call("getRegisters", in_p=[cpu_id])
+        return (names, values)
+
+    def set_register(self, cpu_id, name, value):
+        """Gets one register.
+
+        This feature is not implemented in the 4.0.0 release but may show up
+        in a dot release.
+
+        in cpu_id of type int
+            The identifier of the Virtual CPU.
+
+        in name of type str
+            The register name, case is ignored.
+
+        in value of type str
+            The new register value. Hexadecimal, decimal and octal formattings
+            are supported in addition to any special formattings returned by
+            the getters.
+
+        """
+        if not isinstance(cpu_id, baseinteger):
+            raise TypeError("cpu_id can only be an instance of type baseinteger")
+        if not isinstance(name, basestring):
+            raise TypeError("name can only be an instance of type basestring")
+        if not isinstance(value, basestring):
+            raise TypeError("value can only be an instance of type basestring")
+        self._call("setRegister", in_p=[cpu_id, name, value])
+
+    def set_registers(self, cpu_id, names, values):
+        """Sets zero or more registers atomically.
+
+        This feature is not implemented in the 4.0.0 release but may show up
+        in a dot release.
+
+        in cpu_id of type int
+            The identifier of the Virtual CPU.
+
+        in names of type str
+            Array containing the register names, case ignored.
+
+        in values of type str
+            Array paralell to the names holding the register values. See
+            :py:func:`IMachineDebugger.set_register`  for formatting
+            guidelines.
+
+        """
+        if not isinstance(cpu_id, baseinteger):
+            raise TypeError("cpu_id can only be an instance of type baseinteger")
+        if not isinstance(names, list):
+            raise TypeError("names can only be an instance of type list")
+        for a in names[:10]:
+            if not isinstance(a, basestring):
+                raise TypeError("array can only contain objects of type basestring")
+        if not isinstance(values, list):
+            raise TypeError("values can only be an instance of type list")
+        for a in values[:10]:
+            if not isinstance(a, basestring):
+                raise TypeError("array can only contain objects of type basestring")
+        self._call("setRegisters", in_p=[cpu_id, names, values])
+
+    def dump_guest_stack(self, cpu_id):
+        """Produce a simple stack dump using the current guest state.
+
+        This feature is not implemented in the 4.0.0 release but may show up
+        in a dot release.
+
+        in cpu_id of type int
+            The identifier of the Virtual CPU.
+
+        return stack of type str
+            String containing the formatted stack dump.
+
+        """
+        if not isinstance(cpu_id, baseinteger):
+            raise TypeError("cpu_id can only be an instance of type baseinteger")
+        stack = self._call("dumpGuestStack", in_p=[cpu_id])
+        return stack
+
+    def reset_stats(self, pattern):
+        """Reset VM statistics.
+
+        in pattern of type str
+            The selection pattern. A bit similar to filename globbing.
+            Wildchars are '*' and '?', where the asterisk matches zero or
+            more characters and question mark matches exactly one character.
+            Multiple pattern can be joined by putting '|' between them.
+
+        """
+        if not isinstance(pattern, basestring):
+            raise TypeError("pattern can only be an instance of type basestring")
+        self._call("resetStats", in_p=[pattern])
+
+    def dump_stats(self, pattern):
+        """Dumps VM statistics.
+
+        in pattern of type str
+            The selection pattern. A bit similar to filename globbing.
+            Wildchars are '*' and '?', where the asterisk matches zero or
+            more characters and question mark matches exactly one character.
+            Multiple pattern can be joined by putting '|' between them.
+
+        """
+        if not isinstance(pattern, basestring):
+            raise TypeError("pattern can only be an instance of type basestring")
+        self._call("dumpStats", in_p=[pattern])
+
+    def get_stats(self, pattern, with_descriptions):
+        """Get the VM statistics in a XMLish format.
+
+        in pattern of type str
+            The selection pattern. A bit similar to filename globbing.
+            Wildchars are '*' and '?', where the asterisk matches zero or
+            more characters and question mark matches exactly one character.
+            Multiple pattern can be joined by putting '|' between them.
+
+        in with_descriptions of type bool
+            Whether to include the descriptions.
+
+        return stats of type str
+            The XML document containing the statistics.
+
+        """
+        if not isinstance(pattern, basestring):
+            raise TypeError("pattern can only be an instance of type basestring")
+        if not isinstance(with_descriptions, bool):
+            raise TypeError("with_descriptions can only be an instance of type bool")
+        stats = self._call("getStats", in_p=[pattern, with_descriptions])
+        return stats
+
+    def get_cpu_load(self, cpu_id):
+        """Get the load percentages (as observed by the VMM) for all virtual CPUs
+        or a specific one.
+
+        in cpu_id of type int
+            The ID of the virtual CPU to retrieve stats for, pass 0x7fffffff
+            or higher for the average accross all CPUs.
+
+        out pct_executing of type int
+            Percentage of the interval that the CPU(s) spend executing guest code.
+
+        out pct_halted of type int
+            Percentage of the interval that the CPU(s) spend halted.
+
+        out pct_other of type int
+            Percentage of the interval that the CPU(s) preempted by the host
+            scheduler, on virtualization overhead and on other tasks.
+
+        return ms_interval of type int
+            The interval the percentage was calculated over in milliseconds
+
+        """
+        if not isinstance(cpu_id, baseinteger):
+            raise TypeError("cpu_id can only be an instance of type baseinteger")
+        ms_interval, pct_executing, pct_halted, pct_other = self._call(
+            "getCPULoad", in_p=[cpu_id]
+        )
+        return (ms_interval, pct_executing, pct_halted, pct_other)
+
+    @property
+    def single_step(self):
+        """Get or set bool value for 'singleStep'
+        Switch for enabling single-stepping.
+        """
+        ret = self._get_attr("singleStep")
+        return ret
+
+    @single_step.setter
+    def single_step(self, value):
+        if not isinstance(value, bool):
+            raise TypeError("value is not an instance of bool")
+        return self._set_attr("singleStep", value)
+
+    @property
+    def recompile_user(self):
+        """Get or set bool value for 'recompileUser'
+        Switch for forcing code recompilation for user mode code.
+        """
+        ret = self._get_attr("recompileUser")
+        return ret
+
+    @recompile_user.setter
+    def recompile_user(self, value):
+        if not isinstance(value, bool):
+            raise TypeError("value is not an instance of bool")
+        return self._set_attr("recompileUser", value)
+
+    @property
+    def recompile_supervisor(self):
+        """Get or set bool value for 'recompileSupervisor'
+        Switch for forcing code recompilation for supervisor mode code.
+        """
+        ret = self._get_attr("recompileSupervisor")
+        return ret
+
+    @recompile_supervisor.setter
+    def recompile_supervisor(self, value):
+        if not isinstance(value, bool):
+            raise TypeError("value is not an instance of bool")
+        return self._set_attr("recompileSupervisor", value)
+
+    @property
+    def execute_all_in_iem(self):
+        """Get or set bool value for 'executeAllInIEM'
+        Whether to execute all the code in the instruction interpreter. This
+        is mainly for testing the interpreter and not an execution mode
+        intended for general consumption.
+        """
+        ret = self._get_attr("executeAllInIEM")
+        return ret
+
+    @execute_all_in_iem.setter
+    def execute_all_in_iem(self, value):
+        if not isinstance(value, bool):
+            raise TypeError("value is not an instance of bool")
+        return self._set_attr("executeAllInIEM", value)
+
+    @property
+    def patm_enabled(self):
+        """Get or set bool value for 'PATMEnabled'
+        Switch for enabling and disabling the PATM component.
+        """
+        ret = self._get_attr("PATMEnabled")
+        return ret
+
+    @patm_enabled.setter
+    def patm_enabled(self, value):
+        if not isinstance(value, bool):
+            raise TypeError("value is not an instance of bool")
+        return self._set_attr("PATMEnabled", value)
+
+    @property
+    def csam_enabled(self):
+        """Get or set bool value for 'CSAMEnabled'
+        Switch for enabling and disabling the CSAM component.
+        """
+        ret = self._get_attr("CSAMEnabled")
+        return ret
+
+    @csam_enabled.setter
+    def csam_enabled(self, value):
+        if not isinstance(value, bool):
+            raise TypeError("value is not an instance of bool")
+        return self._set_attr("CSAMEnabled", value)
+
+    @property
+    def log_enabled(self):
+        """Get or set bool value for 'logEnabled'
+        Switch for enabling and disabling the debug logger.
+        """
+        ret = self._get_attr("logEnabled")
+        return ret
+
+    @log_enabled.setter
+    def log_enabled(self, value):
+        if not isinstance(value, bool):
+            raise TypeError("value is not an instance of bool")
+        return self._set_attr("logEnabled", value)
+
+    @property
+    def log_dbg_flags(self):
+        """Get str value for 'logDbgFlags'
+        The debug logger flags.
+        """
+        ret = self._get_attr("logDbgFlags")
+        return ret
+
+    @property
+    def log_dbg_groups(self):
+        """Get str value for 'logDbgGroups'
+        The debug logger's group settings.
+        """
+        ret = self._get_attr("logDbgGroups")
+        return ret
+
+    @property
+    def log_dbg_destinations(self):
+        """Get str value for 'logDbgDestinations'
+        The debug logger's destination settings.
+        """
+        ret = self._get_attr("logDbgDestinations")
+        return ret
+
+    @property
+    def log_rel_flags(self):
+        """Get str value for 'logRelFlags'
+        The release logger flags.
+        """
+        ret = self._get_attr("logRelFlags")
+        return ret
+
+    @property
+    def log_rel_groups(self):
+        """Get str value for 'logRelGroups'
+        The release logger's group settings.
+        """
+        ret = self._get_attr("logRelGroups")
+        return ret
+
+    @property
+    def log_rel_destinations(self):
+        """Get str value for 'logRelDestinations'
+        The relase logger's destination settings.
+        """
+        ret = self._get_attr("logRelDestinations")
+        return ret
+
+    @property
+    def execution_engine(self):
+        """Get VMExecutionEngine value for 'executionEngine'
+        Gets the main execution engine of the VM.
+        """
+        ret = self._get_attr("executionEngine")
+        return _lib.VMExecutionEngine(ret)
+
+    @property
+    def hw_virt_ex_enabled(self):
+        """Get bool value for 'HWVirtExEnabled'
+        Flag indicating whether the VM is currently making use of CPU hardware
+        virtualization extensions.
+
+        Superseeded by mainExecutionMode.
+        """
+        ret = self._get_attr("HWVirtExEnabled")
+        return ret
+
+    @property
+    def hw_virt_ex_nested_paging_enabled(self):
+        """Get bool value for 'HWVirtExNestedPagingEnabled'
+        Flag indicating whether the VM is currently making use of the nested paging
+        CPU hardware virtualization extension.
+        """
+        ret = self._get_attr("HWVirtExNestedPagingEnabled")
+        return ret
+
+    @property
+    def hw_virt_ex_vpid_enabled(self):
+        """Get bool value for 'HWVirtExVPIDEnabled'
+        Flag indicating whether the VM is currently making use of the VPID
+        VT-x extension.
+        """
+        ret = self._get_attr("HWVirtExVPIDEnabled")
+        return ret
+
+    @property
+    def hw_virt_ex_ux_enabled(self):
+        """Get bool value for 'HWVirtExUXEnabled'
+        Flag indicating whether the VM is currently making use of the
+        unrestricted execution feature of VT-x.
+        """
+        ret = self._get_attr("HWVirtExUXEnabled")
+        return ret
+
+    @property
+    def os_name(self):
+        """Get str value for 'OSName'
+        Query the guest OS kernel name as detected by the DBGF.
+
+        This feature is not implemented in the 4.0.0 release but may show up
+        in a dot release.
+        """
+        ret = self._get_attr("OSName")
+        return ret
+
+    @property
+    def os_version(self):
+        """Get str value for 'OSVersion'
+        Query the guest OS kernel version string as detected by the DBGF.
+
+        This feature is not implemented in the 4.0.0 release but may show up
+        in a dot release.
+        """
+        ret = self._get_attr("OSVersion")
+        return ret
+
+    @property
+    def pae_enabled(self):
+        """Get bool value for 'PAEEnabled'
+        Flag indicating whether the VM is currently making use of the Physical
+        Address Extension CPU feature.
+        """
+        ret = self._get_attr("PAEEnabled")
+        return ret
+
+    @property
+    def virtual_time_rate(self):
+        """Get or set int value for 'virtualTimeRate'
+        The rate at which the virtual time runs expressed as a percentage.
+        The accepted range is 2% to 20000%.
+        """
+        ret = self._get_attr("virtualTimeRate")
+        return ret
+
+    @virtual_time_rate.setter
+    def virtual_time_rate(self, value):
+        if not isinstance(value, baseinteger):
+            raise TypeError("value is not an instance of baseinteger")
+        return self._set_attr("virtualTimeRate", value)
+
+    @property
+    def vm(self):
+        """Get int value for 'VM'
+        Gets the user-mode VM handle, with a reference. Must be passed to
+        VMR3ReleaseUVM when done. This is only for internal use while we carve
+        the details of this interface.
+        """
+        ret = self._get_attr("VM")
+        return ret
+
+    @property
+    def uptime(self):
+        """Get int value for 'uptime'
+        VM uptime in milliseconds, i.e. time in which it could have been
+        executing guest code. Excludes the time when the VM was paused.
+        """
+        ret = self._get_attr("uptime")
+        return ret
@@ -0,0 +1,36 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from .ievent import IEvent
+from .vboxeventtype import VBoxEventType
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IMachineEvent(IEvent):
+    """
+    Base abstract interface for all machine events.
+    """
+
+    __uuid__ = "92ed7b1a-0d96-40ed-ae46-a564d484325e"
+    __wsmap__ = "managed"
+    id = VBoxEventType.machine_event
+
+    @property
+    def machine_id(self):
+        """Get str value for 'machineId'
+        ID of the machine this event relates to.
+        """
+        ret = self._get_attr("machineId")
+        return ret
@@ -0,0 +1,38 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from .imachineevent import IMachineEvent
+from .vboxeventtype import VBoxEventType
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IMachineRegisteredEvent(IMachineEvent):
+    """
+    The given machine was registered or unregistered
+    within this VirtualBox installation.
+    """
+
+    __uuid__ = "c354a762-3ff2-4f2e-8f09-07382ee25088"
+    __wsmap__ = "managed"
+    id = VBoxEventType.on_machine_registered
+
+    @property
+    def registered(self):
+        """Get bool value for 'registered'
+        If @c true, the machine was registered, otherwise it was
+        unregistered.
+        """
+        ret = self._get_attr("registered")
+        return ret
@@ -0,0 +1,36 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from .imachineevent import IMachineEvent
+from .vboxeventtype import VBoxEventType
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IMachineStateChangedEvent(IMachineEvent):
+    """
+    Machine state change event.
+    """
+
+    __uuid__ = "5748F794-48DF-438D-85EB-98FFD70D18C9"
+    __wsmap__ = "managed"
+    id = VBoxEventType.on_machine_state_changed
+
+    @property
+    def state(self):
+        """Get MachineState value for 'state'
+        New execution state.
+        """
+        ret = self._get_attr("state")
+        return _lib.MachineState(ret)
@@ -0,0 +1,1473 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from ..library_base import Interface
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IMedium(Interface):
+    """
+    The IMedium interface represents virtual storage for a machine's
+    hard disks, CD/DVD or floppy drives. It will typically represent
+    a disk image on the host, for example a VDI or VMDK file representing
+    a virtual hard disk, or an ISO or RAW file representing virtual
+    removable media, but can also point to a network location (e.g.
+    for iSCSI targets).
+
+    Instances of IMedium are connected to virtual machines by way of medium
+    attachments, which link the storage medium to a particular device slot
+    of a storage controller of the virtual machine.
+    In the VirtualBox API, virtual storage is therefore always represented
+    by the following chain of object links:
+
+
+    :py:func:`IMachine.storage_controllers`  contains an array of
+    storage controllers (IDE, SATA, SCSI, SAS or a floppy controller;
+    these are instances of :py:class:`IStorageController` ).
+    :py:func:`IMachine.medium_attachments`  contains an array of
+    medium attachments (instances of :py:class:`IMediumAttachment`
+    created by :py:func:`IMachine.attach_device` ),
+    each containing a storage controller from the above array, a
+    port/device specification, and an instance of IMedium representing
+    the medium storage (image file).
+
+    For removable media, the storage medium is optional; a medium
+    attachment with no medium represents a CD/DVD or floppy drive
+    with no medium inserted. By contrast, hard disk attachments
+    will always have an IMedium object attached.
+    Each IMedium in turn points to a storage unit (such as a file
+    on the host computer or a network resource) that holds actual
+    data. This location is represented by the :py:func:`location`
+    attribute.
+
+
+    Existing media are opened using :py:func:`IVirtualBox.open_medium` ;
+    new hard disk media can be created with the VirtualBox API using the
+    :py:func:`IVirtualBox.create_medium`  method. Differencing hard
+    disks (see below) are usually implicitly created by VirtualBox as
+    needed, but may also be created explicitly using :py:func:`create_diff_storage` .
+    VirtualBox cannot create CD/DVD or floppy images (ISO and RAW files); these
+    should be created with external tools and then opened from within VirtualBox.
+
+    Only for CD/DVDs and floppies, an IMedium instance can also represent a host
+    drive. In that case the :py:func:`id_p`  attribute contains the UUID of
+    one of the drives in :py:func:`IHost.dvd_drives`  or :py:func:`IHost.floppy_drives` .
+
+    Media registries
+
+    When a medium has been opened or created using one of the aforementioned
+    APIs, it becomes "known" to VirtualBox. Known media can be attached
+    to virtual machines and re-found through :py:func:`IVirtualBox.open_medium` .
+    They also appear in the global
+    :py:func:`IVirtualBox.hard_disks` ,
+    :py:func:`IVirtualBox.dvd_images`  and
+    :py:func:`IVirtualBox.floppy_images`  arrays.
+
+    Prior to VirtualBox 4.0, opening a medium added it to a global media registry
+    in the VirtualBox.xml file, which was shared between all machines and made
+    transporting machines and their media from one host to another difficult.
+
+    Starting with VirtualBox 4.0, media are only added to a registry when they are
+    *attached* to a machine using :py:func:`IMachine.attach_device` . For
+    backwards compatibility, which registry a medium is added to depends on which
+    VirtualBox version created a machine:
+
+
+    If the medium has first been attached to a machine which was created by
+    VirtualBox 4.0 or later, it is added to that machine's media registry in
+    the machine XML settings file. This way all information about a machine's
+    media attachments is contained in a single file and can be transported
+    easily.
+    For older media attachments (i.e. if the medium was first attached to a
+    machine which was created with a VirtualBox version before 4.0), media
+    continue to be registered in the global VirtualBox settings file, for
+    backwards compatibility.
+
+
+    See :py:func:`IVirtualBox.open_medium`  for more information.
+
+    Media are removed from media registries by the :py:func:`IMedium.close` ,
+    :py:func:`delete_storage`  and :py:func:`merge_to`  methods.
+
+    Accessibility checks
+
+    VirtualBox defers media accessibility checks until the :py:func:`refresh_state`
+    method is called explicitly on a medium. This is done to make the VirtualBox object
+    ready for serving requests as fast as possible and let the end-user
+    application decide if it needs to check media accessibility right away or not.
+
+    As a result, when VirtualBox starts up (e.g. the VirtualBox
+    object gets created for the first time), all known media are in the
+    "Inaccessible" state, but the value of the :py:func:`last_access_error`
+    attribute is an empty string because no actual accessibility check has
+    been made yet.
+
+    After calling :py:func:`refresh_state` , a medium is considered
+    *accessible* if its storage unit can be read. In that case, the
+    :py:func:`state`  attribute has a value of "Created". If the storage
+    unit cannot be read (for example, because it is located on a disconnected
+    network resource, or was accidentally deleted outside VirtualBox),
+    the medium is considered *inaccessible*, which is indicated by the
+    "Inaccessible" state. The exact reason why the medium is inaccessible can be
+    obtained by reading the :py:func:`last_access_error`  attribute.
+
+    Medium types
+
+    There are five types of medium behavior which are stored in the
+    :py:func:`type_p`  attribute (see :py:class:`MediumType` ) and
+    which define the medium's behavior with attachments and snapshots.
+
+    All media can be also divided in two groups: *base* media and
+    *differencing* media. A base medium contains all sectors of the
+    medium data in its own storage and therefore can be used independently.
+    In contrast, a differencing medium is a "delta" to some other medium and
+    contains only those sectors which differ from that other medium, which is
+    then called a *parent*. The differencing medium is said to be
+    *linked to* that parent. The parent may be itself a differencing
+    medium, thus forming a chain of linked media. The last element in that
+    chain must always be a base medium. Note that several differencing
+    media may be linked to the same parent medium.
+
+    Differencing media can be distinguished from base media by querying the
+    :py:func:`parent`  attribute: base media do not have parents they would
+    depend on, so the value of this attribute is always @c null for them.
+    Using this attribute, it is possible to walk up the medium tree (from the
+    child medium to its parent). It is also possible to walk down the tree
+    using the :py:func:`children`  attribute.
+
+    Note that the type of all differencing media is "normal"; all other
+    values are meaningless for them. Base media may be of any type.
+
+    Automatic composition of the file name part
+
+    Another extension to the :py:func:`IMedium.location`  attribute is that
+    there is a possibility to cause VirtualBox to compose a unique value for
+    the file name part of the location using the UUID of the hard disk. This
+    applies only to hard disks in :py:attr:`MediumState.not_created`  state,
+    e.g. before the storage unit is created, and works as follows. You set the
+    value of the :py:func:`IMedium.location`  attribute to a location
+    specification which only contains the path specification but not the file
+    name part and ends with either a forward slash or a backslash character.
+    In response, VirtualBox will generate a new UUID for the hard disk and
+    compose the file name using the following pattern:
+
+    ::
+
+         <path>/{<uuid>}.<ext>
+
+
+    where <path> is the supplied path specification,
+    <uuid> is the newly generated UUID and <ext>
+    is the default extension for the storage format of this hard disk. After
+    that, you may call any of the methods that create a new hard disk storage
+    unit and they will use the generated UUID and file name.
+    """
+
+    __uuid__ = "ad47ad09-787b-44ab-b343-a082a3f2dfb1"
+    __wsmap__ = "managed"
+
+    @property
+    def id_p(self):
+        """Get str value for 'id'
+        UUID of the medium. For a newly created medium, this value is a randomly
+        generated UUID.
+
+
+        For media in one of MediumState_NotCreated, MediumState_Creating or
+        MediumState_Deleting states, the value of this property is undefined
+        and will most likely be an empty UUID.
+        """
+        ret = self._get_attr("id")
+        return ret
+
+    @property
+    def description(self):
+        """Get or set str value for 'description'
+        Optional description of the medium. For a newly created medium the value
+        of this attribute is an empty string.
+
+        Medium types that don't support this attribute will return E_NOTIMPL in
+        attempt to get or set this attribute's value.
+
+
+        For some storage types, reading this attribute may return an outdated
+        (last known) value when :py:func:`state`  is :py:attr:`MediumState.inaccessible`  or :py:attr:`MediumState.locked_write`  because the value of this attribute is
+        stored within the storage unit itself. Also note that changing the
+        attribute value is not possible in such case, as well as when the
+        medium is the :py:attr:`MediumState.locked_read`  state.
+        """
+        ret = self._get_attr("description")
+        return ret
+
+    @description.setter
+    def description(self, value):
+        if not isinstance(value, basestring):
+            raise TypeError("value is not an instance of basestring")
+        return self._set_attr("description", value)
+
+    @property
+    def state(self):
+        """Get MediumState value for 'state'
+        Returns the current medium state, which is the last state set by
+        the accessibility check performed by :py:func:`refresh_state` .
+        If that method has not yet been called on the medium, the state
+        is "Inaccessible"; as opposed to truly inaccessible media, the
+        value of :py:func:`last_access_error`  will be an empty string in
+        that case.
+
+        As of version 3.1, this no longer performs an accessibility check
+        automatically; call :py:func:`refresh_state`  for that.
+        """
+        ret = self._get_attr("state")
+        return _lib.MediumState(ret)
+
+    @property
+    def variant(self):
+        """Get MediumVariant value for 'variant'
+        Returns the storage format variant information for this medium
+        as an array of the flags described at :py:class:`MediumVariant` .
+        Before :py:func:`refresh_state`  is called this method returns
+        an undefined value.
+        """
+        ret = self._get_attr("variant")
+        return [_lib.MediumVariant(a) for a in ret]
+
+    @property
+    def location(self):
+        """Get or set str value for 'location'
+        Location of the storage unit holding medium data.
+
+        The format of the location string is medium type specific. For medium
+        types using regular files in a host's file system, the location
+        string is the full file name.
+        """
+        ret = self._get_attr("location")
+        return ret
+
+    @location.setter
+    def location(self, value):
+        if not isinstance(value, basestring):
+            raise TypeError("value is not an instance of basestring")
+        return self._set_attr("location", value)
+
+    @property
+    def name(self):
+        """Get str value for 'name'
+        Name of the storage unit holding medium data.
+
+        The returned string is a short version of the :py:func:`location`
+        attribute that is suitable for representing the medium in situations
+        where the full location specification is too long (such as lists
+        and comboboxes in GUI frontends). This string is also used by frontends
+        to sort the media list alphabetically when needed.
+
+        For example, for locations that are regular files in the host's file
+        system, the value of this attribute is just the file name (+ extension),
+        without the path specification.
+
+        Note that as opposed to the :py:func:`location`  attribute, the name
+        attribute will not necessary be unique for a list of media of the
+        given type and format.
+        """
+        ret = self._get_attr("name")
+        return ret
+
+    @property
+    def device_type(self):
+        """Get DeviceType value for 'deviceType'
+        Kind of device (DVD/Floppy/HardDisk) which is applicable to this
+        medium.
+        """
+        ret = self._get_attr("deviceType")
+        return _lib.DeviceType(ret)
+
+    @property
+    def host_drive(self):
+        """Get bool value for 'hostDrive'
+        True if this corresponds to a drive on the host.
+        """
+        ret = self._get_attr("hostDrive")
+        return ret
+
+    @property
+    def size(self):
+        """Get int value for 'size'
+        Physical size of the storage unit used to hold medium data (in bytes).
+
+
+        For media whose :py:func:`state`  is :py:attr:`MediumState.inaccessible` , the value of this property is the
+        last known size. For :py:attr:`MediumState.not_created`  media,
+        the returned value is zero.
+        """
+        ret = self._get_attr("size")
+        return ret
+
+    @property
+    def format_p(self):
+        """Get str value for 'format'
+        Storage format of this medium.
+
+        The value of this attribute is a string that specifies a backend used
+        to store medium data. The storage format is defined when you create a
+        new medium or automatically detected when you open an existing medium,
+        and cannot be changed later.
+
+        The list of all storage formats supported by this VirtualBox
+        installation can be obtained using
+        :py:func:`ISystemProperties.medium_formats` .
+        """
+        ret = self._get_attr("format")
+        return ret
+
+    @property
+    def medium_format(self):
+        """Get IMediumFormat value for 'mediumFormat'
+        Storage medium format object corresponding to this medium.
+
+        The value of this attribute is a reference to the medium format object
+        that specifies the backend properties used to store medium data. The
+        storage format is defined when you create a new medium or automatically
+        detected when you open an existing medium, and cannot be changed later.
+
+        @c null is returned if there is no associated medium format
+        object. This can e.g. happen for medium objects representing host
+        drives and other special medium objects.
+        """
+        ret = self._get_attr("mediumFormat")
+        return _lib.IMediumFormat(ret)
+
+    @property
+    def type_p(self):
+        """Get or set MediumType value for 'type'
+        Type (role) of this medium.
+
+        The following constraints apply when changing the value of this
+        attribute:
+
+        If a medium is attached to a virtual machine (either in the
+        current state or in one of the snapshots), its type cannot be
+        changed.
+
+        As long as the medium has children, its type cannot be set
+        to :py:attr:`MediumType.writethrough` .
+
+        The type of all differencing media is
+        :py:attr:`MediumType.normal`  and cannot be changed.
+
+
+
+        The type of a newly created or opened medium is set to
+        :py:attr:`MediumType.normal` , except for DVD and floppy media,
+        which have a type of :py:attr:`MediumType.writethrough` .
+        """
+        ret = self._get_attr("type")
+        return _lib.MediumType(ret)
+
+    @type_p.setter
+    def type_p(self, value):
+        if not isinstance(value, _lib.MediumType):
+            raise TypeError("value is not an instance of MediumType")
+        return self._set_attr("type", value)
+
+    @property
+    def allowed_types(self):
+        """Get MediumType value for 'allowedTypes'
+        Returns which medium types can selected for this medium.
+        """
+        ret = self._get_attr("allowedTypes")
+        return [_lib.MediumType(a) for a in ret]
+
+    @property
+    def parent(self):
+        """Get IMedium value for 'parent'
+        Parent of this medium (the medium this medium is directly based
+        on).
+
+        Only differencing media have parents. For base (non-differencing)
+        media, @c null is returned.
+        """
+        ret = self._get_attr("parent")
+        return _lib.IMedium(ret)
+
+    @property
+    def children(self):
+        """Get IMedium value for 'children'
+        Children of this medium (all differencing media directly based
+        on this medium). A @c null array is returned if this medium
+        does not have any children.
+        """
+        ret = self._get_attr("children")
+        return [_lib.IMedium(a) for a in ret]
+
+    @property
+    def base(self):
+        """Get IMedium value for 'base'
+        Base medium of this medium.
+
+        If this is a differencing medium, its base medium is the medium
+        the given medium branch starts from. For all other types of media, this
+        property returns the medium object itself (i.e. the same object this
+        property is read on).
+        """
+        ret = self._get_attr("base")
+        return _lib.IMedium(ret)
+
+    @property
+    def read_only(self):
+        """Get bool value for 'readOnly'
+        Returns @c true if this medium is read-only and @c false otherwise.
+
+        A medium is considered to be read-only when its contents cannot be
+        modified without breaking the integrity of other parties that depend on
+        this medium such as its child media or snapshots of virtual machines
+        where this medium is attached to these machines. If there are no
+        children and no such snapshots then there is no dependency and the
+        medium is not read-only.
+
+        The value of this attribute can be used to determine the kind of the
+        attachment that will take place when attaching this medium to a
+        virtual machine. If the value is @c false then the medium will
+        be attached directly. If the value is @c true then the medium
+        will be attached indirectly by creating a new differencing child
+        medium for that. See the interface description for more information.
+
+        Note that all :py:attr:`MediumType.immutable` Immutable media
+        are always read-only while all
+        :py:attr:`MediumType.writethrough` Writethrough media are
+        always not.
+
+
+        The read-only condition represented by this attribute is related to
+        the medium type and usage, not to the current
+        :py:func:`IMedium.state` medium state and not to the read-only
+        state of the storage unit.
+        """
+        ret = self._get_attr("readOnly")
+        return ret
+
+    @property
+    def logical_size(self):
+        """Get int value for 'logicalSize'
+        Logical size of this medium (in bytes), as reported to the
+        guest OS running inside the virtual machine this medium is
+        attached to. The logical size is defined when the medium is created
+        and cannot be changed later.
+
+
+        For media whose state is :py:func:`state`  is :py:attr:`MediumState.inaccessible` , the value of this property is the
+        last known logical size. For :py:attr:`MediumState.not_created`
+        media, the returned value is zero.
+        """
+        ret = self._get_attr("logicalSize")
+        return ret
+
+    @property
+    def auto_reset(self):
+        """Get or set bool value for 'autoReset'
+        Whether this differencing medium will be automatically reset each
+        time a virtual machine it is attached to is powered up. This
+        attribute is automatically set to @c true for the last
+        differencing image of an "immutable" medium (see
+        :py:class:`MediumType` ).
+
+        See :py:func:`reset`  for more information about resetting
+        differencing media.
+
+
+        Reading this property on a base (non-differencing) medium will
+        always @c false. Changing the value of this property in this
+        case is not supported.
+        """
+        ret = self._get_attr("autoReset")
+        return ret
+
+    @auto_reset.setter
+    def auto_reset(self, value):
+        if not isinstance(value, bool):
+            raise TypeError("value is not an instance of bool")
+        return self._set_attr("autoReset", value)
+
+    @property
+    def last_access_error(self):
+        """Get str value for 'lastAccessError'
+        Text message that represents the result of the last accessibility
+        check performed by :py:func:`refresh_state` .
+
+        An empty string is returned if the last accessibility check
+        was successful or has not yet been called. As a result, if
+        :py:func:`state`  is "Inaccessible" and this attribute is empty,
+        then :py:func:`refresh_state`  has yet to be called; this is the
+        default value of media after VirtualBox initialization.
+        A non-empty string indicates a failure and should normally describe
+        a reason of the failure (for example, a file read error).
+        """
+        ret = self._get_attr("lastAccessError")
+        return ret
+
+    @property
+    def machine_ids(self):
+        """Get str value for 'machineIds'
+        Array of UUIDs of all machines this medium is attached to.
+
+        A @c null array is returned if this medium is not attached to any
+        machine or to any machine's snapshot.
+
+
+        The returned array will include a machine even if this medium is not
+        attached to that machine in the current state but attached to it in
+        one of the machine's snapshots. See :py:func:`get_snapshot_ids`  for
+        details.
+        """
+        ret = self._get_attr("machineIds")
+        return ret
+
+    def set_ids(self, set_image_id, image_id, set_parent_id, parent_id):
+        """Changes the UUID and parent UUID for a hard disk medium.
+
+        in set_image_id of type bool
+            Select whether a new image UUID is set or not.
+
+        in image_id of type str
+            New UUID for the image. If an empty string is passed, then a new
+            UUID is automatically created, provided that @a setImageId is @c true.
+            Specifying a zero UUID is not allowed.
+
+        in set_parent_id of type bool
+            Select whether a new parent UUID is set or not.
+
+        in parent_id of type str
+            New parent UUID for the image. If an empty string is passed, then a
+            new UUID is automatically created, provided @a setParentId is
+            @c true. A zero UUID is valid.
+
+        raises :class:`OleErrorInvalidarg`
+            Invalid parameter combination.
+
+        raises :class:`VBoxErrorNotSupported`
+            Medium is not a hard disk medium.
+
+        """
+        if not isinstance(set_image_id, bool):
+            raise TypeError("set_image_id can only be an instance of type bool")
+        if not isinstance(image_id, basestring):
+            raise TypeError("image_id can only be an instance of type basestring")
+        if not isinstance(set_parent_id, bool):
+            raise TypeError("set_parent_id can only be an instance of type bool")
+        if not isinstance(parent_id, basestring):
+            raise TypeError("parent_id can only be an instance of type basestring")
+        self._call("setIds", in_p=[set_image_id, image_id, set_parent_id, parent_id])
+
+    def refresh_state(self):
+        """If the current medium state (see :py:class:`MediumState` ) is one of
+        "Created", "Inaccessible" or "LockedRead", then this performs an
+        accessibility check on the medium and sets the value of the :py:func:`state`
+        attribute accordingly; that value is also returned for convenience.
+
+        For all other state values, this does not perform a refresh but returns
+        the state only.
+
+        The refresh, if performed, may take a long time (several seconds or even
+        minutes, depending on the storage unit location and format) because it performs an
+        accessibility check of the storage unit. This check may cause a significant
+        delay if the storage unit of the given medium is, for example, a file located
+        on a network share which is not currently accessible due to connectivity
+        problems. In that case, the call will not return until a timeout
+        interval defined by the host OS for this operation expires. For this reason,
+        it is recommended to never read this attribute on the main UI thread to avoid
+        making the UI unresponsive.
+
+        If the last known state of the medium is "Created" and the accessibility
+        check fails, then the state would be set to "Inaccessible", and
+        :py:func:`last_access_error`  may be used to get more details about the
+        failure. If the state of the medium is "LockedRead", then it remains the
+        same, and a non-empty value of :py:func:`last_access_error`  will
+        indicate a failed accessibility check in this case.
+
+        Note that not all medium states are applicable to all medium types.
+
+        return state of type :class:`MediumState`
+            New medium state.
+
+        """
+        state = self._call("refreshState")
+        state = _lib.MediumState(state)
+        return state
+
+    def get_snapshot_ids(self, machine_id):
+        """Returns an array of UUIDs of all snapshots of the given machine where
+        this medium is attached to.
+
+        If the medium is attached to the machine in the current state, then the
+        first element in the array will always be the ID of the queried machine
+        (i.e. the value equal to the @c machineId argument), followed by
+        snapshot IDs (if any).
+
+        If the medium is not attached to the machine in the current state, then
+        the array will contain only snapshot IDs.
+
+        The returned array may be @c null if this medium is not attached
+        to the given machine at all, neither in the current state nor in one of
+        the snapshots.
+
+        in machine_id of type str
+            UUID of the machine to query.
+
+        return snapshot_ids of type str
+            Array of snapshot UUIDs of the given machine using this medium.
+
+        """
+        if not isinstance(machine_id, basestring):
+            raise TypeError("machine_id can only be an instance of type basestring")
+        snapshot_ids = self._call("getSnapshotIds", in_p=[machine_id])
+        return snapshot_ids
+
+    def lock_read(self):
+        """Locks this medium for reading.
+
+                A read lock is shared: many clients can simultaneously lock the
+                same medium for reading unless it is already locked for writing (see
+                :py:func:`lock_write` ) in which case an error is returned.
+
+                When the medium is locked for reading, it cannot be modified
+                from within VirtualBox. This means that any method that changes
+                the properties of this medium or contents of the storage unit
+                will return an error (unless explicitly stated otherwise). That
+                includes an attempt to start a virtual machine that wants to
+                write to the medium.
+
+                When the virtual machine is started up, it locks for reading all
+                media it uses in read-only mode. If some medium cannot be locked
+                for reading, the startup procedure will fail.
+                A medium is typically locked for reading while it is used by a running
+                virtual machine but has a depending differencing image that receives
+                the actual write operations. This way one base medium can have
+                multiple child differencing images which can be written to
+                simultaneously. Read-only media such as DVD and floppy images are
+                also locked for reading only (so they can be in use by multiple
+                machines simultaneously).
+
+                A medium is also locked for reading when it is the source of a
+                write operation such as :py:func:`clone_to`  or :py:func:`merge_to` .
+
+                The medium locked for reading must be unlocked by abandoning the
+                returned token object, see :py:class:`IToken` . Calls to
+                :py:func:`lock_read`  can be nested and the lock is actually released
+                when all callers have abandoned the token.
+
+                This method sets the medium state (see :py:func:`state` ) to
+                "LockedRead" on success. The medium's previous state must be
+                one of "Created", "Inaccessible" or "LockedRead".
+
+                Locking an inaccessible medium is not an error; this method performs
+                a logical lock that prevents modifications of this medium through
+                the VirtualBox API, not a physical file-system lock of the underlying
+                storage unit.
+
+                This method returns the current state of the medium
+                *before* the operation.
+
+                return token of type :class:`IToken`
+                    Token object, when this is released (reference count reaches 0) then
+                    the lock count is decreased. The lock is released when the lock count
+                    reaches 0.
+
+                raises :class:`VBoxErrorInvalidObjectState`
+                    Invalid medium state (e.g. not created, locked, inaccessible,
+        creating, deleting).
+
+        """
+        token = self._call("lockRead")
+        token = _lib.IToken(token)
+        return token
+
+    def lock_write(self):
+        """Locks this medium for writing.
+
+                A write lock, as opposed to :py:func:`lock_read` , is
+                exclusive: there may be only one client holding a write lock,
+                and there may be no read locks while the write lock is held.
+                As a result, read-locking fails if a write lock is held, and
+                write-locking fails if either a read or another write lock is held.
+
+                When a medium is locked for writing, it cannot be modified
+                from within VirtualBox, and it is not guaranteed that the values
+                of its properties are up-to-date. Any method that changes the
+                properties of this medium or contents of the storage unit will
+                return an error (unless explicitly stated otherwise).
+
+                When a virtual machine is started up, it locks for writing all
+                media it uses to write data to. If any medium could not be locked
+                for writing, the startup procedure will fail. If a medium has
+                differencing images, then while the machine is running, only
+                the last ("leaf") differencing image is locked for writing,
+                whereas its parents are locked for reading only.
+
+                A medium is also locked for writing when it is the target of a
+                write operation such as :py:func:`clone_to`  or :py:func:`merge_to` .
+
+                The medium locked for writing must be unlocked by abandoning the
+                returned token object, see :py:class:`IToken` . Write locks
+                *cannot* be nested.
+
+                This method sets the medium state (see :py:func:`state` ) to
+                "LockedWrite" on success. The medium's previous state must be
+                either "Created" or "Inaccessible".
+
+                Locking an inaccessible medium is not an error; this method performs
+                a logical lock that prevents modifications of this medium through
+                the VirtualBox API, not a physical file-system lock of the underlying
+                storage unit.
+
+                return token of type :class:`IToken`
+                    Token object, when this is released (reference count reaches 0) then
+                    the lock is released.
+
+                raises :class:`VBoxErrorInvalidObjectState`
+                    Invalid medium state (e.g. not created, locked, inaccessible,
+        creating, deleting).
+
+        """
+        token = self._call("lockWrite")
+        token = _lib.IToken(token)
+        return token
+
+    def close(self):
+        """Closes this medium.
+
+                The medium must not be attached to any known virtual machine
+                and must not have any known child media, otherwise the
+                operation will fail.
+
+                When the medium is successfully closed, it is removed from
+                the list of registered media, but its storage unit is not
+                deleted. In particular, this means that this medium can
+                later be opened again using the :py:func:`IVirtualBox.open_medium`
+                call.
+
+                Note that after this method successfully returns, the given medium
+                object becomes uninitialized. This means that any attempt
+                to call any of its methods or attributes will fail with the
+                "Object not ready" (E_ACCESSDENIED) error.
+
+                raises :class:`VBoxErrorInvalidObjectState`
+                    Invalid medium state (other than not created, created or
+        inaccessible).
+
+                raises :class:`VBoxErrorObjectInUse`
+                    Medium attached to virtual machine.
+
+                raises :class:`VBoxErrorFileError`
+                    Settings file not accessible.
+
+                raises :class:`VBoxErrorXmlError`
+                    Could not parse the settings file.
+
+        """
+        self._call("close")
+
+    def get_property(self, name):
+        """Returns the value of the custom medium property with the given name.
+
+        The list of all properties supported by the given medium format can
+        be obtained with :py:func:`IMediumFormat.describe_properties` .
+
+        If this method returns an empty string in @a value, the requested
+        property is supported but currently not assigned any value.
+
+        in name of type str
+            Name of the property to get.
+
+        return value of type str
+            Current property value.
+
+        raises :class:`VBoxErrorObjectNotFound`
+            Requested property does not exist (not supported by the format).
+
+        raises :class:`OleErrorInvalidarg`
+            @a name is @c null or empty.
+
+        """
+        if not isinstance(name, basestring):
+            raise TypeError("name can only be an instance of type basestring")
+        value = self._call("getProperty", in_p=[name])
+        return value
+
+    def set_property(self, name, value):
+        """Sets the value of the custom medium property with the given name.
+
+        The list of all properties supported by the given medium format can
+        be obtained with :py:func:`IMediumFormat.describe_properties` .
+
+        Setting the property value to @c null or an empty string is
+        equivalent to deleting the existing value. A default value (if it is
+        defined for this property) will be used by the format backend in this
+        case.
+
+        in name of type str
+            Name of the property to set.
+
+        in value of type str
+            Property value to set.
+
+        raises :class:`VBoxErrorObjectNotFound`
+            Requested property does not exist (not supported by the format).
+
+        raises :class:`OleErrorInvalidarg`
+            @a name is @c null or empty.
+
+        """
+        if not isinstance(name, basestring):
+            raise TypeError("name can only be an instance of type basestring")
+        if not isinstance(value, basestring):
+            raise TypeError("value can only be an instance of type basestring")
+        self._call("setProperty", in_p=[name, value])
+
+    def get_properties(self, names):
+        """Returns values for a group of properties in one call.
+
+        The names of the properties to get are specified using the @a names
+        argument which is a list of comma-separated property names or
+        an empty string if all properties are to be returned.
+        Currently the value of this argument is ignored and the method
+        always returns all existing properties.
+
+        The list of all properties supported by the given medium format can
+        be obtained with :py:func:`IMediumFormat.describe_properties` .
+
+        The method returns two arrays, the array of property names corresponding
+        to the @a names argument and the current values of these properties.
+        Both arrays have the same number of elements with each element at the
+        given index in the first array corresponds to an element at the same
+        index in the second array.
+
+        For properties that do not have assigned values, an empty string is
+        returned at the appropriate index in the @a returnValues array.
+
+        in names of type str
+            Names of properties to get.
+
+        out return_names of type str
+            Names of returned properties.
+
+        return return_values of type str
+            Values of returned properties.
+
+        """
+        if not isinstance(names, basestring):
+            raise TypeError("names can only be an instance of type basestring")
+        return_values, return_names = self._call("getProperties", in_p=[names])
+        return (return_values, return_names)
+
+    def set_properties(self, names, values):
+        """Sets values for a group of properties in one call.
+
+        The names of the properties to set are passed in the @a names
+        array along with the new values for them in the @a values array. Both
+        arrays have the same number of elements with each element at the given
+        index in the first array corresponding to an element at the same index
+        in the second array.
+
+        If there is at least one property name in @a names that is not valid,
+        the method will fail before changing the values of any other properties
+        from the @a names array.
+
+        Using this method over :py:func:`set_property`  is preferred if you
+        need to set several properties at once since it is more efficient.
+
+        The list of all properties supported by the given medium format can
+        be obtained with :py:func:`IMediumFormat.describe_properties` .
+
+        Setting the property value to @c null or an empty string is equivalent
+        to deleting the existing value. A default value (if it is defined for
+        this property) will be used by the format backend in this case.
+
+        in names of type str
+            Names of properties to set.
+
+        in values of type str
+            Values of properties to set.
+
+        """
+        if not isinstance(names, list):
+            raise TypeError("names can only be an instance of type list")
+        for a in names[:10]:
+            if not isinstance(a, basestring):
+                raise TypeError("array can only contain objects of type basestring")
+        if not isinstance(values, list):
+            raise TypeError("values can only be an instance of type list")
+        for a in values[:10]:
+            if not isinstance(a, basestring):
+                raise TypeError("array can only contain objects of type basestring")
+        self._call("setProperties", in_p=[names, values])
+
+    def create_base_storage(self, logical_size, variant):
+        """Starts creating a hard disk storage unit (fixed/dynamic, according
+        to the variant flags) in the background. The previous storage unit
+        created for this object, if any, must first be deleted using
+        :py:func:`delete_storage` , otherwise the operation will fail.
+
+        Before the operation starts, the medium is placed in
+        :py:attr:`MediumState.creating`  state. If the create operation
+        fails, the medium will be placed back in :py:attr:`MediumState.not_created`
+        state.
+
+        After the returned progress object reports that the operation has
+        successfully completed, the medium state will be set to :py:attr:`MediumState.created` , the medium will be remembered by this
+        VirtualBox installation and may be attached to virtual machines.
+
+        in logical_size of type int
+            Maximum logical size of the medium in bytes.
+
+        in variant of type :class:`MediumVariant`
+            Exact image variant which should be created (as a combination of
+            :py:class:`MediumVariant`  flags).
+
+        return progress of type :class:`IProgress`
+            Progress object to track the operation completion.
+
+        raises :class:`VBoxErrorNotSupported`
+            The variant of storage creation operation is not supported. See
+
+        """
+        if not isinstance(logical_size, baseinteger):
+            raise TypeError("logical_size can only be an instance of type baseinteger")
+        if not isinstance(variant, list):
+            raise TypeError("variant can only be an instance of type list")
+        for a in variant[:10]:
+            if not isinstance(a, _lib.MediumVariant):
+                raise TypeError("array can only contain objects of type MediumVariant")
+        progress = self._call("createBaseStorage", in_p=[logical_size, variant])
+        progress = _lib.IProgress(progress)
+        return progress
+
+    def delete_storage(self):
+        """Starts deleting the storage unit of this medium.
+
+                The medium must not be attached to any known virtual machine and must
+                not have any known child media, otherwise the operation will fail.
+                It will also fail if there is no storage unit to delete or if deletion
+                is already in progress, or if the medium is being in use (locked for
+                read or for write) or inaccessible. Therefore, the only valid state for
+                this operation to succeed is :py:attr:`MediumState.created` .
+
+                Before the operation starts, the medium is placed in
+                :py:attr:`MediumState.deleting`  state and gets removed from the list
+                of remembered hard disks (media registry). If the delete operation
+                fails, the medium will be remembered again and placed back to
+                :py:attr:`MediumState.created`  state.
+
+                After the returned progress object reports that the operation is
+                complete, the medium state will be set to
+                :py:attr:`MediumState.not_created`  and you will be able to use one of
+                the storage creation methods to create it again.
+
+                :py:func:`close`
+
+
+
+
+                If the deletion operation fails, it is not guaranteed that the storage
+                unit still exists. You may check the :py:func:`IMedium.state`  value
+                to answer this question.
+
+                return progress of type :class:`IProgress`
+                    Progress object to track the operation completion.
+
+                raises :class:`VBoxErrorObjectInUse`
+                    Medium is attached to a virtual machine.
+
+                raises :class:`VBoxErrorNotSupported`
+                    Storage deletion is not allowed because neither of storage creation
+        operations are supported. See
+
+        """
+        progress = self._call("deleteStorage")
+        progress = _lib.IProgress(progress)
+        return progress
+
+    def create_diff_storage(self, target, variant):
+        """Starts creating an empty differencing storage unit based on this
+        medium in the format and at the location defined by the @a target
+        argument.
+
+        The target medium must be in :py:attr:`MediumState.not_created`
+        state (i.e. must not have an existing storage unit). Upon successful
+        completion, this operation will set the type of the target medium to
+        :py:attr:`MediumType.normal`  and create a storage unit necessary to
+        represent the differencing medium data in the given format (according
+        to the storage format of the target object).
+
+        After the returned progress object reports that the operation is
+        successfully complete, the target medium gets remembered by this
+        VirtualBox installation and may be attached to virtual machines.
+
+
+        The medium will be set to :py:attr:`MediumState.locked_read`
+        state for the duration of this operation.
+
+        in target of type :class:`IMedium`
+            Target medium.
+
+        in variant of type :class:`MediumVariant`
+            Exact image variant which should be created (as a combination of
+            :py:class:`MediumVariant`  flags).
+
+        return progress of type :class:`IProgress`
+            Progress object to track the operation completion.
+
+        raises :class:`VBoxErrorObjectInUse`
+            Medium not in @c NotCreated state.
+
+        """
+        if not isinstance(target, _lib.IMedium):
+            raise TypeError("target can only be an instance of type IMedium")
+        if not isinstance(variant, list):
+            raise TypeError("variant can only be an instance of type list")
+        for a in variant[:10]:
+            if not isinstance(a, _lib.MediumVariant):
+                raise TypeError("array can only contain objects of type MediumVariant")
+        progress = self._call("createDiffStorage", in_p=[target, variant])
+        progress = _lib.IProgress(progress)
+        return progress
+
+    def merge_to(self, target):
+        """Starts merging the contents of this medium and all intermediate
+        differencing media in the chain to the given target medium.
+
+        The target medium must be either a descendant of this medium or
+        its ancestor (otherwise this method will immediately return a failure).
+        It follows that there are two logical directions of the merge operation:
+        from ancestor to descendant (*forward merge*) and from descendant to
+        ancestor (*backward merge*). Let us consider the following medium
+        chain:
+
+        Base <- Diff_1 <- Diff_2
+
+        Here, calling this method on the Base medium object with
+        Diff_2 as an argument will be a forward merge; calling it on
+        Diff_2 with Base as an argument will be a backward
+        merge. Note that in both cases the contents of the resulting medium
+        will be the same, the only difference is the medium object that takes
+        the result of the merge operation. In case of the forward merge in the
+        above example, the result will be written to Diff_2; in case of
+        the backward merge, the result will be written to Base. In
+        other words, the result of the operation is always stored in the target
+        medium.
+
+        Upon successful operation completion, the storage units of all media in
+        the chain between this (source) medium and the target medium, including
+        the source medium itself, will be automatically deleted and the
+        relevant medium objects (including this medium) will become
+        uninitialized. This means that any attempt to call any of
+        their methods or attributes will fail with the
+        "Object not ready" (E_ACCESSDENIED) error. Applied to the above
+        example, the forward merge of Base to Diff_2 will
+        delete and uninitialize both Base and Diff_1 media.
+        Note that Diff_2 in this case will become a base medium
+        itself since it will no longer be based on any other medium.
+
+        Considering the above, all of the following conditions must be met in
+        order for the merge operation to succeed:
+
+
+        Neither this (source) medium nor any intermediate
+        differencing medium in the chain between it and the target
+        medium is attached to any virtual machine.
+
+
+        Neither the source medium nor the target medium is an
+        :py:attr:`MediumType.immutable`  medium.
+
+
+        The part of the medium tree from the source medium to the
+        target medium is a linear chain, i.e. all medium in this
+        chain have exactly one child which is the next medium in this
+        chain. The only exception from this rule is the target medium in
+        the forward merge operation; it is allowed to have any number of
+        child media because the merge operation will not change its
+        logical contents (as it is seen by the guest OS or by children).
+
+
+        None of the involved media are in
+        :py:attr:`MediumState.locked_read`  or
+        :py:attr:`MediumState.locked_write`  state.
+
+
+
+
+        This (source) medium and all intermediates will be placed to :py:attr:`MediumState.deleting`  state and the target medium will be
+        placed to :py:attr:`MediumState.locked_write`  state and for the
+        duration of this operation.
+
+        in target of type :class:`IMedium`
+            Target medium.
+
+        return progress of type :class:`IProgress`
+            Progress object to track the operation completion.
+
+        """
+        if not isinstance(target, _lib.IMedium):
+            raise TypeError("target can only be an instance of type IMedium")
+        progress = self._call("mergeTo", in_p=[target])
+        progress = _lib.IProgress(progress)
+        return progress
+
+    def clone_to(self, target, variant, parent):
+        """Starts creating a clone of this medium in the format and at the
+        location defined by the @a target argument.
+
+        The target medium must be either in :py:attr:`MediumState.not_created`
+        state (i.e. must not have an existing storage unit) or in
+        :py:attr:`MediumState.created`  state (i.e. created and not locked, and
+        big enough to hold the data or else the copy will be partial). Upon
+        successful completion, the cloned medium will contain exactly the
+        same sector data as the medium being cloned, except that in the
+        first case a new UUID for the clone will be randomly generated, and in
+        the second case the UUID will remain unchanged.
+
+        The @a parent argument defines which medium will be the parent
+        of the clone. Passing a @c null reference indicates that the clone will
+        be a base image, i.e. completely independent. It is possible to specify
+        an arbitrary medium for this parameter, including the parent of the
+        medium which is being cloned. Even cloning to a child of the source
+        medium is possible. Note that when cloning to an existing image, the
+        @a parent argument is ignored.
+
+        After the returned progress object reports that the operation is
+        successfully complete, the target medium gets remembered by this
+        VirtualBox installation and may be attached to virtual machines.
+
+
+        This medium will be placed to :py:attr:`MediumState.locked_read`
+        state for the duration of this operation.
+
+        in target of type :class:`IMedium`
+            Target medium.
+
+        in variant of type :class:`MediumVariant`
+            Exact image variant which should be created (as a combination of
+            :py:class:`MediumVariant`  flags).
+
+        in parent of type :class:`IMedium`
+            Parent of the cloned medium.
+
+        return progress of type :class:`IProgress`
+            Progress object to track the operation completion.
+
+        raises :class:`OleErrorNotimpl`
+            The specified cloning variant is not supported at the moment.
+
+        """
+        if not isinstance(target, _lib.IMedium):
+            raise TypeError("target can only be an instance of type IMedium")
+        if not isinstance(variant, list):
+            raise TypeError("variant can only be an instance of type list")
+        for a in variant[:10]:
+            if not isinstance(a, _lib.MediumVariant):
+                raise TypeError("array can only contain objects of type MediumVariant")
+        if not isinstance(parent, _lib.IMedium):
+            raise TypeError("parent can only be an instance of type IMedium")
+        progress = self._call("cloneTo", in_p=[target, variant, parent])
+        progress = _lib.IProgress(progress)
+        return progress
+
+    def clone_to_base(self, target, variant):
+        """Starts creating a clone of this medium in the format and at the
+        location defined by the @a target argument.
+
+        The target medium must be either in :py:attr:`MediumState.not_created`
+        state (i.e. must not have an existing storage unit) or in
+        :py:attr:`MediumState.created`  state (i.e. created and not locked, and
+        big enough to hold the data or else the copy will be partial). Upon
+        successful completion, the cloned medium will contain exactly the
+        same sector data as the medium being cloned, except that in the
+        first case a new UUID for the clone will be randomly generated, and in
+        the second case the UUID will remain unchanged.
+
+        The @a parent argument defines which medium will be the parent
+        of the clone. In this case the clone will be a base image, i.e.
+        completely independent. It is possible to specify an arbitrary
+        medium for this parameter, including the parent of the
+        medium which is being cloned. Even cloning to a child of the source
+        medium is possible. Note that when cloning to an existing image, the
+        @a parent argument is ignored.
+
+        After the returned progress object reports that the operation is
+        successfully complete, the target medium gets remembered by this
+        VirtualBox installation and may be attached to virtual machines.
+
+
+        This medium will be placed to :py:attr:`MediumState.locked_read`
+        state for the duration of this operation.
+
+        in target of type :class:`IMedium`
+            Target medium.
+
+        in variant of type :class:`MediumVariant`
+            :py:class:`MediumVariant`  flags).
+
+        return progress of type :class:`IProgress`
+            Progress object to track the operation completion.
+
+        raises :class:`OleErrorNotimpl`
+            The specified cloning variant is not supported at the moment.
+
+        """
+        if not isinstance(target, _lib.IMedium):
+            raise TypeError("target can only be an instance of type IMedium")
+        if not isinstance(variant, list):
+            raise TypeError("variant can only be an instance of type list")
+        for a in variant[:10]:
+            if not isinstance(a, _lib.MediumVariant):
+                raise TypeError("array can only contain objects of type MediumVariant")
+        progress = self._call("cloneToBase", in_p=[target, variant])
+        progress = _lib.IProgress(progress)
+        return progress
+
+    def move_to(self, location):
+        """Changes the location of this medium. Some medium types may support
+        changing the storage unit location by simply changing the value of the
+        associated property. In this case the operation is performed
+        immediately, and @a progress is returning a @c null reference.
+        Otherwise on success there is a progress object returned, which
+        signals progress and completion of the operation. This distinction is
+        necessary because for some formats the operation is very fast, while
+        for others it can be very slow (moving the image file by copying all
+        data), and in the former case it'd be a waste of resources to create
+        a progress object which will immediately signal completion.
+
+        When setting a location for a medium which corresponds to a/several
+        regular file(s) in the host's file system, the given file name may be
+        either relative to the :py:func:`IVirtualBox.home_folder` VirtualBox
+        home folder or absolute. Note that if the given location
+        specification does not contain the file extension part then a proper
+        default extension will be automatically appended by the implementation
+        depending on the medium type.
+
+        in location of type str
+            New location.
+
+        return progress of type :class:`IProgress`
+            Progress object to track the operation completion.
+
+        raises :class:`OleErrorNotimpl`
+            The operation is not implemented yet.
+
+        raises :class:`VBoxErrorNotSupported`
+            Medium format does not support changing the location.
+
+        """
+        if not isinstance(location, basestring):
+            raise TypeError("location can only be an instance of type basestring")
+        progress = self._call("moveTo", in_p=[location])
+        progress = _lib.IProgress(progress)
+        return progress
+
+    def compact(self):
+        """Starts compacting of this medium. This means that the medium is
+                transformed into a possibly more compact storage representation.
+                This potentially creates temporary images, which can require a
+                substantial amount of additional disk space.
+
+                This medium will be placed to :py:attr:`MediumState.locked_write`
+                state and all its parent media (if any) will be placed to
+                :py:attr:`MediumState.locked_read`  state for the duration of this
+                operation.
+
+                Please note that the results can be either returned straight away,
+                or later as the result of the background operation via the object
+                returned via the @a progress parameter.
+
+                return progress of type :class:`IProgress`
+                    Progress object to track the operation completion.
+
+                raises :class:`VBoxErrorNotSupported`
+                    Medium format does not support compacting (but potentially
+        needs it).
+
+        """
+        progress = self._call("compact")
+        progress = _lib.IProgress(progress)
+        return progress
+
+    def resize(self, logical_size):
+        """Starts resizing this medium. This means that the nominal size of the
+        medium is set to the new value. Both increasing and decreasing the
+        size is possible, and there are no safety checks, since VirtualBox
+        does not make any assumptions about the medium contents.
+
+        Resizing usually needs additional disk space, and possibly also
+        some temporary disk space. Note that resize does not create a full
+        temporary copy of the medium, so the additional disk space requirement
+        is usually much lower than using the clone operation.
+
+        This medium will be placed to :py:attr:`MediumState.locked_write`
+        state for the duration of this operation.
+
+        Please note that the results can be either returned straight away,
+        or later as the result of the background operation via the object
+        returned via the @a progress parameter.
+
+        in logical_size of type int
+            New nominal capacity of the medium in bytes.
+
+        return progress of type :class:`IProgress`
+            Progress object to track the operation completion.
+
+        raises :class:`VBoxErrorNotSupported`
+            Medium format does not support resizing.
+
+        """
+        if not isinstance(logical_size, baseinteger):
+            raise TypeError("logical_size can only be an instance of type baseinteger")
+        progress = self._call("resize", in_p=[logical_size])
+        progress = _lib.IProgress(progress)
+        return progress
+
+    def reset(self):
+        """Starts erasing the contents of this differencing medium.
+
+        This operation will reset the differencing medium to its initial
+        state when it does not contain any sector data and any read operation is
+        redirected to its parent medium. This automatically gets called
+        during VM power-up for every medium whose :py:func:`auto_reset`
+        attribute is @c true.
+
+        The medium will be write-locked for the duration of this operation (see
+        :py:func:`lock_write` ).
+
+        return progress of type :class:`IProgress`
+            Progress object to track the operation completion.
+
+        raises :class:`VBoxErrorNotSupported`
+            This is not a differencing medium.
+
+        raises :class:`VBoxErrorInvalidObjectState`
+            Medium is not in
+
+        """
+        progress = self._call("reset")
+        progress = _lib.IProgress(progress)
+        return progress
+
+    def change_encryption(
+        self, current_password, cipher, new_password, new_password_id
+    ):
+        """Starts encryption of this medium. This means that the stored data in the
+                medium is encrypted.
+
+                This medium will be placed to :py:attr:`MediumState.locked_write`
+                state.
+
+                Please note that the results can be either returned straight away,
+                or later as the result of the background operation via the object
+                returned via the @a progress parameter.
+
+                in current_password of type str
+                    The current password the medium is protected with. Use an empty string to indicate
+                    that the medium isn't encrypted.
+
+                in cipher of type str
+                    The cipher to use for encryption. An empty string indicates no encryption for the
+                    result.
+
+                in new_password of type str
+                    The new password the medium should be protected with. An empty password and password ID
+                    will result in the medium being encrypted with the current password.
+
+                in new_password_id of type str
+                    The ID of the new password when unlocking the medium.
+
+                return progress of type :class:`IProgress`
+                    Progress object to track the operation completion.
+
+                raises :class:`VBoxErrorNotSupported`
+                    Encryption is not supported for this medium because it is attached to more than one VM
+        or has children.
+
+        """
+        if not isinstance(current_password, basestring):
+            raise TypeError(
+                "current_password can only be an instance of type basestring"
+            )
+        if not isinstance(cipher, basestring):
+            raise TypeError("cipher can only be an instance of type basestring")
+        if not isinstance(new_password, basestring):
+            raise TypeError("new_password can only be an instance of type basestring")
+        if not isinstance(new_password_id, basestring):
+            raise TypeError(
+                "new_password_id can only be an instance of type basestring"
+            )
+        progress = self._call(
+            "changeEncryption",
+            in_p=[current_password, cipher, new_password, new_password_id],
+        )
+        progress = _lib.IProgress(progress)
+        return progress
+
+    def get_encryption_settings(self):
+        """Returns the encryption settings for this medium.
+
+        out cipher of type str
+            The cipher used for encryption.
+
+        return password_id of type str
+            The ID of the password when unlocking the medium.
+
+        raises :class:`VBoxErrorNotSupported`
+            Encryption is not configured for this medium.
+
+        """
+        password_id, cipher = self._call("getEncryptionSettings")
+        return (password_id, cipher)
+
+    def check_encryption_password(self, password):
+        """Checks whether the supplied password is correct for the medium.
+
+        in password of type str
+            The password to check.
+
+        raises :class:`VBoxErrorNotSupported`
+            Encryption is not configured for this medium.
+
+        raises :class:`VBoxErrorPasswordIncorrect`
+            The given password is incorrect.
+
+        """
+        if not isinstance(password, basestring):
+            raise TypeError("password can only be an instance of type basestring")
+        self._call("checkEncryptionPassword", in_p=[password])
+
+    def open_for_io(self, writable, password):
+        """Open the medium for I/O.
+
+        in writable of type bool
+            Set this to open the medium for both reading and writing.  When
+            not set the medium is opened readonly.
+
+        in password of type str
+            Password for accessing an encrypted medium. Must be empty if not encrypted.
+
+        return medium_io of type :class:`IMediumIO`
+            Medium I/O object.
+
+        """
+        if not isinstance(writable, bool):
+            raise TypeError("writable can only be an instance of type bool")
+        if not isinstance(password, basestring):
+            raise TypeError("password can only be an instance of type basestring")
+        medium_io = self._call("openForIO", in_p=[writable, password])
+        medium_io = _lib.IMediumIO(medium_io)
+        return medium_io
@@ -0,0 +1,312 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from ..library_base import Interface
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IMediumAttachment(Interface):
+    """
+    The IMediumAttachment interface links storage media to virtual machines.
+    For each medium (:py:class:`IMedium` ) which has been attached to a
+    storage controller (:py:class:`IStorageController` ) of a machine
+    (:py:class:`IMachine` ) via the :py:func:`IMachine.attach_device`
+    method, one instance of IMediumAttachment is added to the machine's
+    :py:func:`IMachine.medium_attachments`  array attribute.
+
+    Each medium attachment specifies the storage controller as well as a
+    port and device number and the IMedium instance representing a virtual
+    hard disk or floppy or DVD image.
+
+    For removable media (DVDs or floppies), there are two additional
+    options. For one, the IMedium instance can be @c null to represent
+    an empty drive with no media inserted (see :py:func:`IMachine.mount_medium` );
+    secondly, the medium can be one of the pseudo-media for host drives
+    listed in :py:func:`IHost.dvd_drives`  or :py:func:`IHost.floppy_drives` .
+
+    Attaching Hard Disks
+
+    Hard disks are attached to virtual machines using the
+    :py:func:`IMachine.attach_device`  method and detached using the
+    :py:func:`IMachine.detach_device`  method. Depending on a medium's
+    type (see :py:func:`IMedium.type_p` ), hard disks are attached either
+    *directly* or *indirectly*.
+
+    When a hard disk is being attached directly, it is associated with the
+    virtual machine and used for hard disk operations when the machine is
+    running. When a hard disk is being attached indirectly, a new differencing
+    hard disk linked to it is implicitly created and this differencing hard
+    disk is associated with the machine and used for hard disk operations.
+    This also means that if :py:func:`IMachine.attach_device`  performs
+    a direct attachment then the same hard disk will be returned in response
+    to the subsequent :py:func:`IMachine.get_medium`  call; however if
+    an indirect attachment is performed then
+    :py:func:`IMachine.get_medium`  will return the implicitly created
+    differencing hard disk, not the original one passed to :py:func:`IMachine.attach_device` . In detail:
+
+
+    **Normal base** hard disks that do not have children (i.e.
+    differencing hard disks linked to them) and that are not already
+    attached to virtual machines in snapshots are attached **directly**.
+    Otherwise, they are attached **indirectly** because having
+    dependent children or being part of the snapshot makes it impossible
+    to modify hard disk contents without breaking the integrity of the
+    dependent party. The :py:func:`IMedium.read_only`  attribute allows to
+    quickly determine the kind of the attachment for the given hard
+    disk. Note that if a normal base hard disk is to be indirectly
+    attached to a virtual machine with snapshots then a special
+    procedure called *smart attachment* is performed (see below).
+    **Normal differencing** hard disks are like normal base hard disks:
+    they are attached **directly** if they do not have children and are
+    not attached to virtual machines in snapshots, and **indirectly**
+    otherwise. Note that the smart attachment procedure is never performed
+    for differencing hard disks.
+    **Immutable** hard disks are always attached **indirectly** because
+    they are designed to be non-writable. If an immutable hard disk is
+    attached to a virtual machine with snapshots then a special
+    procedure called smart attachment is performed (see below).
+    **Writethrough** hard disks are always attached **directly**,
+    also as designed. This also means that writethrough hard disks cannot
+    have other hard disks linked to them at all.
+    **Shareable** hard disks are always attached **directly**,
+    also as designed. This also means that shareable hard disks cannot
+    have other hard disks linked to them at all. They behave almost
+    like writethrough hard disks, except that shareable hard disks can
+    be attached to several virtual machines which are running, allowing
+    concurrent accesses. You need special cluster software running in
+    the virtual machines to make use of such disks.
+
+
+    Note that the same hard disk, regardless of its type, may be attached to
+    more than one virtual machine at a time. In this case, the machine that is
+    started first gains exclusive access to the hard disk and attempts to
+    start other machines having this hard disk attached will fail until the
+    first machine is powered down.
+
+    Detaching hard disks is performed in a *deferred* fashion. This means
+    that the given hard disk remains associated with the given machine after a
+    successful :py:func:`IMachine.detach_device`  call until
+    :py:func:`IMachine.save_settings`  is called to save all changes to
+    machine settings to disk. This deferring is necessary to guarantee that
+    the hard disk configuration may be restored at any time by a call to
+    :py:func:`IMachine.discard_settings`  before the settings
+    are saved (committed).
+
+    Note that if :py:func:`IMachine.discard_settings`  is called after
+    indirectly attaching some hard disks to the machine but before a call to
+    :py:func:`IMachine.save_settings`  is made, it will implicitly delete
+    all differencing hard disks implicitly created by
+    :py:func:`IMachine.attach_device`  for these indirect attachments.
+    Such implicitly created hard disks will also be immediately deleted when
+    detached explicitly using the :py:func:`IMachine.detach_device`
+    call if it is made before :py:func:`IMachine.save_settings` . This
+    implicit deletion is safe because newly created differencing hard
+    disks do not contain any user data.
+
+    However, keep in mind that detaching differencing hard disks that were
+    implicitly created by :py:func:`IMachine.attach_device`
+    before the last :py:func:`IMachine.save_settings`  call will
+    **not** implicitly delete them as they may already contain some data
+    (for example, as a result of virtual machine execution). If these hard
+    disks are no more necessary, the caller can always delete them explicitly
+    using :py:func:`IMedium.delete_storage`  after they are actually de-associated
+    from this machine by the :py:func:`IMachine.save_settings`  call.
+
+    Smart Attachment
+
+    When normal base or immutable hard disks are indirectly attached to a
+    virtual machine then some additional steps are performed to make sure the
+    virtual machine will have the most recent "view" of the hard disk being
+    attached. These steps include walking through the machine's snapshots
+    starting from the current one and going through ancestors up to the first
+    snapshot. Hard disks attached to the virtual machine in all
+    of the encountered snapshots are checked whether they are descendants of
+    the given normal base or immutable hard disk. The first found child (which
+    is the differencing hard disk) will be used instead of the normal base or
+    immutable hard disk as a parent for creating a new differencing hard disk
+    that will be actually attached to the machine. And only if no descendants
+    are found or if the virtual machine does not have any snapshots then the
+    normal base or immutable hard disk will be used itself as a parent for
+    this differencing hard disk.
+
+    It is easier to explain what smart attachment does using the
+    following example:
+
+    ::
+
+         BEFORE attaching B.vdi:       AFTER attaching B.vdi:
+
+         Snapshot 1 (B.vdi)            Snapshot 1 (B.vdi)
+         Snapshot 2 (D1->B.vdi)        Snapshot 2 (D1->B.vdi)
+         Snapshot 3 (D2->D1.vdi)       Snapshot 3 (D2->D1.vdi)
+         Snapshot 4 (none)             Snapshot 4 (none)
+         CurState   (none)             CurState   (D3->D2.vdi)
+
+         NOT
+         ...
+         CurState   (D3->B.vdi)
+
+
+    The first column is the virtual machine configuration before the base hard
+    disk B.vdi is attached, the second column shows the machine after
+    this hard disk is attached. Constructs like D1->B.vdi and similar
+    mean that the hard disk that is actually attached to the machine is a
+    differencing hard disk, D1.vdi, which is linked to (based on)
+    another hard disk, B.vdi.
+
+    As we can see from the example, the hard disk B.vdi was detached
+    from the machine before taking Snapshot 4. Later, after Snapshot 4 was
+    taken, the user decides to attach B.vdi again. B.vdi has
+    dependent child hard disks (D1.vdi, D2.vdi), therefore
+    it cannot be attached directly and needs an indirect attachment (i.e.
+    implicit creation of a new differencing hard disk). Due to the smart
+    attachment procedure, the new differencing hard disk
+    (D3.vdi) will be based on D2.vdi, not on
+    B.vdi itself, since D2.vdi is the most recent view of
+    B.vdi existing for this snapshot branch of the given virtual
+    machine.
+
+    Note that if there is more than one descendant hard disk of the given base
+    hard disk found in a snapshot, and there is an exact device, channel and
+    bus match, then this exact match will be used. Otherwise, the youngest
+    descendant will be picked up.
+
+    There is one more important aspect of the smart attachment procedure which
+    is not related to snapshots at all. Before walking through the snapshots
+    as described above, the backup copy of the current list of hard disk
+    attachment is searched for descendants. This backup copy is created when
+    the hard disk configuration is changed for the first time after the last
+    :py:func:`IMachine.save_settings`  call and used by
+    :py:func:`IMachine.discard_settings`  to undo the recent hard disk
+    changes. When such a descendant is found in this backup copy, it will be
+    simply re-attached back, without creating a new differencing hard disk for
+    it. This optimization is necessary to make it possible to re-attach the
+    base or immutable hard disk to a different bus, channel or device slot
+    without losing the contents of the differencing hard disk actually
+    attached to the machine in place of it.
+    """
+
+    __uuid__ = "8d095cb0-0126-43e0-b05d-326e74abb356"
+    __wsmap__ = "struct"
+
+    @property
+    def machine(self):
+        """Get IMachine value for 'machine'
+        Machine object for this medium attachment.
+        """
+        ret = self._get_attr("machine")
+        return _lib.IMachine(ret)
+
+    @property
+    def medium(self):
+        """Get IMedium value for 'medium'
+        Medium object associated with this attachment; it
+        can be @c null for removable devices.
+        """
+        ret = self._get_attr("medium")
+        return _lib.IMedium(ret)
+
+    @property
+    def controller(self):
+        """Get str value for 'controller'
+        Name of the storage controller of this attachment; this
+        refers to one of the controllers in :py:func:`IMachine.storage_controllers`
+        by name.
+        """
+        ret = self._get_attr("controller")
+        return ret
+
+    @property
+    def port(self):
+        """Get int value for 'port'
+        Port number of this attachment.
+        See :py:func:`IMachine.attach_device`  for the meaning of this value for the different controller types.
+        """
+        ret = self._get_attr("port")
+        return ret
+
+    @property
+    def device(self):
+        """Get int value for 'device'
+        Device slot number of this attachment.
+        See :py:func:`IMachine.attach_device`  for the meaning of this value for the different controller types.
+        """
+        ret = self._get_attr("device")
+        return ret
+
+    @property
+    def type_p(self):
+        """Get DeviceType value for 'type'
+        Device type of this attachment.
+        """
+        ret = self._get_attr("type")
+        return _lib.DeviceType(ret)
+
+    @property
+    def passthrough(self):
+        """Get bool value for 'passthrough'
+        Pass I/O requests through to a device on the host.
+        """
+        ret = self._get_attr("passthrough")
+        return ret
+
+    @property
+    def temporary_eject(self):
+        """Get bool value for 'temporaryEject'
+        Whether guest-triggered eject results in unmounting the medium.
+        """
+        ret = self._get_attr("temporaryEject")
+        return ret
+
+    @property
+    def is_ejected(self):
+        """Get bool value for 'isEjected'
+        Signals that the removable medium has been ejected. This is not
+        necessarily equivalent to having a @c null medium association.
+        """
+        ret = self._get_attr("isEjected")
+        return ret
+
+    @property
+    def non_rotational(self):
+        """Get bool value for 'nonRotational'
+        Whether the associated medium is non-rotational.
+        """
+        ret = self._get_attr("nonRotational")
+        return ret
+
+    @property
+    def discard(self):
+        """Get bool value for 'discard'
+        Whether the associated medium supports discarding unused blocks.
+        """
+        ret = self._get_attr("discard")
+        return ret
+
+    @property
+    def hot_pluggable(self):
+        """Get bool value for 'hotPluggable'
+        Whether this attachment is hot pluggable or not.
+        """
+        ret = self._get_attr("hotPluggable")
+        return ret
+
+    @property
+    def bandwidth_group(self):
+        """Get IBandwidthGroup value for 'bandwidthGroup'
+        The bandwidth group this medium attachment is assigned to.
+        """
+        ret = self._get_attr("bandwidthGroup")
+        return _lib.IBandwidthGroup(ret)
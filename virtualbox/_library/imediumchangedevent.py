@@ -0,0 +1,38 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from .ievent import IEvent
+from .vboxeventtype import VBoxEventType
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IMediumChangedEvent(IEvent):
+    """
+    Notification when a
+    :py:func:`IMachine.medium_attachments` medium attachment
+    changes.
+    """
+
+    __uuid__ = "0FE2DA40-5637-472A-9736-72019EABD7DE"
+    __wsmap__ = "managed"
+    id = VBoxEventType.on_medium_changed
+
+    @property
+    def medium_attachment(self):
+        """Get IMediumAttachment value for 'mediumAttachment'
+        Medium attachment that is subject to change.
+        """
+        ret = self._get_attr("mediumAttachment")
+        return _lib.IMediumAttachment(ret)
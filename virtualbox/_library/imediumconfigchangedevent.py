@@ -0,0 +1,37 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from .ievent import IEvent
+from .vboxeventtype import VBoxEventType
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IMediumConfigChangedEvent(IEvent):
+    """
+    The configuration of the given medium was changed (location, properties,
+    child/parent or anything else).
+    """
+
+    __uuid__ = "dd3e2654-a161-41f1-b583-4892f4a9d5d5"
+    __wsmap__ = "managed"
+    id = VBoxEventType.on_medium_config_changed
+
+    @property
+    def medium(self):
+        """Get IMedium value for 'medium'
+        ID of the medium this event relates to.
+        """
+        ret = self._get_attr("medium")
+        return _lib.IMedium(ret)
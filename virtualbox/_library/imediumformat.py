@@ -0,0 +1,142 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from ..library_base import Interface
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IMediumFormat(Interface):
+    """
+    The IMediumFormat interface represents a medium format.
+
+    Each medium format has an associated backend which is used to handle
+    media stored in this format. This interface provides information
+    about the properties of the associated backend.
+
+    Each medium format is identified by a string represented by the
+    :py:func:`id_p`  attribute. This string is used in calls like
+    :py:func:`IVirtualBox.create_medium`  to specify the desired
+    format.
+
+    The list of all supported medium formats can be obtained using
+    :py:func:`ISystemProperties.medium_formats` .
+
+    :py:class:`IMedium`
+    """
+
+    __uuid__ = "11be93c7-a862-4dc9-8c89-bf4ba74a886a"
+    __wsmap__ = "managed"
+
+    @property
+    def id_p(self):
+        """Get str value for 'id'
+        Identifier of this format.
+
+        The format identifier is a non-@c null non-empty ASCII string. Note that
+        this string is case-insensitive. This means that, for example, all of
+        the following strings:
+
+        ::
+
+             "VDI"
+             "vdi"
+             "VdI"
+
+
+        refer to the same medium format.
+
+        This string is used in methods of other interfaces where it is necessary
+        to specify a medium format, such as
+        :py:func:`IVirtualBox.create_medium` .
+        """
+        ret = self._get_attr("id")
+        return ret
+
+    @property
+    def name(self):
+        """Get str value for 'name'
+        Human readable description of this format.
+
+        Mainly for use in file open dialogs.
+        """
+        ret = self._get_attr("name")
+        return ret
+
+    @property
+    def capabilities(self):
+        """Get MediumFormatCapabilities value for 'capabilities'
+        Capabilities of the format as an array of the flags.
+
+        For the meaning of individual capability flags see
+        :py:class:`MediumFormatCapabilities` .
+        """
+        ret = self._get_attr("capabilities")
+        return [_lib.MediumFormatCapabilities(a) for a in ret]
+
+    def describe_file_extensions(self):
+        """Returns two arrays describing the supported file extensions.
+
+        The first array contains the supported extensions and the seconds one
+        the type each extension supports. Both have the same size.
+
+        Note that some backends do not work on files, so this array may be
+        empty.
+
+        :py:func:`IMediumFormat.capabilities`
+
+        out extensions of type str
+            The array of supported extensions.
+
+        out types of type :class:`DeviceType`
+            The array which indicates the device type for every given extension.
+
+        """
+        extensions, types = self._call("describeFileExtensions")
+        types = [_lib.DeviceType(a) for a in types]
+        return (extensions, types)
+
+    def describe_properties(self):
+        """Returns several arrays describing the properties supported by this
+        format.
+
+        An element with the given index in each array describes one
+        property. Thus, the number of elements in each returned array is the
+        same and corresponds to the number of supported properties.
+
+        The returned arrays are filled in only if the
+        :py:attr:`MediumFormatCapabilities.properties`  flag is set.
+        All arguments must be non-@c null.
+
+        :py:class:`DataType` , :py:class:`DataFlags`
+
+        out names of type str
+            Array of property names.
+
+        out descriptions of type str
+            Array of property descriptions.
+
+        out types of type :class:`DataType`
+            Array of property types.
+
+        out flags of type int
+            Array of property flags.
+
+        out defaults of type str
+            Array of default property values.
+
+        """
+        names, descriptions, types, flags, defaults = self._call("describeProperties")
+        types = [_lib.DataType(a) for a in types]
+        return (names, descriptions, types, flags, defaults)
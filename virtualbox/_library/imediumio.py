@@ -0,0 +1,203 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from ..library_base import Interface
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IMediumIO(Interface):
+    """
+    The IMediumIO interface is used to access and modify the content of a
+    medium.  It is returned by :py:func:`IMedium.open_for_io` .
+    """
+
+    __uuid__ = "e4b301a9-5f86-4d65-ad1b-87ca284fb1c8"
+    __wsmap__ = "managed"
+
+    @property
+    def medium(self):
+        """Get IMedium value for 'medium'
+        The open medium.
+        """
+        ret = self._get_attr("medium")
+        return _lib.IMedium(ret)
+
+    @property
+    def writable(self):
+        """Get bool value for 'writable'
+        Whether the medium can be written to. (It can always be read from.)
+        """
+        ret = self._get_attr("writable")
+        return ret
+
+    @property
+    def explorer(self):
+        """Get IVFSExplorer value for 'explorer'
+        Returns the virtual file system explorer for the medium.
+
+        This will attempt to recognize the format of the medium content and
+        present it as a virtual directory structure to the API user.
+
+        A FAT floppy image will be represented will a single root subdir 'fat12'
+        that gives access to the file system content.
+
+        A ISO-9660 image will have one subdir in the root for each format present
+        in the image, so the API user can select which data view to access (iso9660,
+        rockridge, joliet, udf, hfs, ...).
+
+        A partitioned harddisk image will have subdirs for each partition.  The
+        the filesystem content of each partition can be accessed thru the subdirs
+        if we have a file system interpreter for it.  There will also be raw files
+        for each subdirectory, to provide a simple way of accessing raw partition
+        data from an API client.
+
+        Please note that the explorer may show inconsistent information if
+        the API user modifies the raw image content after it was opened.
+        """
+        ret = self._get_attr("explorer")
+        return _lib.IVFSExplorer(ret)
+
+    def read(self, offset, size):
+        """Read data from the medium.
+
+        in offset of type int
+            The byte offset into the medium to start reading at.
+
+        in size of type int
+            How many bytes to try read.
+
+        return data of type str
+            Array of data read. This may be shorter than the specified size.
+
+        """
+        if not isinstance(offset, baseinteger):
+            raise TypeError("offset can only be an instance of type baseinteger")
+        if not isinstance(size, baseinteger):
+            raise TypeError("size can only be an instance of type baseinteger")
+        data = self._call("read", in_p=[offset, size])
+        return data
+
+    def write(self, offset, data):
+        """Write data to the medium.
+
+        in offset of type int
+            The byte offset into the medium to start reading at.
+
+        in data of type str
+            Array of data to write.
+
+        return written of type int
+            How many bytes were actually written.
+
+        """
+        if not isinstance(offset, baseinteger):
+            raise TypeError("offset can only be an instance of type baseinteger")
+        if not isinstance(data, list):
+            raise TypeError("data can only be an instance of type list")
+        for a in data[:10]:
+            if not isinstance(a, basestring):
+                raise TypeError("array can only contain objects of type basestring")
+        written = self._call("write", in_p=[offset, data])
+        return written
+
+    def format_fat(self, quick):
+        """Formats the medium as FAT.  Generally only useful for floppy images as
+        no partition table will be created.
+
+        in quick of type bool
+            Quick format it when set.
+
+        """
+        if not isinstance(quick, bool):
+            raise TypeError("quick can only be an instance of type bool")
+        self._call("formatFAT", in_p=[quick])
+
+    def initialize_partition_table(self, format_p, whole_disk_in_one_entry):
+        """Writes an empty partition table to the disk.
+
+        in format_p of type :class:`PartitionTableType`
+            The partition table format.
+
+        in whole_disk_in_one_entry of type bool
+            When @c true a partition table entry for the whole disk is created.
+            Otherwise the partition table is empty.
+
+        """
+        if not isinstance(format_p, _lib.PartitionTableType):
+            raise TypeError(
+                "format_p can only be an instance of type PartitionTableType"
+            )
+        if not isinstance(whole_disk_in_one_entry, bool):
+            raise TypeError(
+                "whole_disk_in_one_entry can only be an instance of type bool"
+            )
+        self._call("initializePartitionTable", in_p=[format_p, whole_disk_in_one_entry])
+
+    def convert_to_stream(self, format_p, variant, buffer_size):
+        """Converts the currently opened image into a stream of the specified
+        image type/variant. It is sufficient to open the image in read-only
+        mode. Only few types and variants are supported due to the inherent
+        restrictions of the output style.
+
+        in format_p of type str
+            Identifier of the storage format to use for output.
+
+        in variant of type :class:`MediumVariant`
+            The partition table format.
+
+        in buffer_size of type int
+            Requested buffer size (in bytes) for efficient conversion. Sizes
+            which are too small or too large are silently truncated to suitable
+            values. Tens to hundreds of Megabytes are a good choice.
+
+        out stream of type :class:`IDataStream`
+            Data stream object for reading the target image.
+
+        return progress of type :class:`IProgress`
+            Progress object to track the operation completion.
+
+        raises :class:`VBoxErrorNotSupported`
+            The requested format/variant combination cannot handle stream output.
+
+        raises :class:`VBoxErrorFileError`
+            An error occurred during the conversion.
+
+        """
+        if not isinstance(format_p, basestring):
+            raise TypeError("format_p can only be an instance of type basestring")
+        if not isinstance(variant, list):
+            raise TypeError("variant can only be an instance of type list")
+        for a in variant[:10]:
+            if not isinstance(a, _lib.MediumVariant):
+                raise TypeError("array can only contain objects of type MediumVariant")
+        if not isinstance(buffer_size, baseinteger):
+            raise TypeError("buffer_size can only be an instance of type baseinteger")
+        progress, stream = self._call(
+            "convertToStream", in_p=[format_p, variant, buffer_size]
+        )
+        progress = _lib.IProgress(progress)
+        stream = _lib.IDataStream(stream)
+        return (progress, stream)
+
+    def close(self):
+        """Explictly close the medium I/O rather than waiting for garbage
+        collection and the destructor.
+
+        This will wait for any pending reads and writes to complete and then
+        close down the I/O access without regard for open explorer instances or
+        anything like that.
+
+        """
+        self._call("close")
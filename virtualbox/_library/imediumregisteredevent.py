@@ -0,0 +1,54 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from .ievent import IEvent
+from .vboxeventtype import VBoxEventType
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IMediumRegisteredEvent(IEvent):
+    """
+    The given medium was registered or unregistered
+    within this VirtualBox installation.
+    """
+
+    __uuid__ = "53fac49a-b7f1-4a5a-a4ef-a11dd9c2a458"
+    __wsmap__ = "managed"
+    id = VBoxEventType.on_medium_registered
+
+    @property
+    def medium_id(self):
+        """Get str value for 'mediumId'
+        ID of the medium this event relates to.
+        """
+        ret = self._get_attr("mediumId")
+        return ret
+
+    @property
+    def medium_type(self):
+        """Get DeviceType value for 'mediumType'
+        Type of the medium this event relates to.
+        """
+        ret = self._get_attr("mediumType")
+        return _lib.DeviceType(ret)
+
+    @property
+    def registered(self):
+        """Get bool value for 'registered'
+        If @c true, the medium was registered, otherwise it was
+        unregistered.
+        """
+        ret = self._get_attr("registered")
+        return ret
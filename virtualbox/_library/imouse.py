@@ -0,0 +1,291 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from ..library_base import Interface
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IMouse(Interface):
+    """
+    The IMouse interface represents the virtual machine's mouse. Used in
+    :py:func:`IConsole.mouse` .
+
+    Through this interface, the virtual machine's virtual mouse can be
+    controlled.
+    """
+
+    __uuid__ = "10cd08d0-e8b8-4838-b10c-45ba193734c1"
+    __wsmap__ = "managed"
+
+    @property
+    def absolute_supported(self):
+        """Get bool value for 'absoluteSupported'
+        Whether the guest OS supports absolute mouse pointer positioning
+        or not.
+
+        You can use the :py:class:`IMouseCapabilityChangedEvent`
+        event to be instantly informed about changes of this attribute
+        during virtual machine execution.
+
+        :py:func:`put_mouse_event_absolute`
+        """
+        ret = self._get_attr("absoluteSupported")
+        return ret
+
+    @property
+    def relative_supported(self):
+        """Get bool value for 'relativeSupported'
+        Whether the guest OS supports relative mouse pointer positioning
+        or not.
+
+        You can use the :py:class:`IMouseCapabilityChangedEvent`
+        event to be instantly informed about changes of this attribute
+        during virtual machine execution.
+
+        :py:func:`put_mouse_event`
+        """
+        ret = self._get_attr("relativeSupported")
+        return ret
+
+    @property
+    def multi_touch_supported(self):
+        """Get bool value for 'multiTouchSupported'
+        Whether the guest OS has enabled the multi-touch reporting device.
+
+        You can use the :py:class:`IMouseCapabilityChangedEvent`
+        event to be instantly informed about changes of this attribute
+        during virtual machine execution.
+
+        :py:func:`put_mouse_event`
+        """
+        ret = self._get_attr("multiTouchSupported")
+        return ret
+
+    @property
+    def needs_host_cursor(self):
+        """Get bool value for 'needsHostCursor'
+        Whether the guest OS can currently switch to drawing it's own mouse
+        cursor on demand.
+
+        You can use the :py:class:`IMouseCapabilityChangedEvent`
+        event to be instantly informed about changes of this attribute
+        during virtual machine execution.
+
+        :py:func:`put_mouse_event`
+        """
+        ret = self._get_attr("needsHostCursor")
+        return ret
+
+    @property
+    def pointer_shape(self):
+        """Get IMousePointerShape value for 'pointerShape'
+        The current mouse pointer used by the guest.
+        """
+        ret = self._get_attr("pointerShape")
+        return _lib.IMousePointerShape(ret)
+
+    def put_mouse_event(self, dx, dy, dz, dw, button_state):
+        """Initiates a mouse event using relative pointer movements
+        along x and y axis.
+
+        in dx of type int
+            Amount of pixels the mouse should move to the right.
+            Negative values move the mouse to the left.
+
+        in dy of type int
+            Amount of pixels the mouse should move downwards.
+            Negative values move the mouse upwards.
+
+        in dz of type int
+            Amount of mouse wheel moves.
+            Positive values describe clockwise wheel rotations,
+            negative values describe counterclockwise rotations.
+
+        in dw of type int
+            Amount of horizontal mouse wheel moves.
+            Positive values describe a movement to the left,
+            negative values describe a movement to the right.
+
+        in button_state of type int
+            The current state of mouse buttons. Every bit represents
+            a mouse button as follows:
+
+            Bit 0 (0x01)left mouse button
+            Bit 1 (0x02)right mouse button
+            Bit 2 (0x04)middle mouse button
+
+            A value of 1 means the corresponding button is pressed.
+            otherwise it is released.
+
+        raises :class:`OleErrorAccessdenied`
+            Console not powered up.
+
+        raises :class:`VBoxErrorIprtError`
+            Could not send mouse event to virtual mouse.
+
+        """
+        if not isinstance(dx, baseinteger):
+            raise TypeError("dx can only be an instance of type baseinteger")
+        if not isinstance(dy, baseinteger):
+            raise TypeError("dy can only be an instance of type baseinteger")
+        if not isinstance(dz, baseinteger):
+            raise TypeError("dz can only be an instance of type baseinteger")
+        if not isinstance(dw, baseinteger):
+            raise TypeError("dw can only be an instance of type baseinteger")
+        if not isinstance(button_state, baseinteger):
+            raise TypeError("button_state can only be an instance of type baseinteger")
+        self._call("putMouseEvent", in_p=[dx, dy, dz, dw, button_state])
+
+    def put_mouse_event_absolute(self, x, y, dz, dw, button_state):
+        """Positions the mouse pointer using absolute x and y coordinates.
+        These coordinates are expressed in pixels and
+        start from [1,1] which corresponds to the top left
+        corner of the virtual display.  The values [-1,-1] and
+        [0x7fffffff,0x7fffffff] have special meanings as
+        respectively "no data" (to signal that the host wishes to report
+        absolute pointer data in future) and "out of range" (the host
+        pointer is outside of all guest windows).
+
+
+
+
+        This method will have effect only if absolute mouse
+        positioning is supported by the guest OS.
+
+
+        :py:func:`absolute_supported`
+
+        in x of type int
+            X coordinate of the pointer in pixels, starting from @c 1.
+
+        in y of type int
+            Y coordinate of the pointer in pixels, starting from @c 1.
+
+        in dz of type int
+            Amount of mouse wheel moves.
+            Positive values describe clockwise wheel rotations,
+            negative values describe counterclockwise rotations.
+
+        in dw of type int
+            Amount of horizontal mouse wheel moves.
+            Positive values describe a movement to the left,
+            negative values describe a movement to the right.
+
+        in button_state of type int
+            The current state of mouse buttons. Every bit represents
+            a mouse button as follows:
+
+            Bit 0 (0x01)left mouse button
+            Bit 1 (0x02)right mouse button
+            Bit 2 (0x04)middle mouse button
+
+            A value of @c 1 means the corresponding button is pressed.
+            otherwise it is released.
+
+        raises :class:`OleErrorAccessdenied`
+            Console not powered up.
+
+        raises :class:`VBoxErrorIprtError`
+            Could not send mouse event to virtual mouse.
+
+        """
+        if not isinstance(x, baseinteger):
+            raise TypeError("x can only be an instance of type baseinteger")
+        if not isinstance(y, baseinteger):
+            raise TypeError("y can only be an instance of type baseinteger")
+        if not isinstance(dz, baseinteger):
+            raise TypeError("dz can only be an instance of type baseinteger")
+        if not isinstance(dw, baseinteger):
+            raise TypeError("dw can only be an instance of type baseinteger")
+        if not isinstance(button_state, baseinteger):
+            raise TypeError("button_state can only be an instance of type baseinteger")
+        self._call("putMouseEventAbsolute", in_p=[x, y, dz, dw, button_state])
+
+    def put_event_multi_touch(self, count, contacts, scan_time):
+        """Sends a multi-touch pointer event. The coordinates are expressed in
+        pixels and start from [1,1] which corresponds to the top left
+        corner of the virtual display.
+
+
+
+
+        The guest may not understand or may choose to ignore this event.
+
+
+        :py:func:`multi_touch_supported`
+
+        in count of type int
+            Number of contacts in the event.
+
+        in contacts of type int
+            Each array element contains packed information about one contact.
+            Bits 0..15: X coordinate in pixels.
+            Bits 16..31: Y coordinate in pixels.
+            Bits 32..39: contact identifier.
+            Bit 40: "in contact" flag, which indicates that there is a contact with the touch surface.
+            Bit 41: "in range" flag, the contact is close enough to the touch surface.
+            All other bits are reserved for future use and must be set to 0.
+
+        in scan_time of type int
+            Timestamp of the event in milliseconds. Only relative time between events is important.
+
+        raises :class:`OleErrorAccessdenied`
+            Console not powered up.
+
+        raises :class:`VBoxErrorIprtError`
+            Could not send event to virtual device.
+
+        """
+        if not isinstance(count, baseinteger):
+            raise TypeError("count can only be an instance of type baseinteger")
+        if not isinstance(contacts, list):
+            raise TypeError("contacts can only be an instance of type list")
+        for a in contacts[:10]:
+            if not isinstance(a, baseinteger):
+                raise TypeError("array can only contain objects of type baseinteger")
+        if not isinstance(scan_time, baseinteger):
+            raise TypeError("scan_time can only be an instance of type baseinteger")
+        self._call("putEventMultiTouch", in_p=[count, contacts, scan_time])
+
+    def put_event_multi_touch_string(self, count, contacts, scan_time):
+        """:py:func:`put_event_multi_touch`
+
+        in count of type int
+            :py:func:`put_event_multi_touch`
+
+        in contacts of type str
+            Contains information about all contacts:
+            "id1,x1,y1,inContact1,inRange1;...;idN,xN,yN,inContactN,inRangeN".
+            For example for two contacts: "0,10,20,1,1;1,30,40,1,1"
+
+        in scan_time of type int
+            :py:func:`put_event_multi_touch`
+
+        """
+        if not isinstance(count, baseinteger):
+            raise TypeError("count can only be an instance of type baseinteger")
+        if not isinstance(contacts, basestring):
+            raise TypeError("contacts can only be an instance of type basestring")
+        if not isinstance(scan_time, baseinteger):
+            raise TypeError("scan_time can only be an instance of type baseinteger")
+        self._call("putEventMultiTouchString", in_p=[count, contacts, scan_time])
+
+    @property
+    def event_source(self):
+        """Get IEventSource value for 'eventSource'
+        Event source for mouse events.
+        """
+        ret = self._get_attr("eventSource")
+        return _lib.IEventSource(ret)
@@ -0,0 +1,61 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from .ievent import IEvent
+from .vboxeventtype import VBoxEventType
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IMouseCapabilityChangedEvent(IEvent):
+    """
+    Notification when the mouse capabilities reported by the
+    guest have changed. The new capabilities are passed.
+    """
+
+    __uuid__ = "70e7779a-e64a-4908-804e-371cad23a756"
+    __wsmap__ = "managed"
+    id = VBoxEventType.on_mouse_capability_changed
+
+    @property
+    def supports_absolute(self):
+        """Get bool value for 'supportsAbsolute'
+        Supports absolute coordinates.
+        """
+        ret = self._get_attr("supportsAbsolute")
+        return ret
+
+    @property
+    def supports_relative(self):
+        """Get bool value for 'supportsRelative'
+        Supports relative coordinates.
+        """
+        ret = self._get_attr("supportsRelative")
+        return ret
+
+    @property
+    def supports_multi_touch(self):
+        """Get bool value for 'supportsMultiTouch'
+        Supports multi-touch events coordinates.
+        """
+        ret = self._get_attr("supportsMultiTouch")
+        return ret
+
+    @property
+    def needs_host_cursor(self):
+        """Get bool value for 'needsHostCursor'
+        If host cursor is needed.
+        """
+        ret = self._get_attr("needsHostCursor")
+        return ret
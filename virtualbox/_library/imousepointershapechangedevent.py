@@ -0,0 +1,110 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from .ievent import IEvent
+from .vboxeventtype import VBoxEventType
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IMousePointerShapeChangedEvent(IEvent):
+    """
+    Notification when the guest mouse pointer shape has
+    changed. The new shape data is given.
+    """
+
+    __uuid__ = "a6dcf6e8-416b-4181-8c4a-45ec95177aef"
+    __wsmap__ = "managed"
+    id = VBoxEventType.on_mouse_pointer_shape_changed
+
+    @property
+    def visible(self):
+        """Get bool value for 'visible'
+        Flag whether the pointer is visible.
+        """
+        ret = self._get_attr("visible")
+        return ret
+
+    @property
+    def alpha(self):
+        """Get bool value for 'alpha'
+        Flag whether the pointer has an alpha channel.
+        """
+        ret = self._get_attr("alpha")
+        return ret
+
+    @property
+    def xhot(self):
+        """Get int value for 'xhot'
+        The pointer hot spot X coordinate.
+        """
+        ret = self._get_attr("xhot")
+        return ret
+
+    @property
+    def yhot(self):
+        """Get int value for 'yhot'
+        The pointer hot spot Y coordinate.
+        """
+        ret = self._get_attr("yhot")
+        return ret
+
+    @property
+    def width(self):
+        """Get int value for 'width'
+        Width of the pointer shape in pixels.
+        """
+        ret = self._get_attr("width")
+        return ret
+
+    @property
+    def height(self):
+        """Get int value for 'height'
+        Height of the pointer shape in pixels.
+        """
+        ret = self._get_attr("height")
+        return ret
+
+    @property
+    def shape(self):
+        """Get str value for 'shape'
+        Shape buffer arrays.
+
+        The @a shape buffer contains a 1-bpp (bits per pixel) AND mask
+        followed by a 32-bpp XOR (color) mask.
+
+        For pointers without alpha channel the XOR mask pixels are
+        32-bit values: (lsb)BGR0(msb). For pointers with alpha channel
+        the XOR mask consists of (lsb)BGRA(msb) 32-bit values.
+
+        An AND mask is used for pointers with alpha channel, so if the
+        callback does not support alpha, the pointer could be
+        displayed as a normal color pointer.
+
+        The AND mask is a 1-bpp bitmap with byte aligned scanlines. The
+        size of the AND mask therefore is cbAnd = (width + 7) / 8 *
+        height. The padding bits at the end of each scanline are
+        undefined.
+
+        The XOR mask follows the AND mask on the next 4-byte aligned
+        offset: uint8_t *pXor = pAnd + (cbAnd + 3) & ~3.
+        Bytes in the gap between the AND and the XOR mask are undefined.
+        The XOR mask scanlines have no gap between them and the size of
+        the XOR mask is: cXor = width * 4 * height.
+
+
+        If @a shape is 0, only the pointer visibility is changed.
+        """
+        ret = self._get_attr("shape")
+        return ret
@@ -0,0 +1,47 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class ImportOptions(Enum):
+    """Import options, used with :py:func:`IAppliance.import_machines` .
+
+
+    .. describe:: keep_all_ma_cs(1)
+
+            Don't generate new MAC addresses of the attached network adapters.
+
+    .. describe:: keep_natma_cs(2)
+
+            Don't generate new MAC addresses of the attached network adapters when they are using NAT.
+
+    .. describe:: import_to_vdi(3)
+
+            Import all disks to VDI format
+
+    """
+
+    __uuid__ = "0a981523-3b20-4004-8ee3-dfd322202ace"
+    _enums = [
+        (
+            "KeepAllMACs",
+            1,
+            """Don't generate new MAC addresses of the attached network adapters.""",
+        ),
+        (
+            "KeepNATMACs",
+            2,
+            """Don't generate new MAC addresses of the attached network adapters when they are using NAT.""",
+        ),
+        ("ImportToVDI", 3, """Import all disks to VDI format"""),
+    ]
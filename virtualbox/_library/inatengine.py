@@ -0,0 +1,278 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from ..library_base import Interface
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class INATEngine(Interface):
+    """
+    Interface for managing a NAT engine which is used with a virtual machine. This
+    allows for changing NAT behavior such as port-forwarding rules. This interface is
+    used in the :py:func:`INetworkAdapter.nat_engine`  attribute.
+    """
+
+    __uuid__ = "8faef61e-6e15-4f71-a6a5-94e707fafbcc"
+    __wsmap__ = "managed"
+
+    @property
+    def network(self):
+        """Get or set str value for 'network'
+        The network attribute of the NAT engine (the same value is used with built-in
+        DHCP server to fill corresponding fields of DHCP leases).
+        """
+        ret = self._get_attr("network")
+        return ret
+
+    @network.setter
+    def network(self, value):
+        if not isinstance(value, basestring):
+            raise TypeError("value is not an instance of basestring")
+        return self._set_attr("network", value)
+
+    @property
+    def host_ip(self):
+        """Get or set str value for 'hostIP'
+        IP of host interface to bind all opened sockets to.
+        Changing this does not change binding of port forwarding.
+        """
+        ret = self._get_attr("hostIP")
+        return ret
+
+    @host_ip.setter
+    def host_ip(self, value):
+        if not isinstance(value, basestring):
+            raise TypeError("value is not an instance of basestring")
+        return self._set_attr("hostIP", value)
+
+    @property
+    def tftp_prefix(self):
+        """Get or set str value for 'TFTPPrefix'
+        TFTP prefix attribute which is used with the built-in DHCP server to fill
+        the corresponding fields of DHCP leases.
+        """
+        ret = self._get_attr("TFTPPrefix")
+        return ret
+
+    @tftp_prefix.setter
+    def tftp_prefix(self, value):
+        if not isinstance(value, basestring):
+            raise TypeError("value is not an instance of basestring")
+        return self._set_attr("TFTPPrefix", value)
+
+    @property
+    def tftp_boot_file(self):
+        """Get or set str value for 'TFTPBootFile'
+        TFTP boot file attribute which is used with the built-in DHCP server to fill
+        the corresponding fields of DHCP leases.
+        """
+        ret = self._get_attr("TFTPBootFile")
+        return ret
+
+    @tftp_boot_file.setter
+    def tftp_boot_file(self, value):
+        if not isinstance(value, basestring):
+            raise TypeError("value is not an instance of basestring")
+        return self._set_attr("TFTPBootFile", value)
+
+    @property
+    def tftp_next_server(self):
+        """Get or set str value for 'TFTPNextServer'
+        TFTP server attribute which is used with the built-in DHCP server to fill
+        the corresponding fields of DHCP leases.
+        The preferred form is IPv4 addresses.
+        """
+        ret = self._get_attr("TFTPNextServer")
+        return ret
+
+    @tftp_next_server.setter
+    def tftp_next_server(self, value):
+        if not isinstance(value, basestring):
+            raise TypeError("value is not an instance of basestring")
+        return self._set_attr("TFTPNextServer", value)
+
+    @property
+    def alias_mode(self):
+        """Get or set int value for 'aliasMode'"""
+        ret = self._get_attr("aliasMode")
+        return ret
+
+    @alias_mode.setter
+    def alias_mode(self, value):
+        if not isinstance(value, baseinteger):
+            raise TypeError("value is not an instance of baseinteger")
+        return self._set_attr("aliasMode", value)
+
+    @property
+    def dns_pass_domain(self):
+        """Get or set bool value for 'DNSPassDomain'
+        Whether the DHCP server should pass the DNS domain used by the host.
+        """
+        ret = self._get_attr("DNSPassDomain")
+        return ret
+
+    @dns_pass_domain.setter
+    def dns_pass_domain(self, value):
+        if not isinstance(value, bool):
+            raise TypeError("value is not an instance of bool")
+        return self._set_attr("DNSPassDomain", value)
+
+    @property
+    def dns_proxy(self):
+        """Get or set bool value for 'DNSProxy'
+        Whether the DHCP server (and the DNS traffic by NAT) should pass the address
+        of the DNS proxy and process traffic using DNS servers registered on the host.
+        """
+        ret = self._get_attr("DNSProxy")
+        return ret
+
+    @dns_proxy.setter
+    def dns_proxy(self, value):
+        if not isinstance(value, bool):
+            raise TypeError("value is not an instance of bool")
+        return self._set_attr("DNSProxy", value)
+
+    @property
+    def dns_use_host_resolver(self):
+        """Get or set bool value for 'DNSUseHostResolver'
+        Whether the DHCP server (and the DNS traffic by NAT) should pass the address
+        of the DNS proxy and process traffic using the host resolver mechanism.
+        """
+        ret = self._get_attr("DNSUseHostResolver")
+        return ret
+
+    @dns_use_host_resolver.setter
+    def dns_use_host_resolver(self, value):
+        if not isinstance(value, bool):
+            raise TypeError("value is not an instance of bool")
+        return self._set_attr("DNSUseHostResolver", value)
+
+    @property
+    def redirects(self):
+        """Get str value for 'redirects'
+        Array of NAT port-forwarding rules in string representation, in the following
+        format: "name,protocol id,host ip,host port,guest ip,guest port".
+        """
+        ret = self._get_attr("redirects")
+        return ret
+
+    def set_network_settings(self, mtu, sock_snd, sock_rcv, tcp_wnd_snd, tcp_wnd_rcv):
+        """Sets network configuration of the NAT engine.
+
+        in mtu of type int
+            MTU (maximum transmission unit) of the NAT engine in bytes.
+
+        in sock_snd of type int
+            Capacity of the socket send buffer in bytes when creating a new socket.
+
+        in sock_rcv of type int
+            Capacity of the socket receive buffer in bytes when creating a new socket.
+
+        in tcp_wnd_snd of type int
+            Initial size of the NAT engine's sending TCP window in bytes when
+            establishing a new TCP connection.
+
+        in tcp_wnd_rcv of type int
+            Initial size of the NAT engine's receiving TCP window in bytes when
+            establishing a new TCP connection.
+
+        """
+        if not isinstance(mtu, baseinteger):
+            raise TypeError("mtu can only be an instance of type baseinteger")
+        if not isinstance(sock_snd, baseinteger):
+            raise TypeError("sock_snd can only be an instance of type baseinteger")
+        if not isinstance(sock_rcv, baseinteger):
+            raise TypeError("sock_rcv can only be an instance of type baseinteger")
+        if not isinstance(tcp_wnd_snd, baseinteger):
+            raise TypeError("tcp_wnd_snd can only be an instance of type baseinteger")
+        if not isinstance(tcp_wnd_rcv, baseinteger):
+            raise TypeError("tcp_wnd_rcv can only be an instance of type baseinteger")
+        self._call(
+            "setNetworkSettings",
+            in_p=[mtu, sock_snd, sock_rcv, tcp_wnd_snd, tcp_wnd_rcv],
+        )
+
+    def get_network_settings(self):
+        """Returns network configuration of NAT engine. See :py:func:`set_network_settings`
+        for parameter descriptions.
+
+        out mtu of type int
+
+        out sock_snd of type int
+
+        out sock_rcv of type int
+
+        out tcp_wnd_snd of type int
+
+        out tcp_wnd_rcv of type int
+
+        """
+        mtu, sock_snd, sock_rcv, tcp_wnd_snd, tcp_wnd_rcv = self._call(
+            "getNetworkSettings"
+        )
+        return (mtu, sock_snd, sock_rcv, tcp_wnd_snd, tcp_wnd_rcv)
+
+    def add_redirect(self, name, proto, host_ip, host_port, guest_ip, guest_port):
+        """Adds a new NAT port-forwarding rule.
+
+        in name of type str
+            The name of the rule. An empty name is acceptable, in which case the NAT engine
+            auto-generates one using the other parameters.
+
+        in proto of type :class:`NATProtocol`
+            Protocol handled with the rule.
+
+        in host_ip of type str
+            IP of the host interface to which the rule should apply. An empty ip address is
+            acceptable, in which case the NAT engine binds the handling socket to any interface.
+
+        in host_port of type int
+            The port number to listen on.
+
+        in guest_ip of type str
+            The IP address of the guest which the NAT engine will forward matching packets
+            to. An empty IP address is acceptable, in which case the NAT engine will forward
+            packets to the first DHCP lease (x.x.x.15).
+
+        in guest_port of type int
+            The port number to forward.
+
+        """
+        if not isinstance(name, basestring):
+            raise TypeError("name can only be an instance of type basestring")
+        if not isinstance(proto, _lib.NATProtocol):
+            raise TypeError("proto can only be an instance of type NATProtocol")
+        if not isinstance(host_ip, basestring):
+            raise TypeError("host_ip can only be an instance of type basestring")
+        if not isinstance(host_port, baseinteger):
+            raise TypeError("host_port can only be an instance of type baseinteger")
+        if not isinstance(guest_ip, basestring):
+            raise TypeError("guest_ip can only be an instance of type basestring")
+        if not isinstance(guest_port, baseinteger):
+            raise TypeError("guest_port can only be an instance of type baseinteger")
+        self._call(
+            "addRedirect", in_p=[name, proto, host_ip, host_port, guest_ip, guest_port]
+        )
+
+    def remove_redirect(self, name):
+        """Removes a port-forwarding rule that was previously registered.
+
+        in name of type str
+            The name of the rule to delete.
+
+        """
+        if not isinstance(name, basestring):
+            raise TypeError("name can only be an instance of type basestring")
+        self._call("removeRedirect", in_p=[name])
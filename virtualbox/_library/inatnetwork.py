@@ -0,0 +1,268 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from ..library_base import Interface
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class INATNetwork(Interface):
+    """
+    TBD: the idea, technically we can start any number of the NAT networks,
+    but we should expect that at some point we will get collisions because of
+    port-forwanding rules. so perhaps we should support only single instance of NAT
+    network.
+    """
+
+    __uuid__ = "4fdebbf0-be30-49c0-b315-e9749e1bded1"
+    __wsmap__ = "managed"
+
+    @property
+    def network_name(self):
+        """Get or set str value for 'networkName'
+        TBD: the idea, technically we can start any number of the NAT networks,
+        but we should expect that at some point we will get collisions because of
+        port-forwanding rules. so perhaps we should support only single instance of NAT
+        network.
+        """
+        ret = self._get_attr("networkName")
+        return ret
+
+    @network_name.setter
+    def network_name(self, value):
+        if not isinstance(value, basestring):
+            raise TypeError("value is not an instance of basestring")
+        return self._set_attr("networkName", value)
+
+    @property
+    def enabled(self):
+        """Get or set bool value for 'enabled'"""
+        ret = self._get_attr("enabled")
+        return ret
+
+    @enabled.setter
+    def enabled(self, value):
+        if not isinstance(value, bool):
+            raise TypeError("value is not an instance of bool")
+        return self._set_attr("enabled", value)
+
+    @property
+    def network(self):
+        """Get or set str value for 'network'
+        This is CIDR IPv4 string. Specifying it user defines IPv4 addresses
+        of gateway (low address + 1) and DHCP server (= low address + 2).
+        Note: If there are defined IPv4 port-forward rules update of network
+        will be ignored (because new assignment could break existing rules).
+        """
+        ret = self._get_attr("network")
+        return ret
+
+    @network.setter
+    def network(self, value):
+        if not isinstance(value, basestring):
+            raise TypeError("value is not an instance of basestring")
+        return self._set_attr("network", value)
+
+    @property
+    def gateway(self):
+        """Get str value for 'gateway'
+        This attribute is read-only. It's recalculated on changing
+        network attribute (low address of network + 1).
+        """
+        ret = self._get_attr("gateway")
+        return ret
+
+    @property
+    def i_pv6_enabled(self):
+        """Get or set bool value for 'IPv6Enabled'
+        This attribute define whether gateway will support IPv6 or not.
+        """
+        ret = self._get_attr("IPv6Enabled")
+        return ret
+
+    @i_pv6_enabled.setter
+    def i_pv6_enabled(self, value):
+        if not isinstance(value, bool):
+            raise TypeError("value is not an instance of bool")
+        return self._set_attr("IPv6Enabled", value)
+
+    @property
+    def i_pv6_prefix(self):
+        """Get or set str value for 'IPv6Prefix'
+        This a CIDR IPv6 defining prefix for link-local addresses
+        autoconfiguration within network. Note: ignored if attribute
+        IPv6Enabled is false.
+        """
+        ret = self._get_attr("IPv6Prefix")
+        return ret
+
+    @i_pv6_prefix.setter
+    def i_pv6_prefix(self, value):
+        if not isinstance(value, basestring):
+            raise TypeError("value is not an instance of basestring")
+        return self._set_attr("IPv6Prefix", value)
+
+    @property
+    def advertise_default_i_pv6_route_enabled(self):
+        """Get or set bool value for 'advertiseDefaultIPv6RouteEnabled'"""
+        ret = self._get_attr("advertiseDefaultIPv6RouteEnabled")
+        return ret
+
+    @advertise_default_i_pv6_route_enabled.setter
+    def advertise_default_i_pv6_route_enabled(self, value):
+        if not isinstance(value, bool):
+            raise TypeError("value is not an instance of bool")
+        return self._set_attr("advertiseDefaultIPv6RouteEnabled", value)
+
+    @property
+    def need_dhcp_server(self):
+        """Get or set bool value for 'needDhcpServer'"""
+        ret = self._get_attr("needDhcpServer")
+        return ret
+
+    @need_dhcp_server.setter
+    def need_dhcp_server(self, value):
+        if not isinstance(value, bool):
+            raise TypeError("value is not an instance of bool")
+        return self._set_attr("needDhcpServer", value)
+
+    @property
+    def event_source(self):
+        """Get IEventSource value for 'eventSource'"""
+        ret = self._get_attr("eventSource")
+        return _lib.IEventSource(ret)
+
+    @property
+    def port_forward_rules4(self):
+        """Get str value for 'portForwardRules4'
+        Array of NAT port-forwarding rules in string representation,
+        in the following format:
+        "name:protocolid:[host ip]:host port:[guest ip]:guest port".
+        """
+        ret = self._get_attr("portForwardRules4")
+        return ret
+
+    @property
+    def local_mappings(self):
+        """Get str value for 'localMappings'
+        Array of mappings (address,offset),e.g. ("127.0.1.1=4") maps 127.0.1.1 to networkid + 4.
+        """
+        ret = self._get_attr("localMappings")
+        return ret
+
+    def add_local_mapping(self, hostid, offset):
+        """
+
+        in hostid of type str
+
+        in offset of type int
+
+        """
+        if not isinstance(hostid, basestring):
+            raise TypeError("hostid can only be an instance of type basestring")
+        if not isinstance(offset, baseinteger):
+            raise TypeError("offset can only be an instance of type baseinteger")
+        self._call("addLocalMapping", in_p=[hostid, offset])
+
+    @property
+    def loopback_ip6(self):
+        """Get or set int value for 'loopbackIp6'
+        Offset in ipv6 network from network id for address mapped into loopback6 interface of the host.
+        """
+        ret = self._get_attr("loopbackIp6")
+        return ret
+
+    @loopback_ip6.setter
+    def loopback_ip6(self, value):
+        if not isinstance(value, baseinteger):
+            raise TypeError("value is not an instance of baseinteger")
+        return self._set_attr("loopbackIp6", value)
+
+    @property
+    def port_forward_rules6(self):
+        """Get str value for 'portForwardRules6'
+        Array of NAT port-forwarding rules in string representation, in the
+        following format: "name:protocolid:[host ip]:host port:[guest ip]:guest port".
+        """
+        ret = self._get_attr("portForwardRules6")
+        return ret
+
+    def add_port_forward_rule(
+        self, is_ipv6, rule_name, proto, host_ip, host_port, guest_ip, guest_port
+    ):
+        """Protocol handled with the rule.
+
+        in is_ipv6 of type bool
+
+        in rule_name of type str
+
+        in proto of type :class:`NATProtocol`
+            Protocol handled with the rule.
+
+        in host_ip of type str
+            IP of the host interface to which the rule should apply.
+            An empty ip address is acceptable, in which case the NAT engine
+            binds the handling socket to any interface.
+
+        in host_port of type int
+            The port number to listen on.
+
+        in guest_ip of type str
+            The IP address of the guest which the NAT engine will forward
+            matching packets to. An empty IP address is not acceptable.
+
+        in guest_port of type int
+            The port number to forward.
+
+        """
+        if not isinstance(is_ipv6, bool):
+            raise TypeError("is_ipv6 can only be an instance of type bool")
+        if not isinstance(rule_name, basestring):
+            raise TypeError("rule_name can only be an instance of type basestring")
+        if not isinstance(proto, _lib.NATProtocol):
+            raise TypeError("proto can only be an instance of type NATProtocol")
+        if not isinstance(host_ip, basestring):
+            raise TypeError("host_ip can only be an instance of type basestring")
+        if not isinstance(host_port, baseinteger):
+            raise TypeError("host_port can only be an instance of type baseinteger")
+        if not isinstance(guest_ip, basestring):
+            raise TypeError("guest_ip can only be an instance of type basestring")
+        if not isinstance(guest_port, baseinteger):
+            raise TypeError("guest_port can only be an instance of type baseinteger")
+        self._call(
+            "addPortForwardRule",
+            in_p=[is_ipv6, rule_name, proto, host_ip, host_port, guest_ip, guest_port],
+        )
+
+    def remove_port_forward_rule(self, i_sipv6, rule_name):
+        """
+
+        in i_sipv6 of type bool
+
+        in rule_name of type str
+
+        """
+        if not isinstance(i_sipv6, bool):
+            raise TypeError("i_sipv6 can only be an instance of type bool")
+        if not isinstance(rule_name, basestring):
+            raise TypeError("rule_name can only be an instance of type basestring")
+        self._call("removePortForwardRule", in_p=[i_sipv6, rule_name])
+
+    def start(self):
+        """"""
+        self._call("start")
+
+    def stop(self):
+        """"""
+        self._call("stop")
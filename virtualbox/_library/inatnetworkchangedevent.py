@@ -0,0 +1,32 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from .ievent import IEvent
+from .vboxeventtype import VBoxEventType
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class INATNetworkChangedEvent(IEvent):
+    """"""
+
+    __uuid__ = "101ae042-1a29-4a19-92cf-02285773f3b5"
+    __wsmap__ = "managed"
+    id = VBoxEventType.on_nat_network_changed
+
+    @property
+    def network_name(self):
+        """Get str value for 'networkName'"""
+        ret = self._get_attr("networkName")
+        return ret
@@ -0,0 +1,32 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from .inatnetworkalterevent import INATNetworkAlterEvent
+from .vboxeventtype import VBoxEventType
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class INATNetworkCreationDeletionEvent(INATNetworkAlterEvent):
+    """"""
+
+    __uuid__ = "8d984a7e-b855-40b8-ab0c-44d3515b4528"
+    __wsmap__ = "managed"
+    id = VBoxEventType.on_nat_network_creation_deletion
+
+    @property
+    def creation_event(self):
+        """Get bool value for 'creationEvent'"""
+        ret = self._get_attr("creationEvent")
+        return ret
@@ -0,0 +1,74 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from .inatnetworkalterevent import INATNetworkAlterEvent
+from .vboxeventtype import VBoxEventType
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class INATNetworkPortForwardEvent(INATNetworkAlterEvent):
+    """"""
+
+    __uuid__ = "2514881b-23d0-430a-a7ff-7ed7f05534bc"
+    __wsmap__ = "managed"
+    id = VBoxEventType.on_nat_network_port_forward
+
+    @property
+    def create(self):
+        """Get bool value for 'create'"""
+        ret = self._get_attr("create")
+        return ret
+
+    @property
+    def ipv6(self):
+        """Get bool value for 'ipv6'"""
+        ret = self._get_attr("ipv6")
+        return ret
+
+    @property
+    def name(self):
+        """Get str value for 'name'"""
+        ret = self._get_attr("name")
+        return ret
+
+    @property
+    def proto(self):
+        """Get NATProtocol value for 'proto'"""
+        ret = self._get_attr("proto")
+        return _lib.NATProtocol(ret)
+
+    @property
+    def host_ip(self):
+        """Get str value for 'hostIp'"""
+        ret = self._get_attr("hostIp")
+        return ret
+
+    @property
+    def host_port(self):
+        """Get int value for 'hostPort'"""
+        ret = self._get_attr("hostPort")
+        return ret
+
+    @property
+    def guest_ip(self):
+        """Get str value for 'guestIp'"""
+        ret = self._get_attr("guestIp")
+        return ret
+
+    @property
+    def guest_port(self):
+        """Get int value for 'guestPort'"""
+        ret = self._get_attr("guestPort")
+        return ret
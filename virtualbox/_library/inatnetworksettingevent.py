@@ -0,0 +1,56 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from .inatnetworkalterevent import INATNetworkAlterEvent
+from .vboxeventtype import VBoxEventType
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class INATNetworkSettingEvent(INATNetworkAlterEvent):
+    """"""
+
+    __uuid__ = "9db3a9e6-7f29-4aae-a627-5a282c83092c"
+    __wsmap__ = "managed"
+    id = VBoxEventType.on_nat_network_setting
+
+    @property
+    def enabled(self):
+        """Get bool value for 'enabled'"""
+        ret = self._get_attr("enabled")
+        return ret
+
+    @property
+    def network(self):
+        """Get str value for 'network'"""
+        ret = self._get_attr("network")
+        return ret
+
+    @property
+    def gateway(self):
+        """Get str value for 'gateway'"""
+        ret = self._get_attr("gateway")
+        return ret
+
+    @property
+    def advertise_default_i_pv6_route_enabled(self):
+        """Get bool value for 'advertiseDefaultIPv6RouteEnabled'"""
+        ret = self._get_attr("advertiseDefaultIPv6RouteEnabled")
+        return ret
+
+    @property
+    def need_dhcp_server(self):
+        """Get bool value for 'needDhcpServer'"""
+        ret = self._get_attr("needDhcpServer")
+        return ret
@@ -0,0 +1,36 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from .inatnetworkchangedevent import INATNetworkChangedEvent
+from .vboxeventtype import VBoxEventType
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class INATNetworkStartStopEvent(INATNetworkChangedEvent):
+    """
+    IsStartEvent is true when NAT network is started and false on stopping.
+    """
+
+    __uuid__ = "269d8f6b-fa1e-4cee-91c7-6d8496bea3c1"
+    __wsmap__ = "managed"
+    id = VBoxEventType.on_nat_network_start_stop
+
+    @property
+    def start_event(self):
+        """Get bool value for 'startEvent'
+        IsStartEvent is true when NAT network is started and false on stopping.
+        """
+        ret = self._get_attr("startEvent")
+        return ret
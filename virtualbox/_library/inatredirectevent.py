@@ -0,0 +1,92 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from .imachineevent import IMachineEvent
+from .vboxeventtype import VBoxEventType
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class INATRedirectEvent(IMachineEvent):
+    """
+    Notification when NAT redirect rule added or removed.
+    """
+
+    __uuid__ = "24eef068-c380-4510-bc7c-19314a7352f1"
+    __wsmap__ = "managed"
+    id = VBoxEventType.on_nat_redirect
+
+    @property
+    def slot(self):
+        """Get int value for 'slot'
+        Adapter which NAT attached to.
+        """
+        ret = self._get_attr("slot")
+        return ret
+
+    @property
+    def remove(self):
+        """Get bool value for 'remove'
+        Whether rule remove or add.
+        """
+        ret = self._get_attr("remove")
+        return ret
+
+    @property
+    def name(self):
+        """Get str value for 'name'
+        Name of the rule.
+        """
+        ret = self._get_attr("name")
+        return ret
+
+    @property
+    def proto(self):
+        """Get NATProtocol value for 'proto'
+        Protocol (TCP or UDP) of the redirect rule.
+        """
+        ret = self._get_attr("proto")
+        return _lib.NATProtocol(ret)
+
+    @property
+    def host_ip(self):
+        """Get str value for 'hostIP'
+        Host ip address to bind socket on.
+        """
+        ret = self._get_attr("hostIP")
+        return ret
+
+    @property
+    def host_port(self):
+        """Get int value for 'hostPort'
+        Host port to bind socket on.
+        """
+        ret = self._get_attr("hostPort")
+        return ret
+
+    @property
+    def guest_ip(self):
+        """Get str value for 'guestIP'
+        Guest ip address to redirect to.
+        """
+        ret = self._get_attr("guestIP")
+        return ret
+
+    @property
+    def guest_port(self):
+        """Get int value for 'guestPort'
+        Guest port to redirect to.
+        """
+        ret = self._get_attr("guestPort")
+        return ret
@@ -0,0 +1,380 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from ..library_base import Interface
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class INetworkAdapter(Interface):
+    """
+    Represents a virtual network adapter that is attached to a virtual machine.
+    Each virtual machine has a fixed number of network adapter slots with one
+    instance of this attached to each of them. Call
+    :py:func:`IMachine.get_network_adapter`  to get the network adapter that
+    is attached to a given slot in a given machine.
+
+    Each network adapter can be in one of five attachment modes, which are
+    represented by the :py:class:`NetworkAttachmentType`  enumeration;
+    see the :py:func:`attachment_type`  attribute.
+    """
+
+    __uuid__ = "e9a0c183-7071-4894-93d6-dcbec010fa91"
+    __wsmap__ = "managed"
+
+    @property
+    def adapter_type(self):
+        """Get or set NetworkAdapterType value for 'adapterType'
+        Type of the virtual network adapter. Depending on this value,
+        VirtualBox will provide a different virtual network hardware
+        to the guest.
+        """
+        ret = self._get_attr("adapterType")
+        return _lib.NetworkAdapterType(ret)
+
+    @adapter_type.setter
+    def adapter_type(self, value):
+        if not isinstance(value, _lib.NetworkAdapterType):
+            raise TypeError("value is not an instance of NetworkAdapterType")
+        return self._set_attr("adapterType", value)
+
+    @property
+    def slot(self):
+        """Get int value for 'slot'
+        Slot number this adapter is plugged into. Corresponds to
+        the value you pass to :py:func:`IMachine.get_network_adapter`
+        to obtain this instance.
+        """
+        ret = self._get_attr("slot")
+        return ret
+
+    @property
+    def enabled(self):
+        """Get or set bool value for 'enabled'
+        Flag whether the network adapter is present in the
+        guest system. If disabled, the virtual guest hardware will
+        not contain this network adapter. Can only be changed when
+        the VM is not running.
+        """
+        ret = self._get_attr("enabled")
+        return ret
+
+    @enabled.setter
+    def enabled(self, value):
+        if not isinstance(value, bool):
+            raise TypeError("value is not an instance of bool")
+        return self._set_attr("enabled", value)
+
+    @property
+    def mac_address(self):
+        """Get or set str value for 'MACAddress'
+        Ethernet MAC address of the adapter, 12 hexadecimal characters. When
+        setting it to @c null or an empty string for an enabled adapter,
+        VirtualBox will generate a unique MAC address. Disabled adapters can
+        have an empty MAC address.
+        """
+        ret = self._get_attr("MACAddress")
+        return ret
+
+    @mac_address.setter
+    def mac_address(self, value):
+        if not isinstance(value, basestring):
+            raise TypeError("value is not an instance of basestring")
+        return self._set_attr("MACAddress", value)
+
+    @property
+    def attachment_type(self):
+        """Get or set NetworkAttachmentType value for 'attachmentType'
+        Sets/Gets network attachment type of this network adapter.
+        """
+        ret = self._get_attr("attachmentType")
+        return _lib.NetworkAttachmentType(ret)
+
+    @attachment_type.setter
+    def attachment_type(self, value):
+        if not isinstance(value, _lib.NetworkAttachmentType):
+            raise TypeError("value is not an instance of NetworkAttachmentType")
+        return self._set_attr("attachmentType", value)
+
+    @property
+    def bridged_interface(self):
+        """Get or set str value for 'bridgedInterface'
+        Name of the network interface the VM should be bridged to.
+        """
+        ret = self._get_attr("bridgedInterface")
+        return ret
+
+    @bridged_interface.setter
+    def bridged_interface(self, value):
+        if not isinstance(value, basestring):
+            raise TypeError("value is not an instance of basestring")
+        return self._set_attr("bridgedInterface", value)
+
+    @property
+    def host_only_interface(self):
+        """Get or set str value for 'hostOnlyInterface'
+        Name of the host only network interface the VM is attached to.
+        """
+        ret = self._get_attr("hostOnlyInterface")
+        return ret
+
+    @host_only_interface.setter
+    def host_only_interface(self, value):
+        if not isinstance(value, basestring):
+            raise TypeError("value is not an instance of basestring")
+        return self._set_attr("hostOnlyInterface", value)
+
+    @property
+    def internal_network(self):
+        """Get or set str value for 'internalNetwork'
+        Name of the internal network the VM is attached to.
+        """
+        ret = self._get_attr("internalNetwork")
+        return ret
+
+    @internal_network.setter
+    def internal_network(self, value):
+        if not isinstance(value, basestring):
+            raise TypeError("value is not an instance of basestring")
+        return self._set_attr("internalNetwork", value)
+
+    @property
+    def nat_network(self):
+        """Get or set str value for 'NATNetwork'
+        Name of the NAT network the VM is attached to.
+        """
+        ret = self._get_attr("NATNetwork")
+        return ret
+
+    @nat_network.setter
+    def nat_network(self, value):
+        if not isinstance(value, basestring):
+            raise TypeError("value is not an instance of basestring")
+        return self._set_attr("NATNetwork", value)
+
+    @property
+    def generic_driver(self):
+        """Get or set str value for 'genericDriver'
+        Name of the driver to use for the "Generic" network attachment type.
+        """
+        ret = self._get_attr("genericDriver")
+        return ret
+
+    @generic_driver.setter
+    def generic_driver(self, value):
+        if not isinstance(value, basestring):
+            raise TypeError("value is not an instance of basestring")
+        return self._set_attr("genericDriver", value)
+
+    @property
+    def cloud_network(self):
+        """Get or set str value for 'cloudNetwork'
+        Name of the cloud network the VM is attached to.
+        """
+        ret = self._get_attr("cloudNetwork")
+        return ret
+
+    @cloud_network.setter
+    def cloud_network(self, value):
+        if not isinstance(value, basestring):
+            raise TypeError("value is not an instance of basestring")
+        return self._set_attr("cloudNetwork", value)
+
+    @property
+    def cable_connected(self):
+        """Get or set bool value for 'cableConnected'
+        Flag whether the adapter reports the cable as connected or not.
+        It can be used to report offline situations to a VM.
+        """
+        ret = self._get_attr("cableConnected")
+        return ret
+
+    @cable_connected.setter
+    def cable_connected(self, value):
+        if not isinstance(value, bool):
+            raise TypeError("value is not an instance of bool")
+        return self._set_attr("cableConnected", value)
+
+    @property
+    def line_speed(self):
+        """Get or set int value for 'lineSpeed'
+        Line speed reported by custom drivers, in units of 1 kbps.
+        """
+        ret = self._get_attr("lineSpeed")
+        return ret
+
+    @line_speed.setter
+    def line_speed(self, value):
+        if not isinstance(value, baseinteger):
+            raise TypeError("value is not an instance of baseinteger")
+        return self._set_attr("lineSpeed", value)
+
+    @property
+    def promisc_mode_policy(self):
+        """Get or set NetworkAdapterPromiscModePolicy value for 'promiscModePolicy'
+        The promiscuous mode policy of the network adapter when attached to an
+        internal network, host only network or a bridge.
+        """
+        ret = self._get_attr("promiscModePolicy")
+        return _lib.NetworkAdapterPromiscModePolicy(ret)
+
+    @promisc_mode_policy.setter
+    def promisc_mode_policy(self, value):
+        if not isinstance(value, _lib.NetworkAdapterPromiscModePolicy):
+            raise TypeError(
+                "value is not an instance of NetworkAdapterPromiscModePolicy"
+            )
+        return self._set_attr("promiscModePolicy", value)
+
+    @property
+    def trace_enabled(self):
+        """Get or set bool value for 'traceEnabled'
+        Flag whether network traffic from/to the network card should be traced.
+        Can only be toggled when the VM is turned off.
+        """
+        ret = self._get_attr("traceEnabled")
+        return ret
+
+    @trace_enabled.setter
+    def trace_enabled(self, value):
+        if not isinstance(value, bool):
+            raise TypeError("value is not an instance of bool")
+        return self._set_attr("traceEnabled", value)
+
+    @property
+    def trace_file(self):
+        """Get or set str value for 'traceFile'
+        Filename where a network trace will be stored. If not set, VBox-pid.pcap
+        will be used.
+        """
+        ret = self._get_attr("traceFile")
+        return ret
+
+    @trace_file.setter
+    def trace_file(self, value):
+        if not isinstance(value, basestring):
+            raise TypeError("value is not an instance of basestring")
+        return self._set_attr("traceFile", value)
+
+    @property
+    def nat_engine(self):
+        """Get INATEngine value for 'NATEngine'
+        Points to the NAT engine which handles the network address translation
+        for this interface. This is active only when the interface actually uses
+        NAT.
+        """
+        ret = self._get_attr("NATEngine")
+        return _lib.INATEngine(ret)
+
+    @property
+    def boot_priority(self):
+        """Get or set int value for 'bootPriority'
+        Network boot priority of the adapter. Priority 1 is highest. If not set,
+        the priority is considered to be at the lowest possible setting.
+        """
+        ret = self._get_attr("bootPriority")
+        return ret
+
+    @boot_priority.setter
+    def boot_priority(self, value):
+        if not isinstance(value, baseinteger):
+            raise TypeError("value is not an instance of baseinteger")
+        return self._set_attr("bootPriority", value)
+
+    @property
+    def bandwidth_group(self):
+        """Get or set IBandwidthGroup value for 'bandwidthGroup'
+        The bandwidth group this network adapter is assigned to.
+        """
+        ret = self._get_attr("bandwidthGroup")
+        return _lib.IBandwidthGroup(ret)
+
+    @bandwidth_group.setter
+    def bandwidth_group(self, value):
+        if not isinstance(value, _lib.IBandwidthGroup):
+            raise TypeError("value is not an instance of IBandwidthGroup")
+        return self._set_attr("bandwidthGroup", value)
+
+    def get_property(self, key):
+        """Returns the value of the network attachment property with the given name.
+
+        If the requested data @a key does not exist, this function will
+        succeed and return an empty string in the @a value argument.
+
+        in key of type str
+            Name of the property to get.
+
+        return value of type str
+            Current property value.
+
+        raises :class:`OleErrorInvalidarg`
+            @a name is @c null or empty.
+
+        """
+        if not isinstance(key, basestring):
+            raise TypeError("key can only be an instance of type basestring")
+        value = self._call("getProperty", in_p=[key])
+        return value
+
+    def set_property(self, key, value):
+        """Sets the value of the network attachment property with the given name.
+
+        Setting the property value to @c null or an empty string is equivalent
+        to deleting the existing value.
+
+        in key of type str
+            Name of the property to set.
+
+        in value of type str
+            Property value to set.
+
+        raises :class:`OleErrorInvalidarg`
+            @a name is @c null or empty.
+
+        """
+        if not isinstance(key, basestring):
+            raise TypeError("key can only be an instance of type basestring")
+        if not isinstance(value, basestring):
+            raise TypeError("value can only be an instance of type basestring")
+        self._call("setProperty", in_p=[key, value])
+
+    def get_properties(self, names):
+        """Returns values for a group of properties in one call.
+
+        The names of the properties to get are specified using the @a names
+        argument which is a list of comma-separated property names or
+        an empty string if all properties are to be returned.
+        Currently the value of this argument is ignored and the method
+        always returns all existing properties.
+
+        The method returns two arrays, the array of property names corresponding
+        to the @a names argument and the current values of these properties.
+        Both arrays have the same number of elements with each element at the
+        given index in the first array corresponds to an element at the same
+        index in the second array.
+
+        in names of type str
+            Names of properties to get.
+
+        out return_names of type str
+            Names of returned properties.
+
+        return return_values of type str
+            Values of returned properties.
+
+        """
+        if not isinstance(names, basestring):
+            raise TypeError("names can only be an instance of type basestring")
+        return_values, return_names = self._call("getProperties", in_p=[names])
+        return (return_values, return_names)
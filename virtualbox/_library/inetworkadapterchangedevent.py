@@ -0,0 +1,39 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from .ievent import IEvent
+from .vboxeventtype import VBoxEventType
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class INetworkAdapterChangedEvent(IEvent):
+    """
+    Notification when a property of one of the
+    virtual :py:func:`IMachine.get_network_adapter` network adapters
+    changes. Interested callees should use INetworkAdapter methods and
+    attributes to find out what has changed.
+    """
+
+    __uuid__ = "08889892-1EC6-4883-801D-77F56CFD0103"
+    __wsmap__ = "managed"
+    id = VBoxEventType.on_network_adapter_changed
+
+    @property
+    def network_adapter(self):
+        """Get INetworkAdapter value for 'networkAdapter'
+        Network adapter that is subject to change.
+        """
+        ret = self._get_attr("networkAdapter")
+        return _lib.INetworkAdapter(ret)
@@ -0,0 +1,106 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from ..library_base import Interface
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IParallelPort(Interface):
+    """
+    The IParallelPort interface represents the virtual parallel port device.
+
+    The virtual parallel port device acts like an ordinary parallel port
+    inside the virtual machine. This device communicates to the real
+    parallel port hardware using the name of the parallel device on the host
+    computer specified in the #path attribute.
+
+    Each virtual parallel port device is assigned a base I/O address and an
+    IRQ number that will be reported to the guest operating system and used
+    to operate the given parallel port from within the virtual machine.
+
+    :py:func:`IMachine.get_parallel_port`
+    """
+
+    __uuid__ = "788b87df-7708-444b-9eef-c116ce423d39"
+    __wsmap__ = "managed"
+
+    @property
+    def slot(self):
+        """Get int value for 'slot'
+        Slot number this parallel port is plugged into. Corresponds to
+        the value you pass to :py:func:`IMachine.get_parallel_port`
+        to obtain this instance.
+        """
+        ret = self._get_attr("slot")
+        return ret
+
+    @property
+    def enabled(self):
+        """Get or set bool value for 'enabled'
+        Flag whether the parallel port is enabled. If disabled,
+        the parallel port will not be reported to the guest OS.
+        """
+        ret = self._get_attr("enabled")
+        return ret
+
+    @enabled.setter
+    def enabled(self, value):
+        if not isinstance(value, bool):
+            raise TypeError("value is not an instance of bool")
+        return self._set_attr("enabled", value)
+
+    @property
+    def io_base(self):
+        """Get or set int value for 'IOBase'
+        Base I/O address of the parallel port.
+        """
+        ret = self._get_attr("IOBase")
+        return ret
+
+    @io_base.setter
+    def io_base(self, value):
+        if not isinstance(value, baseinteger):
+            raise TypeError("value is not an instance of baseinteger")
+        return self._set_attr("IOBase", value)
+
+    @property
+    def irq(self):
+        """Get or set int value for 'IRQ'
+        IRQ number of the parallel port.
+        """
+        ret = self._get_attr("IRQ")
+        return ret
+
+    @irq.setter
+    def irq(self, value):
+        if not isinstance(value, baseinteger):
+            raise TypeError("value is not an instance of baseinteger")
+        return self._set_attr("IRQ", value)
+
+    @property
+    def path(self):
+        """Get or set str value for 'path'
+        Host parallel device name. If this parallel port is enabled, setting a
+        @c null or an empty string as this attribute's value will result in
+        the parallel port behaving as if not connected to any device.
+        """
+        ret = self._get_attr("path")
+        return ret
+
+    @path.setter
+    def path(self, value):
+        if not isinstance(value, basestring):
+            raise TypeError("value is not an instance of basestring")
+        return self._set_attr("path", value)
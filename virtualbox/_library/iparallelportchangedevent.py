@@ -0,0 +1,39 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from .ievent import IEvent
+from .vboxeventtype import VBoxEventType
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IParallelPortChangedEvent(IEvent):
+    """
+    Notification when a property of one of the
+    virtual :py:func:`IMachine.get_parallel_port` parallel ports
+    changes. Interested callees should use ISerialPort methods and
+    attributes to find out what has changed.
+    """
+
+    __uuid__ = "813C99FC-9849-4F47-813E-24A75DC85615"
+    __wsmap__ = "managed"
+    id = VBoxEventType.on_parallel_port_changed
+
+    @property
+    def parallel_port(self):
+        """Get IParallelPort value for 'parallelPort'
+        Parallel port that is subject to change.
+        """
+        ret = self._get_attr("parallelPort")
+        return _lib.IParallelPort(ret)
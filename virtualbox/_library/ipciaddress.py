@@ -0,0 +1,87 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from ..library_base import Interface
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IPCIAddress(Interface):
+    """
+    Address on the PCI bus.
+    """
+
+    __uuid__ = "c984d15f-e191-400b-840e-970f3dad7296"
+    __wsmap__ = "managed"
+
+    @property
+    def bus(self):
+        """Get or set int value for 'bus'
+        Bus number.
+        """
+        ret = self._get_attr("bus")
+        return ret
+
+    @bus.setter
+    def bus(self, value):
+        if not isinstance(value, baseinteger):
+            raise TypeError("value is not an instance of baseinteger")
+        return self._set_attr("bus", value)
+
+    @property
+    def device(self):
+        """Get or set int value for 'device'
+        Device number.
+        """
+        ret = self._get_attr("device")
+        return ret
+
+    @device.setter
+    def device(self, value):
+        if not isinstance(value, baseinteger):
+            raise TypeError("value is not an instance of baseinteger")
+        return self._set_attr("device", value)
+
+    @property
+    def dev_function(self):
+        """Get or set int value for 'devFunction'
+        Device function number.
+        """
+        ret = self._get_attr("devFunction")
+        return ret
+
+    @dev_function.setter
+    def dev_function(self, value):
+        if not isinstance(value, baseinteger):
+            raise TypeError("value is not an instance of baseinteger")
+        return self._set_attr("devFunction", value)
+
+    def as_long(self):
+        """Convert PCI address into long.
+
+        return result of type int
+
+        """
+        result = self._call("asLong")
+        return result
+
+    def from_long(self, number):
+        """Make PCI address from long.
+
+        in number of type int
+
+        """
+        if not isinstance(number, baseinteger):
+            raise TypeError("number can only be an instance of type baseinteger")
+        self._call("fromLong", in_p=[number])
@@ -0,0 +1,58 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from ..library_base import Interface
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IPCIDeviceAttachment(Interface):
+    """
+    Information about PCI attachments.
+    """
+
+    __uuid__ = "91f33d6f-e621-4f70-a77e-15f0e3c714d5"
+    __wsmap__ = "struct"
+
+    @property
+    def name(self):
+        """Get str value for 'name'
+        Device name.
+        """
+        ret = self._get_attr("name")
+        return ret
+
+    @property
+    def is_physical_device(self):
+        """Get bool value for 'isPhysicalDevice'
+        If this is physical or virtual device.
+        """
+        ret = self._get_attr("isPhysicalDevice")
+        return ret
+
+    @property
+    def host_address(self):
+        """Get int value for 'hostAddress'
+        Address of device on the host, applicable only to host devices.
+        """
+        ret = self._get_attr("hostAddress")
+        return ret
+
+    @property
+    def guest_address(self):
+        """Get int value for 'guestAddress'
+        Address of device in the guest.
+        """
+        ret = self._get_attr("guestAddress")
+        return ret
@@ -0,0 +1,397 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from ..library_base import Interface
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IPerformanceCollector(Interface):
+    """
+    The IPerformanceCollector interface represents a service that collects
+    and stores performance metrics data.
+
+    Performance metrics are associated with objects of interfaces like IHost
+    and IMachine. Each object has a distinct set of performance metrics. The
+    set can be obtained with :py:func:`IPerformanceCollector.get_metrics` .
+
+    Metric data is collected at the specified intervals and is retained
+    internally. The interval and the number of retained samples can be set
+    with :py:func:`IPerformanceCollector.setup_metrics` . Both metric data
+    and collection settings are not persistent, they are discarded as soon as
+    VBoxSVC process terminates. Moreover, metric settings and data associated
+    with a particular VM only exist while VM is running. They disappear as
+    soon as VM shuts down. It is not possible to set up metrics for machines
+    that are powered off. One needs to start VM first, then set up metric
+    collection parameters.
+
+    Metrics are organized hierarchically, with each level separated by a
+    slash (/) character. Generally, the scheme for metric names is like this:
+
+    Category/Metric[/SubMetric][:aggregation]
+
+    "Category/Metric" together form the base metric name. A base metric is
+    the smallest unit for which a sampling interval and the number of
+    retained samples can be set. Only base metrics can be enabled and
+    disabled. All sub-metrics are collected when their base metric is
+    collected. Collected values for any set of sub-metrics can be queried
+    with :py:func:`IPerformanceCollector.query_metrics_data` .
+
+    For example "CPU/Load/User:avg" metric name stands for the "CPU"
+    category, "Load" metric, "User" submetric, "average" aggregate. An
+    aggregate function is computed over all retained data. Valid aggregate
+    functions are:
+
+
+    avg -- average
+    min -- minimum
+    max -- maximum
+
+
+    When setting up metric parameters, querying metric data, enabling or
+    disabling metrics wildcards can be used in metric names to specify a
+    subset of metrics. For example, to select all CPU-related metrics
+    use CPU/*, all averages can be queried using *:avg and
+    so on. To query metric values without aggregates *: can be used.
+
+    The valid names for base metrics are:
+
+
+    CPU/Load
+    CPU/MHz
+    RAM/Usage
+    RAM/VMM
+
+
+    The general sequence for collecting and retrieving the metrics is:
+
+
+    Obtain an instance of IPerformanceCollector with
+    :py:func:`IVirtualBox.performance_collector`
+
+
+    Allocate and populate an array with references to objects the metrics
+    will be collected for. Use references to IHost and IMachine objects.
+
+
+    Allocate and populate an array with base metric names the data will
+    be collected for.
+
+
+    Call :py:func:`IPerformanceCollector.setup_metrics` . From now on
+    the metric data will be collected and stored.
+
+
+    Wait for the data to get collected.
+
+
+    Allocate and populate an array with references to objects the metric
+    values will be queried for. You can re-use the object array used for
+    setting base metrics.
+
+
+    Allocate and populate an array with metric names the data will be
+    collected for. Note that metric names differ from base metric names.
+
+
+    Call :py:func:`IPerformanceCollector.query_metrics_data` . The data
+    that have been collected so far are returned. Note that the values
+    are still retained internally and data collection continues.
+
+
+
+    For an example of usage refer to the following files in VirtualBox SDK:
+
+
+    Java: bindings/webservice/java/jax-ws/samples/metrictest.java
+
+
+    Python: bindings/xpcom/python/sample/shellcommon.py
+    """
+
+    __uuid__ = "b14290ad-cd54-400c-b858-797bcb82570e"
+    __wsmap__ = "managed"
+
+    @property
+    def metric_names(self):
+        """Get str value for 'metricNames'
+        Array of unique names of metrics.
+
+        This array represents all metrics supported by the performance
+        collector. Individual objects do not necessarily support all of them.
+        :py:func:`IPerformanceCollector.get_metrics`  can be used to get the
+        list of supported metrics for a particular object.
+        """
+        ret = self._get_attr("metricNames")
+        return ret
+
+    def get_metrics(self, metric_names, objects):
+        """Returns parameters of specified metrics for a set of objects.
+
+        @c Null metrics array means all metrics. @c Null object array means
+        all existing objects.
+
+        in metric_names of type str
+            Metric name filter. Currently, only a comma-separated list of metrics
+            is supported.
+
+        in objects of type Interface
+            Set of objects to return metric parameters for.
+
+        return metrics of type :class:`IPerformanceMetric`
+            Array of returned metric parameters.
+
+        """
+        if not isinstance(metric_names, list):
+            raise TypeError("metric_names can only be an instance of type list")
+        for a in metric_names[:10]:
+            if not isinstance(a, basestring):
+                raise TypeError("array can only contain objects of type basestring")
+        if not isinstance(objects, list):
+            raise TypeError("objects can only be an instance of type list")
+        for a in objects[:10]:
+            if not isinstance(a, _lib.Interface):
+                raise TypeError("array can only contain objects of type Interface")
+        metrics = self._call("getMetrics", in_p=[metric_names, objects])
+        metrics = [_lib.IPerformanceMetric(a) for a in metrics]
+        return metrics
+
+    def setup_metrics(self, metric_names, objects, period, count):
+        """Sets parameters of specified base metrics for a set of objects. Returns
+        an array of :py:class:`IPerformanceMetric`  describing the metrics
+        have been affected.
+
+        @c Null or empty metric name array means all metrics. @c Null or
+        empty object array means all existing objects. If metric name array
+        contains a single element and object array contains many, the single
+        metric name array element is applied to each object array element to
+        form metric/object pairs.
+
+        in metric_names of type str
+            Metric name filter. Comma-separated list of metrics with wildcard
+            support.
+
+        in objects of type Interface
+            Set of objects to setup metric parameters for.
+
+        in period of type int
+            Time interval in seconds between two consecutive samples of
+            performance data.
+
+        in count of type int
+            Number of samples to retain in performance data history. Older
+            samples get discarded.
+
+        return affected_metrics of type :class:`IPerformanceMetric`
+            Array of metrics that have been modified by the call to this method.
+
+        """
+        if not isinstance(metric_names, list):
+            raise TypeError("metric_names can only be an instance of type list")
+        for a in metric_names[:10]:
+            if not isinstance(a, basestring):
+                raise TypeError("array can only contain objects of type basestring")
+        if not isinstance(objects, list):
+            raise TypeError("objects can only be an instance of type list")
+        for a in objects[:10]:
+            if not isinstance(a, _lib.Interface):
+                raise TypeError("array can only contain objects of type Interface")
+        if not isinstance(period, baseinteger):
+            raise TypeError("period can only be an instance of type baseinteger")
+        if not isinstance(count, baseinteger):
+            raise TypeError("count can only be an instance of type baseinteger")
+        affected_metrics = self._call(
+            "setupMetrics", in_p=[metric_names, objects, period, count]
+        )
+        affected_metrics = [_lib.IPerformanceMetric(a) for a in affected_metrics]
+        return affected_metrics
+
+    def enable_metrics(self, metric_names, objects):
+        """Turns on collecting specified base metrics. Returns an array of
+        :py:class:`IPerformanceMetric`  describing the metrics have been
+        affected.
+
+        @c Null or empty metric name array means all metrics. @c Null or
+        empty object array means all existing objects. If metric name array
+        contains a single element and object array contains many, the single
+        metric name array element is applied to each object array element to
+        form metric/object pairs.
+
+        in metric_names of type str
+            Metric name filter. Comma-separated list of metrics with wildcard
+            support.
+
+        in objects of type Interface
+            Set of objects to enable metrics for.
+
+        return affected_metrics of type :class:`IPerformanceMetric`
+            Array of metrics that have been modified by the call to this method.
+
+        """
+        if not isinstance(metric_names, list):
+            raise TypeError("metric_names can only be an instance of type list")
+        for a in metric_names[:10]:
+            if not isinstance(a, basestring):
+                raise TypeError("array can only contain objects of type basestring")
+        if not isinstance(objects, list):
+            raise TypeError("objects can only be an instance of type list")
+        for a in objects[:10]:
+            if not isinstance(a, _lib.Interface):
+                raise TypeError("array can only contain objects of type Interface")
+        affected_metrics = self._call("enableMetrics", in_p=[metric_names, objects])
+        affected_metrics = [_lib.IPerformanceMetric(a) for a in affected_metrics]
+        return affected_metrics
+
+    def disable_metrics(self, metric_names, objects):
+        """Turns off collecting specified base metrics. Returns an array of
+        :py:class:`IPerformanceMetric`  describing the metrics have been
+        affected.
+
+        @c Null or empty metric name array means all metrics. @c Null or
+        empty object array means all existing objects. If metric name array
+        contains a single element and object array contains many, the single
+        metric name array element is applied to each object array element to
+        form metric/object pairs.
+
+        in metric_names of type str
+            Metric name filter. Comma-separated list of metrics with wildcard
+            support.
+
+        in objects of type Interface
+            Set of objects to disable metrics for.
+
+        return affected_metrics of type :class:`IPerformanceMetric`
+            Array of metrics that have been modified by the call to this method.
+
+        """
+        if not isinstance(metric_names, list):
+            raise TypeError("metric_names can only be an instance of type list")
+        for a in metric_names[:10]:
+            if not isinstance(a, basestring):
+                raise TypeError("array can only contain objects of type basestring")
+        if not isinstance(objects, list):
+            raise TypeError("objects can only be an instance of type list")
+        for a in objects[:10]:
+            if not isinstance(a, _lib.Interface):
+                raise TypeError("array can only contain objects of type Interface")
+        affected_metrics = self._call("disableMetrics", in_p=[metric_names, objects])
+        affected_metrics = [_lib.IPerformanceMetric(a) for a in affected_metrics]
+        return affected_metrics
+
+    def query_metrics_data(self, metric_names, objects):
+        """Queries collected metrics data for a set of objects.
+
+        The data itself and related metric information are returned in seven
+        parallel and one flattened array of arrays. Elements of
+        returnMetricNames, returnObjects, returnUnits, returnScales,
+        returnSequenceNumbers, returnDataIndices and returnDataLengths with
+        the same index describe one set of values corresponding to a single
+        metric.
+
+        The returnData parameter is a flattened array of arrays. Each
+        start and length of a sub-array is indicated by
+        returnDataIndices and returnDataLengths. The first
+        value for metric metricNames[i] is at
+        returnData[returnIndices[i]].
+
+
+        @c Null or empty metric name array means all metrics. @c Null or
+        empty object array means all existing objects. If metric name array
+        contains a single element and object array contains many, the single
+        metric name array element is applied to each object array element to
+        form metric/object pairs.
+
+
+        Data collection continues behind the scenes after call to
+        @c queryMetricsData. The return data can be seen as the snapshot of
+        the current state at the time of @c queryMetricsData call. The
+        internally kept metric values are not cleared by the call. This
+        allows querying different subsets of metrics or aggregates with
+        subsequent calls. If periodic querying is needed it is highly
+        suggested to query the values with @c interval*count period to avoid
+        confusion. This way a completely new set of data values will be
+        provided by each query.
+
+        in metric_names of type str
+            Metric name filter. Comma-separated list of metrics with wildcard
+            support.
+
+        in objects of type Interface
+            Set of objects to query metrics for.
+
+        out return_metric_names of type str
+            Names of metrics returned in @c returnData.
+
+        out return_objects of type Interface
+            Objects associated with metrics returned in @c returnData.
+
+        out return_units of type str
+            Units of measurement for each returned metric.
+
+        out return_scales of type int
+            Divisor that should be applied to return values in order to get
+            floating point values. For example:
+            (double)returnData[returnDataIndices[0]+i] / returnScales[0]
+            will retrieve the floating point value of i-th sample of the first
+            metric.
+
+        out return_sequence_numbers of type int
+            Sequence numbers of the first elements of value sequences of
+            particular metrics returned in @c returnData. For aggregate metrics
+            it is the sequence number of the sample the aggregate started
+            calculation from.
+
+        out return_data_indices of type int
+            Indices of the first elements of value sequences of particular
+            metrics returned in @c returnData.
+
+        out return_data_lengths of type int
+            Lengths of value sequences of particular metrics.
+
+        return return_data of type int
+            Flattened array of all metric data containing sequences of values for
+            each metric.
+
+        """
+        if not isinstance(metric_names, list):
+            raise TypeError("metric_names can only be an instance of type list")
+        for a in metric_names[:10]:
+            if not isinstance(a, basestring):
+                raise TypeError("array can only contain objects of type basestring")
+        if not isinstance(objects, list):
+            raise TypeError("objects can only be an instance of type list")
+        for a in objects[:10]:
+            if not isinstance(a, _lib.Interface):
+                raise TypeError("array can only contain objects of type Interface")
+        (
+            return_data,
+            return_metric_names,
+            return_objects,
+            return_units,
+            return_scales,
+            return_sequence_numbers,
+            return_data_indices,
+            return_data_lengths,
+        ) = self._call("queryMetricsData", in_p=[metric_names, objects])
+        return_objects = [_lib.Interface(a) for a in return_objects]
+        return (
+            return_data,
+            return_metric_names,
+            return_objects,
+            return_units,
+            return_scales,
+            return_sequence_numbers,
+            return_data_indices,
+            return_data_lengths,
+        )
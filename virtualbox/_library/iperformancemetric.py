@@ -0,0 +1,95 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from ..library_base import Interface
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IPerformanceMetric(Interface):
+    """
+    The IPerformanceMetric interface represents parameters of the given
+    performance metric.
+    """
+
+    __uuid__ = "81314d14-fd1c-411a-95c5-e9bb1414e632"
+    __wsmap__ = "managed"
+
+    @property
+    def metric_name(self):
+        """Get str value for 'metricName'
+        Name of the metric.
+        """
+        ret = self._get_attr("metricName")
+        return ret
+
+    @property
+    def object_p(self):
+        """Get Interface value for 'object'
+        Object this metric belongs to.
+        """
+        ret = self._get_attr("object")
+        return _lib.Interface(ret)
+
+    @property
+    def description(self):
+        """Get str value for 'description'
+        Textual description of the metric.
+        """
+        ret = self._get_attr("description")
+        return ret
+
+    @property
+    def period(self):
+        """Get int value for 'period'
+        Time interval between samples, measured in seconds.
+        """
+        ret = self._get_attr("period")
+        return ret
+
+    @property
+    def count(self):
+        """Get int value for 'count'
+        Number of recent samples retained by the performance collector for this
+        metric.
+
+        When the collected sample count exceeds this number, older samples
+        are discarded.
+        """
+        ret = self._get_attr("count")
+        return ret
+
+    @property
+    def unit(self):
+        """Get str value for 'unit'
+        Unit of measurement.
+        """
+        ret = self._get_attr("unit")
+        return ret
+
+    @property
+    def minimum_value(self):
+        """Get int value for 'minimumValue'
+        Minimum possible value of this metric.
+        """
+        ret = self._get_attr("minimumValue")
+        return ret
+
+    @property
+    def maximum_value(self):
+        """Get int value for 'maximumValue'
+        Maximum possible value of this metric.
+        """
+        ret = self._get_attr("maximumValue")
+        return ret
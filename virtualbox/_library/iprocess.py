@@ -0,0 +1,257 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from ..library_base import Interface
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IProcess(Interface):
+    """
+    Abstract parent interface for processes handled by VirtualBox.
+    """
+
+    __uuid__ = "bc68370c-8a02-45f3-a07d-a67aa72756aa"
+    __wsmap__ = "managed"
+
+    @property
+    def arguments(self):
+        """Get str value for 'arguments'
+        The arguments this process is using for execution.
+        """
+        ret = self._get_attr("arguments")
+        return ret
+
+    @property
+    def environment(self):
+        """Get str value for 'environment'
+        The initial process environment.  Not yet implemented.
+        """
+        ret = self._get_attr("environment")
+        return ret
+
+    @property
+    def event_source(self):
+        """Get IEventSource value for 'eventSource'
+        Event source for process events.
+        """
+        ret = self._get_attr("eventSource")
+        return _lib.IEventSource(ret)
+
+    @property
+    def executable_path(self):
+        """Get str value for 'executablePath'
+        Full path of the actual executable image.
+        """
+        ret = self._get_attr("executablePath")
+        return ret
+
+    @property
+    def exit_code(self):
+        """Get int value for 'exitCode'
+        The exit code. Only available when the process has been
+        terminated normally.
+        """
+        ret = self._get_attr("exitCode")
+        return ret
+
+    @property
+    def name(self):
+        """Get str value for 'name'
+        The friendly name of this process.
+        """
+        ret = self._get_attr("name")
+        return ret
+
+    @property
+    def pid(self):
+        """Get int value for 'PID'
+        The process ID (PID).
+        """
+        ret = self._get_attr("PID")
+        return ret
+
+    @property
+    def status(self):
+        """Get ProcessStatus value for 'status'
+        The current process status; see :py:class:`ProcessStatus`
+        for more information.
+        """
+        ret = self._get_attr("status")
+        return _lib.ProcessStatus(ret)
+
+    def wait_for(self, wait_for, timeout_ms):
+        """Waits for one or more events to happen.
+
+        in wait_for of type int
+            Specifies what to wait for;
+            see :py:class:`ProcessWaitForFlag`  for more information.
+
+        in timeout_ms of type int
+            Timeout (in ms) to wait for the operation to complete.
+            Pass 0 for an infinite timeout.
+
+        return reason of type :class:`ProcessWaitResult`
+            The overall wait result;
+            see :py:class:`ProcessWaitResult`  for more information.
+
+        """
+        if not isinstance(wait_for, baseinteger):
+            raise TypeError("wait_for can only be an instance of type baseinteger")
+        if not isinstance(timeout_ms, baseinteger):
+            raise TypeError("timeout_ms can only be an instance of type baseinteger")
+        reason = self._call("waitFor", in_p=[wait_for, timeout_ms])
+        reason = _lib.ProcessWaitResult(reason)
+        return reason
+
+    def wait_for_array(self, wait_for, timeout_ms):
+        """Waits for one or more events to happen.
+        Scriptable version of :py:func:`wait_for` .
+
+        in wait_for of type :class:`ProcessWaitForFlag`
+            Specifies what to wait for;
+            see :py:class:`ProcessWaitForFlag`  for more information.
+
+        in timeout_ms of type int
+            Timeout (in ms) to wait for the operation to complete.
+            Pass 0 for an infinite timeout.
+
+        return reason of type :class:`ProcessWaitResult`
+            The overall wait result;
+            see :py:class:`ProcessWaitResult`  for more information.
+
+        """
+        if not isinstance(wait_for, list):
+            raise TypeError("wait_for can only be an instance of type list")
+        for a in wait_for[:10]:
+            if not isinstance(a, _lib.ProcessWaitForFlag):
+                raise TypeError(
+                    "array can only contain objects of type ProcessWaitForFlag"
+                )
+        if not isinstance(timeout_ms, baseinteger):
+            raise TypeError("timeout_ms can only be an instance of type baseinteger")
+        reason = self._call("waitForArray", in_p=[wait_for, timeout_ms])
+        reason = _lib.ProcessWaitResult(reason)
+        return reason
+
+    def read(self, handle, to_read, timeout_ms):
+        """Reads data from a running process.
+
+        in handle of type int
+            Handle to read from. Usually 0 is stdin.
+
+        in to_read of type int
+            Number of bytes to read.
+
+        in timeout_ms of type int
+            Timeout (in ms) to wait for the operation to complete.
+            Pass 0 for an infinite timeout.
+
+        return data of type str
+            Array of data read.
+
+        """
+        if not isinstance(handle, baseinteger):
+            raise TypeError("handle can only be an instance of type baseinteger")
+        if not isinstance(to_read, baseinteger):
+            raise TypeError("to_read can only be an instance of type baseinteger")
+        if not isinstance(timeout_ms, baseinteger):
+            raise TypeError("timeout_ms can only be an instance of type baseinteger")
+        data = self._call("read", in_p=[handle, to_read, timeout_ms])
+        return data
+
+    def write(self, handle, flags, data, timeout_ms):
+        """Writes data to a running process.
+
+        in handle of type int
+            Handle to write to. Usually 0 is stdin, 1 is stdout and 2 is stderr.
+
+        in flags of type int
+            A combination of :py:class:`ProcessInputFlag`  flags.
+
+        in data of type str
+            Array of bytes to write. The size of the array also specifies
+            how much to write.
+
+        in timeout_ms of type int
+            Timeout (in ms) to wait for the operation to complete.
+            Pass 0 for an infinite timeout.
+
+        return written of type int
+            How many bytes were written.
+
+        """
+        if not isinstance(handle, baseinteger):
+            raise TypeError("handle can only be an instance of type baseinteger")
+        if not isinstance(flags, baseinteger):
+            raise TypeError("flags can only be an instance of type baseinteger")
+        if not isinstance(data, list):
+            raise TypeError("data can only be an instance of type list")
+        for a in data[:10]:
+            if not isinstance(a, basestring):
+                raise TypeError("array can only contain objects of type basestring")
+        if not isinstance(timeout_ms, baseinteger):
+            raise TypeError("timeout_ms can only be an instance of type baseinteger")
+        written = self._call("write", in_p=[handle, flags, data, timeout_ms])
+        return written
+
+    def write_array(self, handle, flags, data, timeout_ms):
+        """Writes data to a running process.
+        Scriptable version of :py:func:`write` .
+
+        in handle of type int
+            Handle to write to. Usually 0 is stdin, 1 is stdout and 2 is stderr.
+
+        in flags of type :class:`ProcessInputFlag`
+            A combination of :py:class:`ProcessInputFlag`  flags.
+
+        in data of type str
+            Array of bytes to write. The size of the array also specifies
+            how much to write.
+
+        in timeout_ms of type int
+            Timeout (in ms) to wait for the operation to complete.
+            Pass 0 for an infinite timeout.
+
+        return written of type int
+            How may bytes were written.
+
+        """
+        if not isinstance(handle, baseinteger):
+            raise TypeError("handle can only be an instance of type baseinteger")
+        if not isinstance(flags, list):
+            raise TypeError("flags can only be an instance of type list")
+        for a in flags[:10]:
+            if not isinstance(a, _lib.ProcessInputFlag):
+                raise TypeError(
+                    "array can only contain objects of type ProcessInputFlag"
+                )
+        if not isinstance(data, list):
+            raise TypeError("data can only be an instance of type list")
+        for a in data[:10]:
+            if not isinstance(a, basestring):
+                raise TypeError("array can only contain objects of type basestring")
+        if not isinstance(timeout_ms, baseinteger):
+            raise TypeError("timeout_ms can only be an instance of type baseinteger")
+        written = self._call("writeArray", in_p=[handle, flags, data, timeout_ms])
+        return written
+
+    def terminate(self):
+        """Terminates (kills) a running process.
+        It can take up to 30 seconds to get a guest process killed. In
+        case a guest process could not be killed an appropriate error is
+        returned.
+
+        """
+        self._call("terminate")
@@ -0,0 +1,274 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from ..library_base import Interface
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IProgress(Interface):
+    """
+    The IProgress interface is used to track and control
+    asynchronous tasks within VirtualBox.
+
+    An instance of this is returned every time VirtualBox starts
+    an asynchronous task (in other words, a separate thread) which
+    continues to run after a method call returns. For example,
+    :py:func:`IMachine.save_state` , which saves the state of
+    a running virtual machine, can take a long time to complete.
+    To be able to display a progress bar, a user interface such as
+    the VirtualBox graphical user interface can use the IProgress
+    object returned by that method.
+
+    Note that IProgress is a "read-only" interface in the sense
+    that only the VirtualBox internals behind the Main API can
+    create and manipulate progress objects, whereas client code
+    can only use the IProgress object to monitor a task's
+    progress and, if :py:func:`cancelable`  is @c true,
+    cancel the task by calling :py:func:`cancel` .
+
+    A task represented by IProgress consists of either one or
+    several sub-operations that run sequentially, one by one (see
+    :py:func:`operation`  and :py:func:`operation_count` ).
+    Every operation is identified by a number (starting from 0)
+    and has a separate description.
+
+    You can find the individual percentage of completion of the current
+    operation in :py:func:`operation_percent`  and the
+    percentage of completion of the task as a whole
+    in :py:func:`percent` .
+
+    Similarly, you can wait for the completion of a particular
+    operation via :py:func:`wait_for_operation_completion`  or
+    for the completion of the whole task via
+    :py:func:`wait_for_completion` .
+    """
+
+    __uuid__ = "d7b98d2b-30e8-447e-99cb-e31becae6ae4"
+    __wsmap__ = "managed"
+
+    @property
+    def id_p(self):
+        """Get str value for 'id'
+        ID of the task.
+        """
+        ret = self._get_attr("id")
+        return ret
+
+    @property
+    def description(self):
+        """Get str value for 'description'
+        Description of the task.
+        """
+        ret = self._get_attr("description")
+        return ret
+
+    @property
+    def initiator(self):
+        """Get Interface value for 'initiator'
+        Initiator of the task.
+        """
+        ret = self._get_attr("initiator")
+        return _lib.Interface(ret)
+
+    @property
+    def cancelable(self):
+        """Get bool value for 'cancelable'
+        Whether the task can be interrupted.
+        """
+        ret = self._get_attr("cancelable")
+        return ret
+
+    @property
+    def percent(self):
+        """Get int value for 'percent'
+        Current progress value of the task as a whole, in percent.
+        This value depends on how many operations are already complete.
+        Returns 100 if :py:func:`completed`  is @c true.
+        """
+        ret = self._get_attr("percent")
+        return ret
+
+    @property
+    def time_remaining(self):
+        """Get int value for 'timeRemaining'
+        Estimated remaining time until the task completes, in
+        seconds. Returns 0 once the task has completed; returns -1
+        if the remaining time cannot be computed, in particular if
+        the current progress is 0.
+
+        Even if a value is returned, the estimate will be unreliable
+        for low progress values. It will become more reliable as the
+        task progresses; it is not recommended to display an ETA
+        before at least 20% of a task have completed.
+        """
+        ret = self._get_attr("timeRemaining")
+        return ret
+
+    @property
+    def completed(self):
+        """Get bool value for 'completed'
+        Whether the task has been completed.
+        """
+        ret = self._get_attr("completed")
+        return ret
+
+    @property
+    def canceled(self):
+        """Get bool value for 'canceled'
+        Whether the task has been canceled.
+        """
+        ret = self._get_attr("canceled")
+        return ret
+
+    @property
+    def result_code(self):
+        """Get int value for 'resultCode'
+        Result code of the progress task.
+        Valid only if :py:func:`completed`  is @c true.
+        """
+        ret = self._get_attr("resultCode")
+        return ret
+
+    @property
+    def error_info(self):
+        """Get IVirtualBoxErrorInfo value for 'errorInfo'
+        Extended information about the unsuccessful result of the
+        progress operation. May be @c null if no extended information
+        is available.
+        Valid only if :py:func:`completed`  is @c true and
+        :py:func:`result_code`  indicates a failure.
+        """
+        ret = self._get_attr("errorInfo")
+        return _lib.IVirtualBoxErrorInfo(ret)
+
+    @property
+    def operation_count(self):
+        """Get int value for 'operationCount'
+        Number of sub-operations this task is divided into.
+        Every task consists of at least one suboperation.
+        """
+        ret = self._get_attr("operationCount")
+        return ret
+
+    @property
+    def operation(self):
+        """Get int value for 'operation'
+        Number of the sub-operation being currently executed.
+        """
+        ret = self._get_attr("operation")
+        return ret
+
+    @property
+    def operation_description(self):
+        """Get str value for 'operationDescription'
+        Description of the sub-operation being currently executed.
+        """
+        ret = self._get_attr("operationDescription")
+        return ret
+
+    @property
+    def operation_percent(self):
+        """Get int value for 'operationPercent'
+        Progress value of the current sub-operation only, in percent.
+        """
+        ret = self._get_attr("operationPercent")
+        return ret
+
+    @property
+    def operation_weight(self):
+        """Get int value for 'operationWeight'
+        Weight value of the current sub-operation only.
+        """
+        ret = self._get_attr("operationWeight")
+        return ret
+
+    @property
+    def timeout(self):
+        """Get or set int value for 'timeout'
+        When non-zero, this specifies the number of milliseconds after which
+        the operation will automatically be canceled. This can only be set on
+        cancelable objects.
+        """
+        ret = self._get_attr("timeout")
+        return ret
+
+    @timeout.setter
+    def timeout(self, value):
+        if not isinstance(value, baseinteger):
+            raise TypeError("value is not an instance of baseinteger")
+        return self._set_attr("timeout", value)
+
+    @property
+    def event_source(self):
+        """Get IEventSource value for 'eventSource'"""
+        ret = self._get_attr("eventSource")
+        return _lib.IEventSource(ret)
+
+    def wait_for_completion(self, timeout):
+        """Waits until the task is done (including all sub-operations)
+        with a given timeout in milliseconds; specify -1 for an indefinite wait.
+
+        Note that the VirtualBox/XPCOM/COM/native event queues of the calling
+        thread are not processed while waiting. Neglecting event queues may
+        have dire consequences (degrade performance, resource hogs,
+        deadlocks, etc.), this is specially so for the main thread on
+        platforms using XPCOM. Callers are advised wait for short periods
+        and service their event queues between calls, or to create a worker
+        thread to do the waiting.
+
+        in timeout of type int
+            Maximum time in milliseconds to wait or -1 to wait indefinitely.
+
+        raises :class:`VBoxErrorIprtError`
+            Failed to wait for task completion.
+
+        """
+        if not isinstance(timeout, baseinteger):
+            raise TypeError("timeout can only be an instance of type baseinteger")
+        self._call("waitForCompletion", in_p=[timeout])
+
+    def wait_for_operation_completion(self, operation, timeout):
+        """Waits until the given operation is done with a given timeout in
+        milliseconds; specify -1 for an indefinite wait.
+
+        See :py:func:`wait_for_completion` for event queue considerations.
+
+        in operation of type int
+            Number of the operation to wait for.
+            Must be less than :py:func:`operation_count` .
+
+        in timeout of type int
+            Maximum time in milliseconds to wait or -1 to wait indefinitely.
+
+        raises :class:`VBoxErrorIprtError`
+            Failed to wait for operation completion.
+
+        """
+        if not isinstance(operation, baseinteger):
+            raise TypeError("operation can only be an instance of type baseinteger")
+        if not isinstance(timeout, baseinteger):
+            raise TypeError("timeout can only be an instance of type baseinteger")
+        self._call("waitForOperationCompletion", in_p=[operation, timeout])
+
+    def cancel(self):
+        """Cancels the task.
+
+        If :py:func:`cancelable`  is @c false, then this method will fail.
+
+        raises :class:`VBoxErrorInvalidObjectState`
+            Operation cannot be canceled.
+
+        """
+        self._call("cancel")
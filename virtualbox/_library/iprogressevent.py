@@ -0,0 +1,34 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from .ievent import IEvent
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IProgressEvent(IEvent):
+    """
+    Base abstract interface for all progress events.
+    """
+
+    __uuid__ = "daaf9016-1f04-4191-aa2f-1fac9646ae4c"
+    __wsmap__ = "managed"
+
+    @property
+    def progress_id(self):
+        """Get str value for 'progressId'
+        GUID of the progress this event relates to.
+        """
+        ret = self._get_attr("progressId")
+        return ret
@@ -0,0 +1,36 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from .iprogressevent import IProgressEvent
+from .vboxeventtype import VBoxEventType
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IProgressPercentageChangedEvent(IProgressEvent):
+    """
+    Progress state change event.
+    """
+
+    __uuid__ = "f05d7e60-1bcf-4218-9807-04e036cc70f1"
+    __wsmap__ = "managed"
+    id = VBoxEventType.on_progress_percentage_changed
+
+    @property
+    def percent(self):
+        """Get int value for 'percent'
+        New percent
+        """
+        ret = self._get_attr("percent")
+        return ret
@@ -0,0 +1,71 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from .iformvalue import IFormValue
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IRangedIntegerFormValue(IFormValue):
+    """
+    Counterpart of the :py:func:`IFormValue.label`  attribute.
+    May be null or empty.  Usually used for units.
+    """
+
+    __uuid__ = "b31c4052-7bdc-11e9-8bc2-8ffdb8b19219"
+    __wsmap__ = "managed"
+
+    @property
+    def suffix(self):
+        """Get str value for 'suffix'
+        Counterpart of the :py:func:`IFormValue.label`  attribute.
+        May be null or empty.  Usually used for units.
+        """
+        ret = self._get_attr("suffix")
+        return ret
+
+    @property
+    def minimum(self):
+        """Get int value for 'minimum'"""
+        ret = self._get_attr("minimum")
+        return ret
+
+    @property
+    def maximum(self):
+        """Get int value for 'maximum'"""
+        ret = self._get_attr("maximum")
+        return ret
+
+    def get_integer(self):
+        """
+
+        return value of type int
+
+        """
+        value = self._call("getInteger")
+        return value
+
+    def set_integer(self, value):
+        """
+
+        in value of type int
+
+        return progress of type :class:`IProgress`
+
+        """
+        if not isinstance(value, baseinteger):
+            raise TypeError("value can only be an instance of type baseinteger")
+        progress = self._call("setInteger", in_p=[value])
+        progress = _lib.IProgress(progress)
+        return progress
@@ -0,0 +1,349 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from ..library_base import Interface
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IRecordingScreenSettings(Interface):
+    """
+    The IRecordingScreenSettings interface represents recording settings of a
+    single virtual screen. This is used only in the :py:class:`IRecordingSettings`
+    interface.
+    """
+
+    __uuid__ = "678fbd9a-93af-42a7-7f13-79ad6ef1a18d"
+    __wsmap__ = "managed"
+
+    def is_feature_enabled(self, feature):
+        """Returns whether a particular recording feature is enabled for this
+        screen or not.
+
+        in feature of type :class:`RecordingFeature`
+            Feature to check for.
+
+        return enabled of type bool
+            @c true if the feature is enabled, @c false if not.
+
+        """
+        if not isinstance(feature, _lib.RecordingFeature):
+            raise TypeError("feature can only be an instance of type RecordingFeature")
+        enabled = self._call("isFeatureEnabled", in_p=[feature])
+        return enabled
+
+    @property
+    def id_p(self):
+        """Get int value for 'id'
+        This attribute contains the screen ID bound to these settings.
+        """
+        ret = self._get_attr("id")
+        return ret
+
+    @property
+    def enabled(self):
+        """Get or set bool value for 'enabled'
+        This setting determines whether this screen is enabled while recording.
+        """
+        ret = self._get_attr("enabled")
+        return ret
+
+    @enabled.setter
+    def enabled(self, value):
+        if not isinstance(value, bool):
+            raise TypeError("value is not an instance of bool")
+        return self._set_attr("enabled", value)
+
+    @property
+    def features(self):
+        """Get or set int value for 'features'
+        This setting determines all enabled recording features for this
+        screen.
+        """
+        ret = self._get_attr("features")
+        return ret
+
+    @features.setter
+    def features(self, value):
+        if not isinstance(value, baseinteger):
+            raise TypeError("value is not an instance of baseinteger")
+        return self._set_attr("features", value)
+
+    @property
+    def destination(self):
+        """Get or set RecordingDestination value for 'destination'
+        This setting determines the recording destination for this
+        screen.
+        """
+        ret = self._get_attr("destination")
+        return _lib.RecordingDestination(ret)
+
+    @destination.setter
+    def destination(self, value):
+        if not isinstance(value, _lib.RecordingDestination):
+            raise TypeError("value is not an instance of RecordingDestination")
+        return self._set_attr("destination", value)
+
+    @property
+    def filename(self):
+        """Get or set str value for 'filename'
+        This setting determines the filename VirtualBox uses to save
+        the recorded content. This setting cannot be changed while video
+        recording is enabled.
+
+        When setting this attribute, the specified path has to be
+        absolute (full path). When reading this attribute, a full path is
+        always returned.
+        """
+        ret = self._get_attr("filename")
+        return ret
+
+    @filename.setter
+    def filename(self, value):
+        if not isinstance(value, basestring):
+            raise TypeError("value is not an instance of basestring")
+        return self._set_attr("filename", value)
+
+    @property
+    def max_time(self):
+        """Get or set int value for 'maxTime'
+        This setting defines the maximum amount of time in seconds
+        to record. Recording will stop as soon as the defined time
+        interval has elapsed. If this value is zero, recording will not be
+        limited by time. This setting cannot be changed while recording is
+        enabled.
+        """
+        ret = self._get_attr("maxTime")
+        return ret
+
+    @max_time.setter
+    def max_time(self, value):
+        if not isinstance(value, baseinteger):
+            raise TypeError("value is not an instance of baseinteger")
+        return self._set_attr("maxTime", value)
+
+    @property
+    def max_file_size(self):
+        """Get or set int value for 'maxFileSize'
+        This setting determines the maximal number of recording file
+        size in MB. Recording will stop as soon as the file size has
+        reached the defined value. If this value is zero, recording
+        will not be limited by the file size. This setting cannot be changed
+        while recording is enabled.
+        """
+        ret = self._get_attr("maxFileSize")
+        return ret
+
+    @max_file_size.setter
+    def max_file_size(self, value):
+        if not isinstance(value, baseinteger):
+            raise TypeError("value is not an instance of baseinteger")
+        return self._set_attr("maxFileSize", value)
+
+    @property
+    def options(self):
+        """Get or set str value for 'options'
+        This setting contains any additional recording options
+        required in comma-separated key=value format. This setting
+        cannot be changed while recording is enabled.
+
+        The following keys and their corresponding values are available:
+
+
+
+        ac_enabled
+        Enables audio recording when set to true, otherwise
+        set to false to disable.
+
+        **This feature is considered being experimental.**
+        """
+        ret = self._get_attr("options")
+        return ret
+
+    @options.setter
+    def options(self, value):
+        if not isinstance(value, basestring):
+            raise TypeError("value is not an instance of basestring")
+        return self._set_attr("options", value)
+
+    @property
+    def audio_codec(self):
+        """Get or set RecordingAudioCodec value for 'audioCodec'
+        Determines the audio codec to use for encoding the
+        recorded audio data. This setting cannot be changed while recording is
+        enabled.
+        """
+        ret = self._get_attr("audioCodec")
+        return _lib.RecordingAudioCodec(ret)
+
+    @audio_codec.setter
+    def audio_codec(self, value):
+        if not isinstance(value, _lib.RecordingAudioCodec):
+            raise TypeError("value is not an instance of RecordingAudioCodec")
+        return self._set_attr("audioCodec", value)
+
+    @property
+    def audio_hz(self):
+        """Get or set int value for 'audioHz'
+        Determines the Hertz (Hz) rate of the recorded audio data. This setting
+        cannot be changed while recording is enabled.
+        """
+        ret = self._get_attr("audioHz")
+        return ret
+
+    @audio_hz.setter
+    def audio_hz(self, value):
+        if not isinstance(value, baseinteger):
+            raise TypeError("value is not an instance of baseinteger")
+        return self._set_attr("audioHz", value)
+
+    @property
+    def audio_bits(self):
+        """Get or set int value for 'audioBits'
+        Determines the bits per sample of the recorded audio data. This setting
+        cannot be changed while recording is enabled.
+        """
+        ret = self._get_attr("audioBits")
+        return ret
+
+    @audio_bits.setter
+    def audio_bits(self, value):
+        if not isinstance(value, baseinteger):
+            raise TypeError("value is not an instance of baseinteger")
+        return self._set_attr("audioBits", value)
+
+    @property
+    def audio_channels(self):
+        """Get or set int value for 'audioChannels'
+        Determines the audio channels of the recorded audio data.
+        Specifiy 2 for stereo or 1 for mono. More than stereo (2) channels
+        are not supported at the moment. This setting cannot be changed while
+        recording is enabled.
+        """
+        ret = self._get_attr("audioChannels")
+        return ret
+
+    @audio_channels.setter
+    def audio_channels(self, value):
+        if not isinstance(value, baseinteger):
+            raise TypeError("value is not an instance of baseinteger")
+        return self._set_attr("audioChannels", value)
+
+    @property
+    def video_codec(self):
+        """Get or set RecordingVideoCodec value for 'videoCodec'
+        Determines the video codec to use for encoding the recorded video data.
+        This setting cannot be changed while recording is enabled.
+        """
+        ret = self._get_attr("videoCodec")
+        return _lib.RecordingVideoCodec(ret)
+
+    @video_codec.setter
+    def video_codec(self, value):
+        if not isinstance(value, _lib.RecordingVideoCodec):
+            raise TypeError("value is not an instance of RecordingVideoCodec")
+        return self._set_attr("videoCodec", value)
+
+    @property
+    def video_width(self):
+        """Get or set int value for 'videoWidth'
+        Determines the horizontal resolution of the recorded video data. This
+        setting cannot be changed while recording is enabled.
+        """
+        ret = self._get_attr("videoWidth")
+        return ret
+
+    @video_width.setter
+    def video_width(self, value):
+        if not isinstance(value, baseinteger):
+            raise TypeError("value is not an instance of baseinteger")
+        return self._set_attr("videoWidth", value)
+
+    @property
+    def video_height(self):
+        """Get or set int value for 'videoHeight'
+        Determines the vertical resolution of the recorded video data. This
+        setting cannot be changed while recording is enabled.
+        """
+        ret = self._get_attr("videoHeight")
+        return ret
+
+    @video_height.setter
+    def video_height(self, value):
+        if not isinstance(value, baseinteger):
+            raise TypeError("value is not an instance of baseinteger")
+        return self._set_attr("videoHeight", value)
+
+    @property
+    def video_rate(self):
+        """Get or set int value for 'videoRate'
+        Determines the bitrate in kilobits per second. Increasing this value
+        makes the video look better for the cost of an increased file size or
+        transfer rate. This setting cannot be changed while recording is enabled.
+        """
+        ret = self._get_attr("videoRate")
+        return ret
+
+    @video_rate.setter
+    def video_rate(self, value):
+        if not isinstance(value, baseinteger):
+            raise TypeError("value is not an instance of baseinteger")
+        return self._set_attr("videoRate", value)
+
+    @property
+    def video_rate_control_mode(self):
+        """Get or set RecordingVideoRateControlMode value for 'videoRateControlMode'
+        Determines the rate control mode. This setting cannot be changed
+        while recording is enabled.
+        """
+        ret = self._get_attr("videoRateControlMode")
+        return _lib.RecordingVideoRateControlMode(ret)
+
+    @video_rate_control_mode.setter
+    def video_rate_control_mode(self, value):
+        if not isinstance(value, _lib.RecordingVideoRateControlMode):
+            raise TypeError("value is not an instance of RecordingVideoRateControlMode")
+        return self._set_attr("videoRateControlMode", value)
+
+    @property
+    def video_fps(self):
+        """Get or set int value for 'videoFPS'
+        Determines the maximum number of frames per second (FPS). Frames with
+        a higher frequency will be skipped. Reducing this value increases the
+        number of skipped frames and reduces the file size or transfer rate.
+        This setting cannot be changed while recording is enabled.
+        """
+        ret = self._get_attr("videoFPS")
+        return ret
+
+    @video_fps.setter
+    def video_fps(self, value):
+        if not isinstance(value, baseinteger):
+            raise TypeError("value is not an instance of baseinteger")
+        return self._set_attr("videoFPS", value)
+
+    @property
+    def video_scaling_method(self):
+        """Get or set RecordingVideoScalingMethod value for 'videoScalingMethod'
+        Determines the video scaling method to use.
+        This setting cannot be changed while recording is enabled.
+        """
+        ret = self._get_attr("videoScalingMethod")
+        return _lib.RecordingVideoScalingMethod(ret)
+
+    @video_scaling_method.setter
+    def video_scaling_method(self, value):
+        if not isinstance(value, _lib.RecordingVideoScalingMethod):
+            raise TypeError("value is not an instance of RecordingVideoScalingMethod")
+        return self._set_attr("videoScalingMethod", value)
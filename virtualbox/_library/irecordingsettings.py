@@ -0,0 +1,68 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from ..library_base import Interface
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IRecordingSettings(Interface):
+    """
+    The IRecordingSettings interface represents recording settings of the virtual
+    machine. This is used only in the :py:func:`IMachine.recording_settings`
+    attribute.
+    """
+
+    __uuid__ = "D88F2A5A-47C7-4A3F-AAE1-1B516817DB41"
+    __wsmap__ = "managed"
+
+    def get_screen_settings(self, screen_id):
+        """Returns the recording settings for a particular screen.
+
+        in screen_id of type int
+            Screen ID to retrieve recording screen settings for.
+
+        return record_screen_settings of type :class:`IRecordingScreenSettings`
+            Recording screen settings for the requested screen.
+
+        """
+        if not isinstance(screen_id, baseinteger):
+            raise TypeError("screen_id can only be an instance of type baseinteger")
+        record_screen_settings = self._call("getScreenSettings", in_p=[screen_id])
+        record_screen_settings = _lib.IRecordingScreenSettings(record_screen_settings)
+        return record_screen_settings
+
+    @property
+    def enabled(self):
+        """Get or set bool value for 'enabled'
+        This setting determines whether VirtualBox uses recording to record a
+        VM session.
+        """
+        ret = self._get_attr("enabled")
+        return ret
+
+    @enabled.setter
+    def enabled(self, value):
+        if not isinstance(value, bool):
+            raise TypeError("value is not an instance of bool")
+        return self._set_attr("enabled", value)
+
+    @property
+    def screens(self):
+        """Get IRecordingScreenSettings value for 'screens'
+        This setting returns an array for recording settings of all configured
+        virtual screens.
+        """
+        ret = self._get_attr("screens")
+        return [_lib.IRecordingScreenSettings(a) for a in ret]
@@ -0,0 +1,41 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from .ievent import IEvent
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IReusableEvent(IEvent):
+    """
+    Base abstract interface for all reusable events.
+    """
+
+    __uuid__ = "69bfb134-80f6-4266-8e20-16371f68fa25"
+    __wsmap__ = "managed"
+
+    @property
+    def generation(self):
+        """Get int value for 'generation'
+        Current generation of event, incremented on reuse.
+        """
+        ret = self._get_attr("generation")
+        return ret
+
+    def reuse(self):
+        """Marks an event as reused, increments 'generation', fields shall no
+        longer be considered valid.
+
+        """
+        self._call("reuse")
@@ -0,0 +1,98 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from .ievent import IEvent
+from .vboxeventtype import VBoxEventType
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IRuntimeErrorEvent(IEvent):
+    """
+    Notification when an error happens during the virtual
+    machine execution.
+
+    There are three kinds of runtime errors:
+
+    *fatal*
+    *non-fatal with retry*
+    *non-fatal warnings*
+
+
+    **Fatal** errors are indicated by the @a fatal parameter set
+    to @c true. In case of fatal errors, the virtual machine
+    execution is always paused before calling this notification, and
+    the notification handler is supposed either to immediately save
+    the virtual machine state using :py:func:`IMachine.save_state`
+    or power it off using :py:func:`IConsole.power_down` .
+    Resuming the execution can lead to unpredictable results.
+
+    **Non-fatal** errors and warnings are indicated by the
+    @a fatal parameter set to @c false. If the virtual machine
+    is in the Paused state by the time the error notification is
+    received, it means that the user can *try to resume* the machine
+    execution after attempting to solve the problem that caused the
+    error. In this case, the notification handler is supposed
+    to show an appropriate message to the user (depending on the
+    value of the @a id parameter) that offers several actions such
+    as *Retry*, *Save* or *Power Off*. If the user
+    wants to retry, the notification handler should continue
+    the machine execution using the :py:func:`IConsole.resume`
+    call. If the machine execution is not Paused during this
+    notification, then it means this notification is a *warning*
+    (for example, about a fatal condition that can happen very soon);
+    no immediate action is required from the user, the machine
+    continues its normal execution.
+
+    Note that in either case the notification handler
+    **must not** perform any action directly on a thread
+    where this notification is called. Everything it is allowed to
+    do is to post a message to another thread that will then talk
+    to the user and take the corresponding action.
+
+    Currently, the following error identifiers are known:
+
+    "HostMemoryLow"
+    "HostAudioNotResponding"
+    "VDIStorageFull"
+    "3DSupportIncompatibleAdditions"
+    """
+
+    __uuid__ = "883DD18B-0721-4CDE-867C-1A82ABAF914C"
+    __wsmap__ = "managed"
+    id = VBoxEventType.on_runtime_error
+
+    @property
+    def fatal(self):
+        """Get bool value for 'fatal'
+        Whether the error is fatal or not.
+        """
+        ret = self._get_attr("fatal")
+        return ret
+
+    @property
+    def id_p(self):
+        """Get str value for 'id'
+        Error identifier.
+        """
+        ret = self._get_attr("id")
+        return ret
+
+    @property
+    def message(self):
+        """Get str value for 'message'
+        Optional error message.
+        """
+        ret = self._get_attr("message")
+        return ret
@@ -0,0 +1,166 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from ..library_base import Interface
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class ISerialPort(Interface):
+    """
+    The ISerialPort interface represents the virtual serial port device.
+
+    The virtual serial port device acts like an ordinary serial port
+    inside the virtual machine. This device communicates to the real
+    serial port hardware in one of two modes: host pipe or host device.
+
+    In host pipe mode, the #path attribute specifies the path to the pipe on
+    the host computer that represents a serial port. The #server attribute
+    determines if this pipe is created by the virtual machine process at
+    machine startup or it must already exist before starting machine
+    execution.
+
+    In host device mode, the #path attribute specifies the name of the
+    serial port device on the host computer.
+
+    There is also a third communication mode: the disconnected mode. In this
+    mode, the guest OS running inside the virtual machine will be able to
+    detect the serial port, but all port write operations will be discarded
+    and all port read operations will return no data.
+
+    :py:func:`IMachine.get_serial_port`
+    """
+
+    __uuid__ = "5587d0f6-a227-4f23-8278-2f675eea1bb2"
+    __wsmap__ = "managed"
+
+    @property
+    def slot(self):
+        """Get int value for 'slot'
+        Slot number this serial port is plugged into. Corresponds to
+        the value you pass to :py:func:`IMachine.get_serial_port`
+        to obtain this instance.
+        """
+        ret = self._get_attr("slot")
+        return ret
+
+    @property
+    def enabled(self):
+        """Get or set bool value for 'enabled'
+        Flag whether the serial port is enabled. If disabled,
+        the serial port will not be reported to the guest OS.
+        """
+        ret = self._get_attr("enabled")
+        return ret
+
+    @enabled.setter
+    def enabled(self, value):
+        if not isinstance(value, bool):
+            raise TypeError("value is not an instance of bool")
+        return self._set_attr("enabled", value)
+
+    @property
+    def io_base(self):
+        """Get or set int value for 'IOBase'
+        Base I/O address of the serial port.
+        """
+        ret = self._get_attr("IOBase")
+        return ret
+
+    @io_base.setter
+    def io_base(self, value):
+        if not isinstance(value, baseinteger):
+            raise TypeError("value is not an instance of baseinteger")
+        return self._set_attr("IOBase", value)
+
+    @property
+    def irq(self):
+        """Get or set int value for 'IRQ'
+        IRQ number of the serial port.
+        """
+        ret = self._get_attr("IRQ")
+        return ret
+
+    @irq.setter
+    def irq(self, value):
+        if not isinstance(value, baseinteger):
+            raise TypeError("value is not an instance of baseinteger")
+        return self._set_attr("IRQ", value)
+
+    @property
+    def host_mode(self):
+        """Get or set PortMode value for 'hostMode'
+        How is this port connected to the host.
+
+        Changing this attribute may fail if the conditions for
+        :py:func:`path`  are not met.
+        """
+        ret = self._get_attr("hostMode")
+        return _lib.PortMode(ret)
+
+    @host_mode.setter
+    def host_mode(self, value):
+        if not isinstance(value, _lib.PortMode):
+            raise TypeError("value is not an instance of PortMode")
+        return self._set_attr("hostMode", value)
+
+    @property
+    def server(self):
+        """Get or set bool value for 'server'
+        Flag whether this serial port acts as a server (creates a new pipe on
+        the host) or as a client (uses the existing pipe). This attribute is
+        used only when :py:func:`host_mode`  is PortMode_HostPipe or PortMode_TCP.
+        """
+        ret = self._get_attr("server")
+        return ret
+
+    @server.setter
+    def server(self, value):
+        if not isinstance(value, bool):
+            raise TypeError("value is not an instance of bool")
+        return self._set_attr("server", value)
+
+    @property
+    def path(self):
+        """Get or set str value for 'path'
+        Path to the serial port's pipe on the host when :py:func:`ISerialPort.host_mode`  is
+        PortMode_HostPipe, the host serial device name when
+        :py:func:`ISerialPort.host_mode`  is PortMode_HostDevice or the TCP
+        **port** (server) or **hostname:port** (client) when
+        :py:func:`ISerialPort.host_mode`  is PortMode_TCP.
+        For those cases, setting a @c null or empty string as the attribute's
+        value is an error. Otherwise, the value of this property is ignored.
+        """
+        ret = self._get_attr("path")
+        return ret
+
+    @path.setter
+    def path(self, value):
+        if not isinstance(value, basestring):
+            raise TypeError("value is not an instance of basestring")
+        return self._set_attr("path", value)
+
+    @property
+    def uart_type(self):
+        """Get or set UartType value for 'uartType'
+        Selects the emulated UART implementation.
+        """
+        ret = self._get_attr("uartType")
+        return _lib.UartType(ret)
+
+    @uart_type.setter
+    def uart_type(self, value):
+        if not isinstance(value, _lib.UartType):
+            raise TypeError("value is not an instance of UartType")
+        return self._set_attr("uartType", value)
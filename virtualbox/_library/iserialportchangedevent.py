@@ -0,0 +1,39 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from .ievent import IEvent
+from .vboxeventtype import VBoxEventType
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class ISerialPortChangedEvent(IEvent):
+    """
+    Notification when a property of one of the
+    virtual :py:func:`IMachine.get_serial_port` serial ports changes.
+    Interested callees should use ISerialPort methods and attributes
+    to find out what has changed.
+    """
+
+    __uuid__ = "3BA329DC-659C-488B-835C-4ECA7AE71C6C"
+    __wsmap__ = "managed"
+    id = VBoxEventType.on_serial_port_changed
+
+    @property
+    def serial_port(self):
+        """Get ISerialPort value for 'serialPort'
+        Serial port that is subject to change.
+        """
+        ret = self._get_attr("serialPort")
+        return _lib.ISerialPort(ret)
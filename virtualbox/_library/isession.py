@@ -0,0 +1,157 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from ..library_base import Interface
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class ISession(Interface):
+    """
+    The ISession interface represents a client process and allows for locking
+    virtual machines (represented by IMachine objects) to prevent conflicting
+    changes to the machine.
+
+    Any caller wishing to manipulate a virtual machine needs to create a session
+    object first, which lives in its own process space. Such session objects are
+    then associated with :py:class:`IMachine`  objects living in the VirtualBox
+    server process to coordinate such changes.
+
+    There are two typical scenarios in which sessions are used:
+
+
+    To alter machine settings or control a running virtual machine, one
+    needs to lock a machine for a given session (client process) by calling
+    :py:func:`IMachine.lock_machine` .
+
+    Whereas multiple sessions may control a running virtual machine, only
+    one process can obtain a write lock on the machine to prevent conflicting
+    changes. A write lock is also needed if a process wants to actually run a
+    virtual machine in its own context, such as the VirtualBox GUI or
+    VBoxHeadless front-ends. They must also lock a machine for their own
+    sessions before they are allowed to power up the virtual machine.
+
+    As a result, no machine settings can be altered while another process is
+    already using it, either because that process is modifying machine settings
+    or because the machine is running.
+
+
+    To start a VM using one of the existing VirtualBox front-ends (e.g. the
+    VirtualBox GUI or VBoxHeadless), one would use
+    :py:func:`IMachine.launch_vm_process` , which also takes a session object
+    as its first parameter. This session then identifies the caller and lets the
+    caller control the started machine (for example, pause machine execution or
+    power it down) as well as be notified about machine execution state changes.
+
+
+
+    How sessions objects are created in a client process depends on whether you use
+    the Main API via COM or via the webservice:
+
+
+    When using the COM API directly, an object of the Session class from the
+    VirtualBox type library needs to be created. In regular COM C++ client code,
+    this can be done by calling createLocalObject(), a standard COM API.
+    This object will then act as a local session object in further calls to open
+    a session.
+
+
+    In the webservice, the session manager (IWebsessionManager) instead creates
+    a session object automatically whenever :py:func:`IWebsessionManager.logon`
+    is called. A managed object reference to that session object can be retrieved by
+    calling :py:func:`IWebsessionManager.get_session_object` .
+    """
+
+    __uuid__ = "c0447716-ff5a-4795-b57a-ecd5fffa18a4"
+    __wsmap__ = "managed"
+
+    @property
+    def state(self):
+        """Get SessionState value for 'state'
+        Current state of this session.
+        """
+        ret = self._get_attr("state")
+        return _lib.SessionState(ret)
+
+    @property
+    def type_p(self):
+        """Get SessionType value for 'type'
+        Type of this session. The value of this attribute is valid only
+        if the session currently has a machine locked (i.e. its
+        :py:func:`state`  is Locked), otherwise an error will be returned.
+        """
+        ret = self._get_attr("type")
+        return _lib.SessionType(ret)
+
+    @property
+    def name(self):
+        """Get or set str value for 'name'
+        Name of this session. Important only for VM sessions, otherwise it
+        it will be remembered, but not used for anything significant (and can
+        be left at the empty string which is the default). The value can only
+        be changed when the session state is SessionState_Unlocked. Make sure
+        that you use a descriptive name which does not conflict with the VM
+        process session names: "GUI/Qt", "GUI/SDL" and "headless".
+        """
+        ret = self._get_attr("name")
+        return ret
+
+    @name.setter
+    def name(self, value):
+        if not isinstance(value, basestring):
+            raise TypeError("value is not an instance of basestring")
+        return self._set_attr("name", value)
+
+    @property
+    def machine(self):
+        """Get IMachine value for 'machine'
+        Machine object associated with this session.
+        """
+        ret = self._get_attr("machine")
+        return _lib.IMachine(ret)
+
+    @property
+    def console(self):
+        """Get IConsole value for 'console'
+        Console object associated with this session. Only sessions
+        which locked the machine for a VM process have a non-null console.
+        """
+        ret = self._get_attr("console")
+        return _lib.IConsole(ret)
+
+    def unlock_machine(self):
+        """Unlocks a machine that was previously locked for the current session.
+
+        Calling this method is required every time a machine has been locked
+        for a particular session using the :py:func:`IMachine.launch_vm_process`
+        or :py:func:`IMachine.lock_machine`  calls. Otherwise the state of
+        the machine will be set to :py:attr:`MachineState.aborted`  on the
+        server, and changes made to the machine settings will be lost.
+
+        Generally, it is recommended to unlock all machines explicitly
+        before terminating the application (regardless of the reason for
+        the termination).
+
+
+        Do not expect the session state (:py:func:`ISession.state`
+        to return to "Unlocked" immediately after you invoke this method,
+        particularly if you have started a new VM process. The session
+        state will automatically return to "Unlocked" once the VM is no
+        longer executing, which can of course take a very long time.
+
+        raises :class:`OleErrorUnexpected`
+            Session is not locked.
+
+        """
+        self._call("unlockMachine")
@@ -0,0 +1,37 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from .imachineevent import IMachineEvent
+from .vboxeventtype import VBoxEventType
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class ISessionStateChangedEvent(IMachineEvent):
+    """
+    The state of the session for the given machine was changed.
+    :py:func:`IMachine.session_state`
+    """
+
+    __uuid__ = "714a3eef-799a-4489-86cd-fe8e45b2ff8e"
+    __wsmap__ = "managed"
+    id = VBoxEventType.on_session_state_changed
+
+    @property
+    def state(self):
+        """Get SessionState value for 'state'
+        New session state.
+        """
+        ret = self._get_attr("state")
+        return _lib.SessionState(ret)
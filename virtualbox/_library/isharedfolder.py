@@ -0,0 +1,166 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from ..library_base import Interface
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class ISharedFolder(Interface):
+    """
+    The ISharedFolder interface represents a folder in the host computer's
+    file system accessible from the guest OS running inside a virtual
+    machine using an associated logical name.
+
+    There are three types of shared folders:
+
+    *Global* (:py:func:`IVirtualBox.shared_folders` ), shared
+    folders available to all virtual machines.
+    *Permanent* (:py:func:`IMachine.shared_folders` ),
+    VM-specific shared folders available to the given virtual machine at
+    startup.
+    *Transient* (:py:func:`IConsole.shared_folders` ),
+    VM-specific shared folders created in the session context (for
+    example, when the virtual machine is running) and automatically
+    discarded when the session is closed (the VM is powered off).
+
+
+    Logical names of shared folders must be unique within the given scope
+    (global, permanent or transient). However, they do not need to be unique
+    across scopes. In this case, the definition of the shared folder in a
+    more specific scope takes precedence over definitions in all other
+    scopes. The order of precedence is (more specific to more general):
+
+    Transient definitions
+    Permanent definitions
+    Global definitions
+
+
+    For example, if MyMachine has a shared folder named
+    C_DRIVE (that points to C:\\), then creating a
+    transient shared folder named C_DRIVE (that points
+    to C:\\\\WINDOWS) will change the definition
+    of C_DRIVE in the guest OS so
+    that \\\\VBOXSVR\\C_DRIVE will give access
+    to C:\\WINDOWS instead of C:\\ on the host
+    PC. Removing the transient shared folder C_DRIVE will restore
+    the previous (permanent) definition of C_DRIVE that points
+    to C:\\ if it still exists.
+
+    Note that permanent and transient shared folders of different machines
+    are in different name spaces, so they don't overlap and don't need to
+    have unique logical names.
+
+
+    Global shared folders are not implemented in the current version of the
+    product.
+    """
+
+    __uuid__ = "9622225a-5409-414b-bd16-77df7ba3451e"
+    __wsmap__ = "managed"
+
+    @property
+    def name(self):
+        """Get str value for 'name'
+        Logical name of the shared folder.
+        """
+        ret = self._get_attr("name")
+        return ret
+
+    @property
+    def host_path(self):
+        """Get str value for 'hostPath'
+        Full path to the shared folder in the host file system.
+        """
+        ret = self._get_attr("hostPath")
+        return ret
+
+    @property
+    def accessible(self):
+        """Get bool value for 'accessible'
+        Whether the folder defined by the host path is currently
+        accessible or not.
+
+        For example, the folder can be inaccessible if it is placed
+        on the network share that is not available by the time
+        this property is read.
+        """
+        ret = self._get_attr("accessible")
+        return ret
+
+    @property
+    def writable(self):
+        """Get or set bool value for 'writable'
+        Whether the folder defined by the host path is writable or
+        not.
+        """
+        ret = self._get_attr("writable")
+        return ret
+
+    @writable.setter
+    def writable(self, value):
+        if not isinstance(value, bool):
+            raise TypeError("value is not an instance of bool")
+        return self._set_attr("writable", value)
+
+    @property
+    def auto_mount(self):
+        """Get or set bool value for 'autoMount'
+        Whether the folder gets automatically mounted by the guest or not.
+        """
+        ret = self._get_attr("autoMount")
+        return ret
+
+    @auto_mount.setter
+    def auto_mount(self, value):
+        if not isinstance(value, bool):
+            raise TypeError("value is not an instance of bool")
+        return self._set_attr("autoMount", value)
+
+    @property
+    def auto_mount_point(self):
+        """Get or set str value for 'autoMountPoint'
+        Desired mount point in the guest for automatically mounting the folder
+        when :py:func:`ISharedFolder.auto_mount`  is set.  For Windows and
+        OS/2 guests this should be a drive letter, while other guests it should
+        be a absolute directory.  It is possible to combine the two, e.g.
+        "T:/mnt/testrsrc" will be attached to "T:" by windows and OS/2 while
+        the unixy guests will mount it at "/mnt/testrsrc".
+
+        When empty the guest will choose a mount point.  The guest may do so
+        too should the specified mount point be in use or otherwise unusable.
+        """
+        ret = self._get_attr("autoMountPoint")
+        return ret
+
+    @auto_mount_point.setter
+    def auto_mount_point(self, value):
+        if not isinstance(value, basestring):
+            raise TypeError("value is not an instance of basestring")
+        return self._set_attr("autoMountPoint", value)
+
+    @property
+    def last_access_error(self):
+        """Get str value for 'lastAccessError'
+        Text message that represents the result of the last accessibility
+        check.
+
+        Accessibility checks are performed each time the :py:func:`accessible`
+        attribute is read. An empty string is returned if the last
+        accessibility check was successful. A non-empty string indicates a
+        failure and should normally describe a reason of the failure (for
+        example, a file read error).
+        """
+        ret = self._get_attr("lastAccessError")
+        return ret
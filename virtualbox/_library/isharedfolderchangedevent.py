@@ -0,0 +1,44 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from .ievent import IEvent
+from .vboxeventtype import VBoxEventType
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class ISharedFolderChangedEvent(IEvent):
+    """
+    Notification when a shared folder is added or removed.
+    The @a scope argument defines one of three scopes:
+    :py:func:`IVirtualBox.shared_folders` global shared folders
+    (:py:attr:`Scope.global_p` Global),
+    :py:func:`IMachine.shared_folders` permanent shared folders of
+    the machine (:py:attr:`Scope.machine` Machine) or :py:func:`IConsole.shared_folders` transient shared folders of the
+    machine (:py:attr:`Scope.session` Session). Interested callees
+    should use query the corresponding collections to find out what has
+    changed.
+    """
+
+    __uuid__ = "B66349B5-3534-4239-B2DE-8E1535D94C0B"
+    __wsmap__ = "managed"
+    id = VBoxEventType.on_shared_folder_changed
+
+    @property
+    def scope(self):
+        """Get Scope value for 'scope'
+        Scope of the notification.
+        """
+        ret = self._get_attr("scope")
+        return _lib.Scope(ret)
@@ -0,0 +1,69 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from .ievent import IEvent
+from .vboxeventtype import VBoxEventType
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IShowWindowEvent(IEvent):
+    """
+    Notification when a call to
+    :py:func:`IMachine.show_console_window`
+    requests the console window to be activated and brought to
+    foreground on the desktop of the host PC.
+
+    This notification should cause the VM console process to
+    perform the requested action as described above. If it is
+    impossible to do it at a time of this notification, this
+    method should return a failure.
+
+    Note that many modern window managers on many platforms
+    implement some sort of focus stealing prevention logic, so
+    that it may be impossible to activate a window without the
+    help of the currently active application (which is supposedly
+    an initiator of this notification). In this case, this method
+    must return a non-zero identifier that represents the
+    top-level window of the VM console process. The caller, if it
+    represents a currently active process, is responsible to use
+    this identifier (in a platform-dependent manner) to perform
+    actual window activation.
+
+    This method must set @a winId to zero if it has performed all
+    actions necessary to complete the request and the console
+    window is now active and in foreground, to indicate that no
+    further action is required on the caller's side.
+    """
+
+    __uuid__ = "B0A0904D-2F05-4D28-855F-488F96BAD2B2"
+    __wsmap__ = "managed"
+    id = VBoxEventType.on_show_window
+
+    @property
+    def win_id(self):
+        """Get or set int value for 'winId'
+        Platform-dependent identifier of the top-level VM console
+        window, or zero if this method has performed all actions
+        necessary to implement the *show window* semantics for
+        the given platform and/or this VirtualBox front-end.
+        """
+        ret = self._get_attr("winId")
+        return ret
+
+    @win_id.setter
+    def win_id(self, value):
+        if not isinstance(value, baseinteger):
+            raise TypeError("value is not an instance of baseinteger")
+        return self._set_attr("winId", value)
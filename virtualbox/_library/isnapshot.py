@@ -0,0 +1,206 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from ..library_base import Interface
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class ISnapshot(Interface):
+    """
+    The ISnapshot interface represents a snapshot of the virtual
+    machine.
+
+    Together with the differencing media that are created
+    when a snapshot is taken, a machine can be brought back to
+    the exact state it was in when the snapshot was taken.
+
+    The ISnapshot interface has no methods, only attributes; snapshots
+    are controlled through methods of the :py:class:`IMachine`  interface
+    which also manage the media associated with the snapshot.
+    The following operations exist:
+
+
+    :py:func:`IMachine.take_snapshot`  creates a new snapshot
+    by creating new, empty differencing images for the machine's
+    media and saving the VM settings and (if the VM is running)
+    the current VM state in the snapshot.
+
+    The differencing images will then receive all data written to
+    the machine's media, while their parent (base) images
+    remain unmodified after the snapshot has been taken (see
+    :py:class:`IMedium`  for details about differencing images).
+    This simplifies restoring a machine to the state of a snapshot:
+    only the differencing images need to be deleted.
+
+    The current machine state is not changed by taking a snapshot
+    except that :py:func:`IMachine.current_snapshot`  is set to
+    the newly created snapshot, which is also added to the machine's
+    snapshots tree.
+
+
+    :py:func:`IMachine.restore_snapshot`  resets a machine to
+    the state of a previous snapshot by deleting the differencing
+    image of each of the machine's media and setting the machine's
+    settings and state to the state that was saved in the snapshot (if any).
+
+    This destroys the machine's current state. After calling this,
+    :py:func:`IMachine.current_snapshot`  points to the snapshot
+    that was restored.
+
+
+    :py:func:`IMachine.delete_snapshot`  deletes a snapshot
+    without affecting the current machine state.
+
+    This does not change the current machine state, but instead frees the
+    resources allocated when the snapshot was taken: the settings and machine
+    state file are deleted (if any), and the snapshot's differencing image for
+    each of the machine's media gets merged with its parent image.
+
+    Neither the current machine state nor other snapshots are affected
+    by this operation, except that parent media will be modified
+    to contain the disk data associated with the snapshot being deleted.
+
+    When deleting the current snapshot, the :py:func:`IMachine.current_snapshot`
+    attribute is set to the current snapshot's parent or @c null if it
+    has no parent. Otherwise the attribute is unchanged.
+
+
+
+    Each snapshot contains a copy of virtual machine's settings (hardware
+    configuration etc.). This copy is contained in an immutable (read-only)
+    instance of :py:class:`IMachine`  which is available from the snapshot's
+    :py:func:`machine`  attribute. When restoring the snapshot, these
+    settings are copied back to the original machine.
+
+    In addition, if the machine was running when the
+    snapshot was taken (:py:func:`IMachine.state`  is :py:attr:`MachineState.running` ),
+    the current VM state is saved in the snapshot (similarly to what happens
+    when a VM's state is saved). The snapshot is then said to be *online*
+    because when restoring it, the VM will be running.
+
+    If the machine was in :py:attr:`MachineState.saved` saved saved,
+    the snapshot receives a copy of the execution state file
+    (:py:func:`IMachine.state_file_path` ).
+
+    Otherwise, if the machine was not running (:py:attr:`MachineState.powered_off`
+    or :py:attr:`MachineState.aborted` ), the snapshot is *offline*;
+    it then contains a so-called "zero execution state", representing a
+    machine that is powered off.
+    """
+
+    __uuid__ = "6cc49055-dad4-4496-85cf-3f76bcb3b5fa"
+    __wsmap__ = "managed"
+
+    @property
+    def id_p(self):
+        """Get str value for 'id'
+        UUID of the snapshot.
+        """
+        ret = self._get_attr("id")
+        return ret
+
+    @property
+    def name(self):
+        """Get or set str value for 'name'
+        Short name of the snapshot.
+        Setting this attribute causes :py:func:`IMachine.save_settings`  to
+        be called implicitly.
+        """
+        ret = self._get_attr("name")
+        return ret
+
+    @name.setter
+    def name(self, value):
+        if not isinstance(value, basestring):
+            raise TypeError("value is not an instance of basestring")
+        return self._set_attr("name", value)
+
+    @property
+    def description(self):
+        """Get or set str value for 'description'
+        Optional description of the snapshot.
+        Setting this attribute causes :py:func:`IMachine.save_settings`  to
+        be called implicitly.
+        """
+        ret = self._get_attr("description")
+        return ret
+
+    @description.setter
+    def description(self, value):
+        if not isinstance(value, basestring):
+            raise TypeError("value is not an instance of basestring")
+        return self._set_attr("description", value)
+
+    @property
+    def time_stamp(self):
+        """Get int value for 'timeStamp'
+        Timestamp of the snapshot, in milliseconds since 1970-01-01 UTC.
+        """
+        ret = self._get_attr("timeStamp")
+        return ret
+
+    @property
+    def online(self):
+        """Get bool value for 'online'
+        @c true if this snapshot is an online snapshot and @c false otherwise.
+
+        When this attribute is @c true, the
+        :py:func:`IMachine.state_file_path`  attribute of the
+        :py:func:`machine`  object associated with this snapshot
+        will point to the saved state file. Otherwise, it will be
+        an empty string.
+        """
+        ret = self._get_attr("online")
+        return ret
+
+    @property
+    def machine(self):
+        """Get IMachine value for 'machine'
+        Virtual machine this snapshot is taken on. This object
+        stores all settings the machine had when taking this snapshot.
+
+        The returned machine object is immutable, i.e. no
+        any settings can be changed.
+        """
+        ret = self._get_attr("machine")
+        return _lib.IMachine(ret)
+
+    @property
+    def parent(self):
+        """Get ISnapshot value for 'parent'
+        Parent snapshot (a snapshot this one is based on), or
+        @c null if the snapshot has no parent (i.e. is the first snapshot).
+        """
+        ret = self._get_attr("parent")
+        return _lib.ISnapshot(ret)
+
+    @property
+    def children(self):
+        """Get ISnapshot value for 'children'
+        Child snapshots (all snapshots having this one as a parent).
+        By inspecting this attribute starting with a machine's root snapshot
+        (which can be obtained by calling :py:func:`IMachine.find_snapshot`
+        with a @c null UUID), a machine's snapshots tree can be iterated over.
+        """
+        ret = self._get_attr("children")
+        return [_lib.ISnapshot(a) for a in ret]
+
+    @property
+    def children_count(self):
+        """Get int value for 'childrenCount'
+        Returns the number of direct children of this snapshot.
+        """
+        ret = self._get_attr("childrenCount")
+        return ret
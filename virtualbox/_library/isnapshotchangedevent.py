@@ -0,0 +1,35 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from .isnapshotevent import ISnapshotEvent
+from .vboxeventtype import VBoxEventType
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class ISnapshotChangedEvent(ISnapshotEvent):
+    """
+    Snapshot properties (name and/or description) have been changed.
+    :py:class:`ISnapshot`
+    """
+
+    __uuid__ = "07541941-8079-447a-a33e-47a69c7980db"
+    __wsmap__ = "managed"
+    id = VBoxEventType.on_snapshot_changed
+
+    @property
+    def midl_does_not_like_empty_interfaces(self):
+        """Get bool value for 'midlDoesNotLikeEmptyInterfaces'"""
+        ret = self._get_attr("midlDoesNotLikeEmptyInterfaces")
+        return ret
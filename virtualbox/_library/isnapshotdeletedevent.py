@@ -0,0 +1,42 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from .isnapshotevent import ISnapshotEvent
+from .vboxeventtype import VBoxEventType
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class ISnapshotDeletedEvent(ISnapshotEvent):
+    """
+    Snapshot of the given machine has been deleted.
+
+
+    This notification is delivered **after** the snapshot
+    object has been uninitialized on the server (so that any
+    attempt to call its methods will return an error).
+
+
+    :py:class:`ISnapshot`
+    """
+
+    __uuid__ = "c48f3401-4a9e-43f4-b7a7-54bd285e22f4"
+    __wsmap__ = "managed"
+    id = VBoxEventType.on_snapshot_deleted
+
+    @property
+    def midl_does_not_like_empty_interfaces(self):
+        """Get bool value for 'midlDoesNotLikeEmptyInterfaces'"""
+        ret = self._get_attr("midlDoesNotLikeEmptyInterfaces")
+        return ret
@@ -0,0 +1,36 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from .imachineevent import IMachineEvent
+from .vboxeventtype import VBoxEventType
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class ISnapshotEvent(IMachineEvent):
+    """
+    Base interface for all snapshot events.
+    """
+
+    __uuid__ = "21637b0e-34b8-42d3-acfb-7e96daf77c22"
+    __wsmap__ = "managed"
+    id = VBoxEventType.snapshot_event
+
+    @property
+    def snapshot_id(self):
+        """Get str value for 'snapshotId'
+        ID of the snapshot this event relates to.
+        """
+        ret = self._get_attr("snapshotId")
+        return ret
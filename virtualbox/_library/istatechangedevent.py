@@ -0,0 +1,37 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from .ievent import IEvent
+from .vboxeventtype import VBoxEventType
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IStateChangedEvent(IEvent):
+    """
+    Notification when the execution state of the machine has changed.
+    The new state is given.
+    """
+
+    __uuid__ = "4376693C-CF37-453B-9289-3B0F521CAF27"
+    __wsmap__ = "managed"
+    id = VBoxEventType.on_state_changed
+
+    @property
+    def state(self):
+        """Get MachineState value for 'state'
+        New machine state.
+        """
+        ret = self._get_attr("state")
+        return _lib.MachineState(ret)
@@ -0,0 +1,173 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from ..library_base import Interface
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IStorageController(Interface):
+    """
+    Represents a storage controller that is attached to a virtual machine
+    (:py:class:`IMachine` ). Just as drives (hard disks, DVDs, FDs) are
+    attached to storage controllers in a real computer, virtual drives
+    (represented by :py:class:`IMediumAttachment` ) are attached to virtual
+    storage controllers, represented by this interface.
+
+    As opposed to physical hardware, VirtualBox has a very generic concept
+    of a storage controller, and for purposes of the Main API, all virtual
+    storage is attached to virtual machines via instances of this interface.
+    There are five types of such virtual storage controllers: IDE, SCSI, SATA,
+    SAS and Floppy (see :py:func:`bus` ). Depending on which of these four
+    is used, certain sub-types may be available and can be selected in
+    :py:func:`controller_type` .
+
+    Depending on these settings, the guest operating system might see
+    significantly different virtual hardware.
+    """
+
+    __uuid__ = "ddca7247-bf98-47fb-ab2f-b5177533f493"
+    __wsmap__ = "managed"
+
+    @property
+    def name(self):
+        """Get or set str value for 'name'
+        Name of the storage controller, as originally specified with
+        :py:func:`IMachine.add_storage_controller` . This then uniquely
+        identifies this controller with other method calls such as
+        :py:func:`IMachine.attach_device`  and :py:func:`IMachine.mount_medium` .
+        """
+        ret = self._get_attr("name")
+        return ret
+
+    @name.setter
+    def name(self, value):
+        if not isinstance(value, basestring):
+            raise TypeError("value is not an instance of basestring")
+        return self._set_attr("name", value)
+
+    @property
+    def max_devices_per_port_count(self):
+        """Get int value for 'maxDevicesPerPortCount'
+        Maximum number of devices which can be attached to one port.
+        """
+        ret = self._get_attr("maxDevicesPerPortCount")
+        return ret
+
+    @property
+    def min_port_count(self):
+        """Get int value for 'minPortCount'
+        Minimum number of ports that :py:func:`IStorageController.port_count`  can be set to.
+        """
+        ret = self._get_attr("minPortCount")
+        return ret
+
+    @property
+    def max_port_count(self):
+        """Get int value for 'maxPortCount'
+        Maximum number of ports that :py:func:`IStorageController.port_count`  can be set to.
+        """
+        ret = self._get_attr("maxPortCount")
+        return ret
+
+    @property
+    def instance(self):
+        """Get or set int value for 'instance'
+        The instance number of the device in the running VM.
+        """
+        ret = self._get_attr("instance")
+        return ret
+
+    @instance.setter
+    def instance(self, value):
+        if not isinstance(value, baseinteger):
+            raise TypeError("value is not an instance of baseinteger")
+        return self._set_attr("instance", value)
+
+    @property
+    def port_count(self):
+        """Get or set int value for 'portCount'
+        The number of currently usable ports on the controller.
+        The minimum and maximum number of ports for one controller are
+        stored in :py:func:`IStorageController.min_port_count`
+        and :py:func:`IStorageController.max_port_count` .
+        """
+        ret = self._get_attr("portCount")
+        return ret
+
+    @port_count.setter
+    def port_count(self, value):
+        if not isinstance(value, baseinteger):
+            raise TypeError("value is not an instance of baseinteger")
+        return self._set_attr("portCount", value)
+
+    @property
+    def bus(self):
+        """Get StorageBus value for 'bus'
+        The bus type of the storage controller (IDE, SATA, SCSI, SAS or Floppy).
+        """
+        ret = self._get_attr("bus")
+        return _lib.StorageBus(ret)
+
+    @property
+    def controller_type(self):
+        """Get or set StorageControllerType value for 'controllerType'
+        The exact variant of storage controller hardware presented
+        to the guest.
+        Depending on this value, VirtualBox will provide a different
+        virtual storage controller hardware to the guest.
+        For SATA, SAS and floppy controllers, only one variant is
+        available, but for IDE and SCSI, there are several.
+
+        For SCSI controllers, the default type is LsiLogic.
+        """
+        ret = self._get_attr("controllerType")
+        return _lib.StorageControllerType(ret)
+
+    @controller_type.setter
+    def controller_type(self, value):
+        if not isinstance(value, _lib.StorageControllerType):
+            raise TypeError("value is not an instance of StorageControllerType")
+        return self._set_attr("controllerType", value)
+
+    @property
+    def use_host_io_cache(self):
+        """Get or set bool value for 'useHostIOCache'
+        If true, the storage controller emulation will use a dedicated I/O thread, enable the host I/O
+        caches and use synchronous file APIs on the host. This was the only option in the API before
+        VirtualBox 3.2 and is still the default for IDE controllers.
+
+        If false, the host I/O cache will be disabled for image files attached to this storage controller.
+        Instead, the storage controller emulation will use asynchronous I/O APIs on the host. This makes
+        it possible to turn off the host I/O caches because the emulation can handle unaligned access to
+        the file. This should be used on OS X and Linux hosts if a high I/O load is expected or many
+        virtual machines are running at the same time to prevent I/O cache related hangs.
+        This option new with the API of VirtualBox 3.2 and is now the default for non-IDE storage controllers.
+        """
+        ret = self._get_attr("useHostIOCache")
+        return ret
+
+    @use_host_io_cache.setter
+    def use_host_io_cache(self, value):
+        if not isinstance(value, bool):
+            raise TypeError("value is not an instance of bool")
+        return self._set_attr("useHostIOCache", value)
+
+    @property
+    def bootable(self):
+        """Get bool value for 'bootable'
+        Returns whether it is possible to boot from disks attached to this controller.
+        """
+        ret = self._get_attr("bootable")
+        return ret
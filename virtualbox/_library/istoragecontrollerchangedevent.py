@@ -0,0 +1,46 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from .ievent import IEvent
+from .vboxeventtype import VBoxEventType
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IStorageControllerChangedEvent(IEvent):
+    """
+    Notification when a
+    :py:func:`IMachine.storage_controllers` storage controllers
+    changes.
+    """
+
+    __uuid__ = "6BB335CC-1C58-440C-BB7B-3A1397284C7B"
+    __wsmap__ = "managed"
+    id = VBoxEventType.on_storage_controller_changed
+
+    @property
+    def machin_id(self):
+        """Get str value for 'machinId'
+        The id of the machine containing the storage controller.
+        """
+        ret = self._get_attr("machinId")
+        return ret
+
+    @property
+    def controller_name(self):
+        """Get str value for 'controllerName'
+        The name of the storage controller.
+        """
+        ret = self._get_attr("controllerName")
+        return ret
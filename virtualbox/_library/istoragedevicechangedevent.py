@@ -0,0 +1,54 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from .ievent import IEvent
+from .vboxeventtype import VBoxEventType
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IStorageDeviceChangedEvent(IEvent):
+    """
+    Notification when a
+    :py:func:`IMachine.medium_attachments` storage device
+    is attached or removed.
+    """
+
+    __uuid__ = "232e9151-ae84-4b8e-b0f3-5c20c35caac9"
+    __wsmap__ = "managed"
+    id = VBoxEventType.on_storage_device_changed
+
+    @property
+    def storage_device(self):
+        """Get IMediumAttachment value for 'storageDevice'
+        Storage device that is subject to change.
+        """
+        ret = self._get_attr("storageDevice")
+        return _lib.IMediumAttachment(ret)
+
+    @property
+    def removed(self):
+        """Get bool value for 'removed'
+        Flag whether the device was removed or added to the VM.
+        """
+        ret = self._get_attr("removed")
+        return ret
+
+    @property
+    def silent(self):
+        """Get bool value for 'silent'
+        Flag whether the guest should be notified about the change.
+        """
+        ret = self._get_attr("silent")
+        return ret
@@ -0,0 +1,35 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from ..library_base import Interface
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IStringArray(Interface):
+    """
+    When you need to return an array of strings asynchronously
+    (under a progress) you cannot use by-value out parameter
+    type="wstring" safearray="yes"
+    dir="out", hence this wrapper.
+    """
+
+    __uuid__ = "3890b2c8-604d-11e9-92d3-53cb473db9fb"
+    __wsmap__ = "managed"
+
+    @property
+    def values(self):
+        """Get str value for 'values'"""
+        ret = self._get_attr("values")
+        return ret
@@ -0,0 +1,67 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from .iformvalue import IFormValue
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IStringFormValue(IFormValue):
+    """
+    Intnded for cases when a read-only string value is used to
+    display information and different string is to be used when
+    copying to the clipboard.
+    """
+
+    __uuid__ = "cb6f0f2c-8384-11e9-921d-8b984e28a686"
+    __wsmap__ = "managed"
+
+    @property
+    def multiline(self):
+        """Get bool value for 'multiline'"""
+        ret = self._get_attr("multiline")
+        return ret
+
+    def get_string(self):
+        """
+
+        return text of type str
+
+        """
+        text = self._call("getString")
+        return text
+
+    def set_string(self, text):
+        """
+
+        in text of type str
+
+        return progress of type :class:`IProgress`
+
+        """
+        if not isinstance(text, basestring):
+            raise TypeError("text can only be an instance of type basestring")
+        progress = self._call("setString", in_p=[text])
+        progress = _lib.IProgress(progress)
+        return progress
+
+    @property
+    def clipboard_string(self):
+        """Get str value for 'clipboardString'
+        Intnded for cases when a read-only string value is used to
+        display information and different string is to be used when
+        copying to the clipboard.
+        """
+        ret = self._get_attr("clipboardString")
+        return ret
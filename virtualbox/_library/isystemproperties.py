@@ -0,0 +1,1138 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from ..library_base import Interface
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class ISystemProperties(Interface):
+    """
+    The ISystemProperties interface represents global properties of the given
+    VirtualBox installation.
+
+    These properties define limits and default values for various attributes
+    and parameters. Most of the properties are read-only, but some can be
+    changed by a user.
+    """
+
+    __uuid__ = "81c55eb1-d584-41a7-aa0b-08b71cddd773"
+    __wsmap__ = "managed"
+
+    @property
+    def min_guest_ram(self):
+        """Get int value for 'minGuestRAM'
+        Minimum guest system memory in Megabytes.
+        """
+        ret = self._get_attr("minGuestRAM")
+        return ret
+
+    @property
+    def max_guest_ram(self):
+        """Get int value for 'maxGuestRAM'
+        Maximum guest system memory in Megabytes.
+        """
+        ret = self._get_attr("maxGuestRAM")
+        return ret
+
+    @property
+    def min_guest_vram(self):
+        """Get int value for 'minGuestVRAM'
+        Minimum guest video memory in Megabytes.
+        """
+        ret = self._get_attr("minGuestVRAM")
+        return ret
+
+    @property
+    def max_guest_vram(self):
+        """Get int value for 'maxGuestVRAM'
+        Maximum guest video memory in Megabytes.
+        """
+        ret = self._get_attr("maxGuestVRAM")
+        return ret
+
+    @property
+    def min_guest_cpu_count(self):
+        """Get int value for 'minGuestCPUCount'
+        Minimum CPU count.
+        """
+        ret = self._get_attr("minGuestCPUCount")
+        return ret
+
+    @property
+    def max_guest_cpu_count(self):
+        """Get int value for 'maxGuestCPUCount'
+        Maximum CPU count.
+        """
+        ret = self._get_attr("maxGuestCPUCount")
+        return ret
+
+    @property
+    def max_guest_monitors(self):
+        """Get int value for 'maxGuestMonitors'
+        Maximum of monitors which could be connected.
+        """
+        ret = self._get_attr("maxGuestMonitors")
+        return ret
+
+    @property
+    def info_vd_size(self):
+        """Get int value for 'infoVDSize'
+        Maximum size of a virtual disk image in bytes. Informational value,
+        does not reflect the limits of any virtual disk image format.
+        """
+        ret = self._get_attr("infoVDSize")
+        return ret
+
+    @property
+    def serial_port_count(self):
+        """Get int value for 'serialPortCount'
+        Maximum number of serial ports associated with every
+        :py:class:`IMachine`  instance.
+        """
+        ret = self._get_attr("serialPortCount")
+        return ret
+
+    @property
+    def parallel_port_count(self):
+        """Get int value for 'parallelPortCount'
+        Maximum number of parallel ports associated with every
+        :py:class:`IMachine`  instance.
+        """
+        ret = self._get_attr("parallelPortCount")
+        return ret
+
+    @property
+    def max_boot_position(self):
+        """Get int value for 'maxBootPosition'
+        Maximum device position in the boot order. This value corresponds
+        to the total number of devices a machine can boot from, to make it
+        possible to include all possible devices to the boot list.
+        :py:func:`IMachine.set_boot_order`
+        """
+        ret = self._get_attr("maxBootPosition")
+        return ret
+
+    @property
+    def raw_mode_supported(self):
+        """Get bool value for 'rawModeSupported'
+        Indicates whether VirtualBox was built with raw-mode support.
+
+        When this reads as False, the :py:attr:`HWVirtExPropertyType.enabled`
+        setting will be ignored and assumed to be True.
+        """
+        ret = self._get_attr("rawModeSupported")
+        return ret
+
+    @property
+    def exclusive_hw_virt(self):
+        """Get or set bool value for 'exclusiveHwVirt'
+        Exclusive use of hardware virtualization by VirtualBox. When enabled,
+        VirtualBox assumes it can obtain full and exclusive access to the VT-x
+        or AMD-V feature of the host. To share hardware virtualization with
+        other hypervisors, this property must be disabled.
+
+        This is ignored on OS X, the kernel mediates hardware
+        access there.
+        """
+        ret = self._get_attr("exclusiveHwVirt")
+        return ret
+
+    @exclusive_hw_virt.setter
+    def exclusive_hw_virt(self, value):
+        if not isinstance(value, bool):
+            raise TypeError("value is not an instance of bool")
+        return self._set_attr("exclusiveHwVirt", value)
+
+    @property
+    def default_machine_folder(self):
+        """Get or set str value for 'defaultMachineFolder'
+        Full path to the default directory used to create new or open
+        existing machines when a machine settings file name contains no
+        path.
+
+        Starting with VirtualBox 4.0, by default, this attribute contains
+        the full path of folder named "VirtualBox VMs" in the user's
+        home directory, which depends on the host platform.
+
+        When setting this attribute, a full path must be specified.
+        Setting this property to @c null or an empty string or the
+        special value "Machines" (for compatibility reasons) will restore
+        that default value.
+
+        If the folder specified herein does not exist, it will be created
+        automatically as needed.
+
+
+        :py:func:`IVirtualBox.create_machine` ,
+        :py:func:`IVirtualBox.open_machine`
+        """
+        ret = self._get_attr("defaultMachineFolder")
+        return ret
+
+    @default_machine_folder.setter
+    def default_machine_folder(self, value):
+        if not isinstance(value, basestring):
+            raise TypeError("value is not an instance of basestring")
+        return self._set_attr("defaultMachineFolder", value)
+
+    @property
+    def logging_level(self):
+        """Get or set str value for 'loggingLevel'
+        Specifies the logging level in current use by VirtualBox.
+        """
+        ret = self._get_attr("loggingLevel")
+        return ret
+
+    @logging_level.setter
+    def logging_level(self, value):
+        if not isinstance(value, basestring):
+            raise TypeError("value is not an instance of basestring")
+        return self._set_attr("loggingLevel", value)
+
+    @property
+    def medium_formats(self):
+        """Get IMediumFormat value for 'mediumFormats'
+        List of all medium storage formats supported by this VirtualBox
+        installation.
+
+        Keep in mind that the medium format identifier
+        (:py:func:`IMediumFormat.id_p` ) used in other API calls like
+        :py:func:`IVirtualBox.create_medium`  to refer to a particular
+        medium format is a case-insensitive string. This means that, for
+        example, all of the following strings:
+
+        ::
+
+             "VDI"
+             "vdi"
+             "VdI"
+
+
+        refer to the same medium format.
+
+        Note that the virtual medium framework is backend-based, therefore
+        the list of supported formats depends on what backends are currently
+        installed.
+
+        :py:class:`IMediumFormat`
+        """
+        ret = self._get_attr("mediumFormats")
+        return [_lib.IMediumFormat(a) for a in ret]
+
+    @property
+    def default_hard_disk_format(self):
+        """Get or set str value for 'defaultHardDiskFormat'
+        Identifier of the default medium format used by VirtualBox.
+
+        The medium format set by this attribute is used by VirtualBox
+        when the medium format was not specified explicitly. One example is
+        :py:func:`IVirtualBox.create_medium`  with the empty
+        format argument. A more complex example is implicit creation of
+        differencing media when taking a snapshot of a virtual machine:
+        this operation will try to use a format of the parent medium first
+        and if this format does not support differencing media the default
+        format specified by this argument will be used.
+
+        The list of supported medium formats may be obtained by the
+        :py:func:`medium_formats`  call. Note that the default medium
+        format must have a capability to create differencing media;
+        otherwise operations that create media implicitly may fail
+        unexpectedly.
+
+        The initial value of this property is "VDI" in the current
+        version of the VirtualBox product, but may change in the future.
+
+
+        Setting this property to @c null or empty string will restore the
+        initial value.
+
+
+
+        :py:func:`medium_formats` ,
+        :py:func:`IMediumFormat.id_p` ,
+        :py:func:`IVirtualBox.create_medium`
+        """
+        ret = self._get_attr("defaultHardDiskFormat")
+        return ret
+
+    @default_hard_disk_format.setter
+    def default_hard_disk_format(self, value):
+        if not isinstance(value, basestring):
+            raise TypeError("value is not an instance of basestring")
+        return self._set_attr("defaultHardDiskFormat", value)
+
+    @property
+    def free_disk_space_warning(self):
+        """Get or set int value for 'freeDiskSpaceWarning'
+        Issue a warning if the free disk space is below (or in some disk
+        intensive operation is expected to go below) the given size in
+        bytes.
+        """
+        ret = self._get_attr("freeDiskSpaceWarning")
+        return ret
+
+    @free_disk_space_warning.setter
+    def free_disk_space_warning(self, value):
+        if not isinstance(value, baseinteger):
+            raise TypeError("value is not an instance of baseinteger")
+        return self._set_attr("freeDiskSpaceWarning", value)
+
+    @property
+    def free_disk_space_percent_warning(self):
+        """Get or set int value for 'freeDiskSpacePercentWarning'
+        Issue a warning if the free disk space is below (or in some disk
+        intensive operation is expected to go below) the given percentage.
+        """
+        ret = self._get_attr("freeDiskSpacePercentWarning")
+        return ret
+
+    @free_disk_space_percent_warning.setter
+    def free_disk_space_percent_warning(self, value):
+        if not isinstance(value, baseinteger):
+            raise TypeError("value is not an instance of baseinteger")
+        return self._set_attr("freeDiskSpacePercentWarning", value)
+
+    @property
+    def free_disk_space_error(self):
+        """Get or set int value for 'freeDiskSpaceError'
+        Issue an error if the free disk space is below (or in some disk
+        intensive operation is expected to go below) the given size in
+        bytes.
+        """
+        ret = self._get_attr("freeDiskSpaceError")
+        return ret
+
+    @free_disk_space_error.setter
+    def free_disk_space_error(self, value):
+        if not isinstance(value, baseinteger):
+            raise TypeError("value is not an instance of baseinteger")
+        return self._set_attr("freeDiskSpaceError", value)
+
+    @property
+    def free_disk_space_percent_error(self):
+        """Get or set int value for 'freeDiskSpacePercentError'
+        Issue an error if the free disk space is below (or in some disk
+        intensive operation is expected to go below) the given percentage.
+        """
+        ret = self._get_attr("freeDiskSpacePercentError")
+        return ret
+
+    @free_disk_space_percent_error.setter
+    def free_disk_space_percent_error(self, value):
+        if not isinstance(value, baseinteger):
+            raise TypeError("value is not an instance of baseinteger")
+        return self._set_attr("freeDiskSpacePercentError", value)
+
+    @property
+    def vrde_auth_library(self):
+        """Get or set str value for 'VRDEAuthLibrary'
+        Library that provides authentication for Remote Desktop clients. The library
+        is used if a virtual machine's authentication type is set to "external"
+        in the VM RemoteDisplay configuration.
+
+        The system library extension (".DLL" or ".so") must be omitted.
+        A full path can be specified; if not, then the library must reside on the
+        system's default library path.
+
+        The default value of this property is "VBoxAuth". There is a library
+        of that name in one of the default VirtualBox library directories.
+
+        For details about VirtualBox authentication libraries and how to implement
+        them, please refer to the VirtualBox manual.
+
+
+        Setting this property to @c null or empty string will restore the
+        initial value.
+        """
+        ret = self._get_attr("VRDEAuthLibrary")
+        return ret
+
+    @vrde_auth_library.setter
+    def vrde_auth_library(self, value):
+        if not isinstance(value, basestring):
+            raise TypeError("value is not an instance of basestring")
+        return self._set_attr("VRDEAuthLibrary", value)
+
+    @property
+    def web_service_auth_library(self):
+        """Get or set str value for 'webServiceAuthLibrary'
+        Library that provides authentication for webservice clients. The library
+        is used if a virtual machine's authentication type is set to "external"
+        in the VM RemoteDisplay configuration and will be called from
+        within the :py:func:`IWebsessionManager.logon`  implementation.
+
+        As opposed to :py:func:`ISystemProperties.vrde_auth_library` ,
+        there is no per-VM setting for this, as the webservice is a global
+        resource (if it is running). Only for this setting (for the webservice),
+        setting this value to a literal "null" string disables authentication,
+        meaning that :py:func:`IWebsessionManager.logon`  will always succeed,
+        no matter what user name and password are supplied.
+
+        The initial value of this property is "VBoxAuth",
+        meaning that the webservice will use the same authentication
+        library that is used by default for VRDE (again, see
+        :py:func:`ISystemProperties.vrde_auth_library` ).
+        The format and calling convention of authentication libraries
+        is the same for the webservice as it is for VRDE.
+
+
+        Setting this property to @c null or empty string will restore the
+        initial value.
+        """
+        ret = self._get_attr("webServiceAuthLibrary")
+        return ret
+
+    @web_service_auth_library.setter
+    def web_service_auth_library(self, value):
+        if not isinstance(value, basestring):
+            raise TypeError("value is not an instance of basestring")
+        return self._set_attr("webServiceAuthLibrary", value)
+
+    @property
+    def default_vrde_ext_pack(self):
+        """Get or set str value for 'defaultVRDEExtPack'
+        The name of the extension pack providing the default VRDE.
+
+        This attribute is for choosing between multiple extension packs
+        providing VRDE. If only one is installed, it will automatically be the
+        default one. The attribute value can be empty if no VRDE extension
+        pack is installed.
+
+        For details about VirtualBox Remote Desktop Extension and how to
+        implement one, please refer to the VirtualBox SDK.
+        """
+        ret = self._get_attr("defaultVRDEExtPack")
+        return ret
+
+    @default_vrde_ext_pack.setter
+    def default_vrde_ext_pack(self, value):
+        if not isinstance(value, basestring):
+            raise TypeError("value is not an instance of basestring")
+        return self._set_attr("defaultVRDEExtPack", value)
+
+    @property
+    def log_history_count(self):
+        """Get or set int value for 'logHistoryCount'
+        This value specifies how many old release log files are kept.
+        """
+        ret = self._get_attr("logHistoryCount")
+        return ret
+
+    @log_history_count.setter
+    def log_history_count(self, value):
+        if not isinstance(value, baseinteger):
+            raise TypeError("value is not an instance of baseinteger")
+        return self._set_attr("logHistoryCount", value)
+
+    @property
+    def default_audio_driver(self):
+        """Get AudioDriverType value for 'defaultAudioDriver'
+        This value hold the default audio driver for the current
+        system.
+        """
+        ret = self._get_attr("defaultAudioDriver")
+        return _lib.AudioDriverType(ret)
+
+    @property
+    def autostart_database_path(self):
+        """Get or set str value for 'autostartDatabasePath'
+        The path to the autostart database. Depending on the host this might
+        be a filesystem path or something else.
+        """
+        ret = self._get_attr("autostartDatabasePath")
+        return ret
+
+    @autostart_database_path.setter
+    def autostart_database_path(self, value):
+        if not isinstance(value, basestring):
+            raise TypeError("value is not an instance of basestring")
+        return self._set_attr("autostartDatabasePath", value)
+
+    @property
+    def default_additions_iso(self):
+        """Get or set str value for 'defaultAdditionsISO'
+        The path to the default Guest Additions ISO image. Can be empty if
+        the location is not known in this installation.
+        """
+        ret = self._get_attr("defaultAdditionsISO")
+        return ret
+
+    @default_additions_iso.setter
+    def default_additions_iso(self, value):
+        if not isinstance(value, basestring):
+            raise TypeError("value is not an instance of basestring")
+        return self._set_attr("defaultAdditionsISO", value)
+
+    @property
+    def default_frontend(self):
+        """Get or set str value for 'defaultFrontend'
+        Selects which VM frontend should be used by default when launching
+        a VM through the :py:func:`IMachine.launch_vm_process`  method.
+        Empty or @c null strings do not define a particular default, it is up
+        to :py:func:`IMachine.launch_vm_process`  to select one. See the
+        description of :py:func:`IMachine.launch_vm_process`  for the valid
+        frontend types.
+
+        This global setting is overridden by the per-VM attribute
+        :py:func:`IMachine.default_frontend`  or a frontend type
+        passed to :py:func:`IMachine.launch_vm_process` .
+        """
+        ret = self._get_attr("defaultFrontend")
+        return ret
+
+    @default_frontend.setter
+    def default_frontend(self, value):
+        if not isinstance(value, basestring):
+            raise TypeError("value is not an instance of basestring")
+        return self._set_attr("defaultFrontend", value)
+
+    @property
+    def screen_shot_formats(self):
+        """Get BitmapFormat value for 'screenShotFormats'
+        Supported bitmap formats which can be used with takeScreenShot
+        and takeScreenShotToArray methods.
+        """
+        ret = self._get_attr("screenShotFormats")
+        return [_lib.BitmapFormat(a) for a in ret]
+
+    @property
+    def proxy_mode(self):
+        """Get or set ProxyMode value for 'proxyMode'
+        The proxy mode setting: System, NoProxy or Manual.
+        """
+        ret = self._get_attr("proxyMode")
+        return _lib.ProxyMode(ret)
+
+    @proxy_mode.setter
+    def proxy_mode(self, value):
+        if not isinstance(value, _lib.ProxyMode):
+            raise TypeError("value is not an instance of ProxyMode")
+        return self._set_attr("proxyMode", value)
+
+    @property
+    def proxy_url(self):
+        """Get or set str value for 'proxyURL'
+        Proxy server URL for the :py:attr:`ProxyMode.manual`  proxy mode.
+
+        The format is: [{type}"://"][{userid}[@{password}]:]{server}[":"{port}]
+
+        Valid types are: http (default), https, socks4, socks4a, socks5, socks5h and direct.
+        Please note that these are proxy types defining how the proxy operates rather than
+        how to proxy any similarly named protocol (i.e. don't confuse a http-proxy with
+        proxying the http protocol, as a http-proxy usually can proxy https and other protocols too).
+
+        The port number defaults to 80 for http, 443 for https and 1080 for the socks ones.
+
+        The password is currently stored as plain text!  Use the :py:attr:`ProxyMode.system`
+        mode if you consider the proxy password to be sensitive.
+
+        An empty string will cause the behavior to be identical to :py:attr:`ProxyMode.system` .
+        For compatibility with libproxy, an URL starting with "direct://" will cause
+        :py:attr:`ProxyMode.no_proxy`  behavior.
+        """
+        ret = self._get_attr("proxyURL")
+        return ret
+
+    @proxy_url.setter
+    def proxy_url(self, value):
+        if not isinstance(value, basestring):
+            raise TypeError("value is not an instance of basestring")
+        return self._set_attr("proxyURL", value)
+
+    @property
+    def supported_paravirt_providers(self):
+        """Get ParavirtProvider value for 'supportedParavirtProviders'
+        Returns an array of officially supported values for enum :py:class:`ParavirtProvider` ,
+        in the sense of what is e.g. worth offering in the VirtualBox GUI.
+        """
+        ret = self._get_attr("supportedParavirtProviders")
+        return [_lib.ParavirtProvider(a) for a in ret]
+
+    @property
+    def supported_clipboard_modes(self):
+        """Get ClipboardMode value for 'supportedClipboardModes'
+        Returns an array of officially supported values for enum :py:class:`ClipboardMode` ,
+        in the sense of what is e.g. worth offering in the VirtualBox GUI.
+        """
+        ret = self._get_attr("supportedClipboardModes")
+        return [_lib.ClipboardMode(a) for a in ret]
+
+    @property
+    def supported_dn_d_modes(self):
+        """Get DnDMode value for 'supportedDnDModes'
+        Returns an array of officially supported values for enum :py:class:`DnDMode` ,
+        in the sense of what is e.g. worth offering in the VirtualBox GUI.
+        """
+        ret = self._get_attr("supportedDnDModes")
+        return [_lib.DnDMode(a) for a in ret]
+
+    @property
+    def supported_firmware_types(self):
+        """Get FirmwareType value for 'supportedFirmwareTypes'
+        Returns an array of officially supported values for enum :py:class:`FirmwareType` ,
+        in the sense of what is e.g. worth offering in the VirtualBox GUI.
+        """
+        ret = self._get_attr("supportedFirmwareTypes")
+        return [_lib.FirmwareType(a) for a in ret]
+
+    @property
+    def supported_pointing_hid_types(self):
+        """Get PointingHIDType value for 'supportedPointingHIDTypes'
+        Returns an array of officially supported values for enum :py:class:`PointingHIDType` ,
+        in the sense of what is e.g. worth offering in the VirtualBox GUI.
+        """
+        ret = self._get_attr("supportedPointingHIDTypes")
+        return [_lib.PointingHIDType(a) for a in ret]
+
+    @property
+    def supported_keyboard_hid_types(self):
+        """Get KeyboardHIDType value for 'supportedKeyboardHIDTypes'
+        Returns an array of officially supported values for enum :py:class:`KeyboardHIDType` ,
+        in the sense of what is e.g. worth offering in the VirtualBox GUI.
+        """
+        ret = self._get_attr("supportedKeyboardHIDTypes")
+        return [_lib.KeyboardHIDType(a) for a in ret]
+
+    @property
+    def supported_vfs_types(self):
+        """Get VFSType value for 'supportedVFSTypes'
+        Returns an array of officially supported values for enum :py:class:`VFSType` ,
+        in the sense of what is e.g. worth offering in the VirtualBox GUI.
+        """
+        ret = self._get_attr("supportedVFSTypes")
+        return [_lib.VFSType(a) for a in ret]
+
+    @property
+    def supported_import_options(self):
+        """Get ImportOptions value for 'supportedImportOptions'
+        Returns an array of officially supported values for enum :py:class:`ImportOptions` ,
+        in the sense of what is e.g. worth offering in the VirtualBox GUI.
+        """
+        ret = self._get_attr("supportedImportOptions")
+        return [_lib.ImportOptions(a) for a in ret]
+
+    @property
+    def supported_export_options(self):
+        """Get ExportOptions value for 'supportedExportOptions'
+        Returns an array of officially supported values for enum :py:class:`ExportOptions` ,
+        in the sense of what is e.g. worth offering in the VirtualBox GUI.
+        """
+        ret = self._get_attr("supportedExportOptions")
+        return [_lib.ExportOptions(a) for a in ret]
+
+    @property
+    def supported_recording_audio_codecs(self):
+        """Get RecordingAudioCodec value for 'supportedRecordingAudioCodecs'
+        Returns an array of officially supported values for enum :py:class:`RecordingAudioCodec` ,
+        in the sense of what is e.g. worth offering in the VirtualBox GUI.
+        """
+        ret = self._get_attr("supportedRecordingAudioCodecs")
+        return [_lib.RecordingAudioCodec(a) for a in ret]
+
+    @property
+    def supported_recording_video_codecs(self):
+        """Get RecordingVideoCodec value for 'supportedRecordingVideoCodecs'
+        Returns an array of officially supported values for enum :py:class:`RecordingVideoCodec` ,
+        in the sense of what is e.g. worth offering in the VirtualBox GUI.
+        """
+        ret = self._get_attr("supportedRecordingVideoCodecs")
+        return [_lib.RecordingVideoCodec(a) for a in ret]
+
+    @property
+    def supported_recording_vs_methods(self):
+        """Get RecordingVideoScalingMethod value for 'supportedRecordingVSMethods'
+        Returns an array of officially supported values for enum :py:class:`RecordingVideoScalingMethod` ,
+        in the sense of what is e.g. worth offering in the VirtualBox GUI.
+        """
+        ret = self._get_attr("supportedRecordingVSMethods")
+        return [_lib.RecordingVideoScalingMethod(a) for a in ret]
+
+    @property
+    def supported_recording_vrc_modes(self):
+        """Get RecordingVideoRateControlMode value for 'supportedRecordingVRCModes'
+        Returns an array of officially supported values for enum :py:class:`RecordingVideoRateControlMode` ,
+        in the sense of what is e.g. worth offering in the VirtualBox GUI.
+        """
+        ret = self._get_attr("supportedRecordingVRCModes")
+        return [_lib.RecordingVideoRateControlMode(a) for a in ret]
+
+    @property
+    def supported_graphics_controller_types(self):
+        """Get GraphicsControllerType value for 'supportedGraphicsControllerTypes'
+        Returns an array of officially supported values for enum :py:class:`GraphicsControllerType` ,
+        in the sense of what is e.g. worth offering in the VirtualBox GUI.
+        """
+        ret = self._get_attr("supportedGraphicsControllerTypes")
+        return [_lib.GraphicsControllerType(a) for a in ret]
+
+    @property
+    def supported_clone_options(self):
+        """Get CloneOptions value for 'supportedCloneOptions'
+        Returns an array of officially supported values for enum :py:class:`CloneOptions` ,
+        in the sense of what is e.g. worth offering in the VirtualBox GUI.
+        """
+        ret = self._get_attr("supportedCloneOptions")
+        return [_lib.CloneOptions(a) for a in ret]
+
+    @property
+    def supported_autostop_types(self):
+        """Get AutostopType value for 'supportedAutostopTypes'
+        Returns an array of officially supported values for enum :py:class:`AutostopType` ,
+        in the sense of what is e.g. worth offering in the VirtualBox GUI.
+        """
+        ret = self._get_attr("supportedAutostopTypes")
+        return [_lib.AutostopType(a) for a in ret]
+
+    @property
+    def supported_vm_proc_priorities(self):
+        """Get VMProcPriority value for 'supportedVMProcPriorities'
+        Returns an array of officially supported values for enum :py:class:`VMProcPriority` ,
+        in the sense of what is e.g. worth offering in the VirtualBox GUI.
+        """
+        ret = self._get_attr("supportedVMProcPriorities")
+        return [_lib.VMProcPriority(a) for a in ret]
+
+    @property
+    def supported_network_attachment_types(self):
+        """Get NetworkAttachmentType value for 'supportedNetworkAttachmentTypes'
+        Returns an array of officially supported values for enum :py:class:`NetworkAttachmentType` ,
+        in the sense of what is e.g. worth offering in the VirtualBox GUI.
+        """
+        ret = self._get_attr("supportedNetworkAttachmentTypes")
+        return [_lib.NetworkAttachmentType(a) for a in ret]
+
+    @property
+    def supported_network_adapter_types(self):
+        """Get NetworkAdapterType value for 'supportedNetworkAdapterTypes'
+        Returns an array of officially supported values for enum :py:class:`NetworkAdapterType` ,
+        in the sense of what is e.g. worth offering in the VirtualBox GUI.
+        """
+        ret = self._get_attr("supportedNetworkAdapterTypes")
+        return [_lib.NetworkAdapterType(a) for a in ret]
+
+    @property
+    def supported_port_modes(self):
+        """Get PortMode value for 'supportedPortModes'
+        Returns an array of officially supported values for enum :py:class:`PortMode` ,
+        in the sense of what is e.g. worth offering in the VirtualBox GUI.
+        """
+        ret = self._get_attr("supportedPortModes")
+        return [_lib.PortMode(a) for a in ret]
+
+    @property
+    def supported_uart_types(self):
+        """Get UartType value for 'supportedUartTypes'
+        Returns an array of officially supported values for enum :py:class:`UartType` ,
+        in the sense of what is e.g. worth offering in the VirtualBox GUI.
+        """
+        ret = self._get_attr("supportedUartTypes")
+        return [_lib.UartType(a) for a in ret]
+
+    @property
+    def supported_usb_controller_types(self):
+        """Get USBControllerType value for 'supportedUSBControllerTypes'
+        Returns an array of officially supported values for enum :py:class:`USBControllerType` ,
+        in the sense of what is e.g. worth offering in the VirtualBox GUI.
+        """
+        ret = self._get_attr("supportedUSBControllerTypes")
+        return [_lib.USBControllerType(a) for a in ret]
+
+    @property
+    def supported_audio_driver_types(self):
+        """Get AudioDriverType value for 'supportedAudioDriverTypes'
+        Returns an array of officially supported values for enum :py:class:`AudioDriverType` ,
+        in the sense of what is e.g. worth offering in the VirtualBox GUI.
+        """
+        ret = self._get_attr("supportedAudioDriverTypes")
+        return [_lib.AudioDriverType(a) for a in ret]
+
+    @property
+    def supported_audio_controller_types(self):
+        """Get AudioControllerType value for 'supportedAudioControllerTypes'
+        Returns an array of officially supported values for enum :py:class:`AudioControllerType` ,
+        in the sense of what is e.g. worth offering in the VirtualBox GUI.
+        """
+        ret = self._get_attr("supportedAudioControllerTypes")
+        return [_lib.AudioControllerType(a) for a in ret]
+
+    @property
+    def supported_storage_buses(self):
+        """Get StorageBus value for 'supportedStorageBuses'
+        Returns an array of officially supported values for enum :py:class:`StorageBus` ,
+        in the sense of what is e.g. worth offering in the VirtualBox GUI.
+        """
+        ret = self._get_attr("supportedStorageBuses")
+        return [_lib.StorageBus(a) for a in ret]
+
+    @property
+    def supported_storage_controller_types(self):
+        """Get StorageControllerType value for 'supportedStorageControllerTypes'
+        Returns an array of officially supported values for enum :py:class:`StorageControllerType` ,
+        in the sense of what is e.g. worth offering in the VirtualBox GUI.
+        """
+        ret = self._get_attr("supportedStorageControllerTypes")
+        return [_lib.StorageControllerType(a) for a in ret]
+
+    @property
+    def supported_chipset_types(self):
+        """Get ChipsetType value for 'supportedChipsetTypes'
+        Returns an array of officially supported values for enum :py:class:`ChipsetType` ,
+        in the sense of what is e.g. worth offering in the VirtualBox GUI.
+        """
+        ret = self._get_attr("supportedChipsetTypes")
+        return [_lib.ChipsetType(a) for a in ret]
+
+    @property
+    def v_box_update_enabled(self):
+        """Get or set bool value for 'VBoxUpdateEnabled'
+        Is the VirtualBox update check enabled?
+        """
+        ret = self._get_attr("VBoxUpdateEnabled")
+        return ret
+
+    @v_box_update_enabled.setter
+    def v_box_update_enabled(self, value):
+        if not isinstance(value, bool):
+            raise TypeError("value is not an instance of bool")
+        return self._set_attr("VBoxUpdateEnabled", value)
+
+    @property
+    def v_box_update_frequency(self):
+        """Get or set int value for 'VBoxUpdateFrequency'
+        How often should a check for a newer version of VirtualBox be made? (in days)
+        """
+        ret = self._get_attr("VBoxUpdateFrequency")
+        return ret
+
+    @v_box_update_frequency.setter
+    def v_box_update_frequency(self, value):
+        if not isinstance(value, baseinteger):
+            raise TypeError("value is not an instance of baseinteger")
+        return self._set_attr("VBoxUpdateFrequency", value)
+
+    @property
+    def v_box_update_last_check_date(self):
+        """Get or set str value for 'VBoxUpdateLastCheckDate'
+        When was the update check last performed? If updating this attribute the
+        string must be in ISO 8601 format (e.g. 2020-05-11T21:13:39.348416000Z).
+        """
+        ret = self._get_attr("VBoxUpdateLastCheckDate")
+        return ret
+
+    @v_box_update_last_check_date.setter
+    def v_box_update_last_check_date(self, value):
+        if not isinstance(value, basestring):
+            raise TypeError("value is not an instance of basestring")
+        return self._set_attr("VBoxUpdateLastCheckDate", value)
+
+    @property
+    def v_box_update_target(self):
+        """Get or set VBoxUpdateTarget value for 'VBoxUpdateTarget'
+        The preferred release type used for determining whether a newer version of VirtualBox is available.
+        """
+        ret = self._get_attr("VBoxUpdateTarget")
+        return _lib.VBoxUpdateTarget(ret)
+
+    @v_box_update_target.setter
+    def v_box_update_target(self, value):
+        if not isinstance(value, _lib.VBoxUpdateTarget):
+            raise TypeError("value is not an instance of VBoxUpdateTarget")
+        return self._set_attr("VBoxUpdateTarget", value)
+
+    @property
+    def v_box_update_count(self):
+        """Get or set int value for 'VBoxUpdateCount'
+        The count of update check attempts.
+        """
+        ret = self._get_attr("VBoxUpdateCount")
+        return ret
+
+    @v_box_update_count.setter
+    def v_box_update_count(self, value):
+        if not isinstance(value, baseinteger):
+            raise TypeError("value is not an instance of baseinteger")
+        return self._set_attr("VBoxUpdateCount", value)
+
+    @property
+    def supported_v_box_update_target_types(self):
+        """Get VBoxUpdateTarget value for 'supportedVBoxUpdateTargetTypes'
+        Returns an array of officially supported values for enum :py:class:`VBoxUpdateTarget` .
+        """
+        ret = self._get_attr("supportedVBoxUpdateTargetTypes")
+        return [_lib.VBoxUpdateTarget(a) for a in ret]
+
+    def get_max_network_adapters(self, chipset):
+        """Maximum total number of network adapters associated with every
+        :py:class:`IMachine`  instance.
+
+        in chipset of type :class:`ChipsetType`
+            The chipset type to get the value for.
+
+        return max_network_adapters of type int
+            The maximum total number of network adapters allowed.
+
+        """
+        if not isinstance(chipset, _lib.ChipsetType):
+            raise TypeError("chipset can only be an instance of type ChipsetType")
+        max_network_adapters = self._call("getMaxNetworkAdapters", in_p=[chipset])
+        return max_network_adapters
+
+    def get_max_network_adapters_of_type(self, chipset, type_p):
+        """Maximum number of network adapters of a given attachment type,
+        associated with every :py:class:`IMachine`  instance.
+
+        in chipset of type :class:`ChipsetType`
+            The chipset type to get the value for.
+
+        in type_p of type :class:`NetworkAttachmentType`
+            Type of attachment.
+
+        return max_network_adapters of type int
+            The maximum number of network adapters allowed for
+            particular chipset and attachment type.
+
+        """
+        if not isinstance(chipset, _lib.ChipsetType):
+            raise TypeError("chipset can only be an instance of type ChipsetType")
+        if not isinstance(type_p, _lib.NetworkAttachmentType):
+            raise TypeError(
+                "type_p can only be an instance of type NetworkAttachmentType"
+            )
+        max_network_adapters = self._call(
+            "getMaxNetworkAdaptersOfType", in_p=[chipset, type_p]
+        )
+        return max_network_adapters
+
+    def get_max_devices_per_port_for_storage_bus(self, bus):
+        """Returns the maximum number of devices which can be attached to a port
+        for the given storage bus.
+
+        in bus of type :class:`StorageBus`
+            The storage bus type to get the value for.
+
+        return max_devices_per_port of type int
+            The maximum number of devices which can be attached to the port for the given
+            storage bus.
+
+        """
+        if not isinstance(bus, _lib.StorageBus):
+            raise TypeError("bus can only be an instance of type StorageBus")
+        max_devices_per_port = self._call(
+            "getMaxDevicesPerPortForStorageBus", in_p=[bus]
+        )
+        return max_devices_per_port
+
+    def get_min_port_count_for_storage_bus(self, bus):
+        """Returns the minimum number of ports the given storage bus supports.
+
+        in bus of type :class:`StorageBus`
+            The storage bus type to get the value for.
+
+        return min_port_count of type int
+            The minimum number of ports for the given storage bus.
+
+        """
+        if not isinstance(bus, _lib.StorageBus):
+            raise TypeError("bus can only be an instance of type StorageBus")
+        min_port_count = self._call("getMinPortCountForStorageBus", in_p=[bus])
+        return min_port_count
+
+    def get_max_port_count_for_storage_bus(self, bus):
+        """Returns the maximum number of ports the given storage bus supports.
+
+        in bus of type :class:`StorageBus`
+            The storage bus type to get the value for.
+
+        return max_port_count of type int
+            The maximum number of ports for the given storage bus.
+
+        """
+        if not isinstance(bus, _lib.StorageBus):
+            raise TypeError("bus can only be an instance of type StorageBus")
+        max_port_count = self._call("getMaxPortCountForStorageBus", in_p=[bus])
+        return max_port_count
+
+    def get_max_instances_of_storage_bus(self, chipset, bus):
+        """Returns the maximum number of storage bus instances which
+        can be configured for each VM. This corresponds to the number of
+        storage controllers one can have. Value may depend on chipset type
+        used.
+
+        in chipset of type :class:`ChipsetType`
+            The chipset type to get the value for.
+
+        in bus of type :class:`StorageBus`
+            The storage bus type to get the value for.
+
+        return max_instances of type int
+            The maximum number of instances for the given storage bus.
+
+        """
+        if not isinstance(chipset, _lib.ChipsetType):
+            raise TypeError("chipset can only be an instance of type ChipsetType")
+        if not isinstance(bus, _lib.StorageBus):
+            raise TypeError("bus can only be an instance of type StorageBus")
+        max_instances = self._call("getMaxInstancesOfStorageBus", in_p=[chipset, bus])
+        return max_instances
+
+    def get_device_types_for_storage_bus(self, bus):
+        """Returns list of all the supported device types
+        (:py:class:`DeviceType` ) for the given type of storage
+        bus.
+
+        in bus of type :class:`StorageBus`
+            The storage bus type to get the value for.
+
+        return device_types of type :class:`DeviceType`
+            The list of all supported device types for the given storage bus.
+
+        """
+        if not isinstance(bus, _lib.StorageBus):
+            raise TypeError("bus can only be an instance of type StorageBus")
+        device_types = self._call("getDeviceTypesForStorageBus", in_p=[bus])
+        device_types = [_lib.DeviceType(a) for a in device_types]
+        return device_types
+
+    def get_storage_bus_for_storage_controller_type(self, storage_controller_type):
+        """Returns the :py:class:`StorageBus`  enum value
+        for a given storage controller type.
+
+        in storage_controller_type of type :class:`StorageControllerType`
+            The storage controller type to get the value for.
+
+        return storage_bus of type :class:`StorageBus`
+            The storage bus which is applicable.
+
+        """
+        if not isinstance(storage_controller_type, _lib.StorageControllerType):
+            raise TypeError(
+                "storage_controller_type can only be an instance of type StorageControllerType"
+            )
+        storage_bus = self._call(
+            "getStorageBusForStorageControllerType", in_p=[storage_controller_type]
+        )
+        storage_bus = _lib.StorageBus(storage_bus)
+        return storage_bus
+
+    def get_storage_controller_types_for_storage_bus(self, storage_bus):
+        """Returns the possible :py:class:`StorageControllerType`  enum values
+        for a given storage bus.
+
+        in storage_bus of type :class:`StorageBus`
+            The storage bus type to get the values for.
+
+        return storage_controller_type of type :class:`StorageControllerType`
+            The enum values (sorted by what should be a sensible decreasing
+            importance of the type) which are valid.
+
+        """
+        if not isinstance(storage_bus, _lib.StorageBus):
+            raise TypeError("storage_bus can only be an instance of type StorageBus")
+        storage_controller_type = self._call(
+            "getStorageControllerTypesForStorageBus", in_p=[storage_bus]
+        )
+        storage_controller_type = [
+            _lib.StorageControllerType(a) for a in storage_controller_type
+        ]
+        return storage_controller_type
+
+    def get_default_io_cache_setting_for_storage_controller(self, controller_type):
+        """Returns the default I/O cache setting for the
+        given storage controller
+
+        in controller_type of type :class:`StorageControllerType`
+            The storage controller type to get the setting for.
+
+        return enabled of type bool
+            Returned flag indicating the default value
+
+        """
+        if not isinstance(controller_type, _lib.StorageControllerType):
+            raise TypeError(
+                "controller_type can only be an instance of type StorageControllerType"
+            )
+        enabled = self._call(
+            "getDefaultIoCacheSettingForStorageController", in_p=[controller_type]
+        )
+        return enabled
+
+    def get_storage_controller_hotplug_capable(self, controller_type):
+        """Returns whether the given storage controller supports
+        hot-plugging devices.
+
+        in controller_type of type :class:`StorageControllerType`
+            The storage controller to check the setting for.
+
+        return hotplug_capable of type bool
+            Returned flag indicating whether the controller is hotplug capable
+
+        """
+        if not isinstance(controller_type, _lib.StorageControllerType):
+            raise TypeError(
+                "controller_type can only be an instance of type StorageControllerType"
+            )
+        hotplug_capable = self._call(
+            "getStorageControllerHotplugCapable", in_p=[controller_type]
+        )
+        return hotplug_capable
+
+    def get_max_instances_of_usb_controller_type(self, chipset, type_p):
+        """Returns the maximum number of USB controller instances which
+        can be configured for each VM. This corresponds to the number of
+        USB controllers one can have. Value may depend on chipset type
+        used.
+
+        in chipset of type :class:`ChipsetType`
+            The chipset type to get the value for.
+
+        in type_p of type :class:`USBControllerType`
+            The USB controller type to get the value for.
+
+        return max_instances of type int
+            The maximum number of instances for the given USB controller type.
+
+        """
+        if not isinstance(chipset, _lib.ChipsetType):
+            raise TypeError("chipset can only be an instance of type ChipsetType")
+        if not isinstance(type_p, _lib.USBControllerType):
+            raise TypeError("type_p can only be an instance of type USBControllerType")
+        max_instances = self._call(
+            "getMaxInstancesOfUSBControllerType", in_p=[chipset, type_p]
+        )
+        return max_instances
+
+    def get_cpu_profiles(self, architecture, name_pattern):
+        """Returns CPU profiles matching the given criteria.
+
+        in architecture of type :class:`CPUArchitecture`
+            The architecture to get profiles for. Required.
+
+        in name_pattern of type str
+            Name pattern. Simple wildcard matching using asterisk (*) and
+            question mark (?).
+
+        return profiles of type :class:`ICPUProfile`
+            The matching CPU profiles.
+
+        """
+        if not isinstance(architecture, _lib.CPUArchitecture):
+            raise TypeError(
+                "architecture can only be an instance of type CPUArchitecture"
+            )
+        if not isinstance(name_pattern, basestring):
+            raise TypeError("name_pattern can only be an instance of type basestring")
+        profiles = self._call("getCPUProfiles", in_p=[architecture, name_pattern])
+        profiles = [_lib.ICPUProfile(a) for a in profiles]
+        return profiles
@@ -0,0 +1,51 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from ..library_base import Interface
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IToken(Interface):
+    """
+    The IToken interface represents a token passed to an API client, which
+    triggers cleanup actions when it is explicitly released by calling the
+    :py:func:`abandon`  method (preferred, as it is accurately defined
+    when the release happens), or when the object reference count drops
+    to 0. The latter way is implicitly used when an API client crashes,
+    however the discovery that there was a crash can take rather long,
+    depending on the platform (COM needs 6 minutes). So better don't rely
+    on the crash behavior too much.
+    """
+
+    __uuid__ = "20479eaf-d8ed-44cf-85ac-c83a26c95a4d"
+    __wsmap__ = "managed"
+
+    def abandon(self):
+        """Releases this token. Cannot be undone in any way, and makes the
+        token object unusable (even the :py:func:`dummy`  method will return
+        an error), ready for releasing. It is a more defined way than just
+        letting the reference count drop to 0, because the latter (depending
+        on the platform) can trigger asynchronous cleanup activity.
+
+        """
+        self._call("abandon")
+
+    def dummy(self):
+        """Purely a NOOP. Useful when using proxy type API bindings (e.g. the
+        webservice) which manage objects on behalf of the actual client, using
+        an object reference expiration time based garbage collector.
+
+        """
+        self._call("dummy")
@@ -0,0 +1,64 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from ..library_base import Interface
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IUSBController(Interface):
+    """
+    The USB Controller name.
+    """
+
+    __uuid__ = "ee206a6e-7ff8-4a84-bd34-0c651e118bb5"
+    __wsmap__ = "managed"
+
+    @property
+    def name(self):
+        """Get or set str value for 'name'
+        The USB Controller name.
+        """
+        ret = self._get_attr("name")
+        return ret
+
+    @name.setter
+    def name(self, value):
+        if not isinstance(value, basestring):
+            raise TypeError("value is not an instance of basestring")
+        return self._set_attr("name", value)
+
+    @property
+    def type_p(self):
+        """Get or set USBControllerType value for 'type'
+        The USB Controller type.
+        """
+        ret = self._get_attr("type")
+        return _lib.USBControllerType(ret)
+
+    @type_p.setter
+    def type_p(self, value):
+        if not isinstance(value, _lib.USBControllerType):
+            raise TypeError("value is not an instance of USBControllerType")
+        return self._set_attr("type", value)
+
+    @property
+    def usb_standard(self):
+        """Get int value for 'USBStandard'
+        USB standard version which the controller implements.
+        This is a BCD which means that the major version is in the
+        high byte and minor version is in the low byte.
+        """
+        ret = self._get_attr("USBStandard")
+        return ret
@@ -0,0 +1,37 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from .ievent import IEvent
+from .vboxeventtype import VBoxEventType
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IUSBControllerChangedEvent(IEvent):
+    """
+    Notification when a property of the virtual
+    :py:func:`IMachine.usb_controllers` USB controllers changes.
+    Interested callees should use IUSBController methods and attributes to
+    find out what has changed.
+    """
+
+    __uuid__ = "93BADC0C-61D9-4940-A084-E6BB29AF3D83"
+    __wsmap__ = "managed"
+    id = VBoxEventType.on_usb_controller_changed
+
+    @property
+    def midl_does_not_like_empty_interfaces(self):
+        """Get bool value for 'midlDoesNotLikeEmptyInterfaces'"""
+        ret = self._get_attr("midlDoesNotLikeEmptyInterfaces")
+        return ret
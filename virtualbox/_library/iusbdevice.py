@@ -0,0 +1,168 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from ..library_base import Interface
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IUSBDevice(Interface):
+    """
+    The IUSBDevice interface represents a virtual USB device attached to the
+    virtual machine.
+
+    A collection of objects implementing this interface is stored in the
+    :py:func:`IConsole.usb_devices`  attribute which lists all USB devices
+    attached to a running virtual machine's USB controller.
+    """
+
+    __uuid__ = "6dc83c2c-81a9-4005-9d52-fc45a78bf3f5"
+    __wsmap__ = "managed"
+
+    @property
+    def id_p(self):
+        """Get str value for 'id'
+        Unique USB device ID. This ID is built from #vendorId,
+        #productId, #revision and #serialNumber.
+        """
+        ret = self._get_attr("id")
+        return ret
+
+    @property
+    def vendor_id(self):
+        """Get int value for 'vendorId'
+        Vendor ID.
+        """
+        ret = self._get_attr("vendorId")
+        return ret
+
+    @property
+    def product_id(self):
+        """Get int value for 'productId'
+        Product ID.
+        """
+        ret = self._get_attr("productId")
+        return ret
+
+    @property
+    def revision(self):
+        """Get int value for 'revision'
+        Product revision number. This is a packed BCD represented as
+        unsigned short. The high byte is the integer part and the low
+        byte is the decimal.
+        """
+        ret = self._get_attr("revision")
+        return ret
+
+    @property
+    def manufacturer(self):
+        """Get str value for 'manufacturer'
+        Manufacturer string.
+        """
+        ret = self._get_attr("manufacturer")
+        return ret
+
+    @property
+    def product(self):
+        """Get str value for 'product'
+        Product string.
+        """
+        ret = self._get_attr("product")
+        return ret
+
+    @property
+    def serial_number(self):
+        """Get str value for 'serialNumber'
+        Serial number string.
+        """
+        ret = self._get_attr("serialNumber")
+        return ret
+
+    @property
+    def address(self):
+        """Get str value for 'address'
+        Host-specific address of the device, uniquely
+        identifying a physically connected device in the system.
+        Note that the address of a USB device may change across
+        device re-plugs and host suspend/resume cycles or reboots.
+        """
+        ret = self._get_attr("address")
+        return ret
+
+    @property
+    def port(self):
+        """Get int value for 'port'
+        Host USB port number on the hub the device is physically
+        connected to.
+        """
+        ret = self._get_attr("port")
+        return ret
+
+    @property
+    def port_path(self):
+        """Get str value for 'portPath'
+        Host-specific identifier of the port (including hub) the USB
+        device is physically connected to. Note that hubs may be
+        dynamically added and removed, and that hub enumeration may not
+        be consistent across host reboots.
+        """
+        ret = self._get_attr("portPath")
+        return ret
+
+    @property
+    def version(self):
+        """Get int value for 'version'
+        The major USB version of the device - 1, 2 or 3.
+        """
+        ret = self._get_attr("version")
+        return ret
+
+    @property
+    def speed(self):
+        """Get USBConnectionSpeed value for 'speed'
+        The speed at which the device is currently communicating.
+        """
+        ret = self._get_attr("speed")
+        return _lib.USBConnectionSpeed(ret)
+
+    @property
+    def remote(self):
+        """Get bool value for 'remote'
+        Whether the device is physically connected to a remote VRDE
+        client or to a local host machine.
+        """
+        ret = self._get_attr("remote")
+        return ret
+
+    @property
+    def device_info(self):
+        """Get str value for 'deviceInfo'
+        Array of device attributes as single strings.
+
+        So far the following are used:
+        0: The manufacturer string, if the device doesn't expose the ID one is taken
+        from an internal database or an empty string if none is found.
+        1: The product string, if the device doesn't expose the ID one is taken
+        from an internal database or an empty string if none is found.
+        """
+        ret = self._get_attr("deviceInfo")
+        return ret
+
+    @property
+    def backend(self):
+        """Get str value for 'backend'
+        The backend which will be used to communicate with this device.
+        """
+        ret = self._get_attr("backend")
+        return ret
@@ -0,0 +1,269 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from ..library_base import Interface
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IUSBDeviceFilter(Interface):
+    """
+    The IUSBDeviceFilter interface represents an USB device filter used
+    to perform actions on a group of USB devices.
+
+    This type of filters is used by running virtual machines to
+    automatically capture selected USB devices once they are physically
+    attached to the host computer.
+
+    A USB device is matched to the given device filter if and only if all
+    attributes of the device match the corresponding attributes of the
+    filter (that is, attributes are joined together using the logical AND
+    operation). On the other hand, all together, filters in the list of
+    filters carry the semantics of the logical OR operation. So if it is
+    desirable to create a match like "this vendor id OR this product id",
+    one needs to create two filters and specify "any match" (see below)
+    for unused attributes.
+
+    All filter attributes used for matching are strings. Each string
+    is an expression representing a set of values of the corresponding
+    device attribute, that will match the given filter. Currently, the
+    following filtering expressions are supported:
+
+
+    *Interval filters*. Used to specify valid intervals for
+    integer device attributes (Vendor ID, Product ID and Revision).
+    The format of the string is:
+
+    int:((m)|([m]-[n]))(,(m)|([m]-[n]))*
+
+    where m and n are integer numbers, either in octal
+    (starting from 0), hexadecimal (starting from 0x)
+    or decimal (otherwise) form, so that m < n. If m
+    is omitted before a dash (-), the minimum possible integer
+    is assumed; if n is omitted after a dash, the maximum
+    possible integer is assumed.
+
+    *Boolean filters*. Used to specify acceptable values for
+    boolean device attributes. The format of the string is:
+
+    true|false|yes|no|0|1
+
+
+    *Exact match*. Used to specify a single value for the given
+    device attribute. Any string that doesn't start with int:
+    represents the exact match. String device attributes are compared to
+    this string including case of symbols. Integer attributes are first
+    converted to a string (see individual filter attributes) and then
+    compared ignoring case.
+
+
+    *Any match*. Any value of the corresponding device attribute
+    will match the given filter. An empty or @c null string is
+    used to construct this type of filtering expressions.
+
+
+
+
+
+    On the Windows host platform, interval filters are not currently
+    available. Also all string filter attributes
+    (:py:func:`manufacturer` , :py:func:`product` ,
+    :py:func:`serial_number` ) are ignored, so they behave as
+    *any match* no matter what string expression is specified.
+
+
+    :py:func:`IUSBDeviceFilters.device_filters` ,
+    :py:class:`IHostUSBDeviceFilter`
+    """
+
+    __uuid__ = "45587218-4289-ef4e-8e6a-e5b07816b631"
+    __wsmap__ = "managed"
+
+    @property
+    def name(self):
+        """Get or set str value for 'name'
+        Visible name for this filter.
+        This name is used to visually distinguish one filter from another,
+        so it can neither be @c null nor an empty string.
+        """
+        ret = self._get_attr("name")
+        return ret
+
+    @name.setter
+    def name(self, value):
+        if not isinstance(value, basestring):
+            raise TypeError("value is not an instance of basestring")
+        return self._set_attr("name", value)
+
+    @property
+    def active(self):
+        """Get or set bool value for 'active'
+        Whether this filter active or has been temporarily disabled.
+        """
+        ret = self._get_attr("active")
+        return ret
+
+    @active.setter
+    def active(self, value):
+        if not isinstance(value, bool):
+            raise TypeError("value is not an instance of bool")
+        return self._set_attr("active", value)
+
+    @property
+    def vendor_id(self):
+        """Get or set str value for 'vendorId'
+        :py:func:`IUSBDevice.vendor_id` Vendor ID filter.
+        The string representation for the *exact matching*
+        has the form XXXX, where X is the hex digit
+        (including leading zeroes).
+        """
+        ret = self._get_attr("vendorId")
+        return ret
+
+    @vendor_id.setter
+    def vendor_id(self, value):
+        if not isinstance(value, basestring):
+            raise TypeError("value is not an instance of basestring")
+        return self._set_attr("vendorId", value)
+
+    @property
+    def product_id(self):
+        """Get or set str value for 'productId'
+        :py:func:`IUSBDevice.product_id` Product ID filter.
+        The string representation for the *exact matching*
+        has the form XXXX, where X is the hex digit
+        (including leading zeroes).
+        """
+        ret = self._get_attr("productId")
+        return ret
+
+    @product_id.setter
+    def product_id(self, value):
+        if not isinstance(value, basestring):
+            raise TypeError("value is not an instance of basestring")
+        return self._set_attr("productId", value)
+
+    @property
+    def revision(self):
+        """Get or set str value for 'revision'
+        :py:func:`IUSBDevice.product_id` Product revision number
+        filter. The string representation for the *exact matching*
+        has the form IIFF, where I is the decimal digit
+        of the integer part of the revision, and F is the
+        decimal digit of its fractional part (including leading and
+        trailing zeros).
+        Note that for interval filters, it's best to use the hexadecimal
+        form, because the revision is stored as a 16 bit packed BCD value;
+        so the expression int:0x0100-0x0199 will match any
+        revision from 1.0 to 1.99.
+        """
+        ret = self._get_attr("revision")
+        return ret
+
+    @revision.setter
+    def revision(self, value):
+        if not isinstance(value, basestring):
+            raise TypeError("value is not an instance of basestring")
+        return self._set_attr("revision", value)
+
+    @property
+    def manufacturer(self):
+        """Get or set str value for 'manufacturer'
+        :py:func:`IUSBDevice.manufacturer` Manufacturer filter.
+        """
+        ret = self._get_attr("manufacturer")
+        return ret
+
+    @manufacturer.setter
+    def manufacturer(self, value):
+        if not isinstance(value, basestring):
+            raise TypeError("value is not an instance of basestring")
+        return self._set_attr("manufacturer", value)
+
+    @property
+    def product(self):
+        """Get or set str value for 'product'
+        :py:func:`IUSBDevice.product` Product filter.
+        """
+        ret = self._get_attr("product")
+        return ret
+
+    @product.setter
+    def product(self, value):
+        if not isinstance(value, basestring):
+            raise TypeError("value is not an instance of basestring")
+        return self._set_attr("product", value)
+
+    @property
+    def serial_number(self):
+        """Get or set str value for 'serialNumber'
+        :py:func:`IUSBDevice.serial_number` Serial number filter.
+        """
+        ret = self._get_attr("serialNumber")
+        return ret
+
+    @serial_number.setter
+    def serial_number(self, value):
+        if not isinstance(value, basestring):
+            raise TypeError("value is not an instance of basestring")
+        return self._set_attr("serialNumber", value)
+
+    @property
+    def port(self):
+        """Get or set str value for 'port'
+        :py:func:`IUSBDevice.port` Host USB port filter.
+        """
+        ret = self._get_attr("port")
+        return ret
+
+    @port.setter
+    def port(self, value):
+        if not isinstance(value, basestring):
+            raise TypeError("value is not an instance of basestring")
+        return self._set_attr("port", value)
+
+    @property
+    def remote(self):
+        """Get or set str value for 'remote'
+        :py:func:`IUSBDevice.remote` Remote state filter.
+
+        This filter makes sense only for machine USB filters,
+        i.e. it is ignored by IHostUSBDeviceFilter objects.
+        """
+        ret = self._get_attr("remote")
+        return ret
+
+    @remote.setter
+    def remote(self, value):
+        if not isinstance(value, basestring):
+            raise TypeError("value is not an instance of basestring")
+        return self._set_attr("remote", value)
+
+    @property
+    def masked_interfaces(self):
+        """Get or set int value for 'maskedInterfaces'
+        This is an advanced option for hiding one or more USB interfaces
+        from the guest. The value is a bit mask where the bits that are set
+        means the corresponding USB interface should be hidden, masked off
+        if you like.
+        This feature only works on Linux hosts.
+        """
+        ret = self._get_attr("maskedInterfaces")
+        return ret
+
+    @masked_interfaces.setter
+    def masked_interfaces(self, value):
+        if not isinstance(value, baseinteger):
+            raise TypeError("value is not an instance of baseinteger")
+        return self._set_attr("maskedInterfaces", value)
@@ -0,0 +1,170 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from ..library_base import Interface
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IUSBDeviceFilters(Interface):
+    """
+    List of USB device filters associated with the machine.
+
+    If the machine is currently running, these filters are activated
+    every time a new (supported) USB device is attached to the host
+    computer that was not ignored by global filters
+    (:py:func:`IHost.usb_device_filters` ).
+
+    These filters are also activated when the machine is powered up.
+    They are run against a list of all currently available USB
+    devices (in states
+    :py:attr:`USBDeviceState.available` ,
+    :py:attr:`USBDeviceState.busy` ,
+    :py:attr:`USBDeviceState.held` ) that were not previously
+    ignored by global filters.
+
+    If at least one filter matches the USB device in question, this
+    device is automatically captured (attached to) the virtual USB
+    controller of this machine.
+
+    :py:class:`IUSBDeviceFilter` , :py:class:`IUSBController`
+    """
+
+    __uuid__ = "9709db9b-3346-49d6-8f1c-41b0c4784ff2"
+    __wsmap__ = "managed"
+
+    @property
+    def device_filters(self):
+        """Get IUSBDeviceFilter value for 'deviceFilters'
+        List of USB device filters associated with the machine.
+
+        If the machine is currently running, these filters are activated
+        every time a new (supported) USB device is attached to the host
+        computer that was not ignored by global filters
+        (:py:func:`IHost.usb_device_filters` ).
+
+        These filters are also activated when the machine is powered up.
+        They are run against a list of all currently available USB
+        devices (in states
+        :py:attr:`USBDeviceState.available` ,
+        :py:attr:`USBDeviceState.busy` ,
+        :py:attr:`USBDeviceState.held` ) that were not previously
+        ignored by global filters.
+
+        If at least one filter matches the USB device in question, this
+        device is automatically captured (attached to) the virtual USB
+        controller of this machine.
+
+        :py:class:`IUSBDeviceFilter` , :py:class:`IUSBController`
+        """
+        ret = self._get_attr("deviceFilters")
+        return [_lib.IUSBDeviceFilter(a) for a in ret]
+
+    def create_device_filter(self, name):
+        """Creates a new USB device filter. All attributes except
+        the filter name are set to empty (any match),
+        *active* is @c false (the filter is not active).
+
+        The created filter can then be added to the list of filters using
+        :py:func:`insert_device_filter` .
+
+
+
+        :py:func:`device_filters`
+
+        in name of type str
+            Filter name. See :py:func:`IUSBDeviceFilter.name`
+            for more info.
+
+        return filter_p of type :class:`IUSBDeviceFilter`
+            Created filter object.
+
+        raises :class:`VBoxErrorInvalidVmState`
+            The virtual machine is not mutable.
+
+        """
+        if not isinstance(name, basestring):
+            raise TypeError("name can only be an instance of type basestring")
+        filter_p = self._call("createDeviceFilter", in_p=[name])
+        filter_p = _lib.IUSBDeviceFilter(filter_p)
+        return filter_p
+
+    def insert_device_filter(self, position, filter_p):
+        """Inserts the given USB device to the specified position
+        in the list of filters.
+
+        Positions are numbered starting from 0. If the specified
+        position is equal to or greater than the number of elements in
+        the list, the filter is added to the end of the collection.
+
+
+        Duplicates are not allowed, so an attempt to insert a
+        filter that is already in the collection, will return an
+        error.
+
+
+
+
+        :py:func:`device_filters`
+
+        in position of type int
+            Position to insert the filter to.
+
+        in filter_p of type :class:`IUSBDeviceFilter`
+            USB device filter to insert.
+
+        raises :class:`VBoxErrorInvalidVmState`
+            Virtual machine is not mutable.
+
+        raises :class:`OleErrorInvalidarg`
+            USB device filter not created within this VirtualBox instance.
+
+        raises :class:`VBoxErrorInvalidObjectState`
+            USB device filter already in list.
+
+        """
+        if not isinstance(position, baseinteger):
+            raise TypeError("position can only be an instance of type baseinteger")
+        if not isinstance(filter_p, _lib.IUSBDeviceFilter):
+            raise TypeError("filter_p can only be an instance of type IUSBDeviceFilter")
+        self._call("insertDeviceFilter", in_p=[position, filter_p])
+
+    def remove_device_filter(self, position):
+        """Removes a USB device filter from the specified position in the
+        list of filters.
+
+        Positions are numbered starting from 0. Specifying a
+        position equal to or greater than the number of elements in
+        the list will produce an error.
+
+        :py:func:`device_filters`
+
+        in position of type int
+            Position to remove the filter from.
+
+        return filter_p of type :class:`IUSBDeviceFilter`
+            Removed USB device filter.
+
+        raises :class:`VBoxErrorInvalidVmState`
+            Virtual machine is not mutable.
+
+        raises :class:`OleErrorInvalidarg`
+            USB device filter list empty or invalid @a position.
+
+        """
+        if not isinstance(position, baseinteger):
+            raise TypeError("position can only be an instance of type baseinteger")
+        filter_p = self._call("removeDeviceFilter", in_p=[position])
+        filter_p = _lib.IUSBDeviceFilter(filter_p)
+        return filter_p
@@ -0,0 +1,68 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from .ievent import IEvent
+from .vboxeventtype import VBoxEventType
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IUSBDeviceStateChangedEvent(IEvent):
+    """
+    Notification when a USB device is attached to or detached from
+    the virtual USB controller.
+
+    This notification is sent as a result of the indirect
+    request to attach the device because it matches one of the
+    machine USB filters, or as a result of the direct request
+    issued by :py:func:`IConsole.attach_usb_device`  or
+    :py:func:`IConsole.detach_usb_device` .
+
+    This notification is sent in case of both a succeeded and a
+    failed request completion. When the request succeeds, the
+    @a error parameter is @c null, and the given device has been
+    already added to (when @a attached is @c true) or removed from
+    (when @a attached is @c false) the collection represented by
+    :py:func:`IConsole.usb_devices` . On failure, the collection
+    doesn't change and the @a error parameter represents the error
+    message describing the failure.
+    """
+
+    __uuid__ = "806da61b-6679-422a-b629-51b06b0c6d93"
+    __wsmap__ = "managed"
+    id = VBoxEventType.on_usb_device_state_changed
+
+    @property
+    def device(self):
+        """Get IUSBDevice value for 'device'
+        Device that is subject to state change.
+        """
+        ret = self._get_attr("device")
+        return _lib.IUSBDevice(ret)
+
+    @property
+    def attached(self):
+        """Get bool value for 'attached'
+        @c true if the device was attached and @c false otherwise.
+        """
+        ret = self._get_attr("attached")
+        return ret
+
+    @property
+    def error(self):
+        """Get IVirtualBoxErrorInfo value for 'error'
+        @c null on success or an error message object on failure.
+        """
+        ret = self._get_attr("error")
+        return _lib.IVirtualBoxErrorInfo(ret)
@@ -0,0 +1,43 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from ..library_base import Interface
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IUSBProxyBackend(Interface):
+    """
+    The USBProxyBackend interface represents a source for USB devices available
+    to the host for attaching to the VM.
+    """
+
+    __uuid__ = "dfe56449-6989-4002-80cf-3607f377d40c"
+    __wsmap__ = "managed"
+
+    @property
+    def name(self):
+        """Get str value for 'name'
+        The unique name of the proxy backend.
+        """
+        ret = self._get_attr("name")
+        return ret
+
+    @property
+    def type_p(self):
+        """Get str value for 'type'
+        The type of the backend.
+        """
+        ret = self._get_attr("type")
+        return ret
@@ -0,0 +1,37 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from .ievent import IEvent
+from .vboxeventtype import VBoxEventType
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IVBoxSVCAvailabilityChangedEvent(IEvent):
+    """
+    Notification when VBoxSVC becomes unavailable (due to a crash or similar
+    unexpected circumstances) or available again.
+    """
+
+    __uuid__ = "97c78fcd-d4fc-485f-8613-5af88bfcfcdc"
+    __wsmap__ = "managed"
+    id = VBoxEventType.on_v_box_svc_availability_changed
+
+    @property
+    def available(self):
+        """Get bool value for 'available'
+        Whether VBoxSVC is available now.
+        """
+        ret = self._get_attr("available")
+        return ret
@@ -0,0 +1,87 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from .ievent import IEvent
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IVetoEvent(IEvent):
+    """
+    Base abstract interface for veto events.
+    """
+
+    __uuid__ = "7c5e945f-2354-4267-883f-2f417d216519"
+    __wsmap__ = "managed"
+
+    def add_veto(self, reason):
+        """Adds a veto on this event.
+
+        in reason of type str
+            Reason for veto, could be null or empty string.
+
+        """
+        if not isinstance(reason, basestring):
+            raise TypeError("reason can only be an instance of type basestring")
+        self._call("addVeto", in_p=[reason])
+
+    def is_vetoed(self):
+        """If this event was vetoed.
+
+        return result of type bool
+            Reason for veto.
+
+        """
+        result = self._call("isVetoed")
+        return result
+
+    def get_vetos(self):
+        """Current veto reason list, if size is 0 - no veto.
+
+        return result of type str
+            Array of reasons for veto provided by different event handlers.
+
+        """
+        result = self._call("getVetos")
+        return result
+
+    def add_approval(self, reason):
+        """Adds an approval on this event.
+
+        in reason of type str
+            Reason for approval, could be null or empty string.
+
+        """
+        if not isinstance(reason, basestring):
+            raise TypeError("reason can only be an instance of type basestring")
+        self._call("addApproval", in_p=[reason])
+
+    def is_approved(self):
+        """If this event was approved.
+
+        return result of type bool
+
+        """
+        result = self._call("isApproved")
+        return result
+
+    def get_approvals(self):
+        """Current approval reason list, if size is 0 - no approvals.
+
+        return result of type str
+            Array of reasons for approval provided by different event handlers.
+
+        """
+        result = self._call("getApprovals")
+        return result
@@ -0,0 +1,143 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from ..library_base import Interface
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IVFSExplorer(Interface):
+    """
+    The VFSExplorer interface unifies access to different file system
+    types. This includes local file systems as well remote file systems like
+    S3. For a list of supported types see :py:class:`VFSType` .
+    An instance of this is returned by :py:func:`IAppliance.create_vfs_explorer` .
+    """
+
+    __uuid__ = "fb220201-2fd3-47e2-a5dc-2c2431d833cc"
+    __wsmap__ = "managed"
+
+    @property
+    def path(self):
+        """Get str value for 'path'
+        Returns the current path in the virtual file system.
+        """
+        ret = self._get_attr("path")
+        return ret
+
+    @property
+    def type_p(self):
+        """Get VFSType value for 'type'
+        Returns the file system type which is currently in use.
+        """
+        ret = self._get_attr("type")
+        return _lib.VFSType(ret)
+
+    def update(self):
+        """Updates the internal list of files/directories from the
+        current directory level. Use :py:func:`entry_list`  to get the full list
+        after a call to this method.
+
+        return progress of type :class:`IProgress`
+            Progress object to track the operation completion.
+
+        """
+        progress = self._call("update")
+        progress = _lib.IProgress(progress)
+        return progress
+
+    def cd(self, dir_p):
+        """Change the current directory level.
+
+        in dir_p of type str
+            The name of the directory to go in.
+
+        return progress of type :class:`IProgress`
+            Progress object to track the operation completion.
+
+        """
+        if not isinstance(dir_p, basestring):
+            raise TypeError("dir_p can only be an instance of type basestring")
+        progress = self._call("cd", in_p=[dir_p])
+        progress = _lib.IProgress(progress)
+        return progress
+
+    def cd_up(self):
+        """Go one directory upwards from the current directory level.
+
+        return progress of type :class:`IProgress`
+            Progress object to track the operation completion.
+
+        """
+        progress = self._call("cdUp")
+        progress = _lib.IProgress(progress)
+        return progress
+
+    def entry_list(self):
+        """Returns a list of files/directories after a call to :py:func:`update` . The user is responsible for keeping this internal
+        list up do date.
+
+        out names of type str
+            The list of names for the entries.
+
+        out types of type int
+            The list of types for the entries. :py:class:`FsObjType`
+
+        out sizes of type int
+            The list of sizes (in bytes) for the entries.
+
+        out modes of type int
+            The list of file modes (in octal form) for the entries.
+
+        """
+        names, types, sizes, modes = self._call("entryList")
+        return (names, types, sizes, modes)
+
+    def exists(self, names):
+        """Checks if the given file list exists in the current directory
+        level.
+
+        in names of type str
+            The names to check.
+
+        return exists of type str
+            The names which exist.
+
+        """
+        if not isinstance(names, list):
+            raise TypeError("names can only be an instance of type list")
+        for a in names[:10]:
+            if not isinstance(a, basestring):
+                raise TypeError("array can only contain objects of type basestring")
+        exists = self._call("exists", in_p=[names])
+        return exists
+
+    def remove(self, names):
+        """Deletes the given files in the current directory level.
+
+        in names of type str
+            The names to remove.
+
+        return progress of type :class:`IProgress`
+            Progress object to track the operation completion.
+
+        """
+        if not isinstance(names, list):
+            raise TypeError("names can only be an instance of type list")
+        for a in names[:10]:
+            if not isinstance(a, basestring):
+                raise TypeError("array can only contain objects of type basestring")
+        progress = self._call("remove", in_p=[names])
+        progress = _lib.IProgress(progress)
+        return progress
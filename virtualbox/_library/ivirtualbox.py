@@ -0,0 +1,1182 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from ..library_base import Interface
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IVirtualBox(Interface):
+    """
+    The IVirtualBox interface represents the main interface exposed by the
+    product that provides virtual machine management.
+
+    An instance of IVirtualBox is required for the product to do anything
+    useful. Even though the interface does not expose this, internally,
+    IVirtualBox is implemented as a singleton and actually lives in the
+    process of the VirtualBox server (VBoxSVC.exe). This makes sure that
+    IVirtualBox can track the state of all virtual machines on a particular
+    host, regardless of which frontend started them.
+
+    To enumerate all the virtual machines on the host, use the
+    :py:func:`IVirtualBox.machines`  attribute.
+
+    Error information handling is a bit special with IVirtualBox: creating
+    an instance will always succeed. The return of the actual error
+    code/information is postponed to any attribute or method call. The
+    reason for this is that COM likes to mutilate the error code and lose
+    the detailed error information returned by instance creation.
+    """
+
+    __uuid__ = "d0a0163f-e254-4e5b-a1f2-011cf991c38d"
+    __wsmap__ = "managed"
+
+    @property
+    def version(self):
+        """Get str value for 'version'
+        A string representing the version number of the product. The
+        format is 3 integer numbers divided by dots (e.g. 1.0.1). The
+        last number represents the build number and will frequently change.
+
+        This may be followed by a _ALPHA[0-9]*, _BETA[0-9]* or _RC[0-9]* tag
+        in prerelease builds. Non-Oracle builds may (/shall) also have a
+        publisher tag, at the end. The publisher tag starts with an underscore
+        just like the prerelease build type tag.
+        """
+        ret = self._get_attr("version")
+        return ret
+
+    @property
+    def version_normalized(self):
+        """Get str value for 'versionNormalized'
+        A string representing the version number of the product,
+        without the publisher information (but still with other tags).
+        See :py:func:`version` .
+        """
+        ret = self._get_attr("versionNormalized")
+        return ret
+
+    @property
+    def revision(self):
+        """Get int value for 'revision'
+        The internal build revision number of the product.
+        """
+        ret = self._get_attr("revision")
+        return ret
+
+    @property
+    def package_type(self):
+        """Get str value for 'packageType'
+        A string representing the package type of this product. The
+        format is OS_ARCH_DIST where OS is either WINDOWS, LINUX,
+        SOLARIS, DARWIN. ARCH is either 32BITS or 64BITS. DIST
+        is either GENERIC, UBUNTU_606, UBUNTU_710, or something like
+        this.
+        """
+        ret = self._get_attr("packageType")
+        return ret
+
+    @property
+    def api_version(self):
+        """Get str value for 'APIVersion'
+        A string representing the VirtualBox API version number. The format is
+        2 integer numbers divided by an underscore (e.g. 1_0). After the
+        first public release of packages with a particular API version the
+        API will not be changed in an incompatible way. Note that this
+        guarantee does not apply to development builds, and also there is no
+        guarantee that this version is identical to the first two integer
+        numbers of the package version.
+        """
+        ret = self._get_attr("APIVersion")
+        return ret
+
+    @property
+    def api_revision(self):
+        """Get int value for 'APIRevision'
+        This is mainly intended for the VBox Validation Kit so it can fluently
+        deal with incompatible API changes and new functionality during
+        development (i.e. on trunk).
+
+        The high 7 bits (62:56) is the major version number, the next 8 bits
+        (55:48) are the minor version number, the next 8 bits (47:40) are the
+        build number, and the rest (39:0) is the API revision number.
+
+        The API revision number is manually increased on trunk when making
+        incompatible changes that the validation kit or others needs to be able
+        to detect and cope with dynamically.  It can also be used to indicate
+        the presence of new features on both trunk and branches.
+        """
+        ret = self._get_attr("APIRevision")
+        return ret
+
+    @property
+    def home_folder(self):
+        """Get str value for 'homeFolder'
+        Full path to the directory where the global settings file,
+        VirtualBox.xml, is stored.
+
+        In this version of VirtualBox, the value of this property is
+        always <user_dir>/.VirtualBox (where
+        <user_dir> is the path to the user directory,
+        as determined by the host OS), and cannot be changed.
+
+        This path is also used as the base to resolve relative paths in
+        places where relative paths are allowed (unless otherwise
+        expressly indicated).
+        """
+        ret = self._get_attr("homeFolder")
+        return ret
+
+    @property
+    def settings_file_path(self):
+        """Get str value for 'settingsFilePath'
+        Full name of the global settings file.
+        The value of this property corresponds to the value of
+        :py:func:`home_folder`  plus /VirtualBox.xml.
+        """
+        ret = self._get_attr("settingsFilePath")
+        return ret
+
+    @property
+    def host(self):
+        """Get IHost value for 'host'
+        Associated host object.
+        """
+        ret = self._get_attr("host")
+        return _lib.IHost(ret)
+
+    @property
+    def system_properties(self):
+        """Get ISystemProperties value for 'systemProperties'
+        Associated system information object.
+        """
+        ret = self._get_attr("systemProperties")
+        return _lib.ISystemProperties(ret)
+
+    @property
+    def machines(self):
+        """Get IMachine value for 'machines'
+        Array of machine objects registered within this VirtualBox instance.
+        """
+        ret = self._get_attr("machines")
+        return [_lib.IMachine(a) for a in ret]
+
+    @property
+    def machine_groups(self):
+        """Get str value for 'machineGroups'
+        Array of all machine group names which are used by the machines which
+        are accessible. Each group is only listed once, however they are listed
+        in no particular order and there is no guarantee that there are no gaps
+        in the group hierarchy (i.e. "/", "/group/subgroup"
+        is a valid result).
+        """
+        ret = self._get_attr("machineGroups")
+        return ret
+
+    @property
+    def hard_disks(self):
+        """Get IMedium value for 'hardDisks'
+        Array of medium objects known to this VirtualBox installation.
+
+        This array contains only base media. All differencing
+        media of the given base medium can be enumerated using
+        :py:func:`IMedium.children` .
+        """
+        ret = self._get_attr("hardDisks")
+        return [_lib.IMedium(a) for a in ret]
+
+    @property
+    def dvd_images(self):
+        """Get IMedium value for 'DVDImages'
+        Array of CD/DVD image objects currently in use by this VirtualBox instance.
+        """
+        ret = self._get_attr("DVDImages")
+        return [_lib.IMedium(a) for a in ret]
+
+    @property
+    def floppy_images(self):
+        """Get IMedium value for 'floppyImages'
+        Array of floppy image objects currently in use by this VirtualBox instance.
+        """
+        ret = self._get_attr("floppyImages")
+        return [_lib.IMedium(a) for a in ret]
+
+    @property
+    def progress_operations(self):
+        """Get IProgress value for 'progressOperations'"""
+        ret = self._get_attr("progressOperations")
+        return [_lib.IProgress(a) for a in ret]
+
+    @property
+    def guest_os_types(self):
+        """Get IGuestOSType value for 'guestOSTypes'"""
+        ret = self._get_attr("guestOSTypes")
+        return [_lib.IGuestOSType(a) for a in ret]
+
+    @property
+    def shared_folders(self):
+        """Get ISharedFolder value for 'sharedFolders'
+        Collection of global shared folders. Global shared folders are
+        available to all virtual machines.
+
+        New shared folders are added to the collection using
+        :py:func:`create_shared_folder` . Existing shared folders can be
+        removed using :py:func:`remove_shared_folder` .
+
+
+        In the current version of the product, global shared folders are not
+        implemented and therefore this collection is always empty.
+        """
+        ret = self._get_attr("sharedFolders")
+        return [_lib.ISharedFolder(a) for a in ret]
+
+    @property
+    def performance_collector(self):
+        """Get IPerformanceCollector value for 'performanceCollector'
+        Associated performance collector object.
+        """
+        ret = self._get_attr("performanceCollector")
+        return _lib.IPerformanceCollector(ret)
+
+    @property
+    def dhcp_servers(self):
+        """Get IDHCPServer value for 'DHCPServers'
+        DHCP servers.
+        """
+        ret = self._get_attr("DHCPServers")
+        return [_lib.IDHCPServer(a) for a in ret]
+
+    @property
+    def nat_networks(self):
+        """Get INATNetwork value for 'NATNetworks'"""
+        ret = self._get_attr("NATNetworks")
+        return [_lib.INATNetwork(a) for a in ret]
+
+    @property
+    def event_source(self):
+        """Get IEventSource value for 'eventSource'
+        Event source for VirtualBox events.
+        """
+        ret = self._get_attr("eventSource")
+        return _lib.IEventSource(ret)
+
+    @property
+    def extension_pack_manager(self):
+        """Get IExtPackManager value for 'extensionPackManager'
+        The extension pack manager.
+        """
+        ret = self._get_attr("extensionPackManager")
+        return _lib.IExtPackManager(ret)
+
+    @property
+    def internal_networks(self):
+        """Get str value for 'internalNetworks'
+        Names of all internal networks.
+        """
+        ret = self._get_attr("internalNetworks")
+        return ret
+
+    @property
+    def generic_network_drivers(self):
+        """Get str value for 'genericNetworkDrivers'
+        Names of all generic network drivers.
+        """
+        ret = self._get_attr("genericNetworkDrivers")
+        return ret
+
+    @property
+    def cloud_networks(self):
+        """Get ICloudNetwork value for 'cloudNetworks'
+        Names of all configured cloud networks.
+        """
+        ret = self._get_attr("cloudNetworks")
+        return [_lib.ICloudNetwork(a) for a in ret]
+
+    @property
+    def cloud_provider_manager(self):
+        """Get ICloudProviderManager value for 'cloudProviderManager'
+        The cloud provider manager (singleton).
+        """
+        ret = self._get_attr("cloudProviderManager")
+        return _lib.ICloudProviderManager(ret)
+
+    def compose_machine_filename(self, name, group, create_flags, base_folder):
+        """Returns a recommended full path of the settings file name for a new virtual
+        machine.
+
+        This API serves two purposes:
+
+
+        It gets called by :py:func:`create_machine`  if @c null or
+        empty string (which is recommended) is specified for the
+        @a settingsFile argument there, which means that API should use
+        a recommended default file name.
+
+        It can be called manually by a client software before creating a machine,
+        e.g. if that client wants to pre-create the machine directory to create
+        virtual hard disks in that directory together with the new machine
+        settings file. In that case, the file name should be stripped from the
+        full settings file path returned by this function to obtain the
+        machine directory.
+
+
+        See :py:func:`IMachine.name`  and :py:func:`create_machine`  for more
+        details about the machine name.
+
+        @a groupName defines which additional subdirectory levels should be
+        included. It must be either a valid group name or @c null or empty
+        string which designates that the machine will not be related to a
+        machine group.
+
+        If @a baseFolder is a @c null or empty string (which is recommended), the
+        default machine settings folder
+        (see :py:func:`ISystemProperties.default_machine_folder` ) will be used as
+        a base folder for the created machine, resulting in a file name like
+        "/home/user/VirtualBox VMs/name/name.vbox". Otherwise the given base folder
+        will be used.
+
+        This method does not access the host disks. In particular, it does not check
+        for whether a machine with this name already exists.
+
+        in name of type str
+            Suggested machine name.
+
+        in group of type str
+            Machine group name for the new machine or machine group. It is
+            used to determine the right subdirectory.
+
+        in create_flags of type str
+            Machine creation flags, see :py:func:`create_machine`  (optional).
+
+        in base_folder of type str
+            Base machine folder (optional).
+
+        return file_p of type str
+            Fully qualified path where the machine would be created.
+
+        """
+        if not isinstance(name, basestring):
+            raise TypeError("name can only be an instance of type basestring")
+        if not isinstance(group, basestring):
+            raise TypeError("group can only be an instance of type basestring")
+        if not isinstance(create_flags, basestring):
+            raise TypeError("create_flags can only be an instance of type basestring")
+        if not isinstance(base_folder, basestring):
+            raise TypeError("base_folder can only be an instance of type basestring")
+        file_p = self._call(
+            "composeMachineFilename", in_p=[name, group, create_flags, base_folder]
+        )
+        return file_p
+
+    def create_machine(self, settings_file, name, groups, os_type_id, flags):
+        """Creates a new virtual machine by creating a machine settings file at
+                the given location.
+
+                VirtualBox machine settings files use a custom XML dialect. Starting
+                with VirtualBox 4.0, a ".vbox" extension is recommended, but not enforced,
+                and machine files can be created at arbitrary locations.
+
+                However, it is recommended that machines are created in the default
+                machine folder (e.g. "/home/user/VirtualBox VMs/name/name.vbox"; see
+                :py:func:`ISystemProperties.default_machine_folder` ). If you specify
+                @c null or empty string (which is recommended) for the @a settingsFile
+                argument, :py:func:`compose_machine_filename`  is called automatically
+                to have such a recommended name composed based on the machine name
+                given in the @a name argument and the primary group.
+
+                If the resulting settings file already exists, this method will fail,
+                unless the forceOverwrite flag is set.
+
+                The new machine is created unregistered, with the initial configuration
+                set according to the specified guest OS type. A typical sequence of
+                actions to create a new virtual machine is as follows:
+
+
+
+                Call this method to have a new machine created. The returned machine
+                object will be "mutable" allowing to change any machine property.
+
+
+
+                Configure the machine using the appropriate attributes and methods.
+
+
+
+                Call :py:func:`IMachine.save_settings`  to write the settings
+                to the machine's XML settings file. The configuration of the newly
+                created machine will not be saved to disk until this method is
+                called.
+
+
+
+                Call :py:func:`register_machine`  to add the machine to the list
+                of machines known to VirtualBox.
+
+
+
+                The specified guest OS type identifier must match an ID of one of known
+                guest OS types listed in the :py:func:`IVirtualBox.guest_os_types`
+                array.
+
+
+                :py:func:`IMachine.settings_modified`  will return
+                @c false for the created machine, until any of machine settings
+                are changed.
+
+
+
+                There is no way to change the name of the settings file or
+                subfolder of the created machine directly.
+
+                in settings_file of type str
+                    Fully qualified path where the settings file should be created,
+                    empty string or @c null for a default folder and file based on the
+                    @a name argument and the primary group.
+                    (see :py:func:`compose_machine_filename` ).
+
+                in name of type str
+                    Machine name.
+
+                in groups of type str
+                    Array of group names. @c null or an empty array have the same
+                    meaning as an array with just the empty string or "/", i.e.
+                    create a machine without group association.
+
+                in os_type_id of type str
+                    Guest OS Type ID.
+
+                in flags of type str
+                    Additional property parameters, passed as a comma-separated list of
+                    "name=value" type entries. The following ones are recognized:
+                    forceOverwrite=1 to overwrite an existing machine settings
+                    file, UUID=<uuid> to specify a machine UUID and
+                    directoryIncludesUUID=1 to switch to a special VM directory
+                    naming scheme which should not be used unless necessary.
+
+                return machine of type :class:`IMachine`
+                    Created machine object.
+
+                raises :class:`VBoxErrorObjectNotFound`
+                    @a osTypeId is invalid.
+
+                raises :class:`VBoxErrorFileError`
+                    Resulting settings file name is invalid or the settings file already
+        exists or could not be created due to an I/O error.
+
+                raises :class:`OleErrorInvalidarg`
+                    @a name is empty or @c null.
+
+        """
+        if not isinstance(settings_file, basestring):
+            raise TypeError("settings_file can only be an instance of type basestring")
+        if not isinstance(name, basestring):
+            raise TypeError("name can only be an instance of type basestring")
+        if not isinstance(groups, list):
+            raise TypeError("groups can only be an instance of type list")
+        for a in groups[:10]:
+            if not isinstance(a, basestring):
+                raise TypeError("array can only contain objects of type basestring")
+        if not isinstance(os_type_id, basestring):
+            raise TypeError("os_type_id can only be an instance of type basestring")
+        if not isinstance(flags, basestring):
+            raise TypeError("flags can only be an instance of type basestring")
+        machine = self._call(
+            "createMachine", in_p=[settings_file, name, groups, os_type_id, flags]
+        )
+        machine = _lib.IMachine(machine)
+        return machine
+
+    def open_machine(self, settings_file):
+        """Opens a virtual machine from the existing settings file.
+        The opened machine remains unregistered until you call
+        :py:func:`register_machine` .
+
+        The specified settings file name must be fully qualified.
+        The file must exist and be a valid machine XML settings file
+        whose contents will be used to construct the machine object.
+
+
+        :py:func:`IMachine.settings_modified`  will return
+        @c false for the opened machine, until any of machine settings
+        are changed.
+
+        in settings_file of type str
+            Name of the machine settings file.
+
+        return machine of type :class:`IMachine`
+            Opened machine object.
+
+        raises :class:`VBoxErrorFileError`
+            Settings file name invalid, not found or sharing violation.
+
+        """
+        if not isinstance(settings_file, basestring):
+            raise TypeError("settings_file can only be an instance of type basestring")
+        machine = self._call("openMachine", in_p=[settings_file])
+        machine = _lib.IMachine(machine)
+        return machine
+
+    def register_machine(self, machine):
+        """Registers the machine previously created using
+        :py:func:`create_machine`  or opened using
+        :py:func:`open_machine`  within this VirtualBox installation. After
+        successful method invocation, the
+        :py:class:`IMachineRegisteredEvent`  event is fired.
+
+
+        This method implicitly calls :py:func:`IMachine.save_settings`
+        to save all current machine settings before registering it.
+
+        in machine of type :class:`IMachine`
+
+        raises :class:`VBoxErrorObjectNotFound`
+            No matching virtual machine found.
+
+        raises :class:`VBoxErrorInvalidObjectState`
+            Virtual machine was not created within this VirtualBox instance.
+
+        """
+        if not isinstance(machine, _lib.IMachine):
+            raise TypeError("machine can only be an instance of type IMachine")
+        self._call("registerMachine", in_p=[machine])
+
+    def find_machine(self, name_or_id):
+        """Attempts to find a virtual machine given its name or UUID.
+
+        Inaccessible machines cannot be found by name, only by UUID, because their name
+        cannot safely be determined.
+
+        in name_or_id of type str
+            What to search for. This can either be the UUID or the name of a virtual machine.
+
+        return machine of type :class:`IMachine`
+            Machine object, if found.
+
+        raises :class:`VBoxErrorObjectNotFound`
+            Could not find registered machine matching @a nameOrId.
+
+        """
+        if not isinstance(name_or_id, basestring):
+            raise TypeError("name_or_id can only be an instance of type basestring")
+        machine = self._call("findMachine", in_p=[name_or_id])
+        machine = _lib.IMachine(machine)
+        return machine
+
+    def get_machines_by_groups(self, groups):
+        """Gets all machine references which are in one of the specified groups.
+
+        in groups of type str
+            What groups to match. The usual group list rules apply, i.e.
+            passing an empty list will match VMs in the toplevel group, likewise
+            the empty string.
+
+        return machines of type :class:`IMachine`
+            All machines which matched.
+
+        """
+        if not isinstance(groups, list):
+            raise TypeError("groups can only be an instance of type list")
+        for a in groups[:10]:
+            if not isinstance(a, basestring):
+                raise TypeError("array can only contain objects of type basestring")
+        machines = self._call("getMachinesByGroups", in_p=[groups])
+        machines = [_lib.IMachine(a) for a in machines]
+        return machines
+
+    def get_machine_states(self, machines):
+        """Gets the state of several machines in a single operation.
+
+        in machines of type :class:`IMachine`
+            Array with the machine references.
+
+        return states of type :class:`MachineState`
+            Machine states, corresponding to the machines.
+
+        """
+        if not isinstance(machines, list):
+            raise TypeError("machines can only be an instance of type list")
+        for a in machines[:10]:
+            if not isinstance(a, _lib.IMachine):
+                raise TypeError("array can only contain objects of type IMachine")
+        states = self._call("getMachineStates", in_p=[machines])
+        states = [_lib.MachineState(a) for a in states]
+        return states
+
+    def create_appliance(self):
+        """Creates a new appliance object, which represents an appliance in the Open Virtual Machine
+        Format (OVF). This can then be used to import an OVF appliance into VirtualBox or to export
+        machines as an OVF appliance; see the documentation for :py:class:`IAppliance`  for details.
+
+        return appliance of type :class:`IAppliance`
+            New appliance.
+
+        """
+        appliance = self._call("createAppliance")
+        appliance = _lib.IAppliance(appliance)
+        return appliance
+
+    def create_unattended_installer(self):
+        """Creates a new :py:class:`IUnattended`  guest installation object.  This can be used to
+        analyze an installation ISO to create and configure a new machine for it to be installed
+        on.  It can also be used to (re)install an existing machine.
+
+        return unattended of type :class:`IUnattended`
+            New unattended object.
+
+        """
+        unattended = self._call("createUnattendedInstaller")
+        unattended = _lib.IUnattended(unattended)
+        return unattended
+
+    def create_medium(self, format_p, location, access_mode, a_device_type_type):
+        """Creates a new base medium object that will use the given storage
+        format and location for medium data.
+
+        The actual storage unit is not created by this method. In order to
+        do it, and before you are able to attach the created medium to
+        virtual machines, you must call one of the following methods to
+        allocate a format-specific storage unit at the specified location:
+
+        :py:func:`IMedium.create_base_storage`
+        :py:func:`IMedium.create_diff_storage`
+
+
+        Some medium attributes, such as :py:func:`IMedium.id_p` , may
+        remain uninitialized until the medium storage unit is successfully
+        created by one of the above methods.
+
+        Depending on the given device type, the file at the storage location
+        must be in one of the media formats understood by VirtualBox:
+
+
+        With a "HardDisk" device type, the file must be a hard disk image
+        in one of the formats supported by VirtualBox (see
+        :py:func:`ISystemProperties.medium_formats` ).
+        After the storage unit is successfully created and this method succeeds,
+        if the medium is a base medium, it
+        will be added to the :py:func:`hard_disks`  array attribute.
+        With a "DVD" device type, the file must be an ISO 9960 CD/DVD image.
+        After this method succeeds, the medium will be added to the
+        :py:func:`dvd_images`  array attribute.
+        With a "Floppy" device type, the file must be an RAW floppy image.
+        After this method succeeds, the medium will be added to the
+        :py:func:`floppy_images`  array attribute.
+
+
+        The list of all storage formats supported by this VirtualBox
+        installation can be obtained using
+        :py:func:`ISystemProperties.medium_formats` . If the @a format
+        attribute is empty or @c null then the default storage format
+        specified by :py:func:`ISystemProperties.default_hard_disk_format`  will
+        be used for disks r creating a storage unit of the medium.
+
+        Note that the format of the location string is storage format specific.
+        See :py:func:`IMedium.location`  and IMedium for more details.
+
+        in format_p of type str
+            Identifier of the storage format to use for the new medium.
+
+        in location of type str
+            Location of the storage unit for the new medium.
+
+        in access_mode of type :class:`AccessMode`
+            Whether to open the image in read/write or read-only mode. For
+            a "DVD" device type, this is ignored and read-only mode is always assumed.
+
+        in a_device_type_type of type :class:`DeviceType`
+            Must be one of "HardDisk", "DVD" or "Floppy".
+
+        return medium of type :class:`IMedium`
+            Created medium object.
+
+        raises :class:`VBoxErrorObjectNotFound`
+            @a format identifier is invalid. See
+
+        raises :class:`VBoxErrorFileError`
+            @a location is a not valid file name (for file-based formats only).
+
+        """
+        if not isinstance(format_p, basestring):
+            raise TypeError("format_p can only be an instance of type basestring")
+        if not isinstance(location, basestring):
+            raise TypeError("location can only be an instance of type basestring")
+        if not isinstance(access_mode, _lib.AccessMode):
+            raise TypeError("access_mode can only be an instance of type AccessMode")
+        if not isinstance(a_device_type_type, _lib.DeviceType):
+            raise TypeError(
+                "a_device_type_type can only be an instance of type DeviceType"
+            )
+        medium = self._call(
+            "createMedium", in_p=[format_p, location, access_mode, a_device_type_type]
+        )
+        medium = _lib.IMedium(medium)
+        return medium
+
+    def open_medium(self, location, device_type, access_mode, force_new_uuid):
+        """Finds existing media or opens a medium from an existing storage location.
+
+                Once a medium has been opened, it can be passed to other VirtualBox
+                methods, in particular to :py:func:`IMachine.attach_device` .
+
+                Depending on the given device type, the file at the storage location
+                must be in one of the media formats understood by VirtualBox:
+
+
+                With a "HardDisk" device type, the file must be a hard disk image
+                in one of the formats supported by VirtualBox (see
+                :py:func:`ISystemProperties.medium_formats` ).
+                After this method succeeds, if the medium is a base medium, it
+                will be added to the :py:func:`hard_disks`  array attribute.
+                With a "DVD" device type, the file must be an ISO 9960 CD/DVD image.
+                After this method succeeds, the medium will be added to the
+                :py:func:`dvd_images`  array attribute.
+                With a "Floppy" device type, the file must be an RAW floppy image.
+                After this method succeeds, the medium will be added to the
+                :py:func:`floppy_images`  array attribute.
+
+
+                After having been opened, the medium can be re-found by this method
+                and can be attached to virtual machines. See :py:class:`IMedium`  for
+                more details.
+
+                The UUID of the newly opened medium will either be retrieved from the
+                storage location, if the format supports it (e.g. for hard disk images),
+                or a new UUID will be randomly generated (e.g. for ISO and RAW files).
+                If for some reason you need to change the medium's UUID, use
+                :py:func:`IMedium.set_ids` .
+
+                If a differencing hard disk medium is to be opened by this method, the
+                operation will succeed only if its parent medium and all ancestors,
+                if any, are already known to this VirtualBox installation (for example,
+                were opened by this method before).
+
+                This method attempts to guess the storage format of the specified medium
+                by reading medium data at the specified location.
+
+                If @a accessMode is ReadWrite (which it should be for hard disks and floppies),
+                the image is opened for read/write access and must have according permissions,
+                as VirtualBox may actually write status information into the disk's metadata
+                sections.
+
+                Note that write access is required for all typical hard disk usage in VirtualBox,
+                since VirtualBox may need to write metadata such as a UUID into the image.
+                The only exception is opening a source image temporarily for copying and
+                cloning (see :py:func:`IMedium.clone_to`  when the image will be closed
+                again soon.
+
+                The format of the location string is storage format specific. See
+                :py:func:`IMedium.location`  and IMedium for more details.
+
+                in location of type str
+                    Location of the storage unit that contains medium data in one of
+                    the supported storage formats.
+
+                in device_type of type :class:`DeviceType`
+                    Must be one of "HardDisk", "DVD" or "Floppy".
+
+                in access_mode of type :class:`AccessMode`
+                    Whether to open the image in read/write or read-only mode. For
+                    a "DVD" device type, this is ignored and read-only mode is always assumed.
+
+                in force_new_uuid of type bool
+                    Allows the caller to request a completely new medium UUID for
+                    the image which is to be opened. Useful if one intends to open an exact
+                    copy of a previously opened image, as this would normally fail due to
+                    the duplicate UUID.
+
+                return medium of type :class:`IMedium`
+                    Opened medium object.
+
+                raises :class:`VBoxErrorFileError`
+                    Invalid medium storage file location or could not find the medium
+        at the specified location.
+
+                raises :class:`VBoxErrorIprtError`
+                    Could not get medium storage format.
+
+                raises :class:`OleErrorInvalidarg`
+                    Invalid medium storage format.
+
+                raises :class:`VBoxErrorInvalidObjectState`
+                    Medium has already been added to a media registry.
+
+        """
+        if not isinstance(location, basestring):
+            raise TypeError("location can only be an instance of type basestring")
+        if not isinstance(device_type, _lib.DeviceType):
+            raise TypeError("device_type can only be an instance of type DeviceType")
+        if not isinstance(access_mode, _lib.AccessMode):
+            raise TypeError("access_mode can only be an instance of type AccessMode")
+        if not isinstance(force_new_uuid, bool):
+            raise TypeError("force_new_uuid can only be an instance of type bool")
+        medium = self._call(
+            "openMedium", in_p=[location, device_type, access_mode, force_new_uuid]
+        )
+        medium = _lib.IMedium(medium)
+        return medium
+
+    def get_guest_os_type(self, id_p):
+        """Returns an object describing the specified guest OS type.
+
+        The requested guest OS type is specified using a string which is a
+        mnemonic identifier of the guest operating system, such as
+        "win31" or "ubuntu". The guest OS type ID of a
+        particular virtual machine can be read or set using the
+        :py:func:`IMachine.os_type_id`  attribute.
+
+        The :py:func:`IVirtualBox.guest_os_types`  collection contains all
+        available guest OS type objects. Each object has an
+        :py:func:`IGuestOSType.id_p`  attribute which contains an identifier of
+        the guest OS this object describes.
+
+        While this function returns an error for unknown guest OS types, they
+        can be still used without serious problems (if one accepts the fact
+        that there is no default VM config information).
+
+        in id_p of type str
+            Guest OS type ID string.
+
+        return type_p of type :class:`IGuestOSType`
+            Guest OS type object.
+
+        raises :class:`OleErrorInvalidarg`
+            @a id is not a valid Guest OS type.
+
+        """
+        if not isinstance(id_p, basestring):
+            raise TypeError("id_p can only be an instance of type basestring")
+        type_p = self._call("getGuestOSType", in_p=[id_p])
+        type_p = _lib.IGuestOSType(type_p)
+        return type_p
+
+    def create_shared_folder(
+        self, name, host_path, writable, automount, auto_mount_point
+    ):
+        """Creates a new global shared folder by associating the given logical
+        name with the given host path, adds it to the collection of shared
+        folders and starts sharing it. Refer to the description of
+        :py:class:`ISharedFolder`  to read more about logical names.
+
+        In the current implementation, this operation is not
+        implemented.
+
+        in name of type str
+            Unique logical name of the shared folder.
+
+        in host_path of type str
+            Full path to the shared folder in the host file system.
+
+        in writable of type bool
+            Whether the share is writable or readonly
+
+        in automount of type bool
+            Whether the share gets automatically mounted by the guest
+            or not.
+
+        in auto_mount_point of type str
+            Where the guest should automatically mount the folder, if possible.
+            For Windows and OS/2 guests this should be a drive letter, while other
+            guests it should be a absolute directory.
+
+        """
+        if not isinstance(name, basestring):
+            raise TypeError("name can only be an instance of type basestring")
+        if not isinstance(host_path, basestring):
+            raise TypeError("host_path can only be an instance of type basestring")
+        if not isinstance(writable, bool):
+            raise TypeError("writable can only be an instance of type bool")
+        if not isinstance(automount, bool):
+            raise TypeError("automount can only be an instance of type bool")
+        if not isinstance(auto_mount_point, basestring):
+            raise TypeError(
+                "auto_mount_point can only be an instance of type basestring"
+            )
+        self._call(
+            "createSharedFolder",
+            in_p=[name, host_path, writable, automount, auto_mount_point],
+        )
+
+    def remove_shared_folder(self, name):
+        """Removes the global shared folder with the given name previously
+        created by :py:func:`create_shared_folder`  from the collection of
+        shared folders and stops sharing it.
+
+        In the current implementation, this operation is not
+        implemented.
+
+        in name of type str
+            Logical name of the shared folder to remove.
+
+        """
+        if not isinstance(name, basestring):
+            raise TypeError("name can only be an instance of type basestring")
+        self._call("removeSharedFolder", in_p=[name])
+
+    def get_extra_data_keys(self):
+        """Returns an array representing the global extra data keys which currently
+        have values defined.
+
+        return keys of type str
+            Array of extra data keys.
+
+        """
+        keys = self._call("getExtraDataKeys")
+        return keys
+
+    def get_extra_data(self, key):
+        """Returns associated global extra data.
+
+        If the requested data @a key does not exist, this function will
+        succeed and return an empty string in the @a value argument.
+
+        in key of type str
+            Name of the data key to get.
+
+        return value of type str
+            Value of the requested data key.
+
+        raises :class:`VBoxErrorFileError`
+            Settings file not accessible.
+
+        raises :class:`VBoxErrorXmlError`
+            Could not parse the settings file.
+
+        """
+        if not isinstance(key, basestring):
+            raise TypeError("key can only be an instance of type basestring")
+        value = self._call("getExtraData", in_p=[key])
+        return value
+
+    def set_extra_data(self, key, value):
+        """Sets associated global extra data.
+
+        If you pass @c null or an empty string as a key @a value, the given
+        @a key will be deleted.
+
+
+        Key must contain printable (non-control) UTF-8 characters only.
+
+
+        Before performing the actual data change, this method will ask all
+        registered event listeners using the
+        :py:class:`IExtraDataCanChangeEvent`
+        notification for a permission. If one of the listeners refuses the
+        new value, the change will not be performed.
+
+
+        On success, the
+        :py:class:`IExtraDataChangedEvent`  notification
+        is called to inform all registered listeners about a successful data
+        change.
+
+        in key of type str
+            Name of the data key to set.
+
+        in value of type str
+            Value to assign to the key.
+
+        raises :class:`VBoxErrorFileError`
+            Settings file not accessible.
+
+        raises :class:`VBoxErrorXmlError`
+            Could not parse the settings file.
+
+        raises :class:`OleErrorAccessdenied`
+            Modification request refused.
+
+        raises :class:`OleErrorInvalidarg`
+            Key contains invalid characters.
+
+        """
+        if not isinstance(key, basestring):
+            raise TypeError("key can only be an instance of type basestring")
+        if not isinstance(value, basestring):
+            raise TypeError("value can only be an instance of type basestring")
+        self._call("setExtraData", in_p=[key, value])
+
+    def set_settings_secret(self, password):
+        """Unlocks the secret data by passing the unlock password to the
+        server. The server will cache the password for that machine.
+
+        in password of type str
+            The cipher key.
+
+        raises :class:`VBoxErrorInvalidVmState`
+            Virtual machine is not mutable.
+
+        """
+        if not isinstance(password, basestring):
+            raise TypeError("password can only be an instance of type basestring")
+        self._call("setSettingsSecret", in_p=[password])
+
+    def create_dhcp_server(self, name):
+        """Creates a DHCP server settings to be used for the given internal network name
+
+        in name of type str
+            server name
+
+        return server of type :class:`IDHCPServer`
+            DHCP server settings
+
+        raises :class:`OleErrorInvalidarg`
+            Host network interface @a name already exists.
+
+        """
+        if not isinstance(name, basestring):
+            raise TypeError("name can only be an instance of type basestring")
+        server = self._call("createDHCPServer", in_p=[name])
+        server = _lib.IDHCPServer(server)
+        return server
+
+    def find_dhcp_server_by_network_name(self, name):
+        """Searches a DHCP server settings to be used for the given internal network name
+
+        in name of type str
+            server name
+
+        return server of type :class:`IDHCPServer`
+            DHCP server settings
+
+        raises :class:`OleErrorInvalidarg`
+            Host network interface @a name already exists.
+
+        """
+        if not isinstance(name, basestring):
+            raise TypeError("name can only be an instance of type basestring")
+        server = self._call("findDHCPServerByNetworkName", in_p=[name])
+        server = _lib.IDHCPServer(server)
+        return server
+
+    def remove_dhcp_server(self, server):
+        """Removes the DHCP server settings
+
+        in server of type :class:`IDHCPServer`
+            DHCP server settings to be removed
+
+        raises :class:`OleErrorInvalidarg`
+            Host network interface @a name already exists.
+
+        """
+        if not isinstance(server, _lib.IDHCPServer):
+            raise TypeError("server can only be an instance of type IDHCPServer")
+        self._call("removeDHCPServer", in_p=[server])
+
+    def create_nat_network(self, network_name):
+        """
+
+        in network_name of type str
+
+        return network of type :class:`INATNetwork`
+
+        """
+        if not isinstance(network_name, basestring):
+            raise TypeError("network_name can only be an instance of type basestring")
+        network = self._call("createNATNetwork", in_p=[network_name])
+        network = _lib.INATNetwork(network)
+        return network
+
+    def find_nat_network_by_name(self, network_name):
+        """
+
+        in network_name of type str
+
+        return network of type :class:`INATNetwork`
+
+        """
+        if not isinstance(network_name, basestring):
+            raise TypeError("network_name can only be an instance of type basestring")
+        network = self._call("findNATNetworkByName", in_p=[network_name])
+        network = _lib.INATNetwork(network)
+        return network
+
+    def remove_nat_network(self, network):
+        """
+
+        in network of type :class:`INATNetwork`
+
+        """
+        if not isinstance(network, _lib.INATNetwork):
+            raise TypeError("network can only be an instance of type INATNetwork")
+        self._call("removeNATNetwork", in_p=[network])
+
+    def create_cloud_network(self, network_name):
+        """
+
+        in network_name of type str
+
+        return network of type :class:`ICloudNetwork`
+
+        """
+        if not isinstance(network_name, basestring):
+            raise TypeError("network_name can only be an instance of type basestring")
+        network = self._call("createCloudNetwork", in_p=[network_name])
+        network = _lib.ICloudNetwork(network)
+        return network
+
+    def find_cloud_network_by_name(self, network_name):
+        """
+
+        in network_name of type str
+
+        return network of type :class:`ICloudNetwork`
+
+        """
+        if not isinstance(network_name, basestring):
+            raise TypeError("network_name can only be an instance of type basestring")
+        network = self._call("findCloudNetworkByName", in_p=[network_name])
+        network = _lib.ICloudNetwork(network)
+        return network
+
+    def remove_cloud_network(self, network):
+        """
+
+        in network of type :class:`ICloudNetwork`
+
+        """
+        if not isinstance(network, _lib.ICloudNetwork):
+            raise TypeError("network can only be an instance of type ICloudNetwork")
+        self._call("removeCloudNetwork", in_p=[network])
+
+    def check_firmware_present(self, firmware_type, version):
+        """Check if this VirtualBox installation has a firmware
+        of the given type available, either system-wide or per-user.
+        Optionally, this may return a hint where this firmware can be
+        downloaded from.
+
+        in firmware_type of type :class:`FirmwareType`
+            Type of firmware to check.
+
+        in version of type str
+            Expected version number, usually empty string (presently ignored).
+
+        out url of type str
+            Suggested URL to download this firmware from.
+
+        out file_p of type str
+            Filename of firmware, only valid if result == TRUE.
+
+        return result of type bool
+            If firmware of this type and version is available.
+
+        """
+        if not isinstance(firmware_type, _lib.FirmwareType):
+            raise TypeError(
+                "firmware_type can only be an instance of type FirmwareType"
+            )
+        if not isinstance(version, basestring):
+            raise TypeError("version can only be an instance of type basestring")
+        result, url, file_p = self._call(
+            "checkFirmwarePresent", in_p=[firmware_type, version]
+        )
+        return (result, url, file_p)
@@ -0,0 +1,75 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from ..library_base import Interface
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IVirtualBoxClient(Interface):
+    """
+    Convenience interface for client applications. Treat this as a
+    singleton, i.e. never create more than one instance of this interface.
+
+    At the moment only available for clients of the local API (not usable
+    via the webservice). Once the session logic is redesigned this might
+    change.
+
+    Error information handling is a bit special with IVirtualBoxClient:
+    creating an instance will always succeed. The return of the actual error
+    code/information is postponed to any attribute or method call. The
+    reason for this is that COM likes to mutilate the error code and lose
+    the detailed error information returned by instance creation.
+    """
+
+    __uuid__ = "d2937a8e-cb8d-4382-90ba-b7da78a74573"
+    __wsmap__ = "suppress"
+
+    @property
+    def virtual_box(self):
+        """Get IVirtualBox value for 'virtualBox'
+        Reference to the server-side API root object.
+        """
+        ret = self._get_attr("virtualBox")
+        return _lib.IVirtualBox(ret)
+
+    @property
+    def session(self):
+        """Get ISession value for 'session'
+        Create a new session object and return the reference to it.
+        """
+        ret = self._get_attr("session")
+        return _lib.ISession(ret)
+
+    @property
+    def event_source(self):
+        """Get IEventSource value for 'eventSource'
+        Event source for VirtualBoxClient events.
+        """
+        ret = self._get_attr("eventSource")
+        return _lib.IEventSource(ret)
+
+    def check_machine_error(self, machine):
+        """Perform error checking before using an :py:class:`IMachine`  object.
+        Generally useful before starting a VM and all other uses. If anything
+        is not as it should be then this method will return an appropriate
+        error.
+
+        in machine of type :class:`IMachine`
+            The machine object to check.
+
+        """
+        if not isinstance(machine, _lib.IMachine):
+            raise TypeError("machine can only be an instance of type IMachine")
+        self._call("checkMachineError", in_p=[machine])
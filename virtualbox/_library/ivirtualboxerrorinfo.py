@@ -0,0 +1,123 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from ..library_base import Interface
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IVirtualBoxErrorInfo(Interface):
+    """
+    The IVirtualBoxErrorInfo interface represents extended error information.
+
+    Extended error information can be set by VirtualBox components after
+    unsuccessful or partially successful method invocation. This information
+    can be retrieved by the calling party as an IVirtualBoxErrorInfo object
+    and then shown to the client in addition to the plain 32-bit result code.
+
+    In MS COM, this interface extends the IErrorInfo interface,
+    in XPCOM, it extends the nsIException interface. In both cases,
+    it provides a set of common attributes to retrieve error
+    information.
+
+    Sometimes invocation of some component's method may involve methods of
+    other components that may also fail (independently of this method's
+    failure), or a series of non-fatal errors may precede a fatal error that
+    causes method failure. In cases like that, it may be desirable to preserve
+    information about all errors happened during method invocation and deliver
+    it to the caller. The :py:func:`next_p`  attribute is intended
+    specifically for this purpose and allows to represent a chain of errors
+    through a single IVirtualBoxErrorInfo object set after method invocation.
+
+    errors are stored to a chain in the reverse order, i.e. the
+    initial error object you query right after method invocation is the last
+    error set by the callee, the object it points to in the @a next attribute
+    is the previous error and so on, up to the first error (which is the last
+    in the chain).
+    """
+
+    __uuid__ = "c1bcc6d5-7966-481d-ab0b-d0ed73e28135"
+    __wsmap__ = "managed"
+
+    @property
+    def result_code(self):
+        """Get int value for 'resultCode'
+        Result code of the error.
+        Usually, it will be the same as the result code returned
+        by the method that provided this error information, but not
+        always. For example, on Win32, CoCreateInstance() will most
+        likely return E_NOINTERFACE upon unsuccessful component
+        instantiation attempt, but not the value the component factory
+        returned. Value is typed 'long', not 'result',
+        to make interface usable from scripting languages.
+
+        In MS COM, there is no equivalent.
+        In XPCOM, it is the same as nsIException::result.
+        """
+        ret = self._get_attr("resultCode")
+        return ret
+
+    @property
+    def result_detail(self):
+        """Get int value for 'resultDetail'
+        Optional result data of this error. This will vary depending on the
+        actual error usage. By default this attribute is not being used.
+        """
+        ret = self._get_attr("resultDetail")
+        return ret
+
+    @property
+    def interface_id(self):
+        """Get str value for 'interfaceID'
+        UUID of the interface that defined the error.
+
+        In MS COM, it is the same as IErrorInfo::GetGUID, except for the
+        data type.
+        In XPCOM, there is no equivalent.
+        """
+        ret = self._get_attr("interfaceID")
+        return ret
+
+    @property
+    def component(self):
+        """Get str value for 'component'
+        Name of the component that generated the error.
+
+        In MS COM, it is the same as IErrorInfo::GetSource.
+        In XPCOM, there is no equivalent.
+        """
+        ret = self._get_attr("component")
+        return ret
+
+    @property
+    def text(self):
+        """Get str value for 'text'
+        Text description of the error.
+
+        In MS COM, it is the same as IErrorInfo::GetDescription.
+        In XPCOM, it is the same as nsIException::message.
+        """
+        ret = self._get_attr("text")
+        return ret
+
+    @property
+    def next_p(self):
+        """Get IVirtualBoxErrorInfo value for 'next'
+        Next error object if there is any, or @c null otherwise.
+
+        In MS COM, there is no equivalent.
+        In XPCOM, it is the same as nsIException::inner.
+        """
+        ret = self._get_attr("next")
+        return _lib.IVirtualBoxErrorInfo(ret)
@@ -0,0 +1,34 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from .iform import IForm
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IVirtualSystemDescriptionForm(IForm):
+    """"""
+
+    __uuid__ = "14c2db8a-3ee4-11e9-b872-cb9447aad965"
+    __wsmap__ = "managed"
+
+    def get_virtual_system_description(self):
+        """
+
+        return description of type :class:`IVirtualSystemDescription`
+
+        """
+        description = self._call("getVirtualSystemDescription")
+        description = _lib.IVirtualSystemDescription(description)
+        return description
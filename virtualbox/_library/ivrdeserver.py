@@ -0,0 +1,174 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from ..library_base import Interface
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IVRDEServer(Interface):
+    """
+    Flag if VRDE server is enabled.
+    """
+
+    __uuid__ = "08e25756-08a2-41af-a05f-d7c661abaebe"
+    __wsmap__ = "managed"
+
+    @property
+    def enabled(self):
+        """Get or set bool value for 'enabled'
+        Flag if VRDE server is enabled.
+        """
+        ret = self._get_attr("enabled")
+        return ret
+
+    @enabled.setter
+    def enabled(self, value):
+        if not isinstance(value, bool):
+            raise TypeError("value is not an instance of bool")
+        return self._set_attr("enabled", value)
+
+    @property
+    def auth_type(self):
+        """Get or set AuthType value for 'authType'
+        VRDE authentication method.
+        """
+        ret = self._get_attr("authType")
+        return _lib.AuthType(ret)
+
+    @auth_type.setter
+    def auth_type(self, value):
+        if not isinstance(value, _lib.AuthType):
+            raise TypeError("value is not an instance of AuthType")
+        return self._set_attr("authType", value)
+
+    @property
+    def auth_timeout(self):
+        """Get or set int value for 'authTimeout'
+        Timeout for guest authentication. Milliseconds.
+        """
+        ret = self._get_attr("authTimeout")
+        return ret
+
+    @auth_timeout.setter
+    def auth_timeout(self, value):
+        if not isinstance(value, baseinteger):
+            raise TypeError("value is not an instance of baseinteger")
+        return self._set_attr("authTimeout", value)
+
+    @property
+    def allow_multi_connection(self):
+        """Get or set bool value for 'allowMultiConnection'
+        Flag whether multiple simultaneous connections to the VM are permitted.
+        Note that this will be replaced by a more powerful mechanism in the future.
+        """
+        ret = self._get_attr("allowMultiConnection")
+        return ret
+
+    @allow_multi_connection.setter
+    def allow_multi_connection(self, value):
+        if not isinstance(value, bool):
+            raise TypeError("value is not an instance of bool")
+        return self._set_attr("allowMultiConnection", value)
+
+    @property
+    def reuse_single_connection(self):
+        """Get or set bool value for 'reuseSingleConnection'
+        Flag whether the existing connection must be dropped and a new connection
+        must be established by the VRDE server, when a new client connects in single
+        connection mode.
+        """
+        ret = self._get_attr("reuseSingleConnection")
+        return ret
+
+    @reuse_single_connection.setter
+    def reuse_single_connection(self, value):
+        if not isinstance(value, bool):
+            raise TypeError("value is not an instance of bool")
+        return self._set_attr("reuseSingleConnection", value)
+
+    @property
+    def vrde_ext_pack(self):
+        """Get or set str value for 'VRDEExtPack'
+        The name of Extension Pack providing VRDE for this VM. Overrides
+        :py:func:`ISystemProperties.default_vrde_ext_pack` .
+        """
+        ret = self._get_attr("VRDEExtPack")
+        return ret
+
+    @vrde_ext_pack.setter
+    def vrde_ext_pack(self, value):
+        if not isinstance(value, basestring):
+            raise TypeError("value is not an instance of basestring")
+        return self._set_attr("VRDEExtPack", value)
+
+    @property
+    def auth_library(self):
+        """Get or set str value for 'authLibrary'
+        Library used for authentication of RDP clients by this VM. Overrides
+        :py:func:`ISystemProperties.vrde_auth_library` .
+        """
+        ret = self._get_attr("authLibrary")
+        return ret
+
+    @auth_library.setter
+    def auth_library(self, value):
+        if not isinstance(value, basestring):
+            raise TypeError("value is not an instance of basestring")
+        return self._set_attr("authLibrary", value)
+
+    @property
+    def vrde_properties(self):
+        """Get str value for 'VRDEProperties'
+        Array of names of properties, which are supported by this VRDE server.
+        """
+        ret = self._get_attr("VRDEProperties")
+        return ret
+
+    def set_vrde_property(self, key, value):
+        """Sets a VRDE specific property string.
+
+        If you pass @c null or empty string as a key @a value, the given @a key
+        will be deleted.
+
+        in key of type str
+            Name of the key to set.
+
+        in value of type str
+            Value to assign to the key.
+
+        """
+        if not isinstance(key, basestring):
+            raise TypeError("key can only be an instance of type basestring")
+        if not isinstance(value, basestring):
+            raise TypeError("value can only be an instance of type basestring")
+        self._call("setVRDEProperty", in_p=[key, value])
+
+    def get_vrde_property(self, key):
+        """Returns a VRDE specific property string.
+
+        If the requested data @a key does not exist, this function will
+        succeed and return an empty string in the @a value argument.
+
+        in key of type str
+            Name of the key to get.
+
+        return value of type str
+            Value of the requested key.
+
+        """
+        if not isinstance(key, basestring):
+            raise TypeError("key can only be an instance of type basestring")
+        value = self._call("getVRDEProperty", in_p=[key])
+        return value
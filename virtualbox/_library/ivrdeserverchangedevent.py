@@ -0,0 +1,37 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from .ievent import IEvent
+from .vboxeventtype import VBoxEventType
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IVRDEServerChangedEvent(IEvent):
+    """
+    Notification when a property of the
+    :py:func:`IMachine.vrde_server` VRDE server changes.
+    Interested callees should use IVRDEServer methods and attributes to
+    find out what has changed.
+    """
+
+    __uuid__ = "a06fd66a-3188-4c8c-8756-1395e8cb691c"
+    __wsmap__ = "managed"
+    id = VBoxEventType.on_vrde_server_changed
+
+    @property
+    def midl_does_not_like_empty_interfaces(self):
+        """Get bool value for 'midlDoesNotLikeEmptyInterfaces'"""
+        ret = self._get_attr("midlDoesNotLikeEmptyInterfaces")
+        return ret
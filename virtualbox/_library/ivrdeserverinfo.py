@@ -0,0 +1,153 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from ..library_base import Interface
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IVRDEServerInfo(Interface):
+    """
+    Contains information about the remote desktop (VRDE) server capabilities and status.
+    This is used in the :py:func:`IConsole.vrde_server_info`  attribute.
+    """
+
+    __uuid__ = "c39ef4d6-7532-45e8-96da-eb5986ae76e4"
+    __wsmap__ = "struct"
+
+    @property
+    def active(self):
+        """Get bool value for 'active'
+        Whether the remote desktop connection is active.
+        """
+        ret = self._get_attr("active")
+        return ret
+
+    @property
+    def port(self):
+        """Get int value for 'port'
+        VRDE server port number. If this property is equal to 0, then
+        the VRDE server failed to start, usually because there are no free IP
+        ports to bind to. If this property is equal to -1, then the VRDE
+        server has not yet been started.
+        """
+        ret = self._get_attr("port")
+        return ret
+
+    @property
+    def number_of_clients(self):
+        """Get int value for 'numberOfClients'
+        How many times a client connected.
+        """
+        ret = self._get_attr("numberOfClients")
+        return ret
+
+    @property
+    def begin_time(self):
+        """Get int value for 'beginTime'
+        When the last connection was established, in milliseconds since 1970-01-01 UTC.
+        """
+        ret = self._get_attr("beginTime")
+        return ret
+
+    @property
+    def end_time(self):
+        """Get int value for 'endTime'
+        When the last connection was terminated or the current time, if
+        connection is still active, in milliseconds since 1970-01-01 UTC.
+        """
+        ret = self._get_attr("endTime")
+        return ret
+
+    @property
+    def bytes_sent(self):
+        """Get int value for 'bytesSent'
+        How many bytes were sent in last or current, if still active, connection.
+        """
+        ret = self._get_attr("bytesSent")
+        return ret
+
+    @property
+    def bytes_sent_total(self):
+        """Get int value for 'bytesSentTotal'
+        How many bytes were sent in all connections.
+        """
+        ret = self._get_attr("bytesSentTotal")
+        return ret
+
+    @property
+    def bytes_received(self):
+        """Get int value for 'bytesReceived'
+        How many bytes were received in last or current, if still active, connection.
+        """
+        ret = self._get_attr("bytesReceived")
+        return ret
+
+    @property
+    def bytes_received_total(self):
+        """Get int value for 'bytesReceivedTotal'
+        How many bytes were received in all connections.
+        """
+        ret = self._get_attr("bytesReceivedTotal")
+        return ret
+
+    @property
+    def user(self):
+        """Get str value for 'user'
+        Login user name supplied by the client.
+        """
+        ret = self._get_attr("user")
+        return ret
+
+    @property
+    def domain(self):
+        """Get str value for 'domain'
+        Login domain name supplied by the client.
+        """
+        ret = self._get_attr("domain")
+        return ret
+
+    @property
+    def client_name(self):
+        """Get str value for 'clientName'
+        The client name supplied by the client.
+        """
+        ret = self._get_attr("clientName")
+        return ret
+
+    @property
+    def client_ip(self):
+        """Get str value for 'clientIP'
+        The IP address of the client.
+        """
+        ret = self._get_attr("clientIP")
+        return ret
+
+    @property
+    def client_version(self):
+        """Get int value for 'clientVersion'
+        The client software version number.
+        """
+        ret = self._get_attr("clientVersion")
+        return ret
+
+    @property
+    def encryption_style(self):
+        """Get int value for 'encryptionStyle'
+        Public key exchange method used when connection was established.
+        Values: 0 - RDP4 public key exchange scheme.
+        1 - X509 certificates were sent to client.
+        """
+        ret = self._get_attr("encryptionStyle")
+        return ret
@@ -0,0 +1,36 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+import sys as _sys
+from .ievent import IEvent
+from .vboxeventtype import VBoxEventType
+
+# Taken from sys.modules as virtualbox.library may still be importing this
+_lib = _sys.modules["virtualbox.library"]
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class IVRDEServerInfoChangedEvent(IEvent):
+    """
+    Notification when the status of the VRDE server changes. Interested callees
+    should use :py:func:`IConsole.vrde_server_info` IVRDEServerInfo
+    attributes to find out what is the current status.
+    """
+
+    __uuid__ = "dd6a1080-e1b7-4339-a549-f0878115596e"
+    __wsmap__ = "managed"
+    id = VBoxEventType.on_vrde_server_info_changed
+
+    @property
+    def midl_does_not_like_empty_interfaces(self):
+        """Get bool value for 'midlDoesNotLikeEmptyInterfaces'"""
+        ret = self._get_attr("midlDoesNotLikeEmptyInterfaces")
+        return ret
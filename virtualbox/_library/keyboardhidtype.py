@@ -0,0 +1,50 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class KeyboardHIDType(Enum):
+    """Type of keyboard device used in a virtual machine.
+
+
+    .. describe:: none(1)
+
+            No keyboard.
+
+    .. describe:: ps2_keyboard(2)
+
+            PS/2 keyboard.
+
+    .. describe:: usb_keyboard(3)
+
+            USB keyboard.
+
+    .. describe:: combo_keyboard(4)
+
+            Combined device, working as PS/2 or USB keyboard, depending on guest behavior.
+            Using of such device can have negative performance implications.
+
+    """
+
+    __uuid__ = "383e43d7-5c7c-4ec8-9cb8-eda1bccd6699"
+    _enums = [
+        ("None", 1, """No keyboard."""),
+        ("PS2Keyboard", 2, """PS/2 keyboard."""),
+        ("USBKeyboard", 3, """USB keyboard."""),
+        (
+            "ComboKeyboard",
+            4,
+            """Combined device, working as PS/2 or USB keyboard, depending on guest behavior.
+            Using of such device can have negative performance implications.""",
+        ),
+    ]
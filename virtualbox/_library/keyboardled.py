@@ -0,0 +1,39 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class KeyboardLED(Enum):
+    """Keyboard LED indicators.
+
+
+    .. describe:: num_lock(1)
+
+
+
+    .. describe:: caps_lock(2)
+
+
+
+    .. describe:: scroll_lock(4)
+
+
+
+    """
+
+    __uuid__ = "ef29ea38-409b-49c7-a817-c858d426dfba"
+    _enums = [
+        ("NumLock", 1, """"""),
+        ("CapsLock", 2, """"""),
+        ("ScrollLock", 4, """"""),
+    ]
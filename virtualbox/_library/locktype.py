@@ -0,0 +1,70 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class LockType(Enum):
+    """Used with :py:func:`IMachine.lock_machine` .
+
+
+    .. describe:: null(0)
+
+            Placeholder value, do not use when obtaining a lock.
+
+    .. describe:: shared(1)
+
+            Request only a shared lock for remote-controlling the machine.
+            Such a lock allows changing certain VM settings which can be safely
+            modified for a running VM.
+
+    .. describe:: write(2)
+
+            Lock the machine for writing. This requests an exclusive lock, i.e.
+            there cannot be any other API client holding any type of lock for this
+            VM concurrently. Remember that a VM process counts as an API client
+            which implicitly holds the equivalent of a shared lock during the
+            entire VM runtime.
+
+    .. describe:: vm(3)
+
+            Lock the machine for writing, and create objects necessary for
+            running a VM in this process.
+
+    """
+
+    __uuid__ = "678aaf14-2815-4c3e-b20a-e86ed0216498"
+    _enums = [
+        ("Null", 0, """Placeholder value, do not use when obtaining a lock."""),
+        (
+            "Shared",
+            1,
+            """Request only a shared lock for remote-controlling the machine.
+            Such a lock allows changing certain VM settings which can be safely
+            modified for a running VM.""",
+        ),
+        (
+            "Write",
+            2,
+            """Lock the machine for writing. This requests an exclusive lock, i.e.
+            there cannot be any other API client holding any type of lock for this
+            VM concurrently. Remember that a VM process counts as an API client
+            which implicitly holds the equivalent of a shared lock during the
+            entire VM runtime.""",
+        ),
+        (
+            "VM",
+            3,
+            """Lock the machine for writing, and create objects necessary for
+            running a VM in this process.""",
+        ),
+    ]
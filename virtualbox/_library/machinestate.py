@@ -0,0 +1,457 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class MachineState(Enum):
+    """Virtual machine execution state.
+
+    This enumeration represents possible values of the :py:func:`IMachine.state`  attribute.
+
+    Below is the basic virtual machine state diagram. It shows how the state
+    changes during virtual machine execution. The text in square braces shows
+    a method of the IConsole or IMachine interface that performs the given state
+    transition.
+
+
+    ::
+
+         +---------[powerDown()] <- Stuck <--[failure]-+
+         V                                             |
+         +-> PoweredOff --+-->[powerUp()]--> Starting --+      | +-----[resume()]-----+
+         |                |                             |      | V                    |
+         |   Aborted -----+                             +--> Running --[pause()]--> Paused
+         |                                              |      ^ |                   ^ |
+         |   Saved -----------[powerUp()]--> Restoring -+      | |                   | |
+         |     ^                                               | |                   | |
+         |     |     +-----------------------------------------+-|-------------------+ +
+         |     |     |                                           |                     |
+         |     |     +- OnlineSnapshotting <--[takeSnapshot()]<--+---------------------+
+         |     |                                                 |                     |
+         |     +-------- Saving <--------[saveState()]<----------+---------------------+
+         |                                                       |                     |
+         +-------------- Stopping -------[powerDown()]<----------+---------------------+
+
+
+
+    Note that states to the right from PoweredOff, Aborted and Saved in the
+    above diagram are called *online VM states*. These states
+    represent the virtual machine which is being executed in a dedicated
+    process (usually with a GUI window attached to it where you can see the
+    activity of the virtual machine and interact with it). There are two
+    special pseudo-states, FirstOnline and LastOnline, that can be used in
+    relational expressions to detect if the given machine state is online or
+    not:
+
+
+    ::
+
+         if (machine.GetState() >= MachineState_FirstOnline &&
+         machine.GetState() <= MachineState_LastOnline)
+         {
+         ...the machine is being executed...
+         }
+
+
+
+    When the virtual machine is in one of the online VM states (that is, being
+    executed), only a few machine settings can be modified. Methods working
+    with such settings contain an explicit note about that. An attempt to
+    change any other setting or perform a modifying operation during this time
+    will result in the @c VBOX_E_INVALID_VM_STATE error.
+
+    All online states except Running, Paused and Stuck are transitional: they
+    represent temporary conditions of the virtual machine that will last as
+    long as the operation that initiated such a condition.
+
+    The Stuck state is a special case. It means that execution of the machine
+    has reached the "Guru Meditation" condition. This condition indicates an
+    internal VMM (virtual machine manager) failure which may happen as a
+    result of either an unhandled low-level virtual hardware exception or one
+    of the recompiler exceptions (such as the *too-many-traps*
+    condition).
+
+    Note also that any online VM state may transit to the Aborted state. This
+    happens if the process that is executing the virtual machine terminates
+    unexpectedly (for example, crashes). Other than that, the Aborted state is
+    equivalent to PoweredOff.
+
+    There are also a few additional state diagrams that do not deal with
+    virtual machine execution and therefore are shown separately. The states
+    shown on these diagrams are called *offline VM states* (this includes
+    PoweredOff, Aborted and Saved too).
+
+    The first diagram shows what happens when a lengthy setup operation is
+    being executed (such as :py:func:`IMachine.attach_device` ).
+
+
+    ::
+
+         +----------------------------------(same state as before the call)------+
+         |                                                                       |
+         +-> PoweredOff --+                                                      |
+         |                |                                                      |
+         |-> Aborted -----+-->[lengthy VM configuration call] --> SettingUp -----+
+         |                |
+         +-> Saved -------+
+
+
+
+    The next two diagrams demonstrate the process of taking a snapshot of a
+    powered off virtual machine, restoring the state to that as of a snapshot
+    or deleting a snapshot, respectively.
+
+
+    ::
+
+         +----------------------------------(same state as before the call)------+
+         |                                                                       |
+         +-> PoweredOff --+                                                      |
+         |                +-->[takeSnapshot()] ------------------> Snapshotting -+
+         +-> Aborted -----+
+
+         +-> PoweredOff --+
+         |                |
+         |   Aborted -----+-->[restoreSnapshot()    ]-------> RestoringSnapshot -+
+         |                |   [deleteSnapshot()     ]-------> DeletingSnapshot --+
+         +-> Saved -------+                                                      |
+         |                                                                       |
+         +---(Saved if restored from an online snapshot, PoweredOff otherwise)---+
+
+
+
+
+    For whoever decides to touch this enum: In order to keep the
+    comparisons involving FirstOnline and LastOnline pseudo-states valid,
+    the numeric values of these states must be correspondingly updated if
+    needed: for any online VM state, the condition
+    FirstOnline <= state <= LastOnline must be
+    @c true. The same relates to transient states for which
+    the condition FirstOnline <= state <= LastOnline must be
+    @c true.
+
+
+    .. describe:: null(0)
+
+            Null value (never used by the API).
+
+    .. describe:: powered_off(1)
+
+            The machine is not running and has no saved execution state; it has
+            either never been started or been shut down successfully.
+
+    .. describe:: saved(2)
+
+            The machine is not currently running, but the execution state of the machine
+            has been saved to an external file when it was running, from where
+            it can be resumed.
+
+    .. describe:: teleported(3)
+
+            The machine was teleported to a different host (or process) and then
+            powered off. Take care when powering it on again may corrupt resources
+            it shares with the teleportation target (e.g. disk and network).
+
+    .. describe:: aborted(4)
+
+            The process running the machine has terminated abnormally. This may
+            indicate a crash of the VM process in host execution context, or
+            the VM process has been terminated externally.
+
+    .. describe:: running(5)
+
+            The machine is currently being executed.
+
+            For whoever decides to touch this enum: In order to keep the
+            comparisons in the old source code valid, this state must immediately
+            precede the Paused state.
+
+            @todo Lift this spectacularly wonderful restriction.
+
+    .. describe:: paused(6)
+
+            Execution of the machine has been paused.
+
+            For whoever decides to touch this enum: In order to keep the
+            comparisons in the old source code valid, this state must immediately
+            follow the Running state.
+
+            @todo Lift this spectacularly wonderful restriction.
+
+    .. describe:: stuck(7)
+
+            Execution of the machine has reached the "Guru Meditation"
+            condition. This indicates a severe error in the hypervisor itself.
+
+            bird: Why this uncool name? Could we rename it to "GuruMeditation" or
+            "Guru", perhaps? Or are there some other VMM states that are
+            intended to be lumped in here as well?
+
+    .. describe:: teleporting(8)
+
+            The machine is about to be teleported to a different host or process.
+            It is possible to pause a machine in this state, but it will go to the
+            @c TeleportingPausedVM state and it will not be
+            possible to resume it again unless the teleportation fails.
+
+    .. describe:: live_snapshotting(9)
+
+            A live snapshot is being taken. The machine is running normally, but
+            some of the runtime configuration options are inaccessible. Also, if
+            paused while in this state it will transition to
+            @c OnlineSnapshotting and it will not be resume the
+            execution until the snapshot operation has completed.
+
+    .. describe:: starting(10)
+
+            Machine is being started after powering it on from a
+            zero execution state.
+
+    .. describe:: stopping(11)
+
+            Machine is being normally stopped powering it off, or after the guest OS
+            has initiated a shutdown sequence.
+
+    .. describe:: saving(12)
+
+            Machine is saving its execution state to a file.
+
+    .. describe:: restoring(13)
+
+            Execution state of the machine is being restored from a file
+            after powering it on from the saved execution state.
+
+    .. describe:: teleporting_paused_vm(14)
+
+            The machine is being teleported to another host or process, but it is
+            not running. This is the paused variant of the
+            @c Teleporting state.
+
+    .. describe:: teleporting_in(15)
+
+            Teleporting the machine state in from another host or process.
+
+    .. describe:: deleting_snapshot_online(16)
+
+            Like @c DeletingSnapshot, but the merging of media is ongoing in
+            the background while the machine is running.
+
+    .. describe:: deleting_snapshot_paused(17)
+
+            Like @c DeletingSnapshotOnline, but the machine was paused when the
+            merging of differencing media was started.
+
+    .. describe:: online_snapshotting(18)
+
+            Like @c LiveSnapshotting, but the machine was paused when the
+            merging of differencing media was started.
+
+    .. describe:: restoring_snapshot(19)
+
+            A machine snapshot is being restored; this typically does not take long.
+
+    .. describe:: deleting_snapshot(20)
+
+            A machine snapshot is being deleted; this can take a long time since this
+            may require merging differencing media. This value indicates that the
+            machine is not running while the snapshot is being deleted.
+
+    .. describe:: setting_up(21)
+
+            Lengthy setup operation is in progress.
+
+    .. describe:: snapshotting(22)
+
+            Taking an (offline) snapshot.
+
+    .. describe:: first_online(5)
+
+            Pseudo-state: first online state (for use in relational expressions).
+
+    .. describe:: last_online(18)
+
+            Pseudo-state: last online state (for use in relational expressions).
+
+    .. describe:: first_transient(8)
+
+            Pseudo-state: first transient state (for use in relational expressions).
+
+    .. describe:: last_transient(22)
+
+            Pseudo-state: last transient state (for use in relational expressions).
+
+    """
+
+    __uuid__ = "00bc01b5-00a4-48db-000a-9061008357aa"
+    _enums = [
+        ("Null", 0, """Null value (never used by the API)."""),
+        (
+            "PoweredOff",
+            1,
+            """The machine is not running and has no saved execution state; it has
+            either never been started or been shut down successfully.""",
+        ),
+        (
+            "Saved",
+            2,
+            """The machine is not currently running, but the execution state of the machine
+            has been saved to an external file when it was running, from where
+            it can be resumed.""",
+        ),
+        (
+            "Teleported",
+            3,
+            """The machine was teleported to a different host (or process) and then
+            powered off. Take care when powering it on again may corrupt resources
+            it shares with the teleportation target (e.g. disk and network).""",
+        ),
+        (
+            "Aborted",
+            4,
+            """The process running the machine has terminated abnormally. This may
+            indicate a crash of the VM process in host execution context, or
+            the VM process has been terminated externally.""",
+        ),
+        (
+            "Running",
+            5,
+            """The machine is currently being executed.
+            
+            For whoever decides to touch this enum: In order to keep the
+            comparisons in the old source code valid, this state must immediately
+            precede the Paused state.
+            
+            @todo Lift this spectacularly wonderful restriction.""",
+        ),
+        (
+            "Paused",
+            6,
+            """Execution of the machine has been paused.
+            
+            For whoever decides to touch this enum: In order to keep the
+            comparisons in the old source code valid, this state must immediately
+            follow the Running state.
+            
+            @todo Lift this spectacularly wonderful restriction.""",
+        ),
+        (
+            "Stuck",
+            7,
+            """Execution of the machine has reached the "Guru Meditation"
+            condition. This indicates a severe error in the hypervisor itself.
+            
+            bird: Why this uncool name? Could we rename it to "GuruMeditation" or
+            "Guru", perhaps? Or are there some other VMM states that are
+            intended to be lumped in here as well?""",
+        ),
+        (
+            "Teleporting",
+            8,
+            """The machine is about to be teleported to a different host or process.
+            It is possible to pause a machine in this state, but it will go to the
+            @c TeleportingPausedVM state and it will not be
+            possible to resume it again unless the teleportation fails.""",
+        ),
+        (
+            "LiveSnapshotting",
+            9,
+            """A live snapshot is being taken. The machine is running normally, but
+            some of the runtime configuration options are inaccessible. Also, if
+            paused while in this state it will transition to
+            @c OnlineSnapshotting and it will not be resume the
+            execution until the snapshot operation has completed.""",
+        ),
+        (
+            "Starting",
+            10,
+            """Machine is being started after powering it on from a
+            zero execution state.""",
+        ),
+        (
+            "Stopping",
+            11,
+            """Machine is being normally stopped powering it off, or after the guest OS
+            has initiated a shutdown sequence.""",
+        ),
+        ("Saving", 12, """Machine is saving its execution state to a file."""),
+        (
+            "Restoring",
+            13,
+            """Execution state of the machine is being restored from a file
+            after powering it on from the saved execution state.""",
+        ),
+        (
+            "TeleportingPausedVM",
+            14,
+            """The machine is being teleported to another host or process, but it is
+            not running. This is the paused variant of the
+            @c Teleporting state.""",
+        ),
+        (
+            "TeleportingIn",
+            15,
+            """Teleporting the machine state in from another host or process.""",
+        ),
+        (
+            "DeletingSnapshotOnline",
+            16,
+            """Like @c DeletingSnapshot, but the merging of media is ongoing in
+            the background while the machine is running.""",
+        ),
+        (
+            "DeletingSnapshotPaused",
+            17,
+            """Like @c DeletingSnapshotOnline, but the machine was paused when the
+            merging of differencing media was started.""",
+        ),
+        (
+            "OnlineSnapshotting",
+            18,
+            """Like @c LiveSnapshotting, but the machine was paused when the
+            merging of differencing media was started.""",
+        ),
+        (
+            "RestoringSnapshot",
+            19,
+            """A machine snapshot is being restored; this typically does not take long.""",
+        ),
+        (
+            "DeletingSnapshot",
+            20,
+            """A machine snapshot is being deleted; this can take a long time since this
+            may require merging differencing media. This value indicates that the
+            machine is not running while the snapshot is being deleted.""",
+        ),
+        ("SettingUp", 21, """Lengthy setup operation is in progress."""),
+        ("Snapshotting", 22, """Taking an (offline) snapshot."""),
+        (
+            "FirstOnline",
+            5,
+            """Pseudo-state: first online state (for use in relational expressions).""",
+        ),
+        (
+            "LastOnline",
+            18,
+            """Pseudo-state: last online state (for use in relational expressions).""",
+        ),
+        (
+            "FirstTransient",
+            8,
+            """Pseudo-state: first transient state (for use in relational expressions).""",
+        ),
+        (
+            "LastTransient",
+            22,
+            """Pseudo-state: last transient state (for use in relational expressions).""",
+        ),
+    ]
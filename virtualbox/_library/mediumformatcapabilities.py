@@ -0,0 +1,141 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class MediumFormatCapabilities(Enum):
+    """Medium format capability flags.
+
+
+    .. describe:: uuid(1)
+
+            Supports UUIDs as expected by VirtualBox code.
+
+    .. describe:: create_fixed(2)
+
+            Supports creating fixed size images, allocating all space instantly.
+
+    .. describe:: create_dynamic(4)
+
+            Supports creating dynamically growing images, allocating space on
+            demand.
+
+    .. describe:: create_split2_g(8)
+
+            Supports creating images split in chunks of a bit less than 2 GBytes.
+
+    .. describe:: differencing(16)
+
+            Supports being used as a format for differencing media (see :py:func:`IMedium.create_diff_storage` ).
+
+    .. describe:: asynchronous(32)
+
+            Supports asynchronous I/O operations for at least some configurations.
+
+    .. describe:: file_p(64)
+
+            The format backend operates on files (the :py:func:`IMedium.location`
+            attribute of the medium specifies a file used to store medium
+            data; for a list of supported file extensions see
+            :py:func:`IMediumFormat.describe_file_extensions` ).
+
+    .. describe:: properties(128)
+
+            The format backend uses the property interface to configure the storage
+            location and properties (the :py:func:`IMediumFormat.describe_properties`
+            method is used to get access to properties supported by the given medium format).
+
+    .. describe:: tcp_networking(256)
+
+            The format backend uses the TCP networking interface for network access.
+
+    .. describe:: vfs(512)
+
+            The format backend supports virtual filesystem functionality.
+
+    .. describe:: discard(1024)
+
+            The format backend supports discarding blocks.
+
+    .. describe:: preferred(2048)
+
+            Indicates that this is a frequently used format backend.
+
+    .. describe:: capability_mask(4095)
+
+
+
+    """
+
+    __uuid__ = "7342ba79-7ce0-4d94-8f86-5ed5a185d9bd"
+    _enums = [
+        ("Uuid", 1, """Supports UUIDs as expected by VirtualBox code."""),
+        (
+            "CreateFixed",
+            2,
+            """Supports creating fixed size images, allocating all space instantly.""",
+        ),
+        (
+            "CreateDynamic",
+            4,
+            """Supports creating dynamically growing images, allocating space on
+            demand.""",
+        ),
+        (
+            "CreateSplit2G",
+            8,
+            """Supports creating images split in chunks of a bit less than 2 GBytes.""",
+        ),
+        (
+            "Differencing",
+            16,
+            """Supports being used as a format for differencing media (see :py:func:`IMedium.create_diff_storage` ).""",
+        ),
+        (
+            "Asynchronous",
+            32,
+            """Supports asynchronous I/O operations for at least some configurations.""",
+        ),
+        (
+            "File",
+            64,
+            """The format backend operates on files (the :py:func:`IMedium.location` 
+            attribute of the medium specifies a file used to store medium
+            data; for a list of supported file extensions see
+            :py:func:`IMediumFormat.describe_file_extensions` ).""",
+        ),
+        (
+            "Properties",
+            128,
+            """The format backend uses the property interface to configure the storage
+            location and properties (the :py:func:`IMediumFormat.describe_properties` 
+            method is used to get access to properties supported by the given medium format).""",
+        ),
+        (
+            "TcpNetworking",
+            256,
+            """The format backend uses the TCP networking interface for network access.""",
+        ),
+        (
+            "VFS",
+            512,
+            """The format backend supports virtual filesystem functionality.""",
+        ),
+        ("Discard", 1024, """The format backend supports discarding blocks."""),
+        (
+            "Preferred",
+            2048,
+            """Indicates that this is a frequently used format backend.""",
+        ),
+        ("CapabilityMask", 4095, """"""),
+    ]
@@ -0,0 +1,96 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class MediumState(Enum):
+    """Virtual medium state.
+    :py:class:`IMedium`
+
+
+    .. describe:: not_created(0)
+
+            Associated medium storage does not exist (either was not created yet or
+            was deleted).
+
+    .. describe:: created(1)
+
+            Associated storage exists and accessible; this gets set if the
+            accessibility check performed by :py:func:`IMedium.refresh_state`
+            was successful.
+
+    .. describe:: locked_read(2)
+
+            Medium is locked for reading (see :py:func:`IMedium.lock_read` ),
+            no data modification is possible.
+
+    .. describe:: locked_write(3)
+
+            Medium is locked for writing (see :py:func:`IMedium.lock_write` ),
+            no concurrent data reading or modification is possible.
+
+    .. describe:: inaccessible(4)
+
+            Medium accessibility check (see :py:func:`IMedium.refresh_state` ) has
+            not yet been performed, or else, associated medium storage is not
+            accessible. In the first case, :py:func:`IMedium.last_access_error`
+            is empty, in the second case, it describes the error that occurred.
+
+    .. describe:: creating(5)
+
+            Associated medium storage is being created.
+
+    .. describe:: deleting(6)
+
+            Associated medium storage is being deleted.
+
+    """
+
+    __uuid__ = "ef41e980-e012-43cd-9dea-479d4ef14d13"
+    _enums = [
+        (
+            "NotCreated",
+            0,
+            """Associated medium storage does not exist (either was not created yet or
+            was deleted).""",
+        ),
+        (
+            "Created",
+            1,
+            """Associated storage exists and accessible; this gets set if the
+            accessibility check performed by :py:func:`IMedium.refresh_state` 
+            was successful.""",
+        ),
+        (
+            "LockedRead",
+            2,
+            """Medium is locked for reading (see :py:func:`IMedium.lock_read` ),
+            no data modification is possible.""",
+        ),
+        (
+            "LockedWrite",
+            3,
+            """Medium is locked for writing (see :py:func:`IMedium.lock_write` ),
+            no concurrent data reading or modification is possible.""",
+        ),
+        (
+            "Inaccessible",
+            4,
+            """Medium accessibility check (see :py:func:`IMedium.refresh_state` ) has
+            not yet been performed, or else, associated medium storage is not
+            accessible. In the first case, :py:func:`IMedium.last_access_error` 
+            is empty, in the second case, it describes the error that occurred.""",
+        ),
+        ("Creating", 5, """Associated medium storage is being created."""),
+        ("Deleting", 6, """Associated medium storage is being deleted."""),
+    ]
@@ -0,0 +1,99 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class MediumType(Enum):
+    """Virtual medium type. For each :py:class:`IMedium` , this defines how the medium is
+    attached to a virtual machine (see :py:class:`IMediumAttachment` ) and what happens
+    when a snapshot (see :py:class:`ISnapshot` ) is taken of a virtual machine which has
+    the medium attached. At the moment DVD and floppy media are always of type "writethrough".
+
+
+    .. describe:: normal(0)
+
+            Normal medium (attached directly or indirectly, preserved
+            when taking snapshots).
+
+    .. describe:: immutable(1)
+
+            Immutable medium (attached indirectly, changes are wiped out
+            the next time the virtual machine is started).
+
+    .. describe:: writethrough(2)
+
+            Write through medium (attached directly, ignored when
+            taking snapshots).
+
+    .. describe:: shareable(3)
+
+            Allow using this medium concurrently by several machines.
+            Present since VirtualBox 3.2.0, and accepted since 3.2.8.
+
+    .. describe:: readonly(4)
+
+            A readonly medium, which can of course be used by several machines.
+            Present and accepted since VirtualBox 4.0.
+
+    .. describe:: multi_attach(5)
+
+            A medium which is indirectly attached, so that one base medium can
+            be used for several VMs which have their own differencing medium to
+            store their modifications. In some sense a variant of Immutable
+            with unset AutoReset flag in each differencing medium.
+            Present and accepted since VirtualBox 4.0.
+
+    """
+
+    __uuid__ = "fe663fb5-c244-4e1b-9d81-c628b417dd04"
+    _enums = [
+        (
+            "Normal",
+            0,
+            """Normal medium (attached directly or indirectly, preserved
+            when taking snapshots).""",
+        ),
+        (
+            "Immutable",
+            1,
+            """Immutable medium (attached indirectly, changes are wiped out
+            the next time the virtual machine is started).""",
+        ),
+        (
+            "Writethrough",
+            2,
+            """Write through medium (attached directly, ignored when
+            taking snapshots).""",
+        ),
+        (
+            "Shareable",
+            3,
+            """Allow using this medium concurrently by several machines.
+            Present since VirtualBox 3.2.0, and accepted since 3.2.8.""",
+        ),
+        (
+            "Readonly",
+            4,
+            """A readonly medium, which can of course be used by several machines.
+            Present and accepted since VirtualBox 4.0.""",
+        ),
+        (
+            "MultiAttach",
+            5,
+            """A medium which is indirectly attached, so that one base medium can
+            be used for several VMs which have their own differencing medium to
+            store their modifications. In some sense a variant of Immutable
+            with unset AutoReset flag in each differencing medium.
+            Present and accepted since VirtualBox 4.0.""",
+        ),
+    ]
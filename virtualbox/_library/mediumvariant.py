@@ -0,0 +1,101 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class MediumVariant(Enum):
+    """Virtual medium image variant. More than one flag may be set.
+    :py:class:`IMedium`
+
+
+    .. describe:: standard(0)
+
+            No particular variant requested, results in using the backend default.
+
+    .. describe:: vmdk_split2_g(1)
+
+            VMDK image split in chunks of less than 2GByte.
+
+    .. describe:: vmdk_raw_disk(2)
+
+            VMDK image representing a raw disk.
+
+    .. describe:: vmdk_stream_optimized(4)
+
+            VMDK streamOptimized image. Special import/export format which is
+            read-only/append-only.
+
+    .. describe:: vmdk_esx(8)
+
+            VMDK format variant used on ESX products.
+
+    .. describe:: vdi_zero_expand(256)
+
+            Fill new blocks with zeroes while expanding image file.
+
+    .. describe:: fixed(65536)
+
+            Fixed image. Only allowed for base images.
+
+    .. describe:: diff(131072)
+
+            Differencing image. Only allowed for child images.
+
+    .. describe:: formatted(536870912)
+
+            Special flag which requests formatting the disk image. Right now
+            supported for floppy images only.
+
+    .. describe:: no_create_dir(1073741824)
+
+            Special flag which suppresses automatic creation of the subdirectory.
+            Only used when passing the medium variant as an input parameter.
+
+    """
+
+    __uuid__ = "0282e97f-4ef3-4411-a8e0-47c384803cb6"
+    _enums = [
+        (
+            "Standard",
+            0,
+            """No particular variant requested, results in using the backend default.""",
+        ),
+        ("VmdkSplit2G", 1, """VMDK image split in chunks of less than 2GByte."""),
+        ("VmdkRawDisk", 2, """VMDK image representing a raw disk."""),
+        (
+            "VmdkStreamOptimized",
+            4,
+            """VMDK streamOptimized image. Special import/export format which is
+            read-only/append-only.""",
+        ),
+        ("VmdkESX", 8, """VMDK format variant used on ESX products."""),
+        (
+            "VdiZeroExpand",
+            256,
+            """Fill new blocks with zeroes while expanding image file.""",
+        ),
+        ("Fixed", 65536, """Fixed image. Only allowed for base images."""),
+        ("Diff", 131072, """Differencing image. Only allowed for child images."""),
+        (
+            "Formatted",
+            536870912,
+            """Special flag which requests formatting the disk image. Right now
+            supported for floppy images only.""",
+        ),
+        (
+            "NoCreateDir",
+            1073741824,
+            """Special flag which suppresses automatic creation of the subdirectory.
+            Only used when passing the medium variant as an input parameter.""",
+        ),
+    ]
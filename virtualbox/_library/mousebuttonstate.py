@@ -0,0 +1,64 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class MouseButtonState(Enum):
+    """Mouse button state.
+
+
+    .. describe:: left_button(1)
+
+
+
+    .. describe:: right_button(2)
+
+
+
+    .. describe:: middle_button(4)
+
+
+
+    .. describe:: wheel_up(8)
+
+
+
+    .. describe:: wheel_down(16)
+
+
+
+    .. describe:: x_button1(32)
+
+
+
+    .. describe:: x_button2(64)
+
+
+
+    .. describe:: mouse_state_mask(127)
+
+
+
+    """
+
+    __uuid__ = "9ee094b8-b28a-4d56-a166-973cb588d7f8"
+    _enums = [
+        ("LeftButton", 1, """"""),
+        ("RightButton", 2, """"""),
+        ("MiddleButton", 4, """"""),
+        ("WheelUp", 8, """"""),
+        ("WheelDown", 16, """"""),
+        ("XButton1", 32, """"""),
+        ("XButton2", 64, """"""),
+        ("MouseStateMask", 127, """"""),
+    ]
@@ -0,0 +1,39 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class NATAliasMode(Enum):
+    """
+
+
+    .. describe:: alias_log(1)
+
+
+
+    .. describe:: alias_proxy_only(2)
+
+
+
+    .. describe:: alias_use_same_ports(4)
+
+
+
+    """
+
+    __uuid__ = "67772168-50d9-11df-9669-7fb714ee4fa1"
+    _enums = [
+        ("AliasLog", 1, """"""),
+        ("AliasProxyOnly", 2, """"""),
+        ("AliasUseSamePorts", 4, """"""),
+    ]
@@ -0,0 +1,34 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class NATProtocol(Enum):
+    """Protocol definitions used with NAT port-forwarding rules.
+
+
+    .. describe:: udp(0)
+
+            Port-forwarding uses UDP protocol.
+
+    .. describe:: tcp(1)
+
+            Port-forwarding uses TCP protocol.
+
+    """
+
+    __uuid__ = "e90164be-eb03-11de-94af-fff9b1c1b19f"
+    _enums = [
+        ("UDP", 0, """Port-forwarding uses UDP protocol."""),
+        ("TCP", 1, """Port-forwarding uses TCP protocol."""),
+    ]
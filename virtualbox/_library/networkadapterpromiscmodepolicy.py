@@ -0,0 +1,51 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class NetworkAdapterPromiscModePolicy(Enum):
+    """The promiscuous mode policy of an interface.
+
+
+    .. describe:: deny(1)
+
+            Deny promiscuous mode requests.
+
+    .. describe:: allow_network(2)
+
+            Allow promiscuous mode, but restrict the scope it to the internal
+            network so that it only applies to other VMs.
+
+    .. describe:: allow_all(3)
+
+            Allow promiscuous mode, include unrelated traffic going over the wire
+            and internally on the host.
+
+    """
+
+    __uuid__ = "c963768a-376f-4c85-8d84-d8ced4b7269e"
+    _enums = [
+        ("Deny", 1, """Deny promiscuous mode requests."""),
+        (
+            "AllowNetwork",
+            2,
+            """Allow promiscuous mode, but restrict the scope it to the internal
+            network so that it only applies to other VMs.""",
+        ),
+        (
+            "AllowAll",
+            3,
+            """Allow promiscuous mode, include unrelated traffic going over the wire
+            and internally on the host.""",
+        ),
+    ]
@@ -0,0 +1,69 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class NetworkAdapterType(Enum):
+    """Network adapter type.
+
+
+    .. describe:: null(0)
+
+            Null value (never used by the API).
+
+    .. describe:: am79_c970_a(1)
+
+            AMD PCNet-PCI II network card (Am79C970A).
+
+    .. describe:: am79_c973(2)
+
+            AMD PCNet-FAST III network card (Am79C973).
+
+    .. describe:: i82540_em(3)
+
+            Intel PRO/1000 MT Desktop network card (82540EM).
+
+    .. describe:: i82543_gc(4)
+
+            Intel PRO/1000 T Server network card (82543GC).
+
+    .. describe:: i82545_em(5)
+
+            Intel PRO/1000 MT Server network card (82545EM).
+
+    .. describe:: virtio(6)
+
+            Virtio network device.
+
+    .. describe:: am79_c960(7)
+
+            AMD PCnet-ISA/NE2100 network card (Am79C960).
+
+    .. describe:: virtio_1_0(8)
+
+            Virtio 1.0 network device.
+
+    """
+
+    __uuid__ = "3c2281e4-d952-4e87-8c7d-24379cb6a81c"
+    _enums = [
+        ("Null", 0, """Null value (never used by the API)."""),
+        ("Am79C970A", 1, """AMD PCNet-PCI II network card (Am79C970A)."""),
+        ("Am79C973", 2, """AMD PCNet-FAST III network card (Am79C973)."""),
+        ("I82540EM", 3, """Intel PRO/1000 MT Desktop network card (82540EM)."""),
+        ("I82543GC", 4, """Intel PRO/1000 T Server network card (82543GC)."""),
+        ("I82545EM", 5, """Intel PRO/1000 MT Server network card (82545EM)."""),
+        ("Virtio", 6, """Virtio network device."""),
+        ("Am79C960", 7, """AMD PCnet-ISA/NE2100 network card (Am79C960)."""),
+        ("Virtio_1_0", 8, """Virtio 1.0 network device."""),
+    ]
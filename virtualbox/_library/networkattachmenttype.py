@@ -0,0 +1,64 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class NetworkAttachmentType(Enum):
+    """Network attachment type.
+
+
+    .. describe:: null(0)
+
+            Null value, also means "not attached".
+
+    .. describe:: nat(1)
+
+
+
+    .. describe:: bridged(2)
+
+
+
+    .. describe:: internal(3)
+
+
+
+    .. describe:: host_only(4)
+
+
+
+    .. describe:: generic(5)
+
+
+
+    .. describe:: nat_network(6)
+
+
+
+    .. describe:: cloud(7)
+
+
+
+    """
+
+    __uuid__ = "524a8f9d-4b86-4b51-877d-1aa27c4ebeac"
+    _enums = [
+        ("Null", 0, """Null value, also means "not attached"."""),
+        ("NAT", 1, """"""),
+        ("Bridged", 2, """"""),
+        ("Internal", 3, """"""),
+        ("HostOnly", 4, """"""),
+        ("Generic", 5, """"""),
+        ("NATNetwork", 6, """"""),
+        ("Cloud", 7, """"""),
+    ]
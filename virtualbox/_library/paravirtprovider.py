@@ -0,0 +1,69 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class ParavirtProvider(Enum):
+    """The paravirtualized guest interface provider. This enumeration represents possible
+    values for the :py:func:`IMachine.paravirt_provider`  attribute.
+
+
+    .. describe:: none(0)
+
+            No provider is used.
+
+    .. describe:: default(1)
+
+            A default provider is automatically chosen according to the guest OS type.
+
+    .. describe:: legacy(2)
+
+            Used for VMs which didn't used to have any provider settings. Usually
+            interpreted as @c None for most VMs.
+
+    .. describe:: minimal(3)
+
+            A minimal set of features to expose to the paravirtualized guest.
+
+    .. describe:: hyper_v(4)
+
+            Microsoft Hyper-V.
+
+    .. describe:: kvm(5)
+
+            Linux KVM.
+
+    """
+
+    __uuid__ = "696453ec-3742-4a05-bead-658ccbf2c944"
+    _enums = [
+        ("None", 0, """No provider is used."""),
+        (
+            "Default",
+            1,
+            """A default provider is automatically chosen according to the guest OS type.""",
+        ),
+        (
+            "Legacy",
+            2,
+            """Used for VMs which didn't used to have any provider settings. Usually
+            interpreted as @c None for most VMs.""",
+        ),
+        (
+            "Minimal",
+            3,
+            """A minimal set of features to expose to the paravirtualized guest.""",
+        ),
+        ("HyperV", 4, """Microsoft Hyper-V."""),
+        ("KVM", 5, """Linux KVM."""),
+    ]
@@ -0,0 +1,34 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class PartitioningType(Enum):
+    """The type of the disk partition.
+
+
+    .. describe:: mbr(0)
+
+
+
+    .. describe:: gpt(1)
+
+
+
+    """
+
+    __uuid__ = "64c4c806-8908-4c0b-9a51-2d7a0151321f"
+    _enums = [
+        ("MBR", 0, """"""),
+        ("GPT", 1, """"""),
+    ]
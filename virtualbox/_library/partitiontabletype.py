@@ -0,0 +1,34 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class PartitionTableType(Enum):
+    """Partition table types.
+
+
+    .. describe:: mbr(1)
+
+
+
+    .. describe:: gpt(2)
+
+
+
+    """
+
+    __uuid__ = "360066eb-d19e-4fa1-57ef-fed434fbe2a9"
+    _enums = [
+        ("MBR", 1, """"""),
+        ("GPT", 2, """"""),
+    ]
@@ -0,0 +1,856 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class PartitionType(Enum):
+    """
+
+
+    .. describe:: empty(0)
+
+            Empty partition entry
+
+    .. describe:: fat12(1)
+
+            FAT12 if partition size less than 65536 sectors
+
+    .. describe:: fat16(4)
+
+            FAT16 if partition size less than 65536 sectors
+
+    .. describe:: fat(6)
+
+            FAT12 or FAT16 if partition size greater or equal than 65536 sectors
+
+    .. describe:: ifs(7)
+
+            NT and OS/2 installable file system, e.g. NTFS, exFAT, HPFS.
+
+    .. describe:: fat32_chs(11)
+
+            The FAT32 with CHS addressing.
+
+    .. describe:: fat32_lba(12)
+
+            The FAT32 with LBA addressing.
+
+    .. describe:: fat16_b(14)
+
+            The FAT16 with LBA addressing.
+
+    .. describe:: extended(15)
+
+            The extended partition with LBA addressing.
+
+    .. describe:: windows_re(39)
+
+            Windows Recovery Environment (RE) partition (hidden NTFS partition).
+
+    .. describe:: linux_swap_old(66)
+
+            The linux swap partition (old versions).
+
+    .. describe:: linux_old(67)
+
+            The linux native partition (old versions).
+
+    .. describe:: dragon_fly_bsd_slice(108)
+
+            The BSD slice.
+
+    .. describe:: linux_swap(130)
+
+            The linux swap partition.
+
+    .. describe:: linux(131)
+
+            The linux native partition.
+
+    .. describe:: linux_extended(133)
+
+            The linux extended partition.
+
+    .. describe:: linux_lvm(142)
+
+            The linux LVM partition.
+
+    .. describe:: bsd_slice(165)
+
+            The BSD slice.
+
+    .. describe:: apple_ufs(168)
+
+            The Apple UFS partition.
+
+    .. describe:: apple_hfs(175)
+
+            The Apple HFS partition.
+
+    .. describe:: solaris(191)
+
+            The Apple HFS partition.
+
+    .. describe:: gpt(238)
+
+            The GPT protective MBR partition.
+
+    .. describe:: efi(239)
+
+            The EFI system partition.
+
+    .. describe:: unknown(256)
+
+            Unknown partition type.
+
+    .. describe:: mbr(257)
+
+            MBR partition scheme.
+
+    .. describe:: i_ffs(258)
+
+            Intel Fast Flash (iFFS) partition.
+
+    .. describe:: sony_boot(259)
+
+            Sony boot partition.
+
+    .. describe:: lenovo_boot(260)
+
+            Lenovo boot partition.
+
+    .. describe:: windows_msr(270)
+
+            Microsoft Reserved Partition (MSR).
+
+    .. describe:: windows_basic_data(271)
+
+            Windows Basic data partition
+
+    .. describe:: windows_ldm_meta(272)
+
+            Windows Logical Disk Manager (LDM) metadata partition.
+
+    .. describe:: windows_ldm_data(273)
+
+            Windows Logical Disk Manager data partition.
+
+    .. describe:: windows_recovery(274)
+
+            Windows Recovery Environment.
+
+    .. describe:: windows_storage_spaces(276)
+
+            Windows Storage Spaces partition.
+
+    .. describe:: windows_storage_replica(277)
+
+            Windows Storage Replica partition.
+
+    .. describe:: ibmgpfs(275)
+
+            IBM General Parallel File System (GPFS) partition.
+
+    .. describe:: linux_data(300)
+
+            Linux filesystem data.
+
+    .. describe:: linux_raid(301)
+
+            Linux RAID partition.
+
+    .. describe:: linux_root_x86(302)
+
+            Linux root partition for x86.
+
+    .. describe:: linux_root_amd64(303)
+
+            Linux root partition for AMD64.
+
+    .. describe:: linux_root_arm32(304)
+
+            Linux root partition for ARM32.
+
+    .. describe:: linux_root_arm64(305)
+
+            Linux root partition for ARM64 / AArch64.
+
+    .. describe:: linux_home(306)
+
+            Linux /home partition.
+
+    .. describe:: linux_srv(307)
+
+            Linux /srv partition.
+
+    .. describe:: linux_plain_dm_crypt(308)
+
+            Linux plain dm-crypt partition.
+
+    .. describe:: linux_luks(309)
+
+            Linux unitified key setup (LUKS) partition.
+
+    .. describe:: linux_reserved(310)
+
+            Linux reserved partition.
+
+    .. describe:: free_bsd_boot(330)
+
+            FreeBSD boot partition.
+
+    .. describe:: free_bsd_data(331)
+
+            FreeBSD data partition.
+
+    .. describe:: free_bsd_swap(332)
+
+            FreeBSD swap partition.
+
+    .. describe:: free_bsdufs(333)
+
+            FreeBSD unix file system (UFS) partition.
+
+    .. describe:: free_bsd_vinum(334)
+
+            FreeBSD Vinum volume manager partition.
+
+    .. describe:: free_bsdzfs(335)
+
+            FreeBSD ZFS partition.
+
+    .. describe:: free_bsd_unknown(359)
+
+            Unknown FreeBSD partition.
+
+    .. describe:: apple_hfs_plus(360)
+
+            Apple hierarchical file system plus (HFS+) partition.
+
+    .. describe:: apple_apfs(361)
+
+            Apple APFS/FileFault container partition.
+
+    .. describe:: apple_raid(362)
+
+            Apple RAID partition.
+
+    .. describe:: apple_raid_offline(363)
+
+            Apple RAID partition, offline.
+
+    .. describe:: apple_boot(364)
+
+            Apple boot partition.
+
+    .. describe:: apple_label(365)
+
+            Apple label.
+
+    .. describe:: apple_tv_recovery(366)
+
+            Apple TV recovery partition.
+
+    .. describe:: apple_core_storage(367)
+
+            Apple Core Storage Containe.
+
+    .. describe:: soft_raid_status(370)
+
+            SoftRAID status.
+
+    .. describe:: soft_raid_scratch(371)
+
+            SoftRAID scratch.
+
+    .. describe:: soft_raid_volume(372)
+
+            SoftRAID volume.
+
+    .. describe:: soft_raid_cache(373)
+
+            SoftRAID cache.
+
+    .. describe:: apple_unknown(389)
+
+            Unknown Apple partition.
+
+    .. describe:: solaris_boot(390)
+
+            Solaris boot partition.
+
+    .. describe:: solaris_root(391)
+
+            Solaris root partition.
+
+    .. describe:: solaris_swap(392)
+
+            Solaris swap partition.
+
+    .. describe:: solaris_backup(393)
+
+            Solaris backup partition.
+
+    .. describe:: solaris_usr(394)
+
+            Solaris /usr partition.
+
+    .. describe:: solaris_var(395)
+
+            Solaris /var partition.
+
+    .. describe:: solaris_home(396)
+
+            Solaris /home partition.
+
+    .. describe:: solaris_alt_sector(397)
+
+            Solaris alternate sector.
+
+    .. describe:: solaris_reserved(398)
+
+            Solaris reserved partition.
+
+    .. describe:: solaris_unknown(419)
+
+            Unknown Solaris partition.
+
+    .. describe:: net_bsd_swap(420)
+
+            NetBSD swap partition.
+
+    .. describe:: net_bsdffs(421)
+
+            NetBSD fast file system (FFS) partition.
+
+    .. describe:: net_bsdlfs(422)
+
+            NetBSD log structured file system (LFS) partition.
+
+    .. describe:: net_bsdraid(423)
+
+            NetBSD RAID partition.
+
+    .. describe:: net_bsd_concatenated(424)
+
+            NetBSD concatenated partition.
+
+    .. describe:: net_bsd_encrypted(425)
+
+            NetBSD encrypted partition.
+
+    .. describe:: net_bsd_unknown(449)
+
+            Unknown NetBSD partition.
+
+    .. describe:: chrome_os_kernel(450)
+
+            Chrome OS kernel partition.
+
+    .. describe:: chrome_os_root_fs(451)
+
+            Chrome OS root file system partition.
+
+    .. describe:: chrome_os_future(452)
+
+            Chrome OS partition reserved for future.
+
+    .. describe:: cont_lnx_usr(480)
+
+            Container Linux /usr partition.
+
+    .. describe:: cont_lnx_root(481)
+
+            Container Linux resizable root filesystem partition.
+
+    .. describe:: cont_lnx_reserved(482)
+
+            Container Linux OEM customization partition.
+
+    .. describe:: cont_lnx_root_raid(483)
+
+            Container Linux root filesystem on RAID partition.
+
+    .. describe:: haiku_bfs(510)
+
+            Haiku BFS
+
+    .. describe:: midnt_bsd_boot(540)
+
+            MidnightBSD boot partition.
+
+    .. describe:: midnt_bsd_data(541)
+
+            MidnightBSD data partition.
+
+    .. describe:: midnt_bsd_swap(542)
+
+            MidnightBSD swap partition.
+
+    .. describe:: midnt_bsdufs(543)
+
+            MidnightBSD unix file system (UFS) partition.
+
+    .. describe:: midnt_bsd_vium(544)
+
+            MidnightBSD Vinum volume manager partition.
+
+    .. describe:: midnt_bsdzfs(545)
+
+            MidnightBSD ZFS partition.
+
+    .. describe:: midnt_bsd_unknown(569)
+
+            Unknown MidnightBSD partition.
+
+    .. describe:: open_bsd_data(570)
+
+            OpenBSD data partition.
+
+    .. describe:: qnx_power_safe_fs(600)
+
+            QNX power-safe file system partition.
+
+    .. describe:: plan9(630)
+
+            Plan 9 partition.
+
+    .. describe:: vm_ware_vmk_core(660)
+
+            VMWare ESX coredump partition.
+
+    .. describe:: vm_ware_vmfs(661)
+
+            VMWare ESX virtual machine file system (VMFS) partition.
+
+    .. describe:: vm_ware_reserved(662)
+
+            VMWare ESX reserved partition.
+
+    .. describe:: vm_ware_unknown(689)
+
+            Unknown VMWare partition.
+
+    .. describe:: android_x86_bootloader(690)
+
+            Android x86 bootloader partition.
+
+    .. describe:: android_x86_bootloader2(691)
+
+            Android x86 bootloader2 partition.
+
+    .. describe:: android_x86_boot(692)
+
+            Android x86 boot partition.
+
+    .. describe:: android_x86_recovery(693)
+
+            Android x86 recovery partition.
+
+    .. describe:: android_x86_misc(694)
+
+            Android x86 misc partition.
+
+    .. describe:: android_x86_metadata(695)
+
+            Android x86 metadata partition.
+
+    .. describe:: android_x86_system(696)
+
+            Android x86 system partition.
+
+    .. describe:: android_x86_cache(697)
+
+            Android x86 cache partition.
+
+    .. describe:: android_x86_data(698)
+
+            Android x86 data partition.
+
+    .. describe:: android_x86_persistent(699)
+
+            Android x86 persistent data partition.
+
+    .. describe:: android_x86_vendor(700)
+
+            Android x86 vendor partition.
+
+    .. describe:: android_x86_config(701)
+
+            Android x86 config partition.
+
+    .. describe:: android_x86_factory(702)
+
+            Android x86 factory partition.
+
+    .. describe:: android_x86_factory_alt(703)
+
+            Android x86 alternative factory partition.
+
+    .. describe:: android_x86_fastboot(704)
+
+            Android x86 fastboot partition.
+
+    .. describe:: android_x86_oem(705)
+
+            Android x86 OEM partition.
+
+    .. describe:: android_arm_meta(720)
+
+            Android ARM meta partition.
+
+    .. describe:: android_arm_ext(721)
+
+            Android ARM EXT partition.
+
+    .. describe:: onie_boot(750)
+
+            Open Network Install Environment (ONIE) boot partition.
+
+    .. describe:: onie_config(751)
+
+            Open Network Install Environment (ONIE) config partition.
+
+    .. describe:: power_pc_prep(780)
+
+            PowerPC PReP boot partition.
+
+    .. describe:: xdg_shr_boot_config(810)
+
+            freedesktop.org shared boot loader configuration partition.
+
+    .. describe:: ceph_block(830)
+
+            Ceph block partition.
+
+    .. describe:: ceph_block_db(831)
+
+            Ceph block DB partition.
+
+    .. describe:: ceph_block_db_dmc(832)
+
+            Ceph dm-crypt block DB partition.
+
+    .. describe:: ceph_block_db_dmc_luks(833)
+
+            Ceph dm-crypt Linux unitified key setup (LUKS) block DB partition.
+
+    .. describe:: ceph_block_dmc(834)
+
+            Ceph dm-crypt block partition.
+
+    .. describe:: ceph_block_dmc_luks(835)
+
+            Ceph dm-crypt Linux unitified key setup (LUKS) block partition.
+
+    .. describe:: ceph_block_wa_log(836)
+
+            Ceph block write-ahead log partition.
+
+    .. describe:: ceph_block_wa_log_dmc(837)
+
+            Ceph dm-crypt block write-ahead log partition.
+
+    .. describe:: ceph_block_wa_log_dmc_luks(838)
+
+            Ceph dm-crypt Linux unitified key setup (LUKS) block write-ahead log partition.
+
+    .. describe:: ceph_disk(839)
+
+            Ceph disk in creation partition.
+
+    .. describe:: ceph_disk_dmc(840)
+
+            Ceph dm-crypt disk in creation partition.
+
+    .. describe:: ceph_journal(841)
+
+            Ceph Journal partition.
+
+    .. describe:: ceph_journal_dmc(842)
+
+            Ceph dm-crypt journal partition.
+
+    .. describe:: ceph_journal_dmc_luks(843)
+
+            Ceph dm-crypt Linux unitified key setup (LUKS) journal partition.
+
+    .. describe:: ceph_lockbox(844)
+
+            Ceph Lockbox for dm-crypt keys partition.
+
+    .. describe:: ceph_multipath_block1(845)
+
+            Ceph multipath block 1 partition.
+
+    .. describe:: ceph_multipath_block2(846)
+
+            Ceph multipath block 2 partition.
+
+    .. describe:: ceph_multipath_block_db(847)
+
+            Ceph multipath block DB partition.
+
+    .. describe:: ceph_multipath_b_lock_wa_log(848)
+
+            Ceph multipath block write-ahead log partition.
+
+    .. describe:: ceph_multipath_journal(849)
+
+            Ceph multipath journal partition.
+
+    .. describe:: ceph_multipath_osd(851)
+
+            Ceph multipath object storage deamon (OSD) partition.
+
+    .. describe:: ceph_osd(852)
+
+            Ceph object storage deamon (OSD) partition.
+
+    .. describe:: ceph_osd_dmc(853)
+
+            Ceph dm-crypt object storage deamon (OSD) partition.
+
+    .. describe:: ceph_osd_dmc_luks(854)
+
+            Ceph dm-crypt Linux unitified key setup (LUKS) object storage deamon (OSD) partition.
+
+    """
+
+    __uuid__ = "84a6629c-8e9c-474c-adbb-21995671597f"
+    _enums = [
+        ("Empty", 0, """Empty partition entry"""),
+        ("FAT12", 1, """FAT12 if partition size less than 65536 sectors"""),
+        ("FAT16", 4, """FAT16 if partition size less than 65536 sectors"""),
+        (
+            "FAT",
+            6,
+            """FAT12 or FAT16 if partition size greater or equal than 65536 sectors""",
+        ),
+        ("IFS", 7, """NT and OS/2 installable file system, e.g. NTFS, exFAT, HPFS."""),
+        ("FAT32CHS", 11, """The FAT32 with CHS addressing."""),
+        ("FAT32LBA", 12, """The FAT32 with LBA addressing."""),
+        ("FAT16B", 14, """The FAT16 with LBA addressing."""),
+        ("Extended", 15, """The extended partition with LBA addressing."""),
+        (
+            "WindowsRE",
+            39,
+            """Windows Recovery Environment (RE) partition (hidden NTFS partition).""",
+        ),
+        ("LinuxSwapOld", 66, """The linux swap partition (old versions)."""),
+        ("LinuxOld", 67, """The linux native partition (old versions)."""),
+        ("DragonFlyBSDSlice", 108, """The BSD slice."""),
+        ("LinuxSwap", 130, """The linux swap partition."""),
+        ("Linux", 131, """The linux native partition."""),
+        ("LinuxExtended", 133, """The linux extended partition."""),
+        ("LinuxLVM", 142, """The linux LVM partition."""),
+        ("BSDSlice", 165, """The BSD slice."""),
+        ("AppleUFS", 168, """The Apple UFS partition."""),
+        ("AppleHFS", 175, """The Apple HFS partition."""),
+        ("Solaris", 191, """The Apple HFS partition."""),
+        ("GPT", 238, """The GPT protective MBR partition."""),
+        ("EFI", 239, """The EFI system partition."""),
+        ("Unknown", 256, """Unknown partition type."""),
+        ("MBR", 257, """MBR partition scheme."""),
+        ("iFFS", 258, """Intel Fast Flash (iFFS) partition."""),
+        ("SonyBoot", 259, """Sony boot partition."""),
+        ("LenovoBoot", 260, """Lenovo boot partition."""),
+        ("WindowsMSR", 270, """Microsoft Reserved Partition (MSR)."""),
+        ("WindowsBasicData", 271, """Windows Basic data partition"""),
+        (
+            "WindowsLDMMeta",
+            272,
+            """Windows Logical Disk Manager (LDM) metadata partition.""",
+        ),
+        ("WindowsLDMData", 273, """Windows Logical Disk Manager data partition."""),
+        ("WindowsRecovery", 274, """Windows Recovery Environment."""),
+        ("WindowsStorageSpaces", 276, """Windows Storage Spaces partition."""),
+        ("WindowsStorageReplica", 277, """Windows Storage Replica partition."""),
+        ("IBMGPFS", 275, """IBM General Parallel File System (GPFS) partition."""),
+        ("LinuxData", 300, """Linux filesystem data."""),
+        ("LinuxRAID", 301, """Linux RAID partition."""),
+        ("LinuxRootX86", 302, """Linux root partition for x86."""),
+        ("LinuxRootAMD64", 303, """Linux root partition for AMD64."""),
+        ("LinuxRootARM32", 304, """Linux root partition for ARM32."""),
+        ("LinuxRootARM64", 305, """Linux root partition for ARM64 / AArch64."""),
+        ("LinuxHome", 306, """Linux /home partition."""),
+        ("LinuxSrv", 307, """Linux /srv partition."""),
+        ("LinuxPlainDmCrypt", 308, """Linux plain dm-crypt partition."""),
+        ("LinuxLUKS", 309, """Linux unitified key setup (LUKS) partition."""),
+        ("LinuxReserved", 310, """Linux reserved partition."""),
+        ("FreeBSDBoot", 330, """FreeBSD boot partition."""),
+        ("FreeBSDData", 331, """FreeBSD data partition."""),
+        ("FreeBSDSwap", 332, """FreeBSD swap partition."""),
+        ("FreeBSDUFS", 333, """FreeBSD unix file system (UFS) partition."""),
+        ("FreeBSDVinum", 334, """FreeBSD Vinum volume manager partition."""),
+        ("FreeBSDZFS", 335, """FreeBSD ZFS partition."""),
+        ("FreeBSDUnknown", 359, """Unknown FreeBSD partition."""),
+        (
+            "AppleHFSPlus",
+            360,
+            """Apple hierarchical file system plus (HFS+) partition.""",
+        ),
+        ("AppleAPFS", 361, """Apple APFS/FileFault container partition."""),
+        ("AppleRAID", 362, """Apple RAID partition."""),
+        ("AppleRAIDOffline", 363, """Apple RAID partition, offline."""),
+        ("AppleBoot", 364, """Apple boot partition."""),
+        ("AppleLabel", 365, """Apple label."""),
+        ("AppleTvRecovery", 366, """Apple TV recovery partition."""),
+        ("AppleCoreStorage", 367, """Apple Core Storage Containe."""),
+        ("SoftRAIDStatus", 370, """SoftRAID status."""),
+        ("SoftRAIDScratch", 371, """SoftRAID scratch."""),
+        ("SoftRAIDVolume", 372, """SoftRAID volume."""),
+        ("SoftRAIDCache", 373, """SoftRAID cache."""),
+        ("AppleUnknown", 389, """Unknown Apple partition."""),
+        ("SolarisBoot", 390, """Solaris boot partition."""),
+        ("SolarisRoot", 391, """Solaris root partition."""),
+        ("SolarisSwap", 392, """Solaris swap partition."""),
+        ("SolarisBackup", 393, """Solaris backup partition."""),
+        ("SolarisUsr", 394, """Solaris /usr partition."""),
+        ("SolarisVar", 395, """Solaris /var partition."""),
+        ("SolarisHome", 396, """Solaris /home partition."""),
+        ("SolarisAltSector", 397, """Solaris alternate sector."""),
+        ("SolarisReserved", 398, """Solaris reserved partition."""),
+        ("SolarisUnknown", 419, """Unknown Solaris partition."""),
+        ("NetBSDSwap", 420, """NetBSD swap partition."""),
+        ("NetBSDFFS", 421, """NetBSD fast file system (FFS) partition."""),
+        ("NetBSDLFS", 422, """NetBSD log structured file system (LFS) partition."""),
+        ("NetBSDRAID", 423, """NetBSD RAID partition."""),
+        ("NetBSDConcatenated", 424, """NetBSD concatenated partition."""),
+        ("NetBSDEncrypted", 425, """NetBSD encrypted partition."""),
+        ("NetBSDUnknown", 449, """Unknown NetBSD partition."""),
+        ("ChromeOSKernel", 450, """Chrome OS kernel partition."""),
+        ("ChromeOSRootFS", 451, """Chrome OS root file system partition."""),
+        ("ChromeOSFuture", 452, """Chrome OS partition reserved for future."""),
+        ("ContLnxUsr", 480, """Container Linux /usr partition."""),
+        (
+            "ContLnxRoot",
+            481,
+            """Container Linux resizable root filesystem partition.""",
+        ),
+        ("ContLnxReserved", 482, """Container Linux OEM customization partition."""),
+        (
+            "ContLnxRootRAID",
+            483,
+            """Container Linux root filesystem on RAID partition.""",
+        ),
+        ("HaikuBFS", 510, """Haiku BFS"""),
+        ("MidntBSDBoot", 540, """MidnightBSD boot partition."""),
+        ("MidntBSDData", 541, """MidnightBSD data partition."""),
+        ("MidntBSDSwap", 542, """MidnightBSD swap partition."""),
+        ("MidntBSDUFS", 543, """MidnightBSD unix file system (UFS) partition."""),
+        ("MidntBSDVium", 544, """MidnightBSD Vinum volume manager partition."""),
+        ("MidntBSDZFS", 545, """MidnightBSD ZFS partition."""),
+        ("MidntBSDUnknown", 569, """Unknown MidnightBSD partition."""),
+        ("OpenBSDData", 570, """OpenBSD data partition."""),
+        ("QNXPowerSafeFS", 600, """QNX power-safe file system partition."""),
+        ("Plan9", 630, """Plan 9 partition."""),
+        ("VMWareVMKCore", 660, """VMWare ESX coredump partition."""),
+        (
+            "VMWareVMFS",
+            661,
+            """VMWare ESX virtual machine file system (VMFS) partition.""",
+        ),
+        ("VMWareReserved", 662, """VMWare ESX reserved partition."""),
+        ("VMWareUnknown", 689, """Unknown VMWare partition."""),
+        ("AndroidX86Bootloader", 690, """Android x86 bootloader partition."""),
+        ("AndroidX86Bootloader2", 691, """Android x86 bootloader2 partition."""),
+        ("AndroidX86Boot", 692, """Android x86 boot partition."""),
+        ("AndroidX86Recovery", 693, """Android x86 recovery partition."""),
+        ("AndroidX86Misc", 694, """Android x86 misc partition."""),
+        ("AndroidX86Metadata", 695, """Android x86 metadata partition."""),
+        ("AndroidX86System", 696, """Android x86 system partition."""),
+        ("AndroidX86Cache", 697, """Android x86 cache partition."""),
+        ("AndroidX86Data", 698, """Android x86 data partition."""),
+        ("AndroidX86Persistent", 699, """Android x86 persistent data partition."""),
+        ("AndroidX86Vendor", 700, """Android x86 vendor partition."""),
+        ("AndroidX86Config", 701, """Android x86 config partition."""),
+        ("AndroidX86Factory", 702, """Android x86 factory partition."""),
+        ("AndroidX86FactoryAlt", 703, """Android x86 alternative factory partition."""),
+        ("AndroidX86Fastboot", 704, """Android x86 fastboot partition."""),
+        ("AndroidX86OEM", 705, """Android x86 OEM partition."""),
+        ("AndroidARMMeta", 720, """Android ARM meta partition."""),
+        ("AndroidARMExt", 721, """Android ARM EXT partition."""),
+        (
+            "ONIEBoot",
+            750,
+            """Open Network Install Environment (ONIE) boot partition.""",
+        ),
+        (
+            "ONIEConfig",
+            751,
+            """Open Network Install Environment (ONIE) config partition.""",
+        ),
+        ("PowerPCPrep", 780, """PowerPC PReP boot partition."""),
+        (
+            "XDGShrBootConfig",
+            810,
+            """freedesktop.org shared boot loader configuration partition.""",
+        ),
+        ("CephBlock", 830, """Ceph block partition."""),
+        ("CephBlockDB", 831, """Ceph block DB partition."""),
+        ("CephBlockDBDmc", 832, """Ceph dm-crypt block DB partition."""),
+        (
+            "CephBlockDBDmcLUKS",
+            833,
+            """Ceph dm-crypt Linux unitified key setup (LUKS) block DB partition.""",
+        ),
+        ("CephBlockDmc", 834, """Ceph dm-crypt block partition."""),
+        (
+            "CephBlockDmcLUKS",
+            835,
+            """Ceph dm-crypt Linux unitified key setup (LUKS) block partition.""",
+        ),
+        ("CephBlockWALog", 836, """Ceph block write-ahead log partition."""),
+        (
+            "CephBlockWALogDmc",
+            837,
+            """Ceph dm-crypt block write-ahead log partition.""",
+        ),
+        (
+            "CephBlockWALogDmcLUKS",
+            838,
+            """Ceph dm-crypt Linux unitified key setup (LUKS) block write-ahead log partition.""",
+        ),
+        ("CephDisk", 839, """Ceph disk in creation partition."""),
+        ("CephDiskDmc", 840, """Ceph dm-crypt disk in creation partition."""),
+        ("CephJournal", 841, """Ceph Journal partition."""),
+        ("CephJournalDmc", 842, """Ceph dm-crypt journal partition."""),
+        (
+            "CephJournalDmcLUKS",
+            843,
+            """Ceph dm-crypt Linux unitified key setup (LUKS) journal partition.""",
+        ),
+        ("CephLockbox", 844, """Ceph Lockbox for dm-crypt keys partition."""),
+        ("CephMultipathBlock1", 845, """Ceph multipath block 1 partition."""),
+        ("CephMultipathBlock2", 846, """Ceph multipath block 2 partition."""),
+        ("CephMultipathBlockDB", 847, """Ceph multipath block DB partition."""),
+        (
+            "CephMultipathBLockWALog",
+            848,
+            """Ceph multipath block write-ahead log partition.""",
+        ),
+        ("CephMultipathJournal", 849, """Ceph multipath journal partition."""),
+        (
+            "CephMultipathOSD",
+            851,
+            """Ceph multipath object storage deamon (OSD) partition.""",
+        ),
+        ("CephOSD", 852, """Ceph object storage deamon (OSD) partition."""),
+        ("CephOSDDmc", 853, """Ceph dm-crypt object storage deamon (OSD) partition."""),
+        (
+            "CephOSDDmcLUKS",
+            854,
+            """Ceph dm-crypt Linux unitified key setup (LUKS) object storage deamon (OSD) partition.""",
+        ),
+    ]
@@ -0,0 +1,52 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class PathStyle(Enum):
+    """The path style of a system.
+    (Values matches the RTPATH_STR_F_STYLE_XXX defines in iprt/path.h!)
+
+
+    .. describe:: dos(1)
+
+            DOS-style paths with forward and backward slashes, drive
+            letters and UNC.  Known from DOS, OS/2 and Windows.
+
+    .. describe:: unix(2)
+
+            UNIX-style paths with forward slashes only.
+
+    .. describe:: unknown(8)
+
+            The path style is not known, most likely because the Guest Additions
+            aren't active yet.
+
+    """
+
+    __uuid__ = "97303a5b-42e8-0a55-d16f-d2a92c295261"
+    _enums = [
+        (
+            "DOS",
+            1,
+            """DOS-style paths with forward and backward slashes, drive
+            letters and UNC.  Known from DOS, OS/2 and Windows.""",
+        ),
+        ("UNIX", 2, """UNIX-style paths with forward slashes only."""),
+        (
+            "Unknown",
+            8,
+            """The path style is not known, most likely because the Guest Additions
+            aren't active yet.""",
+        ),
+    ]
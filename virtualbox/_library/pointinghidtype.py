@@ -0,0 +1,70 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class PointingHIDType(Enum):
+    """Type of pointing device used in a virtual machine.
+
+
+    .. describe:: none(1)
+
+            No mouse.
+
+    .. describe:: ps2_mouse(2)
+
+            PS/2 auxiliary device, a.k.a. mouse.
+
+    .. describe:: usb_mouse(3)
+
+            USB mouse (relative pointer).
+
+    .. describe:: usb_tablet(4)
+
+            USB tablet (absolute pointer).  Also enables a relative USB mouse in
+            addition.
+
+    .. describe:: combo_mouse(5)
+
+            Combined device, working as PS/2 or USB mouse, depending on guest
+            behavior.  Using this device can have negative performance implications.
+
+    .. describe:: usb_multi_touch(6)
+
+            USB multi-touch device.  Also enables the USB tablet and mouse devices.
+
+    """
+
+    __uuid__ = "19964e93-0050-45c4-9382-a7bccc53e666"
+    _enums = [
+        ("None", 1, """No mouse."""),
+        ("PS2Mouse", 2, """PS/2 auxiliary device, a.k.a. mouse."""),
+        ("USBMouse", 3, """USB mouse (relative pointer)."""),
+        (
+            "USBTablet",
+            4,
+            """USB tablet (absolute pointer).  Also enables a relative USB mouse in
+            addition.""",
+        ),
+        (
+            "ComboMouse",
+            5,
+            """Combined device, working as PS/2 or USB mouse, depending on guest
+            behavior.  Using this device can have negative performance implications.""",
+        ),
+        (
+            "USBMultiTouch",
+            6,
+            """USB multi-touch device.  Also enables the USB tablet and mouse devices.""",
+        ),
+    ]
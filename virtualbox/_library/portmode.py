@@ -0,0 +1,54 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class PortMode(Enum):
+    """The PortMode enumeration represents possible communication modes for
+    the virtual serial port device.
+
+
+    .. describe:: disconnected(0)
+
+            Virtual device is not attached to any real host device.
+
+    .. describe:: host_pipe(1)
+
+            Virtual device is attached to a host pipe.
+
+    .. describe:: host_device(2)
+
+            Virtual device is attached to a host device.
+
+    .. describe:: raw_file(3)
+
+            Virtual device is attached to a raw file.
+
+    .. describe:: tcp(4)
+
+            Virtual device is attached to a TCP socket.
+
+    """
+
+    __uuid__ = "7485fcfd-d603-470a-87af-26d33beb7de9"
+    _enums = [
+        (
+            "Disconnected",
+            0,
+            """Virtual device is not attached to any real host device.""",
+        ),
+        ("HostPipe", 1, """Virtual device is attached to a host pipe."""),
+        ("HostDevice", 2, """Virtual device is attached to a host device."""),
+        ("RawFile", 3, """Virtual device is attached to a raw file."""),
+        ("TCP", 4, """Virtual device is attached to a TCP socket."""),
+    ]
@@ -0,0 +1,120 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class ProcessCreateFlag(Enum):
+    """Guest process execution flags.
+    The values are passed to the Guest Additions, so its not possible
+    to change (move) or reuse values.here. See EXECUTEPROCESSFLAG_XXX
+    in GuestControlSvc.h.
+
+
+    .. describe:: none(0)
+
+            No flag set.
+
+    .. describe:: wait_for_process_start_only(1)
+
+            Only use the specified timeout value to wait for starting the guest process - the guest
+            process itself then uses an infinite timeout.
+
+    .. describe:: ignore_orphaned_processes(2)
+
+            Do not report an error when executed processes are still alive when VBoxService or the guest OS is shutting down.
+
+    .. describe:: hidden(4)
+
+            Do not show the started process according to the guest OS guidelines.
+
+    .. describe:: profile(8)
+
+            Utilize the user's profile data when exeuting a process. Only available for Windows guests at the moment.
+
+    .. describe:: wait_for_std_out(16)
+
+            The guest process waits until all data from stdout is read out.
+
+    .. describe:: wait_for_std_err(32)
+
+            The guest process waits until all data from stderr is read out.
+
+    .. describe:: expand_arguments(64)
+
+            Expands environment variables in process arguments.
+
+            This is not yet implemented and is currently silently ignored.
+            We will document the protocolVersion number for this feature once it
+            appears, so don't use it till then.
+
+    .. describe:: unquoted_arguments(128)
+
+            Work around for Windows and OS/2 applications not following normal
+            argument quoting and escaping rules. The arguments are passed to the
+            application without any extra quoting, just a single space between each.
+            Present since VirtualBox 4.3.28 and 5.0 beta 3.
+
+    """
+
+    __uuid__ = "C544CD2B-F02D-4886-9901-71C523DB8DC5"
+    _enums = [
+        ("None", 0, """No flag set."""),
+        (
+            "WaitForProcessStartOnly",
+            1,
+            """Only use the specified timeout value to wait for starting the guest process - the guest
+            process itself then uses an infinite timeout.""",
+        ),
+        (
+            "IgnoreOrphanedProcesses",
+            2,
+            """Do not report an error when executed processes are still alive when VBoxService or the guest OS is shutting down.""",
+        ),
+        (
+            "Hidden",
+            4,
+            """Do not show the started process according to the guest OS guidelines.""",
+        ),
+        (
+            "Profile",
+            8,
+            """Utilize the user's profile data when exeuting a process. Only available for Windows guests at the moment.""",
+        ),
+        (
+            "WaitForStdOut",
+            16,
+            """The guest process waits until all data from stdout is read out.""",
+        ),
+        (
+            "WaitForStdErr",
+            32,
+            """The guest process waits until all data from stderr is read out.""",
+        ),
+        (
+            "ExpandArguments",
+            64,
+            """Expands environment variables in process arguments.
+            
+            This is not yet implemented and is currently silently ignored.
+            We will document the protocolVersion number for this feature once it
+            appears, so don't use it till then.""",
+        ),
+        (
+            "UnquotedArguments",
+            128,
+            """Work around for Windows and OS/2 applications not following normal
+            argument quoting and escaping rules. The arguments are passed to the
+            application without any extra quoting, just a single space between each.
+            Present since VirtualBox 4.3.28 and 5.0 beta 3.""",
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class ProcessInputFlag(Enum):
+    """Guest process input flags.
+
+
+    .. describe:: none(0)
+
+            No flag set.
+
+    .. describe:: end_of_file(1)
+
+            End of file (input) reached.
+
+    """
+
+    __uuid__ = "5d38c1dd-2604-4ddf-92e5-0c0cdd3bdbd5"
+    _enums = [
+        ("None", 0, """No flag set."""),
+        ("EndOfFile", 1, """End of file (input) reached."""),
+    ]
@@ -0,0 +1,49 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class ProcessInputStatus(Enum):
+    """Process input statuses.
+
+
+    .. describe:: undefined(0)
+
+            Undefined state.
+
+    .. describe:: broken(1)
+
+            Input pipe is broken.
+
+    .. describe:: available(10)
+
+            Input pipe became available for writing.
+
+    .. describe:: written(50)
+
+            Data has been successfully written.
+
+    .. describe:: overflow(100)
+
+            Too much input data supplied, data overflow.
+
+    """
+
+    __uuid__ = "a4a0ef9c-29cc-4805-9803-c8215ae9da6c"
+    _enums = [
+        ("Undefined", 0, """Undefined state."""),
+        ("Broken", 1, """Input pipe is broken."""),
+        ("Available", 10, """Input pipe became available for writing."""),
+        ("Written", 50, """Data has been successfully written."""),
+        ("Overflow", 100, """Too much input data supplied, data overflow."""),
+    ]
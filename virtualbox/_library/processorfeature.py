@@ -0,0 +1,59 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class ProcessorFeature(Enum):
+    """CPU features.
+
+
+    .. describe:: hw_virt_ex(0)
+
+
+
+    .. describe:: pae(1)
+
+
+
+    .. describe:: long_mode(2)
+
+
+
+    .. describe:: nested_paging(3)
+
+
+
+    .. describe:: unrestricted_guest(4)
+
+
+
+    .. describe:: nested_hw_virt(5)
+
+
+
+    .. describe:: virt_vmsave_vmload(6)
+
+
+
+    """
+
+    __uuid__ = "0064dece-000e-4963-00f8-eb9b00674c8a"
+    _enums = [
+        ("HWVirtEx", 0, """"""),
+        ("PAE", 1, """"""),
+        ("LongMode", 2, """"""),
+        ("NestedPaging", 3, """"""),
+        ("UnrestrictedGuest", 4, """"""),
+        ("NestedHWVirt", 5, """"""),
+        ("VirtVmsaveVmload", 6, """"""),
+    ]
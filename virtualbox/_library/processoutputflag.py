@@ -0,0 +1,35 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class ProcessOutputFlag(Enum):
+    """Guest process output flags for specifying which
+    type of output to retrieve.
+
+
+    .. describe:: none(0)
+
+            No flags set. Get output from stdout.
+
+    .. describe:: std_err(1)
+
+            Get output from stderr.
+
+    """
+
+    __uuid__ = "9979e85a-52bb-40b7-870c-57115e27e0f1"
+    _enums = [
+        ("None", 0, """No flags set. Get output from stdout."""),
+        ("StdErr", 1, """Get output from stderr."""),
+    ]
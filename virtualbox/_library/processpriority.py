@@ -0,0 +1,34 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class ProcessPriority(Enum):
+    """Process priorities.
+
+
+    .. describe:: invalid(0)
+
+            Invalid priority, do not use.
+
+    .. describe:: default(1)
+
+            Default process priority determined by the OS.
+
+    """
+
+    __uuid__ = "ee8cac50-e232-49fe-806b-d1214d9c2e49"
+    _enums = [
+        ("Invalid", 0, """Invalid priority, do not use."""),
+        ("Default", 1, """Default process priority determined by the OS."""),
+    ]
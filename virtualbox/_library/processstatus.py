@@ -0,0 +1,88 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class ProcessStatus(Enum):
+    """Process execution statuses.
+
+
+    .. describe:: undefined(0)
+
+            Process is in an undefined state.
+
+    .. describe:: starting(10)
+
+            Process is being started.
+
+    .. describe:: started(100)
+
+            Process has been started.
+
+    .. describe:: paused(110)
+
+            Process has been paused.
+
+    .. describe:: terminating(480)
+
+            Process is being terminated.
+
+    .. describe:: terminated_normally(500)
+
+            Process terminated normally.
+
+    .. describe:: terminated_signal(510)
+
+            Process terminated via signal.
+
+    .. describe:: terminated_abnormally(511)
+
+            Process terminated abnormally.
+
+    .. describe:: timed_out_killed(512)
+
+            Process timed out and was killed.
+
+    .. describe:: timed_out_abnormally(513)
+
+            Process timed out and was not killed successfully.
+
+    .. describe:: down(600)
+
+            Service/OS is stopping, process was killed.
+
+    .. describe:: error(800)
+
+            Something went wrong.
+
+    """
+
+    __uuid__ = "4d52368f-5b48-4bfe-b486-acf89139b52f"
+    _enums = [
+        ("Undefined", 0, """Process is in an undefined state."""),
+        ("Starting", 10, """Process is being started."""),
+        ("Started", 100, """Process has been started."""),
+        ("Paused", 110, """Process has been paused."""),
+        ("Terminating", 480, """Process is being terminated."""),
+        ("TerminatedNormally", 500, """Process terminated normally."""),
+        ("TerminatedSignal", 510, """Process terminated via signal."""),
+        ("TerminatedAbnormally", 511, """Process terminated abnormally."""),
+        ("TimedOutKilled", 512, """Process timed out and was killed."""),
+        (
+            "TimedOutAbnormally",
+            513,
+            """Process timed out and was not killed successfully.""",
+        ),
+        ("Down", 600, """Service/OS is stopping, process was killed."""),
+        ("Error", 800, """Something went wrong."""),
+    ]
@@ -0,0 +1,54 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class ProcessWaitForFlag(Enum):
+    """Process waiting flags.
+
+
+    .. describe:: none(0)
+
+            No waiting flags specified. Do not use this.
+
+    .. describe:: start(1)
+
+            Wait for the process being started.
+
+    .. describe:: terminate(2)
+
+            Wait for the process being terminated.
+
+    .. describe:: std_in(4)
+
+            Wait for stdin becoming available.
+
+    .. describe:: std_out(8)
+
+            Wait for data becoming available on stdout.
+
+    .. describe:: std_err(16)
+
+            Wait for data becoming available on stderr.
+
+    """
+
+    __uuid__ = "23b550c7-78e1-437e-98f0-65fd9757bcd2"
+    _enums = [
+        ("None", 0, """No waiting flags specified. Do not use this."""),
+        ("Start", 1, """Wait for the process being started."""),
+        ("Terminate", 2, """Wait for the process being terminated."""),
+        ("StdIn", 4, """Wait for stdin becoming available."""),
+        ("StdOut", 8, """Wait for data becoming available on stdout."""),
+        ("StdErr", 16, """Wait for data becoming available on stderr."""),
+    ]
@@ -0,0 +1,107 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class ProcessWaitResult(Enum):
+    """Process waiting results. Depending on the process waiting flags (for
+    more information see :py:class:`ProcessWaitForFlag` ) the waiting result
+    can vary based on the processes' current status.
+
+    To wait for a guest process to terminate after it has been
+    created by :py:func:`IGuestSession.process_create`  or :py:func:`IGuestSession.process_create_ex`
+    one would specify ProcessWaitFor_Terminate.
+
+    If a guest process has been started with ProcessCreateFlag_WaitForStdOut
+    a client can wait with ProcessWaitResult_StdOut for new data to arrive on
+    stdout; same applies for ProcessCreateFlag_WaitForStdErr and
+    ProcessWaitResult_StdErr.
+
+
+    .. describe:: none(0)
+
+            No result was returned. Not being used.
+
+    .. describe:: start(1)
+
+            The process has been started.
+
+    .. describe:: terminate(2)
+
+            The process has been terminated.
+
+    .. describe:: status(3)
+
+            The process has changed its status. The status then can
+            be retrieved via :py:func:`IProcess.status` .
+
+    .. describe:: error(4)
+
+            Error while executing the process.
+
+    .. describe:: timeout(5)
+
+            The waiting operation timed out. Also use if the guest process has
+            timed out in the guest side (kill attempted).
+
+    .. describe:: std_in(6)
+
+            The process signalled that stdin became available for writing.
+
+    .. describe:: std_out(7)
+
+            Data on stdout became available for reading.
+
+    .. describe:: std_err(8)
+
+            Data on stderr became available for reading.
+
+    .. describe:: wait_flag_not_supported(9)
+
+            A waiting flag specified in the :py:func:`IProcess.wait_for`  call
+            is not supported by the guest.
+
+    """
+
+    __uuid__ = "40719cbe-f192-4fe9-a231-6697b3c8e2b4"
+    _enums = [
+        ("None", 0, """No result was returned. Not being used."""),
+        ("Start", 1, """The process has been started."""),
+        ("Terminate", 2, """The process has been terminated."""),
+        (
+            "Status",
+            3,
+            """The process has changed its status. The status then can
+            be retrieved via :py:func:`IProcess.status` .""",
+        ),
+        ("Error", 4, """Error while executing the process."""),
+        (
+            "Timeout",
+            5,
+            """The waiting operation timed out. Also use if the guest process has
+            timed out in the guest side (kill attempted).""",
+        ),
+        (
+            "StdIn",
+            6,
+            """The process signalled that stdin became available for writing.""",
+        ),
+        ("StdOut", 7, """Data on stdout became available for reading."""),
+        ("StdErr", 8, """Data on stderr became available for reading."""),
+        (
+            "WaitFlagNotSupported",
+            9,
+            """A waiting flag specified in the :py:func:`IProcess.wait_for`  call
+            is not supported by the guest.""",
+        ),
+    ]
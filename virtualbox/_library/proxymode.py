@@ -0,0 +1,43 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class ProxyMode(Enum):
+    """Proxy setting: System (default), NoProxy and Manual. :py:func:`ISystemProperties.proxy_mode`
+
+
+    .. describe:: system(0)
+
+            Use the system proxy settings as far as possible.
+
+    .. describe:: no_proxy(1)
+
+            Direct connection to the Internet.
+
+    .. describe:: manual(2)
+
+            Use the manual proxy from :py:func:`ISystemProperties.proxy_url` .
+
+    """
+
+    __uuid__ = "885264b3-b517-40fc-ce46-36e3bae895a4"
+    _enums = [
+        ("System", 0, """Use the system proxy settings as far as possible."""),
+        ("NoProxy", 1, """Direct connection to the Internet."""),
+        (
+            "Manual",
+            2,
+            """Use the manual proxy from :py:func:`ISystemProperties.proxy_url` .""",
+        ),
+    ]
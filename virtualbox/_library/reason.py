@@ -0,0 +1,53 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class Reason(Enum):
+    """Internal event reason type.
+
+
+    .. describe:: unspecified(0)
+
+            Null value, means "no known reason".
+
+    .. describe:: host_suspend(1)
+
+            Host is being suspended (power management event).
+
+    .. describe:: host_resume(2)
+
+            Host is being resumed (power management event).
+
+    .. describe:: host_battery_low(3)
+
+            Host is running low on battery (power management event).
+
+    .. describe:: snapshot(4)
+
+            A snapshot of the VM is being taken.
+
+    """
+
+    __uuid__ = "e7e8e097-299d-4e98-8bbc-c31c2d47d0cc"
+    _enums = [
+        ("Unspecified", 0, """Null value, means "no known reason"."""),
+        ("HostSuspend", 1, """Host is being suspended (power management event)."""),
+        ("HostResume", 2, """Host is being resumed (power management event)."""),
+        (
+            "HostBatteryLow",
+            3,
+            """Host is running low on battery (power management event).""",
+        ),
+        ("Snapshot", 4, """A snapshot of the VM is being taken."""),
+    ]
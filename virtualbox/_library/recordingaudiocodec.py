@@ -0,0 +1,45 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class RecordingAudioCodec(Enum):
+    """Recording audio codec enumeration.
+
+
+    .. describe:: none(0)
+
+            No codec set.
+
+    .. describe:: wav_pcm(1)
+
+            WAV format, linear PCM, uncompressed.
+            Not implemented yet.
+
+    .. describe:: opus(2)
+
+            Opus Audio.
+
+    """
+
+    __uuid__ = "0AEFF775-053A-42F8-9C00-E445107DBED8"
+    _enums = [
+        ("None", 0, """No codec set."""),
+        (
+            "WavPCM",
+            1,
+            """WAV format, linear PCM, uncompressed.
+            Not implemented yet.""",
+        ),
+        ("Opus", 2, """Opus Audio."""),
+    ]
@@ -0,0 +1,34 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class RecordingDestination(Enum):
+    """Recording destination enumeration.
+
+
+    .. describe:: none(0)
+
+            No destination.
+
+    .. describe:: file_p(1)
+
+            Destination is a regular file.
+
+    """
+
+    __uuid__ = "11E3F06B-DEC1-48B9-BDC4-1E618D72893C"
+    _enums = [
+        ("None", 0, """No destination."""),
+        ("File", 1, """Destination is a regular file."""),
+    ]
@@ -0,0 +1,39 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class RecordingFeature(Enum):
+    """Recording features enumeration.
+
+
+    .. describe:: none(0)
+
+            No feature set.
+
+    .. describe:: video(1)
+
+            Video recording.
+
+    .. describe:: audio(2)
+
+            Audio recording.
+
+    """
+
+    __uuid__ = "A7DDC6A5-DAA8-4485-B860-E9F2E98A7794"
+    _enums = [
+        ("None", 0, """No feature set."""),
+        ("Video", 1, """Video recording."""),
+        ("Audio", 2, """Audio recording."""),
+    ]
@@ -0,0 +1,44 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class RecordingVideoCodec(Enum):
+    """Recording video codec enumeration.
+
+
+    .. describe:: none(0)
+
+            No codec set.
+
+    .. describe:: vp8(1)
+
+            VP8 codec.
+
+    .. describe:: vp9(2)
+
+            VP9 codec. Not implemented yet.
+
+    .. describe:: av1(3)
+
+            AV1 codec. Not implemented yet.
+
+    """
+
+    __uuid__ = "663BFC39-AFFF-49FA-98DD-322A857E877B"
+    _enums = [
+        ("None", 0, """No codec set."""),
+        ("VP8", 1, """VP8 codec."""),
+        ("VP9", 2, """VP9 codec. Not implemented yet."""),
+        ("AV1", 3, """AV1 codec. Not implemented yet."""),
+    ]
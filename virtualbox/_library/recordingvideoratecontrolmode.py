@@ -0,0 +1,34 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class RecordingVideoRateControlMode(Enum):
+    """Recording video rate control mode enumeration.
+
+
+    .. describe:: cbr(0)
+
+            Constant bit rate (CBR).
+
+    .. describe:: vbr(1)
+
+            Variable bit rate (VBR). Not yet implemented.
+
+    """
+
+    __uuid__ = "D4EFB692-9F98-4112-88D3-A16FBE2BF6A8"
+    _enums = [
+        ("CBR", 0, """Constant bit rate (CBR)."""),
+        ("VBR", 1, """Variable bit rate (VBR). Not yet implemented."""),
+    ]
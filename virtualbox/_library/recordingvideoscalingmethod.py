@@ -0,0 +1,62 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class RecordingVideoScalingMethod(Enum):
+    """Recording video scaling method enumeration.
+
+
+    .. describe:: none(0)
+
+            No scaling performed.
+
+    .. describe:: nearest_neighbor(1)
+
+            Performs scaling via nearest-neighbor interpolation.
+            Not yet implemented.
+
+    .. describe:: bilinear(2)
+
+            Performs scaling via bilinear interpolation.
+            Not yet implemented.
+
+    .. describe:: bicubic(3)
+
+            Performs scaling via bicubic interpolation.
+            Not yet implemented.
+
+    """
+
+    __uuid__ = "5576D890-48EE-449A-A81B-B776233598B7"
+    _enums = [
+        ("None", 0, """No scaling performed."""),
+        (
+            "NearestNeighbor",
+            1,
+            """Performs scaling via nearest-neighbor interpolation.
+            Not yet implemented.""",
+        ),
+        (
+            "Bilinear",
+            2,
+            """Performs scaling via bilinear interpolation.
+            Not yet implemented.""",
+        ),
+        (
+            "Bicubic",
+            3,
+            """Performs scaling via bicubic interpolation.
+            Not yet implemented.""",
+        ),
+    ]
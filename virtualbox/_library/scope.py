@@ -0,0 +1,42 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class Scope(Enum):
+    """Scope of the operation.
+
+    A generic enumeration used in various methods to define the action or
+    argument scope.
+
+
+    .. describe:: global_p(0)
+
+
+
+    .. describe:: machine(1)
+
+
+
+    .. describe:: session(2)
+
+
+
+    """
+
+    __uuid__ = "7c91096e-499e-4eca-9f9b-9001438d7855"
+    _enums = [
+        ("Global", 0, """"""),
+        ("Machine", 1, """"""),
+        ("Session", 2, """"""),
+    ]
@@ -0,0 +1,64 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class ScreenLayoutMode(Enum):
+    """How :py:func:`IDisplay.set_screen_layout`  method should work.
+
+
+    .. describe:: apply_p(0)
+
+            If the guest is already at desired mode then the API might avoid setting the mode.
+
+    .. describe:: reset(1)
+
+            Always set the new mode even if the guest is already at desired mode.
+
+    .. describe:: attach(2)
+
+            Attach new screens and always set the new mode for existing screens.
+
+    .. describe:: silent(3)
+
+            Do not notify the guest of the change.  Normally this is wished, but it
+            might not be when re-setting monitor information from the last session
+            (no hotplug happened, as it is still the same virtual monitor).
+
+    """
+
+    __uuid__ = "8fa1964c-8774-11e9-ae5d-1f419105e68d"
+    _enums = [
+        (
+            "Apply",
+            0,
+            """If the guest is already at desired mode then the API might avoid setting the mode.""",
+        ),
+        (
+            "Reset",
+            1,
+            """Always set the new mode even if the guest is already at desired mode.""",
+        ),
+        (
+            "Attach",
+            2,
+            """Attach new screens and always set the new mode for existing screens.""",
+        ),
+        (
+            "Silent",
+            3,
+            """Do not notify the guest of the change.  Normally this is wished, but it
+            might not be when re-setting monitor information from the last session
+            (no hotplug happened, as it is still the same virtual monitor).""",
+        ),
+    ]
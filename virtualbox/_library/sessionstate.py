@@ -0,0 +1,91 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class SessionState(Enum):
+    """Session state. This enumeration represents possible values of
+    :py:func:`IMachine.session_state`  and :py:func:`ISession.state`
+    attributes.
+
+
+    .. describe:: null(0)
+
+            Null value (never used by the API).
+
+    .. describe:: unlocked(1)
+
+            In :py:func:`IMachine.session_state` , this means that the machine
+            is not locked for any sessions.
+
+            In :py:func:`ISession.state` , this means that no machine is
+            currently locked for this session.
+
+    .. describe:: locked(2)
+
+            In :py:func:`IMachine.session_state` , this means that the machine
+            is currently locked for a session, whose process identifier can
+            then be found in the :py:func:`IMachine.session_pid`  attribute.
+
+            In :py:func:`ISession.state` , this means that a machine is
+            currently locked for this session, and the mutable machine object
+            can be found in the :py:func:`ISession.machine`  attribute
+            (see :py:func:`IMachine.lock_machine`  for details).
+
+    .. describe:: spawning(3)
+
+            A new process is being spawned for the machine as a result of
+            :py:func:`IMachine.launch_vm_process`  call. This state also occurs
+            as a short transient state during an :py:func:`IMachine.lock_machine`
+            call.
+
+    .. describe:: unlocking(4)
+
+            The session is being unlocked.
+
+    """
+
+    __uuid__ = "cf2700c0-ea4b-47ae-9725-7810114b94d8"
+    _enums = [
+        ("Null", 0, """Null value (never used by the API)."""),
+        (
+            "Unlocked",
+            1,
+            """In :py:func:`IMachine.session_state` , this means that the machine
+            is not locked for any sessions.
+            
+            In :py:func:`ISession.state` , this means that no machine is
+            currently locked for this session.""",
+        ),
+        (
+            "Locked",
+            2,
+            """In :py:func:`IMachine.session_state` , this means that the machine
+            is currently locked for a session, whose process identifier can
+            then be found in the :py:func:`IMachine.session_pid`  attribute.
+            
+            In :py:func:`ISession.state` , this means that a machine is
+            currently locked for this session, and the mutable machine object
+            can be found in the :py:func:`ISession.machine`  attribute
+            (see :py:func:`IMachine.lock_machine`  for details).""",
+        ),
+        (
+            "Spawning",
+            3,
+            """A new process is being spawned for the machine as a result of
+            :py:func:`IMachine.launch_vm_process`  call. This state also occurs
+            as a short transient state during an :py:func:`IMachine.lock_machine` 
+            call.""",
+        ),
+        ("Unlocking", 4, """The session is being unlocked."""),
+    ]
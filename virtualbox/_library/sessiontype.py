@@ -0,0 +1,63 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class SessionType(Enum):
+    """Session type. This enumeration represents possible values of the
+    :py:func:`ISession.type_p`  attribute.
+
+
+    .. describe:: null(0)
+
+            Null value (never used by the API).
+
+    .. describe:: write_lock(1)
+
+            Session has acquired an exclusive write lock on a machine
+            using :py:func:`IMachine.lock_machine` .
+
+    .. describe:: remote(2)
+
+            Session has launched a VM process using
+            :py:func:`IMachine.launch_vm_process`
+
+    .. describe:: shared(3)
+
+            Session has obtained a link to another session using
+            :py:func:`IMachine.lock_machine`
+
+    """
+
+    __uuid__ = "A13C02CB-0C2C-421E-8317-AC0E8AAA153A"
+    _enums = [
+        ("Null", 0, """Null value (never used by the API)."""),
+        (
+            "WriteLock",
+            1,
+            """Session has acquired an exclusive write lock on a machine
+            using :py:func:`IMachine.lock_machine` .""",
+        ),
+        (
+            "Remote",
+            2,
+            """Session has launched a VM process using
+            :py:func:`IMachine.launch_vm_process` """,
+        ),
+        (
+            "Shared",
+            3,
+            """Session has obtained a link to another session using
+            :py:func:`IMachine.lock_machine` """,
+        ),
+    ]
@@ -0,0 +1,160 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class SettingsVersion(Enum):
+    """Settings version of VirtualBox settings files. This is written to
+    the "version" attribute of the root "VirtualBox" element in the settings
+    file XML and indicates which VirtualBox version wrote the file.
+
+
+    .. describe:: null(0)
+
+            Null value, indicates invalid version.
+
+    .. describe:: v1_0(1)
+
+            Legacy settings version, not currently supported.
+
+    .. describe:: v1_1(2)
+
+            Legacy settings version, not currently supported.
+
+    .. describe:: v1_2(3)
+
+            Legacy settings version, not currently supported.
+
+    .. describe:: v1_3pre(4)
+
+            Legacy settings version, not currently supported.
+
+    .. describe:: v1_3(5)
+
+            Settings version "1.3", written by VirtualBox 2.0.12.
+
+    .. describe:: v1_4(6)
+
+            Intermediate settings version, understood by VirtualBox 2.1.x.
+
+    .. describe:: v1_5(7)
+
+            Intermediate settings version, understood by VirtualBox 2.1.x.
+
+    .. describe:: v1_6(8)
+
+            Settings version "1.6", written by VirtualBox 2.1.4 (at least).
+
+    .. describe:: v1_7(9)
+
+            Settings version "1.7", written by VirtualBox 2.2.x and 3.0.x.
+
+    .. describe:: v1_8(10)
+
+            Intermediate settings version "1.8", understood by VirtualBox 3.1.x.
+
+    .. describe:: v1_9(11)
+
+            Settings version "1.9", written by VirtualBox 3.1.x.
+
+    .. describe:: v1_10(12)
+
+            Settings version "1.10", written by VirtualBox 3.2.x.
+
+    .. describe:: v1_11(13)
+
+            Settings version "1.11", written by VirtualBox 4.0.x.
+
+    .. describe:: v1_12(14)
+
+            Settings version "1.12", written by VirtualBox 4.1.x.
+
+    .. describe:: v1_13(15)
+
+            Settings version "1.13", written by VirtualBox 4.2.x.
+
+    .. describe:: v1_14(16)
+
+            Settings version "1.14", written by VirtualBox 4.3.x.
+
+    .. describe:: v1_15(17)
+
+            Settings version "1.15", written by VirtualBox 5.0.x.
+
+    .. describe:: v1_16(18)
+
+            Settings version "1.16", written by VirtualBox 5.1.x.
+
+    .. describe:: v1_17(19)
+
+            Settings version "1.17", written by VirtualBox 6.0.x.
+
+    .. describe:: v1_18(20)
+
+            Settings version "1.18", written by VirtualBox 6.1.x.
+
+    .. describe:: future(99999)
+
+            Settings version greater than "1.15", written by a future VirtualBox version.
+
+    """
+
+    __uuid__ = "b4cc23c2-96f2-419d-830b-bd13c1135dfb"
+    _enums = [
+        ("Null", 0, """Null value, indicates invalid version."""),
+        ("v1_0", 1, """Legacy settings version, not currently supported."""),
+        ("v1_1", 2, """Legacy settings version, not currently supported."""),
+        ("v1_2", 3, """Legacy settings version, not currently supported."""),
+        ("v1_3pre", 4, """Legacy settings version, not currently supported."""),
+        ("v1_3", 5, """Settings version "1.3", written by VirtualBox 2.0.12."""),
+        (
+            "v1_4",
+            6,
+            """Intermediate settings version, understood by VirtualBox 2.1.x.""",
+        ),
+        (
+            "v1_5",
+            7,
+            """Intermediate settings version, understood by VirtualBox 2.1.x.""",
+        ),
+        (
+            "v1_6",
+            8,
+            """Settings version "1.6", written by VirtualBox 2.1.4 (at least).""",
+        ),
+        (
+            "v1_7",
+            9,
+            """Settings version "1.7", written by VirtualBox 2.2.x and 3.0.x.""",
+        ),
+        (
+            "v1_8",
+            10,
+            """Intermediate settings version "1.8", understood by VirtualBox 3.1.x.""",
+        ),
+        ("v1_9", 11, """Settings version "1.9", written by VirtualBox 3.1.x."""),
+        ("v1_10", 12, """Settings version "1.10", written by VirtualBox 3.2.x."""),
+        ("v1_11", 13, """Settings version "1.11", written by VirtualBox 4.0.x."""),
+        ("v1_12", 14, """Settings version "1.12", written by VirtualBox 4.1.x."""),
+        ("v1_13", 15, """Settings version "1.13", written by VirtualBox 4.2.x."""),
+        ("v1_14", 16, """Settings version "1.14", written by VirtualBox 4.3.x."""),
+        ("v1_15", 17, """Settings version "1.15", written by VirtualBox 5.0.x."""),
+        ("v1_16", 18, """Settings version "1.16", written by VirtualBox 5.1.x."""),
+        ("v1_17", 19, """Settings version "1.17", written by VirtualBox 6.0.x."""),
+        ("v1_18", 20, """Settings version "1.18", written by VirtualBox 6.1.x."""),
+        (
+            "Future",
+            99999,
+            """Settings version greater than "1.15", written by a future VirtualBox version.""",
+        ),
+    ]
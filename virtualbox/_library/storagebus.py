@@ -0,0 +1,70 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class StorageBus(Enum):
+    """The bus type of the storage controller (IDE, SATA, SCSI, SAS or Floppy);
+    see :py:func:`IStorageController.bus` .
+
+
+    .. describe:: null(0)
+
+            @c null value. Never used by the API.
+
+    .. describe:: ide(1)
+
+
+
+    .. describe:: sata(2)
+
+
+
+    .. describe:: scsi(3)
+
+
+
+    .. describe:: floppy(4)
+
+
+
+    .. describe:: sas(5)
+
+
+
+    .. describe:: usb(6)
+
+
+
+    .. describe:: pc_ie(7)
+
+
+
+    .. describe:: virtio_scsi(8)
+
+
+
+    """
+
+    __uuid__ = "f9510869-7d07-46ba-96a6-6728fbf4adee"
+    _enums = [
+        ("Null", 0, """@c null value. Never used by the API."""),
+        ("IDE", 1, """"""),
+        ("SATA", 2, """"""),
+        ("SCSI", 3, """"""),
+        ("Floppy", 4, """"""),
+        ("SAS", 5, """"""),
+        ("USB", 6, """"""),
+        ("PCIe", 7, """"""),
+        ("VirtioSCSI", 8, """"""),
+    ]
@@ -0,0 +1,93 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class StorageControllerType(Enum):
+    """The exact variant of storage controller hardware presented
+    to the guest; see :py:func:`IStorageController.controller_type` .
+
+
+    .. describe:: null(0)
+
+            @c null value. Never used by the API.
+
+    .. describe:: lsi_logic(1)
+
+            A SCSI controller of the LsiLogic variant.
+
+    .. describe:: bus_logic(2)
+
+            A SCSI controller of the BusLogic variant.
+
+    .. describe:: intel_ahci(3)
+
+            An Intel AHCI SATA controller; this is the only variant for SATA.
+
+    .. describe:: piix3(4)
+
+            An IDE controller of the PIIX3 variant.
+
+    .. describe:: piix4(5)
+
+            An IDE controller of the PIIX4 variant.
+
+    .. describe:: ich6(6)
+
+            An IDE controller of the ICH6 variant.
+
+    .. describe:: i82078(7)
+
+            A floppy disk controller; this is the only variant for floppy drives.
+
+    .. describe:: lsi_logic_sas(8)
+
+            A variant of the LsiLogic controller using SAS.
+
+    .. describe:: usb(9)
+
+            Special USB based storage controller.
+
+    .. describe:: nv_me(10)
+
+            An NVMe storage controller.
+
+    .. describe:: virtio_scsi(11)
+
+            Virtio SCSI storage controller.
+
+    """
+
+    __uuid__ = "a77d457d-66a3-4368-b24c-293d0f562a9f"
+    _enums = [
+        ("Null", 0, """@c null value. Never used by the API."""),
+        ("LsiLogic", 1, """A SCSI controller of the LsiLogic variant."""),
+        ("BusLogic", 2, """A SCSI controller of the BusLogic variant."""),
+        (
+            "IntelAhci",
+            3,
+            """An Intel AHCI SATA controller; this is the only variant for SATA.""",
+        ),
+        ("PIIX3", 4, """An IDE controller of the PIIX3 variant."""),
+        ("PIIX4", 5, """An IDE controller of the PIIX4 variant."""),
+        ("ICH6", 6, """An IDE controller of the ICH6 variant."""),
+        (
+            "I82078",
+            7,
+            """A floppy disk controller; this is the only variant for floppy drives.""",
+        ),
+        ("LsiLogicSas", 8, """A variant of the LsiLogic controller using SAS."""),
+        ("USB", 9, """Special USB based storage controller."""),
+        ("NVMe", 10, """An NVMe storage controller."""),
+        ("VirtioSCSI", 11, """Virtio SCSI storage controller."""),
+    ]
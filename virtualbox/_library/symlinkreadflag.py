@@ -0,0 +1,34 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class SymlinkReadFlag(Enum):
+    """Symbolic link reading flags.
+
+
+    .. describe:: none(0)
+
+            No flags set.
+
+    .. describe:: no_symlinks(1)
+
+            Don't allow symbolic links as part of the path.
+
+    """
+
+    __uuid__ = "b7fe2b9d-790e-4b25-8adf-1ca33026931f"
+    _enums = [
+        ("None", 0, """No flags set."""),
+        ("NoSymlinks", 1, """Don't allow symbolic links as part of the path."""),
+    ]
@@ -0,0 +1,44 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class SymlinkType(Enum):
+    """Symbolic link types.  This is significant when creating links on the
+    Windows platform, ignored elsewhere.
+
+
+    .. describe:: unknown(0)
+
+            It is not known what is being targeted.
+
+    .. describe:: directory(1)
+
+            The link targets a directory.
+
+    .. describe:: file_p(2)
+
+            The link targets a file (or whatever else except directories).
+
+    """
+
+    __uuid__ = "37794668-f8f1-4714-98a5-6f8fa2ed0118"
+    _enums = [
+        ("Unknown", 0, """It is not known what is being targeted."""),
+        ("Directory", 1, """The link targets a directory."""),
+        (
+            "File",
+            2,
+            """The link targets a file (or whatever else except directories).""",
+        ),
+    ]
@@ -0,0 +1,48 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class TouchContactState(Enum):
+    """Touch event contact state.
+
+
+    .. describe:: none(0)
+
+            The touch has finished.
+
+    .. describe:: in_contact(1)
+
+            Whether the touch is really touching the device.
+
+    .. describe:: in_range(2)
+
+            Whether the touch is close enough to the device to be detected.
+
+    .. describe:: contact_state_mask(3)
+
+
+
+    """
+
+    __uuid__ = "3f942686-2506-421c-927c-90d4b45f4a38"
+    _enums = [
+        ("None", 0, """The touch has finished."""),
+        ("InContact", 1, """Whether the touch is really touching the device."""),
+        (
+            "InRange",
+            2,
+            """Whether the touch is close enough to the device to be detected.""",
+        ),
+        ("ContactStateMask", 3, """"""),
+    ]
@@ -0,0 +1,55 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class UartType(Enum):
+    """The UART type represents the emulated UART chip for the serial port device.
+
+
+    .. describe:: u16450(0)
+
+            The most basic emulated UART which doesn't support FIFO operation.
+
+    .. describe:: u16550_a(1)
+
+            The successor of the 16450 UART introducing a 16 byte FIFO to reduce
+            operational overhead.
+
+    .. describe:: u16750(2)
+
+            This UART developed by Texas Instruments introduced a 64 byte FIFO
+            and hardware flow control.
+
+    """
+
+    __uuid__ = "c8899d39-0b90-4265-9d02-1e38bd4d1b39"
+    _enums = [
+        (
+            "U16450",
+            0,
+            """The most basic emulated UART which doesn't support FIFO operation.""",
+        ),
+        (
+            "U16550A",
+            1,
+            """The successor of the 16450 UART introducing a 16 byte FIFO to reduce
+            operational overhead.""",
+        ),
+        (
+            "U16750",
+            2,
+            """This UART developed by Texas Instruments introduced a 64 byte FIFO
+            and hardware flow control.""",
+        ),
+    ]
@@ -0,0 +1,44 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class UpdateCheckType(Enum):
+    """Which type of software to check whether a new version exists.
+
+
+    .. describe:: none(0)
+
+            No flags specified. Do not use this.
+
+    .. describe:: virtual_box(1)
+
+
+
+    .. describe:: extension_pack(2)
+
+
+
+    .. describe:: guest_additions(3)
+
+
+
+    """
+
+    __uuid__ = "ac34bb91-6739-4791-b30f-ce84e57928bb"
+    _enums = [
+        ("None", 0, """No flags specified. Do not use this."""),
+        ("VirtualBox", 1, """"""),
+        ("ExtensionPack", 2, """"""),
+        ("GuestAdditions", 3, """"""),
+    ]
@@ -0,0 +1,65 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class USBConnectionSpeed(Enum):
+    """USB device/port speed state. This enumeration represents speeds at
+    which a USB device can communicate with the host.
+
+    The speed is a function of both the device itself and the port which
+    it is attached to, including hubs and cables in the path.
+
+
+    Due to differences in USB stack implementations on various hosts,
+    the reported speed may not exactly match the actual speed.
+
+
+    :py:class:`IHostUSBDevice`
+
+
+    .. describe:: null(0)
+
+            @c null value. Never returned by the API.
+
+    .. describe:: low(1)
+
+            Low speed, 1.5 Mbps.
+
+    .. describe:: full(2)
+
+            Full speed, 12 Mbps.
+
+    .. describe:: high(3)
+
+            High speed, 480 Mbps.
+
+    .. describe:: super_p(4)
+
+            SuperSpeed, 5 Gbps.
+
+    .. describe:: super_plus(5)
+
+            SuperSpeedPlus, 10 Gbps.
+
+    """
+
+    __uuid__ = "d2915840-ea26-4fb4-b72a-21eaf6b888ff"
+    _enums = [
+        ("Null", 0, """@c null value. Never returned by the API."""),
+        ("Low", 1, """Low speed, 1.5 Mbps."""),
+        ("Full", 2, """Full speed, 12 Mbps."""),
+        ("High", 3, """High speed, 480 Mbps."""),
+        ("Super", 4, """SuperSpeed, 5 Gbps."""),
+        ("SuperPlus", 5, """SuperSpeedPlus, 10 Gbps."""),
+    ]
@@ -0,0 +1,49 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class USBControllerType(Enum):
+    """The USB controller type. :py:func:`IUSBController.type_p` .
+
+
+    .. describe:: null(0)
+
+            @c null value. Never used by the API.
+
+    .. describe:: ohci(1)
+
+
+
+    .. describe:: ehci(2)
+
+
+
+    .. describe:: xhci(3)
+
+
+
+    .. describe:: last(4)
+
+            Last element (invalid). Used for parameter checks.
+
+    """
+
+    __uuid__ = "8fdd1c6a-5412-41da-ab07-7baed7d6e18e"
+    _enums = [
+        ("Null", 0, """@c null value. Never used by the API."""),
+        ("OHCI", 1, """"""),
+        ("EHCI", 2, """"""),
+        ("XHCI", 3, """"""),
+        ("Last", 4, """Last element (invalid). Used for parameter checks."""),
+    ]
@@ -0,0 +1,40 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class USBDeviceFilterAction(Enum):
+    """Actions for host USB device filters.
+    :py:class:`IHostUSBDeviceFilter` , :py:class:`USBDeviceState`
+
+
+    .. describe:: null(0)
+
+            Null value (never used by the API).
+
+    .. describe:: ignore(1)
+
+            Ignore the matched USB device.
+
+    .. describe:: hold(2)
+
+            Hold the matched USB device.
+
+    """
+
+    __uuid__ = "cbc30a49-2f4e-43b5-9da6-121320475933"
+    _enums = [
+        ("Null", 0, """Null value (never used by the API)."""),
+        ("Ignore", 1, """Ignore the matched USB device."""),
+        ("Hold", 2, """Hold the matched USB device."""),
+    ]
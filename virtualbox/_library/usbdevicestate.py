@@ -0,0 +1,116 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class USBDeviceState(Enum):
+    """USB device state. This enumeration represents all possible states
+    of the USB device physically attached to the host computer regarding
+    its state on the host computer and availability to guest computers
+    (all currently running virtual machines).
+
+    Once a supported USB device is attached to the host, global USB
+    filters (:py:func:`IHost.usb_device_filters` ) are activated. They can
+    either ignore the device, or put it to USBDeviceState_Held state, or do
+    nothing. Unless the device is ignored by global filters, filters of all
+    currently running guests (:py:func:`IUSBDeviceFilters.device_filters` ) are
+    activated that can put it to USBDeviceState_Captured state.
+
+    If the device was ignored by global filters, or didn't match
+    any filters at all (including guest ones), it is handled by the host
+    in a normal way. In this case, the device state is determined by
+    the host and can be one of USBDeviceState_Unavailable, USBDeviceState_Busy
+    or USBDeviceState_Available, depending on the current device usage.
+
+    Besides auto-capturing based on filters, the device can be manually
+    captured by guests (:py:func:`IConsole.attach_usb_device` ) if its
+    state is USBDeviceState_Busy, USBDeviceState_Available or
+    USBDeviceState_Held.
+
+
+    Due to differences in USB stack implementations in Linux and Win32,
+    states USBDeviceState_Busy and USBDeviceState_Unavailable are applicable
+    only to the Linux version of the product. This also means that (:py:func:`IConsole.attach_usb_device` ) can only succeed on Win32 if the
+    device state is USBDeviceState_Held.
+
+
+    :py:class:`IHostUSBDevice` , :py:class:`IHostUSBDeviceFilter`
+
+
+    .. describe:: not_supported(0)
+
+            Not supported by the VirtualBox server, not available to guests.
+
+    .. describe:: unavailable(1)
+
+            Being used by the host computer exclusively,
+            not available to guests.
+
+    .. describe:: busy(2)
+
+            Being used by the host computer, potentially available to guests.
+
+    .. describe:: available(3)
+
+            Not used by the host computer, available to guests (the host computer
+            can also start using the device at any time).
+
+    .. describe:: held(4)
+
+            Held by the VirtualBox server (ignored by the host computer),
+            available to guests.
+
+    .. describe:: captured(5)
+
+            Captured by one of the guest computers, not available
+            to anybody else.
+
+    """
+
+    __uuid__ = "b99a2e65-67fb-4882-82fd-f3e5e8193ab4"
+    _enums = [
+        (
+            "NotSupported",
+            0,
+            """Not supported by the VirtualBox server, not available to guests.""",
+        ),
+        (
+            "Unavailable",
+            1,
+            """Being used by the host computer exclusively,
+            not available to guests.""",
+        ),
+        (
+            "Busy",
+            2,
+            """Being used by the host computer, potentially available to guests.""",
+        ),
+        (
+            "Available",
+            3,
+            """Not used by the host computer, available to guests (the host computer
+            can also start using the device at any time).""",
+        ),
+        (
+            "Held",
+            4,
+            """Held by the VirtualBox server (ignored by the host computer),
+            available to guests.""",
+        ),
+        (
+            "Captured",
+            5,
+            """Captured by one of the guest computers, not available
+            to anybody else.""",
+        ),
+    ]
@@ -0,0 +1,805 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class VBoxEventType(Enum):
+    """Type of an event.
+    See :py:class:`IEvent`  for an introduction to VirtualBox event handling.
+
+
+    .. describe:: invalid(0)
+
+            Invalid event, must be first.
+
+    .. describe:: any_p(1)
+
+            Wildcard for all events.
+            Events of this type are never delivered, and only used in
+            :py:func:`IEventSource.register_listener`  call to simplify registration.
+
+    .. describe:: vetoable(2)
+
+            Wildcard for all vetoable events. Events of this type are never delivered, and only
+            used in :py:func:`IEventSource.register_listener`  call to simplify registration.
+
+    .. describe:: machine_event(3)
+
+            Wildcard for all machine events. Events of this type are never delivered, and only used in
+            :py:func:`IEventSource.register_listener`  call to simplify registration.
+
+    .. describe:: snapshot_event(4)
+
+            Wildcard for all snapshot events. Events of this type are never delivered, and only used in
+            :py:func:`IEventSource.register_listener`  call to simplify registration.
+
+    .. describe:: input_event(5)
+
+            Wildcard for all input device (keyboard, mouse) events.
+            Events of this type are never delivered, and only used in
+            :py:func:`IEventSource.register_listener`  call to simplify registration.
+
+    .. describe:: last_wildcard(31)
+
+            Last wildcard.
+
+    .. describe:: on_machine_state_changed(32)
+
+            See :py:class:`IMachineStateChangedEvent` IMachineStateChangedEvent.
+
+    .. describe:: on_machine_data_changed(33)
+
+            See :py:class:`IMachineDataChangedEvent` IMachineDataChangedEvent.
+
+    .. describe:: on_extra_data_changed(34)
+
+            See :py:class:`IExtraDataChangedEvent` IExtraDataChangedEvent.
+
+    .. describe:: on_extra_data_can_change(35)
+
+            See :py:class:`IExtraDataCanChangeEvent` IExtraDataCanChangeEvent.
+
+    .. describe:: on_medium_registered(36)
+
+            See :py:class:`IMediumRegisteredEvent` IMediumRegisteredEvent.
+
+    .. describe:: on_machine_registered(37)
+
+            See :py:class:`IMachineRegisteredEvent` IMachineRegisteredEvent.
+
+    .. describe:: on_session_state_changed(38)
+
+            See :py:class:`ISessionStateChangedEvent` ISessionStateChangedEvent.
+
+    .. describe:: on_snapshot_taken(39)
+
+            See :py:class:`ISnapshotTakenEvent` ISnapshotTakenEvent.
+
+    .. describe:: on_snapshot_deleted(40)
+
+            See :py:class:`ISnapshotDeletedEvent` ISnapshotDeletedEvent.
+
+    .. describe:: on_snapshot_changed(41)
+
+            See :py:class:`ISnapshotChangedEvent` ISnapshotChangedEvent.
+
+    .. describe:: on_guest_property_changed(42)
+
+            See :py:class:`IGuestPropertyChangedEvent` IGuestPropertyChangedEvent.
+
+    .. describe:: on_mouse_pointer_shape_changed(43)
+
+            See :py:class:`IMousePointerShapeChangedEvent` IMousePointerShapeChangedEvent.
+
+    .. describe:: on_mouse_capability_changed(44)
+
+            See :py:class:`IMouseCapabilityChangedEvent` IMouseCapabilityChangedEvent.
+
+    .. describe:: on_keyboard_leds_changed(45)
+
+            See :py:class:`IKeyboardLedsChangedEvent` IKeyboardLedsChangedEvent.
+
+    .. describe:: on_state_changed(46)
+
+            See :py:class:`IStateChangedEvent` IStateChangedEvent.
+
+    .. describe:: on_additions_state_changed(47)
+
+            See :py:class:`IAdditionsStateChangedEvent` IAdditionsStateChangedEvent.
+
+    .. describe:: on_network_adapter_changed(48)
+
+            See :py:class:`INetworkAdapterChangedEvent` INetworkAdapterChangedEvent.
+
+    .. describe:: on_serial_port_changed(49)
+
+            See :py:class:`ISerialPortChangedEvent` ISerialPortChangedEvent.
+
+    .. describe:: on_parallel_port_changed(50)
+
+            See :py:class:`IParallelPortChangedEvent` IParallelPortChangedEvent.
+
+    .. describe:: on_storage_controller_changed(51)
+
+            See :py:class:`IStorageControllerChangedEvent` IStorageControllerChangedEvent.
+
+    .. describe:: on_medium_changed(52)
+
+            See :py:class:`IMediumChangedEvent` IMediumChangedEvent.
+
+    .. describe:: on_vrde_server_changed(53)
+
+            See :py:class:`IVRDEServerChangedEvent` IVRDEServerChangedEvent.
+
+    .. describe:: on_usb_controller_changed(54)
+
+            See :py:class:`IUSBControllerChangedEvent` IUSBControllerChangedEvent.
+
+    .. describe:: on_usb_device_state_changed(55)
+
+            See :py:class:`IUSBDeviceStateChangedEvent` IUSBDeviceStateChangedEvent.
+
+    .. describe:: on_shared_folder_changed(56)
+
+            See :py:class:`ISharedFolderChangedEvent` ISharedFolderChangedEvent.
+
+    .. describe:: on_runtime_error(57)
+
+            See :py:class:`IRuntimeErrorEvent` IRuntimeErrorEvent.
+
+    .. describe:: on_can_show_window(58)
+
+            See :py:class:`ICanShowWindowEvent` ICanShowWindowEvent.
+
+    .. describe:: on_show_window(59)
+
+            See :py:class:`IShowWindowEvent` IShowWindowEvent.
+
+    .. describe:: on_cpu_changed(60)
+
+            See :py:class:`ICPUChangedEvent` ICPUChangedEvent.
+
+    .. describe:: on_vrde_server_info_changed(61)
+
+            See :py:class:`IVRDEServerInfoChangedEvent` IVRDEServerInfoChangedEvent.
+
+    .. describe:: on_event_source_changed(62)
+
+            See :py:class:`IEventSourceChangedEvent` IEventSourceChangedEvent.
+
+    .. describe:: on_cpu_execution_cap_changed(63)
+
+            See :py:class:`ICPUExecutionCapChangedEvent` ICPUExecutionCapChangedEvent.
+
+    .. describe:: on_guest_keyboard(64)
+
+            See :py:class:`IGuestKeyboardEvent` IGuestKeyboardEvent.
+
+    .. describe:: on_guest_mouse(65)
+
+            See :py:class:`IGuestMouseEvent` IGuestMouseEvent.
+
+    .. describe:: on_nat_redirect(66)
+
+            See :py:class:`INATRedirectEvent` INATRedirectEvent.
+
+    .. describe:: on_host_pci_device_plug(67)
+
+            See :py:class:`IHostPCIDevicePlugEvent` IHostPCIDevicePlugEvent.
+
+    .. describe:: on_v_box_svc_availability_changed(68)
+
+            See :py:class:`IVBoxSVCAvailabilityChangedEvent` IVBoxSVCAvailablityChangedEvent.
+
+    .. describe:: on_bandwidth_group_changed(69)
+
+            See :py:class:`IBandwidthGroupChangedEvent` IBandwidthGroupChangedEvent.
+
+    .. describe:: on_guest_monitor_changed(70)
+
+            See :py:class:`IGuestMonitorChangedEvent` IGuestMonitorChangedEvent.
+
+    .. describe:: on_storage_device_changed(71)
+
+            See :py:class:`IStorageDeviceChangedEvent` IStorageDeviceChangedEvent.
+
+    .. describe:: on_clipboard_mode_changed(72)
+
+            See :py:class:`IClipboardModeChangedEvent` IClipboardModeChangedEvent.
+
+    .. describe:: on_dn_d_mode_changed(73)
+
+            See :py:class:`IDnDModeChangedEvent` IDnDModeChangedEvent.
+
+    .. describe:: on_nat_network_changed(74)
+
+            See :py:class:`INATNetworkChangedEvent` INATNetworkChangedEvent.
+
+    .. describe:: on_nat_network_start_stop(75)
+
+            See :py:class:`INATNetworkStartStopEvent` INATNetworkStartStopEvent.
+
+    .. describe:: on_nat_network_alter(76)
+
+            See :py:class:`INATNetworkAlterEvent` INATNetworkAlterEvent.
+
+    .. describe:: on_nat_network_creation_deletion(77)
+
+            See :py:class:`INATNetworkCreationDeletionEvent` INATNetworkCreationDeletionEvent.
+
+    .. describe:: on_nat_network_setting(78)
+
+            See :py:class:`INATNetworkSettingEvent` INATNetworkSettingEvent.
+
+    .. describe:: on_nat_network_port_forward(79)
+
+            See :py:class:`INATNetworkPortForwardEvent` INATNetworkPortForwardEvent.
+
+    .. describe:: on_guest_session_state_changed(80)
+
+            See :py:class:`IGuestSessionStateChangedEvent` IGuestSessionStateChangedEvent.
+
+    .. describe:: on_guest_session_registered(81)
+
+            See :py:class:`IGuestSessionRegisteredEvent` IGuestSessionRegisteredEvent.
+
+    .. describe:: on_guest_process_registered(82)
+
+            See :py:class:`IGuestProcessRegisteredEvent` IGuestProcessRegisteredEvent.
+
+    .. describe:: on_guest_process_state_changed(83)
+
+            See :py:class:`IGuestProcessStateChangedEvent` IGuestProcessStateChangedEvent.
+
+    .. describe:: on_guest_process_input_notify(84)
+
+            See :py:class:`IGuestProcessInputNotifyEvent` IGuestProcessInputNotifyEvent.
+
+    .. describe:: on_guest_process_output(85)
+
+            See :py:class:`IGuestProcessOutputEvent` IGuestProcessOutputEvent.
+
+    .. describe:: on_guest_file_registered(86)
+
+            See :py:class:`IGuestFileRegisteredEvent` IGuestFileRegisteredEvent.
+
+    .. describe:: on_guest_file_state_changed(87)
+
+            See :py:class:`IGuestFileStateChangedEvent` IGuestFileStateChangedEvent.
+
+    .. describe:: on_guest_file_offset_changed(88)
+
+            See :py:class:`IGuestFileOffsetChangedEvent` IGuestFileOffsetChangedEvent.
+
+    .. describe:: on_guest_file_read(89)
+
+            See :py:class:`IGuestFileReadEvent` IGuestFileReadEvent.
+
+            For performance reasons this is a separate event to
+            not unnecessarily overflow the event queue.
+
+    .. describe:: on_guest_file_write(90)
+
+            See :py:class:`IGuestFileWriteEvent` IGuestFileWriteEvent.
+
+            For performance reasons this is a separate event to
+            not unnecessarily overflow the event queue.
+
+    .. describe:: on_recording_changed(91)
+
+            See :py:class:`IRecordingChangedEvent` IRecordingChangeEvent.
+
+    .. describe:: on_guest_user_state_changed(92)
+
+            See :py:class:`IGuestUserStateChangedEvent` IGuestUserStateChangedEvent.
+
+    .. describe:: on_guest_multi_touch(93)
+
+            See :py:class:`IGuestMouseEvent` IGuestMouseEvent.
+
+    .. describe:: on_host_name_resolution_configuration_change(94)
+
+            See :py:class:`IHostNameResolutionConfigurationChangeEvent` IHostNameResolutionConfigurationChangeEvent.
+
+    .. describe:: on_snapshot_restored(95)
+
+            See :py:class:`ISnapshotRestoredEvent` ISnapshotRestoredEvent.
+
+    .. describe:: on_medium_config_changed(96)
+
+            See :py:class:`IMediumConfigChangedEvent` IMediumConfigChangedEvent.
+
+    .. describe:: on_audio_adapter_changed(97)
+
+            See :py:class:`IAudioAdapterChangedEvent` IAudioAdapterChangedEvent.
+
+    .. describe:: on_progress_percentage_changed(98)
+
+            See :py:class:`IProgressPercentageChangedEvent` IProgressPercentageChangedEvent.
+
+    .. describe:: on_progress_task_completed(99)
+
+            See :py:class:`IProgressTaskCompletedEvent` IProgressTaskCompletedEvent.
+
+    .. describe:: on_cursor_position_changed(100)
+
+            See :py:class:`ICursorPositionChangedEvent` ICursorPositionChangedEvent.
+
+    .. describe:: on_guest_additions_status_changed(101)
+
+            See :py:class:`IGuestAdditionsStatusChangedEvent` IGuestAdditionsStatusChangedEvent.
+
+    .. describe:: on_guest_monitor_info_changed(102)
+
+            See :py:class:`IGuestMonitorInfoChangedEvent` IGuestMonitorInfoChangedEvent.
+
+    .. describe:: on_guest_file_size_changed(103)
+
+            See :py:class:`IGuestFileSizeChangedEvent` IGuestFileSizeChangedEvent.
+
+    .. describe:: on_clipboard_file_transfer_mode_changed(104)
+
+            See :py:class:`IClipboardFileTransferModeChangedEvent` IClipboardFileTransferModeChangedEvent.
+
+    .. describe:: on_cloud_provider_list_changed(105)
+
+            See :py:class:`ICloudProviderListChangedEvent` .
+
+    .. describe:: on_cloud_provider_registered(106)
+
+            See :py:class:`ICloudProviderRegisteredEvent` .
+
+    .. describe:: on_cloud_provider_uninstall(107)
+
+            See :py:class:`ICloudProviderUninstallEvent` .
+
+    .. describe:: on_cloud_profile_registered(108)
+
+            See :py:class:`ICloudProfileRegisteredEvent` .
+
+    .. describe:: on_cloud_profile_changed(109)
+
+            See :py:class:`ICloudProfileChangedEvent` .
+
+    .. describe:: last(110)
+
+            Must be last event, used for iterations and structures relying on numerical event values.
+
+    """
+
+    __uuid__ = "2ab7c196-f232-11ea-a5d2-83b96bc30bcc"
+    _enums = [
+        ("Invalid", 0, """Invalid event, must be first."""),
+        (
+            "Any",
+            1,
+            """Wildcard for all events.
+            Events of this type are never delivered, and only used in
+            :py:func:`IEventSource.register_listener`  call to simplify registration.""",
+        ),
+        (
+            "Vetoable",
+            2,
+            """Wildcard for all vetoable events. Events of this type are never delivered, and only
+            used in :py:func:`IEventSource.register_listener`  call to simplify registration.""",
+        ),
+        (
+            "MachineEvent",
+            3,
+            """Wildcard for all machine events. Events of this type are never delivered, and only used in
+            :py:func:`IEventSource.register_listener`  call to simplify registration.""",
+        ),
+        (
+            "SnapshotEvent",
+            4,
+            """Wildcard for all snapshot events. Events of this type are never delivered, and only used in
+            :py:func:`IEventSource.register_listener`  call to simplify registration.""",
+        ),
+        (
+            "InputEvent",
+            5,
+            """Wildcard for all input device (keyboard, mouse) events.
+            Events of this type are never delivered, and only used in
+            :py:func:`IEventSource.register_listener`  call to simplify registration.""",
+        ),
+        ("LastWildcard", 31, """Last wildcard."""),
+        (
+            "OnMachineStateChanged",
+            32,
+            """See :py:class:`IMachineStateChangedEvent` IMachineStateChangedEvent.""",
+        ),
+        (
+            "OnMachineDataChanged",
+            33,
+            """See :py:class:`IMachineDataChangedEvent` IMachineDataChangedEvent.""",
+        ),
+        (
+            "OnExtraDataChanged",
+            34,
+            """See :py:class:`IExtraDataChangedEvent` IExtraDataChangedEvent.""",
+        ),
+        (
+            "OnExtraDataCanChange",
+            35,
+            """See :py:class:`IExtraDataCanChangeEvent` IExtraDataCanChangeEvent.""",
+        ),
+        (
+            "OnMediumRegistered",
+            36,
+            """See :py:class:`IMediumRegisteredEvent` IMediumRegisteredEvent.""",
+        ),
+        (
+            "OnMachineRegistered",
+            37,
+            """See :py:class:`IMachineRegisteredEvent` IMachineRegisteredEvent.""",
+        ),
+        (
+            "OnSessionStateChanged",
+            38,
+            """See :py:class:`ISessionStateChangedEvent` ISessionStateChangedEvent.""",
+        ),
+        (
+            "OnSnapshotTaken",
+            39,
+            """See :py:class:`ISnapshotTakenEvent` ISnapshotTakenEvent.""",
+        ),
+        (
+            "OnSnapshotDeleted",
+            40,
+            """See :py:class:`ISnapshotDeletedEvent` ISnapshotDeletedEvent.""",
+        ),
+        (
+            "OnSnapshotChanged",
+            41,
+            """See :py:class:`ISnapshotChangedEvent` ISnapshotChangedEvent.""",
+        ),
+        (
+            "OnGuestPropertyChanged",
+            42,
+            """See :py:class:`IGuestPropertyChangedEvent` IGuestPropertyChangedEvent.""",
+        ),
+        (
+            "OnMousePointerShapeChanged",
+            43,
+            """See :py:class:`IMousePointerShapeChangedEvent` IMousePointerShapeChangedEvent.""",
+        ),
+        (
+            "OnMouseCapabilityChanged",
+            44,
+            """See :py:class:`IMouseCapabilityChangedEvent` IMouseCapabilityChangedEvent.""",
+        ),
+        (
+            "OnKeyboardLedsChanged",
+            45,
+            """See :py:class:`IKeyboardLedsChangedEvent` IKeyboardLedsChangedEvent.""",
+        ),
+        (
+            "OnStateChanged",
+            46,
+            """See :py:class:`IStateChangedEvent` IStateChangedEvent.""",
+        ),
+        (
+            "OnAdditionsStateChanged",
+            47,
+            """See :py:class:`IAdditionsStateChangedEvent` IAdditionsStateChangedEvent.""",
+        ),
+        (
+            "OnNetworkAdapterChanged",
+            48,
+            """See :py:class:`INetworkAdapterChangedEvent` INetworkAdapterChangedEvent.""",
+        ),
+        (
+            "OnSerialPortChanged",
+            49,
+            """See :py:class:`ISerialPortChangedEvent` ISerialPortChangedEvent.""",
+        ),
+        (
+            "OnParallelPortChanged",
+            50,
+            """See :py:class:`IParallelPortChangedEvent` IParallelPortChangedEvent.""",
+        ),
+        (
+            "OnStorageControllerChanged",
+            51,
+            """See :py:class:`IStorageControllerChangedEvent` IStorageControllerChangedEvent.""",
+        ),
+        (
+            "OnMediumChanged",
+            52,
+            """See :py:class:`IMediumChangedEvent` IMediumChangedEvent.""",
+        ),
+        (
+            "OnVRDEServerChanged",
+            53,
+            """See :py:class:`IVRDEServerChangedEvent` IVRDEServerChangedEvent.""",
+        ),
+        (
+            "OnUSBControllerChanged",
+            54,
+            """See :py:class:`IUSBControllerChangedEvent` IUSBControllerChangedEvent.""",
+        ),
+        (
+            "OnUSBDeviceStateChanged",
+            55,
+            """See :py:class:`IUSBDeviceStateChangedEvent` IUSBDeviceStateChangedEvent.""",
+        ),
+        (
+            "OnSharedFolderChanged",
+            56,
+            """See :py:class:`ISharedFolderChangedEvent` ISharedFolderChangedEvent.""",
+        ),
+        (
+            "OnRuntimeError",
+            57,
+            """See :py:class:`IRuntimeErrorEvent` IRuntimeErrorEvent.""",
+        ),
+        (
+            "OnCanShowWindow",
+            58,
+            """See :py:class:`ICanShowWindowEvent` ICanShowWindowEvent.""",
+        ),
+        ("OnShowWindow", 59, """See :py:class:`IShowWindowEvent` IShowWindowEvent."""),
+        ("OnCPUChanged", 60, """See :py:class:`ICPUChangedEvent` ICPUChangedEvent."""),
+        (
+            "OnVRDEServerInfoChanged",
+            61,
+            """See :py:class:`IVRDEServerInfoChangedEvent` IVRDEServerInfoChangedEvent.""",
+        ),
+        (
+            "OnEventSourceChanged",
+            62,
+            """See :py:class:`IEventSourceChangedEvent` IEventSourceChangedEvent.""",
+        ),
+        (
+            "OnCPUExecutionCapChanged",
+            63,
+            """See :py:class:`ICPUExecutionCapChangedEvent` ICPUExecutionCapChangedEvent.""",
+        ),
+        (
+            "OnGuestKeyboard",
+            64,
+            """See :py:class:`IGuestKeyboardEvent` IGuestKeyboardEvent.""",
+        ),
+        ("OnGuestMouse", 65, """See :py:class:`IGuestMouseEvent` IGuestMouseEvent."""),
+        (
+            "OnNATRedirect",
+            66,
+            """See :py:class:`INATRedirectEvent` INATRedirectEvent.""",
+        ),
+        (
+            "OnHostPCIDevicePlug",
+            67,
+            """See :py:class:`IHostPCIDevicePlugEvent` IHostPCIDevicePlugEvent.""",
+        ),
+        (
+            "OnVBoxSVCAvailabilityChanged",
+            68,
+            """See :py:class:`IVBoxSVCAvailabilityChangedEvent` IVBoxSVCAvailablityChangedEvent.""",
+        ),
+        (
+            "OnBandwidthGroupChanged",
+            69,
+            """See :py:class:`IBandwidthGroupChangedEvent` IBandwidthGroupChangedEvent.""",
+        ),
+        (
+            "OnGuestMonitorChanged",
+            70,
+            """See :py:class:`IGuestMonitorChangedEvent` IGuestMonitorChangedEvent.""",
+        ),
+        (
+            "OnStorageDeviceChanged",
+            71,
+            """See :py:class:`IStorageDeviceChangedEvent` IStorageDeviceChangedEvent.""",
+        ),
+        (
+            "OnClipboardModeChanged",
+            72,
+            """See :py:class:`IClipboardModeChangedEvent` IClipboardModeChangedEvent.""",
+        ),
+        (
+            "OnDnDModeChanged",
+            73,
+            """See :py:class:`IDnDModeChangedEvent` IDnDModeChangedEvent.""",
+        ),
+        (
+            "OnNATNetworkChanged",
+            74,
+            """See :py:class:`INATNetworkChangedEvent` INATNetworkChangedEvent.""",
+        ),
+        (
+            "OnNATNetworkStartStop",
+            75,
+            """See :py:class:`INATNetworkStartStopEvent` INATNetworkStartStopEvent.""",
+        ),
+        (
+            "OnNATNetworkAlter",
+            76,
+            """See :py:class:`INATNetworkAlterEvent` INATNetworkAlterEvent.""",
+        ),
+        (
+            "OnNATNetworkCreationDeletion",
+            77,
+            """See :py:class:`INATNetworkCreationDeletionEvent` INATNetworkCreationDeletionEvent.""",
+        ),
+        (
+            "OnNATNetworkSetting",
+            78,
+            """See :py:class:`INATNetworkSettingEvent` INATNetworkSettingEvent.""",
+        ),
+        (
+            "OnNATNetworkPortForward",
+            79,
+            """See :py:class:`INATNetworkPortForwardEvent` INATNetworkPortForwardEvent.""",
+        ),
+        (
+            "OnGuestSessionStateChanged",
+            80,
+            """See :py:class:`IGuestSessionStateChangedEvent` IGuestSessionStateChangedEvent.""",
+        ),
+        (
+            "OnGuestSessionRegistered",
+            81,
+            """See :py:class:`IGuestSessionRegisteredEvent` IGuestSessionRegisteredEvent.""",
+        ),
+        (
+            "OnGuestProcessRegistered",
+            82,
+            """See :py:class:`IGuestProcessRegisteredEvent` IGuestProcessRegisteredEvent.""",
+        ),
+        (
+            "OnGuestProcessStateChanged",
+            83,
+            """See :py:class:`IGuestProcessStateChangedEvent` IGuestProcessStateChangedEvent.""",
+        ),
+        (
+            "OnGuestProcessInputNotify",
+            84,
+            """See :py:class:`IGuestProcessInputNotifyEvent` IGuestProcessInputNotifyEvent.""",
+        ),
+        (
+            "OnGuestProcessOutput",
+            85,
+            """See :py:class:`IGuestProcessOutputEvent` IGuestProcessOutputEvent.""",
+        ),
+        (
+            "OnGuestFileRegistered",
+            86,
+            """See :py:class:`IGuestFileRegisteredEvent` IGuestFileRegisteredEvent.""",
+        ),
+        (
+            "OnGuestFileStateChanged",
+            87,
+            """See :py:class:`IGuestFileStateChangedEvent` IGuestFileStateChangedEvent.""",
+        ),
+        (
+            "OnGuestFileOffsetChanged",
+            88,
+            """See :py:class:`IGuestFileOffsetChangedEvent` IGuestFileOffsetChangedEvent.""",
+        ),
+        (
+            "OnGuestFileRead",
+            89,
+            """See :py:class:`IGuestFileReadEvent` IGuestFileReadEvent.
+            
+            For performance reasons this is a separate event to
+            not unnecessarily overflow the event queue.""",
+        ),
+        (
+            "OnGuestFileWrite",
+            90,
+            """See :py:class:`IGuestFileWriteEvent` IGuestFileWriteEvent.
+            
+            For performance reasons this is a separate event to
+            not unnecessarily overflow the event queue.""",
+        ),
+        (
+            "OnRecordingChanged",
+            91,
+            """See :py:class:`IRecordingChangedEvent` IRecordingChangeEvent.""",
+        ),
+        (
+            "OnGuestUserStateChanged",
+            92,
+            """See :py:class:`IGuestUserStateChangedEvent` IGuestUserStateChangedEvent.""",
+        ),
+        (
+            "OnGuestMultiTouch",
+            93,
+            """See :py:class:`IGuestMouseEvent` IGuestMouseEvent.""",
+        ),
+        (
+            "OnHostNameResolutionConfigurationChange",
+            94,
+            """See :py:class:`IHostNameResolutionConfigurationChangeEvent` IHostNameResolutionConfigurationChangeEvent.""",
+        ),
+        (
+            "OnSnapshotRestored",
+            95,
+            """See :py:class:`ISnapshotRestoredEvent` ISnapshotRestoredEvent.""",
+        ),
+        (
+            "OnMediumConfigChanged",
+            96,
+            """See :py:class:`IMediumConfigChangedEvent` IMediumConfigChangedEvent.""",
+        ),
+        (
+            "OnAudioAdapterChanged",
+            97,
+            """See :py:class:`IAudioAdapterChangedEvent` IAudioAdapterChangedEvent.""",
+        ),
+        (
+            "OnProgressPercentageChanged",
+            98,
+            """See :py:class:`IProgressPercentageChangedEvent` IProgressPercentageChangedEvent.""",
+        ),
+        (
+            "OnProgressTaskCompleted",
+            99,
+            """See :py:class:`IProgressTaskCompletedEvent` IProgressTaskCompletedEvent.""",
+        ),
+        (
+            "OnCursorPositionChanged",
+            100,
+            """See :py:class:`ICursorPositionChangedEvent` ICursorPositionChangedEvent.""",
+        ),
+        (
+            "OnGuestAdditionsStatusChanged",
+            101,
+            """See :py:class:`IGuestAdditionsStatusChangedEvent` IGuestAdditionsStatusChangedEvent.""",
+        ),
+        (
+            "OnGuestMonitorInfoChanged",
+            102,
+            """See :py:class:`IGuestMonitorInfoChangedEvent` IGuestMonitorInfoChangedEvent.""",
+        ),
+        (
+            "OnGuestFileSizeChanged",
+            103,
+            """See :py:class:`IGuestFileSizeChangedEvent` IGuestFileSizeChangedEvent.""",
+        ),
+        (
+            "OnClipboardFileTransferModeChanged",
+            104,
+            """See :py:class:`IClipboardFileTransferModeChangedEvent` IClipboardFileTransferModeChangedEvent.""",
+        ),
+        (
+            "OnCloudProviderListChanged",
+            105,
+            """See :py:class:`ICloudProviderListChangedEvent` .""",
+        ),
+        (
+            "OnCloudProviderRegistered",
+            106,
+            """See :py:class:`ICloudProviderRegisteredEvent` .""",
+        ),
+        (
+            "OnCloudProviderUninstall",
+            107,
+            """See :py:class:`ICloudProviderUninstallEvent` .""",
+        ),
+        (
+            "OnCloudProfileRegistered",
+            108,
+            """See :py:class:`ICloudProfileRegisteredEvent` .""",
+        ),
+        (
+            "OnCloudProfileChanged",
+            109,
+            """See :py:class:`ICloudProfileChangedEvent` .""",
+        ),
+        (
+            "Last",
+            110,
+            """Must be last event, used for iterations and structures relying on numerical event values.""",
+        ),
+    ]
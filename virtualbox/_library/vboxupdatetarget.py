@@ -0,0 +1,51 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class VBoxUpdateTarget(Enum):
+    """The preferred release type used for determining whether a newer version of VirtualBox is available. :py:func:`ISystemProperties.v_box_update_target`
+
+
+    .. describe:: stable(0)
+
+            Stable releases: new maintenance and minor releases within the same major release version.  This is the default.
+
+    .. describe:: all_releases(1)
+
+            All releases: new maintenance, minor, and major releases.
+
+    .. describe:: with_betas(2)
+
+            With betas: new maintenance, minor, and major releases as well as beta releases.
+
+    """
+
+    __uuid__ = "900d4a76-7b08-4af8-a453-f331e783eaee"
+    _enums = [
+        (
+            "Stable",
+            0,
+            """Stable releases: new maintenance and minor releases within the same major release version.  This is the default.""",
+        ),
+        (
+            "AllReleases",
+            1,
+            """All releases: new maintenance, minor, and major releases.""",
+        ),
+        (
+            "WithBetas",
+            2,
+            """With betas: new maintenance, minor, and major releases as well as beta releases.""",
+        ),
+    ]
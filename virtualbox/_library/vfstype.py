@@ -0,0 +1,44 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class VFSType(Enum):
+    """Virtual file systems supported by VFSExplorer.
+
+
+    .. describe:: file_p(1)
+
+
+
+    .. describe:: cloud(2)
+
+
+
+    .. describe:: s3(3)
+
+
+
+    .. describe:: web_dav(4)
+
+
+
+    """
+
+    __uuid__ = "813999ba-b949-48a8-9230-aadc6285e2f2"
+    _enums = [
+        ("File", 1, """"""),
+        ("Cloud", 2, """"""),
+        ("S3", 3, """"""),
+        ("WebDav", 4, """"""),
+    ]
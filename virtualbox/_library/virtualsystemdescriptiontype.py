@@ -0,0 +1,303 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class VirtualSystemDescriptionType(Enum):
+    """Used with :py:class:`IVirtualSystemDescription`  to describe the type of
+    a configuration value.
+
+
+    .. describe:: ignore(1)
+
+
+
+    .. describe:: os(2)
+
+
+
+    .. describe:: name(3)
+
+
+
+    .. describe:: product(4)
+
+
+
+    .. describe:: vendor(5)
+
+
+
+    .. describe:: version(6)
+
+
+
+    .. describe:: product_url(7)
+
+
+
+    .. describe:: vendor_url(8)
+
+
+
+    .. describe:: description(9)
+
+
+
+    .. describe:: license_p(10)
+
+
+
+    .. describe:: miscellaneous(11)
+
+
+
+    .. describe:: cpu(12)
+
+
+
+    .. describe:: memory(13)
+
+
+
+    .. describe:: hard_disk_controller_ide(14)
+
+
+
+    .. describe:: hard_disk_controller_sata(15)
+
+
+
+    .. describe:: hard_disk_controller_scsi(16)
+
+
+
+    .. describe:: hard_disk_controller_sas(17)
+
+
+
+    .. describe:: hard_disk_image(18)
+
+
+
+    .. describe:: floppy(19)
+
+
+
+    .. describe:: cdrom(20)
+
+
+
+    .. describe:: network_adapter(21)
+
+
+
+    .. describe:: usb_controller(22)
+
+
+
+    .. describe:: sound_card(23)
+
+
+
+    .. describe:: settings_file(24)
+
+            Optional, may be unset by the API caller. If this is changed by the
+            API caller it defines the absolute path of the VM settings file and
+            therefore also the VM folder with highest priority.
+
+    .. describe:: base_folder(25)
+
+            Optional, may be unset by the API caller. If set (and
+            :py:attr:`VirtualSystemDescriptionType.settings_file`  is not changed),
+            defines the VM base folder (taking the primary group into account if
+            also set).
+
+    .. describe:: primary_group(26)
+
+            Optional, empty by default and may be unset by the API caller.
+            Defines the primary group of the VM after import. May influence the
+            selection of the VM folder. Additional groups may be configured later
+            using :py:func:`IMachine.groups` , after importing.
+
+    .. describe:: cloud_instance_shape(27)
+
+
+
+    .. describe:: cloud_domain(28)
+
+
+
+    .. describe:: cloud_boot_disk_size(29)
+
+
+
+    .. describe:: cloud_bucket(30)
+
+
+
+    .. describe:: cloud_ocivcn(31)
+
+
+
+    .. describe:: cloud_public_ip(32)
+
+
+
+    .. describe:: cloud_profile_name(33)
+
+
+
+    .. describe:: cloud_oci_subnet(34)
+
+
+
+    .. describe:: cloud_keep_object(35)
+
+
+
+    .. describe:: cloud_launch_instance(36)
+
+
+
+    .. describe:: cloud_instance_id(37)
+
+
+
+    .. describe:: cloud_image_id(38)
+
+
+
+    .. describe:: cloud_instance_state(39)
+
+
+
+    .. describe:: cloud_image_state(40)
+
+
+
+    .. describe:: cloud_instance_display_name(41)
+
+
+
+    .. describe:: cloud_image_display_name(42)
+
+
+
+    .. describe:: cloud_oci_launch_mode(43)
+
+
+
+    .. describe:: cloud_private_ip(44)
+
+
+
+    .. describe:: cloud_boot_volume_id(45)
+
+
+
+    .. describe:: cloud_ocivcn_compartment(46)
+
+
+
+    .. describe:: cloud_oci_subnet_compartment(47)
+
+
+
+    .. describe:: cloud_public_ssh_key(48)
+
+
+
+    .. describe:: booting_firmware(49)
+
+
+
+    .. describe:: hard_disk_controller_virtio_scsi(60)
+
+
+
+    """
+
+    __uuid__ = "6e18c6d7-e1b7-4cb0-9706-1f31d18248f8"
+    _enums = [
+        ("Ignore", 1, """"""),
+        ("OS", 2, """"""),
+        ("Name", 3, """"""),
+        ("Product", 4, """"""),
+        ("Vendor", 5, """"""),
+        ("Version", 6, """"""),
+        ("ProductUrl", 7, """"""),
+        ("VendorUrl", 8, """"""),
+        ("Description", 9, """"""),
+        ("License", 10, """"""),
+        ("Miscellaneous", 11, """"""),
+        ("CPU", 12, """"""),
+        ("Memory", 13, """"""),
+        ("HardDiskControllerIDE", 14, """"""),
+        ("HardDiskControllerSATA", 15, """"""),
+        ("HardDiskControllerSCSI", 16, """"""),
+        ("HardDiskControllerSAS", 17, """"""),
+        ("HardDiskImage", 18, """"""),
+        ("Floppy", 19, """"""),
+        ("CDROM", 20, """"""),
+        ("NetworkAdapter", 21, """"""),
+        ("USBController", 22, """"""),
+        ("SoundCard", 23, """"""),
+        (
+            "SettingsFile",
+            24,
+            """Optional, may be unset by the API caller. If this is changed by the
+            API caller it defines the absolute path of the VM settings file and
+            therefore also the VM folder with highest priority.""",
+        ),
+        (
+            "BaseFolder",
+            25,
+            """Optional, may be unset by the API caller. If set (and
+            :py:attr:`VirtualSystemDescriptionType.settings_file`  is not changed),
+            defines the VM base folder (taking the primary group into account if
+            also set).""",
+        ),
+        (
+            "PrimaryGroup",
+            26,
+            """Optional, empty by default and may be unset by the API caller.
+            Defines the primary group of the VM after import. May influence the
+            selection of the VM folder. Additional groups may be configured later
+            using :py:func:`IMachine.groups` , after importing.""",
+        ),
+        ("CloudInstanceShape", 27, """"""),
+        ("CloudDomain", 28, """"""),
+        ("CloudBootDiskSize", 29, """"""),
+        ("CloudBucket", 30, """"""),
+        ("CloudOCIVCN", 31, """"""),
+        ("CloudPublicIP", 32, """"""),
+        ("CloudProfileName", 33, """"""),
+        ("CloudOCISubnet", 34, """"""),
+        ("CloudKeepObject", 35, """"""),
+        ("CloudLaunchInstance", 36, """"""),
+        ("CloudInstanceId", 37, """"""),
+        ("CloudImageId", 38, """"""),
+        ("CloudInstanceState", 39, """"""),
+        ("CloudImageState", 40, """"""),
+        ("CloudInstanceDisplayName", 41, """"""),
+        ("CloudImageDisplayName", 42, """"""),
+        ("CloudOCILaunchMode", 43, """"""),
+        ("CloudPrivateIP", 44, """"""),
+        ("CloudBootVolumeId", 45, """"""),
+        ("CloudOCIVCNCompartment", 46, """"""),
+        ("CloudOCISubnetCompartment", 47, """"""),
+        ("CloudPublicSSHKey", 48, """"""),
+        ("BootingFirmware", 49, """"""),
+        ("HardDiskControllerVirtioSCSI", 60, """"""),
+    ]
@@ -0,0 +1,45 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class VirtualSystemDescriptionValueType(Enum):
+    """Used with :py:func:`IVirtualSystemDescription.get_values_by_type`  to describe the value
+    type to fetch.
+
+
+    .. describe:: reference(1)
+
+
+
+    .. describe:: original(2)
+
+
+
+    .. describe:: auto(3)
+
+
+
+    .. describe:: extra_config(4)
+
+
+
+    """
+
+    __uuid__ = "56d9403f-3425-4118-9919-36f2a9b8c77c"
+    _enums = [
+        ("Reference", 1, """"""),
+        ("Original", 2, """"""),
+        ("Auto", 3, """"""),
+        ("ExtraConfig", 4, """"""),
+    ]
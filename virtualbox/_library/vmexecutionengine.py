@@ -0,0 +1,44 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class VMExecutionEngine(Enum):
+    """The main execution engine of a VM.
+
+
+    .. describe:: not_set(0)
+
+            Has not yet been set (try again later).
+
+    .. describe:: raw_mode(1)
+
+            Raw-mode.
+
+    .. describe:: hw_virt(2)
+
+            Hardware assisted virtualization thru HM.
+
+    .. describe:: native_api(3)
+
+            Hardware assisted virtualization thru native API (NEM).
+
+    """
+
+    __uuid__ = "56029577-31f7-44d2-3334-7ecbf95294b6"
+    _enums = [
+        ("NotSet", 0, """Has not yet been set (try again later)."""),
+        ("RawMode", 1, """Raw-mode."""),
+        ("HwVirt", 2, """Hardware assisted virtualization thru HM."""),
+        ("NativeApi", 3, """Hardware assisted virtualization thru native API (NEM)."""),
+    ]
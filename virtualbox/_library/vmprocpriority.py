@@ -0,0 +1,80 @@
+# Generated from VirtualBox.xidl by build.py, see virtualbox/library.py
+from __future__ import absolute_import
+from ..library_base import Enum
+
+# Py2 and Py3 compatibility
+try:
+    basestring = basestring
+except:
+    basestring = (str, bytes)
+try:
+    baseinteger = (int, long)
+except:
+    baseinteger = (int,)
+
+
+class VMProcPriority(Enum):
+    """Virtual machine process priorities.
+
+
+    .. describe:: invalid(0)
+
+            Invalid priority, do not use.
+
+    .. describe:: default(1)
+
+            Default process priority determined by the OS.
+
+    .. describe:: flat(2)
+
+            Assumes a scheduling policy which puts the process at the default
+            priority and with all thread at the same priority
+
+    .. describe:: low(3)
+
+            Assumes a scheduling policy which puts the process mostly below the
+            default priority of the host OS.
+
+    .. describe:: normal(5)
+
+            Assume a scheduling policy which shares the CPU resources fairly with
+            other processes running with the default priority of the host OS.
+
+    .. describe:: high(6)
+
+            Assumes a scheduling policy which puts the task above the default
+            priority of the host OS. This policy might easily cause other tasks
+            in the system to starve.
+
+    """
+
+    __uuid__ = "6fa72dd5-19b7-46ba-bc52-f223c98c7d80"
+    _enums = [
+        ("Invalid", 0, """Invalid priority, do not use."""),
+        ("Default", 1, """Default process priority determined by the OS."""),
+        (
+            "Flat",
+            2,
+            """Assumes a scheduling policy which puts the process at the default
+            priority and with all thread at the same priority""",
+        ),
+        (
+            "Low",
+            3,
+            """Assumes a scheduling policy which puts the process mostly below the
+            default priority of the host OS.""",
+        ),
+        (
+            "Normal",
+            5,
+            """Assume a scheduling policy which shares the CPU resources fairly with
+            other processes running with the default priority of the host OS.""",
+        ),
+        (
+            "High",
+            6,
+            """Assumes a scheduling policy which puts the task above the default
+            priority of the host OS. This policy might easily cause other tasks
+            in the system to starve.""",
+        ),
+    ]
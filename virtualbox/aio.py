@@ -0,0 +1,625 @@
+"""asyncio support for pyvbox.
+
+This module requires Python 3 and is only imported on demand, for example by
+IEventSource.stream().
+
+EventStream delivers events from an IEventSource into an asyncio event loop::
+
+    async with vbox.event_source.stream(
+        [library.VBoxEventType.on_machine_state_changed]
+    ) as stream:
+        async for event in stream:
+            print(event.machine_id, event.state)
+
+Events are fetched by the event source's shared monitor thread (see
+virtualbox.events), wrapped in their event interface and acknowledged with
+event_processed once they have been queued.  The queue is bounded; the
+overflow policy decides what happens when the consumer falls behind.  The
+default, DROP_OLDEST, never holds up the monitor thread, which other
+callbacks and streams on the same event source share.
+
+AsyncMachinePool is the asyncio counterpart to virtualbox.pool.MachinePool::
+
+    pool = await AsyncMachinePool.open("win7", username="Mick",
+                                       password="password")
+    async with pool.machine() as session:
+        ...
+    await pool.close()
+"""
+
+import asyncio
+import collections
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from virtualbox import Session, VirtualBox
+from virtualbox import events, library
+from virtualbox.pool import MachinePool
+
+# Overflow policies for EventStream
+BLOCK = "block"
+DROP_OLDEST = "drop_oldest"
+COALESCE = "coalesce"
+
+OVERFLOW_POLICIES = (BLOCK, DROP_OLDEST, COALESCE)
+
+
+def default_coalesce_key(event):
+    """Events of the same type about the same machine coalesce"""
+    machine_id = None
+    try:
+        machine_id = getattr(event, "machine_id", None)
+    except library.VBoxError:
+        pass
+    return (type(event), machine_id)
+
+
+class EventStream(object):
+    """EventStream is an asynchronous iterator of events from an event source
+
+    Arguments:
+        event_source - the IEventSource to read events from
+        event_types - list of VBoxEventType values to subscribe to
+        maxsize - the maximum number of queued events
+        overflow - what to do when the queue is full:
+            DROP_OLDEST - discard the oldest queued event
+            COALESCE - replace the oldest queued event with the same
+                       coalesce_key as the new one, else drop the oldest
+            BLOCK - stop fetching events until the consumer catches up.
+                    The stream gets a listener and monitor thread of its
+                    own, so only this stream is held up and VirtualBox
+                    keeps the events queued meanwhile.
+        coalesce_key - function mapping an event to its coalesce key.  It
+            is called once per event as the event is queued.
+        loop - the event loop to deliver to (default: the current loop)
+    """
+
+    def __init__(
+        self,
+        event_source,
+        event_types,
+        maxsize=1000,
+        overflow=DROP_OLDEST,
+        coalesce_key=default_coalesce_key,
+        loop=None,
+    ):
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(
+                "overflow must be one of %s" % ", ".join(OVERFLOW_POLICIES)
+            )
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        if isinstance(event_types, library.VBoxEventType):
+            event_types = [event_types]
+        if loop is None:
+            loop = asyncio.get_event_loop()
+        self.maxsize = maxsize
+        self.overflow = overflow
+        self.coalesce_key = coalesce_key
+        self.dropped = 0
+        self._loop = loop
+        self._ready = asyncio.Event()
+        self._buffer = collections.deque()
+        self._cond = threading.Condition()
+        self._closed = False
+        self._callback_ids = []
+        self._dispatcher = None
+        try:
+            if overflow == BLOCK:
+                # Waiting for room parks the monitor thread, so don't share it.
+                self._dispatcher = events._Dispatcher(event_source)
+                for event_type in event_types:
+                    self._dispatcher.add(
+                        int(event_type),
+                        self._put,
+                        event_type,
+                        events.type_to_interface(event_type),
+                    )
+            else:
+                for event_type in event_types:
+                    callback_id = events.register_callback(
+                        self._put, event_source, event_type
+                    )
+                    self._callback_ids.append(callback_id)
+        except Exception:
+            self.close()
+            raise
+
+    def __repr__(self):
+        return "<EventStream queued=%s dropped=%s overflow=%s>" % (
+            len(self._buffer),
+            self.dropped,
+            self.overflow,
+        )
+
+    def qsize(self):
+        """Return the number of queued events"""
+        return len(self._buffer)
+
+    def _make_room(self, key):
+        # Called with self._cond held while the buffer is full.
+        if self.overflow == BLOCK:
+            while len(self._buffer) >= self.maxsize and not self._closed:
+                self._cond.wait()
+            return
+        if self.overflow == COALESCE:
+            for i, (queued_key, _) in enumerate(self._buffer):
+                if queued_key == key:
+                    del self._buffer[i]
+                    self.dropped += 1
+                    return
+        self._buffer.popleft()
+        self.dropped += 1
+
+    def _put(self, event):
+        # Runs on the event source monitor thread.
+        key = None
+        if self.overflow == COALESCE:
+            key = self.coalesce_key(event)
+        with self._cond:
+            if len(self._buffer) >= self.maxsize:
+                self._make_room(key)
+            if self._closed:
+                return
+            self._buffer.append((key, event))
+        try:
+            self._loop.call_soon_threadsafe(self._ready.set)
+        except RuntimeError:
+            # The event loop has been closed.
+            self.close()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        while True:
+            self._ready.clear()
+            with self._cond:
+                if self._buffer:
+                    _, event = self._buffer.popleft()
+                    self._cond.notify()
+                    return event
+                if self._closed:
+                    raise StopAsyncIteration
+            await self._ready.wait()
+
+    async def get(self):
+        """Return the next event, raise StopAsyncIteration once closed"""
+        return await self.__anext__()
+
+    def close(self):
+        """Stop receiving events.  Events already queued are still returned
+        by the iterator before it stops."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        callback_ids, self._callback_ids = self._callback_ids, []
+        for callback_id in callback_ids:
+            events.unregister_callback(callback_id)
+        dispatcher, self._dispatcher = self._dispatcher, None
+        if dispatcher is not None:
+            dispatcher.stop()
+        if not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._ready.set)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, tb):
+        self.close()
+
+
+class _ProgressMonitor(object):
+    """Wait for many IProgress objects with one listener and one thread
+
+    The event sources of the progress objects being waited for are combined
+    with IEventSource.create_aggregator and a single listener reads the
+    task completed events.  Progress objects added while the monitor thread
+    waits for an event are subscribed to together, with one rebuild of the
+    aggregator.  After each rebuild every waiter checks progress.completed,
+    so a completion that happens while no listener is registered is not
+    missed.  The thread exits once nothing is being waited for.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # (progress id, IProgress, callback) not subscribed to yet
+        self._added = []
+        # progress id -> (IProgress, [callback, ...])
+        self._waiters = {}
+        # (event source, listener) the monitor thread reads, None while
+        # the subscription is being rebuilt
+        self._listener = None
+        self._thread = None
+
+    def add(self, progress, callback):
+        """Call callback(None) once progress has completed, or
+        callback(exception) if it can't be waited for.  This makes
+        VirtualBox calls, so don't call it on an event loop."""
+        if progress.completed:
+            callback(None)
+            return
+        progress_id = progress.id_p
+        with self._lock:
+            self._added.append((progress_id, progress, callback))
+            listener = self._listener
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run)
+                self._thread.daemon = True
+                self._thread.start()
+                listener = None
+        if listener is not None:
+            # Interrupt get_event so the new progress gets subscribed to.
+            self._unregister(listener)
+
+    @staticmethod
+    def _unregister(listener):
+        try:
+            listener[0].unregister_listener(listener[1])
+        except Exception:
+            pass
+
+    def _subscribe(self):
+        with self._lock:
+            progresses = [progress for progress, _ in self._waiters.values()]
+        sources = [progress.event_source for progress in progresses]
+        source = sources[0]
+        if len(sources) > 1:
+            source = source.create_aggregator(sources)
+        listener = source.create_listener()
+        event_type = library.VBoxEventType.on_progress_task_completed
+        source.register_listener(listener, [event_type], False)
+        return source, listener
+
+    def _complete(self, progress_id, exc=None):
+        with self._lock:
+            _, callbacks = self._waiters.pop(progress_id, (None, []))
+        for callback in callbacks:
+            callback(exc)
+
+    def _check_completed(self):
+        with self._lock:
+            waiters = list(self._waiters.items())
+        for progress_id, (progress, _) in waiters:
+            try:
+                completed = progress.completed
+            except Exception as exc:
+                self._complete(progress_id, exc)
+            else:
+                if completed:
+                    self._complete(progress_id)
+
+    def _run(self):
+        listener = None
+        try:
+            while True:
+                with self._lock:
+                    added, self._added = self._added, []
+                    for progress_id, progress, callback in added:
+                        waiter = self._waiters.setdefault(progress_id, (progress, []))
+                        waiter[1].append(callback)
+                    if not self._waiters:
+                        self._thread = None
+                        self._listener = None
+                        return
+                    rebuild = bool(added) or listener is None
+                    if rebuild:
+                        self._listener = None
+                if rebuild:
+                    if listener is not None:
+                        self._unregister(listener)
+                        listener = None
+                    listener = self._subscribe()
+                    with self._lock:
+                        if not self._added:
+                            self._listener = listener
+                    self._check_completed()
+                    continue
+                source = listener[0]
+                try:
+                    event = source.get_event(listener[1], 1000)
+                except library.VBoxError:
+                    # Unregistered by add, subscribe again.
+                    listener = None
+                    continue
+                if event:
+                    event = library.IProgressTaskCompletedEvent(event)
+                    progress_id = event.progress_id
+                    try:
+                        source.event_processed(listener[1], event)
+                    except library.VBoxError:
+                        pass
+                    self._complete(progress_id)
+        except Exception as exc:
+            # Fail every waiter rather than leave them waiting forever.
+            with self._lock:
+                self._thread = None
+                self._listener = None
+                added, self._added = self._added, []
+                waiters = list(self._waiters.values())
+                self._waiters.clear()
+            for _, _, callback in added:
+                callback(exc)
+            for _, callbacks in waiters:
+                for callback in callbacks:
+                    callback(exc)
+        finally:
+            if listener is not None:
+                self._unregister(listener)
+
+
+_progress_monitor = _ProgressMonitor()
+
+
+def _progress_result(progress):
+    """Return the result code of progress and the text of its error"""
+    result_code = progress.result_code
+    if result_code == 0:
+        return result_code, None
+    info = progress.error_info
+    return result_code, info.text if info else "operation failed"
+
+
+async def wait_for_progress(progress, loop=None, executor=None):
+    """Wait for an IProgress to complete without blocking a thread.
+
+    Completion is signalled by the progress object's task completed event.
+    All waiters share one listener and monitor thread.  The VirtualBox
+    calls made here run on executor, by default the loop's.
+    Raise VBoxError if the operation failed.
+    """
+    if loop is None:
+        loop = asyncio.get_event_loop()
+    done = loop.create_future()
+
+    def completed(exc):
+        def resolve():
+            if done.done():
+                return
+            if exc is None:
+                done.set_result(None)
+            else:
+                done.set_exception(exc)
+
+        try:
+            loop.call_soon_threadsafe(resolve)
+        except RuntimeError:
+            # The event loop has been closed.
+            pass
+
+    await loop.run_in_executor(executor, _progress_monitor.add, progress, completed)
+    await done
+    result_code, error = await loop.run_in_executor(
+        executor, _progress_result, progress
+    )
+    if result_code != 0:
+        exc = library.VBoxError(error)
+        exc.msg = error
+        raise exc
+
+
+class AsyncMachinePool(object):
+    """AsyncMachinePool is the asyncio front end to a MachinePool
+
+    Blocking VirtualBox calls run on a dedicated executor, and clone builds,
+    which take minutes, on a second one with the pool's workers threads.
+    Launches and snapshot restores are awaited through progress events, and
+    an acquire waiting for a clone to be released waits on the extra data
+    changed events that mark clones free, so waiters do not hold a thread
+    each.
+
+    Arguments:
+        pool - the MachinePool to hand out clones from
+        executor - executor to run blocking calls on (default: a new
+                   ThreadPoolExecutor with max_workers threads, shut down
+                   by close)
+        max_workers - size of the default executor
+    """
+
+    def __init__(self, pool, executor=None, max_workers=8):
+        self._own_executor = executor is None
+        if executor is None:
+            executor = ThreadPoolExecutor(max_workers)
+        self.pool = pool
+        self.executor = executor
+        self._build_executor = ThreadPoolExecutor(pool.workers)
+        # Set by the first coroutine to run, see _watch.
+        self._loop = None
+        self._changed = None
+        self._generation = 0
+        self._vbox = VirtualBox()
+        self._callback_ids = [
+            self._vbox.register_on_extra_data_changed(self._on_change),
+        ]
+
+    @classmethod
+    async def open(cls, machine_name, executor=None, max_workers=8, **kwargs):
+        """Create the MachinePool for machine_name on the executor and
+        return an AsyncMachinePool for it.  kwargs go to MachinePool."""
+        own_executor = executor is None
+        if own_executor:
+            executor = ThreadPoolExecutor(max_workers)
+        loop = asyncio.get_event_loop()
+        pool = await loop.run_in_executor(
+            executor, functools.partial(MachinePool, machine_name, **kwargs)
+        )
+        machine_pool = await loop.run_in_executor(
+            executor, functools.partial(cls, pool, executor=executor)
+        )
+        machine_pool._own_executor = own_executor
+        return machine_pool
+
+    def _run(self, func, *args):
+        loop = asyncio.get_event_loop()
+        return loop.run_in_executor(self.executor, functools.partial(func, *args))
+
+    def _wait(self, progress):
+        return wait_for_progress(progress, executor=self.executor)
+
+    def _watch(self):
+        if self._loop is None:
+            self._loop = asyncio.get_event_loop()
+            self._changed = asyncio.Event()
+
+    def _on_change(self, event):
+        # Runs on the event source monitor thread.
+        loop = self._loop
+        if loop is None:
+            return
+        if event.key not in (self.pool._registry.key, self.pool._registry.state_key):
+            return
+
+        def changed():
+            self._generation += 1
+            self._changed.set()
+
+        try:
+            loop.call_soon_threadsafe(changed)
+        except RuntimeError:
+            # The event loop has been closed.
+            pass
+
+    def _lock_clone(self, clone_id):
+        """Return a free clone and a session with a write lock on it, None
+        if it has gone or been claimed already"""
+        try:
+            clone = self._vbox.find_machine(clone_id)
+        except library.VBoxError:
+            return None
+        session = Session()
+        try:
+            clone.lock_machine(session, library.LockType.write)
+        except Exception:
+            return None
+        return clone, session
+
+    @staticmethod
+    def _unlock(session):
+        if session.state == library.SessionState.locked:
+            session.unlock_machine()
+
+    def _claim(self, clone):
+        self.pool._registry.set_state(clone, "busy")
+        return clone.create_session()
+
+    async def _take_ready_clone(self, frontend):
+        pool = self.pool
+        while True:
+            clone_id = pool._registry.pop_free()
+            if clone_id is None:
+                return None
+            locked = await self._run(self._lock_clone, clone_id)
+            if locked is None:
+                continue
+            clone, session = locked
+            try:
+                with pool.telemetry.timer("restore"):
+                    progress = await self._run(
+                        lambda: session.machine.restore_snapshot()
+                    )
+                    await self._wait(progress)
+            except Exception:
+                pass
+            finally:
+                await self._run(session.unlock_machine)
+
+            # Launching the clone claims it, see MachinePool._take_ready_clone
+            session = await self._run(Session)
+            try:
+                with pool.telemetry.timer("launch"):
+                    progress = await self._run(
+                        clone.launch_vm_process, session, frontend, ""
+                    )
+                    await self._wait(progress)
+            except Exception:
+                await self._run(pool._launch_failed, clone)
+                continue
+            finally:
+                await self._run(self._unlock, session)
+            return await self._run(self._claim, clone)
+
+    async def acquire(self, username=None, password=None, frontend=None):
+        """Acquire a Machine resource, see MachinePool.acquire
+
+        :rtype: ISession
+        """
+        pool = self.pool
+        if username is None:
+            username = pool.username
+        if password is None:
+            password = pool.password
+        if frontend is None:
+            frontend = pool.frontend
+        self._watch()
+        with pool._cond:
+            pool._waiting += 1
+        try:
+            with pool.telemetry.timer("acquire"):
+                return await self._acquire(username, password, frontend)
+        finally:
+            with pool._cond:
+                pool._waiting -= 1
+
+    async def _acquire(self, username, password, frontend):
+        pool = self.pool
+        loop = asyncio.get_event_loop()
+        while True:
+            generation = self._generation
+            session = await self._take_ready_clone(frontend)
+            if session is not None:
+                pool._wake_provisioner()
+                return session
+            if not pool._full():
+                with pool.telemetry.timer("build"):
+                    await loop.run_in_executor(
+                        self._build_executor,
+                        pool._build_clone,
+                        username,
+                        password,
+                        frontend,
+                    )
+                continue
+            if generation == self._generation:
+                # Wait for a clone to change state.  Time out now and then in
+                # case the change happened in another process unnoticed.
+                self._changed.clear()
+                try:
+                    await asyncio.wait_for(self._changed.wait(), 1)
+                except asyncio.TimeoutError:
+                    pass
+
+    async def release(self, session):
+        """Release a machine session resource, see MachinePool.release"""
+        return await self._run(self.pool.release, session)
+
+    def machine(self, username=None, password=None, frontend=None):
+        """Acquire a machine for the duration of an async with block"""
+        return _PooledMachine(self, username, password, frontend)
+
+    async def close(self):
+        """Close the pool and shut down the executors it created"""
+        callback_ids, self._callback_ids = self._callback_ids, []
+        for callback_id in callback_ids:
+            events.unregister_callback(callback_id)
+        await self._run(self.pool.close)
+        self._build_executor.shutdown(wait=False)
+        if self._own_executor:
+            self.executor.shutdown(wait=False)
+
+
+class _PooledMachine(object):
+    """Async context manager returned by AsyncMachinePool.machine"""
+
+    def __init__(self, pool, username, password, frontend):
+        self._pool = pool
+        self._args = (username, password, frontend)
+        self._session = None
+
+    async def __aenter__(self):
+        self._session = await self._pool.acquire(*self._args)
+        return self._session
+
+    async def __aexit__(self, exc_type, exc_value, tb):
+        session, self._session = self._session, None
+        await self._pool.release(session)
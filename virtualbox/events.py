@@ -3,77 +3,240 @@
 By Michael Dorman
 [mjdorma+pyvbox@gmail.com]
 """
+
 from __future__ import print_function
 import sys
 import atexit
-import inspect
+import itertools
 import traceback
 import threading
 
 from virtualbox import library
 
 
-_lookup = {}
-
-
 def type_to_interface(event_type):
     """Return the event interface object that corresponds to the event type
     enumeration"""
-    global _lookup
     if not isinstance(event_type, library.VBoxEventType):
         raise TypeError("event_type was not of VBoxEventType")
-    if not _lookup:
-        for attr in dir(library):
-            event_interface = getattr(library, attr)
-            if not inspect.isclass(event_interface):
-                continue
-            if not issubclass(event_interface, library.Interface):
-                continue
-            et = getattr(event_interface, "id", None)
-            if et is None:
-                continue
-            if not isinstance(et, library.VBoxEventType):
-                continue
-            _lookup[int(et)] = event_interface
-    return _lookup[int(event_type)]
+    # build.py generates a static table of event type -> interface name so
+    # only the interface for this event type gets imported.
+    return getattr(library, library._event_interfaces[int(event_type)])
 
 
-_callbacks = {}
+_LAST_WILDCARD = int(library.VBoxEventType.last_wildcard)
 
 
-def _event_monitor(callback, event_source, listener, event_interface, quit):
-    global _callbacks
-    try:
-        while not quit.is_set():
+class _Dispatcher(object):
+    """_Dispatcher multiplexes every callback registered against one event
+    source over a single passive listener and monitor thread.
+
+    The listener is registered for the union of the event types the
+    callbacks subscribe to.  When a callback adds a type, a listener for
+    the larger union is registered before the old one is retired, so no
+    events are lost in between.  Removing callbacks leaves the listener as
+    it is.
+    """
+
+    def __init__(self, event_source):
+        self.event_source = event_source
+        self.listener = None
+        self.event_types = set()
+        # Listeners replaced by a larger one, drained and unregistered by
+        # the monitor thread
+        self.retired = []
+        self.callbacks = {}
+        self.lock = threading.Lock()
+        self.ready = threading.Event()
+        self.quit = threading.Event()
+        self.thread = None
+
+    def add(self, callback_id, callback, event_type, event_interface):
+        with self.lock:
+            self.callbacks[callback_id] = (int(event_type), callback, event_interface)
+            if int(event_type) not in self.event_types:
+                event_types = self.event_types | set([int(event_type)])
+                listener = self.event_source.create_listener()
+                interesting = [library.VBoxEventType(t) for t in sorted(event_types)]
+                self.event_source.register_listener(listener, interesting, False)
+                if self.listener is not None:
+                    self.retired.append((self.listener, self.event_types))
+                self.listener = listener
+                self.event_types = event_types
+        if self.thread is None:
+            self.thread = threading.Thread(target=self._run)
+            self.thread.daemon = True
+            self.thread.start()
+            self.ready.wait()
+
+    def remove(self, callback_id):
+        """Remove a callback, return True when no callbacks remain"""
+        with self.lock:
+            self.callbacks.pop(callback_id, None)
+            return not self.callbacks
+
+    def _unregister(self, listener):
+        try:
+            self.event_source.unregister_listener(listener)
+        except Exception:
+            print("Failed to unregister listener %s" % listener, file=sys.stderr)
+
+    def _unregister_all(self):
+        with self.lock:
+            listeners = [listener for listener, _ in self.retired]
+            if self.listener is not None:
+                listeners.append(self.listener)
+            self.retired = []
+            self.listener = None
+        for listener in listeners:
+            self._unregister(listener)
+
+    def stop(self):
+        # Unregistering the listener interrupts a pending get_event so the
+        # monitor thread exits without waiting out the poll interval.
+        self.quit.set()
+        self._unregister_all()
+        if self.thread is not None and self.thread is not threading.current_thread():
+            self.thread.join()
+
+    def _dispatch(self, event):
+        event_type = int(event.type)
+        name = library._event_interfaces.get(event_type)
+        if name is None:
+            return
+        wrapped = None
+        with self.lock:
+            callbacks = list(self.callbacks.values())
+        for et, callback, event_interface in callbacks:
+            if et != event_type and et > _LAST_WILDCARD:
+                continue
+            if wrapped is None:
+                wrapped = getattr(library, name)(event)
+            # Wildcard types such as machine_event match every event that
+            # implements their interface.
+            if et != event_type and not isinstance(wrapped, event_interface):
+                continue
             try:
-                event = event_source.get_event(listener, 1000)
-            except library.VBoxError:
+                callback(wrapped)
+            except Exception:
                 print(
-                    "Unregistering %s due to VBoxError on get_event" % listener,
+                    "Unhanded exception in callback: \n%s" % traceback.format_exc(),
                     file=sys.stderr,
                 )
+
+    def _process(self, listener, event, seen, retired):
+        """Dispatch event unless another listener delivered it already.
+
+        seen holds the keys of the events taken from listeners that have
+        been retired, as the listeners that replaced them may deliver the
+        same events again.
+        """
+        key = _com_key(event)
+        if key in seen:
+            if not retired:
+                seen.discard(key)
+        else:
+            if retired:
+                seen.add(key)
+            self._dispatch(event)
+        try:
+            self.event_source.event_processed(listener, event)
+        except library.VBoxError:
+            pass
+
+    def _drain(self, listener, seen):
+        """Dispatch the events left on a retired listener, then unregister
+        it"""
+        while not self.quit.is_set():
+            try:
+                event = self.event_source.get_event(listener, 0)
+            except library.VBoxError:
+                break
+            if not event:
                 break
-            if event:
+            self._process(listener, event, seen, True)
+        self._unregister(listener)
+
+    def _run(self):
+        self.ready.set()
+        # Events taken from retired listeners that may come again, and the
+        # event types those listeners were registered for
+        seen = set()
+        seen_types = set()
+        try:
+            while not self.quit.is_set():
+                with self.lock:
+                    retired, self.retired = self.retired, []
+                    listener = self.listener
+                for old, event_types in retired:
+                    self._drain(old, seen)
+                    seen_types.update(event_types)
                 try:
-                    callback(event_interface(event))
-                except Exception:
+                    event = self.event_source.get_event(listener, 1000)
+                except library.VBoxError:
+                    if self.quit.is_set():
+                        continue
                     print(
-                        "Unhanded exception in callback: \n%s" % traceback.format_exc(),
+                        "Unregistering %s due to VBoxError on get_event" % listener,
                         file=sys.stderr,
                     )
-                event_source.event_processed(listener, event)
-    finally:
-        _callbacks.pop(threading.current_thread().ident, None)
-        try:
-            event_source.unregister_listener(listener)
-        except Exception:
-            print("Failed to unregister listener %s" % listener, file=sys.stderr)
+                    break
+                if not event:
+                    continue
+                with self.lock:
+                    # A listener registered while we waited may have the
+                    # event too.  It is registered with self.lock held.
+                    current = listener is self.listener
+                if (
+                    current
+                    and seen
+                    and int(event.type) in seen_types
+                    and _com_key(event) not in seen
+                ):
+                    # Events both listeners got come first, so none of the
+                    # rest of seen is due again.
+                    seen.clear()
+                    seen_types.clear()
+                self._process(listener, event, seen, not current)
+        finally:
+            _remove_dispatcher(self)
+            self._unregister_all()
+
+
+_lock = threading.Lock()
+_dispatchers = {}
+_callbacks = {}
+_callback_ids = itertools.count(1)
+
+
+def _com_key(obj):
+    # A new wrapper is built on every access to a property, so event sources
+    # and events are identified by the COM object behind the wrapper.
+    obj = getattr(obj, "_i", obj)
+    try:
+        hash(obj)
+    except TypeError:
+        return id(obj)
+    return obj
+
+
+def _remove_dispatcher(dispatcher):
+    with _lock:
+        key = _com_key(dispatcher.event_source)
+        if _dispatchers.get(key) is dispatcher:
+            del _dispatchers[key]
+        for callback_id, d in list(_callbacks.items()):
+            if d is dispatcher:
+                del _callbacks[callback_id]
 
 
 def register_callback(callback, event_source, event_type):
     """register a callback function against an event_source for a given
     event_type.
 
+    Callbacks registered against the same event source share one listener
+    and one monitor thread.
+
     Arguments:
         callback - function to call when the event occurs
         event_source - the source to monitor events in
@@ -81,38 +244,36 @@ def register_callback(callback, event_source, event_type):
 
     returns the registration id (callback_id)
     """
-    global _callbacks
     event_interface = type_to_interface(event_type)
-    listener = event_source.create_listener()
-    event_source.register_listener(listener, [event_type], False)
-    quit = threading.Event()
-    t = threading.Thread(
-        target=_event_monitor,
-        args=(callback, event_source, listener, event_interface, quit),
-    )
-    t.daemon = True
-    t.start()
-    while t.is_alive() is False:
-        continue
-    _callbacks[t.ident] = (t, quit)
-    return t.ident
+    with _lock:
+        key = _com_key(event_source)
+        dispatcher = _dispatchers.get(key)
+        if dispatcher is None or dispatcher.quit.is_set():
+            dispatcher = _Dispatcher(event_source)
+            _dispatchers[key] = dispatcher
+        callback_id = next(_callback_ids)
+        _callbacks[callback_id] = dispatcher
+        dispatcher.add(callback_id, callback, event_type, event_interface)
+    return callback_id
 
 
 def unregister_callback(callback_id):
     """unregister a callback registration"""
-    global _callbacks
-    obj = _callbacks.pop(callback_id, None)
-    threads = []
-    if obj is not None:
-        t, quit = obj
-        quit.set()
-        threads.append(t)
-    for t in threads:
-        t.join()
+    with _lock:
+        dispatcher = _callbacks.pop(callback_id, None)
+        if dispatcher is None:
+            return
+        if dispatcher.remove(callback_id):
+            key = _com_key(dispatcher.event_source)
+            if _dispatchers.get(key) is dispatcher:
+                del _dispatchers[key]
+        else:
+            dispatcher = None
+    if dispatcher is not None:
+        dispatcher.stop()
 
 
 def _remove_all_callbacks():
-    global _callbacks
     for callback_id in list(_callbacks):
         unregister_callback(callback_id)
 
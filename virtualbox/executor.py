@@ -0,0 +1,280 @@
+"""Run many guest processes on one guest session
+================================================
+
+A :py:class:`GuestExecutor` starts commands on a single IGuestSession and
+services all of them, and their events, from one thread.  Each submitted command returns a
+``concurrent.futures.Future`` (the ``futures`` backport on Python 2) that
+resolves to a :py:class:`ProcessResult`::
+
+    with guest.create_session("Mick", "password") as gs:
+        with GuestExecutor(gs) as executor:
+            futures = [executor.submit("ping", ["-c", "1", host])
+                       for host in hosts]
+            for future in futures:
+                result = future.result()
+                print(result.exit_code, result.stdout)
+
+``IGuestSession.run_many`` is a shortcut for submitting a list of commands.
+
+The running processes' event sources are combined with an event source
+aggregator and read through one passive listener on the executor thread.
+An aggregator cannot be extended, so it is replaced when processes start,
+and the new listener is registered before the old one is drained.  An
+event marks only the process it came from to be serviced, so a busy
+process does not cost a round trip to every other one.  No more than
+``max_processes`` commands run at a time; the rest wait in a queue.
+"""
+
+from __future__ import absolute_import, print_function
+from collections import deque, namedtuple
+from concurrent.futures import Future
+import sys
+import threading
+
+from virtualbox import library
+from virtualbox.library_ext.guest_session import (
+    ExecuteStream,
+    WAKE_EVENTS,
+    terminated,
+)
+
+ProcessResult = namedtuple("ProcessResult", "exit_code stdout stderr process")
+
+EVENT_TYPES = WAKE_EVENTS + [library.VBoxEventType.on_guest_process_state_changed]
+
+
+class _Job(object):
+    def __init__(self, future, args, stdin):
+        self.future = future
+        self.args = args
+        self.stdin = stdin
+        self.stream = None
+        self.pid = None
+        self.exited = False
+        self.output = {"stdout": [], "stderr": []}
+
+    def finish(self):
+        process = self.stream.process
+        result = ProcessResult(
+            process.exit_code,
+            b"".join(self.output["stdout"]),
+            b"".join(self.output["stderr"]),
+            process,
+        )
+        self.future.set_result(result)
+
+
+class GuestExecutor(object):
+    """Run guest processes concurrently on one IGuestSession
+
+    Arguments:
+        guest_session - the IGuestSession to start processes on
+        max_processes - the most processes to run at a time
+        buffer_size - maximum number of bytes read from or written to a
+            process at a time
+    """
+
+    # Longest wait, in seconds, between polls while every process is quiet
+    poll_interval = 0.2
+
+    def __init__(self, guest_session, max_processes=64, buffer_size=65000):
+        if max_processes < 1:
+            raise ValueError("max_processes must be at least 1")
+        self.guest_session = guest_session
+        self.max_processes = max_processes
+        self.buffer_size = buffer_size
+        self._cond = threading.Condition()
+        self._queue = deque()
+        # (aggregator, listener) for the running processes' events, only
+        # used by the executor thread
+        self._events = None
+        self._shutdown = False
+        self._wake = threading.Event()
+        self._thread = threading.Thread(target=self._run)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.shutdown()
+
+    def submit(
+        self,
+        command,
+        arguments=None,
+        stdin=None,
+        environment=None,
+        flags=None,
+        priority=library.ProcessPriority.default,
+        affinity=None,
+        timeout_ms=0,
+    ):
+        """Queue command to run in the guest, see IGuestSession.execute
+
+        :rtype: Future resolving to a ProcessResult
+        """
+        future = Future()
+        args = (command, arguments, environment, flags, priority, affinity, timeout_ms)
+        with self._cond:
+            if self._shutdown:
+                raise RuntimeError("cannot submit after shutdown")
+            self._queue.append(_Job(future, args, stdin))
+            self._cond.notify()
+        self._wake.set()
+        return future
+
+    def shutdown(self, wait=True):
+        """Stop accepting commands.  Queued and running commands are still
+        completed.  If wait is True, block until they have."""
+        with self._cond:
+            self._shutdown = True
+            self._cond.notify()
+        self._wake.set()
+        if wait:
+            self._thread.join()
+
+    def _start(self, job):
+        if not job.future.set_running_or_notify_cancel():
+            return False
+        try:
+            process, flags = self.guest_session._create_process(*job.args)
+            process.wait_for(int(library.ProcessWaitResult.start), 0)
+            job.pid = process.pid
+            job.stream = ExecuteStream(process, flags, self.buffer_size, job.stdin)
+        except Exception as exc:
+            job.future.set_exception(exc)
+            return False
+        return True
+
+    def _listen(self, active):
+        """Listen to the events of the active jobs' processes through one
+        listener, return the jobs woken by events the old one had left"""
+        old, self._events = self._events, None
+        if active:
+            sources = [job.stream.process.event_source for job in active]
+            aggregator = self.guest_session.event_source.create_aggregator(sources)
+            listener = aggregator.create_listener()
+            aggregator.register_listener(listener, EVENT_TYPES, False)
+            self._events = (aggregator, listener)
+        woken = set()
+        if old is not None:
+            woken = self._read_events(active, old, 0)
+            self._unlisten(old)
+        return woken
+
+    @staticmethod
+    def _unlisten(events):
+        aggregator, listener = events
+        try:
+            aggregator.unregister_listener(listener)
+        except Exception:
+            print("Failed to unregister listener %s" % listener, file=sys.stderr)
+
+    @staticmethod
+    def _read_events(active, events, timeout):
+        """Wait up to timeout seconds for events, return the jobs they are
+        for"""
+        aggregator, listener = events
+        jobs = dict((job.pid, job) for job in active)
+        woken = set()
+        timeout_ms = int(timeout * 1000)
+        while True:
+            event = aggregator.get_event(listener, timeout_ms)
+            if not event:
+                return woken
+            timeout_ms = 0
+            try:
+                pid = library.IGuestProcessEvent(event).pid
+            except Exception:
+                # Can't tell which process it is for.
+                woken.update(active)
+            else:
+                if pid in jobs:
+                    woken.add(jobs[pid])
+            aggregator.event_processed(listener, event)
+
+    def _poll(self, job):
+        """Service job once, return True if it made progress"""
+        progress, chunks, job.exited = job.stream.step(job.exited)
+        for name, chunk in chunks:
+            job.output[name].append(chunk)
+        return progress
+
+    def _run(self):
+        active = []
+        # Jobs that made progress and are serviced again straight away, and
+        # jobs whose process has fired an event since they were serviced
+        ready = set()
+        woken = set()
+        delay = 0
+        try:
+            while True:
+                with self._cond:
+                    while not active and not self._queue and not self._shutdown:
+                        self._cond.wait()
+                    if not active and not self._queue:
+                        return
+                    started = []
+                    while (
+                        self._queue and len(active) + len(started) < self.max_processes
+                    ):
+                        started.append(self._queue.popleft())
+                self._wake.clear()
+                started = [job for job in started if self._start(job)]
+                if started:
+                    active.extend(started)
+                    woken.update(self._listen(active))
+                    # They may have output or have exited before we listened.
+                    woken.update(started)
+
+                if delay == self.poll_interval:
+                    # Quiet for a while.  Don't depend on the events alone.
+                    woken.update(active)
+                due = ready | woken
+                ready = set()
+                finished = False
+                for job in [job for job in active if job in due]:
+                    done = job.exited
+                    try:
+                        if self._poll(job) or job.exited != done:
+                            ready.add(job)
+                        elif done:
+                            # Exited and its output has been drained.
+                            active.remove(job)
+                            finished = True
+                            job.finish()
+                        elif job in woken and terminated(job.stream.process):
+                            # Don't depend on the state changed event alone.
+                            job.exited = True
+                            ready.add(job)
+                    except Exception as exc:
+                        active.remove(job)
+                        finished = True
+                        job.future.set_exception(exc)
+                woken = set()
+                if not active and self._events is not None:
+                    self._listen(active)
+
+                if ready or finished or not active:
+                    delay = 0
+                    continue
+                delay = min(max(delay * 2, 0.001), self.poll_interval)
+                # get_event can't be interrupted, so new commands wait for
+                # at most one delay.
+                if not self._wake.is_set():
+                    woken = self._read_events(active, self._events, delay)
+        except Exception as exc:
+            # Fail everything rather than leave callers waiting forever.
+            with self._cond:
+                self._shutdown = True
+                active.extend(self._queue)
+                self._queue.clear()
+            for job in active:
+                if not job.future.done():
+                    job.future.set_exception(exc)
+        finally:
+            events, self._events = self._events, None
+            if events is not None:
+                self._unlisten(events)
@@ -0,0 +1,204 @@
+"""Run a guest command across a fleet of machines
+================================================
+
+:py:func:`fan_out` runs one command on many running machines at once and
+yields a :py:class:`FleetResult` for each machine as soon as it finishes::
+
+    vbox = VirtualBox()
+    machines = [m for m in vbox.machines if m.state == MachineState.running]
+    for result in fan_out(machines, "/usr/bin/uptime",
+                          username="Mick", password="password",
+                          max_workers=32, timeout=60):
+        if result.error is not None:
+            print(result.machine.name, "failed:", result.error)
+        else:
+            print(result.machine.name, result.exit_code, result.stdout)
+
+Each machine is locked with a shared session, a guest session is opened
+with IGuest.create_session and the command is run with
+IGuestSession.execute.  A failure or timeout on one machine is reported in
+its result and does not stop the others.
+"""
+
+from __future__ import absolute_import
+from collections import namedtuple
+import threading
+import time
+
+try:
+    import queue
+except ImportError:
+    import Queue as queue
+
+from virtualbox.library import ProcessStatus
+
+FleetResult = namedtuple("FleetResult", "machine exit_code stdout stderr error elapsed")
+
+
+class FleetTimeout(Exception):
+    """Raised when a machine does not finish the command in time"""
+
+
+def _timeout_ms(deadline):
+    """Return the milliseconds left until deadline for a VirtualBox call,
+    where 0 means no timeout"""
+    if deadline is None:
+        return 0
+    remaining = int((deadline - time.time()) * 1000)
+    if remaining <= 0:
+        raise FleetTimeout("timed out")
+    return remaining
+
+
+def run_on_machine(
+    machine,
+    command,
+    arguments=None,
+    username="",
+    password="",
+    domain="",
+    stdin="",
+    timeout=None,
+):
+    """Run command on a running machine and return a FleetResult.
+
+    timeout is the number of seconds the whole run, from locking the
+    machine to the command exiting, may take.  None waits forever.
+    Errors are returned in FleetResult.error rather than raised.
+    """
+    t0 = time.time()
+    deadline = None if timeout is None else t0 + timeout
+    try:
+        session = machine.create_session()
+        try:
+            guest = session.console.guest
+            guest_session = guest.create_session(
+                username, password, domain, timeout_ms=_timeout_ms(deadline)
+            )
+            with guest_session:
+                process, stdout, stderr = guest_session.execute(
+                    command, arguments, stdin, timeout_ms=_timeout_ms(deadline)
+                )
+                # The process object is only usable while its session is open.
+                status = process.status
+                exit_code = process.exit_code
+        finally:
+            session.unlock_machine()
+        error = None
+        if status in (
+            ProcessStatus.timed_out_killed,
+            ProcessStatus.timed_out_abnormally,
+        ):
+            error = FleetTimeout("%s timed out" % command)
+        return FleetResult(machine, exit_code, stdout, stderr, error, time.time() - t0)
+    except Exception as exc:
+        return FleetResult(machine, None, None, None, exc, time.time() - t0)
+
+
+def fan_out(
+    machines,
+    command,
+    arguments=None,
+    username="",
+    password="",
+    domain="",
+    stdin="",
+    max_workers=16,
+    timeout=300,
+):
+    """Run command on every machine in parallel.
+
+    No more than max_workers machines are worked on at a time.  Each
+    machine has timeout seconds to finish, see run_on_machine.  The
+    deadline is also enforced on the host: a machine that has not finished
+    by then, for example because a VirtualBox call is stuck, is reported
+    with a FleetTimeout error, and its worker is replaced so it no longer
+    holds up the rest.  stdin is sent to every machine, so it has to be
+    bytes or text rather than a file object or iterator.
+
+    Yield a FleetResult per machine in the order they finish.  If the
+    caller stops iterating early, machines not yet started are skipped.
+    """
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1")
+    machines = list(machines)
+    pending = queue.Queue()
+    for index, machine in enumerate(machines):
+        pending.put((index, machine))
+    results = queue.Queue()
+    stop = threading.Event()
+    lock = threading.Lock()
+    # index -> (machine, start time) of the machines being worked on
+    started = {}
+    # indexes of the machines reported as timed out by the host
+    expired = set()
+
+    def worker():
+        while not stop.is_set():
+            try:
+                index, machine = pending.get_nowait()
+            except queue.Empty:
+                return
+            with lock:
+                started[index] = (machine, time.time())
+            result = run_on_machine(
+                machine,
+                command,
+                arguments,
+                username,
+                password,
+                domain,
+                stdin,
+                timeout,
+            )
+            results.put((index, result))
+            with lock:
+                if index in expired:
+                    # A replacement worker has taken over this one's slot.
+                    return
+
+    def start_worker():
+        thread = threading.Thread(target=worker)
+        thread.daemon = True
+        thread.start()
+
+    for _ in range(min(max_workers, len(machines))):
+        start_worker()
+    reported = 0
+    try:
+        while reported < len(machines):
+            wait = None
+            if timeout is not None:
+                now = time.time()
+                late = []
+                with lock:
+                    for index, (machine, t0) in list(started.items()):
+                        if t0 + timeout <= now:
+                            del started[index]
+                            expired.add(index)
+                            late.append((machine, t0))
+                    deadlines = [t0 + timeout for _, t0 in started.values()]
+                for machine, t0 in late:
+                    reported += 1
+                    start_worker()
+                    error = FleetTimeout(
+                        "%s did not finish within %ss" % (command, timeout)
+                    )
+                    yield FleetResult(machine, None, None, None, error, now - t0)
+                if late:
+                    continue
+                # A machine started from now on has a later deadline.
+                wait = min(deadlines) - now if deadlines else max(timeout, 0.01)
+            try:
+                index, result = results.get(timeout=wait)
+            except queue.Empty:
+                continue
+            with lock:
+                started.pop(index, None)
+                if index in expired:
+                    # Already reported as timed out.
+                    continue
+            reported += 1
+            yield result
+    finally:
+        stop.set()
@@ -0,0 +1,249 @@
+"""Reuse guest sessions
+=====================
+
+Logging in to a guest takes seconds.  :py:class:`GuestSessionPool` keeps
+guest sessions open after use and hands them out again to the next caller
+for the same machine, user and domain::
+
+    pool = GuestSessionPool(idle_timeout=300)
+    try:
+        for step in steps:
+            with pool.session(machine, "Mick", "password") as gs:
+                gs.execute(step.command, step.arguments)
+    finally:
+        pool.close()
+
+A pooled session is checked with a single read of its status before it is
+handed out and again when it is returned.  Sessions that are no longer
+started are closed and dropped.  While there are idle sessions a
+background thread closes each one once it has been idle for
+``idle_timeout`` seconds.  The pool holds one shared lock per machine for
+as long as it has guest sessions open on it, and takes a new one if the
+machine was restarted and the old lock is gone.
+"""
+
+from __future__ import absolute_import
+from contextlib import contextmanager
+import threading
+import time
+
+from virtualbox.library import GuestSessionStatus
+from virtualbox.library import SessionState
+
+
+class GuestSessionPool(object):
+    """Pool of open IGuestSessions keyed by (machine, user, domain)
+
+    Arguments:
+        max_idle - the most idle sessions kept per key; more are closed
+        idle_timeout - seconds an idle session is kept, None keeps it
+            until the pool is closed
+        timeout_ms - passed to IGuest.create_session for new sessions
+        session_name - name given to new guest sessions
+    """
+
+    def __init__(
+        self, max_idle=4, idle_timeout=300, timeout_ms=60000, session_name="pyvbox"
+    ):
+        self.max_idle = max_idle
+        self.idle_timeout = idle_timeout
+        self.timeout_ms = timeout_ms
+        self.session_name = session_name
+        self._lock = threading.Lock()
+        # key -> [(IGuestSession, time returned), ...], oldest first
+        self._idle = {}
+        # id(IGuestSession) -> (IGuestSession, key) for sessions handed out
+        self._leased = {}
+        # machine id -> [ISession, number of guest sessions open, Lock]
+        self._machines = {}
+        self._closed = False
+        # Thread closing idle sessions as they expire, see _reap
+        self._reaper = None
+        self._stop = threading.Event()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def __len__(self):
+        """Return the number of guest sessions open, idle or in use"""
+        with self._lock:
+            return len(self._leased) + sum(len(idle) for idle in self._idle.values())
+
+    @staticmethod
+    def _healthy(guest_session):
+        try:
+            return guest_session.status == GuestSessionStatus.started
+        except Exception:
+            return False
+
+    def _discard(self, guest_session, key):
+        """Close guest_session and drop the machine lock once unused"""
+        try:
+            guest_session.close()
+        except Exception:
+            pass
+        self._release_machine(key)
+
+    def _expired(self, now):
+        # Called with self._lock held.  Remove and return expired sessions.
+        expired = []
+        if self.idle_timeout is None:
+            return expired
+        for key, idle in list(self._idle.items()):
+            while idle and now - idle[0][1] >= self.idle_timeout:
+                expired.append((idle.pop(0)[0], key))
+            if not idle:
+                del self._idle[key]
+        return expired
+
+    def evict_idle(self):
+        """Close the sessions that have been idle for too long"""
+        with self._lock:
+            expired = self._expired(time.time())
+        for guest_session, key in expired:
+            self._discard(guest_session, key)
+
+    def _start_reaper(self):
+        # Called with self._lock held.
+        if self.idle_timeout is None or self._reaper is not None:
+            return
+        self._reaper = threading.Thread(target=self._reap)
+        self._reaper.daemon = True
+        self._reaper.start()
+
+    def _reap(self):
+        """Evict idle sessions as they expire, until none are left"""
+        while True:
+            with self._lock:
+                returned = [idle[0][1] for idle in self._idle.values() if idle]
+                if self._closed or not returned or self.idle_timeout is None:
+                    self._reaper = None
+                    return
+                delay = min(returned) + self.idle_timeout - time.time()
+            if delay > 0 and self._stop.wait(delay):
+                continue
+            self.evict_idle()
+
+    def _machine_session(self, entry, machine):
+        """Return the shared ISession of entry, locking machine again if the
+        lock was lost, for example because the machine was restarted"""
+        with entry[2]:
+            session = entry[0]
+            if session is not None:
+                try:
+                    if session.state == SessionState.locked:
+                        return session
+                except Exception:
+                    pass
+                try:
+                    session.unlock_machine()
+                except Exception:
+                    pass
+            entry[0] = session = machine.create_session()
+            return session
+
+    def acquire(self, machine, username, password, domain=""):
+        """Return an open IGuestSession for username on machine
+
+        An idle session for the same machine, user and domain is reused
+        if it is still healthy, else a new one is created.  Give it back
+        with release.
+        """
+        key = (machine.id_p, username, domain)
+        self.evict_idle()
+        while True:
+            with self._lock:
+                if self._closed:
+                    raise RuntimeError("pool is closed")
+                idle = self._idle.get(key)
+                guest_session = idle.pop() if idle else None
+                if guest_session is None:
+                    break
+                guest_session = guest_session[0]
+                self._leased[id(guest_session)] = (guest_session, key)
+            if self._healthy(guest_session):
+                return guest_session
+            self._forget(guest_session)
+            self._discard(guest_session, key)
+
+        with self._lock:
+            entry = self._machines.get(key[0])
+            if entry is None:
+                entry = self._machines[key[0]] = [None, 0, threading.Lock()]
+            entry[1] += 1
+        try:
+            guest = self._machine_session(entry, machine).console.guest
+            guest_session = guest.create_session(
+                username,
+                password,
+                domain,
+                session_name=self.session_name,
+                timeout_ms=self.timeout_ms,
+            )
+        except Exception:
+            self._release_machine(key)
+            raise
+        with self._lock:
+            self._leased[id(guest_session)] = (guest_session, key)
+        return guest_session
+
+    def _release_machine(self, key):
+        with self._lock:
+            entry = self._machines.get(key[0])
+            if entry is None:
+                return
+            entry[1] -= 1
+            if entry[1] > 0:
+                return
+            del self._machines[key[0]]
+        if entry[0] is not None:
+            try:
+                entry[0].unlock_machine()
+            except Exception:
+                pass
+
+    def _forget(self, guest_session):
+        with self._lock:
+            return self._leased.pop(id(guest_session), (None, None))[1]
+
+    def release(self, guest_session, discard=False):
+        """Return a session from acquire to the pool.  It is closed instead
+        if discard is True, it is no longer healthy, or the pool is full."""
+        key = self._forget(guest_session)
+        if key is None:
+            raise ValueError("guest session was not acquired from this pool")
+        if not discard and self._healthy(guest_session):
+            with self._lock:
+                idle = self._idle.setdefault(key, [])
+                if not self._closed and len(idle) < self.max_idle:
+                    idle.append((guest_session, time.time()))
+                    self._start_reaper()
+                    return
+        self._discard(guest_session, key)
+
+    @contextmanager
+    def session(self, machine, username, password, domain=""):
+        """Acquire a guest session for the duration of a with block"""
+        guest_session = self.acquire(machine, username, password, domain)
+        try:
+            yield guest_session
+        finally:
+            self.release(guest_session)
+
+    def close(self):
+        """Close the idle sessions.  Sessions in use are closed when they
+        are released."""
+        with self._lock:
+            self._closed = True
+            self._stop.set()
+            idle = [
+                (entry[0], key)
+                for key, entries in self._idle.items()
+                for entry in entries
+            ]
+            self._idle.clear()
+        for guest_session, key in idle:
+            self._discard(guest_session, key)
@@ -1,6 +1,8 @@
 """This module provides the base types used by :mod:`virtualbox.library`."""
 
+import os
 import re
+import json
 import inspect
 import platform
 import time
@@ -20,16 +22,92 @@ def pythonic_name(name):
     return name
 
 
+DOCS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "_library", "docs")
+
+
+class LazyDoc(object):
+    """LazyDoc is the class docstring of code generated by a lean build.
+
+    The docstrings of a lean build are written to one JSON file per class
+    under _library/docs.  The file is read the first time the class's
+    __doc__ is accessed, at which point the docstrings of the class's
+    properties and methods are attached as well.
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self._docs = None
+
+    def load(self):
+        if self._docs is None:
+            path = os.path.join(DOCS_PATH, "%s.json" % self.name)
+            try:
+                with open(path, "rb") as f:
+                    self._docs = json.loads(f.read().decode("utf-8"))
+            except (IOError, OSError, ValueError):
+                self._docs = {}
+        return self._docs
+
+    def _attach(self, owner, docs):
+        for member, doc in docs.items():
+            attr = owner.__dict__.get(member)
+            if isinstance(attr, property):
+                setattr(owner, member, property(attr.fget, attr.fset, attr.fdel, doc))
+            elif inspect.isfunction(attr) and attr.__doc__ is None:
+                attr.__doc__ = doc
+
+    def __get__(self, obj, cls):
+        attached = self._docs is not None
+        docs = self.load()
+        if not attached:
+            for owner in cls.__mro__:
+                if owner.__dict__.get("__doc__") is self:
+                    self._attach(owner, docs)
+                    break
+        return docs.get("__doc__")
+
+
+class _EnumDoc(object):
+    """Descriptor serving the class docstring when accessed on an Enum class
+    and the value's docstring when accessed on an Enum instance."""
+
+    def __init__(self, doc):
+        self.doc = doc
+
+    def __get__(self, obj, cls):
+        if obj is None:
+            if isinstance(self.doc, LazyDoc):
+                return self.doc.__get__(None, cls)
+            return self.doc
+        doc = cls._lookup_doc.get(obj._value)
+        if doc is None and isinstance(self.doc, LazyDoc):
+            doc = self.doc.load().get("_enums", {}).get(str(obj._value))
+        return doc
+
+
 class EnumType(type):
     """EnumType is a metaclass for Enum. It is responsible for configuring
-    the Enum class object's values defined in Enum.lookup_label"""
+    the Enum class object's values defined in Enum.lookup_label.  Each value
+    is built once and interned in the class's _instances table."""
+
+    def __new__(mcs, name, bases, dct):
+        dct.setdefault("__slots__", ())
+        if not isinstance(dct.get("__doc__"), _EnumDoc):
+            dct["__doc__"] = _EnumDoc(dct.get("__doc__"))
+        return super(EnumType, mcs).__new__(mcs, name, bases, dct)
 
     def __init__(cls, name, bases, dct):
-        cls._value = None
-        cls._lookup_label = dict((v, l) for l, v, _ in cls._enums)
-        cls._lookup_doc = dict((v, d) for _, v, d in cls._enums)
-        for l, v, _ in cls._enums:
-            setattr(cls, pythonic_name(l), cls(v))
+        cls._lookup_label = dict((row[1], row[0]) for row in cls._enums)
+        cls._lookup_doc = dict((row[1], row[2]) for row in cls._enums if len(row) > 2)
+        cls._instances = {}
+        for row in cls._enums:
+            label, value = row[0], row[1]
+            obj = cls._instances.get(value)
+            if obj is None:
+                obj = object.__new__(cls)
+                obj._value = value
+                cls._instances[value] = obj
+            setattr(cls, pythonic_name(label), obj)
 
     def __getitem__(cls, k):
         if not hasattr(cls, k):
@@ -60,30 +138,38 @@ def add_metaclass(metaclass):
 class Enum(object):
     """Enum objects provide a container for VirtualBox enumerations"""
 
+    __slots__ = ("_value",)
+
     _enums = {}
 
-    def __init__(self, value):
-        if value not in self._lookup_label:
+    def __new__(cls, value):
+        try:
+            return cls._instances[value]
+        except (KeyError, TypeError):
             raise ValueError("Can not find enumeration where value=%s" % value)
-        self._value = value
-        self.__doc__ = self._lookup_doc[self._value]
+
+    def __reduce__(self):
+        return (self.__class__, (self._value,))
 
     def __str__(self):
-        if self._value is None:
-            return "None"
         return self._lookup_label[self._value]
 
     def __int__(self):
         return self._value
 
+    def __hash__(self):
+        return hash(self._value)
+
     def __repr__(self):
         return "%s(%s)" % (self.__class__.__name__, self._value)
 
     def __eq__(self, k):
-        return self.__cmp__(k) == 0
+        if isinstance(k, Enum):
+            return self._value == k._value
+        return self._value == int(k)
 
     def __ne__(self, k):
-        return self.__cmp__(k) != 0
+        return not self.__eq__(k)
 
     def __lt__(self, k):
         return int(self) < int(k)
@@ -155,7 +241,26 @@ class Interface(object):
         else:
             return cast_to_valuetype(value)
 
-    def _search_attr(self, name, prefix=None):
+    # Resolution cache shared by all Interface instances.  Maps
+    # (COM object type, Interface class, member name, prefix) onto the
+    # spelling of the member that was found on the COM object and whether
+    # that member is a callable accessor.  The Interface class is part of
+    # the key because dynamic COM dispatch objects share a single Python
+    # type across every COM interface.
+    _attr_cache = {}
+
+    def _resolve_attr(self, name, prefix=None):
+        """Return the (attr, is_callable) pair for name on the COM object"""
+        key = (type(self._i), self.__class__, name, prefix)
+        resolved = Interface._attr_cache.get(key)
+        if resolved is not None:
+            attr_name, is_callable = resolved
+            attr = getattr(self._i, attr_name, self)
+            if attr is not self:
+                return attr, is_callable
+            # The cached spelling has gone away, fall back to probing.
+            Interface._attr_cache.pop(key, None)
+
         attr_names = [name]
         if prefix is not None:
             attr_names.append(prefix + name[0].upper() + name[1:])
@@ -173,18 +278,24 @@ class Interface(object):
             break
         else:
             raise AttributeError("Failed to find attribute %s in %s" % (name, self))
+        is_callable = inspect.isfunction(attr) or inspect.ismethod(attr)
+        Interface._attr_cache[key] = (attr_name, is_callable)
+        return attr, is_callable
+
+    def _search_attr(self, name, prefix=None):
+        attr, _ = self._resolve_attr(name, prefix=prefix)
         return attr
 
     def _get_attr(self, name):
-        attr = self._search_attr(name, prefix="get")
-        if inspect.isfunction(attr) or inspect.ismethod(attr):
+        attr, is_callable = self._resolve_attr(name, prefix="get")
+        if is_callable:
             return self._call_method(attr)
         else:
             return attr
 
     def _set_attr(self, name, value):
-        attr = self._search_attr(name, prefix="set")
-        if inspect.isfunction(attr) or inspect.ismethod(attr):
+        attr, is_callable = self._resolve_attr(name, prefix="set")
+        if is_callable:
             return self._call_method(attr, value)
         else:
             if isinstance(value, Enum):
@@ -194,9 +305,8 @@ class Interface(object):
     def _call(self, name, in_p=None):
         if in_p is None:
             in_p = []
-        global vbox_error
-        method = self._search_attr(name)
-        if inspect.isfunction(method) or inspect.ismethod(method):
+        method, is_callable = self._resolve_attr(name)
+        if is_callable:
             return self._call_method(method, in_p=in_p)
         else:
             return method
@@ -25,6 +25,8 @@ from .event_source import IEventSource  # noqa: F401
 from .mouse import IMouse  # noqa: F401
 from .process import IProcess  # noqa: F401
 from .guest_process import IGuestProcess  # noqa: F401
+from .file import IFile  # noqa: F401
+from .guest_file import IGuestFile  # noqa: F401
 from .appliance import IAppliance  # noqa: F401
 from .virtual_system_description import IVirtualSystemDescription  # noqa: F401
 
@@ -1,6 +1,9 @@
 """
 Add helper code to the default IEventSource class.
 """
+
+import sys
+
 from virtualbox import library, events
 
 
@@ -10,3 +13,25 @@ class IEventSource(library.IEventSource):
     def register_callback(self, callback, event_type):
         """register a callback function for the provided given event_type"""
         return events.register_callback(callback, self, event_type)
+
+    def stream(self, event_types, maxsize=1000, overflow="drop_oldest", **kwargs):
+        """Return an asynchronous iterator over events of event_types
+
+        Python 3.5 or later only.  Events are typed event interfaces and are
+        acknowledged automatically.  See virtualbox.aio.EventStream for
+        the maxsize and overflow ("drop_oldest", "coalesce", "block")
+        options.
+
+        Example::
+
+            async for event in vbox.event_source.stream([event_type]):
+                ...
+        """
+        if sys.version_info < (3, 5):
+            raise NotImplementedError("IEventSource.stream needs Python 3.5 or later")
+        # virtualbox.aio uses async def, so only import it here.
+        from virtualbox import aio
+
+        return aio.EventStream(
+            self, event_types, maxsize=maxsize, overflow=overflow, **kwargs
+        )
@@ -0,0 +1,26 @@
+"""
+Add helper code to the default IFile class.
+"""
+
+from virtualbox import library
+from virtualbox import utils
+
+
+class IFile(library.IFile):
+    __doc__ = library.IFile.__doc__
+
+    # Accept bytes as well as a list so that data does not have to be
+    # converted to one string per byte.
+    def write(self, data, timeout_ms):
+        if isinstance(data, utils.BINARY_TYPES + (bytearray,)):
+            return self._call("write", in_p=[bytes(data), timeout_ms])
+        return super(IFile, self).write(data, timeout_ms)
+
+    write.__doc__ = library.IFile.write.__doc__
+
+    def write_at(self, offset, data, timeout_ms):
+        if isinstance(data, utils.BINARY_TYPES + (bytearray,)):
+            return self._call("writeAt", in_p=[offset, bytes(data), timeout_ms])
+        return super(IFile, self).write_at(offset, data, timeout_ms)
+
+    write_at.__doc__ = library.IFile.write_at.__doc__
@@ -2,9 +2,11 @@
 Add helper code to the default IGuest class.
 """
 
+import threading
 import time
 import os
 import virtualbox
+from virtualbox import events
 from virtualbox import library
 
 
@@ -12,43 +14,103 @@ from virtualbox import library
 class IGuest(library.IGuest):
     __doc__ = library.IGuest.__doc__
 
+    # Wait for the new session to start.  If timeout_ms is not 0, first wait
+    # for the guest additions to reach the userland run-level, all within
+    # timeout_ms.  Otherwise allow the session 5 seconds to start.  Both
+    # waits are driven by events.  Raise SystemError if the session fails or
+    # does not start in time.
     def create_session(
         self, user, password, domain="", session_name="pyvbox", timeout_ms=0
     ):
+        budget_ms = timeout_ms if timeout_ms != 0 else 5000
+        deadline = time.time() + budget_ms / 1000.0
+        if timeout_ms != 0:
+            self._wait_for_run_level(
+                library.AdditionsRunLevelType.userland, deadline, budget_ms
+            )
         session = super(IGuest, self).create_session(
             user, password, domain, session_name
         )
-        for i in range(50):
-            if session.status == library.GuestSessionStatus.started:
-                break
-            time.sleep(0.1)
-        else:
+        try:
+            self._wait_for_session_start(session, deadline, budget_ms)
+        except SystemError as exc:
             if len(password) == 0:
                 raise SystemError(
-                    "GuestSession failed to start. Could be because "
-                    "of using an empty password."
+                    "%s. Could be because of using an empty password." % exc
                 )
-            raise SystemError("GuestSession failed to start")
-        if timeout_ms != 0:
-            # There is probably a better way to to this?
-            if "win" in self.os_type_id.lower():
-                test_file = "C:\\Windows\\System32\\calc.exe"
-            else:
-                test_file = "/bin/sh"
-            while True:
-                try:
-                    session.file_exists(test_file)
-                except library.VBoxError:
-                    time.sleep(0.5)
-                    timeout_ms -= 500
-                    if timeout_ms <= 0:
-                        raise
-                    continue
-                break
+            raise
         return session
 
     create_session.__doc__ = library.IGuest.create_session.__doc__
 
+    def _wait_for_run_level(self, run_level, deadline, budget_ms):
+        changed = threading.Event()
+
+        def on_status_changed(event):
+            changed.set()
+
+        event_type = library.VBoxEventType.on_guest_additions_status_changed
+        callback_id = events.register_callback(
+            on_status_changed, self.event_source, event_type
+        )
+        try:
+            while self.additions_run_level < run_level:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    raise SystemError(
+                        "Guest additions did not reach run-level %s within %s ms "
+                        "(run-level %s)"
+                        % (run_level, budget_ms, self.additions_run_level)
+                    )
+                changed.wait(remaining)
+                changed.clear()
+        finally:
+            events.unregister_callback(callback_id)
+
+    @staticmethod
+    def _wait_for_session_start(session, deadline, budget_ms):
+        changed = threading.Event()
+        errors = []
+
+        def on_state_changed(event):
+            try:
+                if event.status > library.GuestSessionStatus.started:
+                    errors.append(event.error.text)
+            finally:
+                changed.set()
+
+        event_type = library.VBoxEventType.on_guest_session_state_changed
+        callback_id = events.register_callback(
+            on_state_changed, session.event_source, event_type
+        )
+        try:
+            while True:
+                # Check after subscribing so that a start is not missed.
+                status = session.status
+                if status == library.GuestSessionStatus.started:
+                    return
+                if status > library.GuestSessionStatus.started:
+                    error = ": %s" % errors[-1] if errors else ""
+                    raise SystemError(
+                        "GuestSession failed to start (status %s)%s" % (status, error)
+                    )
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    raise SystemError(
+                        "GuestSession failed to start within %s ms (status %s)"
+                        % (budget_ms, status)
+                    )
+                changed.wait(remaining)
+                changed.clear()
+        except SystemError:
+            try:
+                session.close()
+            except Exception:
+                pass
+            raise
+        finally:
+            events.unregister_callback(callback_id)
+
     # Update guest additions helper
     def update_guest_additions(self, source=None, arguments=None, flags=None):
         if arguments is None:
@@ -0,0 +1,11 @@
+"""
+Add helper code to the default IGuestFile class.
+"""
+
+from virtualbox import library
+from virtualbox.library_ext import file
+
+
+# IGuestFile inherits the byte friendly writes of our IFile.
+class IGuestFile(file.IFile):
+    __doc__ = library.IGuestFile.__doc__
@@ -2,10 +2,209 @@
 Add helper code to the default IGuestSession class.
 """
 
-import time
+import threading
+
+from virtualbox import events
 from virtualbox import library
 from virtualbox import utils
 
+# Events on a guest process's event source that mean it may have input
+# accepted or output waiting
+WAKE_EVENTS = [
+    library.VBoxEventType.on_guest_process_output,
+    library.VBoxEventType.on_guest_process_input_notify,
+]
+
+# Output handles of a guest process and the names execute_stream uses
+_OUTPUT_HANDLES = [
+    (1, "stdout", library.ProcessCreateFlag.wait_for_std_out),
+    (2, "stderr", library.ProcessCreateFlag.wait_for_std_err),
+]
+
+
+def terminated(process):
+    "Return True if the guest process has exited, however it ended"
+    return process.status >= library.ProcessStatus.terminated_normally
+
+
+def _writer(target):
+    "Return a function that writes bytes to a file object or socket"
+    sendall = getattr(target, "sendall", None)
+    if sendall is not None:
+        return sendall
+    return target.write
+
+
+class _StdinWriter(object):
+    """Feed input to a process's stdin a chunk at a time"""
+
+    def __init__(self, process, stdin, chunk_size):
+        self.process = process
+        self.done = False
+        self._chunks = utils.iter_chunks(stdin, chunk_size)
+        self._pending = b""
+
+    def write(self):
+        """Offer the guest the next chunk of input.
+
+        Return the number of bytes accepted, which is 0 while the guest's
+        stdin is full.  End of file is sent once the input is exhausted.
+        """
+        if not self._pending:
+            self._pending = next(self._chunks, None)
+            if self._pending is None:
+                flags = [library.ProcessInputFlag.end_of_file]
+                self.process.write_array(0, flags, [], 0)
+                self.done = True
+                return 0
+        flags = [library.ProcessInputFlag.none]
+        wrote = self.process.write_array(0, flags, self._pending, 0)
+        self._pending = self._pending[wrote:]
+        return wrote
+
+
+class ExecuteStream(object):
+    """Output of a process started by IGuestSession.execute_stream
+
+    Iterating over an ExecuteStream yields ("stdout", chunk) and
+    ("stderr", chunk) tuples as the output is read from the guest.  No more
+    than buffer_size bytes are read at a time, so the output never has to
+    be held in memory as a whole.  Input from stdin is written in chunks of
+    the same size between reads, so a guest that produces output while it
+    consumes its input never stalls on a full pipe.
+
+    Reads are paced by the process's event source rather than a fixed
+    sleep.  VirtualBox answers each read with an IGuestProcessOutputEvent
+    and reports the exit with an IGuestProcessStateChangedEvent.  While
+    output keeps coming it is read back to back.  When the guest is quiet
+    the stream waits for the next event, backing off up to poll_interval
+    seconds between reads.
+
+    Attributes:
+        process - the IGuestProcess that was started
+    """
+
+    # Longest wait, in seconds, between reads while the guest is quiet
+    poll_interval = 0.2
+
+    def __init__(self, process, flags, buffer_size, stdin=None):
+        self.process = process
+        self.buffer_size = buffer_size
+        self._stdin = None
+        if stdin:
+            self._stdin = _StdinWriter(process, stdin, buffer_size)
+        self._handles = [
+            (handle, name, flag)
+            for handle, name, flag in _OUTPUT_HANDLES
+            if flag in flags
+        ]
+
+    def step(self, exited):
+        """Offer the next chunk of stdin and read the output waiting.
+
+        This services the process once without waiting, for callers such
+        as GuestExecutor that drive many streams from their own loop.
+
+        exited tells whether the process is known to have exited, in which
+        case no more input is written.  Return (progress, chunks, exited)
+        where progress is True if input was accepted or output received.
+        """
+        progress = False
+        stdin = self._stdin
+        if stdin is not None and not stdin.done and not exited:
+            # Bytes the guest accepted count as progress, like output.
+            try:
+                progress = stdin.write() > 0 or stdin.done
+            except library.VBoxError:
+                if not terminated(self.process):
+                    raise
+                # The process exited without reading all of its input.
+                exited = True
+        chunks = []
+        for handle, name, flag in self._handles:
+            chunk = utils.to_bytes(self.process.read(handle, self.buffer_size, 0))
+            if chunk:
+                progress = True
+                chunks.append((name, chunk))
+        return progress, chunks, exited
+
+    def __iter__(self):
+        process = self.process
+        wake = threading.Event()
+        exited = threading.Event()
+
+        def on_io(event):
+            wake.set()
+
+        def on_state_changed(event):
+            if event.status >= library.ProcessStatus.terminated_normally:
+                exited.set()
+            wake.set()
+
+        event_source = process.event_source
+        callback_ids = [
+            events.register_callback(on_io, event_source, event_type)
+            for event_type in WAKE_EVENTS
+        ]
+        callback_ids.append(
+            events.register_callback(
+                on_state_changed,
+                event_source,
+                library.VBoxEventType.on_guest_process_state_changed,
+            )
+        )
+        try:
+            # The process may have exited before we subscribed.
+            if terminated(process):
+                exited.set()
+            delay = 0
+            woken = False
+            while True:
+                done = exited.is_set()
+                wake.clear()
+                progress, chunks, done_now = self.step(done)
+                if done_now:
+                    exited.set()
+                for name, chunk in chunks:
+                    yield name, chunk
+                if progress:
+                    delay = 0
+                    continue
+                if done:
+                    # The process has exited and its output has been drained.
+                    break
+                if woken or delay == self.poll_interval:
+                    # Woken without output, or quiet for a while.  Don't
+                    # depend on the state changed event alone.
+                    if terminated(process):
+                        exited.set()
+                        continue
+                delay = min(max(delay * 2, 0.001), self.poll_interval)
+                woken = wake.wait(delay)
+        finally:
+            for callback_id in callback_ids:
+                events.unregister_callback(callback_id)
+
+    def pipe(self, stdout=None, stderr=None):
+        """Copy the output to file objects or sockets as it arrives
+
+        Arguments:
+            stdout - target for stdout, None discards it
+            stderr - target for stderr, None discards it
+
+        Return IGuestProcess
+        """
+        writers = {}
+        if stdout is not None:
+            writers["stdout"] = _writer(stdout)
+        if stderr is not None:
+            writers["stderr"] = _writer(stderr)
+        for name, chunk in self:
+            write = writers.get(name)
+            if write is not None:
+                write(chunk)
+        return self.process
+
 
 # Add context management to IGuestSession
 class IGuestSession(library.IGuestSession):
@@ -17,7 +216,7 @@ class IGuestSession(library.IGuestSession):
     def __exit__(self, *_):
         self.close()
 
-    def execute(
+    def execute_stream(
         self,
         command,
         arguments=None,
@@ -27,26 +226,39 @@ class IGuestSession(library.IGuestSession):
         priority=library.ProcessPriority.default,
         affinity=None,
         timeout_ms=0,
+        buffer_size=65000,
     ):
-        """Execute a command in the Guest
+        """Execute a command in the Guest and stream its output
 
-        Arguments:
-            command - Command to execute.
-            arguments - List of arguments for the command
-            stdin - A buffer to write to the stdin of the command.
-            environment - See IGuestSession.create_process?
-            flags - List of ProcessCreateFlag objects.
-                Default value set to [wait_for_std_err,
-                                      wait_for_stdout,
-                                      ignore_orphaned_processes]
-            timeout_ms - ms to wait for the process to complete.
-                If 0, wait for ever...
-            priority - Set the ProcessPriority priority to be used for
-                execution.
-            affinity - Process affinity to use for execution.
+        Takes the same arguments as execute, plus:
+            buffer_size - maximum number of bytes read from or written to
+                the guest at a time.
 
-        Return IProcess, stdout, stderr
+        stdin is written to the process as the stream is iterated.
+
+        Example::
+
+            stream = session.execute_stream("make", ["all"])
+            for name, chunk in stream:
+                ...
+            print(stream.process.exit_code)
+
+            # or copy the output straight to a file
+            with open("build.log", "wb") as log:
+                session.execute_stream("make", ["all"]).pipe(stdout=log)
+
+        Return ExecuteStream
         """
+        process, flags = self._create_process(
+            command, arguments, environment, flags, priority, affinity, timeout_ms
+        )
+        process.wait_for(int(library.ProcessWaitResult.start), 0)
+        return ExecuteStream(process, flags, buffer_size, stdin)
+
+    def _create_process(
+        self, command, arguments, environment, flags, priority, affinity, timeout_ms
+    ):
+        "Start command with execute's defaults, return (IGuestProcess, flags)"
         if arguments is None:
             arguments = []
         if environment is None:
@@ -60,16 +272,6 @@ class IGuestSession(library.IGuestSession):
         if affinity is None:
             affinity = []
 
-        def read_out(process, flags, stdout, stderr):
-            if library.ProcessCreateFlag.wait_for_std_err in flags:
-                process.wait_for(int(library.ProcessWaitResult.std_err))
-                e = utils.to_bytes(process.read(2, 65000, 0))
-                stderr.append(e)
-            if library.ProcessCreateFlag.wait_for_std_out in flags:
-                process.wait_for(int(library.ProcessWaitResult.std_out))
-                o = utils.to_bytes(process.read(1, 65000, 0))
-                stdout.append(o)
-
         process = self.process_create_ex(
             command,
             [command] + arguments,
@@ -79,33 +281,120 @@ class IGuestSession(library.IGuestSession):
             priority,
             affinity,
         )
+        return process, flags
 
-        process.wait_for(int(library.ProcessWaitResult.start), 0)
+    def execute(
+        self,
+        command,
+        arguments=None,
+        stdin="",
+        environment=None,
+        flags=None,
+        priority=library.ProcessPriority.default,
+        affinity=None,
+        timeout_ms=0,
+    ):
+        """Execute a command in the Guest
 
-        # write stdin to the process
-        if stdin:
-            process.wait_for(int(library.ProcessWaitResult.std_in), 0)
-            index = 0
-            flag_none = [library.ProcessInputFlag.none]
-            flag_eof = [library.ProcessInputFlag.end_of_file]
-            while index < len(stdin):
-                array = [str(ord(a)) for a in stdin[index:]]
-                wrote = process.write_array(0, flag_none, array, 0)
-                if wrote == 0:
-                    raise Exception("Failed to write ANY bytes to %s" % process)
-                index += wrote
-            process.write_array(0, flag_eof, [], 0)
-
-        # read the process output and wait for
-        stdout = []
-        stderr = []
-        while process.status == library.ProcessStatus.started:
-            read_out(process, flags, stdout, stderr)
-            time.sleep(0.2)
-        # make sure we have read the remainder of the out
-        read_out(process, flags, stdout, stderr)
-
-        return process, b"".join(stdout), b"".join(stderr)
+        Arguments:
+            command - Command to execute.
+            arguments - List of arguments for the command
+            stdin - Input for the command: bytes, text (sent as utf-8), a
+                file object or an iterable of bytes.  It is streamed to the
+                guest in chunks rather than loaded whole.
+            environment - See IGuestSession.create_process?
+            flags - List of ProcessCreateFlag objects.
+                Default value set to [wait_for_std_err,
+                                      wait_for_stdout,
+                                      ignore_orphaned_processes]
+            timeout_ms - ms to wait for the process to complete.
+                If 0, wait for ever...
+            priority - Set the ProcessPriority priority to be used for
+                execution.
+            affinity - Process affinity to use for execution.
+
+        Use execute_stream to process large outputs without buffering them.
+
+        Return IProcess, stdout, stderr
+        """
+        stream = self.execute_stream(
+            command,
+            arguments,
+            stdin,
+            environment,
+            flags,
+            priority,
+            affinity,
+            timeout_ms,
+        )
+        output = {"stdout": [], "stderr": []}
+        for name, chunk in stream:
+            output[name].append(chunk)
+        return stream.process, b"".join(output["stdout"]), b"".join(output["stderr"])
+
+    def run_many(self, commands, max_processes=64, **kwargs):
+        """Run commands concurrently on this session
+
+        Arguments:
+            commands - list of commands, each a command string, a list of
+                [command, argument, ...] or a dict of keyword arguments
+                for GuestExecutor.submit.
+            max_processes - the most processes to run at a time.
+            kwargs - default keyword arguments for every command, see
+                execute.
+
+        Example::
+
+            futures = session.run_many([["uname", "-a"], "hostname"])
+            for future in futures:
+                exit_code, stdout, stderr, process = future.result()
+
+        Return list of Future objects, one per command, resolving to
+        virtualbox.executor.ProcessResult
+        """
+        from virtualbox.executor import GuestExecutor
+
+        executor = GuestExecutor(self, max_processes=max_processes)
+        futures = []
+        try:
+            for command in commands:
+                options = dict(kwargs)
+                if isinstance(command, dict):
+                    options.update(command)
+                elif isinstance(command, (list, tuple)):
+                    options.update(command=command[0], arguments=list(command[1:]))
+                else:
+                    options.update(command=command)
+                futures.append(executor.submit(**options))
+        finally:
+            executor.shutdown(wait=False)
+        return futures
+
+    def download(self, guest_path, host_path, **kwargs):
+        """Copy guest_path in the guest to host_path on the host
+
+        Data is moved in large chunks with several reads in flight at once.
+        Pass resume=True to pick up an interrupted download where it left
+        off.  See virtualbox.transfer.download for the keyword arguments.
+
+        Return TransferStats
+        """
+        from virtualbox import transfer
+
+        return transfer.download(self, guest_path, host_path, **kwargs)
+
+    def upload(self, host_path, guest_path, **kwargs):
+        """Copy host_path on the host to guest_path in the guest
+
+        Data is moved in large chunks with several writes in flight at
+        once.  Pass resume=True to pick up an interrupted upload where it
+        left off.  See virtualbox.transfer.upload for the keyword arguments.
+
+        Return TransferStats
+        """
+        from virtualbox import transfer
+
+        return transfer.upload(self, host_path, guest_path, **kwargs)
 
     def makedirs(self, path, mode=0x777):
         "Super-mkdir: create a leaf directory and all intermediate ones."
@@ -3,6 +3,7 @@ Add helper code to the default IProcess class.
 """
 
 from virtualbox import library
+from virtualbox import utils
 
 
 class IProcess(library.IProcess):
@@ -12,3 +13,14 @@ class IProcess(library.IProcess):
         return super(IProcess, self).wait_for(int(wait_for), timeout_ms)
 
     wait_for.__doc__ = library.IProcess.__doc__
+
+    def write_array(self, handle, flags, data, timeout_ms):
+        # Accept bytes as well as a list so that input does not have to be
+        # converted to one string per byte.
+        if isinstance(data, utils.BINARY_TYPES + (bytearray,)):
+            return self._call(
+                "writeArray", in_p=[handle, flags, bytes(data), timeout_ms]
+            )
+        return super(IProcess, self).write_array(handle, flags, data, timeout_ms)
+
+    write_array.__doc__ = library.IProcess.write_array.__doc__
@@ -3,28 +3,33 @@
 
 The :py:class:`MachinePool` manages a pool of linked clones against a defined
 "root machine".  This module works with multiple processes running on the
-host machine at a time.  It manages a resource lock over the root virtual
-machine to ensure consistency.
+host machine at a time.  A write lock over the root virtual machine is only
+held while the pool's index of clones is updated, and a free clone is
+claimed by launching it, so clones are built, restored and launched
+concurrently.  The pool's clones are indexed in the root machine's extra
+data and tracked through VirtualBox events, so acquire does not scan every
+registered machine.
 
 In this example the machine *win7* has a current version of guest editions
-installed and is in a powered off state.
+installed and is in a powered off state.  Close the pool when done with it,
+or use it as a context manager, to stop its event callbacks and threads.
 
 
 Create multiple clones::
 
-    pool = MachinePool('win7')
-    sessions = []
-    for i in range(3):
-        sessions.append(pool.acquire("Mick", "password"))
+    with MachinePool('win7') as pool:
+        sessions = []
+        for i in range(3):
+            sessions.append(pool.acquire("Mick", "password"))
 
-    # You now have three running machines.
-    for session in sessions:
-        with session.guest.create_session("Mick", "password") as gs:
-            _, out, _ = gs.execute("ipconfig")
-            print(out)
+        # You now have three running machines.
+        for session in sessions:
+            with session.guest.create_session("Mick", "password") as gs:
+                _, out, _ = gs.execute("ipconfig")
+                print(out)
 
-    for session in sessions:
-        pool.release(session)
+        for session in sessions:
+            pool.release(session)
 
 
 A reliable version of the above code would look like this::
@@ -47,74 +52,405 @@ A reliable version of the above code would look like this::
                 pool.release(session)
             except Exception as err:
                 print("Error raised on release: %s" % err)
+        pool.close()
+
+
+Keep clones ready ahead of demand::
+
+    pool = MachinePool('win7', min_ready=2, max_size=8,
+                       username="Mick", password="password")
+    try:
+        # Returns as soon as one of the pre-built clones has been launched.
+        session = pool.acquire()
+        ...
+        pool.release(session)
+    finally:
+        pool.close()
+
+With ``min_ready`` set, a background provisioner builds clones (clone,
+boot, wait for the guest additions and a guest login, snapshot and power
+down) until ``min_ready`` clones are free, without growing the pool beyond
+``max_size``.
 
 """
 
 from __future__ import absolute_import
+from __future__ import print_function
 from contextlib import contextmanager
+import collections
+import json
+import sys
+import threading
 import time
+import traceback
+import uuid
 
 from virtualbox import VirtualBox
 from virtualbox import Session
+from virtualbox import events
+from virtualbox.readiness import GuestLogin
+from virtualbox.readiness import Readiness
+from virtualbox.readiness import RunLevel
+from virtualbox.telemetry import Telemetry
+from virtualbox.telemetry import prometheus_text
+from virtualbox.telemetry import write_prometheus
 from virtualbox.library import LockType
+from virtualbox.library import MachineState
 from virtualbox.library import SessionState
-from virtualbox.library import DeviceType
-from virtualbox.library import DeviceActivity
 from virtualbox.library import OleErrorUnexpected
+from virtualbox.library import VBoxError
+
+
+class _CloneRegistry(object):
+    """Index of the clones in a pool and which of them are free.
+
+    The clones are recorded as JSON in the root machine's extra data under
+    ``key``, mapping clone id to "building", "ready" or "broken", the last
+    for a clone that failed and could not be removed.  Entries are only
+    written while holding the root machine lock.  Each clone's extra data
+    under ``state_key`` says whether it is "free" or "busy": it is set to
+    busy once the clone has been launched by acquire, and to free again
+    only by release.  Each process keeps an in memory copy that is kept
+    current through extra data changed and machine registered events, so
+    finding a free clone does not need to look at every registered machine.
+    on_free, if given, is called whenever a clone becomes free.
+    """
+
+    key = "pyvbox/MachinePool/clones"
+    state_key = "pyvbox/MachinePool/state"
+
+    def __init__(self, vbox, root, on_free=None):
+        self.vbox = vbox
+        self.root_id = root.id_p
+        self.on_free = on_free
+        self.lock = threading.Lock()
+        self.clones = {}
+        self.free = collections.OrderedDict()
+        self._callback_ids = [
+            vbox.register_on_extra_data_changed(self._on_extra_data_changed),
+            vbox.register_on_machine_registered(self._on_machine_registered),
+        ]
+        value = root.get_extra_data(self.key)
+        if value:
+            self._load(value)
+
+    def close(self):
+        callback_ids, self._callback_ids = self._callback_ids, []
+        for callback_id in callback_ids:
+            events.unregister_callback(callback_id)
+
+    def __len__(self):
+        return len(self.clones)
+
+    def indexed(self, root):
+        """Return True if an index, even an empty one, has been stored
+        against the root machine"""
+        return bool(root.get_extra_data(self.key))
+
+    def read(self, root):
+        """Return the index stored against the root machine"""
+        value = root.get_extra_data(self.key)
+        return json.loads(value) if value else {}
+
+    def write(self, root, clones):
+        """Store the index against the root machine.  The caller must hold
+        the root machine lock."""
+        root.set_extra_data(self.key, json.dumps(clones, sort_keys=True))
+        self._load(clones)
+
+    def _load(self, clones):
+        if not isinstance(clones, dict):
+            clones = json.loads(clones)
+        with self.lock:
+            added = [
+                clone_id
+                for clone_id, status in clones.items()
+                if status == "ready" and self.clones.get(clone_id) != "ready"
+            ]
+            self.clones = dict(clones)
+            for clone_id in list(self.free):
+                if clones.get(clone_id) != "ready":
+                    del self.free[clone_id]
+        freed = False
+        for clone_id in added:
+            try:
+                unlocked = (
+                    self.vbox.find_machine(clone_id).session_state
+                    == SessionState.unlocked
+                )
+            except VBoxError:
+                continue
+            with self.lock:
+                if unlocked and self.clones.get(clone_id) == "ready":
+                    self.free[clone_id] = True
+                    freed = True
+        if freed and self.on_free is not None:
+            self.on_free()
+
+    def set_state(self, clone, state):
+        """Record that clone is "free" or "busy" for every process"""
+        clone.set_extra_data(self.state_key, state)
+        self._set_free(clone.id_p, state == "free")
+
+    def _set_free(self, clone_id, free):
+        with self.lock:
+            if self.clones.get(clone_id) != "ready":
+                return
+            if not free:
+                self.free.pop(clone_id, None)
+                return
+            self.free[clone_id] = True
+        if self.on_free is not None:
+            self.on_free()
+
+    def pop_free(self):
+        """Return the id of a free clone, None if there isn't one"""
+        with self.lock:
+            if not self.free:
+                return None
+            clone_id, _ = self.free.popitem(last=False)
+            return clone_id
+
+    def _on_extra_data_changed(self, event):
+        key = event.key
+        if key == self.state_key:
+            self._set_free(event.machine_id, event.value == "free")
+        elif key == self.key and event.machine_id == self.root_id:
+            self._load(event.value or {})
+
+    def _on_machine_registered(self, event):
+        if event.registered:
+            return
+        with self.lock:
+            self.clones.pop(event.machine_id, None)
+            self.free.pop(event.machine_id, None)
+
+
+class _RootLock(object):
+    """Write lock over the root machine shared by the threads of a pool.
+
+    Waiters are served in arrival order.  Rather than polling lock_machine,
+    the waiter at the head of the queue retries as soon as a session state
+    changed event reports that the root machine has been unlocked.
+    """
+
+    # Seconds between retries should an unlock event go missing
+    retry_interval = 5
+
+    def __init__(self, vbox, machine_name):
+        self.machine = vbox.find_machine(machine_name)
+        self.machine_id = self.machine.id_p
+        self.cond = threading.Condition()
+        self.queue = collections.deque()
+        self.unlocks = 0
+        self._callback_id = vbox.register_on_session_state_changed(
+            self._on_session_state_changed
+        )
+
+    def close(self):
+        events.unregister_callback(self._callback_id)
+
+    def _on_session_state_changed(self, event):
+        if event.machine_id != self.machine_id:
+            return
+        if event.state == SessionState.unlocked:
+            with self.cond:
+                self.unlocks += 1
+                self.cond.notify_all()
+
+    def _wait(self, deadline, predicate, error):
+        """Wait up to retry_interval for predicate to become true.  Must be
+        called with self.cond held."""
+        if predicate():
+            return
+        timeout = self.retry_interval
+        if deadline is not None:
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                raise ValueError("Failed to acquire lock - %s" % error)
+            timeout = min(timeout, remaining)
+        end = time.time() + timeout
+        while not predicate():
+            remaining = end - time.time()
+            if remaining <= 0:
+                break
+            self.cond.wait(remaining)
+
+    def acquire(self, timeout_ms=-1):
+        """Lock the root machine and return the session holding the lock.
+
+        :param timeout_ms: Milliseconds to wait for the lock, -1 waits
+            forever.
+        :raises ValueError: if the lock was not acquired in time.
+        """
+        deadline = None
+        if timeout_ms != -1:
+            deadline = time.time() + timeout_ms / 1000.0
+        ticket = object()
+        with self.cond:
+            self.queue.append(ticket)
+        try:
+            error = "timed out waiting in queue"
+            while True:
+                with self.cond:
+                    while self.queue[0] is not ticket:
+                        self._wait(deadline, lambda: self.queue[0] is ticket, error)
+                    unlocks = self.unlocks
+                session = Session()
+                try:
+                    self.machine.lock_machine(session, LockType.write)
+                except Exception as exc:
+                    error = exc
+                else:
+                    return session
+                with self.cond:
+                    self._wait(deadline, lambda: self.unlocks != unlocks, error)
+        finally:
+            with self.cond:
+                self.queue.remove(ticket)
+                self.cond.notify_all()
 
 
 class MachinePool(object):
     """MachinePool manages a pool of resources and enable cross process
     coordination of a linked machine clone."""
 
-    def __init__(self, machine_name):
+    # Seconds between provisioner checks when it has not been woken up
+    provision_interval = 5
+
+    def __init__(
+        self,
+        machine_name,
+        min_ready=0,
+        max_size=None,
+        username=None,
+        password=None,
+        frontend="headless",
+        workers=4,
+        readiness=None,
+    ):
         """Create a MachinePool instance.
 
         :param machine_name: Name of the root virtual machine.
         :type machine_name: str
+        :param min_ready: Number of free clones a background provisioner
+            keeps ready ahead of demand.  0 disables the provisioner.
+        :type min_ready: int
+        :param max_size: Maximum number of clones in the pool, or None for
+            no limit.
+        :type max_size: int
+        :param username: Guest user used when building clones.
+        :type username: str
+        :param password: Password of the guest user.
+        :type password: str
+        :param frontend: Frontend used to launch clones.
+        :type frontend: str
+        :param workers: Maximum number of clones built concurrently, by the
+            provisioner and acquire together.
+        :type workers: int
+        :param readiness: Decides when a freshly booted clone has settled
+            and can be snapshotted.  Defaults to waiting, on events, for
+            the guest additions to reach the userland run-level and then
+            for a guest login to succeed.
+        :type readiness: :py:class:`virtualbox.readiness.Readiness`
         """
+        if min_ready and (username is None or password is None):
+            raise ValueError("min_ready requires a username and password")
+        if max_size is not None and min_ready > max_size:
+            raise ValueError("min_ready can not be larger than max_size")
         self.machine_name = machine_name
+        self.min_ready = min_ready
+        self.max_size = max_size
+        self.username = username
+        self.password = password
+        self.frontend = frontend
+        self.workers = max(1, workers)
+        self.readiness = readiness
+        self.telemetry = Telemetry()
+        self._build_slots = threading.Semaphore(self.workers)
+        self._building = 0
+        self._waiting = 0
+        self._cond = threading.Condition()
+        # Counts wake ups, so acquire can tell whether it missed one
+        self._changes = 0
+        self._closed = False
+        self._provisioner = None
+        self._root_lock = _RootLock(VirtualBox(), machine_name)
         with self._lock() as session:
             machine = session.machine
             if not machine.current_snapshot:
                 p, id_p = machine.take_snapshot("initialised", "root machine", False)
                 p.wait_for_completion(60 * 1000)
+            self._registry = _CloneRegistry(
+                VirtualBox(), machine, on_free=self._wake_provisioner
+            )
+            if not self._registry.indexed(machine):
+                self._index_existing_clones(machine)
+        if min_ready:
+            self._provisioner = threading.Thread(target=self._provision)
+            self._provisioner.daemon = True
+            self._provisioner.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        self.close()
+
+    def close(self):
+        """Stop the background provisioner and wait for the clones it is
+        building."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        if self._provisioner is not None:
+            self._provisioner.join()
+            self._provisioner = None
+        with self._cond:
+            while self._building:
+                self._cond.wait()
+        self._registry.close()
+        self._root_lock.close()
 
     @contextmanager
     def _lock(self, timeout_ms=-1):
         """Exclusive lock over root machine"""
-        vbox = VirtualBox()
-        machine = vbox.find_machine(self.machine_name)
-        wait_time = 0
-        while True:
-            session = Session()
-            try:
-                machine.lock_machine(session, LockType.write)
-            except Exception as exc:
-                if timeout_ms != -1 and wait_time > timeout_ms:
-                    raise ValueError("Failed to acquire lock - %s" % exc)
-                time.sleep(1)
-                wait_time += 1000
-            else:
-                try:
-                    yield session
-                finally:
-                    session.unlock_machine()
-                break
+        with self.telemetry.timer("lock_wait"):
+            session = self._root_lock.acquire(timeout_ms)
+        try:
+            yield session
+        finally:
+            session.unlock_machine()
 
-    @property
-    def _clones(self):
-        """Yield all machines under this pool"""
+    def _index_existing_clones(self, root):
+        """Record clones made before the pool kept an index.  Must be called
+        while holding the root machine lock.  The index is written even if
+        it is empty, so this scan only ever happens once."""
         vbox = VirtualBox()
-        machines = []
+        clones = {}
         for machine in vbox.machines:
             if machine.name == self.machine_name:
                 continue
             if machine.name.startswith(self.machine_name):
-                machines.append(machine)
-        return machines
+                if machine.current_snapshot:
+                    clones[machine.id_p] = "ready"
+        self._registry.write(root, clones)
+
+    def _update_index(self, root, clone_id, status):
+        """Set the index status of a clone, None removes it.  Must be called
+        while holding the root machine lock."""
+        clones = self._registry.read(root)
+        if status is None:
+            clones.pop(clone_id, None)
+        else:
+            clones[clone_id] = status
+        self._registry.write(root, clones)
 
     def _power_down(self, session):
+        """Power down the clone of session and restore its snapshot.
+
+        :rtype: (IMachine, True if the snapshot was restored here)
+        """
         vbox = VirtualBox()
         clone = vbox.find_machine(session.machine.name)
         try:
@@ -126,73 +462,327 @@ class MachinePool(object):
                 # session seems to become unlocked automatically after
                 # wait_for_completion is called after the power_down?
                 pass
-            session = clone.create_session()
+            session = Session()
+            try:
+                clone.lock_machine(session, LockType.write)
+            except Exception:
+                # The clone has already been claimed by another acquire,
+                # which restores the snapshot itself.
+                return clone, False
             p = session.machine.restore_snapshot()
             p.wait_for_completion(60 * 1000)
-            return clone
+            return clone, True
         finally:
             if session.state == SessionState.locked:
                 session.unlock_machine()
 
-    def acquire(self, username, password, frontend="headless"):
-        """Acquire a Machine resource."""
-        with self._lock() as root_session:
-            for clone in self._clones:
-                # Search for a free clone
-                session = Session()
-                try:
-                    clone.lock_machine(session, LockType.write)
-                except Exception:
-                    continue
-                else:
-                    try:
-                        p = session.machine.restore_snapshot()
-                        p.wait_for_completion(60 * 1000)
-                    except Exception:
-                        pass
-                    session.unlock_machine()
-                    break
-            else:
-                # Build a new clone
+    def _full(self, size=None):
+        if size is None:
+            size = len(self._registry)
+        return self.max_size is not None and size >= self.max_size
+
+    def _build_clone(self, username, password, frontend):
+        """Build a new clone and leave it powered off at its "initialised"
+        snapshot.
+
+        The root machine is only locked while the index is updated.  Until
+        the clone is indexed as ready acquire skips it, so cloning, booting
+        and snapshotting run concurrently with other builds and acquires.
+        No more than workers builds run at a time.
+
+        :rtype: (IMachine, OrderedDict of readiness phase to seconds), or
+            None if the pool is full
+        """
+        with self._build_slots:
+            clone_id = str(uuid.uuid4())
+            with self._lock() as root_session:
                 machine = root_session.machine
-                clone = machine.clone(name="%s Pool" % self.machine_name)
-                p = clone.launch_vm_process(type_p=frontend)
-                p.wait_for_completion(60 * 1000)
+                if self._full(len(self._registry.read(machine))):
+                    return None
+                # Take the clone's place in the index before letting go of
+                # the lock, so concurrent builds can't exceed max_size.
+                self._update_index(machine, clone_id, "building")
+            try:
+                with self.telemetry.timer("clone"):
+                    # Builds run in parallel, so give each clone a name of its
+                    # own rather than leave IMachine.clone to pick one.
+                    clone = self._root_lock.machine.clone(
+                        name="%s Pool %s" % (self.machine_name, clone_id[:8]),
+                        uuid=clone_id,
+                    )
+            except Exception:
+                with self._lock() as root_session:
+                    self._update_index(root_session.machine, clone_id, None)
+                raise
+            readiness = self.readiness
+            if readiness is None:
+                readiness = Readiness([RunLevel(), GuestLogin(username, password)])
+            session = None
+            try:
+                with self.telemetry.timer("launch"):
+                    p = clone.launch_vm_process(type_p=frontend)
+                    p.wait_for_completion(60 * 1000)
                 session = clone.create_session()
                 console = session.console
-                guest = console.guest
-                try:
-                    guest_session = guest.create_session(
-                        username, password, timeout_ms=300 * 1000
-                    )
-                    idle_count = 0
-                    timeout = 60
-                    while idle_count < 5 and timeout > 0:
-                        act = console.get_device_activity([DeviceType.hard_disk])
-                        if act[0] == DeviceActivity.idle:
-                            idle_count += 1
-                        time.sleep(0.5)
-                        timeout -= 0.5
-                    guest_session.close()
+                timings = readiness.wait(session)
+                for phase, seconds in timings.items():
+                    self.telemetry.observe(phase, seconds)
+                with self.telemetry.timer("snapshot"):
                     console.pause()
                     p, id_p = console.machine.take_snapshot(
                         "initialised", "machine pool", True
                     )
                     p.wait_for_completion(60 * 1000)
+                with self.telemetry.timer("power_down"):
                     self._power_down(session)
+                with self._lock() as root_session:
+                    self._update_index(root_session.machine, clone_id, "ready")
+            except Exception:
+                # Don't leave a half built clone behind for acquire to pick up.
+                self._discard_clone(clone, session)
+                raise
+            finally:
+                if session is not None and session.state == SessionState.locked:
+                    session.unlock_machine()
+            return clone, timings
+
+    def _discard_clone(self, clone, session):
+        """Power off, unlock and remove a failed clone, then drop it from
+        the index.  A clone that can not be removed is indexed as broken
+        rather than being lost track of."""
+        clone_id = clone.id_p
+        removed = False
+        try:
+            if session is not None and session.state == SessionState.locked:
+                try:
+                    if clone.state >= MachineState.running:
+                        p = session.console.power_down()
+                        p.wait_for_completion(60 * 1000)
                 finally:
-                    if session.state == SessionState.locked:
+                    try:
                         session.unlock_machine()
+                    except OleErrorUnexpected:
+                        # Already unlocked by the power down, see _power_down.
+                        pass
+            clone.remove()
+            removed = True
+        except Exception:
+            print(
+                "Failed to remove clone %s:\n%s" % (clone_id, traceback.format_exc()),
+                file=sys.stderr,
+            )
+        finally:
+            with self._lock() as root_session:
+                status = None if removed else "broken"
+                self._update_index(root_session.machine, clone_id, status)
+
+    def _launch_failed(self, clone):
+        """Deal with a free clone that failed to launch.  If nothing holds
+        a lock on it, it wasn't claimed by another process first but is
+        broken, so it is removed to make room for a new one."""
+        try:
+            claimed = clone.session_state != SessionState.unlocked
+        except VBoxError:
+            return
+        if not claimed:
+            self._discard_clone(clone, None)
+
+    def _take_ready_clone(self, frontend):
+        """Launch a free clone and return its session, None if there are no
+        free clones.
+
+        Launching the clone is what claims it: if another process launches
+        the same clone first our launch fails and the next clone is tried.
+        """
+        vbox = VirtualBox()
+        while True:
+            clone_id = self._registry.pop_free()
+            if clone_id is None:
+                return None
+            try:
+                clone = vbox.find_machine(clone_id)
+            except VBoxError:
+                continue
+            session = Session()
+            try:
+                clone.lock_machine(session, LockType.write)
+            except Exception:
+                continue
+            try:
+                with self.telemetry.timer("restore"):
+                    p = session.machine.restore_snapshot()
+                    p.wait_for_completion(60 * 1000)
+            except Exception:
+                pass
+            finally:
+                session.unlock_machine()
 
             # Launch our clone
-            p = clone.launch_vm_process(type_p=frontend)
-            p.wait_for_completion(60 * 1000)
-            session = clone.create_session()
-            return session
+            try:
+                with self.telemetry.timer("launch"):
+                    p = clone.launch_vm_process(type_p=frontend)
+                    p.wait_for_completion(60 * 1000)
+            except Exception:
+                self._launch_failed(clone)
+                continue
+            self._registry.set_state(clone, "busy")
+            return clone.create_session()
+
+    def _wake_provisioner(self):
+        """Wake the provisioner and the acquire calls waiting for a clone"""
+        with self._cond:
+            self._changes += 1
+            self._cond.notify_all()
+
+    def _build_worker(self):
+        failed = False
+        try:
+            self._build_clone(self.username, self.password, self.frontend)
+        except Exception:
+            failed = True
+            print(
+                "MachinePool failed to provision a clone:\n%s" % traceback.format_exc(),
+                file=sys.stderr,
+            )
+        finally:
+            with self._cond:
+                if failed and not self._closed:
+                    # Back off before the provisioner tries again.
+                    self._cond.wait(self.provision_interval)
+                self._building -= 1
+                self._changes += 1
+                self._cond.notify_all()
+
+    def _provision(self):
+        """Keep min_ready clones ready until the pool is closed.  Up to
+        workers clones are built at the same time."""
+        while not self._closed:
+            if self._full():
+                ready = self.min_ready
+            else:
+                ready = len(self._registry.free)
+            with self._cond:
+                wanted = self.min_ready - ready - self._building
+                for _ in range(min(wanted, self.workers - self._building)):
+                    self._building += 1
+                    worker = threading.Thread(target=self._build_worker)
+                    worker.daemon = True
+                    worker.start()
+                if not self._closed:
+                    self._cond.wait(self.provision_interval)
+
+    def acquire(self, username=None, password=None, frontend=None, timeout_ms=-1):
+        """Acquire a Machine resource.
+
+        A free clone is launched and returned straight away.  Otherwise a new
+        clone is built, or once the pool has reached max_size, acquire waits
+        to be woken by a clone being released or built.
+
+        :param username: Guest user, defaults to the pool's username.
+        :param password: Guest password, defaults to the pool's password.
+        :param frontend: Frontend to launch with, defaults to the pool's.
+        :param timeout_ms: Milliseconds to wait for a clone to be released
+            once the pool is full, -1 waits forever.
+        :raises ValueError: if no clone was released in time.
+        :rtype: ISession
+        """
+        deadline = None
+        if timeout_ms != -1:
+            deadline = time.time() + timeout_ms / 1000.0
+        if username is None:
+            username = self.username
+        if password is None:
+            password = self.password
+        if frontend is None:
+            frontend = self.frontend
+        with self._cond:
+            self._waiting += 1
+        try:
+            with self.telemetry.timer("acquire"):
+                while True:
+                    changes = self._changes
+                    session = self._take_ready_clone(frontend)
+                    if session is not None:
+                        # A clone has been taken, let the provisioner replace it.
+                        self._wake_provisioner()
+                        return session
+                    if not self._full():
+                        with self.telemetry.timer("build"):
+                            self._build_clone(username, password, frontend)
+                        continue
+                    with self._cond:
+                        while self._changes == changes:
+                            if deadline is None:
+                                self._cond.wait()
+                                continue
+                            remaining = deadline - time.time()
+                            if remaining <= 0:
+                                raise ValueError(
+                                    "Failed to acquire a clone - timed out waiting "
+                                    "for one to be released"
+                                )
+                            self._cond.wait(remaining)
+        finally:
+            with self._cond:
+                self._waiting -= 1
 
     def release(self, session):
         """Release a machine session resource."""
         if session.state != SessionState.locked:
             return
-        with self._lock():
-            return self._power_down(session)
+        with self.telemetry.timer("release"):
+            clone, restored = self._power_down(session)
+        if restored:
+            self._registry.set_state(clone, "free")
+        self._wake_provisioner()
+        return clone
+
+    def stats(self):
+        """Return a snapshot of the pool's state and timings.
+
+        ``size`` counts every clone in the pool.  Of those, ``ready`` are
+        free, ``busy`` are in use, ``building`` are being built and
+        ``broken`` failed and could not be removed.
+        ``waiting`` is the number of acquire calls in this process that do
+        not have a clone yet.  ``phases`` maps each phase (lock_wait,
+        acquire, restore, launch, build, clone, readiness probes, snapshot,
+        power_down and release) to a histogram of its duration in seconds.
+
+        :rtype: dict
+        """
+        registry = self._registry
+        with registry.lock:
+            size = len(registry.clones)
+            building = sum(1 for s in registry.clones.values() if s == "building")
+            broken = sum(1 for s in registry.clones.values() if s == "broken")
+            ready = len(registry.free)
+        return dict(
+            size=size,
+            ready=ready,
+            busy=size - building - broken - ready,
+            building=building,
+            broken=broken,
+            waiting=self._waiting,
+            phases=self.telemetry.snapshot(),
+        )
+
+    def prometheus(self):
+        """Return stats() in the Prometheus text exposition format"""
+        stats = self.stats()
+        clones = [
+            ([("state", state)], stats[state])
+            for state in ("ready", "busy", "building", "broken")
+        ]
+        gauges = [
+            ("size", "Clones in the pool.", [([], stats["size"])]),
+            ("clones", "Clones in the pool by state.", clones),
+            ("waiting", "Acquire calls waiting for a clone.", [([], stats["waiting"])]),
+        ]
+        return prometheus_text(
+            "pyvbox_pool", [("pool", self.machine_name)], stats["phases"], gauges
+        )
+
+    def write_prometheus(self, path):
+        """Write prometheus() to path, for the node exporter's textfile
+        collector.  The file is replaced atomically."""
+        write_prometheus(path, self.prometheus())
@@ -0,0 +1,241 @@
+"""Detect when a freshly booted guest is ready for use
+======================================================
+
+A :py:class:`Readiness` runs a sequence of probes against a locked session
+and records how long each of them took::
+
+    readiness = Readiness([
+        RunLevel(AdditionsRunLevelType.userland),
+        GuestProperty("/MyCI/BootComplete", "1"),
+        DiskIdle(),
+    ])
+    timings = readiness.wait(session)
+    # OrderedDict([('run_level', 21.3), ('guest_property', 2.1), ...])
+
+Probes that watch guest additions run-levels and guest properties are driven
+by VirtualBox events, so they return as soon as the state is observed.
+Custom probes subclass :py:class:`Probe` and implement ``wait``.
+"""
+
+from __future__ import absolute_import
+from collections import OrderedDict
+import threading
+import time
+
+from virtualbox import VirtualBox
+from virtualbox import events
+from virtualbox.library import AdditionsRunLevelType
+from virtualbox.library import DeviceActivity
+from virtualbox.library import DeviceType
+from virtualbox.library import VBoxEventType
+
+
+class ReadinessTimeout(Exception):
+    """Raised when a probe does not observe readiness in time"""
+
+
+def remaining_ms(deadline):
+    """Return the milliseconds left until deadline, -1 for no deadline"""
+    if deadline is None:
+        return -1
+    return max(0, int((deadline - time.time()) * 1000))
+
+
+def wait_for_event(event_source, event_type, predicate, check, deadline):
+    """Wait for an event that satisfies predicate.
+
+    check() is called after the callback has been registered so that a
+    state reached before the wait started is not missed.  Return True if
+    the event was observed, False on timeout.
+    """
+    observed = threading.Event()
+
+    def callback(event):
+        if predicate(event):
+            observed.set()
+
+    callback_id = events.register_callback(callback, event_source, event_type)
+    try:
+        if check():
+            return True
+        while not observed.is_set():
+            timeout = None if deadline is None else deadline - time.time()
+            if timeout is not None and timeout <= 0:
+                return False
+            observed.wait(timeout)
+        return True
+    finally:
+        events.unregister_callback(callback_id)
+
+
+class Probe(object):
+    """A single readiness phase."""
+
+    name = "probe"
+
+    def wait(self, session, deadline):
+        """Block until the guest of session is ready.
+
+        :param session: Session locked against the running machine.
+        :param deadline: time.time() value to give up at, None waits forever.
+        :raises ReadinessTimeout: if the deadline passes first.
+        """
+        raise NotImplementedError
+
+
+class RunLevel(Probe):
+    """Wait for the guest additions to reach a run-level."""
+
+    name = "run_level"
+
+    def __init__(self, run_level=AdditionsRunLevelType.userland):
+        self.run_level = run_level
+
+    def wait(self, session, deadline):
+        guest = session.console.guest
+
+        def predicate(event):
+            return event.run_level >= self.run_level
+
+        def check():
+            return guest.additions_run_level >= self.run_level
+
+        # Fired on the guest's event source, as IGuest.create_session expects.
+        event_type = VBoxEventType.on_guest_additions_status_changed
+        if not wait_for_event(
+            guest.event_source, event_type, predicate, check, deadline
+        ):
+            raise ReadinessTimeout(
+                "Guest additions did not reach run-level %s" % self.run_level
+            )
+
+
+class GuestProperty(Probe):
+    """Wait for a guest property to be set, for example by a boot script.
+
+    :param name: Name of the guest property.
+    :param value: Value to wait for, None accepts any non-empty value.
+    """
+
+    name = "guest_property"
+
+    def __init__(self, name, value=None):
+        self.property_name = name
+        self.value = value
+
+    def _matches(self, value):
+        if self.value is None:
+            return bool(value)
+        return value == self.value
+
+    def wait(self, session, deadline):
+        machine = session.machine
+        machine_id = machine.id_p
+
+        def predicate(event):
+            return (
+                event.machine_id == machine_id
+                and event.name == self.property_name
+                and self._matches(event.value)
+            )
+
+        def check():
+            return self._matches(machine.get_guest_property_value(self.property_name))
+
+        vbox = VirtualBox()
+        event_type = VBoxEventType.on_guest_property_changed
+        if not wait_for_event(
+            vbox.event_source, event_type, predicate, check, deadline
+        ):
+            raise ReadinessTimeout("Guest property %s was not set" % self.property_name)
+
+
+class GuestLogin(Probe):
+    """Wait until a guest session can be opened for a user."""
+
+    name = "guest_login"
+
+    def __init__(self, username, password, domain=""):
+        self.username = username
+        self.password = password
+        self.domain = domain
+
+    def wait(self, session, deadline):
+        guest = session.console.guest
+        timeout_ms = remaining_ms(deadline)
+        guest_session = guest.create_session(
+            self.username,
+            self.password,
+            self.domain,
+            timeout_ms=300 * 1000 if timeout_ms == -1 else max(timeout_ms, 1),
+        )
+        guest_session.close()
+
+
+class DiskIdle(Probe):
+    """Wait for the hard disks to go quiet.
+
+    This is a heuristic: once ``timeout`` seconds have passed the guest is
+    considered settled whether or not enough idle samples were seen.
+
+    :param samples: Number of idle samples to see.
+    :param interval: Seconds between samples.
+    :param timeout: Seconds to sample for at most.
+    :param device_type: DeviceType to sample.
+    """
+
+    name = "disk_idle"
+
+    def __init__(
+        self, samples=5, interval=0.5, timeout=60, device_type=DeviceType.hard_disk
+    ):
+        self.samples = samples
+        self.interval = interval
+        self.timeout = timeout
+        self.device_type = device_type
+
+    def wait(self, session, deadline):
+        console = session.console
+        end = time.time() + self.timeout
+        if deadline is not None:
+            end = min(end, deadline)
+        idle_count = 0
+        while time.time() < end:
+            act = console.get_device_activity([self.device_type])
+            if act[0] == DeviceActivity.idle:
+                idle_count += 1
+                if idle_count >= self.samples:
+                    return
+            time.sleep(self.interval)
+
+
+class Readiness(object):
+    """Run probes one after another and time each phase.
+
+    :param probes: List of :py:class:`Probe` instances.
+    :param timeout: Seconds the whole sequence may take, None for no limit.
+    """
+
+    def __init__(self, probes, timeout=300):
+        self.probes = list(probes)
+        self.timeout = timeout
+        self.timings = OrderedDict()
+
+    def wait(self, session):
+        """Wait for every probe in turn.
+
+        :rtype: OrderedDict of probe name to seconds taken.
+        :raises ReadinessTimeout: if a probe does not finish in time.
+        """
+        deadline = None
+        if self.timeout is not None:
+            deadline = time.time() + self.timeout
+        timings = OrderedDict()
+        for probe in self.probes:
+            t0 = time.time()
+            try:
+                probe.wait(session, deadline)
+            finally:
+                timings[probe.name] = time.time() - t0
+                self.timings = timings
+        return timings
@@ -0,0 +1,165 @@
+"""Timing histograms and Prometheus text export
+=============================================
+
+:py:class:`Telemetry` collects how long named phases take into cumulative
+histograms::
+
+    telemetry = Telemetry()
+    with telemetry.timer("launch"):
+        progress = machine.launch_vm_process()
+        progress.wait_for_completion(-1)
+    telemetry.snapshot()["launch"]["count"]  # 1
+
+:py:func:`prometheus_text` renders histograms and gauges in the Prometheus
+text exposition format, and :py:func:`write_prometheus` writes them to a
+file for the node exporter's textfile collector.
+"""
+
+from __future__ import absolute_import
+from collections import OrderedDict
+from contextlib import contextmanager
+import os
+import threading
+import time
+
+# Upper bounds, in seconds, of the default histogram buckets
+DEFAULT_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1,
+    2.5,
+    5,
+    10,
+    30,
+    60,
+    120,
+    300,
+    600,
+)
+
+
+class Histogram(object):
+    """Cumulative histogram of observed values"""
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * len(self.buckets)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value):
+        self.count += 1
+        self.sum += value
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+
+    def snapshot(self):
+        """Return count, sum and the cumulative (upper bound, count) pairs"""
+        buckets = list(zip(self.buckets, self.counts))
+        buckets.append((float("inf"), self.count))
+        return dict(count=self.count, sum=self.sum, buckets=buckets)
+
+
+class Telemetry(object):
+    """Thread safe collection of per-phase histograms"""
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self._lock = threading.Lock()
+        self._histograms = OrderedDict()
+
+    def observe(self, phase, seconds):
+        """Record that phase took seconds"""
+        with self._lock:
+            histogram = self._histograms.get(phase)
+            if histogram is None:
+                histogram = self._histograms[phase] = Histogram(self.buckets)
+            histogram.observe(seconds)
+
+    @contextmanager
+    def timer(self, phase):
+        """Time the body of a with block as phase, even if it raises"""
+        t0 = time.time()
+        try:
+            yield
+        finally:
+            self.observe(phase, time.time() - t0)
+
+    def snapshot(self):
+        """Return {phase: Histogram.snapshot()} for every observed phase"""
+        with self._lock:
+            return OrderedDict(
+                (phase, histogram.snapshot())
+                for phase, histogram in self._histograms.items()
+            )
+
+
+def _escape(value):
+    value = str(value)
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(labels):
+    if not labels:
+        return ""
+    return "{%s}" % ",".join('%s="%s"' % (k, _escape(v)) for k, v in labels)
+
+
+def _number(value):
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def prometheus_text(prefix, labels, phases, gauges):
+    """Render metrics in the Prometheus text exposition format.
+
+    :param prefix: Metric name prefix, for example "pyvbox_pool".
+    :param labels: List of (name, value) labels added to every sample.
+    :param phases: Output of :py:meth:`Telemetry.snapshot`, rendered as the
+        ``<prefix>_phase_seconds`` histogram with a ``phase`` label.
+    :param gauges: List of (name, help, [(labels, value), ...]) gauges.
+    :rtype: str
+    """
+    labels = list(labels)
+    lines = []
+    if phases:
+        name = "%s_phase_seconds" % prefix
+        lines.append("# HELP %s Time spent in each phase." % name)
+        lines.append("# TYPE %s histogram" % name)
+        for phase, histogram in phases.items():
+            phase_labels = labels + [("phase", phase)]
+            for bound, count in histogram["buckets"]:
+                bucket_labels = phase_labels + [("le", _number(bound))]
+                lines.append("%s_bucket%s %s" % (name, _labels(bucket_labels), count))
+            lines.append(
+                "%s_sum%s %s"
+                % (name, _labels(phase_labels), _number(float(histogram["sum"])))
+            )
+            lines.append(
+                "%s_count%s %s" % (name, _labels(phase_labels), histogram["count"])
+            )
+    for gauge, help_text, samples in gauges:
+        name = "%s_%s" % (prefix, gauge)
+        lines.append("# HELP %s %s" % (name, help_text))
+        lines.append("# TYPE %s gauge" % name)
+        for sample_labels, value in samples:
+            lines.append(
+                "%s%s %s" % (name, _labels(labels + list(sample_labels)), value)
+            )
+    return "\n".join(lines) + "\n"
+
+
+def write_prometheus(path, text):
+    """Atomically replace the file at path with text"""
+    tmp_path = "%s.%s.tmp" % (path, os.getpid())
+    with open(tmp_path, "w") as f:
+        f.write(text)
+    replace = getattr(os, "replace", os.rename)
+    replace(tmp_path, path)
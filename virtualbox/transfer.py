@@ -0,0 +1,438 @@
+"""Move large files in and out of a guest
+=======================================
+
+:py:func:`download` and :py:func:`upload` copy a file between the host and
+a guest through IGuestFile ``read_at`` and ``write_at``::
+
+    with guest.create_session("Mick", "password") as gs:
+        stats = download(gs, "/var/log/build.tar", "build.tar")
+        print("%.1f MB/s" % (stats.throughput / 1e6))
+        upload(gs, "artifact.zip", "/tmp/artifact.zip", window=8)
+
+The file is moved in chunks of ``chunk_size`` bytes.  Up to ``window``
+chunks are in flight at a time, each handled by its own thread, so the
+round trip of one call overlaps with the others.  Chunks are written to
+their offset as they complete, whatever order that is in.  A
+``progress(done, total)`` callback is called after each chunk, and the
+returned :py:class:`TransferStats` reports the throughput.  A download
+is written to a temporary file next to the host file and renamed into
+place once it is complete, so a failed one leaves the host file as it
+was.
+
+With ``resume=True`` the host file is written in place and finished
+chunks are recorded, with a SHA-256 hash of their data, in a
+:py:class:`Checkpoint` sidecar file next to the host file.  If the
+transfer is interrupted, calling it again with ``resume=True`` verifies
+the recorded chunks and moves only the rest::
+
+    download(gs, "/data/disk.img", "disk.img", resume=True)
+
+These are also available as ``IGuestSession.download`` and
+``IGuestSession.upload``.
+"""
+
+from __future__ import absolute_import
+from collections import namedtuple
+import hashlib
+import json
+import os
+import threading
+import time
+import uuid
+
+try:
+    import queue
+except ImportError:
+    import Queue as queue
+
+from virtualbox.library import FileAccessMode
+from virtualbox.library import FileOpenAction
+from virtualbox.library import VBoxError
+from virtualbox import utils
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+DEFAULT_WINDOW = 4
+
+TransferStats = namedtuple("TransferStats", "bytes seconds throughput")
+
+# Suffix of the temporary file a download is written to
+_TEMP_SUFFIX = ".pyvbox-download"
+
+# os.replace overwrites the target on every platform, but is Python 3 only.
+_replace = getattr(os, "replace", os.rename)
+
+
+def read_chunk(guest_file, offset, size, timeout_ms):
+    """Read size bytes at offset, fewer only at the end of the file"""
+    pieces = []
+    while size > 0:
+        data = utils.to_bytes(guest_file.read_at(offset, size, timeout_ms))
+        if not data:
+            break
+        pieces.append(data)
+        offset += len(data)
+        size -= len(data)
+    return b"".join(pieces)
+
+
+def write_chunk(guest_file, offset, data, timeout_ms):
+    """Write all of data at offset"""
+    view = memoryview(data)
+    while len(view):
+        written = guest_file.write_at(offset, view.tobytes(), timeout_ms)
+        if written <= 0:
+            raise IOError("failed to write to %s at %s" % (guest_file, offset))
+        offset += written
+        view = view[written:]
+
+
+class _Pipeline(object):
+    """Run up to window chunk jobs at a time on worker threads"""
+
+    def __init__(self, window):
+        if window < 1:
+            raise ValueError("window must be at least 1")
+        self.window = window
+        self._jobs = queue.Queue()
+        self._results = queue.Queue()
+        self._threads = []
+        for _ in range(window):
+            thread = threading.Thread(target=self._work)
+            thread.daemon = True
+            thread.start()
+            self._threads.append(thread)
+
+    def _work(self):
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                return
+            func, args = job
+            try:
+                self._results.put((args, func(*args), None))
+            except Exception as exc:
+                self._results.put((args, None, exc))
+
+    def run(self, func, jobs, done):
+        """Call func(*args) for each args in jobs, at most window at a
+        time, and pass each (args, result) to done in the calling thread
+        as they complete.  After an error no more calls are started, and
+        the first error is raised once none are in flight."""
+        jobs = iter(jobs)
+        in_flight = 0
+        error = None
+        try:
+            while True:
+                while error is None and in_flight < self.window:
+                    args = next(jobs, None)
+                    if args is None:
+                        break
+                    self._jobs.put((func, args))
+                    in_flight += 1
+                if in_flight == 0:
+                    break
+                args, result, exc = self._results.get()
+                in_flight -= 1
+                if exc is not None:
+                    error = error or exc
+                else:
+                    done(args, result)
+        except BaseException:
+            # Let the calls in flight finish before the file is closed.
+            while in_flight:
+                self._results.get()
+                in_flight -= 1
+            raise
+        if error is not None:
+            raise error
+
+    def close(self):
+        for _ in self._threads:
+            self._jobs.put(None)
+        for thread in self._threads:
+            thread.join()
+
+
+def _digest(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+class Checkpoint(object):
+    """Sidecar file recording the chunks of a transfer that are done
+
+    The first line is a JSON header that identifies the transfer: the
+    source path, size and modification time and the chunk size.  Each
+    following line records a finished chunk as "<offset> <sha256>".  Lines
+    are appended and flushed as chunks finish, so the record survives the
+    transfer being interrupted.
+
+    Attributes:
+        chunks - dict mapping the offset of each finished chunk to the
+            hex digest of its data
+    """
+
+    suffix = ".pyvbox-partial"
+
+    def __init__(self, path, header):
+        self.path = path
+        self.header = header
+        self.chunks = {}
+        self._file = None
+
+    @classmethod
+    def load(cls, path, header):
+        """Return the checkpoint at path, or an empty one if there is none
+        or it belongs to a different transfer"""
+        checkpoint = cls(path, header)
+        try:
+            with open(path, "r") as f:
+                lines = f.read().split("\n")
+        except (IOError, OSError):
+            return checkpoint
+        try:
+            if json.loads(lines[0]) != header:
+                return checkpoint
+        except ValueError:
+            return checkpoint
+        # The last line is empty, or torn if the writer was interrupted.
+        for line in lines[1:-1]:
+            parts = line.split()
+            if len(parts) == 2 and parts[0].isdigit():
+                checkpoint.chunks[int(parts[0])] = parts[1]
+        return checkpoint
+
+    def open(self):
+        """Start appending to the sidecar file, rewriting it with the
+        header and the chunks that are still trusted"""
+        self._file = open(self.path, "w")
+        self._file.write(json.dumps(self.header, sort_keys=True) + "\n")
+        for offset, digest in sorted(self.chunks.items()):
+            self._file.write("%s %s\n" % (offset, digest))
+        self._file.flush()
+
+    def record(self, offset, digest):
+        self.chunks[offset] = digest
+        self._file.write("%s %s\n" % (offset, digest))
+        self._file.flush()
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def remove(self):
+        self.close()
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+
+
+def _verify(checkpoint, host_file, chunk_size, valid_size):
+    """Drop the chunks whose host file data no longer matches the digest
+    recorded for it, or that end beyond valid_size"""
+    for offset, digest in list(checkpoint.chunks.items()):
+        host_file.seek(offset)
+        data = host_file.read(chunk_size)
+        if offset + len(data) > valid_size or _digest(data) != digest:
+            del checkpoint.chunks[offset]
+
+
+def _stats(total, t0):
+    seconds = time.time() - t0
+    return TransferStats(total, seconds, total / seconds if seconds > 0 else 0.0)
+
+
+def download(
+    guest_session,
+    guest_path,
+    host_path,
+    chunk_size=DEFAULT_CHUNK_SIZE,
+    window=DEFAULT_WINDOW,
+    timeout_ms=30000,
+    progress=None,
+    resume=False,
+):
+    """Copy guest_path in the guest to host_path on the host.
+
+    :param chunk_size: Bytes moved by each call.
+    :param window: Most calls in flight at once.
+    :param timeout_ms: Timeout of each call.
+    :param progress: Called with (bytes done, total bytes) after each chunk.
+    :param resume: Record finished chunks in a sidecar checkpoint file next
+        to host_path and, if an earlier attempt left one behind, only fetch
+        the chunks it is missing.  Chunks already on the host are verified
+        against their recorded hashes first.
+    :rtype: TransferStats with the bytes moved by this call
+    """
+    t0 = time.time()
+    checkpoint = None
+    if resume:
+        info = guest_session.fs_obj_query_info(guest_path, True)
+        header = dict(
+            direction="download",
+            source=guest_path,
+            size=info.object_size,
+            mtime=info.modification_time,
+            chunk_size=chunk_size,
+        )
+        checkpoint = Checkpoint.load(host_path + Checkpoint.suffix, header)
+    guest_file = guest_session.file_open(
+        guest_path, FileAccessMode.read_only, FileOpenAction.open_existing, 0
+    )
+    try:
+        total = guest_file.query_size()
+        if checkpoint is not None:
+            # The checkpoint describes the data in host_path, so write there.
+            path = host_path
+            mode = "wb"
+            if checkpoint.chunks:
+                if os.path.exists(host_path):
+                    mode = "r+b"
+                else:
+                    checkpoint.chunks.clear()
+            host_file = open(path, mode)
+        else:
+            path = "%s.%s%s" % (host_path, uuid.uuid4().hex[:8], _TEMP_SUFFIX)
+            host_file = open(path, "wb")
+        pipeline = _Pipeline(window)
+        try:
+            with host_file:
+                if checkpoint is not None:
+                    _verify(checkpoint, host_file, chunk_size, total)
+                    checkpoint.open()
+                state = {"moved": 0, "done": 0}
+                if checkpoint is not None:
+                    for offset in checkpoint.chunks:
+                        state["done"] += min(chunk_size, total - offset)
+
+                def done(args, data):
+                    host_file.seek(args[1])
+                    host_file.write(data)
+                    if checkpoint is not None:
+                        # Only record the chunk once it is on disk.
+                        host_file.flush()
+                        checkpoint.record(args[1], _digest(data))
+                    state["moved"] += len(data)
+                    state["done"] += len(data)
+                    if progress is not None:
+                        progress(state["done"], total)
+
+                skip = checkpoint.chunks if checkpoint is not None else {}
+                jobs = (
+                    (guest_file, offset, min(chunk_size, total - offset), timeout_ms)
+                    for offset in range(0, total, chunk_size)
+                    if offset not in skip
+                )
+                pipeline.run(read_chunk, jobs, done)
+                host_file.truncate(total)
+            if path != host_path:
+                _replace(path, host_path)
+        except BaseException:
+            if path != host_path:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            raise
+        finally:
+            pipeline.close()
+            if checkpoint is not None:
+                checkpoint.close()
+    finally:
+        guest_file.close()
+    if checkpoint is not None:
+        checkpoint.remove()
+    return _stats(state["moved"], t0)
+
+
+def upload(
+    guest_session,
+    host_path,
+    guest_path,
+    chunk_size=DEFAULT_CHUNK_SIZE,
+    window=DEFAULT_WINDOW,
+    timeout_ms=30000,
+    progress=None,
+    creation_mode=0o644,
+    resume=False,
+):
+    """Copy host_path on the host to guest_path in the guest, replacing it.
+
+    Takes the same arguments as download, plus creation_mode, the mode of
+    the file if it is created.  With resume, the checkpoint is kept next to
+    host_path.  Recorded chunks are kept if the host data still matches
+    their hashes and the guest file, checked with fs_obj_query_info, is
+    large enough to hold them.
+
+    :rtype: TransferStats with the bytes moved by this call
+    """
+    t0 = time.time()
+    st = os.stat(host_path)
+    total = st.st_size
+    checkpoint = None
+    open_action = FileOpenAction.create_or_replace
+    if resume:
+        header = dict(
+            direction="upload",
+            destination=guest_path,
+            size=total,
+            mtime=st.st_mtime,
+            chunk_size=chunk_size,
+        )
+        checkpoint = Checkpoint.load(host_path + Checkpoint.suffix, header)
+        if checkpoint.chunks:
+            try:
+                info = guest_session.fs_obj_query_info(guest_path, True)
+                guest_size = info.object_size
+            except VBoxError:
+                guest_size = 0
+            with open(host_path, "rb") as host_file:
+                _verify(checkpoint, host_file, chunk_size, guest_size)
+            if checkpoint.chunks:
+                open_action = FileOpenAction.open_or_create
+        checkpoint.open()
+    guest_file = guest_session.file_open(
+        guest_path, FileAccessMode.write_only, open_action, creation_mode
+    )
+    try:
+        pipeline = _Pipeline(window)
+        try:
+            with open(host_path, "rb") as host_file:
+                state = {"moved": 0, "done": 0}
+                skip = checkpoint.chunks if checkpoint is not None else {}
+                for offset in skip:
+                    state["done"] += min(chunk_size, total - offset)
+
+                def chunks():
+                    for offset in range(0, total, chunk_size):
+                        if offset in skip:
+                            continue
+                        buf = bytearray(chunk_size)
+                        host_file.seek(offset)
+                        size = host_file.readinto(buf)
+                        if not size:
+                            return
+                        yield guest_file, offset, memoryview(buf)[:size], timeout_ms
+
+                def done(args, result):
+                    size = len(args[2])
+                    if checkpoint is not None:
+                        checkpoint.record(args[1], _digest(args[2]))
+                    state["moved"] += size
+                    state["done"] += size
+                    if progress is not None:
+                        progress(state["done"], total)
+
+                pipeline.run(write_chunk, chunks(), done)
+            if open_action == FileOpenAction.open_or_create:
+                guest_file.set_size(total)
+        finally:
+            pipeline.close()
+            if checkpoint is not None:
+                checkpoint.close()
+    finally:
+        guest_file.close()
+    if checkpoint is not None:
+        checkpoint.remove()
+    return _stats(state["moved"], t0)
@@ -1,6 +1,5 @@
 import sys
 
-
 PY3 = sys.version_info[0] >= 3
 
 try:
@@ -21,3 +20,29 @@ def to_str(x):
     if isinstance(x, BINARY_TYPES):
         return x.decode("utf-8")
     return x
+
+
+def _split(data, chunk_size):
+    view = memoryview(data)
+    for start in range(0, len(view), chunk_size):
+        end = start + chunk_size
+        yield view[start:end].tobytes()
+
+
+def iter_chunks(source, chunk_size):
+    """Yield source as bytes chunks of at most chunk_size bytes
+
+    source may be bytes, text (encoded as utf-8), a file object opened for
+    reading or an iterable of bytes or text pieces.
+    """
+    if isinstance(source, STRING_TYPES):
+        source = source.encode("utf-8")
+    if isinstance(source, BINARY_TYPES + (bytearray, memoryview)):
+        source = [source]
+    else:
+        read = getattr(source, "read", None)
+        if read is not None:
+            source = iter(lambda: read(chunk_size), source.read(0))
+    for piece in source:
+        for chunk in _split(to_bytes(piece), chunk_size):
+            yield chunk